@@ -7,13 +7,35 @@ Das Umenge Logo ist bereits integriert - kein Upload nötig!
 
 import streamlit as st
 import csv
-import base64
+import gzip
+import hashlib
 import io
+import os
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Tuple
+from functools import lru_cache, partial
+from html import escape
+from typing import Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple
+from urllib.parse import quote
 import re
 
+try:
+    # Pillow kommt mit Streamlit; ohne Pillow werden Fotos unverändert eingebettet
+    from PIL import Image, ImageOps, features
+except ImportError:
+    Image = None
+
+try:
+    # SIMD-beschleunigtes Base64 (libbase64), gleiche Ausgabe wie die Standardbibliothek
+    from pybase64 import b64decode, b64encode_as_string
+except ImportError:
+    from base64 import b64decode, b64encode
+
+    def b64encode_as_string(data: bytes) -> str:
+        """Fallback ohne pybase64: Base64 als ASCII-String"""
+        return b64encode(data).decode('ascii')
+
 
 # ============================================================================
 # EMBEDDED LOGO - Umenge Machine Inspections
@@ -21,6 +43,49 @@ import re
 EMBEDDED_LOGO_BASE64 = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAABuAAAAJgCAIAAAD01TIEAAAAiXpUWHRSYXcgcHJvZmlsZSB0eXBlIGlwdGMAAAiZTYwxDgIxDAT7vOKekDjrtV1T0VHwgbtcIiEhgfh/QaDgmGlWW0w6X66n5fl6jNu9p+ULkapDENgzpj+Kl5aFfa6KnYWgSjZjGOiSYRxTY/v8KIijI/rXyc236kHdAK22RvHVummEN+91ML0BQ+siou79WmMAAAKHaVRYdFhNTDpjb20uYWRvYmUueG1wAAAAAAA8P3hwYWNrZXQgYmVnaW49Iu+7vyIgaWQ9Ilc1TTBNcENlaGlIenJlU3pOVGN6a2M5ZCI/PiA8eDp4bXBtZXRhIHhtbG5zOng9ImFkb2JlOm5zOm1ldGEvIiB4OnhtcHRrPSJYTVAgQ29yZSA1LjUuMCI+IDxyZGY6UkRGIHhtbG5zOnJkZj0iaHR0cDovL3d3dy53My5vcmcvMTk5OS8wMi8yMi1yZGYtc3ludGF4LW5zIyI+IDxyZGY6RGVzY3JpcHRpb24gcmRmOmFib3V0PSIiIHhtbG5zOklwdGM0eG1wRXh0PSJodHRwOi8vaXB0Yy5vcmcvc3RkL0lwdGM0eG1wRXh0LzIwMDgtMDItMjkvIiB4bWxuczpwaG90b3Nob3A9Imh0dHA6Ly9ucy5hZG9iZS5jb20vcGhvdG9zaG9wLzEuMC8iIElwdGM0eG1wRXh0OkRpZ2l0YWxTb3VyY2VGaWxlVHlwZT0iaHR0cDovL2N2LmlwdGMub3JnL25ld3Njb2Rlcy9kaWdpdGFsc291cmNldHlwZS90cmFpbmVkQWxnb3JpdGhtaWNNZWRpYSIgSXB0YzR4bXBFeHQ6RGlnaXRhbFNvdXJjZVR5cGU9Imh0dHA6Ly9jdi5pcHRjLm9yZy9uZXdzY29kZXMvZGlnaXRhbHNvdXJjZXR5cGUvdHJhaW5lZEFsZ29yaXRobWljTWVkaWEiIHBob3Rvc2hvcDpDcmVkaXQ9Ik1hZGUgd2l0aCBHb29nbGUgQUkiLz4gPC9yZGY6UkRGPiA8L3g6eG1wbWV0YT4gICA8P3hwYWNrZXQgZW5kPSJ3Ij8+fxJoawAAIABJREFUeJzsvXvcbUdRIFrVa58vDzgJeZEQHgZCLs94/ZEbCT8VMpIJcRBk8IqXOMhDSdA74frgoaPjoAxCcHDu1QuoGHkYCChmJCFAEAxPRSCRH2BGIEIeJFwiCQGSnPN9315d949aXav6uXrtvfb37ZOc+uOc9a3dq7u6urqqurq6Gq21iAgdWAAgQgBAJAAAMO4nICIAUIW7N/JgjOFnrlNKIiIRISKAJSJruSS3awDAWmuMaduWa9Cgvu1r5raIiNvlAtK6tMX1ExFRS0SIjdSJyFU1cSvSHSICsIwqUcNlBFsuLxRARGvniGjMTFA1xsQ1awLqtowxRC3TPCrTIqK1oKnKmPCDMUZjxS+ZnkI6eZD+ymjyt/EQ694FOMcf1vQ0+FWaCxgm/iSubRDiLicL1NSsSxb6mGtoMfwDEFJPUtuoGgqEstZub28DQNM0ZtYg4N133XXzzTd/9atf/ed//uerr776lltu+af/ee1tt92GBG3bAgAitmQREWzIXUFDMnzdpG4MAOiviL/jNwb7Og0SEQswzfAxy8XtImLTNIj4sIc97Ik/8kOnnXbasUcd+6hHPerBJz34vnv3bu3f5mJN0zR7ZiwiiAjAGGOsnRtjnMzkuRkKtAHKWwJEiH4PuE5kSyCLWIwkW0m2Wyg2ikPathUJnITyDNKNBu1yH0EpF41ePAFjcVeUQp1cBQDGnVkAlOiLMSGipmkCBGQgnCQnXZ6RFw3IekfPaH621lprjWHthlK/8GowvqLXtP71FXqHeUB/XU9QQPCX4ZDu5EYqeB+/YVuCSNsDLfXa3Gh6RmQnAGjbnobWzll3N02jh1U/G26RZx+11lo0xhgDFgGRoEdSKMn0BwCmp+tvq4jJZFFyA1oEJGogspeU6iQgAtcWQDe5ERGcfdKV5P/RAiJYBAALiEh23poGwBACgm0AkaATpEBkCZXeZ1kE1lpACwAGN7gXghuyXCIDAC3NZawdPzD/WyACagDAuv4KPzsp53rhzylnU1lhRf5X1U+OdHsUw/Aot03TaM5P8VWLiETI/NM0jfuKjG//uK+skpPMYFaktKabzCM3Vj2Hy3xk+cz057HjwoiN4Ml2oFhx0VzQDzzjLWscRX/NQqxHGkSw1gr+rlMzHhHojcCZYCWjZozpcKYZeGCZ5RCQgBSRCcgIb+iJKc/yRss3In4AJbQtERG0Bo2zxnuODcbXzTsSoQFObrjxRcXnRp65TuZMN3CNqtkyz3CXEdHSnGeBMaZtvfWC5j0hUYcTtABgW2D6S52O2iLkHf/THADINk3TiG0Q0E34GRHZQGJ+0MQHX75JGR537rvmNN0E48n4sBQlaoXlZK7J4LJ0NaajjIygm/JplnBYzYXfuvfUqVXBhwdBS9f53LIklzqFnnq+C6+SbaSGYE65QbQsk/uBczirJhIGreZJrfuYXPJGlwSlcLWcFJS4vFuLERG1Lc1ms2BC6abloZNsdk5EptkDAE7+aFO2nzhayul6pHfC/751MVfEwVBf+PJKz1/Vei/owNkGTDHF5x4mehQCu0WoHcsHwSdeDek3wXs9OsHY6d7pN2KPSaMBs+mOCP7GgBtJadEqRkII6elJUS2FpHKZC+Ih8fVp97WgFKDHXIS9FuNnoxFQ87fT2rPZTLwxXIN4JxwCTcAnbEFp+cDSTNgg5DdDAEAWg68CDkdEO2+NMWzPEBiZF2yl8JvAgwHOSnGjYwkIaNYxP7RIBhDtnEzTALTWWtMZk6b/ljmn4/BengRcRMpgRkQZkX7+doZuzwPWztluAYCm6awgzcBCW7ZJ9LNmcuFw7nGwatBSJf5Kxt0R07P2dRnmt3gWO+jlCRAAARgtig1RJ/ONBX4g7NbsLc2bpoE5E54tXoKugk6D993gxkAbqb7BJEws7jD9RgsjftAOMiG6Uzb9woOpIwZNsOTWkyd4L29kxupVIiKzSL+YBE8S9YIg7p1wOSgRjCl3AE9mx16snLoPA3FZcDCx3dk0jTCiZj4xKXghF9eWxJ+cigraBaVIYgWWpLauPyjDaEfYpuvUb+J/NQ/EaiAYvmiSeJDrHaQWVLneBdiy1gzKJHuRLJMbr3qYqp6xjYJvjDIpwJkRiLi5uXnttdd+/vOfv+Zz/3j99df/0xe++K1vfevuu+92qylo9szatm1QuW8QrLVInsnoT7qEacIuSGq7BQNAJ++4HhZtYAkRCcEYw0JQdyHmh2SX+/li7SGH7CGLe/fufdCDT3zMYx5z6mP/1zPPPPPUU089/PDD57blWQ+9mukUNitFcHKjPO/85vmf0FkT879zpmjp6pm8sbwa5NUkNQpcp8dIK7AknYMxlQmlW4HeAMIknknJoD2Y+qe43QjzfozadpudI+BrsUCLBzVwx5OtZ/TmXC2zvXrAX9yKZizUJs9iQAS/Cn0ocqrW0DOpbeOvZLwEE8HHTe3OLPbbJfeMenoGfMKGrza8eNLJdp3wnjfoYEFqZocRI+wclLpHRMSUix1k4vITPPWSwxGgM9DB193ugWzbgtpABa1DSbn1u80JS9YiNIInWALjNn0BgAyhRURnQDPzGKFn75Aioxf54lADgM40Rwuh/YbGGLJzNAYsEhE24RId1KqYlHPKsRBzQu/E9PkNZd4p0vVuXyLSNAz4jdc2/KF7w56afoMzkrFWDUffum/Kd/TphiGl7rttDGD+aXVfxFEY1BZIxZgaDhM9m0ITkfmKnFNANA7XzLNAU0/mEPiyRfOwyAdrLYAFZNZCACCQGRRSVYspWXqR718QySaj0y2cOlc+asp0HY7ow6OASASkvup6Z9RGIHOO0M0t5vue6hHRo+9Ls47OsoDU8sR9S9wLIjI40/3Vy36pmbWJK9a4HjE+jd/fbpNMrzs0hQvyWW935SQzFxPXlcxN2RwKOJML87hr7uKGcha+5mdZISIiOwKAqP8X9ZzytKGwk36v6cO4uc3g3HqKcej5Sq9Yk1QKgJQujmeQc9aQrlP3msWR/Bq0C2BF6AWr5ngWdDjYOfobJP4GdihDfM6ngJf0XHD0mZtA/isJBkq267mmaxNqk++s0XYI/zSfz2ezmZY/xvkBNQWCqjQO8bjrvictXvJ8iN6+bMzPgX9Dfx63KMPn8O+p4eSDDrrqG9Ltaj9G07C1ScqvRyL3YsythW4llF+naw+U9mbE5YXaQnP/vVXv+7lJyp8jnGD9EAp/1FpU6xc1u4GInIBQyyUCkR6WlJ0AFpXbN/Ag+XLMir5AJABLFtCYbvsEWlDOfZFjjKuFlgW+qOaYA+P1kV4v6FkmckzxVU8c+YodmiKB9boyll3iI9IjG3Cp5rrkuAcltZSTZ6lZyz1ndjYA3erVSXgSolkgtr+JOu8ztdYYQ2iJCCwaQAtkjLFA1toGGYGZtTZkSmFEn4nTjkund0JT0vl0+50HzZqauZWFmhbTus7cAlgrSOp33sIy4M/bZE9TqiuMhNLK2BfWntgqq8BI6ENg5sb152rLQY4d9XNZxJfrD8poWVbd9xDPHFajIIlYPT4xVuXyOZ6M61m4R4NYTQjUm/i9gtc/AcD+/fuvueaaD37wg1dfffWNN954/fXXz+fzza1NNMZAb+I7I7j7ljy7n8rzJUfPJMKIKM5KBn6DiOKmxMiJE9escdZjKni2bXvIIYccf/xxp5566o/8yI+cddZZpzz84UccccR8Pje8QYFIaAAArDZr9ALY69EgS+QK5CZaQDcpU7N5UH5fxrC+tsE3QdfG1pDXDuk3znz39FFhdOLa3KLU25Ar4paW7TlKahPHvdNOgW6XGPyFGSnjvjzu9fRM/iqt+P3W+HhxiEFPc/QRe8MVQ/C4wlsaxV/1z93OxdyISYo9hlxGjNre2PLsnN75qHvH3dHcws8+M7cBL/lGcCzMrf9n71UMJLP/SZqX/Pp1zezlajvTHxpeAHTfdg64WI1qn52OYgPoOSEM4PUtSalKzM54XyGsIYAAE+0Qienj81jomnRlPAdlgLk3Z8kAdBtIuRH0XSogdcbjnpe0Nn6lRr/jSSWvPCdOsn5NqxQ+cZm+US1hIo4yznD1nM4+Ncjh49EzOY5uvFpkRzBIf3tpENABegWtOa3vl+4RxxMhYuQo1BIpdOjn6KN5JrDNqPM47NH4aJ9vXv5nrYW4FQg5PCzvy16uwYuliloJeU+PWsqiCOtJrCDINUDdOZgxGjzUy8FoJjcOfZr3ZwvA30pMibjeKjD+1kvZOVuUOQn7PyjDtEnOssBVXTBO4r6nZEWyDMX6omyrBC0WjMZB/hQlolQQaP2SW0Pl8An+5Z8ykjCNYbmtuGQ8F+I6texdbO4ne4epKNEUnt5ckDe5tvx+kUhaR0yW24lNWV0b+b5d8KM0wOex2E5wOIAxoH1N2imf+0r1V970strD1vabjs4+DDexXBcQI052BMnikLAiElYfgD++Ytt3qPuaMR61pI4IIhVqZBcoJZXjN68e7n7sDevsJURE7aAkBCJiL4EEFcXbOVxJ27Yofwi5JVgXfAbylTGTrBMoAS/GBNILAPKOYyDmPdABOWKODwRQbBpSZpHmaut7mueYMIJSxlHokHPqFaQ29PpSvwuXE8GUqNEH4BsxwV4NugUtExOi2J8y/snJwDXH4zUIMqA2HzNVg1UZ/zJW5dqSk5NBdqUg40zJ8e1iMJa2y7TCz5pb7r777m9/+9uf/OQnP/jBD37xi1+89dZbb7311rvuugsA+DhA0zQWiEVPIFICnIWGsgkjm6igFFhQPsBQz4LuVxVf2TGVEn/BuLA7CdSpn0BxxrOGwe2QzxnfjY3ZA0444YlPfOLZZ599zjnnHHvccfO5RcToeIuO4Og7Ar5iI19zWxVjGIyRpkwS/9zISo/UDtigL2AgbjeosyCvUhI4YcEEWiMnE5Ibj8E+c1kCxPu6MkYaN/kwXrqDGi/NzNJQUhqAOnKYrDkzUqTqYcQ6o417AwCkjl9RpCvjMdIGAUCoN0ltGQY0jBd70Xh1NgM5HSo6XS1IEjULfbyIv65mIwMoEa/Yu6jmiNgd1KU2iDrpHJQugpJbUXvaPQ/oBbzjh/SWbWBpZPit3y2XXXquQdoSCdO2bdPE06d3QgmpRa4iUndiHRJL0JRx3L/vHJTWtSV9gVZ4uGMPaA3OJKpXGDJnF/k8rw9A6YnZ77Fr/vGXH6HEcOzXvdFSWt4EhaHnf52CQ94TgCUghAZAFpAgjOotPi0CAKcQ4Tfaz6X50I8X1g7u9GIs4Bl+6Qe/BFEeQNSSc2q0bds0e9R8SURAC3ECh2Ygh9X4YvzMD53Gp7nBWezY9WOvLEsLppXy0FkZRy0tY16NY1ucxDP6jZop/VjHsk4w1DTXQyBzVkdlxvRxBGEZTtH7EB8AcOxn3azseYDLOKeYJxlEB2l9BFEki35jbXcou+sLtHyUUkcSuaQWYewb+rG3oqeg23gO46E0P2vFDTqayaoDjCa0N2LNQt7BLApmohx0FQdiEKWl5G24xtS0iuVD8C8oWzHpBtXu5mCBrdiA9CaWbot6nWutOzYLLg2aRGLqWRD0AvyJ6bcSbrr4zikQhiSV+EJoxf1SHNsE+Gs+jOeXfpOzmtRM74wZgN5ByU3HJyw1NXL8I4MSlEzyCZfUukn3scCl/J7dIEQ8C9qmaXLRuw4BxgR0u5HcC81ONxwhd1Fm+Rzzc6z74jcBlcBfHwkjMdlEd0B4Miaw5eI+xi6weEsvBCLmEKvmNQ8fHzbvLGGR4XEwnGiQgJ5AhqwFQ4idg7KzFRPjnnU9o1sbapaLI5H9OEqPDtbFnBZOa3Fr2NuoIScEfBvpI/DR87R5XFvAhEn5SQAEZKC35boyyEapAYCWrEEjM5yA+KSjlRNCkXzrBaz8oZRTP73jiZrbwXM85C19Sen+yHBMC03+dT6fS14hzQQB9SFa4as/g/qDDd5eDejygeGYG2+IFrSqjPb06/cJz7cijsYtLj+815F7rydtXDJWnIV6Bn+twcpXzMNt5dTe2HaXeT+2ZCwX6mterMUR9bjq0qNvAQAsWGPMnd+968Ybb7zmc1d/4AMfuOaaa771rW/dfvvtklhExJZ8rltp0LS2JaXh2N7S6175FiIvZPCnkADB5Z10hmmSc+RzTfxenfuHwUHFXQb1+HQjNEbyWopxTK0lsARwwgnHn/nEf3P22WefddZZD3rIAzmzFZd0K/FulYJu+ZprsUOeA71UqdxGSAyV/AlOroIvSAOocVDm2rXFyCb9HB+LKLcySl5pmaO1bI4mwbKkIDGiqmITMx23JW1pdir0V+NW5oR6+sQYCrmS9dePQmanV4ufKn6TfXupzbWrj1V6x2cy1O4lld5Oc7+mtwYFH24xWGilYipDF6HvuAFdRpcUyoPaavVxCPPbandeKkIthHp+EK4I9FdsGaZ4II6+9Ggi3KVfuiOxaQsnQEOC4MizD3v6kDLlczaV53bMnoZJ+OyEjVO2X46qfbttu22MyR/LjePXtIThxXzWDlS4lcYrwA1URExy1HQUsLQVlQznqYyL6DtfjnHmuybgIm3j5XEOdaVbHGZPNQltc3MkHilXeb/lGfRXGRsY4JPiPWIbJJY51loi5NOdUkA7CKRY5BRIR/1r550rr4cslFGp3NmgyiScucGIyCjLT/4I5tZKaes9mO/J9xC5syNuJ/+N56Sg3gEdNhRwo7TuJFWf0Q980JJN3ujPYz2ewg1kFDpedYUieZiOdY1XixJqIGIzIHhEAXEUWgAgaIFmSdx0XwatBQjnUT+O8Vc1sYS5tnIQ8BtFQQDaN1dYn8Yb/MmEDHGL4JhEz2ufniUZ5eMTnpjxS5VjEsONZNdi7yDOUVvL50FOiMc3OeJ6sznV0zTN9QxNzeLwhEGCkgDgnGipOdXra0ikwkjj6dNHl8meHkZf62lCufniBQiqLZzYtukxr+TGjFQJkAcAUkTW9o/nAdByjHxrNoiCR+WglDfBmBKRJ4K1oZ/cu0t2yf0LAJ4bOxBG0WD0eWRSC4ZuKIIdmFgUxkR3rszep+snb9b7rt0n6FSsv+QIwW+rH8jcAj42j/Ksk1ZRegFWiPQsYJvHv3sDbhr4e+wlcT9oWCyAYW6ixiXr3SX1red+zRnK9W2Vsd1J6HoBAM7rpUefVezmvq3bbrvtfR+44qqrrvr4Rz9xyy23gCF2ShoTxj3pajXzoPMGcgF0BqumlRZher9RI6xbAedGtJ6g9PST/oT8FDYep/H/zkHJIlJaSXpOEdH7ylkYiEitbZqmpTkRgUUCOu7Y457x75/+E894xpln/uihhx4KABzQ3lK/iBITBCJtrQaM/1l2loW1RjpAerpwVWn1X60gNUrya0GJJt9AfrGRwyqnTcD5DQOtVK4ZOn7udjilF3HeybgtULMg2EEV/atbTGa2lnkXY67QA4jGWjBM/pqjWPzv0KKrbysVzZGT+f3OYqx/fSNJR1zGsY1tQG2feqHmjRcJsetNl4n7K+8jKef5HZJ0TuEQH9nriefa9faGZTrE/BPH/ggO0AvPVveFWy+4xX2Hqe4XYop/gq+JiHRGzjRZ+peKwmGKgxRlmA6t5j2ZrXkp0bs7ZXKJk0hdqlOSctJuzBupFtMOSqmK+xjkx0xxTsdperZCSkJqyguHA4C/hebNNS24RG4weUAtUbSbI4gqAndyiEvGcz9efRS0gCqTjsQJJICWJFwgmuMa/9Bh58schngVoNcXiP7hRLcBRkGkTGF1A+Gs5JnuRc0LJWMHhF9/z4fO3da/z0k5XQlA6BaJE27k+D/+1UbZqCGC/IiT8GQkPWwuOj65CAenVePgmEDTQT7OLjmOgUyOeS/OC8kYMofotJMBHQJxEUn4BiI7Ki950jSHKErOfwPBp7FQiutPaYGyvguti1yP6t/ED7n3hTVgPLJqTLs3NnV7gQ+xZg/dsrGkEn9FHLkFjtuT9QyWZJCERdJHfVxab+/lnKTFUbAiiygVnuVRpxQS52kiv7x24PZpQIAIRE4Cp7xU1KOW1ZiSk97FUPEs1jOuqKf6EwOgzu7wrzqhhI63pS6yR0cTWyWBw/micGiS9BHJGWPbXz0EkLQkVY9iZ6semmQYaSeRPMkPZIzp8lE6DpfVN0dBIe9kstHjm6Qo3XbQ77AFSgtK0y/9a1lc1rwfFLWRLvHCUGOhGc/zQQji0ouQ29Movc9FUKYwWYT+uTd1LtfhdkcBpcz9aaHAITXlFy6zu5BUn04OA1i66aabPv7JT3zyk5+86qqrvvnNb95+++0i/ozpfYstuZM7bWuwP0kKKlJStxigERgZsTWgv5XaiIiAADEZ56j96Vqk9t3sFCJPVJB6uM4GjbVWOx81toIShAtUgHBPj7C7p6sPWzj55JP/w7nPed7znnfiA09omoZv/yTUh9m1gsnSbUVQ31aNiTlW/iyG7VS0yn079n3q135pKtYYhMa3hvTx4TgGMx8ZVIVPUE+uX2O3ZPL45NqqOQ1QcnLlvxqGFLahnvXHLm4rO14ZlGxUQ3kc0+MVG7sAxlnPvQQO+uJD59TQmOg1Q9RuiK3vrOkpEJ/2iPvrSpbnV2kT172Md+/TNlIdT8ZOK8l+2GhMhrLdpd8Pzd8cL8V1av1X6uOggymqOZFv1NUc7NZ71w1Bf7S5wJ9BbFG4qR+3K9fLROD5nqJ24/iRNpM0VtdWko36w3i26gu14k8y852i/nqORV1Fjp5dA8UIHZ8+pY2i1DxNywGHT04uhTFK5fL5nqYhx+d+hFRwtrqqXYjWiRCtCOIZnaut3omW571K+R+3EtnH6b6HDohCv1S13g5Wcb4MUyl+iOdv7O4fG6CTw6r8ZmdqrglbKfNMzrGoKZ/jyThiOpIPNoV/OitUzfwNeq8eNH/mCBK7zEoR2VErPf6Z914V4PNhzJmuYLyp0Leb0o/6hIGuv2QPpOR/7JHT7Q7r/UFeDWzC3FeJmlXD0i/9eUAxPyCpD+yg3idu0R1VaCIZF5IjNzGS4tu6m7XLpKmBeALEzsRyzJ2UgtSwpQRBCdVB4Zt8WWbooYWch/nyUnWwd3GZgP4Lj+xUKmHVTSS54gAFEQfoFlqIeNddd/3d333qlltuufL977vsssvu2nc3c6ZyIDbWWtZVXVwh53m0Fo3hpTH4rsleJBkkIr5fGzJTJqCwUbknHALOR+kS6xKFRlggCqWbIJGbQEDUXVGqr83pJDAhpi7YyRpSXaEovqNV+De869W2tsHmiCOOOOvf/uj555//pCf+G2MM5zpxAe2o3Z0BJZce9pUDKZd3/NNiXahShIsamoPLj+BN/VgESt3XMoOmPKWcJmljqIB2pv7YeRTqoGB6kr9gyymdwugHvU4acElW93WfflPvhCq9T5UZtxGYKlMe3373Xs5wFBAup3aROn1+sH4lZUehjUrGvSg5Iuu/jWsIOhtBbrM2LKOdrS6PIQX2VbxIC46By+inZqvgmYjtGlxeRoyd7ld8aid3GC2evzomAqLjrvG3gZb0exTwj+6Itjl1hHs5WCGXczk8+Bzgz3UGNoBPAZB2vbtfvVukGvWGcVBX6yjXc2HuCw7WpY3TNIyxIiIXKakv7elopfoeQ9rFkKNnTlvlL+gob3LoejAjDzVWOblkHREAPG7sF/nxTeUpapQg1iNxWg+IGJvUyYBYx8X01Gd9gk8K9B/CNoYeNz/Ceti5zJ6dGB9r58ZApB/DbQbw52wKz/S88MVa+kJaqRPSmj1Hn5zbJcYnXUOZ2slRrgzBKZeJdY3GOTdnc23VUanKJ5BsNJYV8aaRvxEllZSNFi0tk1pJl+8dlD7+udOr4yxq11Z4OWHZQRmRK3COA4TUpuhN2n5zPNBGdEg7/VM8M+yg9Or3dFyijwXpl+LhEvcGdXI3CquGWAtwFH+QE7nfvySisI3UEi5+WUDdP+wzrIALBYKmtbmZE09xPgiKzvOPMZpL6NV/G+c/StUwwU5RLCwmh3rBWk/V1eGWK7OMm3XVMIIbAQD6RIVyKV6QoJeIkACNueHGmz7/+c9/7nPXXHzxxV/+8pclsFzfNMIWnTgEY7kG0Dn7ujfKtReXr+lRPN8lP4Xxz1zXcFoSgRg3fuC2gAhh2JLouyzfKnPWGCMpihCpaRpjZm3bzufbe/bMznj843/5l3/5qU996mw2s8o1qfGJ0VsfntSQN8t2ol39puYAyCgoZLrIaRz/mXdK+0QiQcqUwd7ltG1QJp6Sg1BjasS2S0HaBz8l+yjG3KBTQEEpuiR2ItT31P3aG3O+03BY/+bSreQiGvKOwkTdqmTaYR3bCT4/pJ2/sYNDL1RSi9W0I1in5fHJGy6qcw6sgENUPenMSjFovSYOU1VnbnFb/lVTMopAbAGNAUx/lTpOW+NySi8U3ajlcpvmLhMIyhB5TplhWzfFV3HkSEjJlDs1ITZVK4lLLANJkjwojYj6rFIN3/rO6C4qFgAQmgj/2PmSg/RcDuS/e5Y+AmJC5qivTDwrpWZ+qXoHiiZpmyGva2Lnl7aEu1Em53gqOEQ06FlcoH9u7VNEOG4i8SYp0xTdwiYWcE7VL1pjBZos6fNb1iGIiGLiV9gz8m0ihjcqk/s2Mb8GMHQpL2BopLq68ok+MriNgxpuqfk8x2M1OI9qEUo+kxpn8UBH1HMthWM5lqs531YS2Lfekn/6LW4okCqkzrXEGauHoGxzpqVcnU6v2VLtyzsNGG5Uk/K8lblOZc1OJCYCjzFq6eMzfBikGMeqS7skG29+5CkRIYFkpnDhOGSM4drJv6MclL6QxX7XcXJQKbJzwiU1gUPGGkWsUe/LWOk/Kbq5Ww+PPBcQzjGTHbhuwhMuEmGaYr7VCuhpIaDeqMD1ZdoKhrVgENRXXoP/ukHgoGTJBU528Owzxtxxxx1/9Zfv/sAHPnDF+z+wb9++pkHOLDlQMC/UAAAgAElEQVSbzcCxrnX3dXDEIsc/anMK9BAgQC9EIJhBDPwn5A+SxOPY764YJCI+gg3RnJLPg/26AEmZklrK6Wne/YSA2Etm8l2QQS+EGroSeSnZQ8RByc+IuL21ZYw57bTTXvKSlzzj3/+kri1esGmajDJ0dgZSinOncRtFq4DlKiUkpRYbZQMiXqQNLerG9VHD2INChfcq3029fvfeQyZiQoweR4dwVzm2EJLH9xjN5ZWj9FijKvVX6N+cSVp2tuoldM6c1SVD0zN+EzuqioZ7gnRlp2rKoTB2hx/Ue2k0OTHlq2x6gUwl2q/X0U3nVI0N7lxP4zcdfdzN70qnpMcxH/GU7r4vHzz3E/Q6RfNk7BrocY7r0b3WVHXqHvSV8YJPPI46Ti3l0Nf9Si/k/FEuHRXUb3wnF7v5QoeIX0N4zLlMkzw/hxBxqTdPfRs4zrfIa7d0NIobEQhmWc4NnaNzndMtpIn/VXmDYcARI7xK7nCKok+rs4/JhzBBHGUwoSyofJoBempEhrcAy9ee5N7Elu0Yvko7B6m10QZJDgJNIT6LUHfEMlmPVw2Gepswt6YuWEoZIV/r7qmHsXZpIR9uUGdMmWTrwVnSAv9EllLXvqo/pA9lruTNtTXGtddLIX9zaJifi+sCiZoM7aLCxi2pC40jnVgDgw7KQZMvixuEI1Lmt1z8Y6eX4xN1QZlcDdpB6VaUVfRR5XMYhlogxZ+CYUNERGgQyFq+GNbjB+ai1ou0BSX3dPlOeVSjAlCcYKoGTe6EK7ASatRDTjGnbr3k46gkxk3FdEpjBanF2BhlVmJT6UHwaw2UjYCx9B+sP4Dg3ltQjiRlxCx+fFUHkC9fYc14rT8EhhcbxOSSRd5ww02XXfbXH/7wh6+55rM33XQzU69pGg704/usDWAQNYnOKydE7vx6ndnTvQ9iGwUQEQxaa3VWR2yMtbbTqOqCmq4VS0alZAaAIIJSCbK0kzHAR4xL4RmJFbVq94Z8V2NcrThMRYgHDlNNKymjO8JmByLOZhvGmM3NTQB4whk/+PKXv/ycc85pmobcdQT183THGHV1Udg1sMwMXYZEi2Xg1XMw5ebTy87SYi9pygdtDW2GpSGnp/xsqgi+JK+vJ6hQ4ZyO+KvbkMs5ZcJfy98muxD1ZVjnpuIZw/cxDi6KNoy+jOkQH0NOcV3h6B8EuCkDNOxdOY+VrtZhgplx186swLDOEj/HG7nyQ+/Li5BxQJ2TIsyHqOkAibkZU7h2uZJflmddA9IEP7jPa5xuOkquhFtyKRL1Ou34FvtfyvONqLLU1F3I8TmE8aQeAiHGGWe6+kq81Xpfs7cBis6RdF42aYsvMcjN5dhJmnMO5tZcOe0ztCaqd2prHgMIxzfHD3Hmx7h+iH4Ne1E3Z9OuW9/Sy22u1ODQPYs9Wf62xh6oK5+e450W7m7JsUTUxf/6o62+HV7JJnUQlAyJAQfcoAwv8G3Ubr9NNRaTeqi3KutsyJqNybRUqZuPntWnHJ3lzbD0xltq26MEwdqniH/6TVyb6Cmlg4Z5rIa381BrGxROeCS/8kekjGd6Q0hDzp7xBSzlPh8FgzZ8BqvwJTGehCyBCcGg4RJcQF52UZOo2EClidN18hKbnBHTEhGpW/yGdmu1yRt3ODw4UFT5CSgk6ZeX5N9bKj2Ue6bUQIZC3z+Cl+5R/QRITlF+SL732Z07O8u0mN7pquGnZOujRqFcXl/rHE/IJRe3C2O45JQ7sCA5NdiRZy1873vf+cQnPnHllVdecsm7vv3t2xBxz56GqMtKK1OsExaWAAAbQ9by1Tc8F1CdX7ZOuIBzYgL0uSRilpOsjr0g4zeI1toGDb+R+dvlhVTuQr7Ehh2UGxsbhx56qDHm8MMPP/LIIw8//PCNjY2maYwxhx12mIgaY8x8PhdS7N+/f3Nz884779za2tq/f/++ffv2799PRJubm/P5XFAVtBE9Y1oeyN2J3ElMldyXy7NjtO9LIra6nc0aWZg1TbO9td9aespTzn7FK17xg49/glyZl5N+68+x087rct+FXMlfdVWQsbxzJvICxqtUksNZG/H6Fj8dg5DDs9BuPQzSIdevvJYf5szYqEpZAlWLUko5U0g5FxZwUCYRjiNBcnXW9yW5URo7r4nI3QpdimQRKwuc4yaox1qL2OgxUqMfuwxKi5xU5FfCdld0i/EkxMZa6DRA3nAXHFS1ECClLbcU3+aibsdBjFvcr5z7OI4tGpJRWh3n7ORSFFuZDrky5Xq0vFI91YGoQZ2xHLNiBLpVRlenzOWCnZzjjUxfQnAGQJ+OwG8l7bh0xdI3s8fuRd13P52Onr/e2AnyqWVtWL6sT8dYvwl5JXim1nrpS5aGjv3GmCTWWQXgy1rFGV2eC0GRYA4KVjnNrmmlt/p8my39vlCbfh6MmKPEejB0BHffEgDR3G7PZjMgA5B1UOZajGlYcLWQy6aqywfzRX7T+Od0VvAGSqbOsg7K8nypt1vq7cCyg9LBsCYqp0YpYx7rSlfJslt09e91AShKda0LnA1T0tf62yCuudoYrnFQ6u2W2KqscdMnp0ZfQ4T2gNM/Y8uNjR5NwwKhJ6mRtRaIiAw0wCt6QEsWEXXaN75ctws2gk7qGnePhaYJOej9D8FiO9cdYabUsbW0b36xNLRlxVyGWPGnao4TzNeOUy56ItdiHpNcsnmvNwAQLGyoS9JUie0iNEx+G/yZOwZYv2O5TGRWjQrJZzlJ17YYJquGeBRAGUza0LFzMgbA4I03Xv+7v/uayy+//Bvf+EbTIBE2TdOSRURqbbISrjxnOluy4igE52EEgCCaUuqUqoJnxN7k0n5PADDGHHLIIU3THHHEEccff/xxxx134oknnnTSSSeccAK/Ofroo4844oiNjY3DDz/8Pve5DyLOZjMxH7v6+Roc6CnDUaLb29vskdy3b9/3vve9ffv2ffOb37z11ltvvvnm22+//cYbb7z11ltvueWW22677Y477qDuRAYgGnS7PZ3FCYlISW5CIjoBwtyFegSRDBHxJTmz2YyItrc3DznkkHOf/eyXv/zlp/wvj1RuyvgyhwQ/rBTGtjUVbjUyZBkNkos9jI2ksoxK1k95B1MqsqPKhCUi7TjzdZA2THPLxdyC0+Mr/rcgM+sN91QN44z1GP9BLTm08gHwFuFsg+Yig8oQO0zT0QpSvzLE00j6rreavH41C8LhfhXKKwmWvsUywN/nLvJ/T9tL4Bnc5ZI2816rqpwTvBbqF7EdTp2U1pjwperh5ZD5FtNOnNS40CCVXOzqWDp43KuqjRd1MW6hOVFeBPKlQJo++nNKbIe0kPYQ5WJPegsHsnm4hp2zKU4YngVDUi5NQ7m3VB/uc9pBByd2l5KLyZGs34172uElix0qLXTDehw1tNYou4rS8nBIFg2nm/DLp2VpMjxCyJg8wMumaVw4g2dJD5atl3heq+HwIstSMiSMVy1jmP+95FauLz+26aRJPCHkVqxleyZ+P35lukhc55DVVBvxl3FNJnBTfBuE4FW53gZbz/N2HAUfS8Lh1iX4bBDnFMTbS8Ob0KPGVCmy0H7zZbLuVNnVHqYrSQbbDercQbSLtjpInbnTJND1vfMnAgAf6+acFE4X92si8UXIWiOImtJHv40x3qobMvtFQRSACFD3oXcdR9LIW0wq1XylkZc3wYE1v7Ygf82ofYZxixl/CDVlahZsCYOjUjnJgjNQvYtBefmaW3jE5ubgVzWYBFonP8ohJr6w86ZHYCCuISS1r3W3cs9ms2u/+D/f9ra3fORjH73uui/fdtu3AcAYjtNBIuKj3OxMDGZ6bs72SwiXj1Ledy4egxxxCUqpx2OK/S1dXf1N02xsbBx//PEnnXTSIx7xiBNOOOHkk09+xCMewV7I+93vfvpEtpYe0gpXyDVLMRaILVkRo9ZazqlHLrkeQHhdCZuzd9111+23337dddd95jOf+djHPvJP//RP3/jGN7e2tjiKs2MV6p2zunfg27haEAW8imQIAaAL9iQiY4CItrfmRx6599d+/Td+5Vd+Zc+ePW3bGtPnU1uUZaaBxTYSlrdBc3ImpZsWz8PoQ7/NFqeSKNfpx722rF8yij90UOpEKDlZau2cMweR7wDNG7Veu9EcDxfnucVe0NOFjX7wVvhj2akcTRDaHjX18FFTfdvvKBvAtx8SGOYcBDmeAbByliIwECl0hvYUqFmI1siQwIpL1uNKhrUF9ozCtuNtRIwjPVN869Uf20tExPJc9z1P80XAr7mGw7U7zDuqFuCfH6kEzlFhK+Ko5kxSffSoHrsUf5aOJyd64nDjb1lepQSpdTIQWP3Ftgci6uhd/3087h4WUhiKDsqgBj1ekLUnB1cKIc+n2iUxy4VibMbEUdU+AVv/tvfcwjJerAaLW0nBNOwQjDYelnJQ1lAvHtn8pWTZlUjS5i/DKCtilB7MZzCsdchqmpeP6OZlrC7D95PMqnvab3hMbtcVK1zc4VLgjRqsRsKwgy/uNQzEGA47nnReyJG4xQ6QZP0l3lYcAkTpdEa+/RO26JdPbxcl32h7ON/xAFbioNTj6KuJRO9yG881OEjmULH/p3JQ5tvtwfdBAUQLXqfLuqPA3XkZz8fCBxYNYpfOmx2ULBvjcCVZRBP5t3gX0CWXpjS+iS8fKTmcMnwxyCHMO7R+JELtjlxdo17GuqCenPLOGRO5eqSMzOqxAnTazHH1cZGrrq3GcaAheZ97hnN2M9deDLGxJakPUWIYiW677bYPfehDb3zjG6/+zGe3trZashsbG/P5XMrzVC/kl9SgZmsngIhI73iAkkcA/dFmAVBOzL51osMOO+z+97//93//9z/ucY879dRTH/rQh5500kmHH374IYccInXqnkr4N6EnsKSYtC7/Do6ylnpSJy96mU+4nrZtt7a2vvjFL1599dUf+9hHrr322uuu++r+/fvZbwhg1Ldcn44AUq34F+9Iu4hooY/HlMTPtp3/4A+e/qpXvepHn/zktu3Na5Hdozh/t2Ba9GpqqzQ9M8VykSa1radKZhcYvpU2wpVQ1+64MmON+Jpi8QI7Vap2saqjS6DiCHy9DK/LvVgfxTDsKByyB/r3q57gqaPTod0ytITWX5XbGuY9v9chDu6L0GlCI69ejOupx3aoZBiByA/a8e3neNWph2palG2MWXkxmZMzNb1IrZmzGx7B+5x9q+bOgHaOeUAvivwFkgkqKfNJvaO25uqPGqgf0zIPxB0conO69fybcU7D1OiMheEWY2zHWuZ+EpVSzfW/Tgs1+iJJ4SFjJihW4rEx/Z3G8bFjFA4aWq7vU8IYO2EczfMyJC0Dx1hKA9JJ4j+KvRPfVm/R5fVgvZRYjDMHHLJExDq07MQfD8vMo/RcXg0nWwAgaBEwp1mU9RU4ssLxpe7Sm44Psb+gjy2iPh2HTpLGO5dgGgCXTm4A3c4pwIvz3u0YXIqygPpcAMozQYyzyR2UrunE8aX6+v2ptXg9i8FY+idDw+qnx6BCXZ2qWHM/ziDIdEUX3anjJe+4444PfehDF1544Ze+9KV9+/bN5/M9zYyIOLg6cA4ihrkjNYhQAC/iQNUAfJl3/wn5V8GgA9ZV/Gvbtve9730f97jH/dAP/dCjHvWoH/iBHzjxxBOPOOIIPprNNYv7mPzt7q5+S8AHzAEA+u2QGj4MlvrBg/wLavtL/rXWzmaz+Zz36Ozm5ubXvnbDF77whY997COf/exn//mfv3znnXc6uccnu1upjfzIUwDorgNSLYJBRLTz3nXOfZ81uLm5PZuZ884777d/578ec8wxHFjBbQUd2Ul/upgg9Z8E9N9dSK29BdIL4OXIO+xkcYiVEoaUYTkTLa5nYnCKcgIHZVRtaaYXSsb1Dy2zhxcMdcZiqa06N8TiMGZZXo4DraqwUKDmQ4jSIwifkx+bueg8rV38TLGAH/u+pv4+L1Wu9PgISv0mTBmR4tuBC3Z47pMX0JBdI+RWDc4pNjavqHaGjnWHhZE+ifuUBw5U1kMfaVuuvCDfuJ7Ksc7hMEYG1n9VXxvAdC6kHJX0y7jMdCcwFkE7Jf8XD+vx2Wn57U9hSOu7HqZcwk+l78pcNBXmi0Guv3n7cMBzUmktLJaSbmyP6iBtXST1CwDEG1G5OqdyUE5RM8Cwe2pKybkkZFCNIyhjzhEHJWgfpbzXtpyoKvYf6pSSbCpIkhNxJnSpYNB4R7xVM1lWjtf2UgAyLoPg+vAVrau1g2D1C+M+qrT+hsEc1GW3uafBhC6MwUrW+xB3QhXJRHVUAiKwdj6bzT7zmasvv/zyv/iLd95888133nknXxTD3jRE3N7eDuZgN/PBAAB2+0JeXBJETjr+U48Ohvse4V3VbdsiAiIcffTRD3jAA5/whCc89rGPPeOMMx75yEfu3bvX9aIFAB0bSC6iEFL8oN+s2h+n2yIiay1HT0i77Cgkoi996Uvvf//7P/axT1x77bVf/epXEdGSRXan+gGeoILVCQiN4SuDQEtOg8aYdrvPZcaj+fCHP/y1r33tM57xdEk4pW8BpgWjh5alDL+Z0KBfKewMDvXumDGuotoWF3YGrTOwcQMABSeIlBy7zplQ70wCy2BSJxUlNXvaLkqGZtdTaWH5LEKyZqG1k5Dsy4ToTXeBzzSI5WqYSueOlXuLLX3LjuC6OvuFmVtGJtyIuwvaOJyqwjXp2lSw8z1anfOrcnbIeabgdXJ9ursQa5md2Wvfbb2/EgfTJFBpQ1a6RKfAZ5HAsvL4LmAoDiE5udt0HcE30hL6lIi0/8q9RAAAS2gMASBCq67NcbMeeK2s1t3dyWwN1tpEDkpBrsY8hZRoliRxoEI9eeXPt0NMyOK6tvL90aMgI/S7H1W7CVs28IUFy3tx+ujaHHhfwe7t+eRgdWO3CsG3Y1J1CcjuKkPPLaZt20suefvFF1/8qU99+q677uL8khzaBkqOyFzWlSAiOyh5MwLU0Wwppt1zQQ4IcgkcOU2SeHvFZXnssceedNJDfviHf/i0004744wzHvzg79vY2EBEvuodej8dH8eGiP9DHDq6KMNFH2+fhOgFUDhYaVdLakScz+13vvOdf/iHf7jqqqv+7lN//4UvfOF73/muYMuf65B1Pu4tFwrJuPCNZnKDudz8Y61t2/YFL3je7//+7x955JHz+bxp9sDwncUrokP2jURYx0IPUkvc3ZqGi7n/li/vH+0srdIhk/25XL6MyfIHecaWWQY4XsO14t32m2t3ULwneRiCO0ozlyaVW5wWFuBP8neY8hSQ/L9eFFv8787gH3wl+C9TTxKNSapazXBP4zjYSftwGTrUUDIuM4b+JQelczWW2o2qCrDaCaujHvSsWZ7JIZp98awcVcliaNQoxwXqrKfP8rm2C23p3Go1epaKPugapcbNAkBNvOrOw07iIJwga5+dadeHRBqQXR8FhsCiiJ8hP147qx8HHJTyXI/ScuuCqU5IrCPELJq/aUZHUHYaU9wIRGgMyB0YXFKCbGT7nIh08I37lgAA5Ry44tQwpi+5EoiZmB/Q3xXRN/cF9SzB30F+qy50dsIJU3RQAqSlzAIm0YJ3ne88rBs+BSjL07VSD6A82s40IfZIsjfwpptuuOSSd1166aXXXHMNIs5mMznBLSBzyrjrXHj6E0KYkAAAlKdPcjhCSjNxfkb5hNviwocddtgJJ9z/yU9+8tlnn3P66acfc8xRe/fuJUJJ5iipFfXngwvjmmXMcsQeBu0okRYlPWXTNJzik2nI3o2vfe1rf/M3f3PppZdeddVV29vbM9NYa3kIUDnvyI9RBQC+aIiTVbKzkq/iQURjzNbW1sknn/xHf/SGs846SyJP1yoT5TKGy06N5qrdauX6S7H2uoZlTKWkTgE3zVcxp6ajam5zrjbPYB015P5HC/ljU4Pvp4Da4/9lGIthYLZZ2214FKu1KTzTrU91ldYy/Yp/oiXOTIi5PDkn5HFeSUKkVcDCFlTQo2Q9udtL8zCwUBQjRPNDjIlamHg2U40UWhKsf5F0eV4kf101hgXItV6QrtqwXDVug2SRI4dLuq4KMnDUAIlJv4OSZ6dBYxJnkF8FrM8dA6vradJLs4rKIc3MO5+rtCaZ3rg3Va36vBSpkmVTK+w2JOwQ/XPAYy1ZgwaU1ArWuSLQnP7tvGTgn23VBtt8PhcBiHLrqKo0PuwAEOlR3YGCoZ/K5LL87nTooNR/7pgwihqqnaJU3KVcH0WyaggML1jUzFoHx1Y95HrNz/P5fM+ePfv27fvHf/zHP/iDP3j/+6/47nfv5BPc5MIqKRUIKf4yrggRxUEZWANcUvI/BrgFwldExsbGxpFHHnn66aefccYZP/7jP37yyQ899NBDNzYOJaL5fItzMgbxYrnra+odlAF9dmwcYzwFE51EY3t7e8+ePTxkbdvecMMNb33rW9/5jku+ct1XSO2ZJ0U8ABACWctJPvm4t513Z7oBwBizvb1tDPzWb/3Wf/pPv6mP1e9IIotaWN6tsD59YZhCQ3E9LThH/6qdHTGv5hw0i9F/NWMUOih9CyTc0UziQ+GObgHn9EZmbv0fNMGwHBGm33Uv82pKq3rbqMkPmW/FJoQ8L60VTOqpGXtAuAR18iQ9LpWzNWlSDtqZsboHX3fHPy2mkXOSKlVGU76P2sg3VBVBOfKWufQZqRXpKT5rEl80UWgusEkWbnoqTRdXCwOR3Ttty01Vw9C9C+H7BVovUG8xd94uWlwBi+Zk17rZtJNDcqpO1d9BQbHYt0ExGBA1Ox85OMLfssx8rKlH/XmgR1DqHNBpY9iTQogEZKBTsiBMgkhAYPv7MxwLsRMDOJJJKic/iAfEoSGvNEKChJTTGdn6rlQc4kupwLQDdDHW0UbYdEmsa9rVxpN39LLezpACkBJe8ct7DCT5BO65/YWug9w7QnEmKp8XtdDMzB3fuePP//zP3/a2t1177bX79u3jlAgA0LZzAADop1Ls+eIoP7146AobJKIuB4R3u7RFxNaSaRrGx0ADEvWMQEQNmlNOOeX000//yZ/8ydNOO+2EE04AsOwwnc/nxsykLww7Q8ydgvASlbbl62IsX6vKzmJZAjUNWgvzre0rr7zy9W98w0c//pHtzTn4i3wZd4q8zHrJIUBEbdv++FN/7PWvf/2DH3ISh9YKPrSD+ShjGOMWGSi/0i4sZtAvh1W4xM0kLLc5rbEAhpoVg9V4XH75Rc4UkLssLu0eGstvcXPa8AqEZ4FdC96iXQd/ZGvy8Q1fwqB5dWciXMZCGZ9ltqi1czaoFQBWufBY5EqiZJnKBX+922L5RV09Jq78auNQKrDqk7cOlp9q0VuDoZZFMOmNJVoqTjXZY8k5dm4ugM+o4SjjU+/6mYo3yitomdowhjJuidrL83p8FoMaapR5e1p1s7v6a8l+jfpcl1lYd5d5m7oAmOB9zpbbNahxvNQYjZBy2MVl3PziGwUObAcldMRp9BtwdPBTKVoAsIAAgMQOykb5GburcowxLf9KnBoOIJkMTTk3OoLrICzN0EH4JagQreRSpzwxYjPaCcplBtJjHdjZhbpvQi1+t929+Yj38m7K+AIcfWRDM73EDEr966C05Ch30zSf/PjfvfOd73zv+y6//vrrEWE2a3h6usK984rNFG2nBtsUwU04kvDBGNMdPWZnJVljkFBFH8/bpmnatt27d+9DTvq+pz3taT/xtKc/6lGPOuyww4wxfL01X9fj2jKa8iwcdoaAOwKh4nHSpkXEtiXsbrCxToratm03ZodYIGPgs9dcfdGb/uySSy75zne+w15FGREtdSFKc0nqGiIuNt/efuhDv+9PL3rzmWee6WTybh4liJ076yavduZipUL76rnnH77sSMqQyrQIdXKvvCkY5JbVMbwTLgamG+u0URvzdtyLhYx1qI+HCtqCusPmNe6YevzHQy7v2Ihjs0TEV4TF9swqHDS5GuppWLZFx8M0x/BzMLjIqRQFiy1Wl69nGRgzf6d0B5dlXR6rklUfyweIkttC3cHhwPdUPxdWMS4TQpLsgZ2zDpaDzLjAqB7k1UHdujxiNUpn8Ce3fKiV51NBDX1i62ValHaduwLYmXX0bsB6OSjHzuU8ZFOvqEVQ54aT5wPdQelmbm8xqnz63d2V7k2LiHINLwBE2Re7T9xVOepN2+pAiiB2pxu4tt1G5+PUKMYOxJxYGTKD0gO8nDDSjoPcQjRBrOjNVDDOQVm/NJI3sIPuVzGVYnx2SxQus/BbbHE7LegkhsL/ALC9ubW9vf3pz37mrW996yWXXMKHhTkuj1QUM//JVQU2H2ecREQLxNewdMauc0rGdOPWZ7MZOLOMXWxNg0fc98hTTz31yf/2R3/qp37qQQ96yOGHH940SETzeVdemkZ3+VXFMv7AC3ovc5GMRTBTEDlHpyEia+dEtLFx6A033PAHf/B/X3LJJd/85r8yD0jGDSIvAL4jqkEAsEBIhAgApmkaJLDWHnLonte+9rW/8Iu/SESIjaL8jjord1gcLQ/1830xyVCz2Pa1gyUivjAqmc5mATTqnTU1JyFy9Y9CqQK0ZEhQSd4U+iVysnItlzRYV73ULFsjy9/sXO/CKLflyu90PsRByg8uM0SrxrHDMEZYrcJa8OusypylFU3N8j4mV0GS1FhTOSt9FRIypk+9LT223RpZXc6+OtgXfqgnWuHX3HZUvT1chqnqqaw/5uflbYmVWiNj5UBlPGYlwQtSDtTudXU9/ZkbWnHKjnpxpN9MeMltGZ81gXqOGhsLqcsvLHwyBXInt9ZxlTeVRTdkX93TIihdvzrrFNAi9BlIXPyjlo0YWF/gn73WOksf9OxbdZFYLAH6A9zsoGRUnBAJL8kpq0lpILPsSaj8QKmMj3YJb8WSmpUc9I5dx19NCmFC7pxRGDxXmqE7CTVL3FUjAJkFZP0bhnVLjax2IRXaQo8AACAASURBVGBra2vfvn1//MY/evOb3/zl674S3CrDLK2/ReUX09UaQELgCGoDqoxBAOCbswLjgGnCblAOijz00I2HPOQh55577n849zknnXRSS/PZbMbRXhxNw0ebfQqnFxIpbknMu/U8OTgIOd6T3SQiQmystfLctu3Gxuz222//z//5v1x00UWctnJra4sjVYUfgIfJEhi53dvycCFig8Zai4bmc/vLv/JLF1544Wy2oWbKThsHUy2NpsJn51sZs3SRvWXt8WlB3VIdR4KXm6b8hQ+Q17P6z4Kq2kEoGXa5OEr9/eACOPhKS2CIIn9z66iCml6gp/qNk58j5u8CLO2PezLVwCC2CzY9Fs/cnCpYBTFWeiNwgVEb60cogLf51FW1bL7RBcrX9ygQEcsPd7KSAmKr4DHK5FHN2So5qyZnc5a5cbFOrdoOLyy5YaRDv7J8bPJNYp8HkarByb9BxESZFrRqbnwLk4XcXUBj7IQshoO8V/NVfPHXiuZaDd0i3EoXj0yO266vO0YhsD5oA0D+yPN6OSgr5/4Co5CCe5qDksG5oXu3g6W5wZlb5M7V6eom4FIWp6AkM6daZkNINDI4vaytNbGXiCjt9SiIsJwjsjzYsaiqyV+ZIlwuR1X8K6g304Dfi2FDv0Y55cT3tDhPW89KBeWSC7AVQY09R/66l1x8nFg/1oK11gB+/etf/2+//3sf/OAHv/rVryLifD6XK2tQXcMitcVoSLsu40O3p6rNNXKh1CxK/NWaJSKy8PCTH/5j/+4pP/MzP3Pywx9+v/sdTd0OhgUAsIjGEPS5VnPI1BDqngSBNAMAsITGEJDiASIiA03btoTQtu2eZnbDDTe86aI/feMb38iHvln8ElpEpFbFtyOgMe4YPonBDQDGmPn29jN+4hl//KY/OeaYYzrhjoCAsH6HpyaEZfoy6nhjZUMFeZiqIZvRbIGRksJlzRtrRtFcXCDWX4MEWUwLpAxZEKzi9/EiKm4rXt7URK/UUzuoH/KnNUUwJpGEzBbC8sZ9PGo5myRlI8W1tYjoNqWG3Vi6QM1p1vIIlqEmsma5vJPDY1FDw6Ga+c1ot/tgzTW2dJI+9bIOJk13WF1+mpMBOfmc58nhE1rB/IK6U/m5YvVjvbw0jssvkBdygbbiUYA80eQTcovVyrYqdX1B0y12wiAor222hSGns8bgw6chQScFKqv7JA6LlVnMQihzdf1cXidY5Mq1he1D+RyKW01TbA+sIh3Kqi4SXAiZqtokhQ4sen3cOnFv8rI+Xr8QkafyjDEEQEBI3rhovpWSdt4CsEOiWzVrZ67IXpb2zJzz+byvAvNuspiIgSiPT9YEMCiAyksjpo4QLmWIx/EIDAOLivQYZaF0LGuQ1QaF6TJGfBlyI7hYPcvjU658HSIfy/zPkHMQaO7ixRW7IK21X/vaDa/53Vdfdtll/3rbrcYYfhmkidVTidTuLkTXaIKaEeALR4eV4YkjVc3ncwA48si9Z5111tN//CfOOuusB5x4PCDO51ayYVo7b5oGLAIAu8+SyjXg51iMTLWwWSuIe42I1FoA6EJZu3tsyFqL1GXfYMf0/v37D7vP4V/4whd+4zd+48orr+Q9Jb7CSGJdEbvriZBC0vGvDZqt7a3/7fTT3/72t59yyilt27LQNzAgdlZHiiVrWAWGAU9WfqVzONZ8FbeS70tozMXHJwvyZFAW1bQrb5SkLfmVdJ3qdqbhwsWfhh2UNYllum9U6owcDkm7RSif+wQiUZZbcA42Kr0Tsy8oxpeSpS5mSddZP9Yx5WMcajCsRGywmJQsW4M9Tqm7pCE1N/W39c64mKRDTrHuqjSZC4O2XOS9zS60ksKqYtD7a6AhZYoHFAZlY0De1hovZ9LdrymvccjZGMGc5V8rMZHCleogF2uWo8Yg7yVRquQfhVVVIIg8jxqmuMWCaq6hQz3FCq0n28rVFtcQEEFLdS6c+3awp7liOTrU4M9vBh2slczmau63nUDlgxtEDFL8VqPiR+kC8R7wWIwPWkqjEc+vsehNAqqtpdJWyKQWpq1rdEBOjk2yl5I/ZWci6LiWmilG7lqVsoOyfhCDySK2x9RsEAcBDNvw+lc+8jxqOFYG4elkESNsywTRjhbIoAHfOSt1kb4Y1rry/cWwnMuuu8hBIyEj1RnHKeKmGSKnEvJD0ovF3M5Sil3ieIrsZJBOxpiXYTE2rVdmNTU473sHTdMkGX3JGVWvMnNf7QyUzYX1gUARkjvQIdNMfm3b1lq7uW/rxhuv/5M/fdO73/3ub3zjG7PZTMSlZC2UUOpepIKLzktJLlLh0J0Ts9OGhIgWbNOYbmfDIIBtt+1sNjvllFOe85znPPOZzzz55JNFLhh3JUuQuySeqjERpiHoAQvxDNW8QSqKFgA2NzfZ+bux59C/+Mu/eMlLXnLTzV+fmUai3zkTqOW72gmgi8QERCO1cSvtfP7oRz/yzW95y+mnn+4icDHIABLb6OsM07LTtLK9pnxOduWW3+WlTk2LZYdmrM3dc7cqgLo7HBboRbEjFtTd5VErHkqBdVumds3YOVfmOGccS0LIpP2qwSS32Bs7Q8u2Wa58cqEi4j2oc3BFEUP9hiL53qJKG3JRKqX/HAJ234f+brbTOBdzPdeVFypBuwCg6V92NS7fev3M5TeLxdnlTxqVMsyWMQn+heGDHYkLiCrEbx99lusdqHlUTx+9VM63Pvy+4NgtfFWGsgVe00osc6RM4SRvTrZPYsMkK8kxAGSkXz09yzQchXa5BiUiICjo07BzU4KvwuqlR+UoVHY5ZZ943UlWtZxUX/CTXD0kEWQLYVUjKxZw1waaouyCHEuNMeWtmv61SUXJLaKj97ktw+VPM9T0qCZntKfLIOMcL+AwirYFfKaApG1prbXGiM0sy0wLiARkgO2lFviVC5fRHj+Xd7K/UEhvBAZ5KomoaRr+YQ6OjXxh0d06KiyeI2U8DWI1L12SiZ07luUPeb+gyjtMWwAgdcnP6q6MqGGv8cn1bFA5uTDapBBfBufk2NXs905i+oyCHWiiEphpZZrF9NRxxOB4W/4kon/5l3956a++7G8/8uG77767aZDzEorFxtNV7XD2Nfs3bpM2amVKC57GmJYsABhARAT2WJKxdm4tHP+A+5991lN+9md/9olPfCIi8ipLfxt0uYbrAmz1T5PYZ+sGsd3MkBR9+gHceBERIrVta6Bpyd59950v+7WX/+mfXMSFpVq+9Yh3nACAFUPQ3J6Z2drafuCDHviXf/mXj3/84+fzuc5KOYlZv2oYK9xkKbhAQzDGvI4fkmjLqBVMydzazLo89zFiObLklnDlr6RBVQ8Omk3gU1skW+6r5DIj4wPNOijbtkVsKrVnbmEzWJ6I9C3VlHLegRJulcyZczpARN6YGyv7K19pw45SjoBktQW3CP/OmijJG7mYRCi6e2p6V2/Ej3pTabSkiuWOYJeiJHKtayt3iKOW3VbXI1Xuvh7NmjQRlfJTFgKx/e8WNrrmjs6RbMnlOPPwKcu9QPy27bZs/FfGIRIRgA3iKGugJtHEwu8p5T4bowWylQdDPJXxNraeWKQU5A9EAz2qxSQnJAm7QC/qy5cZOFl41IYQuhRPzP9yc+4ghjqTb67mHLZa4tWI5dy4Fz6EMTq6UoJBRksm0abqPKfBh6Nm2agZDYomMN7+r9HUyTMN0VelM6xlUyFf2zSHvsfSs6YVnTxBOD/Q+LE0izcg6+b1TjgoKTyuToH9Iwn0nXuCtaQlIsCGgMD2Rz/9fmn93t3TwMW4Qkl2x6X7hRb4rBPvZsT6jCpiIXN11oBGzNErNHckAjEwK1OTZPmh7WtgH5PrTjB4o5cf492ay8JiLY5VjfU1x4J7HQ56M4g3IeBGG91OBQBt27Ztu2fPHgB497vffdFFb7rmmmu+9a3b+VIUPnItM7Az6BGICDjaUR3WZinG9UvriMi852pgWoE6oN2FTzdN087nDz/llGc+85nnn3/+Qx5ykrY50I9uWCnsJGPvCKQliWXXIgAAiO9WeIbc3kzbtvwnj8X73ve+Cy644MYbbwykKx/PF2elXpwY080MBDj++OPf+raLzzzzTL5+J5bJq4P1H9blMSwsBSFlUpc1oHvDc7zbKw4ypQSHGYVtdOEa7ez+LF3PUmOSLkAZLC0sLZSg38h0Miq2AVRdvpFXtn2D2rRRODjK9SucZIsp9Lw8dzAyh6P6c9h8t8WLI4Ko+aQxnaRMkhrjlx/jYFqLJVVbzXKo1pIMqAel7idmJU+EyoOWBcmTtPAHvwr+DDZEk18lZV3SxvAPn/Y1xA6CZN8LGzwO9IHWWonHEOc8raf5WH5L0q1mmNYKOIIvQtK6ldpAWgMYv2KCDGNAkduT9css6/HOq5VgLVCuebB8roZ6BohPJSbtgXriJFus0QiCzwIrxJpniEToqJjlydetPp5J/l+qiRjnMuXHgowppDw5uZKw9DbGYhSeCgYNxUp8cnMKKuKvcwEN6ybk3YhbkeF+jnL2wPYnTjiakiwiAroVMPQ+OiZRK93kfzlhDvjU4zJN03gOygA5TbJgn7NsQsVgXa4ofZhUpHbZdAvMemstEfLaXjrvOiYPksuAIW1Wjjd2u8gF/hN7U37chTlRtZaU5zhwqwMAH+GcindzSqXetNoZ1+HuOigLBoHmdpkOorybptm3b9+HPvSh173udR/96EcBoGnc5GRHpI2EFxAggu18UeAURrwksFGOPCJrDLKAYHJtb29zybPO+tHzzzvvrLPOuu/evYic6AHAzWKO2QQAnTZb910UUhKSBfR0hqXXousGiiyhJOnesyDiwu4bXYBURlEeI/Zl/+u//usLXvCCK664wkWQsQcTm6YhtESko2gFh6ZpGmPatt17xP0uvvjiH/uxH5PI3OT29djOFj6P1bN21tfo2rEqebys7tcYWkNVLgDKf0JKZvoSEhA93xapaERr57PZjIpJtbWzMtawub4EUpqHAtziXOp2GKJmyzI9yedkjcPgJmW8g5qsH32HBSgm1PJW71H73467JCfm8NjQzPWophXI8J6jSWhL1NfvagjH18e/j4jUnyf7pWPfQPFqTcfJP5lVI/xjKsXl4xGvn/7x5K3Bx/1ViviLHS4izAvWnexcokvGksKnq1NbgwWLqzw05V/LTvmgHvCXr/EMgoij/PH1UjBJeaEnqQ0YMW/kW3R2dQ0E7QKAtvxlcQVD0438lVJ9dPYoDOPxzfFtTl6BP030KPADqhsXUa0Jc9/yXEMHOcrk5IPDU44bWze+rMvC03g5/HVOYVAqMqdrCq4c8m/TTvK8kCs31sFXwrG51pOaWo9CGWKtF9ccS11MuQ5jzOXPZP1BK3FMdM4PoCEODSt3M9l6TjottirMjdQCEHCsc0AbHHJQas5Zpjk9IkGLkig8J2fKrQzyQ0HZ1cvA+s5WfiLPg1I9N5sKoDcY/BHHMm1FXgVCLDmzyrp4EtqOAh+ftmM8Qwj9SWvy7vg2RGSBEBEIAbsISugSZHfy3/jnRJ0wmQmt9Cqya0jCLAPkYpLFSz6J5AoEpe6quCaTe5JJUY7OvNBmon/LZBsNIcpX8gbya4yccByC+Jj5cHrUcqP14mMkqqNh8BhF8GZyrIQ+YlTtegRlkm0YZEbwLJCp9eEPf/iVr3zlpz71KR3PyPYEf4XEgXZkwbEPsr0AAKDzSII+0A0EABx9yaKtC65sjDEGyfC5RT5C/tSnPvW88857whOecJ/73Ac6vQVOXGLOvKgY0LExyKsOR98ByObLy5cpxaxp3iai7p4cAEJ41ate9apXvcpa6x3qN2itZX6QCaK9nMaYtt2+3/3u9453vOMpT3nK5uY2R+/uwNzJS+/1hfiyl3hxGBj6ou9yxpOvH+OcyFznXJR03NYouuk7MXK9oNCtk7gYZzFzMDD0bZTgpfxt/vduJ1bbcIV95oD3eFoN3vUsOCeXlzlpT5GDprKVgilfNklras4tFaQUAASXMoEfca9RYmeQT/PsIjNYsWjGq1kEBvzPD9KXGgN9sfMfOa2nxze+sEgsPeoj8mox0cnvc5Ztuafz+Xww62XZuC2XL9urVL11UeDDgG6x5SybMQDgWkvznowgDM1KP7/VnOuM5AkEWJfnZiwwy1FONbQaWgcl1rRxnSvSwrnaUm+SlCS9LpPd8aCVgoNvUKqU1yY164i63qUpXPPtYlDmunxbFgDaNtzeYNCWz2J8kpN1Qu2CDM/VVn5foPBgE4v1kZQruYLgIyRAPH/LuI3Vesu4blf6ScFhXdYdNQ1RtYNS1znW4k29GVjbJrtWsGAL8mQqqTIeZGOvd0pqfKy1YAgBoX9P7KwkImMUT7oToi31JyTY1uKNK6fT+8PyYja1RGRt2riPCaRPieoxqNnjLZPbfx9HO4Y72OTtSukYSS7f+3eGTKha8HFI45nvUTqTly6ZM1/4OXbyrhqmVcA5uzmeqPGxhbUCYXUdRbVv376//du/ffWrX/2pT30K1ICKMQ3RgVBAQEDwnZL83GCfm4mpIQ7KkKUNGmPsvLXWHnXUUS960Xk/93MvPOGEEw4//PAgLob3MThGQ96PHM2afBylWXwAQu98jDlWdJWWCalDbX1eD1CmjxgcbduaWQMAV1111bnnnnvr//dNkbHdrpSluHUZ2dnMtG27d+/ed73rXWeffY44sCacrSuFejW8PFaBtIFoVsaaDlI6Lokz9ZH78WUjCYeRiQ50F2w1iIzmHN005u6rMBFKTrYP3tYd0zAwuXK6bAgS5xtAuSEGK/TtgQHMg8oLJeOgdd1Wsrl6y2d50zM/dxKOMGdBQmBoqvKa20NHdiUOSV6FiPiQMd9z/RpLvXJtubnM6RcAgH3lCkl1lKkCn+Sv4CIOqDvuVHWwrpICefVUi+FU4GNeunQosA2EP3OZy7RsEcjMLH2qafiEU9wWFKd5zEtj6VnmSQ0F10ONyqhHSbcoNka5pOtF+og3eNc/eroPfQs/9mLEI06paPSctIGh2ZErWfN+fSCQXYjIDkqIKFOjHxdtl8jFBuq5EHNgXD4nkfJ6rf81mBflIY6bGAQ/jdtwbRrnSjdrAepRrdeDsJBYqDEA+KE8icZqn2VmXz0vLQqljcYcJjnc+IEyJ6UW0y/LgBtQ3rTmed3lsdVSBQAILYBhv4R1F+mA8j9ydWgMG1bUveAAx23ZRHQywVsFGGM6B2W8M1xAPZiENWKiTNx4KTgEtY6SUVN3EM8EHiMUeS75evmrVUytRCuiMFbXirSVFBzxv1ymZsE8BVoA4E7nZtAGFTXJy5iWAAC29m9/9rOfvvD3Xvvxj3/8zu9+zwV1y/EWgCjAO2mESVtiwMmfgfCyXU7aBtDaeTubmWOPPfanf/rZz3/+80899VRjOMaqixcYpPakdOwbmrzaAx1kECGaBcInxpivfOUrz372sz/3uc+B8ovxM1+CJPGVxnSKgRCaptne3r7//e9/6aXvfsITnsBGquOx1WYaTfKS7uzkbSXfDKqPMkpDkYDhwWTXa5SFgSjapEkxlcGUo0B+XlflfBxlOK4CtKispFVh6Mca936LAND5VuLkMDu/TTgt1Mcild8v1mJsK9rUxZ3l+qBiYVBeMtU0AQD1WSanmsu5MovxczCPoJSDZdCirjlJsMugZW99+aS04T9jysu2cVxPTf3l98uAPni4TD1l3CpXVYOqv54CMQ/DQpO65ls9uAusXifR7wHOo4yoGhlO3s5cJ0uJiKiVi6T0hxBusg5fMLXweAVaWD5KtTji5GLyq5oyfs3j8thmOkXxBmFhRUZ+ggIPy8yJnBy0LRmDzrDRyCwv1UtX4mS/sRIsP8KmGisxloHCbIIxIigYWVJBDOBWZ/5qol7Xe/GGtR2rRbu7DIOx0idLbJR4SqQKABgwAO64N4CUZ451ROCf+jnVttvcF6mti95gL2bl7mKsrfUuAT/IMAQPFRTpoIJZp4/MCsQE9EJ8oDxTv0JMeAKOKhyC5PuqYZog0PS4TJKeI9lQ7ldIUTg2MeuPEC4FQw5KAcZtPp8bYza3t6677rrf/i+/8973Xra5vdU0jVyAQ2SJwrnQNYUAxGkn+37JEEthzY1xDJEFAovGwFFHHXX++S+84IILjjvuOBdczS7dJlB72pm+Col2EAYhCBOI5yC/2dzcfM5znvNXf/VXnCKAr1fiZyncMQyRQcPH/AFge3v7QQ868f3vf/9jHnPqWD26THc0VnoNvKLWk9zLs64gK8hfoo/ELeGgBAAXGdS7gGPlHWOu34+Vb0kJye8zenPYQemV3qXMv7mFTb3uo7xboQDJjELR53FqlwMGtO0IJT7Jfh5bLAUiyE9CWK3RgjpxjDuJQd9IW0abHxYdrLWI/Q9EVtkilU8COuvnmMPde44bLewEr6mDMpaonLE9Z1tKmdlsxs81LmZNLjuU0zB+BmfrFjQC/ynPY/l2WoW7jLuzklFh5NoQl4skqqHPYkIjiBkcXPXE9WtuHItzUF6kdI7TdLX68goo5nt1awerc7DkSmpqlE0yqOOB2HEcu2Zy9kNQEwAs5qCUaK8lrSOtv/Tcp0zCipwMJyL3WGnngDtrS0IYolafCVi4T+p5EeKMlQODv5btE4g2s2HI27M8+OlBdUR5q8bXs0LLQETWzuNNhUkgdfW0lbPb2imROK3VAoDly131gjdaiRidh1oc95LspTMaeVUMA0Ktv0yD3R+S8BLcUaBg0RVHVkZ1pt+sfgGQzhCXP05egjpsp1zexKq6Xo3Fra9uOTpKlCiVWeKNnQc+WM0JX6mD1lqYz+1XvvKV173u9y6//D13372fJ5F4CtgF2R3f7nYVurBHQpB8gqK5RUQiiuziG5NancXSxWYCkUWE73vwSb/4H//P5z73uUcffTRivwPjYlLCHb96Q2oS2N2BW09Isj34XjNeX7Vt++u//uuve93rEJEVm7CB5DXTE1+iZVuan/qYx1566V8/9PtOIrTsp04jw01P0Z3C8ypgZ1krl1FU4xDG2VVKP6jwqxZqCNKtVEjOnLPSwz9eydQjNgno5Q0slFS+XsrFun7oq2XN8SF8pjyIN9jWKF1QR8+QM8vtjp3Lq44HX941OZV0mtwWCj73bXsN6+iIzMFiemcsZ8YWVPAVP1SOV7xWip93FxaboauzLdfZmBwvwbryhdx8UhIqnKpSQLaxF9CY7i8vkYUgsBiXLjZqNbMGMhmBVwc7tm4KYAqZkNBo6zyh7jFAXmbeej2r1xfZzB4AwL64yfU19TGePZ56UUDuQhvjcu6zxOD8knLc2/kcSQ6GGwNsHHJVOlsuO3ADiUfsvAxy6vW/KXEgiGqE4t3snGrPTe+dV8l1eSSn3T+f0uSNjZt1ljVl3AT/YIm+W8pAt949A4Bz4jCeW1tbd99992/+5m+95S1v2b//biLas2fPfD4HZafypTf6tm4kAINExDdcdS/DHYYOjH/jlXijeBoDwEMe/MAXv/jFP/9z5933vvfFhtPYcU4Hb87q/A7Jf1dHw4OQg7KEBMdmfLv3m970pvPPP5/fIyK1FhEpGjfrrkMxxoCh7c35Ex5/xmWXXXbs/Y8Rf1Ns7C7voIz7Fb9fdQR0fZKNhVsAgJR26MFpk7EZWpeF8S6MsoOyq4EfdlE+LOMhHS/lkhfflc+6CqyFN2EUrMIpGZSHKFnnpLy06tjGRepf2ElRWXIxN1xNu/GFk/cMri5TKdCJWuDUSNT4w3L5ZOu1fdtZCNYXqIJloA7z9XGzLgbLzy824UBtrRXsvXJtUHHmY2GEUx960i+Q3rJegzFu00UxKZdMS+nCRD4gQK/ox67u8yUT2b13nTjrgMPOQm7VkC7p1k1hfKsvPVZnC+Vuc+ljrrHbZekvoyMAAnLhXF4MpoqqaUXzypkzo3LXkorWAoDucIdLhFm66GYBNwe3Z/zUubn6fdKEMSn5MrXgcNYG2ar1aNprfm+YnMuYMrtAH+etEX+KNs5amrctgaU77rjjD//wD9/5zndef+MNRGTnXZoGnTISollj3FUYoE1bhG5Oq/353hXVtWubpgGLnCh2NjMPe9jDL7jggmc9638/6qijEJH3H9jByw5NrMtkcW/gwAMRZFzYE42I7373u5/73OfO53MR3B1HARGRi7dlUc5nssgYs701f/rTnn7xxRcfdthh2BjnIpzymF4lC+1QioaRMAX/h3GUooxHtTsGk+F7A/Or9Jxbbd2N1xifaRfAfv7QVUfnrQJ24jDyVAu/5blrncZo8ZMxi5VfhVtZLxiwS0m2DrRdHAZpVe80rzSiatyjuarGjuxuwSp4b3U47C4Maqgd8KMVOLByCb8wZy7Qu2nl54HCJwIBwos6odYiLUk1HFjYLgsuh6NY46P1rFv68V/T+MRyDUnwo29rWa06LQe3WI91UW3PyBv2S+jwKcfh7GmZy4f6Vz4VikSttVauLEweApXcZ9qBsoAyLlJEatMG6DQOytSEh1E11LeiXtjUr7u5FNzJFuv9Fzp6N3fh0srBEiDqcDK9W9i27XY7f83vvvqii978jW/c3CUhQp6wYZaoGt2MEgdnvfwX6G7rNtD7dNqWEOnEE0942cte9sIXnj+bzThSmtFwFOPEDX3UJH+7A5bQQRgFlZKT+Wpzc3NjY+OKK6746Z/+6f3794P2hhsEAGotOysBOlVhDDRNg2S2tree99znveENbzjksENjQ2el/LDqRdd6xGiE4h06OTBl7q1Ui+mogaE6ax2UawWLXV87thHod7N3nxrjI4JH20JB5TWUXO7Y4LRQe3vm6iGUqDRpHqtl7Oqx2x7KNj6AHZSLcWmlKyf5be6Tmnbr8VwHqPfqHriwinHJ1bmTEnWsc3zw7PmKoGwb13x1z4MxG3K7b73UwzptNCZgIqaKbUtd+ei+i+twZun/DAAAIABJREFUdQ7K2Eum8Sd1voodlPrKVnFNyjO7dCQIgM/5yRFvcZhICJefuJyIqAvO4o9jAVE2kmIlDYteYC8Pq7glM8VtWTflKNYk/0CcYiDdkAEAghYB9UUKrpUdPuG+oz5KGLpXd/dVCwG4QbTQxS0CAJIlQjtvv/2dO97znvf82Z/92ac//WljDNjugiqOcRPQOwD6JTg6GGMsWTn6jW6rQVLngpuxiv8tANz//ie8+MUvfuELf+7II49EbPSxEWOM3ObG5VeRk+IgTAhlYxF8kdK2LRuL73nPe573vOfdeeed7JokIslkCgBy4xIRIXUHi4wxtt1++ctf/qr/+mprLXRhlEpccysr69HqYD0clBomMA4mJGPdhlzyuPdO+K/rYUfQCE0xn245Q7AvPy021UZUmHF8bCsiPWq6sE4zbh0clDu0FFyA/8duDrk0TRpWGJ2xY1Czt7HYRtqayMadgZhEg91PFpaHdZIkS8Hyi99lGp2ECfMXju2cjB3vwF1AFomuXMbNt4q0b1BdZ7n1A08+122oV43CGgtkS9AiaHeWyXDj+mSC7jcs81sX/e6FO7tNAMA9taTOnrrMksHaVq4MApVIhJ/Z+0FE7M3oHJQ6LW5uHzjOjzAVSXbKKSlg/TLZTBajWpGkoVFDfTSoXCgEvTIbIOMBunW5gNkHu9JN3gGwFpvOd8yHr+db28aYv770f7zid1557bVfNMY0TTOfz5Gg82A6lxC4zsqU1p5KUtGRhGCtNe7yHH0vs8wpcdMDwDFH3++CCy74jxf8X3v37p3NmG1MEGEK6vY9vSu1xlL73g6FoQmMe/5z//79hx122BVXXPGsZz3r7rvvNsYQArX9TWfsoOyqsMS8SkSzBre2tl//+v/3Rb/wC0FcLQDwJ4uxyCq0QE2Lq6t/uaPo63XLs04o4Y9P2iTycV7T495imQTmztj1c1R/t88UWQK5VU1vPNDSd3ouCtOYs9oMrdw4WcAuGotPuUzlLd4rhvRNr2NrWcX8Gj8XbFTswHNQLsClsYOpfizWQTCuIdSQZecth8mB/KiUyvILS4ma+uNq45epYuG1eMH7moYWQ2+J8mNl0VSuwEVObcbP6o0sEkdjFcmutY5GXAhqR2Eql33gyZG1wHJ+iZydVn/x5s5DjEnoFSTqCc5irbtP3CIRcSiMzpUHAOyslDfONamDq0A3JwnrUJbBkDlmC75R6KfJ1NelL2LI1hArNajLGEw2ejBRzfp9Fahepy8iyBuy9ySxkoV1c7MqHyIidkkMrJ2b2Z7NffuJ6B+vvuaNb3zj/3jPX29ubhKRBTLQ5y0GCVujfqJ2AZIC7u5vY4zEMPN0Uw0TuMhN9yM1TXPUkUe/4AUvOP8XXvSgBz0IEZum4WO82HmWunmn2GndlxAHYSyIxGjblrnokre/47zzztvc3uIC1lq5jkm+Yn5AxNls1rbbxpjDDt245JJL/t1Tn8apPJQ6zx0WOAg1MNXValPptXL9GqQt6+u+tQYxdCavGADKkZLrQZ+0XeFgGgyXcbftFOy+prtnLQit+jcnDXaf5gdh52F5abCaVeGBB9PKVV6GrCKsR1oAgPWY78tbWTWbefVl1oEmMexM1OfOwyr8P+Og0vufh7LZJrCML2v69QKLK/enAQBLc0QE4uOe7DlsEdFakGcAg9FdGvynuoejqx/8kD4J3dM+ybZtvRAwjaYvUnUVHHHAh8m3m6aZ1jiOibUaB2W8/FjEQZnaJ8lyZGYn7cAVHyMg8MHLy8l3U8fWJlkPEPGuu+5q9sy+cfMt//2//z8XXfSmffv28Q3d2Ji2bQ0o96Lpho9vJuG+8Nlbyb/QYOe470r6F+903SfgyE2ALo3uxsbGi170ol972a8fc8wxvBfBLksLhICYcS2JgDigt6YPAkOwK2itJaLNzc3DDjn0oosuetEv/gJvRhEROyjZSw6+bEHEpkEAINsed9yxV175N4957GONmYEvqVjB3GtXDkvAgeGg1JfCuXE/IB2UK1vilox7J73NapoeBat1UGqbRJa+a+mp3P1F10EH5UG4Z8O0E/9A2PbYCVieAjtFw/WZ7wcdlDVw0EG5cgjsT/3n0N55jY9yvRyUfBTduRoMEQFaSVHYvXFX8vJXiNi2fXo6HcslEEViig8UdBwlukOo3RHvoJNJZyU3GezYBMdtDhANVDbIRgx5ZskUT6SusPielZd6/ck1Gew8e8TuY3HHixuR3X+b+/YTwnw+f8c73vHqV7/6lltukUyu/NBnb0UAAD6mLd7Avmbs4iJl04ATVnYxbu62ZWlXXEWEsKeZnXvuuS996UtPPvkUjprsrtDBMO/DTtLwIOwWiHcSXIT8fD7f2Nh45Stf+du//duamaGX9cAuS75kqW3b2WxG1JKlJz3pie9973sPOfRwxXUAjr0DH+VBNrsnQnBi4EA3XlcNWkfnjsLtFqxPxqKdh93nW38r+kCnfM2W/D2jpwehFlYh6NZGeB7AcG+l4TL6riC7bLxOP3Ck3IHuVK2BXXZKFkA7f8bsna8/p+VSP/Eb7Lea2HOIDaicktrNooJgtCuzD6PhkCwXIsOxlg2oyEpEbF7xiv8CANb2e1y5larctqwcnA2AF9KZ6K612o0alJFvcxRZAZD6F9W/EL0fhtTGoK4h7jgPMJ/PX08GXSFIFKFwkY4Um7Ah6yc2YK6WaaM99PP5HBEbYz7w/g++4Oee/+Y3v/l73/seZ6IkANt2cTT99ogaWK6qO9ndnfvmXzuHPiIS947HHYgnYtM0cpMJEbWtPecpZ7/rXe967nOfe9xxx3PNPOERAE3PpQUq3csP0dwzIHkkSnjPGLO9vf2kJz1p//79n/jEJ8Dfa+q+5c9tH1DZNLOmMV/76tc2N+9+yjnnuPyTKLH3gcyHg1x0zwRM6aaDA50DnkFGnlne7yJCCsLb2KYaRz6Ss94x+GvBt4i4JpgsDZqXcn25Z/T0INTCJIJOTurBQet0Iri3EnAZfVeQXRSv0w8cKVdDkwNdbq+vvaoXTfECKg/rz2l9vEvgnCEitoddZwkQZTkJKvBL6rK2VX5FI1RyZcSLCOwTYz8kl0EEIkJr5wAgl+Soqq0OxcTUUdz4zVhP05jyU3nQV+3Djnc2YszXcU9g1bAzBz30VU5B6/w7ujhWa4GotdbeeOONr33Nhe94xzvu3r+P/TXWWn19TRDOLe54zh3p4hwBXI5IOQAub/QMctO4bZpme2v+6Ec/8ld/9VfP/Zmf2bPnEPbm85wazC9zb91NvedDPLLCdZyPkoie//znv/Od70Q/q6kc+paIXebPpuEtqvmf//nbn/VT/0dLtmlmuoWDh7DWCaY6PF7+9t6lfcbDtKMwFdybYycZVj0Kw/Xfs+RkDT3XP+7jIByEgzAWDhTbYNVaT05VmtX3eqq+THV0/UCBdePJMpQ15rS+rFXkoExbOBJByX9KGdvFaPW+l5asQUMqEE3WqroGgbbdns1mbesFYPI3/S3eAVp63Rs4K+MEvUmfa6GrPT2s5eOuNYS7ZzkoQQWZH4TJQFhOHOhqE6AlIs6gOp/bzc3N17zmd9/whjfc+d3vWWs55yPHVEpt6Kd91Xkk+fg2p6FsOSqW3ZHYoyFJKkEiLq0FgLZtjzvumBf+/M//0i/90rHHHmutRTPjYoIzDG2ZxhvU96y1070Ici5C/Z7le9u21trNzc1zzjnn7//+7/WvHKULwodActybQ+gfcMIJH/voJx72sIfx0VWuMOnQPwi7BwcdlLsPqTyDa0KxwMDYdXx2GA46KKeFgw7KHlZ3pucgHISpYDrmPFBsg51xUK6o8rgtm/EGjK0ngIMOyvUB7fKGCO0J+zK5B8nGzgS5kts74u3nlCTqYh65FiJCY1AdypFLcsTfqIPJdFugo8F00JYG/zB5nyqe8066GLTw1u9VRlBOC6szuXIpUQ+kGwl2EqblAZ4nMqPATQPme+bn7e3t7e3tP/7jP37961//9a9/HZTbHQAMIF+ZTZwcErG7/YbzTqqckpL0AKCLmpSLdHSUJQAgAcdmAgBRu2fPnjPPPPPCCy889dRTZQJaC03TyKSVbYedodtBWE8INnv437ZtCeGmG24888wzb7nlFgCwQGB7iQ3u7hxxVmJjENFuz5/+tKdfeumlbdtiY2azWa6tgzAE0xpMK4/Xc4MbbJAeVEY5uLc4ZQ402JmFSqmVe5acrHdQHpwFB+Eg7D6sRv6s5xzPraaXwTPZ00Ef5fpEveUsk3LNqxvfxSylsfisJ3/mYBV8W9PitAF8AOD5UqC7HgfUedAW3AnslqxxmeiCYMmgPANnpVRemplb4bbyrZHYywAt8bAEy2O5FcR1xmo3jWBWSYx7kJ1XCQfKBNs5mJYHuDIdqygcK5GPn/zkJ88888yXvvSlN910E7gAYTnTzS5IUvWAOugNAGStHNnWbkT08/pJ74wxjAOfz330ox99+eWXX3HFFY985CN50nINOislP5Qpc++bO/d8yMlh+YlZhS+6eehDH3rJJZcceuihWoWgAwBAyZpnEACaptmzsXHZ5ZddeOGFezY2/n/23jxOkqJMH3/fiOzuGQYYjoEBORRB3FHR1VVgUY5BYRcXGdEfIoqLwCCnHHIIyA9FBBHFg9vhVHBXGZRd8OQYB5BDDjnkWuSUEZBzBmF6uivjfb9/vBlvRmZW1VRPV3VXdcfz4TNUZ2VlRsbxZsQTz/u+oVA33LaKmJBQdhJiQ0dERIwAcdYaEdEtKM0JI9qBaOIiegKNqM92QqUwwo0olxIeD8lHoR2NrjcZlNDQC4bny0HEMoPJzJ4OySgRlDB8xiTQGpSa0WVwI7fEVq4jn5vEZS+Z4HasrFZs/2HFrl9Fcxl2tJIrjrCjg0EE5EBaLL3/pZdeuuiii84+95wXX3xR8hdbNPIh7GkMjBl9Q4jAlMX1Q0S0hpmBWNSOkI89kowmAFkub3Z5r8Ys2wkceOCBX//6N1ZeeWXdY7DWqux5YkkzItoMtb3glfNJkpx77rlf/OIX1RTLOaICzrp0lmwJLGZvmoH+ZMGCBZt/YEsAYMyisgaO3uOfO68XBkL9mhldydtf871Qk+MMbiGYRkRTjNTPqLfUEBERERFjh/jWrjcXguDIiqC1Wh2vECIjzTYOjc+PgPGbY4yU/+lOUPBvXmYiUVBl4Y+YWc4RaQw7WWwKiZkrtOR8OZKtSdmB5KhCZAeIKKtUSh0AsKTiYWLmcgxKlXRVixwO7zRN66Z/bR1pmqqDYckLvXpfaOf6oeMEZVM7GAnKjiAMYWCMYQBisphpeyVs36233nrkkUfec889/VOydDREhD4LlW4OiNxMyRoZikQUungj58pn39YSu8Egop4jY4SZa7XaTjvtdMopJ2+22WbW9jGzczVrLYAJB3yjh4qIgKKd1DxO1tovfvGL5557rp5jjEEGxnL/0d7IlH7gAx9YuHAhsEn6rYQXCDrz+BOUvQC124XK6TaCMqK9iDZZUKyHCeuuFZs7IiIiYszRfoJy5Pcdy+u3cjwSlK0jEpSjQX2CMhNgecJRtZPAjMYACUPiNAhkdi1KEVHITZA5FRAAUHYJw8zyKyAkIpP0EZHJguMJlxnElJQofiGqascmmseOoXMKx+qCcDQGkRrJS5UIrleeXum43QWtXg38KJmkNK1NmqZ9fX2vvvrqEUccccUVVzBzmqYAIOEmwasdDSARaSZuRBR+R8MXoFdQsg8Ea4xhlzl0Z1yndyHPVGzGEBGz23TTTY899vjPfOYzfX3WOSekJAT5xCfSKqjus0ykBxxHlDZyNNvS0NDQhz70ofvvv99aK8JJ5FxNqV1RLuKjDaRf+9pXTzzxxMHBwf7+fkRbTpUjeuLYaM3QZC4y0glo9bfxvdCN6B1T1rnFTHV2NNq+2ju1GhERETEx0J1zjPGV7IwXwdTkviNKqtN6m46m9ZvHTO+GfjVevajTArixQf3eqKSkChmzOJI+OTCWUwqDSGJkHarhH0V66ambLDOH0pp6hJmRKGXmqot3K3rGanqcCh/XxklnzxCUIWtWqY3OBd+dvPB9LyPWdYRIrvnLL7/8jDPOePjhh4eHhyV4n/wKvTM4E0m0voyUDJSSYW+XBDiSMEePCxOkYRrCeJfDw8PTp0//3Oc+e9JJJ62++ppEZIyIlIUkks2APExs842BiAhBGM4DvJj94Ycf3nrrrf/xj39kBLon0wEAiC0a9fhWSr2/P7n55pvf9773SYiPUm+PBGVroAb+rZGgjBhfdIig1K11E1xTNmVtRX/dKrrwTRcd/yMiIiY0unOOEQnK6leRoBwpIkE5GjQkKPVbP0GyIARlxoVkXKSKHeV36EOTFe5BqbW2eE3hbUQZlrl4c11CrVgsDvkXCKjJLpxZLg+tEpRhAzRHY3cnanBO9wzjXkHD5X3uWE1kjBFSklJHRE/99enTTz/90ksvJSK0Jk1TGUMQxplG+TPnB8PoCeIqm4nLvCpNvlIXWj1urRWhJbHr7+/bbtvtv/vd777t7ZsIMW2MIZLACDYufiJGCaUpJYJBkiQXXnjhwQcfLFx5rVYzxqTkVOcrNDqBBDO2iOicmz179q9/dY0xxib96AMahOL8iOWhPB0phmsYjdtOp2Mix3fQxEbzdh/pdZpv3GaTy5YJym7vdT04rY2IWA46KR+JaCfGY4HQzTZ5LMsWbjk3um8nSlJ3Hlj3Jd4NM7dGXhRQOT5eGK/yTAwX7xDZEynTEmq8Qq5MMxkAZMJJZWaC83OVZZiaNaQvfTYOyaZQyKpTxzczvK4SNOADVobFLf1qpJALNvpWYq6FBeg01E17RAgkrOWrlY6P2YNMbISEPQAQUa1WA4CLLrpo8803v+iii9QFG3yEvjB3TSZODv5VFWTG3XOWfdtxURsrnuA+UXiSJMYYIAaAddaZef755//mt79929veFiqLMwYzSCk+1pXVedR9qAn5pOOLUPBorXXOzZ07d+eddx4eHpbO5pgQkZitzbZYiMj3cwaAJEkWLFhw3nnn9fX3hxccF4SGXU39eBWmhLAwyy1V6S3ZHN3zjBMMHKCVk5tMPCIAoDrtLs1kRsN3dGH99zp3E85Cmw+BsZ9XR4wXqmuQEmIf6BKUGmJyt8uoXg09vuJuG58VLfxYoRcpyOUjnOCFzFio2VJyA4paS2VUwvPZx8Er3SgkNIkInXOVkwrcfFVfKfcoxyxrG7onuGmrZShG5Mw1fVVlQXEPMyRAu3n/qkuh/VASzqQpMXOSJPfee+/hhx9+xx131Go19Pm7GRgADJqc/mfIgk5WokDqkMv7PBbuKwlwhAMSptJaJCIE2G+//b564kmrr7mGMWCMSVMSXlKv1jh+a+wDy0Hc9leUFp/SyV9++eUPfWirZ575GyISo6MaI3ItDQNxaIRWOThz7Rl33nnn2jPXxSzRfNu7X0uuFjriwgC+XQIikt08gEavvEbqewyOl8/34R3CWWP7xz5RCs32IEd1x8k5HouN27Vol4KglfE7UrVm4U0ntkv3UTqH1rurTqPHPNJ6exBui07OQRqhCO2V8NFJkngXvOWkJ439Z1xQesV0rAm6bcVRjZYzWkfd4oq79SzeraDTOsrW3bSXf77vUdzylUd638msoGzk8F5FN6hfR4pyWxfz0BAAAKG4eEOwiCtFmXRMkr41lMKU+ErPK2bkJiIb1WQWC5HXXSjV0Qu1wk5OTsK+Wi3hn+EeZnzrjxLos38gZoEMBgcHTznllDlz5tx0000iJZP83Sz+20WxcaldVHETCo9DvWRpr0Aa2qIRp9rh4fS9//zP119//Q9+8IMZa68lGboRbV9fX2mRE9t9xTBSezLh9wylH4oiWJb3a6+9tkiGnXNG7DZRaHOgsuH03HPPf+tb37KBlL69aiZugLrPApClGm9jAUaPsEgtlq17OFYpvEKPV6cI4LVsLYqqJvbgao5SpY1vYboAo5pqhz4NbUe1b7deqi4ZwiuAcPbSW0/R5B0RsWJQy89F/6GIrkV1eTKOhelphGZkMpuUTs9IQ8FESTwRMWEQ6kg0xiNAIQAlc+GNoz80xiAURJSyytBZSvEnBADOOcxy5dSPtFgn/H8rOxJ6vK3JvjvNOlNAFYcB4Nt4fSg+RTt3SDqN7thHJQCQJDNEIDlnmHl4eDhJkltuueXoo4+88867+/v75XjqUgDAYqaP6iqdi49loBy0VWIrZG0hSXJc1rGNMUzpyiuvPHfu3BNOOGG11VZ1BNJSJWHz+NbeuBegJ9Bo56BE6o1DyRqAvSZX/nTOJcYecsgh8y68wBjDCM45CTtAsrvls61JOAJjjEFOkuQPN9/67ne/G4yk1jEGDYxtNvYe37OhBuWPS8GI8UJ7FQStR5akzkyfIiIixhTyupeo7uNdlokAVQl1vbp5PBVe410nzeODhxizSJTLOd/3peYUZCfatJX41OOF7lFQdmf9tI5CTQYcZR6D0sMQsIhd1O2MmYU/Ud0l5r6kKSISICICOblmqJgkImR24EmfeiXLJZ3Vgi+XoASfSXlFqqVOYSASlOOF8X5tCPLaIwJEIHLGmEWLnv3mN0+5+OKLh4aGBgYG0jTNIk5mTGOdnZycZMf8CMuYyzNPqRu+6IVZE48IuSPKyvf9yz9/73vf22qrrZxzomcLR1MrhH5PYywfsO3XLxUeRsKRdUNr6maUqCYBAIhff/3192/+gaeeekpE9UCsMYkzmhXYWCtZ6ROLtVr6iV0/+bOf/QytdH/DkIVYHd+n6x20KyFJRM9Ahl4n5Eh65dHNncaLoBz9vZYPtXstCkO6wVZHRPQiIkHZXujye7JZpBbfmOO9V917BOVIzhwDgrJLJr3jSFCWbj1xCErdVgGfPloS/3qll0FAL20RMVmWdpV9du+i55YzxrCE3SOnTAsEzh/oaMhgElZZvclc3gCtTPVU4tshXXFnppud7kDdFqNhZBj3KX4gy02lKw8PDwOYa6+99sgjj3jiiSdknEhCm/CHJclkuG+JiASMiEJiZiEpszAdCABAedTIsD8jMhFNGRg4+uijjz322P6BAb8/AD4TDlV3tMayDkv3qt563Bt0pBirAjfaDWt+ZHygCkp9SThXA4Bf/eo3n/rUp6QHUuocOQQmKMz8ZNWRxaNE/s1vfjN7+4/IRay17RO/d0tddR7jO1mMGOta7YRFap+ypl21MaJ5S7etUjIUJ9a99NaLiBgvhLOL8S7LxEE3KSg7+8YMHY8a7yeVy8ABwTF+uShKsQI7rV6qW4YQ9W833v0nRLfNaceSEKxL1E4oVxJmV7JXsroUgWNGVnovPUQEBgBwVLPWOjlSRyOZ0ZfgfcDZQ/mZLGu4LGubeDhq+J4S61E9E4LgaJ2YvtctYS9gInTTjiLsTiHRDuWgAYlQ8kuXLt1vv/123XXXJ554wjknwsmw74WcfUgvavSEagfGAHp39eb2HyBNaYsttliwYMEJJ5wwMGWKnp8kCXqX2+pIGct+W7pX9dajLEy16hodbNctxqD2mpe/kbkbR6gd1+5trWXmXXbZZZdddhGjjYgY9OtQn8U+KFWa0je/+U3RYIZjRDHuT9r16K40xBFjgM5ZpN6c4UDXTnK0Pnu2YiMixgdxyLQLvbx6XRGEVlfmma08ey/UT7e85nqhriYnJtpyQCjIkBUJV50ZqxgG06vkGNS1akBxchiGUmPf55JMZgNsMMvoSo26OzMakxgDpXpvTsGUAu23ZYnrr08a9qt9MMF/HcIor0wTr9+HCDtu3RO01zrnFixYsMMOO1x++eXSxyRRtnY5AmYEBs49uAHYh+orq4j1PcqZPzgzsyP1ciUgMIgsmwPc399/+GFfvO7aa7fYcktAJMqCVIqCsu6m1sR7kdRtrE48Zl0eub3Xb/xlYcR1c7PqmwPRGpMQ0UknnbTyyishMlpgJAKNVIBgRDhsATLH8KSvb8Hvb/yfq34uEVaJiIE4sLGjeNKOWtQxQCtWlyofOn3HiBBjXWP6Jmr7ldthUsa+/5QEJssd7+PQwzv9HomImGDonunNxEC4vA+PjB+6YW7WDWVoBOPlk9B5ckBAxclki2/J6q+a/3byzDA73WSN2kt7TvP/egbMDCD5tY0kJda4YQCEyPo4mZVDBMwSrhpgZJLfgojMAIEypaQBpDRTxhhAiTxWVlAqCVq3cKq9bFT0EimjurMC+xP4n7ejssbduEd0EHUbV3ra0FDt61//+i677HL33XcDkHD05APtgZcxipBSL8UA+mepr5ZEmuG2gFeToQR8JaINN9xw/vz53/vemVOnTBPnF8zFwsaY5dOsY4PS3Tuh/uv0MKwyyJ27S/VzlyPc+KkW2zk3a9asvfbaK01TiSElvby6eSVSSqnkb33rW4ODg0K1MzDD2HXgyB1E9ATGfnkZh0ZbUGUHIiIilosemhT1BHRaO94FaYJ2sifsM/Y2+goyuVXEiMEe412QiLpYLj3aMxxlaLUyYtEYgGIubwDwI13Mm7V9UCQKVCyp3n4aoEwWpOH5kiQnpxfrrnUVXPA/b/XM9kHyVY3eVadRfIcxSMJT9/rdFruhPjrTpmWE0R7ZZ3oSZaL06QcffPCwww675ZZbnHPKrYQu1SzurAx1OXdlyRmz+JIYhKZSD3FmBiPxFMQxgY0xaa22zz77fPs735k2bRV/mvO8pNFIPZOEPR+z/lAii0eD6kVKNg0mQsNJcGJwzi1atOi9733v4OAQAKTpMImMElF6vthSYyDPsObSCy6Y9/m992WfEqoUtLhzjd77lb/c6Hut2/neeCN0E3o3AHkn0N7aiL1xAqJ1S977ljkiojcwNpPqMUDrXIHOVzstRGgZjSLOQ+V4p8vQ/I4ZH9KuxVHPotO8ykjn7SO9Ts/NrDS7BgUpuS1KPo88SY7k4M53SSI5AAAgAElEQVTzfPiUxYWk3Eo/hjm+9QO0WDulOUpdwr6qLKiephTpCmMSj8NJgWrMAmEhiShJkrPOOmvbbbe98cYbAwaTmSn8oRwnD72aDI9QPFztpSKEDISTBpER2aVurRkz/uu/Lj/rrLNWXnlVuT4AWGuDwJR5Cqku7KVt32QbA6Go6PvauOFcvUhVPtnIuOneTihdrLuBOV5bmuFOtVj8N7/5zbvvvnutVsvLE1SmMr86TIzBb3/724NvLNVq0feEXrlzhe/xfeCem2dEtAc93m8nF2JjgTe2Lc7Ge98yR0T0Brpw4SDQJVVdTyy1J+GaS+1GKw/VZYumnpnLhauwaKW7D6GCsptDGbSOXOQYcCm2nllwiIzGKPHCQZDKkt6FmSVlq9iBnJ00xjA7T8ZnK9VGHV1LhkVn7UZmqHpkdGlzsgaua8tGODjrxkvqdAdqdP3e6Ljten8wNHQc1QiS4RgYHk7TlP7+3PMH7n/A8ccf//rrr8vJjsllHRbBIDFlESeJDWBIGkrhkY3EefU38zQTZgm7w/sCALIBYoNoELfffvbVV1/9qd33MNYGbE528So134XoXMHae+VSK5RowZAcbHqZsouKP59Ktq4KBIldWs3PI7E2CpLbuiXR42M8YwjeFplxJ6KDDz54pZWmILJJLBgEYmStVae1lL0/TPJ///eXyy67DBnEN7xuJ6+gDQ5BSvR3AxpRz8tDc0veup3vjTdCN2E58aPrtmN1X2HF7t19Nr+90bTb1htbtN4dNZvd11hjCq3b1nNWdJVljmiESE+sGFboRT8x0eQtiUHe0dCMsxdkoE+DY4I4WqF5aWz8DUD7s+mOAnU1bqWDnQ4g2MobvPztitVh7/f8TvMqI523V9vOAJgsGCMYZvTRGDs1z+9Am2ZBM4lINFuIopq0YgCyHDacZ8nJbAV4ba9BA1gN5cA+GiQVEoRkt3OulpsGf5uCb6yaJ90b0SuG37byiHHeGdEc2v005qlzrr+//7rrrvvgBz/4w3k/lDzdSZKoP3Ue5xSzTMVQ4YZKRJLojcP3KOchFQAArLXZ+xhgYGDg1FNPvfbaazfbbLM0TRHRWtvX1yd8f3j9rkLvvnV0WhNOccIPetpIL1v6s7royvZzWthuCfd/mizzxqtj6HyRmTfbbLMddthheHhYem+446p2PjT1NknOOuuspUuXJkkirw2VZI5ue6mXgAE6fa+RDtXeHdpjj+YUZPiyqG67NrpgrP8VAwduaI2G1YjmkxF10YhlCMVNI63hSOJ0P0pk0Oid1SYbmmxaTxI00f2ULLPW1Qrb6rp8ZeyxKwZdxjYZ+KV6Vnse37ZjBq3wTte5zmzbZNAy3o+ZfcKPnEz0TKDT+6L379Zz0BgEDJnD8OTShzB1jfFRxrDUrUuMAFGq2T+KQTFHsJNQKndHsTxLFzeExx9Viwm56XRE5Jx78smnjzrqqM9+9rOLnv2bqhfD7PCSrTu8TkguEBMYZCZmQmQJGWnREDD5WyGD5I3KpZGAyODS9P3vf/+11157+OGHE7NNEtkxkFz23gRgt/WlnnvrtDIpGdHEpenJzTRWutUTJIchyDNZh78lAGKsaoEze1h5CY11yjYNDlKr1Q495IvCNiIWorKWDD4zp2kKAI888sjPfvYzCa0gb6CQwayHqPgbO/TQ0B53hIxYSJBBvc7cCjs5Npz1hEST1W/dPyNWDCGJoFWKXt8UkvIjumbs+b2CMVsGTxiM5X5kDyF836ndgEp1tWhMsCh7wmLmgIjRo0T01P1WP8fePsYY+wrHeiqcFUKmccYsb4FBk88rwkEtI9oxETAYSz4fN1MK7PzJGWfCzF5SKlaFheUkolBkmifJUeuj4SqDdCVZMhDwaUykfESiyrF1HspD/ck72jyl5UdTBHEJueMFiyhBurbUuLSaZBmGICNKmg4nSXLRRZd8+cvHLV78Cge5hjWKKmP+nlPFZWZ3/etSWEgDMn4QEYEYrXFM2WffM8OoB+yofyDZfffdv/vd766+2prOOTBC04gqzfmBChA7z5ig7uhuOuQLAYnVvo28sRoGYGZmQAsA2Nr5DY63H+HDElGtVrNotv/Ih//whz9IAITS+TrLzDXFDJttttltt9/S19/vw4BM5iDcnUWpvZY7pQjbIrbLiqGuQWhSmfpVrPA2orqXFiaaixXeDYj1HzGxUe3hsc9X0aiWWp+3NLpO7yCcw/dq4rjW5zwRvYvOqJQCRaTnJY1J/MGAFUGJIib5m0D5Q2XbhMnJLuo5H+ESC3IzWZbqH0rx6ko1+NeW1UPsNCKb/7M+6rL1bd8tlypzrmExIroFxT5IRAYQ2OfvdlAbGn7llVe+9KUvHXzwwUuWvAoGVe0IQiAiOC4kpCeXC4yZmYBVZemJdd+lDTKzRROSmCrDNAYQaK01V//hD3948cUXrzp9OgGjNdm+AXLIbnf/HlQXalKaFKkk7pOxHIYllc8aaEKPVCHxPjhIGiNoJN/moqhQ//U7OVUYRItldhK6Ic5syF6BN4wHHXQQ1Ouxui8FAMx+yFhz3333XX311VIFzuVBisfmESYVwvdsK7N8tXIQd0daQ9hvw3oLOz80rUz9qvSTiBVDuJsIwd57KdMdVKxZxBgjWpgeRTibimiCag+Pfb40H4bKNhKMfN5SvU6voTcSnjQf9dX5f4eLEzEO6BA1wcwipVQLwOz8fxlDIsm6kQHIIZOnMpEZkUFYl5CdNAY8l2hzlsY/QpIkBhp00xLRXj3e4vtvuRcfJZRNQK9obf3d3P0c08RDuMAGebcZJM4zxP3xj3/80Ie2+f73f6DtKL1cGjcYG6xeSyiUOkM1PU54X10XOVeImICIibHWoktp9uzZN/7h5j322IMBrLVylyRJoLK4hS5eNemTVqca44vmLIB8Kxss1loiStM0TVNtNeUlJaJiibgM/5UQAfpzzWSt16zVanKO1kxJ6113Z6Vd6HRzhCt859xOO+30nve8pyqf1E4iwyWvCuDzzz9fLKqMAg1rENEJhMz4cs/kYA+z80XrbZQMYOukZHiFkf4kojlKdjX8M3zpQ4MVcsSYQff8xrsgESNDXNpEjB51u1AxyFshPNdYli2iLhrxNiFiS0WMFBo0jKhgAerO1sBn8gh5OVmV64xCc+9ZW6AmBXrxhvsAegZXVMHOOZ/BRxgBRLSN4qx1OuhkaaYLrb6bu3cPZJJAiSTPHMHSpcuO+8qxu3x8zmOPPWZtkp2QOnZ5z0bMmHhkkJTEEjISfM/3CjsUQaTFbBwwGC7GKMgGjyiSKe1Lki9+8eArr7xy0003NdYyo3NsURzECZGr+bm6ZApYet9wJXYMjKn2p1G8xfx4aNqUNxS6UMOMCoEo7LBzTuIAGGOQwaCxaBDQABo0TKlBZkd5Z2CHQMiQ2ASBEEi4bKIU/HFrACG7V5oOE6UA4JxzrlbSg5dmYMutxjA7dqkGmN3YrPc82UrWIlqYOnXgwAP3B59SrWTPEZEJkFE2x5xzSZLcfvvtd955JxcCLU/qEPIlcBGjvFq1XZqfHI7xiEbQWtI5TOvcbkiNtchj1v0cUULzyqlb27E+VwDtskvRzowUsbtG9ChCuqHRCcV8u3XU7hFdgkYtElsqYqQwJhGNpDE68K3GppRzJKm3fPaaSgSfKUQOeC4lP4cIvK4ohULnJADKpGHVLltSioUniLgp9ARv+mBGGdO6N2oLqkvuJiczs4+FGMfq+KDUr4wx999/7zHHHLNw4QLpKmHWJl1kQjEsq0jtQlaaiET5KGIx5oBH8Mm79bKaNgSBVl9jje9+97t77rmnc46zq4moLC+z/rbb+kypPHUXeHUHcjcgjP6ZpqlUsnxm5sHBQUR86aWXXnvttZdffrlWq7368isvvfTSyy+/PDQ0JMmpX3/jNSJiykSXiMjg+vr6DCYDAwPGwuqrr77GmmutvfbaK600ZbXVVltjtTXXXnvtvn670kor2aTfGHHeh9BGhRU1UpK3UQ0z507hpVu0HX5dmVXm4ODgR3faad1113nuub+HoykvsP9LosEaY5YtG7r00kvf/4EtmFmKycyINHn2dfS11eiEtjTfipmUbhvF3YYSNVn9oKdVf9t8mLcybLvQzI47tE5KNSMzySZLKd2YHItS9j7q1nM4lWrxOq3HlYsI0aivVh1jI7oBkWULUdrGg3qLCz1H7UNoKKqv1+rSo/SZffCuDj7YhEOj7qpB/arnN6r/Sd7nxwYTwLwIbxb0LvH1zufVUDSk2hURkEHzfct7MI/q4xwLRwiAwthAVlFMRMuZi/tTM1Ua+gQmsonik46LcenVwLERnUZIkCn9JCykqHF/+tOfHnfcl5977jlhiEqTubyLioQteE0S5HQSOxKHccQsAY4sbTSxslxZSShrRA7MW2/9wfPOO2/WrFnMDIjSh7PXJaEoLMeR4BvfV0iVsAtXO1XrkTdHcZYTHhQ5pNgv+Swu20uWLFmyZMnTTz/91FNPPfbYY3/961+feuqpV1555aWXXlq6dOng4CB4VrpFkULpvojY39/f1zew2mqrrr769A022OBtG286a9asddddd9NNN50xY8aaM2aktZq1ljg1xhCztX2lGig9vpCboe69HvlIGhMTGjPIbVkThrd2roaIwDw4OGiT5LjjjjvzzLO5qAMNZzNZYzEYY9DCjBkz7r7zTzNnzmTMwh3Iu4B9LJJRFjVikmD0Fqy9tKBqQOpO5SO6B3H51AlMgMVSREREh9BgEttOkkvnn0p0RqMUEdEFaM7j5d/6ASvLybIfMwMwsAEUDgYBmcgAEuTuiRwkqQ5zHasUjJkbLvWLRicrli7IOfMHTI1Rj9dIUDZDo52lSQj2GB4eXrZs2ZePPvbiSy9xrqaklfBWwmACACJKFm8DyCAcYvZiIwjiQjIAADEZa9k5AJReqq6pxe1rYuIpUwbmzt3na1/7+uqrrQkAfvCYnHAvEpTdgB7qPOFERwyQNKt89eqrr7722mvPP//8M888c9999/3lL3955JFHXnjhhSVLlixbtiy8jm7RhHs1AukkYW2EWzchGaf0ojiRZyf7X608beWZM2fOmjVr1qxZ22yzzWbvfud6660HWYexSmrX4xBbsXtKUCLAcpqvLWtydfGWSw0PDTmihx55+ENbbT00NBTeRSszz1DBwMy2z9Rq7txzzjpg/4PQhk8X7XyGUmaPiEboNM3UyCTqfUsmQhBakp4wp2OGLqQFu7BInUBpb68Tjxy+PSdDlXYbdE4bK3+8MEmMyQqgSc2EM8YSNTkasjKcUU+8dqk+UTgVmWAPGzEh0HB9F7J/kHu3yIrelOxDxswIJwNsIKNoCJw6yCJaCGxIScwkn+t40NTbOXF6b67jCGmCX8XlawRAvdeYD7PqAIyrpUTw1F+fPPjgg2+44QZrLZEYbAqp9JCZ0h4MwdoyY7sQEJEdQXHZKReQoAmSMUqGhEEmorXXXvu8886ZM2fX1DljEgh2A8aXdOie97SapHqbENW9lLJPmRivNE2ttdIWixYteuqpp55++uk//vGPCxYsePHFF5cuXbps2TJJWyQIXemDblP2wg5vVLFXhFgwo/qVkN1iH6sTIylGYuzqa0x/17vetcMOH951109uuMFbpk6dmrphay1k64qyflAtJPhe16Ayx0iH64dMRrgT0eDgGwDwyU/udv3116NXE9ebaAKA5qSibbfZ5oYbbnBEiChjRNq00TNOKrRlq2CUSoSeQOeoltBQ1L2RnhCGHobOx1iIGCUmw7iIiIhoBaUEhhFjhkYTb6jMf6KVriLWScTEQpXfo1wH4FlIZQLDdaJngVK5Qkkf4NMzFLj7shypCqUdS9RkocgUqkgiQRlRQLgg9Ix7ggznnXfe175+0gsvvGCtFUdv8PRHSQEH9cgdvaDoKI0xPu5kGArBIGp39bEOEWs197GP/ce55549c+ZMNAkiItqQXm8L9dAWNGe1xuT9VxrR1OBzVhhx2RalZJqmfX321Vdfve+++2655bZHHnlk4cKFzz//vDr4J0kSpmWX6ygpCZXH56IWMiSvtcOwjzArERhD+xhqcuWg5hdTjiOLP4DsHAPAKqtM2/itb9txxx0/8cmPb77FFj4pmFU1qFKBQTFsk9pswKiWvchXuFnD68vLwJiEmWu1IWvtT396xZ577ln1Rvf/km8BRERrrTVwyy03v/d972dmInH0zkjPbhgdEwCTgYgZZX+uWz/hYIF6hGOVvhxlSSY2wprpnviDulsJ3fE67jSqNrkT12/vNSNax2Sw9p1AODls1wVj5YdoZGOrtqjuLmD4bfhV80qeAK3Qes1ERPQ+yvyerHyzeRoYR86ij46HKFyKEjVKUIoILJyi+xV0eShhmg5rnu/qYCvO/rnBEnoc5rJx5HctwleaLnWEAyKidLi2bNmyk07++jnnnDM8PGwM+E6MAUUIUMyHAwEtVTgBAQBEPyw9XjPncODeay16BoZXXnnaQQcddOKJJ05ZaYCZgY34dFfXt+P7shnfHl7keUs6RBSlKyJmGVaytgZjQPSStZp74YUXbr755ttuu2XhwoWPPPJIrVYTAyRZuUWgp6mQhDoMlbPgKcVSkZSLrFtmJaMBQO1Sae5FmR4wDwqp16zm/kLEWq0GAAMDfdtsvfWcOXM+/vGPrzVjZpIkjkUZyhX7WWeTZgVas10dQKMlLFu2bMmSJVtvvfXTTz/NqqA0yMyy6xXqFBjBonFpeswxR532rW/LsDJoGLIXSTS/bUFcsjbHaOqntJ/R5OKx2ru8H04ejnIMoAuG8S7IJEUXjq+ICBjJqqfJcf08GTp5l783IyJGiPoSw1CI4/+0zCyClSDSY9ECMACiZHQQT76Q4RGZi7pIMjMA+bQ5RijOguQy3DkP966ZWagH+TZkc5hZSjY2IzM0AaLVGoObRqwwlKwU5Zq19k933X3ggQfe9ae72SvdOJMEhxFOm70UC68EBGCWHMSlnyinZkyWsJucW3PNNefNm7fLLrs459ACIpIz0ouWS1CODRrsAYwbfJ1DiYjU4wDsnEuSpFZzr7/+2gMPPLBgwYLrr1/w0EMPvfLKKwBgLWb0Vsb9ZSlxNHmR3Ch86pLxabSa4sq+uj/CiLm8vC43AcXQlsGTsmp4s5RNwMYYdikzM8FaM9b66Ec/One/fbbYcktlVJmxr6/Pl0GMeKvLv0Zr77Z0gJCmHx4ettYeccQR55xzjmpXwSAAiPoY/KgRVTIiArmNN9747rvvmTZtGgQxRCJB2S7ECW5zhDa/0fKpOoIaUZM6EwrdvfWrDj9KDyA0ht3AYWnk4iBJVwRA05da61eI9RkREVFCaU4iH+q+fyNGiuqaJSKim7CcJDnB1FqUZykAiAeqsARKOBpjgIGYhHaUNaNwlH7enivJwOsoAYCz4GzMzAXJpZxXXRIEDoxMJAv7nBlU3RAH2V07YctKnkfRXFbRaCE39tBuKv8654jokksu+drXTnzxxRdVcVZdPYaMVcb9VAIRhCtPLOoovQpMru+MMQYQDRPR7Nnbnn32uW9729sQkQEYnDWWIYEgWUo3VF33IK9hDyXviMhaJAJmfuCBBxYuXHD11b984IEHlixZ4lxN9kBCIsDHhQSpbCUH9V6lNg37j56gZSgREHqmJocBgJL7OQScdUk2pSxeSFlaa9NUlsc1a63oPTWsb5KYLTbf/LDDvrjzx+YkSVKr1fr7+7mopgyLXb17qZ470euyFwYwAjIwEbFLb7/99o9+dOfh4WEiIiIZOz5uSF4YRjLGIBsi+tWvrtlxxx2d4yRJ/NulDqcfETEuaL0fxh7bW1BqEuKKLiIiImKsUPdd2cp+anzJRkT0LAoKx9J3ygcCZPk8mFJEZBE4SjaQYLntw6A5RjBgocgL+WvmPnnFCGwkq3FXWnDWs0GyKA0TitdJExE+UtstVNzJaY6w7TRX8vjWUkgnpWl6yCGHzJs3L0kyh+4SO6lKrpLspdrcdVitrD/n1BVAphC21gIxcbrXnp8985yzp01bhRwIu579VnpsV/aoLunnkjrGWisSPPn88ssv/u1vf/vv//7Zb3/720ceeahWq0nQxr4+sSSoOY458ybOiWYOQuGGrRkSoHWnQXmmaUTwy1dVduv50vRyl7rkYCgUqt4xGEEiGJfMm7I7kki2Jedqkk/+rRtvfMghhxxwwAH9/f3CYMo+yoimbh01bvLaAABiSoeHarXa7Nkfvvvuu5MkYWYCZmYdd1otjISI/cnA0NDQ5/b8zI9+9CNHIEQtQK5OjYiIiIiIiIjoELpkJjzh0ZyUjK0wUsQai+g1NCMoIevS2So+EwMxK0EJUOBhvKjIoTHkWKVjfhUpq+8UEcWdr6hSCgSWXpxYyMyrWiT5VhmHQuHycmcMqDCmoYotKNaKoxNWsnv0ht2PJq+ukshRSR9xznLOLVq06Ljjjvv5z38OAIxAROJSWtWUlS4otFFIq1e0csaz56A6SM7iTloEMsb0GXvyyScfcdSR2U9yKmrc/NfGvMsV1M3QtOeXVJPIgMbU0po6wj9w/59vuOGGn82/4vHHH1+8eLG0ckBsATObYltA8Mj5fUmUeoVvwfefkqox6A8MAM6FdGdDx0+1USV3b1QJukd4NT0CQc90LrXWMFtvoDNOU0rywa22PProo3fc4d9tXwIAxloI7FW1PYICk9K1xeNt7iTS+Wu1IWPMN75x6imnnCKDKNzMyN4FwELrq/p1rRlr3HfffWusuZZcSXOyq22PJjQiIiIiIiIiIiIiIqIH0YigDLnBPFFqIbkNIgOzCxI5MACCrjHBO0fq+hG8n2vo7q2LdCLKvWi1EEV1TFjcMN1tSD6WH4YoDXzO0zCCJrS28C6SUJ1SAsYolu1FmBJHqaUbbrjhgAMOePzxx/v6+ogIDDrnkOsQN5XYphlCKs337zAOAoEw9z4rvbRpYnFoqLbhhm+66KJLtt9+e0SUVPQ+mtWkavfmcSUA6kUfk3pOh2sDU6YM14aff/75K6+88tprr/3jbbcveW0JIAJAkiTyc+cc+9iFQlDmFGfRk1pJZ5TtFuAgF7ZGvM16kdwCEUXFWSIcQ1pcbUVImMo3Yn9KBHoj5WZ4AhFp7DNm5xle4yXu8jgWAFxaMwZ3+djHv/GNb/zTO2aJRVYatKnFo0YEX3tZP29RU2a+9977t99++8HBQalhfXAoVr48gjGmNjz84x9f+pk99kRrSq+TyEtGRERERERERERERET0LOoSlOTXeiY4RxbRmbciZnHz2EBG0Vhr2RGaTK2kOjNlEf0aXIgZLK3K6xCU9QjHjA4ADVqZnYlKFtQjPvLjPoLbctRqpbWuEpQdDdMeF9ijh9Zhqf8R0dKlSy+88MLTTz/9hRdeCJLKZ8lw6lKQGf1NDACOSRVzWX8zCMREZACzJB55GSS+IViLiGiNoVr6r/+6xSU//tFb37oJcRamwJhEsr2MV7uXFKPdA6Xh0Muta7XawMDAE088sXDhwiuvvPLee+997vnnACCxSUgLAoBkgrZY4PjARwVlDNR5ARemUGsVjkdlSMPYuMaYkM2UjOHa8bBeyq/Qfds55/O5Iwtf7SBJDPsIvOxzW1fTeZeo8/CynhMnJpo2bdrcuXNPPPHEVVZdzTknCZr8FTIrCgA+km+j8JTLJ5RXAHKLWq02NDT0kY985N577yciMKyKZvDjN6tV36wuTefM+dhVV10NzI4lwVE18X1Y5o6UPyIiIiIiIiIiIiIiIqKtoODfwgqOwSGEuWdQV3/KAyAg+zwQgeAJVTbkA6apCAaIoOSfnV0NwDlXSj9Cqp+qt9QkyFWHzcnHUIm5IovVRm6bzb8a5S0iVgCh6k3pJ+fcM888c/TRR1911VUlqZqXLpL+VqDCupBHR0RJrpJFKLBGeqgwPWEp5HRjDCJbY9LhdN999j7zzO/3T53CYBAtUWqt9QnsYyTTHGE9SLDIZcuG//GPf/ziF7/49a9/feutt77yyiuqjgQAUUeCNwXCZAmtrJ0hJJpFIwkVdjJkpZUUY++ez4HYO+wSgaXLPNYxkFqrdrv0XN6mZYluNPKFkua656PiR/SRKEtEpzKJYZDNnFlnRym8413vOPPMM7ebPbtWq8mzWGvFELfWJu0n+LTY0mpf/epXTz75lCRJCBwRCbkMmQgZGLO4riJ0NQamr7rqvffcv95664HhQB0PwQNFgjIiIiIiIiIiIiKiPurqscaxPBERHo0IylCqKKvIvlBek0nJADDIA+HXzsE5XgLlj7B6N+qaWiB3wTC5Tbi897cz/io6ikJn7VbiSzZLqtCEdmwdK/zbaBdGCdW4hZK6xNhbbrnlgIMOfPDBBxFLDHgY5E+PZP/XtpCYBoXYfFmWYZKeXBwYEugAEI0BtAkapuOPP+H444/HxDKAMYn24UlFmpTMR3hE6pwhd6yu1VySmBf//sIdd9xx0SUX33333c899zciBnFVdrlSUmJHhi0bJikKj4eMZFUjKQeJCY1Rl3/ETBurR4Q0REShthE5SRK5l1CfyFCr1WoulciJjhwr0ZbJavO+JvmsJRCptRaQEFHSv1Dq5JpqJZldSGprrRZpdGOMYZcCAFpARAOWOO3v7z/uuOOOOuooBItWfOG1cspdn4sBMTsEKbbkFLrtttv+/d8/OjQ0hBbSNLVonHNS8waQmcPPkonovHPP3v+AAzxpC+r83uliR0RERERERERERPQ6IkEZ0a2gyhEJo1fO5cA5DVDyq869aaGSNUSFPuE5LM6MALKa9h7lFgCyLN4+vFpZBdMoGU4wokhJn7rDrBqDMrhU7h3clvX5SMe5BrYbA3ZgwkArWWgjIkqSRHpbrVZDxHnn//CUU055/oW/l0wwlHIoG89kUbnVGNkYDAlK74Kax5r05JcK69AaA+e453gAACAASURBVI5WWmmlefPO3+3TnyFykI0Qm/dhNgA5QTReL4ZxvC+IyXCExhBL4pRaf3//k08+eemll1584UXPPv+c1wYCAIgvMjvSJkNPKKvbvjSUxJ6API9WIYxsLqsspUKS6LqcFc9am7n2c0E4WepLQiY6pv7+/v6kb2BgoH/KwKqrrrrqyqustNJKti9ZaaWVpvQPWGsZM0/zNE3feOONNE0HBwdfe+21119/fenSpUtee9U5NzScWmsTY5M+U0szLSciOlcTxaUKOT1VWjCvWn4CZ621mBARINVqbrdP7Hr22eeute7aw8PDxpgk6ZfziXQHaEz9/aXOnXNvvPHGlltu9Ze//IWRACAkKDMlrEH2sUQBgIi2n73tb3/7W8zkpVa2yuK8KiIiIiIiIiIiIiIiomdRl6AEAGJwwp8UfazB5+DNucFSNhHN5QDB2h98ugtPC2SkZChjkpV22kDbWKYmg5QyLdF5/jYN3f1CYaeSF00Q0h+Vu5Q/R3QOuXQuUEcS0dDgshNOOOGc884V5heCaALQIENxSFzqaeLW7c/EUFWnP9GOniSGCBKLrubevdk7Lrrokn/+l/cxMwaDBJev8508IGDDwM4xACVJ8r9XXX3FFT+99vrrFi9eLPI6ZmZk5FwLqY1Vza8d6jRLLGRIREJht4SV3AxTsvgSGkRkJGnZtFZDgCSxwDx16tQN3/zmjTbaaP31199oo43WXXfdDTfccI011pg+ffrUqVOnTp06MDAgd9FM0wAEzJCxbICI5GrDw8PDtdrSpUtfevHFRYsWPfHEE3/5y18efuSRJ5587K9PLyKiJOlnZu/Dnhpj0pT6+/uJKE1T9gEN5EZE5DWVDhGRs/IblD75rnkXXfj+979/cNmygYEBADAm0XEhEvdGVqsTQXi1tHPnzr3ssstMYiXBkVDP1R0wIaAtmpWnTf3Tn/70lo02kkeAaG8jIiIiIiIiIiIiIiImDqqCxSwxrHcE9HHDRFQECF79FXoZ+vU+IGZLS2Y2RumjOgm0c3mTKCgL0rYMeZ7uEgfRJItrVbrsXM0Y41Vs9c/Uh1mB5e6KreEbPHLEchAyklhMqL1o0aIvzN3v2uuvw9D5t0IfMzB411EISBAIwlACZElvECGLUOCjHGIQp8AYYwxYY9I0TdB86ENb/fjHP15nvfWJiAGstcUm7gqCcuz7W6kJXC0V7SGi/clPLrv22mvn/+zKmhtWDpGZGRgQhKAMf6snlA5CRQYY0pclAxIqEEOtZcBjCmXmpqw0sNZaMzfZZJM3b7D+Vltt9Y5Zs9Zbb72Z66wzZcoU8N1PiUJFcFMxlwReZ5tRlmLxJBSp/MQYYHZEr7/x2uOPP/7H2++8997777rrrkceeYSIiFLnHKJNkkRYS3Fz9iXP75UVgIGZ0RqhKmu1dLXVpp99zjl77LHHsmXLJM+PxMGUjNhNemYneova8P/+7//ea6+9GLMjmlddqzH/CYIxhmrpvHnnz91vPyJixujiHRERERERERERERERMYFQzSsAUAnYKFkoQGhHNJIkJ9QqeedusFbZm4ymxCyTgWGfn9avpr2Ch7nGwD47D3nmURVPIrzMBZz+KprNh0Iqs8iGCmNadvGuQ1rFhW7Xo5yg2bu7Cml4x113fuELX/jzn/+c9UjgjKapxKAMZXcQEl6B+7BXUBZ0wjnxRCTsWZJYg2gB07R20EEHnn766db2pUzGWkQriZUBoE7ijlJgwt5HtaqL9eZkwKZpmtgkrdUuuOCC+fPn33jzTeFvxRs6EPdhdXhi0WsbAiZLNzDysSxmy1HIfmJRD+sjMzpEJOeMgdVXW3Ojjd+6+ebv33nnnd/5zndusMEGup0SSDiNEp1qB+tS3o0+ZzydPK9hlUPKcWv7Xn/99ccee/Suu+5asGDBrbfe+vzzzyPaWq2GaCVehgjXoZK/XpzTZU/J86dkjDn5618/5phjhoeH+/v7OYi10UhBWaretiBva+ZHH310m222eWXxq0GKoaz82ohyRAhKTt3HP77Lz6+8KtNUWru8GMQxVU5EREREREREREREREQ3o6Uwj+AX0QCAyI4lFhgyZH543jPbhEKiEkfh5Y/CCGUxKDnIt8zskLkGkKX6dlSzpq/Ij0pAMmfQhMe9YoiCBWr+YMWldR7wsqR2DE9rLoSMDOY4IsxfzIFzK/gkv/Pnzz/8S0f8/e9/z05DYCLgcnqW0gcoMUc+jiFIkhzOsztpJmX2MSslvYmouqZOnfqVrxx35JFH2qSfERxRrtglBsOTgaCsIuQWNRv1ww//3w3XXfurX/3q+huuBwA0QQ0DC/Mb/lw/y4fAJJWlkVB0AJdrOiYA0GiS+aaKQQAo6WHXX3/9f37PZh/72Md23HHH9dZbT2Idqsu5xjn1MGouWjEO1U2R7LmI0RjiFAC8jco+E5G16JxLkuSll1668847r776l1ddddXLL78scVelbEqbiqllZuSM1NNKA8NA7FI67NDDvnPG6QCgBGWQlGwsuqO0AvjIIB/+8Idvv+OPAJCmqbaFtFeoThWC0gDPXHvt++97YI011pA0Q5GgjIiIiIiIiIiIiIiI6GU0EHV5glLZPL+OFg9Fw+DFSZLANku4nYWVxCBtg3pPhqSkkpV6FyMJEOSkolSqpHbkIvmY86lFaqCakjy/pso4m2iFYGzzRUS0jpIKUrlwY8x3vvOdr33ta4ODg0r6VGV34tatyXAyEtPHvKMg1YZPNhIq7MJYpQAAFiFJEjRMtXT69OnnnXfeJ3f/lEtTkE6f0WdYv78VqMmJQaDUNyiimpSWGhoaWrRo0fe///1LL730jTfe6Ovr0yChxQ2NOsOz1HZ6GqNsUxT0rVCkm0E8qTNiEdEa45XaACChD9dbb72ddtpp54/+x9Zbbz199VXznuCNoJoqIIQszIXeEUZpMOrx5tmGiiYdsxbTNBVN7t///vf//d//Pfvssx966AEhSYXIUwpYSb2CJtG7gZNzBx10wJlnnukI+vr6dJcJsmCUZfF8G1FqXPnz0EMPPff88yRJN2iQX8jktAAQjtDEICL+7re/3W72bOcyrjla7IiIiIiIiIiIiIiIiAkEqiyT6/u2itcgkCz6U10e+nVxOQuFpqLVFDqy7tYbo0gx9Q9/3EBxQcvsENnfIMz3DWGhgyNOfyuOwJJUoXg+wPKEk3V/EjGWKLnQhpK3oaGhww477MILLwy7nXylEfqYOZPLIaKG50MkJkDUaH3ZD1mEWXlm55KXaybBY+jrt7Wh2mbveuePf/zjd2z2LoknCMzGWt+jykMoe55JQ1ASpYh2cHDw0UcfO+20U6+55prBwcFSXuxwT0OT1ZTJ5XptkTUrs9RnaWwqpYWe2ZRUMGCQnWj30k022WTHHXfceeed/+Vf3jtjxgyDCRNJRmkIKObCY5KIbNtvB4qUelaHQUWJA3gu2HSuNn/+/NNOO/2BBx5AzKMxhsS9GGiVryOitX0AUBse/spXjjv5G6dmdhkck/VVBB3tjczC3ufZxq644oq99v68c04ISiZCY8QlP2taztS1AJAYTFM67thjTj31VM4c86NZjoiIiIiIiIiIiIiImAgorohDZKtUXUhqKDDwXrBEZAwwESIDWmYWkSIUXXJldRxK0BAxjx8IoARlSDuW02Qrh6pEpF464FNDBZA+kvFMqoXGCGnKEicVMcaoOsOWYgfIn88+++x+++33u9/9Dq2BgMCqXk2iBWaCNx9fEjnv4lmvDfN0iwOpI/0MpNQnGERwtO2221544YVv3vitwpdqDxRdWxjdoEMV1SUo+V8rgVir1R544IETTzzx+uuvHx4eViOiAQcViLliTuoZvdAVAIRK1uOhWBKK4zT7yifYEedl5RidS601a601c7vtttttt91mz5696qqrGmNqtZpwfNUitantWqWh67mBZzE4woNajcx81llnnXrqN1577TVJ7APB7lBpOIgO1FoLhM65M88886CDD3DOGQOAfQ2qtJ0EetA3smRqiPj444//27/tsGjRopSYnAPPKZdqA7zq2QB/6IMfXHjjjeLMLo1LgBgoWZUGjYiIiIiIiIiIiIiIiOhuFEI11l2NltaqygkQsEEDPkGyKHuMMcQpghXyEQuptp1eU1lLRJSlNPqzJYu3LRUiu4lfqIcZdoJisf5WKSFduNYLtFkfUYnTnQgjPyopY639wx/+sPfeez/22GPGGCW2qiSL/skIYIzNyJ3MC1wiDECQiKPk9M2O9Po+Ll5qjaGU/vNze5599tlTV56mSi5NOSLKuzA1U+d6V/f025K49e677z7uuONuvvnmWq0mX4Wux3m7+PJLnYcu29ruWv9QeV7dtChsMCAhosVEyUfn3LRp0zbb7J177rnnbrvtPmPGjLr1VopO29aKpdZpvpJQVLSfaoJDdbrs87z88ovHH3/8pZf+GHy9lWK2av+UnN0GMrnl1df8z7/9+79nunQfp6PRK6GNEIJSbjQ4OLjrrnNuuOEGMJI5nXVjoPTukRFqEVZZeeWHHnpg7ZnryXtBgiqEutZIUEZERERERERERERERPQIGooU5XiJ24FS8ltA8IHXPLWYkTwAxlob+mhqiDMlHEr+3cwsJI6WxpRKplcPiCopK/m72BLf4YmhOtcpPVj127BGBMupzIjOgH3uFOk08q9zzlr7k5/8ZJdddhF2EoS6IlYuBgAYgYApV55lsU41BUd2ByTHjsAxMiMhsugsAcCi0cwqQIwMBhAZrDGG4UtHHH7BBRdMmbYSB3QSZ9mQrVzBmER7YCfIEqkT9vlG2n791uHLIOpo8+ijj33qU5/abrvtbrjhBgCQ5C2lAudlNsgQMMv6wSBBzjVripvgdoVc2HoOABiwieljR+woMfYtG775sMMOu/XWW2+88eb99z9wrbXWCgtvPDTQbcAPUj1tuT6299Zv8jm4T+v1Kdxi+NuQxhWxZ3jOzLXW+eF58xYsWLDRRhvpqAlZYMi96Q0RpFRDCwxu3333ferJJ0E2fzJ/8Lx1OEsS1f6um0c7YDcw0Dd79uwkSUxm1zmXyiLkN0eQDO8A8Prrr997771SCQGnTMwuaK9iN4uIiIiIiIiIiIiIiIjoBVS5yOKKmH2ubEAmYCfyl3DxLktFXeHqb/33hMjO1byCyvp1JRnTdOmuJZMfaGBBKPAIEK7el7sibcRFVk+rMrURY4yAcc7+PP744z//+c8vXry4FDlUibCwfUuNyMxM5HsOQMCVlM6Heh2MXWoYvvnNb55+xhkm6eeg30MlwXTnqEO9S4XJGh94ewEvv/zyUUcdvcUWW/z85z8fGhqSzQoIBqZQgUqiZb9X3WUptEJQh+oVrlam1NZyZSGthMju6+vbYYcdfvqz/7rr7ju+853vvOtd70qSRC8l1yl1ldKHbkDJBOUUvJeOqmf6Nttsc+edd+6xxx6iQ1Q6OKwiHU2SBPzZZ5/fZ599li1bJidoLGC9dUdNn1yfiN773vcSUZqm2tylWzMz+MZCROf4pptuYmbNs0ScKy6rd+ncI0RERERERERERERERES0HXW5juarY3+OFV1OGOPRyycpvILcIgxSKQeN8JeNihX+KS6Aoo6UGxfL1yjkX1lN2crDL/erEsor6ogVRahdJSKVTy5evHju3LmnnXZaqMIlIpE3ZuczEWRHIOx5bJCNATRo/I+NCsQMgBdwZbotIic0o78NW+SVpkw544wzjjjySNCop2jRx09kANXcdZQ6LJHysKIsTEHqV1/3B1oBJeWj/xecYyL6xz/+8YMffP+DH/zX73//u8uWLRX6T4hC9LEhwCAxiaw1V8YRo6gewRg0uRkgRCgEhWS5QtD0oXaSgFNyRCmzmzp16n/+53/+4dZb5v/8yl3mzJm+2mrao/r6+jyvyxWbU7USTe0Gaqajxp9XCCXrUbS2+Ye86Q3avoSZp0+fftlll51wwgngmVxl+tjLh5lZwgoTY//AwI033nTGGWdYazmjkkV87Oru2VTQVGHaEgwzvv3ts2bMWBvQZqPWeAI6UFPK58waINx5913gyUqJ1QCsr4bCtkQ0xREREREREREREZMeFPwXEdGdyPunejfKcfVzheBryMLEIWPuAx6epovB8FulE4U8hMzR0+k5zjkMA1XWBftAbNXjnMX+6y6kaSpirvEuSE8iJMKVpnz22Wf32GOPW2+9VSVjud6KQfLkMLNkYZYEOGFsyjAFk/gOS6xJRmB22WfO2R/pkxJNEoGIeJUpUy+++OJP7P4pcgxGOnrexAzAwD46a+dCGbYT2aiu80cLv2UGAOd4eHj4hz887/zzz3/88cd1MBpjJCkzqCFAtQg55SREkrgea50LfNyGLEmRXAiN0VRFEPBQ1tparQYAs2a9ff/9958zZ9f111/fWolp6CTggwZthKxfuVKm9a5COASgZQK6VquJkvSSSy75whe+EGb0Vp4ulLICAAIZY3732+u23npr6dUsv/KRPppixSNU6gPWajXn3LbbbnvHHXcBIoAD3zfCMvuSk/Cuq6222n33/XmdddbxfaB+SUZUexERERERERERERETFBTExO868iRi0iPkzU3lCEAxowwLS+ADVEIexE9yyebcjjGVrN/FzBkC9MlOhAnN+Et/EklAQf0M2QozX2Pr5RAxS7/cZYjs5Aogl+YRA4N4qgoefPDBXXfdVdhJA8iuEM1QJFeZgorQgFc1MjETIwsjWZeKQiZkYM7DVXLmHouZ3zCyYd7gTev84n+u+sTuuxETWuHKkrCvYpbbPtfcdT85UpD6NdX9eZo4zRheolqttnTp0osvvnDLLTc/8sgjn3jiCXWvlm+lQUTvlkcC5fw/GbmOSTjiIjuJBI7R1y0DECOgRBrVc6RuhYXcfPP3/+Qnl911158OOeTQDTdcn9kJHZkk/cYkxoAwkkGjGFXbtbVS24OqUrIJNPaitdYYcK62z+f3vvzyy/v6LBi21qrUlIO4rmmaihyxNuwOP+LQ1994bXh42DlHjJDlHOug/FDp11qtBgb/6R2zJA4osN85qMhImVleFgT4yiuLH37wIYPGK6yx/kwLw+TeEREREREREREREZMW48JLRs1mROto5L9oyn7SGVkDiGwAxZtW3QeNAUaSaJKaySZ07lZOQNfIgX+3RdG+QTG+ZAjV0IULbP1WFqjtq5QVh/Jr3anJ6nIok42IaAz7NMTGmF/+8pc77rjjn/70pyRJ1Gu49FsAIMjllj6LcXiOAwDnHBEhWKacjmQGxDybjXTx7DNymtJ73vPu6667bvZHPkwO5Eai4izph0sfJhLQp/1hzgbwJZdcssUWW+y///4PP/xwX18fBx7EItDLHZCLSlj9k7z3LgZZX/RX4Z/gh7welOtLxqTtt9/ummuuue3WWz+1224DAwOqqYR6URRD4m8sKm5MENaSilJ33333K664IkkSGS9aLdV2MYm95577Tj755P7+flVWQofDFCgkGubWW28N9SJsht3A7xxkHemmm24CZmus6T4FfURERERERERERERERMRoUKVWNMWFsoqyQgylSMyMWY5kxsB9UH+rV9Nz1A1ULliOQRksU8Uzl33CbgcVJgjRGpN0slpaRcitjHdZeg/KJTEzMaE1QMyOzj333L333vull17S9PBgUBV5BUZDIlEiczG2oAQbRESJLICIxKmx2h2ttYlejZkdExi2aBCIUtrtE3N+97vfbfL2f6JM4WcM2EAkr2wOB2rfXgfpWFP2XzR3zHzLLbfstNNOBx544KOPPiqGQGhfdhkvLK2T6+8ob5CMbbJGHIiZAZm8XzyE9JPGH9RLSSMqNZlY3G6bbX91zS+vu+6GHXb4NwYwAftWGobVPYMJ0UyK8l4TWkjT4Y99bM4Pz5sXkr9SgaJNlnEkqtiBKVPOOvOcmxbezA68mJ2YXdgBWrnvclHli/v7+w3wZu98R39/AkBgUFT62n+0DFJ+ZjaAiHjb7bcAElFNylm9OLQhHGhERERERERERERERERER1E/G4RknVGekX1AOWUVVRqViwXBCdEQrg1VRBiyBJw5dHOog8nYzPCXugqFejl65ARN3hr+sL01NEp0W3m6GV5PR9rJRCbJzF/+8pcPP/zwJUuWFOhLnzMHgtzudbuK/CVfeU1l1h1VZSnkGhQCGgrLRYbhc3vucfHFF09fY00oUs9h+yJiEJSg/GidqLFOI8xgpbXHzA899NC+++67ww47LFiwQCOBCko1E+5OlPJlcw65V35Qb6r6R+kS1lprrTFGxNtJkszebptf//rXv//977fbbjssJnlHxNB3O/x3oqK0Z6M+3UT0+c9//tRTTxVvbkSUD9p2xhhjEiIgosGhZccee2ytVkMsMLzt1SdWG8JaOzw8vOGGG86YMUN7RunlUXrriCb0/vvvf+mllyDYGWtjOSMiIiIiIiIiIiIiIiLGFyFLUOIJoegx6ReQZV5Ifyichn5A5BJroTfNkylXb6lQ8RQAWKtZEbo00l+3lafLUWJYkGHwjaVzv7Df937wffau36GQSh1+JSW072GIiEaEYQYZxXHbxyOwAMafExCaFrO8Kz5WAKH0Y8dfPuaoeRddOGXaysRMzGAQrfHiYQNggqipGtYwR8iw9A4IgKSy9OmGh4dfffXVr371q1tttdXll18+PDwsAmlJg0NEjhxBFugTfIRatSNZ6zAgFxhbaWpjTJaJKAhYK5ErBSKXkzs65/7lve/71TW/vOH632+73fYEDm2d/RDfQOHtRqz16zY0IeBCAy221JgkSfqtxTQdPvKIL+22227GGEYQZ/yUHBhENkAo7KRzrq+v7447b//pz/5L6OLqJlCHIAT0jBkzNt1003C8hDR2uKMFAGDQGLN48eInnnhC6e/ScGuQlD4iIiIiImIiI98BjoiIiKiDnl8TRUwykHdUzZPQ5N8F7t4hD+ClaYzIaAwDMDvEzA0ckTWNjdJKwjboO9RUVVfhcrR0hCvR7rSI8a3cW9A2lUZ0zolwcvHixZ/+9Kd/9KMfSVsrPaHQgKRcFD9Clsg759f1g1xAbkFErEFS0Sd+QjQGDCIADCT22GOP/tpJJ1nbh8aUOM1QVww5c1TH1vdob9SqS9M0Temaa67ZfPMtv/GNU5cuXepcyt6nOxcnVoSlIbsUGpGwpdBrMwFAnMelkpMkAQBRTQ709Rtj2BGl7gMf+MD8+fNvu+22bbbZRphiKMam9Inac4tRlyDu3UZp5TR9au2xxpgLLrhg4403TtNUtIdhUm/wyeiNMf19U0477bTFixePJbcuY9xaO2vWLGY2gNCggQoEtMHh4fS2225TEzE2pY2IiIiIiOhy9Og8JyIiIiIiokVwkPo1dKfT454CYuJCFD512NXfQpDVhr27dhaDspSPW9hNifSnGZblnNKNIaAycXx8/WJ2qqZgCPMvQ9Be0hWUrkaGvz2z6BP/3yd/9Ztfa6/iQNYLwcQLEQ0a0eXlzLVh/V14LwDJN8/iwQrBxfPysAGAhPHEE0886ZRvODTMjMWMIiG/5qOj2kY7UV2ooNSxB0F0P86R6UDTNAXAp59+es6cOZ/+9KeffPJJ7xecU1fKHWfqSGCQ1vAPbdGomlKboxRfUkk03WkQugrZGGMc1RzV3rTeOueed/Ytt9wyZ9ePg2GTZN0GTQKoOVLKTdCo8ruwUdqI4tMZROuYpk2bdv755/cnfZKVTKK1EqUSgJLZpY4JGAz+36OPXXzhRUDMREwEQESpZAnvkF1FRGutc+7tm24CsgGAhouS2HAAAgB4gec999ytF2FmzTIPkzv6ZFyaRkRE9DqiHVthYBD3JqJLEK44IsYRk74Jxlc7GdmSiNEjz5ORLQ9Fbeaz2VQEZFkCZMhYHKvsh7WWqJ57OCIAJEmS6dHCdBwlCY/+Kbot4UpC1Uzp5BV84oA6rdBbEaNFqY24EnfSGPPAAw/suOOON910k9ffYiCBLJCV4cu+yIhnN4BAKabXIQLmYgfLnMHRogGkaVOmfvvb3z7qqGMYjLUW0CImpZxQAU3ZGyL5sA+r5BD8LJaLIfzEd3toaOj447+y+eZb/uY3v0nTNOSJQqVzwQRInWCmgGNmYgobDoKGqJu2W4qXJFLhzjm37rrrnnPOOY8++uhee+1lEhuGs5zYPOPowX4XR1p8u+2222uvvUT6KgizdQMAOSCivr6+s88+e/HixRoGtHRa24E+CMC73/3ugf4EvP1vZITRK3aTxDz00EO6/RWXZIqwpeL7KyIiohcRX/EREw/Ne3WH3tfh9D66mzRpgjhfiojoLeTEooSRg5ZcJ0M5IyLKWjkkAJXuMIAESGiUv7SNzERIkYRUS1iC8N8VQ0iPlkR2TRF3BhoAAQyW6IZQxCcsw8KFCz82Z5dHH/uLEoJEJB0OikFIs6v6ZmIkyDsPMGf6KSKHyGCYkUKCTONOAgA7QqbEIoNbaaD/7LPPPOSIw0zSz4xCtAOCfChRaVA/zl3X9QFu5ulMmbSVRb8MtVoNERcuXLjVVluefvppr722WLLTMDui1J+Ze1WHtWpk84IYAcEgyG6Gd7fPmDKf0TtM2G2MIQLmbOPBGmBKpwz0HXP0kffee+/cuXMHBgZskvhRn+RtMYlVcssFInIWURQTY4no5JNPXnvtGdZikiQYaM+Z2SCTq9VqNefcX//61/nz5zMYYqSUgeokhmovkiSx1q6//vpTp07VUpXI63ywB1PtRx997Nm//Q2YgRgy7a6J0SdDxEV+RERERETE+CJcO9RFo7l624vR6Vt0LZpPYqMsqa2gyn+NzomIGAFCuVjZqBIbCI/noSRBCAkffVL8AqGwogREC945O095gmCr99bPobJSYhRqEMDSvyX2aqSPrWqjQoBMUwhsFzFKiGpSaClhrEW3NX/+/E984hPPPPMM3qiM2wAAIABJREFUBG7I6EV5JW4CAjEjZOlW8rxL1qrmS/SSWXzJUH2pWjyJO5mmbsbqq82bN2/PPfcEAKHVfDfLbifXLPa6RuHyuh2F/QFjENE5RsTnn39+t912++hHP/rnPz8o1Su+tKEt4CBtkdYn+2RYEAgqSzq47NbAyjUzs6ScTpLEWlFQwrJlwzvttNM999zz1a9+dbXpayBY8OdXOeKIJgi3khBx5syZkqdbTWgYniOMEDxv3jxJhYQ+pTd0xgBq36jVatOnT19zzTWr9wr7j5roxFhj+954441HH300GKq9ORrbhDETR4Sa6IiIiIjOYfSCg4iInkDnprV65ZLIY7KhtI6DyqIyLvY7hzhpjGgLwlWtHlQdmz9AzExMWIovV2QUw+QiEDiVFhgSZgQ2TGoa8t9zkAYHEY0FwMK3Pg5gG1y8FSEbEkdUu4AVt02htAzgBT+ct9++c19bsiR8f3iVHGqUSQgFrQgS65CZDRjkLH03E0gnRGREa4w1xvoLalOKctAhMgIQ8RrTV7n44os/vednCQ0TGkBjJH20j1kJWXSD8AVmUPLrhBg7p+9GE3cuIqzSEODZSfZJb84666zNN9/8F7/4haRSgcDZFvKAofllq6/z8CAUncGzAiCg55JkaGfJdsghQ1qrveXNb77kkouuvPLKTd72tqSvzzGhNRI5MTrwjhQGJDpqFpiVKN1nn3023XRT9a8XSitkmZkZrbnvz/fftPBGdsQIMvigM5bQ9w3DjKussspb3vIWRGTM+7Z0JpsJcH0HoKwHpo6ffPJJ8F202EMm3d6sVlGn31mlYR4RERHRIUTKICIiIqJ3EM69TfBfeKT6OSKidZR7jgHLJGtBx0gkQihMoOhsrYsjYRXEU1a/DUUeqOkxMPMAT6C4sxGmwcl+A1bpFWOMT91AXKS92lIBysu08ZqTGcIpWGuVE3HOWWtPP/30Qw455I2lb4SnwXL3W7yzsJxGRKKuxYz/LvFxqFfSToWIibVEsMGb3nTFFVfutNN/iHIyvEldDWD4RKOulWYIiaHqv+HQkEJKDUDjOX2FWcjSTz388P/tsMMOhx566AsvvBA+V0kUmbnPB+M8LAAETaZjWyswvJSeIxEnJUdKX7/97Gf3uP766/faax9r+rgq3o4YBaTOV1lllf33339oaEgOhpEotZkkCOmFF16ohFdHl4jZSEySgYGBt7zlLSTe/h7MbDAfsOhVt4hoTCJRa7Ona24uJg3GoBKKpjXWeURERPsRLUzEpELs6h1FyZ5kK8Ois05pXRPRRsQF3fhC1+AQ6MPGt0jtgsYJzNaJgAiorJ0yTtCAFQE/5MPcGGoKTEi3a05kRKE2VZGeaUMQbCjvKi6eRTeXfR6lgqaJKjNOm0aEsLqyTkPMjoD4y0cf85X//4SaSyWtDXt1ZBZfUESRPo5hWOclIS76GIjMBMCS/j1LDU+MDKKy9DS5kOvIqdvgTTMvu+yy2R/ZkcBQ5iuOEjFTmjzvY5WIh522tmHfrpJEYf/nIBxBtd+G9RbKm4F4eNnQOeecs+22W994041gEDGL4Fd9eQNk7GTpq9JYyE5wBFSg9bX8GetkjLV9iJgYy5S+deO3/PSnP/3xZT9ZZ931iAmMDHzrQy70qit9d8BIZSJaonSPPXZ/6yYbo82SEREwAfu+lL23rLU3/H7BM3/7axjsohMWT1+TQq9vsMEGAGCLsmQCdkwAkMf3MIjWEKXW2ocffpgpNRbyOLPZOJ28e7NjYJdCdPReERERkxPRwkRMKpTWOBHtRWhP6tqWJixGxEhQVU1GjD9K4R16OtqDRpAEAGY0JtFxzczAiGBEgIWIss51TD6zCEsGcAiIDrUGwnV6ERUjsnRiCu6da6yKpSrwL4joB0AuAqr3q9EiTpJGjxKHhYjLli3bd999z/juGeFpnrsG4Ssh4PtLZLSQ4mG7hDS5P8JKq0PupAzGIAJwSjPWWPOyyy7betttyTm0WVS+sLTluIrjgbAAYQ/XeoCKhpkDFSrUIzcFjz72+E7/sfOhhx76yiuvQHY1CaxZUGhWhQwhO1k6GHKXpfvqBb0CDoioVqt97nOfu+uuu3baaSdmDpNHa+UbA3H8NUErfRO9CHHmzJkHHHDA0LJlaZpmP86zZucM8ssvv3z11VdD4yC8bRkRGChtEXHTTTdNkkLqs6rtFa20T0WePvLgQ0uWLAHfZ0ZfpF5HJ5opIiIiYhwR7VjEZEBcaY4vYv1HTAb0ej8P+Q1FyDYqQSRZNKDIWggppOfodZxz4jioxxGxHDarsiglACJKhdwsFbRI3Ni2c/Z1J0aVEsYdAwCAummtVdwHxEASdhCWLFmy9957X/5fPzHWhpSWJGAScR8QAme/giCgYUiWZcwZZvlAmNmAKKwMokEGySutlxVVpDXGAq45fZULL5q3zfYfdkwi+gu7dUidwLiO57AAVfYhjNCq1RIOxZICzhjjHDvH3/veDz74wX/9/e9vkPOlokoXz8sAICE55TMUSdvCIEerGxIlalXNh0G2BoaHht60zro/+H/svXucHlWV7/1ba1d3ElAIF0VARB3U94iOjo5nVHRE53h0vIMKg4pyMUAAuSN4QRguclNEUEfkIiDKAfE2jjDOxVEH51XR1xE/eBlFjjICIcGQkIR0d+213j9W7V276nk66STdId2s7yefTnU9dd21q57ev/qttT7+8U//3We22XY7UNMTcuoGZk42VmddTL1vqlKM+qY3vH777bZnZoAJoa1RRsj5HwF85StfYeYYoz3i0wWMm+hMHzh4gmnWzLs96Umjo6NmqcTAs5eIzN2cU5cS0R//+MelS5cC6H0z+IDWmO1/iDiO4/hzzHGcHv5n3qziUa+QOJuEmSJbTSNVoNFcjzsqFM3w0BZjrlSJQU1REdXsrDQ7lKrmeOvS49VsMEYudRaj99zJ5rihHpmeYjUD7TI36dnipmWLve0PuhonJuLSpUvf/OY3f/GmL2bfX2nZK52SvYlSIM/laZpfrd5N1zPInATrtHAgJlKt4+Mft8N113/hr1/7WhUJIYCJq9n3F3ApRKIrYmY5stQKY4wx6u233/7KV77yxBNP/OPyP/ai1geHAe0uMGlvyXtvFqbmVi9LRRsjIyNVVZk18nWve813//3bRx51VM4cYc8Lkbo4l01vJKfBLgEz77HHHnvvvbdFTHekwM5dhh/+8Ie/+93v7KJgmB92ug7MjqSu62222Warrbay/gIg77pXwx3p2cLMD68du+OOO1T69slNObzpfzA6juM4juM404H/kbZl4tfFmTlKOWhwvqqKSjknLUw5dWTWLotQbspqVZI1UzpLojYSfpKezWWEuc3JKSnRRJVqqYCWyzibD6ZS8Cova4wRzAL6w92/f9MbXv+v//YtDqFJRVlmRexIigJIk4aySBPQbLZns2oik1Whlm5A0BSNsQk0CUwFtTxxt51v+OIN/+vVr1ZqaliHkMOTw2x8vJZyTFmIqsynYNVHzjnnrL/8y5d85zvfYWZiRrohy8Yst9bMR3NnA8hr5V13nxcRzSMg71e0rckuKvXOO+98+eWXf+3v/2G3Jz1ZoRQshru54lZaK+9/5hrt0YZdKesdr33ta0MI3KTpSG8ROjI3r1q15rYf/BCae5QAkh/003hUIRAgzPy4xz1uu+12sMppAARqrxZUtclFqyCFRmG0+Q1+9rOfUSpGnze7KXdx+5BxHMdxHMdxtjCm6++02Tjoe4Qoa3vI0H9Dxo/evM600dZU6H1g/pve8K00L9qnZRy2DTRjVKt4Ycvk/HKNWIkigBfdNHaDlHpWR7Hy22ADmd5xeH4SZVkKQA7GBKCKX//61695zWt+eNsPrZZ3jB2XHzUOSrV0kKVXqwxk7mVdtLWanJVIprsU8s9c5X45MhI06p/+6Z7f+MY3XvSiFwFWBhxWRdrUyVkkTJS9vdfzy0rllOLW77rrrle84hWnn3766tWrc4khDCt5MXgfUaFjlrcqdSPubVE0lufmDmXmEAIzj4Qqxvi2t73tJz/5yQEHHIBU6Qjdr7H2mnrW8JmBmV/1qldtu+22/YwZXXekqn7729+GaghBh7mhp50FCxZss802uSJbfouVj0rbJACwEvBKuOOOO0QmyorkmL6/XB3HcRzHcTYU//N1szEtgS9+vTadQbOL/zXuzByl9MTElJLRGdlwA5g7R3qFLlCUXEZRdyTrIbk4ST8OvNy9IQLmqtxxd0JV43Q9YgbdZLOddUham07RUFlUaqx8AlXCXXfdud9+b/nFr35peScBgCDI4rKoSmOMVIUVF7aOINJOa+sNzOqYVe+GKCyRYp6AxDhhskVgUJS9XvyiL3/5y//PM/dUYomANKXDZyJ76SNCvqxFyk4KIVxzzTUve9lLb731u1wFc6cSaZl3curf7j3BCD0ZUdR0X5GOxTrW9a5P3PmyT19+xeVX7bDjjhyCVfomZVJQYJDMmauwxUIpjn6nnXZ63vOeR0QMgqj5lIE2u6hAAdzx85+BNb1CCJYBZNqPqvliqJWUH/vYx7aJX7VJSktEZS5am5PeceG//uu/1q5dG3h44mTHcRzHcRxnrrIphptBMcGZhDIylYf+c1HSmRlK925L6m9KpIqYVcSu31FzIKitZSF3NqrNBrksQDUhfODGZJkpQ0d7ExgospxXKQ9lWlxXZqkb3NesZlBX3nR6omd+NlkxHJtZ1/VvfvObfffd9/bbbzd9xDQILtLbJfujTUmTVZKUCBya7mPCRVmxOl3uZl0u7IBm+wohhBBGKpZaXvKSF3/lK1960pOepKqiBIBDyD0qK3Sz64qXMnr2l2WzW4y6Zs2agw8++JBDDlmyZElVNakSsnWxvKHKJu192ec7C0VblTMz+VdzwJlVtuLwute95ps333LooYd2bk+yElkNpaGPkhNzdl2OLZ/0/OVXvepV2avYPnWLp3FVVXfeeeeDy5drKvM9E8dDKd0kM2+11VY7br+DHZJV6+71xt6EKlUVr1y5cs2aNdPy/txxHMdxHGfTcZlm5vC2dRwno6qE1qRSehypiPXMrklK0aWl0SpLKLZ8CKEp+G1r5WySA7vh7N9Jy7R6alq33dMmnmoIwd8DbChJwBKkTmDX+7e/ufMt+77Z1EnVaP+IVGMMBCURxK77iZH8U7kMN4PMR9kTywBAG/esWBcFA4gxggIzM6nW9Uv2euG11167cIftlUMUMLNlzCzdvKaaDy3EtMVSCnn5fjF1WJV+/OPbXvKSF1999bXWn1WjOdGa25JgRjkuAGD5/jRpwYxWlxw8gHY+wXKAKoFSSe4YJ564686fvfrKr371q0/+k6cqIgc0AbxVsFXAFrbfufeNfEjOtJAkYGHGy1/+8nnz5jVyvzb5DrLubG+SHn744QcffNASVdrdMTPPQxZBVBkZGdlll10CtW8getpo4QtuunqMsmLFQ2seWkXeTxzHcRzHcRxny8CtA87MwykEs68iEpFInecQKXMTg2s+tqbmgYCoqYzCXFnlGxFpQrwHlYhSIuw5xVBIYCiMYNPo9Jl70mSpMW1KK/X0AnSvSArsZ1VS1R//+Mf77LPPHXfcEULo7Z2ZtCNyl7kObftqhW9ijCKiSqrtMpSy0VHKctgYM5mt5wWGqtbj9V57vfjGG298whOeADCIRkZGygbJ2zFxc3Y9TMv7ohT+ReTss89+xStecfvtt4+OjmYbmr0TsHV79klN+SXRraWuhbmVuvlAUZraUrR+IGYGEdV1vf/++//oRz96y1ve0mQMVAWRTZTuyNIVOxt9rLOFnO81xvjsZz/7+c9/fr7ZeobZEEJVVVtttdVWW21lq5TP2+mFUqLSWuLChQutY+RXW02pqxTZnZ4PzfyqCg899NBdd91lBbem5XjcjOk4juM4jrNlMl3jWWd6Ka9F63hwnJnHPFI2nR2RWSTMGogO81Tap+blKmoLC5d1eyevEtv4JfMAFd3I08zUb4ZH20OtbKtNeWTkdXNwaKM0d2ViIvrBD37w1re+9Ve/+pWF+qLJcWcOOxKQEpMyI4DJKvZaD+JmR83PLGAxh3QiSqRNnV9RjY23i1Q01rbMSKgo1s9/3nOuuuqqHXd6PEIlIoygSqqUUt01zty2cYi28G6hGs3LVt5gWZck4l//+s7XvObVZ5zxobGxiaoatWSgMUbzKQpS8Zw6cptQtsktQmTh9Y1xMgu+tmdASxdb1ouaX0EEUlWJcecnPP5Tn7z0s1ddtcOOO4aqsuwOzCPQpnR0pjgzz2AyU3SfdSwCZn7Na16jUHB6oCuTsuWjNAWwqqqqqqy/MVf56kzvk1O1yVgaQth+x+246nyvlLtrvL2dLhdijH/4wx+Qnj+b3nMGv1Mcx3Ecx3GcLYHpGs86G8tgRW9gIJWcXxpnxuCeWpgkCLOaRaIsjrMqmTsyGS07PbbQUlCMc2MI1N3BsAFwqcFnERRFTeeeCWiK4+eZGGw/Gig9bskcK3nCPhKp//mfv7nffvv9/ve/z1WTVJWZVNMWkkqtGouq7pr1T1ULQ7bLzaU2jaSdoQhzJiITOgMxk9bjYy94wfNvuumm3XffHWAFAo+gSMKoqmUCvo1rAWz2LlT225xx0mxxVVVdd93nX/7yl//rv/5rdkqWZ5rtabZWvl6DSVebJaE5DDzvnVLeQFVwSvzJ5ptUBOL/9fK9v/2v3zriiCNy1ksiyuWtNNVV91tvs5H7TIzRcjuq6tvf/vbtd9hu8AWPXTUR2XPPPRcuXFjXtVmYZ+7wmO2hIVbFO7/I0h4dcZyIqK7rGPW3v/0tAtkTYuYO0nEcx3Ecx3Ecx3kEKUWYRs1A65BD1oUK5bCnFuZl8qcmhuQ5bDWFi7SS0hMvBrQMZq6aBHkDrhnTTad+bi7wbxyDcnASv0BE3/zmNw888MB77rnH8k6KRFslqrYeKICRkgWkQjdEpMRKpnArKSUrX1uBJ+/XdLFU4xvJQqjESqLP/bNnXff5z+22++4IlYKJghIUavkISJuo5N5LHgLamk/rPPdet9yM4kgTPk9NbgUAEMHq1auPOeaYww5799KlS0bnz7PiVJLSuzZrgkhTvHbgIgun2l3TexNQikRlURvLNamAElNgNdclybz5Ix8++8ybb/7HPZ72DCijKZLVlOdWKGh4/SuXljYDlIKpTSDefffdX/Pqv4bk1z9iKrQtpqovfcnLJHaqkKk2N/K0HlU7vd1221VVJSJ1XZuXk9IbBQBQWBLVQE02A64CgLvvvhsxSowi9YwKqY7jOI7jOI7zKGaworfjTC/DK3cPkmUcC+LMQ1RmqEb7ae7ItE0mCqYF9eorhFQ8mSgwV01ccDZzJZmpo3+VQknpIBvUNaY+eHZ9ZOPIyjSGVY4GcOONNx544IFLly5l5iayuFWp2y3kCVWUPtpC5O5EkeeP7HMtMtOhMUVKCBRCiBPxeX/2nC996UtPfvKTNUU057JNvdPZlEtfaqabTeku2xzpzvzNb37z2te+9tJLL81myfJ1AaxqUDdDgpiWXJQcyfdXvh8t1jvbJ60qOjMTs6qGqrK9j4yEGPU5z33uv/zLvxx34gnVvHmwMkQDhv/JTsrfE2weSu+qqh5//PGWkjXfR0Q0MTERY3zCE57w9re/vRoZyRd95o4qhXjT9ttvPzqvSjMFRYfM30CWZKR9IAC//d3/HasnsqQ+c8fpOI7jOI7jOM46marA5DgbQSkGAogStWstS0YuKRUqSlkmy1GtbcSyEeYBcowxpxesUhK6PBjudO7GXdd6LW1mmKSwyVRvDPdRbiiagouz1GXil0laX/ziDYsXL16xYkUWyIgIyLXbiYjzTLM+EgEC0sYLyVBO9bgJwskPa+HDaESWZg5EbX6MMQRmItT1nz/n2ddcc82TnvRksGWc1KyRMzNzpUpWxRv9S588vMA6OsQjK2fbAZsP2c7uG9/4xqtf/b+/973vjY6O2q0odZS6qZZud5PFzCahVgExN6WqljXrk4arg4VrQEGUiEIu0g0hBpEKg971znf80z/9y4v32gtEoqJQq5a1xaf0fHSRn8IAiOi5z33ueeedt2De/JFQqYpItHtq663mn3H6aTvt/ARQpwQZUZiJo7JEASIyf/78NuepKFObOCIfPIGyNB9VmHnZsmUTE5GoymkEHMdxHMdxHMd5JHBnpTPjFH7JUrUg+2dGlzyuFLFEk7YYW0kGU6JKaxcAM1cOyUFplN7JUgLLS7Y+r+TpKy1j62VQmvTwwKlTypTZnHjDDTccfvjhy5cvz8tkhat37dBeNQDI1W/SimjiOYt8haW/D6kvpvrvMlIxk2otz9rzmdd+/rqnPf3pSizaaHKDq/ccuJMZcofSs/du0LobTbn93CxE9NGPfnT//ff/3e9+l6tjo5v2NUmZ7a2RjWYW8JvnpIYFJ/Njdq5ZGW4iquuaiKowakKnSL3VggWXfPzjV1999cKFC2uJFAZrlchMN44zRXqPyhjjMccc853vfOeggw564hN3Xbhw2x122GHvvfe+7rrrDjvssI3L0Lpx2I622Wab+fPn29MeRRm0fPPmR4cWCVXvvffe5cuXa/ctmeM4juM4juM4jjM3yIJGR9ZIdXrznGyvAWAJ8XrFOVCoHzkkN4tLqlqhqLKSSnVTduvkFUpDZjFe1bK6N4Cpm2h6Ymg+LCeTFcby1/wzmSKVFMz85S9/efHixStXruzZbjuqIgia5TMhQpNczhYWZW6KChMlbToJm9bTUrUcMuuuFdiZNzrCirqeePrTnnrVZz/79P+xp0JFiYhBTVZJIrKdlL2oNP0qgA0xiPUaZ0aVkbwvk2BijIF4Ynz8+BNP+MxnPqPJxgxACY0PrnvrpqsQm+sACIQARshLpssaOjc/U2iqpkSiwCHYfcLMYxMPv/CFL7jiiqv22GOPOsaqqmphgMyvmsujo5tn0HlkyQ9SVTVD+/Nf8OefeO5z1qxavWzZstH583bZZReRGkQyEUNVpYsnKUHrtJPskFFGR0dHR0epyWAQrQP2HkEKpWwFZRaSFStW3H///bvuslvRz+yp4c9zx3Ecx3Ecx3Gc2UKrCk5GZ3iICIDJTFeqKsnDViFJkyKNshFCsOqvhWWyQaQmagJ8K3QElNYmU+4+a14mxFAiyyiUkgwO1dTW2wzuuxlKacQr7Uv5I1uMma+//vrDFx/x0EMPDaqT5QZz8ei0mO2lI5ARNfqDqg5+lC+opnrfIbAFNe+00+Muu+yy5/zZnykUFAK3aSt71zdvMx+XnceGNk5vYnrRlIy1DXoFkNT8ifGJgw8++Pob/k9VVQCsNHMWjrPGX6rDpV4JU221zeiX9H0ubWtcBbteIyMjJowyBxEhQKR+29v2v+SSS7bbfsc4IQpR1cAmd8ayqzhbFN1nafuyYduFC7fZZhuB5TAlEQmVhVNvDlsiETFXIyMjTFV6l9V8VPbebrw52dfMxMTE/fffz1UYerM7juM4juM4juM4s5pBSccclGUOSiICqKmcTGTKCRVlV0sVkbuBtrYFLpbTXEmnHJGmn5Ssc8pcWSK8XCC4+7Nz3D5Y3XhSKescTYy2kq/kS8kcvvSVrx559HtWrVo1KEU3W+oGF6etkekSKRMlJZMgADafnxI01e9WgqTOp2RWQRCFKoQA2nr+vIs/etFL9t5bFNqkJRUrOoxWSUR5GMUBMsDZHjaormaVdkYZ3EXRJlZpCFKr1HHZ/UsPePvbvvK1r86fPx9J9m0OUhSS6qpDlRBVmirb6f4SKJgAtqrcVNQOUlWrym2ilUaxLJ9xoo4xhhACY6TiwHLqKadcc+11j91m4djYGFfU5Lhs2tAzj8wOLMbfOo9oLYiWEKDJnNBmJm1L6MzQkVjl7gXz52+1YMHQd1Qo3pfkCSujI4K7f/8HkTor494DHcdxHMdxHMdxZj9S/OtDYFIuP210DCWAGQHSerZynWcUZXPS2JMBVqUYtRr0vAwOhrsusFYNnbFWcBq6fitToK1md7ArctNNX1q0aNGKFSvy5Rqq5RX65pDQ79IJ2/j+GqlbiKCxDf1uFiYwCEyhqacj51948b77HwCAmFRNIDc9boOrtAxaI/NE1785PWJN3tTgXdDb18REPTJS3XrrfyxevPjnv/xFuvdUi+wHpcQPKm6lMjy/PP6uMQ2ACZHEzXuGvBYxxRghuttuu178sY+99rV/bS8Yht6t09IyzsxRin0AqqoSqa1ed7mYiDDDoqpnFJNKQwgjIyO9Bwh1jcB5pq1l7yzuv//+zZkx03Ecx3Ecx3Ecx3lEUFWk1JNEpNqP+cv6hjaaR5PcrFRLSltMOYeJggmc+d/gQBQQSxKYFZO0yxk/+UctCs0Z58ryRo3DUYmIv/SlL7773YesXPmgXZ11CASlibKXS9QER6VURRoKJk3ZLTUmbULIEiYCgIhqDAxWjDJdeMEFixYfAU7GztRlIE0s85TOd5JaN0MV1WnU4Hqb0i5NwRDR8bVjgnj+hee/cZ83/eJXv7TDkBg1Rc03x59aEqnKuW1TQAKyTxmqMTb1yhv1p/FXElHFgVLiv6giaDSs0SqQyrP3fNZXvvzl17/hDRQYogzKFryhredseUguW1Q+oJmr7DosXxgATAib58pWIyPzFyxo+qSlrO3emL2bReqmnM59S+6xh5L3QMdxHMdxHMdxnNlMGQ83GBtnwdMgagJFB5dprFcqAJihJJIqeWurcQEQo7fvqco92S9W6EQbcJbOBlGKF6W30T5lxuc/f92hhx66cuVKm7NuaaC8xFoUoW506xTInG231HoDG4NeaZglQhUCK5j0rLPOOuroo0FNZHeWsAWKSULO13GEg12x56OcUXtg6aYshXgRWbZs2X777fe+971v5cqVucxxby1004bmT8tzSZstlalGfc4etMYAMi2cAAAgAElEQVQtWwUTHy3e9+GHH37729/+b//2b8961rMAEAJINqiFnS2HHLWdGdQBS7/wTB9PabDv2ZPLX/NB5oXtifH73/9+YmJipg/ScRzHcRzHcRzH2RIQkZyAcmgQnklDMRUQ7glcJqrkkFAbY4pIr+i2VXSF1WvOc5sMmLD5YiNokWj1hLure9z3dFJKFVk9ZOYbbrjhqKOOsryTmLqEYf4+RXb8NbuQJvQY2TbVCGdRodSYIG3vbVwnQc4//8Kj3vMegVrJpewcbHoLgTak7vCgMoKuIrkZEgtYIxOR1b3RCFW97cc/Ouyww372s59Z5SkMyI5tY6bMocWnas0GIhUFpcLmtqKkVgepEnMliGw+1iSDitbbPPaxJ5544kknnVCNzMs9gUNQjVkqggd3zw44Zeho3hSla2ddJ+dwTK+jmgVmttvbbRWY542OppvXXNnAQG+3icLSr8uWLSMFEytcLnccx3Ecx3Ecx5kbDBY0NsGE0ZRNUU5S4UDoN1nZAg5BSAAoWmERCKogSvasVB2HTauaSohokkJCno5NpGp56M50UprskOSzm2666fDDF61cuXLq6mRPYjChuu0E3BppS5NUbwuNmw8UQmCV97///UcedZRAQUGSp7A06Ja1X6Zysj19LetumTI4fSob3FBKyySAGKOIXH/99a9//et/9rOfMXNZUrmn1CAV/s7TWlZDVkUq8J2WbPMslNukVByZmauqYuhjH/OYSy+99H3vf39VjeYtD/XfObOE1ipbzs3m9NJIu3murCYwkGxhMqdnucqSJUvWrFkzuLDjOI7jOI7jOI4zZ+goSyBCJ4S0FDeY0QhI3Qof5cI5ijcrLWzVlrNxzDbVy4Y2UOO7Uyw84ZVbpx9KwdeqqlEqDl/72lcOO+zdK1Y8tA51cvA6Ni6t5MrKKkMOx865AHKeRIiQNoZKACJQ1UAMEpmIJ5xwwqkf/IAQi5KqUmCr8V12iZwbdRNli1L0HKrsTCMmSoqI1HHs4bVnf/isw45YtGzZsqwWrVt17d11zExKEGpKMosyCEKkHCiQNveR5ZoEJMYJe3ugqlLHOD625zOf+Y2///r++x0gtYKCVU4PYcRS/lmdHABEwe++WUQ3869huTws229TBy0nTNg8R5Writvh5JTGGMgRUc4h0EMrV6986EHQZpJTHcdxHMdxHMdxnJlBUmz0EIWBqKgLoopuQGcaDwpg+pACEDTmLdJODeWsmZTD3iYXYQgBSQkqHTS9AFvtpttzv8zMUfrykDSvG264YdGiRQ8+OCXv5KCmkG2Yg4bZ3tVUhaWpRBK2QyAmUkREecc7Djj99NOJAoeQRY3ewZTB6ZvYFN30lzOi12SBPrfMH//4xyOPPPLMM898+OGHp97ne87T0pVG2lgsS9G5lxQ25wYNxAR57nOfe9MNN75wr5cSEZgG777Bg3GFaLYwSUcakhR4MzxmG3N0qYcOGKjbQ+zWrCeiVatWLVmyZOjCjuM4juM4juM4zpyho1EWaFHSo5klHQUDAyJVGcBqMFGwqG2kSrJpTU1pBxts3d4R9HQ0Z9MpL3YOwFfVr3/960cffbSpkz0hrEeKFI79uHuCQjmRRS6rN93s11Rt5qgw1TzGyAwryY1a3vLmfT756ct4ZBSARljgM5LyDUCpUcvtUKbYLXRyQWTw7Ka2yfXvBcXNICIxRlWVWu/573sPOuTgz33+urzWhvbzQQU53URsftXcSkTEIEjjzSSF1FEnxvd5wxtvueWWpz5tD81uZ+Yc7A80KR96bzb8ncHshze/G906Zx1jTLdDdlsPFcHLrxlRGRsbe+CBB/IC3gkdx3Ecx3Ecx3FmJ5wKJ0yWxVFMkcKQoZ8AolajpKm9HHNthVIpItIQKIskSBnzmilbaKgQk3dp5i9VLQ9UU/2dRwMzLcIOXuMsU37jG99YvHjx8uXL17sRok4NnM7Gi7SJmuO7C7m6TA2AFO/MDCYKFUktf/nSl15y6aULFizgEAiBQ8j9qbVMgja0Ng4GevZMaBzrtnPGGCcmJgC+44479t1333/8x3/safxTOaRyYS3KIk+mb9pHFtZdVZUZ2STW73jHO6688sodH/c4uySWvKFnYbb1N6wJHGcSKKWmtV+18Or3Fut9X1ShIqI//vGPcGnScRzHcRzHcRxn7lLohK0WkQNSO6kjidDoTm1J4VJxyjpJtuWFELgnfw61a+Y5eesmUyoiM8xZmW14mHkhb67SC6g3Q5+qfutb3zryyCOXPrDM4nyHNm+hLAzZWtqoQvsFLphZCeDcS0RVIEpNTSUNVBER6rjXi/7n5z5/3faPe7zZrJQA6iWIJKKQilQDQDmt3QLXuasMFTWmvSOVO8q3QV3XRBQTI2H01u/++1v33+//+88f9xbGsMJBkx02Omp+P9rdbpTUwqTaJABlhkoNjR/+8DmfufKKrR+7rW1HEC27X6sfaSr4zK4HzWF4s7kpsxZvKvnAgVDuaVpU8qGUwVZU7N2JP/kdx3Ecx3Ecx3FmP+VotHVTElFbsSYpPDkJWJoQIlWoZZRUVc6ipcIiffMItPB4qWrkPNTMB1J66ErLJQpNVFWtRrgiVyWW3hacqaNNxee2MXM876233nrooYfec889pSA9NIDfJnouyEzZA7LEkEW3cmGr9d5OkGgdd999tyuuuGLnJz4RRca6XA++3MUUGTyFwU+nkcEejpTz0bTgkZGRL33pSwccsP+dd/56UJ3coEMqhf58f/W2mSPirWA3kU6MT2y33Xaf+cynTzrppKqaZ2J0WoynvUEcJ5MfBT0LsOZ8lF1DvT0BkLo6h7B69Wr4k99xHMdxHMdxHGfOMlnQNzBQRmXQsIUiUK+nljRbF6mINCugWW9S1ZSY0pYuxcrKDovQZK4UFe6WTZirzGjccW5Dk6WstX/6058uWrTo3nvvDSH0CrnkIOLUDxqtGpP4mHqOxfJcGMMrz6iCCSSy8847fe666572jGeIRCgTm3JBKSViuzHbydCGou75DrbAkFVmpjuZvZGZY4x1XQMYreZd9unL3nvqyatWrbIOr9qP11YlIlZdf0KDLEGKSGNNlYHcl1Co2nYDs4jstNPjr7vu2lf81SslRhUhgMCqiuDluZ2ZpenhIpQ9kvZyIjZ5KIHGII1Su0yGbhFZvnw5VMvvAsdxHMdxHMdxHGf202pNvZkKzfn9Sv0kLyRQRpsCkAKjyEdIpNnHZf6xNhslkkZmA9SyvnCjzTAn1ZJztZ2e4DVox8tb2PjWmNMMuh1t/B9jvOuuuw466KBf//rXhQrZVlrPAb9lP2gMTUVSyN6ObAtluXYUKQOQtAgAIYTABOjoSHXppZf+xV4vVuJcYqd3QbPZykyX67jcg5rjUL/nDHWYLB0inbX9PO+880444YRVq1aVOx98A7BewXSopzWvWxYmAhCImSmEUE/EP332s//pn/7pZS97eYyR7PIx28WI0e8dZ2bJ94WFeFObLqT/LmGyX8fGxixTqj/qHcdxHMdxHMdx5iT9OF0MEUDK+DwmtiyDRCRo1cLSpVcWLq4sAV5p3yPS0gSX3ZQikjWu7MwsZa/JfJQ+ZF0HZfxvlvlEZM2q1YsOffcdd9xh3snyKqJrn0wToopstMSAsba3BZSRyEyaHI4iTV1pUgRiIv3oRRe9fp99JYpa/yOyVfNGMCDMbYTzcTI5dboo27lMRxCoev/73/+Riy5EVyrtyaxEBAjWWfyn1xSaqqLnrZWJKRupElRP1H+514s/94XP77bbbqL2KWt6k0ChMdM2x9bsaLpaxXGA3POBWNTXMpmSiKyOvBZPDO0GgxPRxMQE0rfAxj0BHMdxHMdxHMdxnEcaU0t4cE43nFSgrcDCbKKHjQ5FVU1jksbGZlsklc5Q0cxYzFV2zLTB3ehKS0StNbLnryxnoqt8ze1x6UworT3PaZ446qijvv2dbw/Wbs4CQfa95pa3i9KTiQe9meXWSjGiNMMysyLWdTz55JMPO/KoKGKOWw4B/S3Yvw3O1TiZ2bZ3YDOEHeTKlSvf/e53f+QjHylbdegBlA2+DvJJlXpobtvcMnaNGCS1HLDffv9wy8277rqrZtGyfefQHqqL/M6MoikNblLOW4G+fLb3enKesBDv8jHiOI7jOI7jOI7jzCFaX2M5txwqlopTI1MmslpSCiNlEB4RNZqIOSvTall7imk1dAPOWS1PIqIi9o5g8CTKAW2BDASxb+lM18A7i0+53RhkZZ0ZFGM89dRTr7/h/4yMjlqGRHQvNrp6IrIohsZ9mRcAADbXI5UymYgoNQW9897RZF4EkXKAqu6//1s+9KEPxRjzrkVFoN0qTm1RnamfPtanaE+jxlHurjCc6pIlSw466KBrPnf16PyRDdZDaYiZUguBplQ8G1OkkhI0XYvAEK3f9c53XXb5lVs/5jEgypkxiSiEoKo592u+gYbt1nE2FetjVQgjTYh3IG3Mv+XDqq+/Wz16AIAVyXEcx9lyKL/ZZ/qtp+M4juM4zlyBu/bJdk7pwUIr2oiJH0Rk07AxYyN9KKOdo42CpaoEsEgNiGo07VFEWlOkbTrtprP7/Gn/gBBKvQzTqivNYXreOqQxv0mBH/rQhz7+8Y8zs0VNDvX0dZQCpCtS+O/KvSCpZh1zpVWBKaRuNIo1iGh8vN57770vu+wyHqlsAUtOlzW4TTz93pwZHTnk3eXTjDH+/Oc/33fffW+55ZZtt90WnRyam9SB83VBkRK0PIxcvLuu5bjjjrv8yivnz58vIoKOxF96Yx1nprGeVtf1xMSEFtbs3n1B3SdJ7sxEtHzZA2vXriV1FcBxnC2F8jt0vQEQjuM4juM4znrJI8Q8Xbiy+rpKtrbY8oH6tVLyuDIvn5XRJjmlSLbskTklARR/14lqBMRclkTEVA34K32MOiXylTM/o0C5Cueef95FF10EwJSC9RoMKdXbVVXSXrkbUlWImsspJ7IsooU7HQsAIPMCB5Wn/8mTr7js01tvs62Cqek3TZi/GawsieJGnzW6nWQzKHHN7kQ1yg9+8IMDDjjgRz/6UQhhbGzMmjovNqDLd0iuVYZy6WdMq+RCUjklAhEFeydgjjOCQOMHPvC+8847j1gpAOBAVa/88WQZXR1n2rEngIjEGLVJQ9xPj4vuexE0WYmbnCOrV6+u6xrFWxDHcZxHlvLPDH80OY7jOI7jTA0p/pVzgG5ZAm2qkwQkySh9av/a0FJGU5ODQd3XxqxKllGy+R0dbaUtw9rTNdNqpZmzjRXXrv9rjkkqVvZ6E1XXda9uF++jH/3o6aefXtd1Gdm97q1luZoGsr+ZfJDn9Ep7U0pVmo1+bBVZRHbcYfvPXXvtk5/ylNIJaJJ0aZjduAbpOQrXfZrTSDaT3nzzzW9729t++ctfEtHY2NjatWtjjOXx5IPJQn5Jvs2IKJes6i1mH1r7h9DcrpkY9YwzzjjrrLPYEsmmsO7y3vGhlLM5sR4beKSqqrLbl/d7fvKXE/akIqLx8XGb9rdTjuNsIcyxv0Udx3Ecx3G2ELIeoo3pjXuxpGhUxNbawsTULZqiqYxwKUKyaZa9nQEoVVKLBkayVQKcP23EMYTuulNhMLJ9i2YT/9Itx/z54pnuqaqB+JrPXv2hD56mUVRkHXsa1MIGxayOqxYKamcmWdEqKhWxz5CKUUFHR0c+9alPveBFLxKQqpZlfIlCKS9u+p/+WcuYxlGEJl9oK8yLmnGSFDfecMMxxxxz3333mbZSOpB7VuR8YIMNrqrmIxYoCuuy7cxq3Be3Yp0zJwRGYJz74XPf//73RxFYlWQEUkDX1Qgu+jgzTaOqRzBXIkPSHpdvQXL3zq89Yoyel8BxnC0W/xp1HMdxHMeZGpPmoEwkpcWskametyrRoB2NSQlgSwampRaZpUlLdUikqpHLP9rKOt0mgqaVS42y1dceJWPRnGptWshaWL4YzHzTTTcdd9xxExMTUeJ6t1BuCkUFdnSlyeZXq2KTfjU5uVwdADOYmRREdM4557xh331UwSE7dUHMOagfm/aHfrnujPaf9pJRYyf+zGc+c9xxxy1ZsgSAqZNZfyyn889SZ0Qubt6tqJ4nynMp3wkACCHYnBjjueeee8opp6BQfGz9wePfbA3lONbPJyYmJiYm6rpOmRz6d4eqZkdw7+5Yu3bt2rVrsbHGasdxnBnF4xIcx3Ecx3E2mWxh7Az6OCWXLEeIzSgSnbIrebGcLgyAlQi2wWZl6cZElDmX5ml2QxRymsKmKE5xNFlo64limIva5bSfUR7eVxz+3+/9x9FHH7169eqo60ziXhghy6MaolKXdW+01S4psKqqKBFZFW+oMoNAASQSzz7zb48+5ti6jkQgIa5GkOy4uSdg0/Syme4n5eYaQVYB4BOfuvTMM89cvfrhGKNGwUC1H+3OKXX9cmv5LJo2VGvF9lUAAFHhELSOAMC2TalCOPvc84899lhBJPNONtqxlK8a2hOZW3eQs8WiqtmkL1ozw2qopfcZ1PMXo707Qn62jI2NxRgxDb5qx3Ecx3Ecx3Ec55HCVKnhL3dVlYhztkAAlEKr29EitQsDyiAVZWblTolm00mIIGKDSqprYYsynswZNzjfFi7LvJYj2EGxcm6w6WfUax/La8nMv/jFL971rnc98MADG+Q8ooJSLy73kg+byrSGRb9hUAghMM+rRiTGdy865NgTjhcohxEi4hCsb5TS28BJbWRrlIc3Q1jPZFCM8YILLjj99L9du3YcqViQCfmlTaynV+aNlEp/bvCGdBeUNwLSLGauqsrSTKrI2WeffeJJJyFJqIN5J9dxItPeOI6ToVTCu47j4+PjpVLfPiuSZTJ/X5QLlNZ7766O4ziO4ziO4zhzkp7hDE0eyPbTRjCB6kDsaVkeJ8eYSiGqAKhK+YlIWyfmsINQVZGaiJgrVSXSMvMl5qI0OV1QqpqSB/nMfO+99x586CG//b932SVczyaKz0tRshTIyguROgQzsxVnZ5BSE6SsImBiECuNj42/6U2v+9jFF2sIImBWEInWuVR3cVk7ajoV0vg6Lv0Mydb5lHvGrjyhUUTkwo+cf/55F47XE7VEqaOqgoaIKWWTDt0XM/ey7FHq/OUBEBFERWMIpBpHRkZJcfrfnnnC8SdJjLaRQbcykK7vQCP5PeXMJE0/rKrKjJC9Lo0ie3H5BWNl2lRVlQHUdT0xMQHVwQ7sOI7jOI7jOI7jzBJM7Rnqo+SitDeISJqSJ0zUiQYmEJgETaFvIZvVqjd1XRNRrgAuIkQaAlW2/uCIFMOUESLK8eFIdaIxIKO6pIJhTZoVLmPp0qVvfetbb7vtNmyU7WhQRB7UKG0il+IpJYYQiAkBVNcTT9vjKRdf8vGR+fMECiHLPikiqrFMPVmcF4aocpOc+OChTheDfS8L80REiolYn3/++edfcO74RAQggqwRo70NWo9wzxfWU4GHLCyC1KR2fa2FRSSEEAIBmBhfe/ZZHz7l1FNVhJhFNdvNNE3nhhuajNJxZhpVqIrloAzJOk0DBnmgf+PniRBCCAFEWO+LFsdxHMdxHMdxHGfWMDzoO6oQEXUtKqpKxKX9zuYgDRtjjCjyThayjIpIk8yylz7cxqQDKTAFkFKUzIoM2gLfbvhq6Gl2RViwqOr4+PgRRxzx/e9/f6hlb71tONnGs3yQ9TJFVEQwgbsaYmPqnNj1iTt94frrn7DLriIgZTQaH5g5hEDUUxvZRO5BWXCyXzdb4GcuFqSqUmuM8ZJLLjn3vHPGx2pVnZiYUKkbcZBg6Tjz8qXyOPRoy7NodV4FFy8BVFWgVsEKgIqMVHzOOWe995STRCbA2ngniwvU2QfT+l20jjPNiGoElJnHx8dXrVplNdTss959gW40d7lY+erFcRzHcRzHcRzHmc2UlbvbaQUrrIQyBwJDVSQLQKpKFEhBCgaVBVEAgKnRNIlMXUQhjJh8WZbt7gw7e4pMnmbmHANug9Iyi6VjlEN6k3RzAWgbzB9zzDFf/epX0Y3DH7r6ID2jXy/uMn8UY9RJAseriokoQIlx8cUXP/fPn29OSQ7B/FNEpEplffDesQ09wmyt7R0thikd04gdZzao2l4+9alPffCDHxwbH48qVrNbVZs2SQc26AUrjzkLiPkU8nybttYuryyAkZERZh4ZCSJy5plnnnLqqaoRA6n6rBsM3a/jbE7seRJjXLNmzcTEhPXSnlm4vFky+VEw9C2L4ziO4ziO4ziOM5dQqKKj/nUHg1zOJCKikGeauyuriNnymJVGAFV3d9zLgVcqOMmBWeXQ4STchHUKK4MC3PB6QHOJoXHHWb/78Ic/fNVVVzXXDMAGRkWWikBPGigDM8u9a/oUVlZaZISDSH3uuee+aZ83S2yDi1WVmKG2Yj+GGgOq6GRnPdP0zjS7U0lBwBe+cN373ve+8XoCIFXpi6qiin48ddaOe7sob4Feq5ojMh2JqKIKQaOMVDxvtLrwgguOOOKI8fHasvsxMyz1ArRJwOB6pPPI03RgZoyNjY2PjzOz6fiDvd1ukNL5m6f7dmDHcRzHcRzHcRxn7iBIWp4qiEjBCuVGkGny7AFQjQCptsojKWCp8IiFzF5W5W0CrapToWvByzsfJksRUSirJfTMca639OgpXACI6KqrrjrnnHM2xXCUbZKTbYS6CRPby0TN6kQ0PlEf9K53HH/iyaKdqklapBBICiBQeKm6J4j86WRXfzCAetrJlZpUNdbx61//+nve857VD68hIqV+rfGhcdyUanOXZ9FboJwo6x0BqKpKJF9rGR+P55334aOOOqqum6DyEELeqLWv5+pzthCISAREWPHgQ2vXrk3pilv1P4uSg37h9JwRkcai718HjuM4juM4juM4c5JyMKhQq3uDrB0lixsRqTZBriICUUYnejspKm2NENtmlZboSzONAprMkgBMLS2cMk0FHxu+FkYzL/XRYBfPkoAa3/rWt0466aS6rttlNnyzvVrSDBIoACVACjkSsAmbb6Wr7fLJRNzrxX9xySWXSOoQTGSrkl2+AZVhEssk1vFp76PpFSzKrVmnt3a+5Zv/uOjww1Y8tLJph3WmdcwqzGSqZTlRWimb+YFVNRCrKjgwARRHq5Ezzjj76KOPjiIcQuOyzM7k4rh7zTFJEW/HmUG0KXemqnr//fePjY3lLMXU2vK73zrp1zJbwsjISFVVGPZWxnEcx3Ecx3Ecx5kllDHQ3JtO1boFQGMHa1QmbQ2U2kSO1nXNVVBVkDnhWhNMGmYyQMw2wCQA3BNfUOSapG74cM8Hp5MY03xkiqINUbTbT37yk4MPPnjlypUYptZNfUjfG/+bBXJw79kRiaQsMHMgRpRddtn5mmuu2eqxjyEiWIkkIjNSdaUHLje4jjOd7Nc8Z9rtk0MdnTfeeOMhhxzy4IMP5mVKDWWyjZTLZPIyptdks2RKdNCmcc0KToxRajnttNNOPOmkvDXL6RklIl0LwM2TzpaFVcSyRxMmKWefPxq6wIT1cO/ZjuM4juM4juM4c5rBfIO5wAalWh3JIxlzcsgch2pbiDH2VEciqgAelG7MkJmFmlQVJ9f0IFM2RaxUdGekOqAEPbpyk5W5EbNApqpLly497LDD/vCHP+TFBlfs/F624rBRfysQZKNfKw8wUeNvNU+lqjKDFCBUVXXJJZc8eY+nqVU3AsQup22qqe+d99OvzF6GbA9edCoiQ/McbIj8ui5MkC+ao+niUZjo6zfffOyxxy5fvrxsn/KwJ9tq79istzOEiaOKiJDZVBupt9kSEZEoKUQkhFAxKXDyiaecfPIpEpW4ImXLNQloGLKfgcOYejs4znSQY7fjROSR8ODKFRO15NcqgzdyY8dG81QRqKVShWpVVeagdBzHcRzHcRzHceYQbUR1kqEC2gxgEZCchxBAjDGEYMNJNlkMUM0lncUGl7nKMdLwU0Q6ceD5MwxoUmV+sd6S654zV5lM8MpexTxHRMbHxxctWvSf//mfZrjbgN10BQJmLut0Zx9faRXMNaZt2pZhRhVCqEhifcopp7xxn31UpBGbU3i+DOigQw91sA+st1dML9nkaO1sUv0tt9xy2GGHZe/kelcv55Q6MlJGS4EKmmBVpjbppypCaNLw2V0XQhCpx8fr44897qyzzjKdd9odo44zE+Q3XRLjfffdx9xmdO0ZisvnTJ6f1czR0dGqqsh7veM4juM4juM4zhwlSzHoZgAbtK/ZkiJilaFVY7lW6ZrMg0oi6vvjMEx6M7Utb7o8uPxzmCIjw0p4zxEma7R8PURENYrURHTqqafecsstIQSAe204KQooIAoFJXudCWfggWSIRODG3CQiYI1a21UXEUAZAUCciAf8zVtPO+20XDeGw0hZ9B0bUtCmt2SOgJ7S2W0cBMukaTuyvJNE9N1b//3dhy1atmzZVI55mMkXQLnZ2kzIzf2jiCq5zcFs0k0j8JuDWHXxEYedc865UNaUqlXTZXv0qPbO7IKImKGq1Uhg5rvvvlsEdk/ZAj3tnohIwdnsK6pRIBqjjI6OWiUo0vQQUE9l4DiO4ziO4ziOM9vhNvsfGsXDfiEQhEibOZb6LkuQqkoUStdL0o2YKJinMomYjbzDpXjZRg13hads4yzdNOXPR61fLIuAA4bTZiKEcOGFF37605/OBYw2Wq5q27lo7Z5bs7k6RQnvEGikChwgE/E5z37mpZdcwlVlUmbpwsXGFt7Nq5QJN2eIsn8iHf/3vve9d77znffddx+mII+W/XYoWXNXNFdWBwLYcyFjO+WJ8fqgA9/58Ys+lu2xj2ZnsTO7sB6ugvHx8fvvv5+ozSTSe6+F9Igo04uk5w9ts/Vjtp6/dbkw0HlSOY7jOI7jOI7jOFs860nSmHPuKTTXyC4tXDaQbPwryUfJzGVYtqaC0mWUNxFVRKavVejKKD0ZKM8QaYNkid5K1TgAACAASURBVBRQs2FuxInNAWx8XhqOULQ4c3XjjTeec865yckoRKzDVOD17KWYtoSfeXdEjQQNLeyBCo1JCVVVjSzY+QmP++xV1yzc4XFQRfoETRn4YNvLOek2VFDTIvPmBq049e3no8o9WFV/+tOfHnTQQZbZc+pNOkUdkwiqABMKHxkBMWZzssa63veNb7r00k+OjIxomxI0qFeLcrZ47CtAVSFYs2bNfffdZ92890DTgWSUxQuxZnp0dLRZnpMRm/wecBzHcRzHcRzHmXVwGQydC9GgmSDKga0EIslxro3ZhRmpXkhUsXjfqFbUAwzLSiml68umq6rqe+jK6eyUKT/NyigGsh8+Cindi5qytmWn5K233nrssceOjY3ldsriWrmFXja39e60ZwMsHbOUUk/aRGAwMyuY6eMXX/qnz3+eqd22v55zdop7H3owPefgtHeJwQMTkTvuuOPAAw/87W9/a6e/cV1xslD9wTn5+trbAILUE/Gv9t778ssvX/CYxyi7FuPMSmKMRBgfH1+9erU5KDEsZ0V+PaADEGGb7RZW80bVcxo4juM4juM4juPMdcgKqBbBpu0wUDoaEYHK0WXWJXN8XpktsJ2L7sCyG9mquTS4arSy3VmvKY9yrouVZVbNzrRqRBEUSUS/+93vDj/88GXLlonUSVJsli5DhpuLgSa5pFJH9BwKFUlJWzclmtyjZolFOprRUKnifad+YJ+3vkUkgghsLj9mrsrj2Tj/Yz6Y3swN3c5UiDHGGK1w9u9///sD3/XOX/ziFxvkRR0CU84UGYgDcdGrO+labXGBxbRKjPK85zzr6quvWrjDQiBaPr+cX9QVGme2wMyArlix4qGHHgI6t3Pu+e27KCZNIiaYwJbFEgsXLuQQHqlTcBzHcRzHcRzHcaYPLkKiW+2LINQxV2q5DLW1brKLTgCxSgbNHCZBkyYx61pERBTqWjh77tp9pFrGrShTKprFfIt17UX/TXe7bNHE2OiS2Vtn81esWHHIIYf86le/ypJwbqgsYpbt2Yztu+kOW8m5EMiy5JwXQ5qyH83SihEO87iaGB9/4xte/4HTPijS5Cw1dTKvnn2HW/i1azo6s6ref9+SAw888Paf/pQCl59OZSO9n5pzFgxT580sma+UNhH9GmvZ4ym7X3vttbs88YkAdItvPccZSvZ0r1q1qq7rbLBH91Ez+BTKEzY9b948zP0XVI7jOI7jOI7jOI9eOnYWEJImlmZZmjxkXyQARauuIIV+m7Zj5OjtEAJPRVgpo49VzXzHwPq9flsImzhsLvRENs8pAKs9ZOqVtYnNjypR5fjjj//ud78bQihjusto6MFdEBGSxNnTi3vBy2RmWh4S1KzEAgKUA0aJKNZ7PuNP/u7vPsWBwNlJO2iSQjqw9VddH3o8611ro8md1fp9jHHlypWLFy/+j//4D4tSt2o22Z46RLrtbo2KGiCwm0rSr0yC/jWKMSpBqbmRIFGi7LTjdldcfvkzn/2n2r4ZYKC5m7x8sTNbyJWyli1btnbt2jw/y5FlyldVhSgkqZZqNbsJwIIFC9B9feU4juM4juM4juNs2cgUVCDuWdxg+okqg3JgLmzwSESkREl4EWW0TklVZRAprIh0qaLYkTS7KVXPUt0cHG32LH40LMJ3S2Mw8+MGURruer9m9ReF4ejss8++7rrrTJ0c1BCRLkzZzqpqpbezg0m7ilvPwWRzshxgHzVlkhREGOEgsd5ll50vu/wzO+y4o1JWHLi3nbKdptgaU7QrTgtUZOeMMdbjE8cff/zX/+HrIQRuEhpQ1nNzw/YuWf508BRKO2pOutq7ZETNLRSIqxDmzas+/rFLXrr3K5Id1XFmPQ888IAZhHuvnShldx00UZbfEdtttx26Dy64odJxHMdxHMdxHGduUcosyQFGAGen5IC62Pod84jSlsnRxnlrTQ7KMJA+rLtXwrCS3DFqoXduuUzLEfZCs8tfLTeiWVKvuOKKCy64AGARRBUdcOSl0X76lUCBiYiYzZ3U5AMNDCYKnLXFcrRvqrM5+5oNKjSKRiHSCkSQ7bdf+Nmrr/zzF76ots8jss2zf2qN44+HXuXBRtjMuoN1WRGpOJxxxhmf+9znQlU1VlNQo8cX7WPNlQ3DGGar7AvrTLm+RylxNvdbFEACMUNGCBdd+JH9/mZ/gAmBlEGhl52hzQzqOFswWXkE0X//93/XdY300qUUH/O7kPKbIz+UbObWW2+NgUwLW/5Xg+M4juM4juM4zqOYyVSg9TgrS09Y8xNtcjwA5qMUkKAtewNAoEoIxAxiE7aKas/NsLMTN15QDlN7fkDT4zaiATY/0xKKPmgbbGJ+i+3ffPPNJ5xwgpXtjjGiaKvuphrjna1YNr5201n2FIF8GGUtXRSyWlUxEwVGRXTmWWfs9bKXC0wBrbgKpVtwUxphM+sOdpoVh0984hMXXXQRmHLLlw7WXAcKXSdX1ijLxizbE5aJMn2Ut5ATIth9whCInnTSSUcceaQygRtFc/Mrto4zLVhXr+taRe6+++4Y41DTd/ncKJ8AVJiXs4Oyt+JmOAvHcRzHcRzHcRxns1HKUKVyZYHbNmC00SW63r7kuNTsQkOh5Khqo92EQKkUdUclTWJNtCrVKMRKIlKNInVadiqx67OVNNIWq2auqoAw5wyJkUh/9atfLVq0aM2q1aQQqQEpkxF2TZSwRJC9DJVKTTFuSauZQxADeScbkyCa6kiqtichIECl1kWHHXrw4UdEEVViIkuhiElyI25Rjr9S1MiKSSD+6le/+oEPfCDniIwqgo5oa0oiCj0lN2/ppkQ3iYFCwZb+s/0oH0neFFMVoxx51OGnn3GGKKAMUasA3lVs1+9CdZwth2yfX7p0ac8+jOJrBsWrkXzTlbfqtttui4H3H+6gdBzHcRzHcRzHmbWsK0K055YDADBREEEWugJxoBzVykSNy9KigTtxqxrbHJR5B710jXmXlAooGz2tB4WWNMdcM6WHNM8pZ1qjLV++/NBDD73nnnvKBQa3g2557jyn/TRVH6KuNS9LzqUbtOsfJCYKUIn658979mmnnQYQVSNExCGUktwWTi9E1NTJH/zgB0ccuXj1w2tKeyPQRLg3QfHJR0lFgGrW5su+XcqahFaLyepM6cpk5orDRD3xpn1e9+HzzqVqpKkr5OKLM5uxDm+5KdauXbtkyZJU8qsfx23PmfIu69momXmnnXZCd6bjOI7jOI7jOI4z96AiZLv4lUu/CzMDLCKqbTHVHITXqwttEyJS5byEWZdJ8qcNR82SZvsQE4UAxChWDzovyVw9IqPTQQFxeulu2VpDmNlU4XRV+Jhjjvv+979P6wv4bbQziw6WNpo4f5SL6mZdGdTEETeuQFWT1BRaVSwSCWAmAAHKors9cZfLPnPFttvtIFEl1U6iHNGcTJRbspAgIrnYPCnuu3/JokWL7r//fiISWNVuy+0JVUUSGRs5EtHK3WcTmDUbgNx7m59qrWApJsvsCawaRcwhy0yqIm/e53VXfvbqeQseo6qkDBakbK8NW36zOk4iP2Ss269cufLee++NMZYmyvJNTKlOGq3cDxkdHc0h3q5ROo7jOI7jOI7jzBIaRWvyBYZ81ChXFpBqY0auBMo9P5la/HEzliwHobnyQSFCMjN1NM6esy8zOIcLo99ky2w5mNRVlgfaiC2gq+waAEII559//he+8IVezOPQBmkuVVdULXXh7PjLH+Uoy1KKJaJALCIhBCKqqoqIRJSZzj333D2f97xIRETVyAgl3yvNBvGsDCkFICJr1qx517vedccvfh5CsAh3DMR054V7mxoql2R/JAfzQRIVqfTyMiEQBwRGXctee73wyiuv3GabbRQghC25qzvOVMjd3l4GrFq1asWKFWW2VpufvxryA7DnBGdmVWy99dY77LBDuf1ZYdZ2HMdxHMdxHMdxNg5FrujcxhZn/TELXGUivlIEKz/KM6vGdlYU404b6rspbY4lnVSlEEJyurU+SpEhxWRmGipCeidbYFoOKYuDuQWZq6997e/POussTLFAhOWXtOuX21sUXcuSqlrqSRnQBQBhtq20H8UYK0JUvOe44978N38josQVlHNBdzUjoaVZ3PSGSCe4Ua3aKvS9LZSSoojEGEMIp53+oW9/9zugIAoRBQjcmCeJCKJ5fSJLxMlEpIiWlrM5dSIlAcr8CWTV6VWFAHMdq0ZBRJNlT0lAKi943nOuveZzj912oSoxQuN+xUB5qG5LlPfYhjeR42wm7LGz7I8PrFz1kN1xTZZJpigR2nRgmw9LqoDG/Z2fSwsWLNhqq62gmm+Dybp9mZXCcRzHcRzHcRzHeUQxq9Z6fZQNSXljAKRt3jtRycO8RpkhFhVKa1FRz8AGkmaXKW1nItLx5fWms5WvF15eOi7LfaDrqSw30nO39dhEb2NevcyetnFbm4yeeojUDrfffvvixYvHx8enfLipRE45RKchx2zF19FtcKApDG7lccxWGUJgRT0hr3zlX535t2dDk35aVLtGtz71RrZCl01XGXpbSIas5oKGEM4777xPfOqT4JynoCIK0E7+0377iNV6AhGI+3spBXursWOB2kQKCBrHGDGDABHsuusuV1555W5PeSrAKhuQd9IlGGdWYE+De+65Z2xsrKqq8p0BMdstmW80dJ9++aMdd9xxwYIF690L/L5wHMdxHMdxHMeZTfTLaFORgDJHKufRIhHFGAFIiuzuqVI97c5KtuaZlamkKaCv8aDZvsxHmRXNtEtTkSQfXDrQoGr5/lotjIrI5XWccS/AdoPI63aG1jMzDM5x8qrKXC1duvSww9593333YKCm7SDmX2zaEGoeyfJSAVBrefP6qYI05wAFM7QGEAKrKrECiCKBmRWq8pQn7frJT36imlcpUfY9lY3THskjrBH0r3Wppud+SUTXX3/9WWed1Qjcsa3AoUxQJrtPmESVWkslcSgyeGpHUaSmUjcAARE1LsjYqKKqUBAFIhA0MHbccYerr756zz2fLTESVxQEJFMv0v1It7PjrIf8Vum+++4z+2T5oFBVSm+nGvtkSoDb69vbPuaxIyMjU9mj3xSO4ziO4ziO4zizir7dsJFQoMRk0XUEUVVzyxGREoJVyEG0NTQVXLEFQrCy3Z1qB5wtMGXsd+mFzPpoTrlY1twply/Fu952hi5vTJebL4tc07K13pbz9vMAnplXrFhxyCGH3HbbbeiV4R42AiciJqZJzn2yYHArUU1EKDJ+tkpBEpshumB09KMXf2z3P3kqtDW35iOfdu/kug57Y7djnTX3uu985ztHH320WVNFpDGOQphBotRUytFS4aUmNlx7B1aq9SjyV+aW0ZQNIe9dVefNG/3kJz/5ly9/uRA0FZJynLlHjPGXv/ylqtZ13fFLTpKzIjvi7UuBFNtvv30pbk42MRPPZ8dxHMdxHMdxHGdzYhKKpSUcTDFJRJSUx1IPzKoLkkWya4VUq+KNnsQzKLGlTXTChE3JAZRSpZ3eFga3U2pn5QmU5seNo2cYnEbKo40xMrNG1BP1ySefePPN/zBonJxMChRMKnEV7RBTwkgAhKgcGAA3btZmeVOA7WQDcS31ie89+XVvfFOMykxIsf/52KbLtdS7TJu42ayf2olYBWERiOhvfvNfhx566IMPPkiUS2wDNiVsxkhiAsAgqaOFZms0FzBrqnxuSTcta17KlGowp/j37PmF3STQEEIAn3Xm2W984z4iyqa8MGgw76TjzGayxH/nnXf2rO4ahySLNNXSHlHNdxKziuywww6qmp8IvS8UdL+WHMdxHMdxHMdxnC2JqYzU2myV1FRLAaPRqWyoKAATixCBVGuyhHpFWJ5Z7piZuYpRgKb+DQBuFJ5JrHCT+ftKB2Ym+85Kf986oCJ/2eDWNpqZsLllITXLcyJy7rnnXnXVVT0d0Ojl68wbyfZA+wCFfS8vkAOSm1DkVPzIfuaNMBovJ6tMTNSveMXLTn7vexUEIhWipEOXDFa43oimmK7L1NtaXdf5VxFZvnz5gQceeNddd5W7a9pHFeYQVlUR7WZUbV26zdkxulqJFpgemgUa5gpgK4Zej9eHHHLI0UcfE60OEUA86W3iOLMXVa2qamJi4t577y0zE6P7oqW0TJYz889dd92Vw7rk+3Jhx3Ecx3Ecx3EcZzairR7ZQWLMC1AChRJlapgWlbvNQVkuTEQVIDZta+UddF2QNryMzKH0S2oKrC4dm72jnbo7ctN9lDOH6Vk2ccONN5x3wbloro212KSxkHlmR8c0LXLA3phyKSoAAgFNlDcacx8xs0Sroq4BCtUn7rrTJz75yZH5CzQblNo8iW179iTLR7adi1BrBdriTao6Pl4vWrToRz/6UdvBbBWU/wkaYV4U2iSlFAWxNgWIAIVNqYJUiIIglpfAIsqRr4tIYCbVGOWVf/WKs8/+sDKhvVW4vUUcZw4hIg888MAf/vAHIGV0TXlyQQRpPMjE3OQWaZPwskBYwcBTn/pUFI74QQa/FxzHcRzHcRzHcZzZgxlZcmqvbg0YrkDEqkATbxejhhCS8CIitSWZzF6xPEgUMbWNYoxDrGGNW62YyFWVs+OsjB1ed+DeZIPSQTfNxg1feyLgRmxhKruoqspa9ic/+cl73/vesbGx3u6GxEKmiXJUn/XmcpnS2dfbFDMjWQI1mS6bwjiiiDjrrLP2eMYztChljkIB7J3FprfDJm7BKNX0LETaqX3gAx/42te+hqLvTUZW4lUhRfz8YBewUh/5+HuKfu7DKnWs6//x9D0+/elPb7twoa3rQanO3KaqqiVLlqxevTpL9kOfURlNkd0iEgKPjIww06677tp5vnWXX+8cx3Ecx3Ecx3EcZ8tHNaIZJ3KhyXS8hjYwDCFQEROMXMOg0MFijFbyO48lO2GwGSIyKSyLOKWaMy1Wx+kSE2fUlZOFMxGJMT6wdNkxR7/n/iX3Bm4seERqpaHzqHtQFlyH1tYXJZlyYRyFKlTqSGitfFbDHQAzouCAA/Z7x4EHysQEtQSAh7ZJr8cMPYx1M71NnfynbN00hOqyyy6/5JKLrT3b+uM9e+qwQyqtW22ENwBRbuKzYRNEhG6FnFi3d8g2C7b++MUX7/7UpyiBQ2BmO8JpPGvH2XKIMYrInXfeuWrVKlUlBSPdSqkUFewVWGy/e7KDkpTjhDxmq6133XkX+3ToV8l65ziO4ziO4ziO4zhbEqzaL0OdzF6qECUhZkEjZ4nUTdkatDWQba1SpyoMfJGoLVacFqMh4kvpt0TXR1kugG5KsjmJNVZMHHvssbfddltVNZWFrIh2L2y+5+gssZnakdD64m+7cO/XtHAIrKp1Lc94+p+cd+GFIFZuDqOnM67juvQ0gnIXm4ec587qDoUQ/v3fbz311FPz/CkW/C09X1nqLZsLraqeNtg901AxRFVqEj311FP/6pWvVCv3sdnbxHE2J/n5cOedd/ae+Ub58CnvqVzxhplBsmDBgm233Xbw6ec4juM4juM4sx3/+9Z5NDOJJFJqNY09rnWYFbpktoWVH+Xq3lnzyQkVAVRodNDB4zDx0QaopIjMobtAWyx84894i2TQYFhxOP/Cj3z5KzeFimKtRCHWMYSgxei9dKsOsSsSQEAudduU6u7keoMCVC5P5h60iroKJQKBQ1WxykUf+9jjn/CEqADR0AoVWTJYxwUaGgw+w7TF5qWpchPuu2/J4sWHP/TQivKoNpRmLU7+LyJmWE4CZhaQCqyaVBI0LVkBE1SjHnLIwSeefFJUmOA8iXFS3FDpzA0aCz3z3XffXWY/aJ4YTALlgWzCVNT1AkRVt99++wULFqhqdtw7juM4juM4juM4s53u+I6JpJkACKRK3HM3EpgYGlPCyk5SxOx0QVtnmwBUVSUiVh2H1y0GtYobKCudKLyTZerDOUDXhtqWg/jnf/7n888/H92Q7RxI38Y85oSGaaifR/VNgHGRcrEpldN1SjaDf0JZ5TxdQgTmAKrHJo466qj//epXC/o1u4modzkGJYPSaPlI+QQ1pSEIIaxdO7Z48eKf//znKI5/Q49qaCeMsdlU7JaUsrY1IZKhMcoL/+J/XnDBeTxSNc0+h7q04wzFboSxsbFf//rX5fuu5h4ssg/nJ0a+bVU15QrBzrvstM22j4H2hfu59L3gOI7jOI7jPDrxF/DOo5jBqNaOTZKsKHGqJq2qgThLZqW1pZzIMlq7myKXZWXK2rp9dulQJHst04CWmfuK2AwxhSOcNrIjEgCD7rnnnpNPPvmhhx6iYPH0JKoU2A6rZ5a0oXtzMZiyI6n5aS5LsovZFJtGoTpzCuOXGMkWUhVTMpVZwawv2esvzjzzTFHQ/8/em8dbUhRpw09k1rlL7yt0NzsIgrwIIo4g4vq54TIO6quOCig6LqioCA68AioyCO4i4IKio46OqCCO28ioyAjoMEBLA4IsTbPI0jQtt7d7TmXE90dkZmVVnXv6dvddzr194te/03Xr1MnKjIyMjHwyMoJImGAR3Jcg4vMfdWDX5CrZ4JNbJII/55yzL7/8sgo0udVCRcEVNRTl8V9hn88e7FODkxBIiGS3XXe66OKvz5m/QH/TJs9OQT33yR5NE1IV8eijj95zzz2pm70felIot9LGl8CA4LdMLFG+YOFCsrYycCZSXfeoRz3qUY961KMe9ahHPepRj8aU4vngdqdIiQELPfQbTuahWAYSETHH62oYSQBEVn1mgIhiCYAs9b/TQ8oBKipyh1dOlccX15ev40oTcB65frh70/Dw+9///ltuucVayygSDKWQcKS27orpp2dv+i4qfugbaEhEDBkREYYxsARNoQ7hwb6Bz33ucwMzZ7EIyJqMKiEARDjWonRms8tIefiTn/zkE5/4ROX06DYWm16kvqKp/GTGAiwsFvSZT35q3/32E2YBTPcxqkc9Gg9Sbb969eqhoaHoFx8VUQmsTEKEqCs9Q6y1zjlmzJ49V39CKDnwT0KTetSjHvWoRz3qUY961KMe9ahHY0kReSxuESwSr5TClVIILFJkmyY9mych9bTiWvFrXYGmgJUR0YPfDLAxIJKwTDWVmGJ5nuvJ8IiIlTEg1rzhMj7nvtPDyKPMoLLVL9Kc3bpKP+eT5/7oskuFwBDlVTyNXZyr1+zb+gz54JL6UDypHesfHJQCWBYOFEcU2JIx8F0F9ZEEjKBhyBDO+dQnDzzkqc654NPq0kzTRERkUXF6GgE2nRSikGleRFauXPnud797eHi4hM9Wa7v1ebTJv9GCrPaL9y5mEXGGxIh87GMf+4dXvcrluRTZz+tv5ORfj3o0HUi105///OehoSGvnQwJeU0VwUoK8Sj9fYiGeRWRzFgAO+ywA8Zod6FHPepRj3rUo2lJ6RTZmy571KOpQvWRO/rxu6XP96hHXUxGsUEkIs0czqUmznYi4tix93SE9YlSOIlHyeosmeBpikNq5ElDZAv4LL4vTX2T+qMp1paiSOlnjE0WAbzx4M14+2xWwMRvf/vb5557bqpfbJKOJlU46Q81v23qdkohHmV8mJIQkzGOpHZMzGTtf0JiBCKu1XRHH330ce94e97KC5SUovpr36K2anFy/Zu05s1m87jjjrv//vujpFVEbqxIxIEYIiRFNwlz3uS3/dNxJ518MpgNZWPlwtmjHnU/qW7J8/yGG27QXawYpzXqH5QVRdzmQhjCeZ4D2GWXXUA2BtitvGVimtOjHvWoRz3q0VSh3uTYox51G0lCbb/F6EZu6qQVPXLGtqpjSJ1b3aMeBSqdoq7cV/lJ8StKMuFo5MMCgQmIYnpuO2KMETfLNFeOvqAOWwXMiIj84VcRCa5paWhMUWBV4bvxxr+2vfwUK9QLZlamxIX6rTffcuo/n7Jx40Z/vBrqRMnwSooihii6YhcQgpteeFEsDWkm9ZCDAgGSc6xQZuGaagxEBAJjyJKBuP322etf/uVfXO5g1M1JRMQQgQQQPb1fad2Y8GrbKQW1VYKNMSeddNKVV14ZwHL/WDuIcOudFmNBJFCh1VdYA+dw0AFP+vjHPu6ETZG/yIPtAMpOlL3Qkz2aSuRjsI78QHSQvOuuu5rNpg5Jb36l5SgiyVVt6cFKAzCWLFkCQN32zeQrmx71qBtJujLQSo96NBpShZ9GeerRVlCqAerM7KmIHvVocmmkAZhu2KcuXCml4zcd3erV1M1Du5vr1qPupBCqEChLe5AlYwwxMzMDhrmALyMcGeH+4PpSYEHMTCTOsQc+9W5n+DyFmeIh6zhu0zywY9D68afUEzWik0rOufXr17/73e++74H727G+eq2UepjWAVAkDCQ92V1WeRHtTBloLRkBgWfPmPHliy5asGix4tApt+v7Ht2mbioetcaY888//8ILL0zTzNf9c8fu1QCEBOpBaQ0AXrJ44UUXXTR33jwJuYzSX00VGe5Rj7aOVOBXr1593333Rb/vypyB2kiU4GIfaebMwd122y0EqWj/lh71qEe9sTCulE7ZI03fvWm9A1WYU+FnanNOwNu3H0rXCz0V0aMebQt1UGJbUc4ofx69xpTGNQDdVlO9Ldutyu0q2lJpmaReY4ELEQWTu8FNOF5UwEck2GDMxZ16TQKwtogkSYHiK4rz5Bg5WGG6e6AugamjZuUnU2WWrTRN404yc57n1toTTzzxyqt+pzx1wj6yJAsJGOITbZdlywkzxIDiUWLRxOe6qgeBxZIhgeby9vlwPRudJIlijDHCQoAFZZbg5PTTTz/0Gc9oOSaTGcpCnETtu6IH0xP+lZ6edPI4ueC/f3fVqaeeitAFKlFRxEfantqGl0JEw4OKukpmwDmfOPsphxySCxhC2Hyyox71aAoRbcZ9MneuZYx56KGHHnvssTgMo8ZIVUfdHTt6Orea+ewZM3fccUe/1zKODepRj3rUoy2m3jJMabPOBxWbDfLh+AAAIABJREFUp60J1LaQbUQBOrxue6CR1lw96lGPto7augdtEaWIx5Y+v92qsh5tBW3ptt/4Sxe3+wdClO14zJeMyRSAijm7kSwkpXyIOwJuhSOeEFDKxeprkABrJv27M9qoRabuyhWzpu7K17UU649y7nJm7uvr+/znP//1r3/d3ykdeawG5SzdT5rvO0P/JfCw74wEBUhROYCJRFFRYygjY4xxjl/wgucff/zxTlgC3pxu2kwJhRhBjZUrVx5zzDFDQ0OR+WgHiKRM25b3xoKJYAhkRHI+9thj3/jGN4JhrbWmAZgK6t+jHk1LitFwdFTce++969at01CSqIViQDkvGxJ/c+ccCSywaNGiOXPmiHTjpnGPejTpJCK68Yke9DCelNoJqQZL7Yq2my7bCY1kR43Gd69ujFX8/raCn/W1w5aWMJ1oStjwPepRl9MY+rVg1N5tFU+g7hzLdWXbnfXc3mhLPSjHIwH16KgEpNanbx0FzrmYmFv/TJecioAh8UKj4F9Zd39EAD454mwji6yHUSOIUxfx1AFnSlDwW3TWWj0qLyLGZD/72S9OO+00EQH0H0QELDEQG1ILOEkKpHlv1L/S+1EmgqT3hRBz4DLECRsDa6PZ599lQMQCQDjfddedP3feedRoiPg4oFKcuKlzewtyXo+roKei4l/E0hpuvuWtx919z8rM2Og9StYoCkxE0FzbBL3Tdnthi2RMX05EJARAnDz/+c8595OfEliHmLC+Is9bnze8Rz3qZooSbkxGoJuWr3jkkUecc9W9lhEOd6crVb1etGhBX18fgO0qx/12vpzu0eiJiOIZlnSu6dF4U92A3nbPmulEaTI0pbpkdpbV1E2hsnDarJDXe2fUFZ/m1GNFj3q0LdTzNalT3V29AubEP7vziHo3UDcI1fiDbKbdv/hVUQ0kuVSi8MR8LSkoiZLpy3quOPqEhbQsArC1BMTT3wZIPDNR7oB6Z0QgDu1M7dTJsxs6ciSKdYvIrnNOQhjKW2+99fjjj9+wYUNoiO8EfTiAmEk/KUTI1Z3k6GpE0mYnHwl/Qi18EDcRGGPIiLXWkDDj9NPP2GPvvZ1Cedbq24NHRsA0t4rGVdArogKAmU888cTf/va3umCLQSdTppHytqxMK+VsaXt9CSTE2HmnJZ/97GdnzZ0nhgg2y/pjb26dI0CPejSFSMeCqqZWM//Tn/7UarWoHPu1DtlX9of9ilRyAQ444ICGByi3F+ppiR5tEVUEpgdAbAtJmUb5q7oem97EgeKdit2LdhZ73aofCb6szBFSI2xOT2rdeovhSD1UZRpTr2cnkrYdxKGQGWKMajS+NBrpasuQdFqMTJsqrZ5IGr/x231HvNtSyX8lANlanwKjVCRNKfpR1q3feCeuJQGkKXfSX2WAiU2uLETr9au71aQ+NVvV8ommdNfX54VwHuh97LHH3vWud9xzz91pvoh4wrtgNBcII0OUsSSAiIE/bw8RAkHP4RMJi5R2iQkC8bm4SZyvlZ41Z3EZWQK1WvLGN7zu9a97A5w/903GMMMYqyVFbG382bZNRCBh/s53/+0rF33VkoHAoTifriEgfb84dWkkQwa2yDUcRXnrNAWBM4MZM2acf/75++7/f5iZjIEIiBWY7qGTPZreJMHPBYBuUv3t8b/deOP10Sc/PjPSQjQ+oM9Ya4T5iU98IozBdnbEe6pMdj3qBupJy9jSKPkp27FfXgdAtrIiarsF1aHM+h3ls4Z+Gj2lCRK3j27SKXLE5WhlA3774Mn2Qr3enEjadm5HS3hKdNzWVXJKNG3aUyU/82ZpcmUyzbWttdb6e7+6QFKOQJiiN1oCwkapMUYBSUDICDskjmvOPzoaaCZdo8abIx0MrGzedhXFaFAVxrVarVNPPfWqq65Cx83MlPWSeFNGtNibXAloONJRmkre8Ch51hojYJfvt+/e53zikyazDCNcnNWvV2/rwLW2fTpWFCEPERHm5cuXv+9974usqBthEiKqRqs3PX+dThidxzMlpH9qsc7hw6f9v5f+/SscswLHZIxE/9XA/K6V2x71aFso3R1Vab/33nsfeOABHR36WXkY5Ygn6RarH5jAwkUL4Fwc7JWXTjPQf1wVZo961IF6Iqc0Guu8rSJKraZpz8yoq9M7ehH5ULLQagq8/kyHd6U/wejYK8lxwmnfHQBGHzio3nc9mrq0fcj2dKMOGzxdQltqbE9743yK0hTxoGzz9goOFsUppsRJwUqqndKL01zEeRC4keb4rka+bHud1mw0+6vxJPKkU71FhoyeyBYR54TIKqO/973vXXzxxZqTqM0eJrXxUyQiDSuZvkXv+IiT7ZBEEYEhIYhjEjBDhIqOARuBJTOzr/+TnzhnhyU7iiEhhhH4hN1CtPUpF9v+aoyFngVcuGKJyMaNG9/+9revWbNG2+6EI9iaoq5R4iv76hEQSTHlDnVO2U4k1gBO3viG155wwgkuz40tzpKTMWnSJ/T823s0NanDYK8sMhWNZ8by5TcNrVuPZM+jw5iKz6Q0ONDYfffdEfDN+s8nbDatq9nOD2xpgUqpFtrCCk5tqkMPlYl1rIzdUZYzwbb1+L1uJGS/TtubyI2SOo/T9E46bKnwJW9fyNb1+KQs+bb0penebdvP+Bi2UONttT1JtfMrbVciHZYnk77Ybgt/S7nyUwgPmFKV7Wqqj4UeVDTtabw7tK2t3lnrpt/25G2zVLFpOwPWXcjPMa9Su8mXAY55ulFeY1Y4Fr8iEmMikuNiUmgighS+mSIOMMzIUDMs2gJAih9t9hxH51XuxNNo4FQR+ctf/nLaaafleU5k0/toZzzFbz2XEwBYv9AVO5fvp6BnWlxAxPRbzVsknLfe+s53v+ilRzoIkSFAC4xAddtmVZg/KR0RRK1YdxHRhz70of+57n+0pZqnSUSMMZpYKeLlUaZT38l4/hSJ+yol7vclxgbXVBHRoAYEuJY75KkHfeozn7ZZpomLjLWxqulnV4luj3o0etosXq9DKc9zCnjiddddV3kGCUCfTi1IVvhxImB2M2fO3HXnXWCMZvGexOGz2Q2brVgzb2udpizVJ/E69DBOE80oi5qA3knnly193eh/0tnw7dFmaatZV4okPkY7K5PSj9v+0jGs9pZKfn26iX+mi5zUxhvp+W2r+NZQ2tjKdKkXj68buu+++5obNjUajXkL5u+4dEnDZhNfz62gceVnRUi6bc247bTZvd7N3pke1JkP06/fI42yXVvNn63mW4d1bl3Hbs+0RXzoQqaNU5Wi/CSIJKeHu+uoVzpFisjQ0OOXX3750qU7HXjggXfddcdBBx3U3z+oyb7TY3x6kWVZJqKJvS06iS8rdjaaqqP7ZF2X377+BAGIKM9zEecc2LmTT/7n+++/v8O4LWGKBKFwh4VAAgH5KJ8EEhYYSsGveLKywDrDah9wFLyTGpmxEGI57BmHfvgjZzCByKgVJyLGlHz96tQNDPd18BLM4vC9f//3C7/8JQTZLYDdxABta94BsNYyRCAR8UwgWpIagkxE6b61NSQiixbM/eJ5X1i4eAcRERhDxjvJkgldS+UO7lGPpgPFcaHbG8xsyZAxrXyYWW66aTnAgKnEoNCLNPwryj5H8cl5c+fOmDEDquUmtmk9Gj+asHkkzo8T+dJRUlsotgO1RSt6NEVpGi+eI6VtHKv2jr4QCTGR01XDSBBkRzyriO2oUatGeZJ626ne2KJugjzP3/Oe4y+55BJpiYjssGTH733ve4cffvjE1K1O49HdW0fdAC6PK01Wi7pKa23Wh6urQOq2Fajf3PbdytHYCenCtrI0HkNoctoPwy2i0YDFkyKlo3npGFasPocGyVH0qTj0Q2QAMsb7rKRnYVOER6EtIgLYWnPVVVcde+yxAwMzrLWLFs6//vrr+vv71RMTQJjHC+eAIoQiym5oEU0roz8jUgWa7DZxl+B8l/DXY7TnnXfez3/+cxrFOUdo02qRN1H2g6iAaOkazBOIpHTSnogySyICkVmzZp5zzjmz580FWfhN5s3Er9nsZDBOVMETw2cR+fWWW2454YQTYoTN+BgnwR/T30ZuRM9hEYmRIlNlnSrcdB9eH7GWDAGQPmvOPffcQ55+KAA9jJ8WJZhKsZB71KMtpfoYaTWbRPTII4+sXLlS03QhxJpUUj0Zkxik5lTUmRoXeY899pg9ezaSiMOTpYjG8NUdypnE1nUtbQtPqDxvTgptS/3rM1ePupkq5koH2rre7Db90Lk+HRar412NdOdsS2H9Do9ty+p9i+53flJEXJ7feuut//7d7zU3DQ+3mnmeb9iwbtasGVtXvW2nDuDvpFRmEt8+janL56C6+o2rv0kXyDoQmaIk6f36Z2yFWtF1nCFa12nhGHkgVFTimIAqowG5tueBORp0a1KkdDQvHcOK1YuiJP5ehHHiWerUuyX9rNvGzjnn3OWXXw5g48aNQ0ND9eFfQYFEJIsBECtVLA+SNjuco2xeNxCFJIMiohlsNR+6tY2rr7767HM+IRQPDvPmBykLKdpFMGREhKTw46ubAupfGcMy1jFmAMJMmekjy5Kf9M///NTDDnPOGZMh2VsOD7dBKmts30zGwDGhVJ356oHAAnW2FWxcv+k9J7x39ZpH4wP1n0c+xJvq7RW/FRETTnl7yeTi52XO6H0YQyQGxHDy9ne87ehjjhGQFmCTIzaaR33c2NOjHk0mVUB8HVkQWGuFcNddKx98+BEhg/ZuyP5CdxpilJA4V+mUsWzZMmMtqHBADrg/gPEaWhUFG/8cq6lnlOVs57saY8v2mg6fuEULtZlhqxUY6X5aQkpbKhsjPb+dy1hbqshJ5+uRBKkzV7eC7ammnVwajSxtlj8dOLAtsp0qjbikL0JQbVX5ZSt3Ky3ekd44mprEeTOeEGJm28guvPDCVsvplwyZOXP2ggWL2v58AsSmGyQzUldVZjxoi3QUapl8uwGz23bqoHXrF5M709XtydQq0PvpEdTKp4joGdVWq5XneavVQpLoQ7fz+/r6rLVZ1iakXvre+jXKJsrEMGH60VZzb9vmprEps7MOGVvBUPFHO3gnDdtdQeExAsAda8jMWdb32c9+9rv//n3b6MubLQCNRkMP9sUzeIYEEA51MMZkI7WwfnP0K7fRRKucGEp1fUyIzsy6fH7sscdOPPHEtWvXpiqj7TZC2meeM/U75RLi8l6SEip1i5Els8wYQcu1nvWsZ57wvvcJiMjGt4ztCnysqI14iDqTiohw7s4888wrr7wSI3MVtU2kiKoU16b4rVf6AMKp1Qia6LeanckYIw7i5MkHPOmMM85AqGfq2QoUmda7jbE92s4p1ft1S6Xt823NwfoqlJ0DYMmsWLGi1WoRkTGU5zmSQZrqNB0yaUzYtBp77703rAWPWIfxICpv8+jNeKftMyMpn7Yld3gjRlg8TBsgqbLrgyKeL6VQwuh52/aBegltlwHjQZ3hm/QzDUiCdhNTzGuHZIKOS834TN1CQHmsVd6IGtOmjXRtO6VdUBmPqY2nD490fLhtX6ey3faZtroF3WGbjaQPK9cV3RV/Fe+nbaxI40j6drOf9TpIOelnat3Fvht9+ZV+Gel6NM93kIfN8j82QVt32WWXfe1rX0vLNyEfY4XGVXIityvabCvmx7a/HU0dOsvDtKS0mfGiw9hMdVRlVMYCRz8KJqaNnWk0+gc17T25lDK8vnEyPDy8du3aRx555OGHH37ggQceeuihhx56aPXq1atXr167du3Q0NDGjRs3btw4PDys5wWdc9ZaIsqyrNFoDA4ODg4Ozps3b9asWQsXLtxxxx133HHHhQsXLl68eNGiRYsXL543b97s2bMbjUbFykoPz2KMgLYOze+GjtgKGs3oqM/ao9H/afkYYQ7d0pmrUuZmfzXSe0fJgZE41sGeT7V9iktG1aQX6Tze+V3W2q985StnnHHGpuYwEVlrncsffPDBDRs2LFyUMbNOVmmj9L2ZvhGw6RfbskjoEnVTp7ByIGYhEWvMWWed9cc//rEyndQZXVepANQjMj6QilHxjCGGGBAAliLFTZr5iAhEQsiIeN78Oeeee47t69d6CICaVukQZyfp4AlPRa2J0QkACMTO/fJX//mZz326Ptd2IJV4IvJnsVP/SuV2GDNExBCyRlx9X8saAhk3e+7c8y+4YN78BUJFiuHtxELq0ZSmiqyO8vnKPnzlWwSZ1yxV11/3v8w5EekqPp3/KB1lzESUWkjOOWMMCYiw2267gVmYTCMToeg0Ges95qMs1STikVMBtP4UsvcwkREpfaZJxqJJUVuIUqpw45NaPpEhihUgomqUljFs5sTQCCYpV7aNlIfBK99zKf1saxipgc7soimTLJJLvQMfFFpfhPCi+PaxNyfKppgDEGZMPaIFa22ohk7rzhgDiAoAkbadRThMcAgPFxESNHOUPqNtTMzNtBz91Jr4b0MJIoLw2ITP6V1D6TpWxIU/TeAtdOwHRnmJJZIgVFWJDfw3qWxXdEVdPkNNKJSvtdumdeNYsQWFVDutedSK8ZOIRKpm6khLuPiK9FsRAXzJUYaThUr6LtNOV6R2csHh4DGgxfpRwGpSilYDbd+in+HMDRD2rcO3StXn/d0gP/UyoxRJcTSqHuMyPaWk8wgZY5rN5kUXXfShD31It/0ihcykE0rK57DCpKjYE/2DRDZGXLJGEdNS9XrU8i7pOFKO1e3w+ggaYXrqakph/eBk5Ky1befNtp+Bz5WROOLzOtKTYRXZNZnzRdpr6TJZL1L4Y+LrltYh/UzrMzQ09OCDD95222233XbbnXfeuXLlynvvvffhhx9+/PHHW63WKNez7UnfIOGayIBmzJgxc/asnXfeeaely/bcc8/d99xjn3322WWnnZctWzYwMDA4OFgZm76kGnTVYRraLKs7P9DFg9GjKNHE0rs6j+hMxKy2qNafATgHa63abiExss4axTPpzN52rqyDmJWapd+mTns1+zPOyw4gZrX9dB6Pc2XxzMjze3G/svZJVz3hWpMVc+W3UasQGV3rAdAQBdbaaE2pZaWtSW3gsj0AEXaO16xZ86UvfemLX7xAnYudc+K8A+bjjz8eWCdEJExEZAwBgCERKbkca9XTVW666G21Wuqh1lleJKajmVSKXZIukPQrXWD/4he/uPDCCzVJtFJgdBuYMkzSJV2WCmsaha2indkVO/lKLKwZb5jZGBgicO5Y3vWudz3laYcwg8iSTztRhfwrOa9Tqk/w46pQIq9C9iH/Ns7lgQceeM973tNqbZlBFocQi0AE7TYGicjlzhijnpVp9Mksy0QELC2XG8YHT/zAoc88gp3T3oJnyFi0vEc96iZKtROC7kqVVernZa3dtGnTihUroqsXkvFljJ+WUmgSYWxS8KkUlv4se8Lee8NYFp4wb3mtxrXXXvv444/39fUBSOIr+wfSM+mAiaCGQmYIqjud9VIFnt4kojzPnXOtVmvTpk177rnngQceGKYJTpmDKQhTpi5mkVatWvXggw+qLo0cY+Y8ZxFHZEVcyqtURVfSKMXZoSJjzBzgS+/zPjw8vOeee+6+++6p8QfvkUSV/tpGij0LbzVmAO64445HHnkkBFct5CFeM+c6KefsRHxQF8X6I9iNMEHr/SiHStHSQOKXaozJsgww1pJzArD6XwwPDzebzac85Sm77rrrmLR6SpOOuN///vf333//smVLGo1Gs9msWGjKt9SKq5hqqtlQM1DT3ZfYj9ZalU99hQ1BZnTI6Bo1z3NmPvTQZ8yZM2dSBr6+9LHHHrvpppu0qlmWZVnmXKvZbDJzs9mMYqYPENlUa0UeqqwiGbMIs0Z0og/gSzHGYwAQJMOKQsy1QsESLOlYKGYo5jydYjSOsTFxI6SaZl0PUcYllvZI7DWULXbt64olr6+LEFLs63SNE3kSFVGoQrGBkUJscbpxrjU0tP7666//+c9/vnz58liC54CIulPVOzHVmemUPSYkItZmzeam2267bWhoSOU/vjc2Ia1Ayp90BMWVVKxzWvNEXXsxSJ9RrJaZBwYGDj74kDlz5kgNDE3n0PS9Y8WKiSHlw8qVK5cvX26t7e/v7+vLBgcHtYHKB+Vhqq9SvqUyHCfoeB1fpGNBr51z69evX7BgwWGHHZZlWTcwrdKPFeqSGqKsHFatWvW73/1uxYoVK1asuO222x5++OH169dXTJco6lFLxFGTFhsfRtkKstY6YQAGBEMeAGLZsGHDug3rH3roof/l6wCAQMYM9PWrc+UTnvCEgw8++PDDD999990XL14cvSzTJlTq2ZlGcmXo/JMxtMHGnEJfWCK644477r33XsVPUgtN5764IW2MYc7jta4R4gaeiNO1AxJF55yLeil2dLQNUj2mlP5Z0Y1xRaab31rzVKYAONeSIgAjh/sl98HUzokvjV/FC4oLt2DPcIiXms6DaTmpTRufFxE9l41kPtUZUMMXxDps2rRpaGjo7rvvvv3226+99tq7775beWutVbEP5kofEl2HZMiAyJAh5jx2baXLR7ijle4uYW2nCtN6esNCWeycW/f40POe97w/rbipIoKbJSIS3f6Q5A4BAEnB6CiIiZoWIiiKH6dnYwzENYyFuAOetP8vrvjV/EULRYhgPay/udw4E9YLbeUBQABSvZHKzGB57Wtf+8NLfxTvk/bFSEWHPSUd+wCEQOSjdsZRm/JW4+j5XxM51zLGiENmbGbAuTvs6U/76S9+1j9zNohAbCgDEJxZe9SjaU7pWFORZ4gm5jKglffc9fSnP3316jWGjBpM0ZZKzeKoG4UKzWZADZuJa82bN++Pf7x21913dyzGGNRmEGy7gor7zFHbgIabw4cfftiNN95oTAa1/CgmW9C2FGtXggUg8Auz1GJI5+94ESGJ9KYSM//9y1922WWXTRdftsJIimsnY8z7T/zA+eef398Y0HktLniESeD8p1pFgmDRBQ/66qoeknS+ThQcOKp39O3OudNPP/2MM86IHRd1fipCW2FY6+8AlHtNDSxve+V5/qrXvPpnP/vZQP+MyJDU6BQRMgIxIHa+5mJAOnagidwgIqJ80GsT5jIE2wDqyi/eZohLF4IVOIgROA+ssDjnPvKR0z/84Q9HQ3kkirzacs50O8V1l3PuyCNffMUVV2R9DQR+CpkI+3oDN/QFgrzBkF6LiF6bxMaIfRGXneT1YbGYSSVQ/GpWFY7Mnz//4ou/+ZznPCet89ZK6RZzRmv1yU9+8tRTT1X8i4j6BwcobKt4oDAZp/VrGNJFcirzqlQp+EQou+K4jryKM0J8QPmpc40nQ07EpIt8AQAXvF+jNohirP2IpI+g81ewCWO2w/itUuz3+IxRr8xgT1bKbMuT9L7WPy0HSE4LiSEguvRyORVG5Kde7LvvPldcccVOO+2yzT0/WtKdkkajsWLFiuc+99lr167VFRBKaxYmIiGDMC7iGFEbOy6/I8US6rxK+aN9oXXQb3N2M2fO/OlPLn/GM56h6y1jTAo0Ywpu8kVK+/3b3/72Mccco39mfY2KW08UEl0rIZHbKKsV3uqYQjKHxue1TIY7+OCD/+tXv1bwd4rycGwpMR5LxCH3wNq/rb315luuv/76G2644dZbb73rrrvWrFnTcrnyPxqWda/YcnESjYTS22vgPsK4S8dU1I3RIkpXu0gQqMHBwQULFuyxxx7777//IYcccuCBB+6zzz6zZ88mUp+7bWLNaGSmm+Uqrg4cu2OPPfa7//5vBgWThXSesgDIGpR1O1KTTwyIuTiJFdorhoykdzw3WIiskxwA+YzTCZIb5g6E9RcUjEPVHzPUQTVDsVsmTCC/25euy9I5MbW6U10R6xldBIBO86nKHlkT7/tyuNgO9JIJyYwt0C1rSLxU67fGmGazmef58PBwWnNtfp7nqvfmzpl1zTXX7Lvf/iKitlZ42PuRiEgWRw7KIjiSLPI4R4naOhqpPhTW2MYYgHRKyIw988wzb7rpJpvZVH2k9kT684rqiV/UVZIC9rEycX1FRMxijKUiG0+wBYlEnBV85CNnLFi8WETFsaoO2v45kb1Qf1fgrfcW0WWVJXPup8+99NJL6yq7/tvigRAPsrijxrHAsSOiKP1xnHDCEJ3+sywzJNxy8+fOPu+88wZnzRaQBJCih072aDukmAmKQEKi05P6U2Q2S2fcdAqIk4L3pkThYOicyywx87IlSxctWoSAjMSBWS9nTMjrE4KIrNuw0bHo1hoAGCJYnzwrzOtkhIggRkRCXi119C5dV+xIvR8BTQAIu3kQmTNnDrrbUBs1caqcFRQjImPM2rVrXc4bWhsA6BEkSGm69/wUKZm5I2n6lE/p80RFCQCA4eFhJO4AFe/UMScR8daaYGho6Kabluet1rrWulT4mWBhmXPWhaICE0YgArXn0q1KfQZeSkHkWIr2lnlFRAIhY3RuKtpI7CFyJiJ5/PHHtYabpakvkO0pNc9arRYzms0WJDCyrGHU+NYNFcADJW353/aaFHfzB5dMXDBUXgGAyFprnWv19/err2LdJXMCSDlzyy235HkuYXNleLglqsEKUyrVe9oMtL9OiZKbqgdSEmlzB4VsV8vX8Y7aexFK1gLbPtP2Ov6qvhc3Uh227Totk8KBu0Bt/BviakL/NMkRrgkgKQi33nrbo48+JiKlepba6BAA3BTEZxTu65XCdaxVgF3dmCmBlUH2VFsODQ1p5GuEpTUnQXvji6biDJtWWFFCFYDm8LB+DQB1Vb6Z8ZgEEyjzM3nGS+bf/va3uOM4Nk2aItRZWlJwR89t3HnXnb/5zW9+8YtfXHfddQ8+8Fc9dooQeE2PjJgwnVfAAVQARwEFx/xo/cauTzGd4qvgiBeRRwr4kXPOhBOTnOSJ1fdu2LBhw4YN991331VXXQWgv79/l112Ofjgg5/5zGc+85nP3HfffQetsELkAAAgAElEQVQHB+OZ3C2VgdGMu26WK786EIjIqvvudTn7zWP/tX5wtM08uF+fmxQrCHl4izlODHRRUPGgZCGy6vmmACVRAhoqShl0KVgMSLMroy2sBD1q7XFSiGh9yEgCjPipCGGzzRdVvl/Uf5Q6J+p/AogMiIjSjXYk4qHvVVn1c4Qk8L0Ji0cRkyCkzKxHlOJMOjAwoH6XKcZqrdWTFsrGrOzll7QiWXCmQ4XIpsuOLp9LQvWMCDE7zl0jy372059+5Stf0eMkOXNAvpWM8ir+PH6Rqp70C0mMpGScCyC60x5PysSTL8mnWGskl1f939cc+fKXg1lTYIfkuiOyt0t4LsH3VkTEsSH6/VVXffzjH0/229v7TpYGp0CjrxRzgA4PZocSZBwPnxpjCD6mjppJWZaRwAD9DfvRM87Y/8An67CG51WBTkp51dyjHk0/KlZ/SVxIRU+Y+X//+L/Dwy1rrBCES7ttxeQanJKcc4ABCGCBNBqWmVmw2267DQ4OOmGfGdwbBGN8SK3UKCIRrHnsb+vXbUQ6X7II8uIZqEla+PsHBeT0YWNM9OmOE6330zQCEROtBEAhUYgDsGzZzoBpp8/qPnrdScVBJBEROAXISieRyRTtE7VynEi50SNd1+HIkcA1rn4xMDCAYvtT9Dg5yjPg2OLdUNjd0MbhTRvWrYcAhkEEAVlDhHj0zoBADC8O4LAIpyQAix81ERapQC3laxHxu/eSE3lkPTPWOZYQmVqCd6dmMuwgY5RMndOPVDgVnQTKAzqxvfyiQ/9ITG3vI1A+9aLXxpj050gXLd5EKcmeDpD0+LNzTm3ucWn55kidEdauXYuw6CWicGwtpRKcUVx33lqQYrjpgqRkDCdR1MMtikUGj5Sw8CDEiO2F0i6fjiQiKT8T+zZeE5FqY0LorLJO8D9Uq9AkkFC5nCofRnedNl+qCjEpfwSyxkhkVwWiHQeicKaPaITzYZU2lgxyYTXBtYrsuVaArUTCcax5hFIt8cLwKIaiQPT4GAjxtCA8EpT4cIxV2yeLokDOnTtXKvq/nWCMpJcSqkGT9bEMH+zYtfIYHnEaMHP05BubjCmNFSusW+xiDDnnbr/99h//+NL/+I//uOmmm9Oz25G8TeR9GAEUHnYADEh9ZUAkehCSqBgE5SPecY1P4fw+4ilpeB2H4jhx2C3m4Ps/wpnxlIaHh++444477rjj+9//fqPR2GOPPY444oiXvvSlhx9+xA47LAo/GsEUDwBZoeE7g7zFj7qQig1FFjz66KOrV6/WLwLy49J0uBLnNAUKyS8D/AOS4BUFOinw0Yd9hmmo/vc6lsF6iMCBSKRwbFTDTh3IKeJGAp2+EDBuFPwnLxgUBUH3HalA4UAQkASUk1knRTVgQiv8/6p4iUhjPnqgtt18Soic8WtGD1sFhL0EBhKIiB0D8KH2FEMNwGVANiP/fGNiXAuENUiMOhLEz6jfcLQEskqokciseCeaZXXfyW4wi9sOrWhcSnAM0bONZO09d9194vs/0Boe9giigDUyp4qpajUhVgFIbI5KY+uGUfotM4gQz3HHXkkZa4wxJJLzTsuWfPyssxCPXRhTn8+6cMqJrXbOWTIgemzNmve+973r16+XcuYEfb4tmp+WVrlOtWfFSTg1c73DPIsx0mrmb3zT64477jiQFRiR3FqrB1v88+PEix71qFtJwh6yQi2c5zfeeGNGJmcnAanRuWukuSCERvZzgTUQYK+99iJjDMFPcO0s4852z1Y0REDNZvPRRx81lOlZ4/ozSACgqDQSLVQsU/0Wiv5EA0r4xVowFxA3JwFg1qxZ9TZOOfK61AjBxG3mKCHPetazLr74mxNQjXRqMCHFbVxUE5FilCm3x1aW4J3dZO7c2fPnz3/44Uf82gMkuQtHsSB6vjsJw6RHYtNlf7osGX0NEBYw3uPSO2KojSoAli5dGtdOnZs+1WWyAymfNfBWBw6X4DM/13vEsvJV/DMNq6dD3lqrAF9YIrZ1nyQROOeY81arNWPGDIy1ohsliYgClHHzG5tDHdtSW66WGi4gU4IOo0GbkgFFJCvqWF3OUZKRLLWoK+v5tuMoNfbiHSRb/hWepJZe3QrdaqrUoU5teZjOpxO8XAqCjd122w3JLlRamUqtdBlksyztpnoryh2hu56uXlrxc/II3cBA/4IFC3Qgp46TmKQRNLak9U8Dp8Q5Ih2VulXsQ4Js2+tCJ1qA58+fPzAwMPFi1pVkRDjPHRE99NAjP/3pT7/1rW/+z//8T7PZjE+kq0skvaYb9obULzKR+bJJDICdM2QY1QGVYotpjL90G7gCCyDu6XScsFJK7+d56y9/uf3222//2te+tmjRDs973vNe/epXP+95z1u4cH6H2JHjZFlNCkXmP/7446tWrULhsS4aNp2C618gEvJIYSwCha2leCN73aUZ95IFjoiQNRGX0AI0XpYxBlTUJ84+XooCRKgaoKhNsg+qsYPiizTUgDCTMcIhb1uxEURxKzGVpeLPgDCyYlJV7e0v0nqmGixyMlVoiphaY+K4SNsrgEkQ1upvE7M5z/2eirTb8NOf24985KOeY6GuqbBKDaysiPKkSzbV908cE4iMifqFOYcwMfLh5j/901uv/cO1BCHvkgsC9KiVBPcYhX79NcGY4kwJxX9UsJSqVQIRDKm3ji59FXD3FYSAIAbGAg2Scz/1yWc/57liLLPoWABBs8SmuWLrNKGTerttFCIScWCQMZLnZ5z24csvv5wAEAxM+33DLacogRLjPnhYQUgIAmEx4Az8tKcd9OWLvjZr7lwH78yiR/uL8V/rrB71aLpSZZGmIYdXrVp11llnDg0NZcYnpo6aTURStYbyYImIHRERyxve+PpDnvZ0jlHDYFJlRTpxFh6cW0Xl4apqoK+v4Vw+f+5ca8zqR1dToDaNF938jJ/wVYrLLV+8IfIe2Yb0Uu8a6GRszNMOedrfv+IVr33ta5cu3VGkPutNFb0iAmeIBGzI+P3OMu233/7r16+//vrrxu1AoklmUdlxxx2POOKIxYsXv+xlRz7pSfuFKRsAK9yhNdy2ma7eOyWfncxmBxxwwA03LH/4oYcLM1StTJJgvwmp/HjPx9HObJTaDSU2JJi+GoJJS43JXvziF73jHW9fsGABkR43NlNExsaSGKJb8oawYMHC4Y2bdlyy5J577kHd8qRUrJLbyXZLB0pWCAAgonlj1EDPYiZQIjXS6LDDDnvJS4489NDDXvziF2sgsLFr9BaQtXbVqlX33Xff7NmzfUCANk+ZKlNSoiCCyYgICzP/pSpzSaIV+8cCcEnlF0tacAgTjMRbv66xiz8NFcMzjJq4JCvuG2rby8ViCcV++GhkoLMGpxpMUC8zjvTSi0Ky9yU7Ln396/5x3vx5m3/ZGJFfFkIWL1o4NDS0ds1jQ+uGAlYCY2zoZd/70GwRZNix9UeUKDqJw+gp7WKzM4ApXBetlAFBerD/fk96x9vf+eznPHtwcFB1Gsor8/Qn48mYcSTV3lmW3XzzzatXr9YQbJVnKDpOdqL6mNU+qqHGZGbPmnXYYYd+9KMfe+IT9xYKIX1SmH5M2tZNJB5QAsJF8ImBJvRau/Zv3/jXb5508slnfOSMH/7oh/feu8rxZlK2+iFAXuZJl+IsjSxTBqZ4ov5AyqqsDutjc5uX7W1X/SqRgM0ojKiEiTZs2nDzzSsuueT73/rWv9588839/f3Llizt6+sLa4HqT1PLqnNNupVIBER+V7vRaCxdsuTAJx/YarUeeOABEaZ4Djr0EqLygYWQd88g8uuE0NmF5eZnQi1BQEQatTnwvJg7Pb4Do5qTEM/vq7QoK1M0zljjX0rQrN2IHRHnuNgvRGSMAGQoIuYUAFNdblEZRveGrNYhFUBT7dKiEUSWDIXtxohdIsz4apBqacxOAS9BwNwD9qJWgSEjLCrJxR4zEQhzZs8+9s1vXrx4h6jZiGAMBayYiKjIJhYpTj/MHK/rf3YXsQiHmjsWxxqeWf9k15JWS9at+/zpH5kHzAfmAwuAOcAsYHb41H9zgbnAnPA5K/ybA8wlzIH/Nyv5U0uYWb6eEYqdmRQyM35FmAEMAv/wkhe2NjzObti5FrsWu5ZwU6Ql4kJiqXbNLXfERPQLqyt6vSa5sJONm371wx8ubjTmBiZo6/q3/N9A7Xog+XMAGARmJBczgRmg2dYsGMz+62eXST7MnLdaw861nGtpsshxZ06PetQdxCE7myRD1jnnnJNWLs3Wz77/g3nGzA7jdGb4Nyv5VCU2GJTVYBh6M0BzMjvbmlmGrr7iV8Itlzdd3mTXaleV9hpjDJrmuLlpuLlp+Mwzz+xg4bU3Z8oLIU1AZ0xmrW00GlmWNRoN28hsI1M8YmBw5pe+/FVVIcy55rDuXMkuVjhOpMXSLD45Z85VT0ad2WoN33TT8he84Pmj5+qWkAGMHt9+/vOfv2rVKmZuNpvN5qaEt46lqTPg+DDThcJj83njxo3f/e5399tvPy8khmAIBLJGjT8PxBvS+ISjkbHisbqNn96hEq7R19f31a9+rdlsbtiwYcOGdRrlcByYMAWIRZxwzi0NOJs3W48//viTn/zkdkwv/lX4X1ER8WYaritdZ+iSxhhjDLLMqGbo72/09WV9fX2zZs0677zzNOxjUc9J6iAdO/fee+/atWvPOOOMEQ6bm0pkgNKqypCPi19ZbllD1qjMFww0ZDKrP4mr4jgiikKS30KXJdako6a6rAu5sItxVx4jFEBJ30BCLK0yEksvHRkCayMVm1uEp1Fxa/WHMclWRORGUs+nHHjQyrvunnjxcMKtVivP8/Xr199www1HHXVUqLDp6+uzjSzra2RZpmnrdfpTf/Y4Ojwnqc2ats7VkR547Wtfs2Hd+rzZWr9+SPWttBs1lWE1RYmZN23a9Ne//vWMM87ozJnS4CqLWy2aR+mO/qS/v/9jZ5519933NJtNEWHOc27F7Fgy9iZYt1DaLm1rnufM7Jzcffc9H/zgB5csWeKHtKFiaugooqmiqITATvsoVYmpqokjJVL6Z1WRJoWPWKskMFnb6hcFpjon6PNY83322eekk0667rrr8pxFpIb3jILb3vrtUlFiZrXl9E+V/zzP/+3f/m3p0qUIUxIMwRo0CA2yjcxklkxmbINMFo09HWT6cKH34vadNZ7VtioDMUmdn+msqVzEf2SNyWz8jBcw5N8e+rHap8m/tGSdOtN5Mwob2s2DiXi1MZO8uIJI96sC6YxgyejQMJn1NzNrMuv5aY0unbRuWV+jYbPMWJ1f9KZtFNxesmSHm2++STtL7fDwz+eKZGYfs4YZlXxqkcRHVPS5C7swi3esdrn+DIBzMcaAc7RaN13x6zce9aoNeVPjnepzlW0KAA4lhBuAJZCAw/3oAcLJm1S2GeAwkxBgk9LyJOKx/2ewZNell/7yP3fbax8hIyLGWimyrRsg1myyYpx1fK+P9MRoNjc8+NArX/Ti2267rYg7ED4FnnUU/qTkOpL+kMJb0140iYKWpLPIx62FAbUMTjz11A+e9v/EZiBiZptlwoVZOV33EnvUozqlmlCnbUMCJ2i2zjzpgxdecEEfAKABIAzGEAUacagJoNtoTBDACTEgBCbMmj37t1dfvfO++wjEOckajfBiUxSwzS7e5TFbOPSpqaQpSj/1qU+dcsopzm3xOb7KrOzjrIVjHSICloGBgUsuueQlL3lJeF6DCNtOdW531L1riCvXIoXtwpIDqtWNsbY5PPylL3/55JNPHh5ujXk9iOioo476zne+09eXea+Fql3BlXlnG2WpTKV5rbAfHA8PD7/r3e/8xje+6Z24fEA7AZWSSBQRhcqNSu+kf45GOH1wQ8gpp5xy1pkfRzgjRmSt7U5xmgjS6Ip63Wq1Gg3785///O//4ZUuZ5Q5SslhUgDFEeNAqaFYf1FFuqJ9L+KMMRptwBh87nOfe9vb3t5ZFMdUVjdPas1nWfad73znLW99c6vVAnfy8U2tZQku8D65UHBM8hIbsnvH5lA45JuugYOgFhqVmWOYLejp7/Cr+qDw9UHIRFOevCrVTv/0U1s4g6ZhGRCW0+ljsVZ1JoyGw+nDlSYQEYs/PVdiXbmeBx/0lB/84Ae77777xE8NpUQ0gs9+/jMnn3yyzphh8gNR6Vxh/ez8FpNHawnAsmXLbrzxxrlz5zYaDedaGnZp29vVzSTheO+3vvWtt771rXmex/vxmYpq2qLyiSjLsksuueQVr3hFjL0mwWWvslExXdc+QZ/oyJMVK1ZccMEFl1xyyaOPPkpEISBqKS1tZ6rousp1etaVQgJJLdZaG6Pp1V/U+e0VhVBRkp2rirJ+E3++liQk4/VnzJ1r9PX93SFPe81rXvPqo161bOedEsWro77TOZVYpW40a1PhVsdaQwAUr7zzzrtf9rKX/eXOv2jFxZAxhkWgp5iT7CPKEKMhnQpmonIkIZ0iAR9buRh6FQyQioMFLEwJ6h1nw9QWjW/UHhSBCfl3AB8kMp4kKHqwHrs5NEm9OEeyQmOfVm7Wezk1nKLM+zsEY0xqpOkpdG2qFYImCDJ+8s2MjT6RO++09De/+c0T9n4iMwf7X3WXidXLtFCNAJW2M60xwmlZ0XO1XSaslWqnTDfWghnDTfz1gUvOPvtJYNvI4jl4JxzDOms+FvayZ8ICKcboAlBkTUJ50IqIdgqRJhSACfxVuBmaxgjihKhhXZYNN8yDm9af/uHTdttrH5/sScNvqRBL4WmMruEzKqqKCOKQO+T8k/PPx+1/OdBmJDACJjCciLAU6KRSHI6Soo0BJNZdI58bJ6DASftV+fqaOBGx1jWyR1utg5/z7Ped+AEyGYgExmZGSq/tcMapRz2abhQXY3EDTYQpz7Fmzeo/3fS0gYEBFrA450i8XeXCXoIOlLCjIAKwwAEOImRahI2EXZ6w19LFi+BYjJ87uJzKNlZjzJvmFbsxeZ67PD/xAx/4z1/+8r9+/dvRLzWjHV8qVmdHXWyrQmc55ZQPHXnkkdESJRpVi7pnZuxIagQUf6vMWGOcc+xgjDn++OMfeeSRs846e1sXqzVatmzZF77whb6+TBcYaR3S6qWW0PhxtbD2jOnr6/vyl798++23//7qawQhJnqKO/jqtsFZKhZIm/LbwS6RdMDaRnbUUUfFJYe1pZyE2yHpxnmEnETkuc997r777nvzzbdUZvQKVysIVLFV2Q6mbLsmTBSFX++96EUvfutb35qW09YSnkgNENcMzrk3vOEN9//1vlNOOYVHXuXGOtcjpOvXvtiQCALQ472lxFbxV5V1cqySjhoJ4EEaCi0yvzpe2q2y0p6KgyJKAoLW8iULxLWJSpm+rjISN4sFtA0VlxYeLOHCUK+8RddvIzi3ji/FjnbCPpks8/ve974rr7zyxz/+SaxkKffrloNlm63DsmXLFi5cOJIar4zHKTJ7VqleecWz3vSmN914442f+9znRlIvdR3Smf8R3XjPe97z8pe/XEUrHUdpJPHpSpWxfNttt59zztmXXHLJ+vXrE1YYSTTSZsus4zWVaSINLikh1oEqhDzP48/rKiWdg7iWFlxqurqtpkJZYNIujkrJGBO3YFQM1Di3Wcac//7q3//+978/66yzXvrSlx599NFHHHGEMWb0YjI1hKo8H+29995f/epXX/SiFwy3WjCw1npQwKcs46gCExgHUu6/2NEiYsgwVTW8n2IC4FDhUoj5XkDAeifMLPpUTWACyuG/LL803K/FzUz7yIOyVZC9Pijib+NWJZLhUPl5yhMT0nOn9oCKlN7UTS8RkbDTmco/hbQ5lfLT5mSd/UHCL0u1pMQFunuIiLyRQOrvCFKPmOFhrHnsF5/57IwVf3pBf3+DjCV/dloXAJqCyYnAeLyZyMQVujHGBUxWA66J94wtGKILWgIcV6d5EREmYwwTchCD8r5s2Jp7Wpte/PqjX/nafxSXI8tEhIwJmGSCrJsYD3NSqCPiIIKWQ6v50K+vvO073z9y9rwG532GRIiZc255cDZlBRHZokUijqwhWPagMIyAOU80ArEPoSAMYRjPXjIAWsZIX99qK2sXLfrEJ89tDA6KIRYxRoQJIBMz0lL86FGPpj+VTRmnA8rmreG775p576pn9fUvYKcRFuNPGA4AE4QpakID0mNiDGoJOMtcf9+DDXvAM59h58xSbavvM5SVdwTGgMqFeY9yXYmKSF+j0Wq1DGXHvvm43/7mdy4grZ1N0brtmJoazms8MUR77LX72972tlZrOMuy8MBURydHmkcUlzYQOIGxDYL3ATn66KMvuOCCNWvWlh6P+9Vl2uxqP9ILX/jCZcuWiUjCsPb5qUdT2pZT+q6SV6zJrIF929vefvXV1xQh89I2pRNKWCoUX9bAGpRFrmL/oSjMly3iWq3h8HABhna3XI0XRc84PWWl8ef7+vr22muvm1fc0kbeCpxtxFVi25Vk5eH4lXavCBkjWWbf+c7jK8nlR+qX+vJynChWQ0TyPP+nt779mxf/66233hoPCJL6JlDi0GGECMxChlgkJsDxCx4BhSD3vpmpAFvDzFLOL4RkkVxiKZH3aklqK8yGCqM6/nAkaKCyMKtrGGNMyH9bXXTFmqSL+bTaHbiqD1ScLlUaJb6CxecU95ldhQxEHIwtlrwARIxBzNUwYRRfZ0OsYcqsiLzudf94+eU/CVUrr5FptJv5m9H2iZ584MG/Dq1fN2vGzLYrx3S9GoGAKafu6hWOGuaUU0655JJL7r//frSTuqo0GkLwiirl8kvnXINFixZ+8IMfhJ8jfJ7fysHkoiZj1MaJJwEEooossIh0n1j33x9++KHPfOYzX/va1x599LGaSt9M0Mnqu8odUVdH6TMVdZfOBSYk76r2QhlIGqkabVVf+Aqi6ZuDJpeAW/kg6wIkOz0ltWmQNSyRXbP2sW988xvf+s63/+6Qp73lLW959atfPXfuXC2NajEcVGUp1Jvq4S1i7PhSrS6hemSMIcGhhx568MGHXPOHawAAbKxxjpPkkNBA4zpJSeRr5GGYvUQEhhhC4hUkUYhU7hNsEsSftfd6jDkauH7Dz8+GggJl9rMuqlJhEMP7kp+6i5qEFmrPe6tS53FIaq+2tUVFJMQ9INGNvQKigab4SJlZsZc4yqCIzWx69h/lsaABcT18yXpcCxGjZOY8bwIsEn38q92ZxXpXzIVKk6rNC+ZLVyGVFALb+yTsLORaGB6+80eXLv/e93fP80V53jBkC4tfKDdMgBghhiFlgPJaFQ0HXqsF5CAms95qEe9X72FNgRBYFz+k6eoNdAe1lZO1LaLcmE2Q+5qbdlq69H0nnYS+frKGRYwpvJC6eYYuJEQcBMgd//m2H5zziV2HN+1kyDA1hPxxBp85XQCwkMARLHMuHPpGZckxkOtmPQolri9TeVZb2TjANCxgmJA7oUb/psysITdk8P6TP7j0Sfsis4Loz1WWzLGGTnrUo+6kOELjHACAiCwZiKy67vpZax7brdWan7cyY41HZ4gD4MJe7/nhY6Bnui0bajlqGrMeIJMdtP/+YIZNV48T10INCCjhGNoBBxzQaDTc8JbZo7VS/ewf+Xb44YfPnz8ffpqb/uojmiDKCmutODd//vwddtihClAmP0mNktT+rtnWJZRBE8t2CdUNnqc+9al9fY3h4Val2vWL+mRdMdQq5lOyfEqYE+KRA2Ant91226F/dxhGgYJNe1IbzDHbJKvGxo0bH3jggS0tqi6N1troi1eR20o3iUiey4IFcw466KDRm2eT0mszZ85ctmzZLbf82Rg9wWOiMUUB+HDinesrldTVVIHkkc8YViBX0WkoFF4X/qIqNdH1cxOqC10R0X3rYsmXDJ+2kEFapgR/EyTYWqW70zvRJxfJKEZNa7Ud2tVVuv8hiOIJMx+jSTnp/4+RHCePUmW19957q37bxgJH+eT999//05/+9HX/97W65urw5DRTd9r7ixcvfvKTn6wA5WafhxccEd0VEdGx64/Zea9kHHLIIUuXLlUpNsZM400sqjVNBM6xc+5LX/rSZz/72VWrVgKwNvOaoOxK1UF7pGqhrgHquEf6vCqQaDKlaqHDWe+6UkJZxaXvqihJeEPUJ7Wk2h6YRz9A0UsuLoGNMQw4kUwzyfT1ici11157zTXXnHPOOa973evefMxb9txzj7RRocwRT0d1v7ypAm7YbL/99rvmmmuMIeeYmD185bdn0EYjJXMgEliM4T0EXQA4q3OEIdFMxyAJp3HTUziRypJQ+gIRji9vDVbErJiLwwQqyY4TEcGo66LvuzTmCRAc6fTMblqmPxNQqqe+N073Mac5DMXgFRR9Ql1hIYiIgxAjxbViK/r7+20jQ3lsptfGmCycXimMlYrkEZGIE4FG4REpZWvtHirEiPVEHsM5NIdbf7rx11+6YMn6oTnO9QtnDOt9E70Tn/95NHGCSHCyWKWwhhcAw6VD+PrbyFP1xxQwEQnIu1uKYXIkkg30bbRmCPKG49+Z7borrEE4Vxj3RajNDF0NyDWelMREAFAgexz/EnGk7H109S8//4XW9TcutXZ2q2lImLmPVc15PF5/JcL+M+Qq9fwMgDp5n+Es9ggRaTUYADGZDK4pZB1TbgyL2QDzYL7h/zvu2IP+/hXIMogYE/1TADC8XwyLCGHznsI96tF0IUaIGsy5gB27lmkO37v8htnDwwMi/SzEOfk5j41IknZAYgkaspkhzqABS07WNlu5tTsuXQYy3sV8TAdWWeeU7kg4T+d3SGEbWT8RzRgYHJgxuHF406heQEmhlft+d9Crj1123tkQ5dxSD8ppTYUhCzVlyM9nWZbNnD2n6lMTris2OsorTCp7xKQ2WR0cmTyqR7qUBQvm9Q8ODDdbFaCq7eol5YAe55Tk5GznNZJSJZjif//3fx/zpqOJSE8CjQyawYAAACAASURBVGljpx4ZY8A+fDdZw4JbbvnzLStuhaBzMtzOK1JFqdKASunB4UoVNBnoDjvsMGvWLIxObidetlUO8zxvNBr6p7UQYcdsrYXa8MZy2Z2wAtEC0IWNEc2MCwBGwjY8ShyTxOstrYZAhGCp8CTy5RvdbA7+JgGALrKvcDFk6ot5qR9Ij70soaiwqEt7v9KnIkICA2K0KYqCj2Sc+yh6tBGEYISC+4P304DRBa+LkaDUyZbhN9LaVmOCqegjwcKFCwcHB4ebrTYDaEzr6Ptd8JlPffrVrzyq0WiMtI5JJ47pRMqBJUuWdAB00nOXSkSWCAxXQBtMfnlohVj23+//eCCgjMeNc2smnFTDJMxRb60rfv2rj370o3/4wx+o8BtlEa7/3usW1RE1qnCv0AA+yFgnH2GvcJKf13HM9EXp/bbPIDi9qz1QApIAiMAUUeZY2FhDSb8zs1EoweVkC9zHwxcAgAieEpFtZER0110rP/7xf/nCF77wqle96vjjjz/44IOJyDlnLQFe2f7mN7+59dabjznmzTNnzkR3GW9lKtWoSKc2e/ZsqCgVBwIUhagJDPt5CqGBfn4kb2yI53K5K72UFmsH1qNeAZqMEhWXMCiCh5T3vPUZg5AyHHqyVphtlkV3k+CJCa0bUhtbp9Z4x4AhBoV7tdYtRFFX92uASA8MxV1BNZBQBmF9p7OQ4mOS6G0WCZCPzu8sYtT3Fn62hYZV9Ofg4JghRoSEyEDqgwh16xxlyUvxWgSUtNKnkzvvxjrEtvnxI4BjPPjQTy+8gFfevdi5GcwNkQYjgzRErHPWuYxZ/zUc9wsGWPqY+5gbIv2ChvP3+1gGnPSzDLAMsAwKBoUH2Pk/nRsUnsEYYJkpMgOYyejPeYB5MHczHAYgmWsNNjIiWrNp/V6HHvqkl70UmRUyormlvG2mXdzGRJ5ohtZIscZkTALr1t1++Y9vuvSyPYyZnTf7XNO2mn3sGi7vY9dwTjnZx9zHrl+kX3gAGBDuE+4TDDAPigyKzCQ7A2ZQZCbRDHYzAP03wKzPDEg+wNxoNbNmM2sOm1azIZK75qObNuyw/5Ne+I53YMYgGxJjvaTWtH83KtMe9WgcKAh/MQUSEUBGgDVr/nrrn+cTDQpnIg2BFRh2RjgDZYyM2QqbPFfd2HAuY0etpsnzRu5Ms4XcMVz/rBlLd9sNjT6MIjzIGLSo3LS0qfFyPBz5+/r6os2a3u+G+W5cScNUR/usr69vpCdTpAMVky7MxUpIrIhuJiICzIwZM+bMmYOayKXmUAyXE0nTEaaITEV4UqSy9tL4B6688sp1Q0PosuMpk0JBikAEMsZkliFf/OIXN27cmD5Wl6sIY6UiGm9KyPUZ47WnJ3nrREQiWLBgQX9//xi2bsxJRU4Byrg0jSuNePZQksSs8Yd6IUmsTz3KLTFlighE2DlhjklU4u5yW26na37/VYLvay/4a2ZxJSCvAr5I8sO0vfFOBV+uPJkOJdaGoVh0xSFcrIsCr5C0qyxCWoH2HZHwmdPqTTppQwb7B2bMmDG2ZbalmP71uuuuO/vss9H5VPg0oigwRMTMAwMDqE2X8TqF+OOwQjLR6KfPFAwrIgsXLqQyTjQ9Jou6eKQAHBHdddddr3/961/5yldee+21elpOSRVdWP9RjK7o1UjAiSIhqrhEt1SUTEWnpXqJ2mXcQmIPoKbB0sRTqbYp6UxIjK0hwSHOPxMe03IqO6ASTvlo27VuzJyIlkmj+UXtpM+vW7fu4osvfsYznnHUUUddccUVzjnAMHOr1Xr/+9//whe+8D3vOeGNb3zj1VdfvXZt+8M0XUtEtGDBgsiEoNSVqwBAesa7DBwrc6rzowSnyCgqcR5E4fBI4SI1EbWcSgxH1CZKABotxHvcxxmn/Hy0qFNhaz85hk3EQjLDpFbMd1W3WS9CUYqiUkrHCyXAJeel42siEqOy6h01t5AoxsgZSjYdJWzzx9ncAKbwc2sHTaZ3KtNtZYBNIoU6MBQvZkHOGFp3148uu+eXVyxgHhRu+GADYFDln5C6QLMTYQ3EFjZXhYq82/5dwiSsYp1eQ9hAwAx2JJIZZJAGGQMigbVWrFlvgUWLjnrve7FwIYL/piYBNCYr89NMCi6peHc4wx4SoYWIkEQEsLSaWL8ef/7LL754wY6t5rx8OMtb4hgsamXqcAuuWF4FmAA1GMCSWCIDECTloQGsSAYhRf0hBmJBFpSFPW1rrTOysYHW/DlvOP107LYHyJIYYUpyoCOqY4GRChA/xvvEPepRF1LIOWgMHKOV/+32Ox69884Z7KxofGinI5QAAhNpeAuvd2wYv2r2hSIpb5iFu+yE+QuggbeI/Q5ZnbZqmFG6DyrFzUCMsj4WQqO/rwOINtpaSeV/GGvJGIQguKMtf/qQj0+SGQtpAy96byGiNOyyJPBcqayYooSA5MBBt5GIQJBlff39gxgZjPa2EKESvNwbmlTN56g0kqUk6uhhCARj7MqVq377m99BvFvN9jxbJUYzIMLMf/jDH37wox+inbGa/iqaUpXVZvoAlaO2jWzHelUzMDDQDbbuZshQ30C/akgKHjQAREgxOVEdb2zKpbSAENQOMLpCQkBGkn/Bu0ePZldW+ChrgLiOIkF0nEwXZnq/Upl0XVetYah5dXgais6YVPalSBEfUk80LTM6yyS/VRwWhgR++cQQhnhfSCMAU4jLUBy9Uhy9/OqkDqawqxHfM9EjWxeojUZjcHBmEd/MK/OtXHHUtb3yk6x36CKiRqNx9jmfuPSyS6fACBpbEhgyCgdXdFGhfKwpnObEhMQSfs3PDoYyEAs0ICBlWaabEGlpU5qkjJhEQCTcJxFqNvPTT//I3x36tEt//KO86Rq2z6NvhoR08V6k2AagoK4BxX/1aSJepHuoxmgc0BHBjVQ1oYwTRaon14pBHlI7Qd3Vi2KLQnVtDDIwJnre+ahyRMLEYtREZzEiRoKGgY92qLkxCk80BuepomZPuUoaEbVarcsuu+yFL3zh05/+9NNOO+3iiy8+8sgjv/CFLygidvnllx9xxBFHH330hg0btq6XJ5iiOTowMFDAc4gYoz/rrf7+lOL7OjzhAQwKSF8slYi8XUYa3S/ICRFYwKLzZtqfKoEMia6U8atCfjTFMAhSjn0sMCgZmU44pEsJ02VomBetiDkmh3u8XRpm22gd+VmejL5FRDQGJQXbvuJhkA4cZqbgBGr8qbriK4nobYhz7bnKyndpNpttO46IACaSNofXJMFTK3ZGvNNt2zUlBScOeY7h4U1/WnHlN/91/vr1s9k1BLYI9KRRPYqfc0gfH1QF0G53VIXKUBtNRwhHjiiEUNVCDEFYvViHM/OAtA5+xcvmPf3vkPWBDOmZEcoUCaQAvU8iaS9X+rdwxWKBY8odhoZ+fdHX3d33LMls//AwCQsJ+Tic4RxcsniDOqWTKR9nE1MOEEt6NhywUAGGkBhN3EEkzDBGDK0zdC+3nv2m1y044gg0+oJVTESWOYchY6b9qcwe9WhEKmwjFjCj1YTL7715Ba1fN8jUgNFVd2E/oTRnikiYmvTALxFZssghf3PuyU/cG/PmgkY04Ma0JSV4svyVn0SzLBvbaign9DhMnA2jfTCGL5oS1B4LCMTMMfwNJW4FEoI4p5n+AOixynjUqNuIiCCw1sbMSFI+ph2nwgKLCQHFSyyqJcOpFEXk50oNreCNaWNEJG+1vvGv33z5y1++HQpbW4raLDP205/+9MaNG0P4XKkLZ9pZdc4XrC6vKjsv8tN15ji0byzJGBNFN57mLjRYPARd5pKG8Pd/kr8b73QYraqeqx2ReHyUFmmJZ0RqsVd+HuscA0TEh1F23EC5u2Od05uVhUxpURf4kN5RiCIZ3QVn4JdF6pMiHthTq9iEJ0lzI3jPFOcciUAkxupKaeLFKZr3MW6JSNvNlC2gmJs4dpAuho0xJNrdMMa0Wq3jjjtujz12O+igg7axFVOOUjwRgWPRu00lJ4AUVphB3u/JL8SI4wFMIhIWZlZp736NNBpKgY90PIbZFr/73VUnnHDC8uXLbcPE+/pMdOIGEDNlxaIkieNRyRGcvnok/+v6vNB2pqjbCfXHUtMo/WVaDQkhJpLXJUCEiRmmC1e+WE5qqaZ6ONWEUjsrEJR96Znly5ffeOOfooNRLNAYc8cdd6jbe/cLXl2cAESIxV8QitWPjr/g4eSPaSesieCM6Oa0BP2fdFJlekqrAQAUM9uUuib+0F8n6LaCQiKah60wXQqZL0tUZVzEm35DvfZtfIuPtVIIVLCU2g0HCvarSXB851waarli+upNtSWstXmeW2sbjYb3KqvZbHpdinJd+a4yxrRoxT9H4kulJZ3NvjEiDmE0tcMYnKM5jDVr/uvrF2284855zP0iMemVE9F/uinKEAfxjpMIO8xEQql/pbdE9L4TSAjZbolsTc70//+fvXePs6yo7sW/a9U+3TPDzDDA8L7IQ/ABBKPEayQJUaMxAmrEaGJ8oAkSEt8m0fzQ5CbXGDXGqJHkgqKCwRfeXDHRiBqMohEDPhCUl6i85OEAA/NguvvsqvX7Y1XVXrv2Pmd6Zrp7eoZen6E5Z5+9a1etWrVetWotgMGa7hLiqK6q+8TTw4848fTfx6ACsZcAcpC2q5doZETSPEAxQXnWQu0R0v5MAiCEegYzU9i85Y7/vOw7//L/DgEmh0Mtih7i/gASYiFpH0CvIJWGBFJYdQTNHqLYbTpDBGawIDsxiTk4mnFYB7/2l3/pf77ilWBWxmJXRbvoWzsma8SVJViC3QOskaCy1vshxGPzph9f9d1J7weE1uYMgMRDdZmnpahbMcZcFJlhN5yYOOhRj4Zj6bbSam8ulllPC9z8YyLHOQ609dzWlKfxXdNffV0TQjbkskJAbYa/m0ITozoc2loKTZSNRAWYcsm/qNIRclwhmdMldtNLCIsKg0mhb8oXNtmaAGhinZQiSprt9Ebha4H1ChHy7rH+JccxXMs5IRFuoiGIBA6DieoLX/j8t79zZVzLu7m0sqdTeiCbRsz8xS9+8XOf+5wWRA4I5DjHEbABMuEqsJgfa0COgW5Ts3mqq0LPN4iI+KCBfKqwAUEo+KT2AkIIzEDwnKI8RCNIcviD2e+NoRO2DLRjdamrcMlgEasRGRFiJF3jBcAIH4FprLVe7AC7HLh1g65fphim3eQrbswtfSQHesQCrERaybElOEIM+SyKosaXsvHkstpXDsIszIiFTXXMWn61e4x354KIbyohRMeOHh6bFbdpe5Sag5BVVekadMQkUHmh5vHATTyw/v6XvexlmzdvxuJAwkKASkMxX008b5Y7+QZ2MfUfoLvLIvDZ8g8EUCAS74ca4Rslchifj3fXgwDJaRbe8pb//RsnPf3qq68aDJxajnUYBnho4sXEx9AKupQivUxzhkOtUcOXrK8HW6NM6oRnWcYy6qnuT8peKe2vZ1lv+6PSDABVJCwUiOGIVPEFBVHXP4MolbUM8EIhCU0wcgqOIJIciyEm4c3830LS3LLV33QphPBHf/RHe+yxR8vpttggsTMkQVMHD8oRkRydOUJt3aoJLIQZtfofDYWkqtvEduMK+VgAkgBi4spp8soYKkvG72GsCTQGGUFSDKY5chobNBDnziQhyQPOH6kV+JmGYyDTWO5wJA9usjOXMjG5JuPFEG8LEN2Rglkg9jw4ks9HM37o1gsTVVUFBPG1bT+tLwa6+T4LL6lRLOyv9oodrVUIuhiZZwhEBD0MP6xv/td/ve4LX1wL2UNk0MGyGKVYR2tNdNXmormeNLj2toZ4AQBd8QA0j2+ulqOWiRcRQnAkE4PNFd0l/hkvPwNHHIFqIAR2cVet2FpZGAPYzjjSwO10Z9pKTD8EPyQEeI877vjsP/2fNQ9u2Utk4H32YUYcGnwWqmSvyt619USaf+mrBHBgnnGDeyDTa/f53T/7M6xdi2oAXWOJs2RNdGHQuARLsKig4NIhDB0DIeCnd/zke9+bFLCE7IWxoPI183wvJCGWqyOiofceMg2/ZTC53xEPBzUx/wvL5FuQk6x1VcYdadacQ0xpIvrs5N0VRNTsaQUXdCeactk+y9j1ns6mHTMXMUSLyqJqDU2krmvNcljMu6AdgCBpvB33SvFs/okrp8IJzMRCVXSoOeeocpIOfG3evOV9Z5/d7cBDEJJ9Jd7LX73lf4dQR0wmdpWdksoH7JXiVF3WcOw0jedgxU8tJ/vYqdlZE6e56pDccPo3Db8xqZhL7Ug0JVkmaREA3nsiIlCQYHGYkSYmJCf/lM11q/uRcRHadvKvvcGV+nipvXf8m3mim8NoejCyrRDanufjexlvyF5RH0ha+cLQ3qCCeXfmeLmdYrD6t67r7D3ZKeLDTrdNrzZ7oD7QGrB50cGEB+YX5dmZnJy86qqrX/va1z4U2FrB/4GevB9lPH5f8jTFs482vAbuQo9GNoS0WygkhSEswL333vuc5zznf/3VX87MzFSpSEjQql8AjIHZxZjNA2uNWWoHeVGK1M4KcO5P9zP1BSH2Qp7Q3kZit0PksbllJibq2X0RDZjtNEIE7wMAZrZx7mlcxZ5cbDOPoou6BvkdV5eIHHvssX/4h39Y4Hwxg52vOK5WvG0ZBxrpxAgmbSVf16+974pUkbwQyJvcba+aJL+GFH/TqereLtlEW6UXxRKzkVlWIW9ILn9oT3GDJYrOfRhSydho+uCDleD2hsz885pqPZheHUKYnp72dQ0Tg9/CpLZgs9XY7toZYq7Um09E0a+ZtyM6Wk7v5zmD9k6R0XgEgK9rgDC1xV9/3Zc/9OG1GzetCn4CgQRscpbl/dXu3r29kt1tAfB2Ex7xML/GV3pBAIhJiIU4OcsDEIKEYfA+4EHIz1gO/5VffsSznoXBMpADGndAkacGHU9xHuwcI9O0nN+oi4GZiVnzFjGISauNs8wMsXHTNf/30+u/c9W+jEk/QxK9t00mshjRChByaGosAZ4XPulZP3273g0ie2fW/VIoK1HNvNG52wYTv37mmZPHH49qspHuIilWhbXcPHYFBroESzDXENdQCIEZ7Nz09DSmp9f/5JYHbvvpCkYVi6lR3pezaz8DEAIFIWVkAFNw5NktX7vXPoceoinM0gJGx9fUMuNNm3MMIgJwVU1sw0pnAm0lr5/G9wUPUNyMfkhxkqR2tHSLTBVxIxCA0ST0Kd37zXGI+ggZB0GjQwcTxDQW5k/qFa8Q0ZyqgKpfPob7S/sf0r46pT3k3EhD5LoHnm5gxKyUGq+QT+2phNNmg0hIkYC1hMFkdfHFF1933XXjC4nuFlBmvsvTUSiT//a5f7388suZWTgr8TFzLqCHY5oqBFbftdpUt/Eua7KL3T5VNJiNnyJSwLbTtQQWADglQxQhIidC8BAPEk01zJp2LEb5megtfShHDmqZYJF4/CWOMYgaJyEEBELo9/NmjJFA85IXUQ6ZLYiJeMjcJhtUhSac789XkineJPKPPUzrN58AjWswRXxokZzchyChySZp3m412zTjIIq57RwcC1MgFiYRaJmsECIn1Ai47BnpBElI39AwPwTTY1P0vaRXMlq/fxGbrFZq5vAwI80zrmvESx0gg8HgvPM+dM45/0S0DY6eAjO7BEtsTTdT+VOiK26X8GZNRaYkqdFYkTBIJBW36mYMIOxyYfbdqbR8FcBXvvqVJ//aU/7tc5/VGMPMZpWrxIIHKTiGQdlpYuMopeVGEeYYGa1rM/JAx1kTHkVa2014XeEiIjmSptEfIBq5Vhw2DwEiRMIkrQCCdM6SmZ3a6RR3aCqiXH+ZUy0JSZnbG4601aFZAtb3vv3tb88nimY53p0A3bWghaPN3rkYz2OUgAFIuTszaTVNijnLHESFWquUtiSiUj9miseP91M7d1/6SubOSAxpdshBKLhUwiTUXs9GoO1thJG82gKno+D6qhwnG5JUKnhpvp7vt9la8z2t7UMmMDFIz1Xoe1NZ8NSOERPxwSR/my0rYUKMGLcypZm3EBrV0KpfhSpmnyykbO/XbnzljkMmqVFvFxHHDhJw74Yvfvj8Tddft0/wyyU4ITfmMOKsoTaKlJ7LziaHqDMSLeUpHpYgGla8oeJ7ly87+Q//AGv2gqs80s5je/eM7OLZGqrnBOxZg6io9SkNIjUFLw9u4ampmRtv/PL55x8oslICizAg7Shj81TT7W7n2dRZyxfzx6JNIfIDnh4M7piZPuxJv/rol5yGiWVCgKuQSG4X0l2WYAnmCbJOxlrgpfaVEAS3Xn3NirpewY5DyP4jGBupXDgpzt9LCJDaBx8wFcLqgw7GvvsVCvcYIANzPNTEuPQM8qhXlG83G6SjWJOC9z6b3w9V4BCCzWNtrVyr+hc3UDvrfL6tMMYWCeQhhFRjra7rfLC9Sx7WGu8lpEaDNK/QPT+kHTgJQRBLGDORhkhkFYuIHnhg4/ve+w/S8WvsxmA1TKt2q3B/29veBgCO7U/2b1ZgslYd0Wtiw7u8aAx68082vA5tVpldNqMWwo4iZRshZ31N3xu05E729o2I9CFuR2FI22mYMV98zVC0bG2P3Ky2nFlE7yi6/bQsxbZfdMa+qHWPxCqLuZPaB2obe2JUT0pB4kh0mBsMoWW5BS1HLk10TNEZS5ljOllcnHOgpC2PcQ6SiSYrzlX0LoHcrCanszRjf7Xk8ZrXvOaLX/zibIbZZa3YGctqB6GQBflzdJB1Vla+FYbsIzcDnBtoVdxFKEy3FXqXCRG9853vPOmkk37w/e/DlADOiyjHPGZ0xVhvwwQK0gXgfYPqHO2bEav0yd0YtG2huuIoD9qk231FbwvF2rGiLROMfR0Z3lU4ZyUE/Temz6PGZRe7iDz1qU896aSTqM+Ha3njIlmbdu5aPt/OXqMdUcm4pGktGA2taWHsYCVPVmjnDJXma3fVRxbtjbvJbOnp15APd4vYyY0swlS3726MoT1Hxa+t6EVuuQczmcV7uDlgZ2/Qbuh6lLaNkD9r/2dmZrLIaDpvdC0ialXxtoPMn4spKRz8dkizAduVWUAnxrHjHae4QQcigh9i0+a7L/3KtRf/29oQVkhdBdE8zUUh6XYOxFmBmdLGtIiHAdM5DxGpAwJYyEHYA0OiqYrvCv6xv3Xq5BOfqFFLcQ7AICdt53FXzZpX6B5jiVc0zkg8kQSpKYivh1QPsXHz5879AO68c2/xlfcUyUNxyXa3GdLk32Voah5iEBGIwBCSoLETJEINg0Be+AHkhWoRIQTGkHk9e/ofBz73T/8Ue68FMZEjjQ1mrWFGeZ9kN5DcS7AE2wTJMHAxglhAIvDifMD6+2+68so9hvVEEAY5IkbcOdRF2pUikVFTc8UTD4kPfPhRWLEaxEEkZufq8OQFhqzA6dcu/7S/wuyFWqmvQUcWDypEC33xoQbWqkSHr1pb1Ep2aR+r6Sq1zDzLE94LLA1DOks16oxIhtDRC21Xsx2i0RkEJ4EUWXnjDoF06UjtIUKBJFDwCMNQ18E5+uRFH73hxh9srywbfz5kMULXWM3k9LGPfeyKK66Ih5cp1i2VmDVJEE/JkEhQpiRpkyabo3m951/zW4puWHNFP+hcqzJt+7lV4py9ZTuHUJoxQRiNQd7dys3WLwCikuythdx5yucKsPbtBQK7BoUkD3KXM9gXFYw9s+vWI+kcQMGp9Il8VxZqRd8aL0/crhNwrPHNzF5CZAgmziVGyoBCOgQUy+NonA4oV+qw4wqhDqEV9VaIzXxEel5Be6XWI8b6Jgoit3+L8OSCPAo70f6kniYiGg79i170kuuuu2F8P3cb6FkgyQIt6FzEJ8lCmd40pomIKFUsUF/bgo9jLqHACRItzczMnHHGGf/fG/9sZmoaEk8ziA/W/Y0OpVECSdkn0/0hBJ91OcUiUtY8fVbzpebEebZL9vNsaLJwhmT+VnjBGscWJ+eO6pkpLCDLqS57zG7KjASN5osxfdq+SHMqXDBe1xKR7jkGOwQiTExUukFoN7rsPVvFzAIDtf3O9gf9PzOrBSRtp2Q57yk2MHourPijFI1rXkQg3RS0nj7bTm7aFvhAewnoYymJccvjHKM782iYmTjGe9o9MyOzug66Lm3nz5nPSzpVEG9gymcOQDG1dLMVmkeRcoKndlwIuYo3izTCgojIgRyca2VXKKIbyz3MQn73+sukbZN0xepWBe12EHT3kRzyHUV7HTAzxB13XvqhD62+f8PewGRABSHaZl/kVrthJqA07CnvYxATVzNVdQ+hetghv/byM7BiD7iJfA9mYVrPH3StSuu6rutaEQsRV1UQz3UNH+649Ms/+Pzn93e83Ncc9LweAdR7Eq3BDCyBtT5k/HX/amccs7gqDKqNRD+V8PSXv3zw8z8P50AcQtDs0bGr1IptXoIleEhBD692DsMavpb196378Y/3dG4g4oiAwO0HLReKYtawtToEqdgTzzAffNQjMJELHC+W86etDGJ9XbLIKVSWyAkJrU1OoK5r6iREf0gBUb8e074nQoGojHCrgfVq/zsXip6oGrpNzgKr0uWLNoqtGTgRRJrDE0GkDmHoRfTQaUAI0Ag4HwA88MCm9773varwzsVYdyWwi3RmZuZtb3sbM0dfpHWOmITuXZ94vq66ovo3e5W38aC3OROYkDs5F2OdYyg0UhhkKk/Lw0fbJmmsgkT/eWlbEyIf+EVy5OXTMPlX+wqL5ALhPauvfU8R6JSNn9yxPAobMJX6Bntb4ciwB5ZVe9QYZwUR8SGVyUq39Ux33mxob+z1TsrCuCDHQ2HWjSdgMtEueiXHsuXWGvurbxMrX8nGWp7EdevWveAFL7j77nWj5PUOj3URQTPGNtEWt+X1pb9KihbU1Cj59N5OMRjnFZQqQgh33333b/zGb5x33nkYHfkkydNdmwR2MY2A9xljWQQTNXSYn1VvbcwSBAAAIABJREFUjqXb7HorQi8tw8E24rzrTuGUtpuZuXIwMfhIGYQtGdhXwzCZjLG8zTObFb0doKLj1FNPPf744zF6b2+nc7Yu5PlqzULaUgopn2memvxUpgGdi2bIIjmBaWtS2sVhmolLLu98Z8QSEUx0YZfe8hAKudaWbrGRfGLa/or2I2WH2wTWfWkIgVw88ZNlXyPxnSMi732AkGPFAFH0YFoFoOh/RoI2ODk5OTFZWdHQTFP6UInoZloZdVz0OE9zEfY5G0LJjeRBKk5n8VDPPZIid4g0HIEBCn7ItcfmqW/+80fXffvbRwArQqjQOK3zqt6OYB9lCchzGcP0VBsGEQVT/VDpDpq5ktwWN7jDyXN//+U49DBUExAALEgiCiC4bULjfEC7A0FEKnYQaGZ0BJGZmmvBbT/9wrnv33fL9GoJgxAY8O28z5rJg0ASw7firx4euXpW2qJnQCRAhJiYUxi2aY4hopvYPBhydbevD3jSrxz5uy9AVUncd8p6cYpyonauhyVYgocYaEiLEFhjOuAh4fbrr9989937S+DgETyT1n9smfExfAwQYs05RqSpbZhI6gA/6WT5soOPOhKViyu1zTcAjNqGnScohGtWJqzAUrBaSFfGWQZIRELQuqtZXojs8gEL2wfjR211YpstJCO/R4tInxdJzqyCeLZ6vQA2J0CtSpO1HdF7QqMmSggESCA0OND2c8oY1djYVXzhRz9++ulnPO5xj5OoJzSrLD0ze1h0JsQoMBwJIYQPf/jD119/PVekoSFIW5shJvpMR4Di0m2F5qlmbNVr/dVav5aMLRRT3zWYFydPyHRolX6kBWhXqIgAnPfK0eWEhra1YlhVxcbtKUuNyLOFd/KDLRySKY2lG0KhZe4WFq+ks5whBI3a0DPa0SWdEpUQM3HcZCKi4AORxiIBMXtmIOZ80Cm+hSAhpBxfoADxAaqIioCIKeVxMqNClA6ScqUrLmLwSBd1dlo02dYsJ3GewFqJ429Amj7rnO3aurC8rsP5rfekEBAArr76qpe+9CUXX3zxxMS2ZJHeBaHZ2xAJo2nASlIAEIYAJEQkQZxzIQZ8cUxNuGvirKCQ/PknP/nJc5/73O9973vo48YFWL4x6ifFWxazohXD0KSQVnaUA4rReBWQpYZlZaNex8yTk5POucnJSWYeDAZ5EofD4czMTF3X09PTNrWC9x4ezBxVcSbnnPjAzORIXagMEi0Q4kFGayLteRpFgIAQWVJodWwHGY62Pzk5eNOb3pQ9egCc6zn6uSMvmj/oUeoivtmHZt4lySNksUXwEqKcSvSgLs5IFTl/aNwZ1baVuCEE6MHe6JpItU8QHZ26uKNM0SvS+Ez0up4PyLfFm9E4TFv3AKmcvRCzngC3ErbASe/p7yigkxwkUFB/VzwtK0QEH8imkdGoyYQCStGXzjFFgUkhxLpzXkmFCF6mpqZImMjlgy95jkRi5bUq+QqjCLHKTZYl1o61oqg75kJNt2DvnxN3e0NboWYhDGc2Xv7Nr3/sEwf7sCoMK5t8FAjFOfbtfRcJBEIgpQ0rsNN8CygWdZl2fLf3+z/xCYc/5zkYLBdy0CpdQVTNUk6JNsvGAi74PLN5TolSQaXob4UfTjkfsGHjZRdeeN813z9CZNLXTEg1BITaVlLETzusnKIlIXFoEY36n4RYm07Hnh8BiISrunLrwnDLXnu+8NWvxr5roVtMCW8F0hYto1yCJZhzyELCKFguKynih1QPMeN/cvXVk8PhciKnKSkQfYv1aK6YWqZaTUTGg5DVBx104COOBOt5EPMikZ247AolrLCKe39Fm+WqOiJiTmFQgduHIlcpdDsx+odVCRoc9mkFxZ2Lqnh3hiIMAe1QhfEPoq3w5UaiYR/9G5TVO2b23jMomAw+qj1l+aXteJFNmx5817vedeGFFzKUBlnEz26t7UruyIJs9Gtd1yK0efPmd7/73UjoDUHY5fVLEgLb3F7Js2mXeVbEC2q0HbCvtqzDTgcvygyqBfQapb3jTdhoHoThinlGjH+KiGLuRRFRG1VSAF3Gj5gpsM3GRpjyedUASXZW6d7Kuhyn+p5a8ibn73fORcdNso5UwWTNJKRGuxmXHXjuG1dVYbaICbYiNGs5jiUTgO7aSVt8UusAYDEFOz18stG9G48z0Dn5VPDA3p9yzIu9oXgq5yDLGLZ35rm+5JJLXvOa15xzzjkLZvLsTEheBktUXTD4gb1N12BIdah3XWwVZKPkdN111z33uc+98cYbxz84Sq/LjFolMqdcFo44OlqIWKIHCkECmYgwZhOG5pjhfcM9cjZq59zKlSv333//tWvXHn744Ucccdh+++23995r991335UrV65evXpyclIdlFpwXIm/ruuZmZmZmZlNmzZt3rz5gQceuOeee+67774777zzlltuWbdu3S233LJ+/fpNmzd5xLOGAeKcI4b3npXNJt1ADL9uPks6Mx7GoWibwC7e3/zN3zzmmGPUM6AxnjCTuMhXru2e1WBLlS/jsPM8O6duPqJm3RGRcy6rf1l+WbkjKQGliJBrBT6XIXo27E9A1ErvmB9RGggh5GTKStiNqA2NTISKSxZLD1aHyWqqBmjH4aR4RwAI9n72ktYIQ0QcWCioZItu68EAgPjQxP6yEInUwVVOa+45dmk7kweDQV6wIQTnnEhbTkEq5irPYleCFqxklOjqR3oHtp2Oe6JyKJmLaf14JsZwC9bde+kHz1t+1517AhMhMFq5Min+t83HvR2cZjjK3lqIQNNHRS4hIqTpLrJzPRANK9rosGXViue/5nVYuy+4InJINIFIiP2YWbAFnxXB/FIRYq50MOwcfO0EmN6y5eprvn7hRw8Rv1LqQWiKRwggyCVZ1eVIQEizFoiIk0dcAAEcNCdBEPVTAmlbICbFi2UEhDyCVBObnbsd9YkvesHKX3wCqoH1FQhxxpZVhRczx1yCJdhxsLK2sMGIOHjPJBBB7bHuZzdc8a1lIUwwWMQZ86Cy8W45Z0q7nqnu+XviTcz7H3E41u7TleRqHC7IuPuhiOu3yIHhDNZY6v7abVZksQT67RQoLMwCY/keqxNnLarQkhskU7yteFd0h3f6sDDqLyWw3d6qfp/lpn0wX8wtEJHKwRCgGYscNe6YNMDWIZX4qxdm/Mu//MsZZ5zxpF99SnptOuwy10jYKdCd35DKvBCRc/x//s8/3nTTTUSakkkIgFe+BMccJIgHERMCgo+xpe2Yl0Ipzfp0Qc92yuyvMAS/CA+yFVAHr3nNutTbsm8bP13QSNV8T1vJ19AGYubhcJjNCQLq9hIW9UkBAMMUQBUN+8h7WaGVEo3Ss/3HOQk+eCtY8k3e990PBPieZlRnzy/rA99yMMYrrVfm6JJmHO3WdNBqnXR6R0RajLj/9fMMWStuc2OgE0ZQsGvLo4qlkX1AhQAtREDxoUuW55577kEHHfQXf/EXi9zTsSPQHO3syIt8Q/aYGC1Futauc1XK/Sq7nBAopji6WgQ//NFNv/VbvzXeO4mxHrdMopYamTm0BXr2RTrjqfFSs6uSE4pCED0qzowDDjhg7dq1D3/4w48//vjjjz/+0Y9+9Nq1aycmllVVJcYt5b3PQYVFbL6V6fkKGUf/Aw88cPfdd//gBz+44YYbrr/++muvvfaHP/zh1NTUzHDIzIjOHF2DDpBIIyFkmlGdfasoGgs9aQoVG5OTk3/2Z2epYO0Vf4t8zeYpKDRSGD0BeYKsKzNOE4kP5FgACcIcy4MOBgNbR1HSFnWmgUiH+S0mSjfSoZTVXIrWxoCMlGMt6JGFXTHnk6ALgQhSo6o4xWt7Apip9j6EMDEx4b1HOlQOiHMEoRC8+MBMofbOuZwahZ2wU4+tMCioCieBQcEHAZh5YnIySZNKpKElIiIECaGyzqkCTQ06DFup6zqfKreqJBZWexPrh5qexqYHr/3sZ3/y1a8eBtpDhk761JftWrmBwMnrFu0KjtGuRAhByDlDzQBAriJHU1V1e5h5/PNOXX3CCagmwC3umaVUgfkFE9ItBOpI2/5lZgTveVhjOMSGTV/44IdWrn9gb2CyDnpcQY2EhBs1mzQ6sp/ZIbqJKUDL2SCepWxRGijlohUiVNW04ztmplc/5pjHv/SlWLFC2KmfV9vkGJlS7t8uwRLs3tAl+CTVIismklB7Itpy62333HTjwyRwHfKvIqJFpbLS3PI9iTTlcQAQDYkekPDEx/48Vq7W829YBHun2VKy6eFGKSIwe4b2YJHle3E41PJPyU6ND925QCkRT/6KtlJVKH9oh+rkK7PRunYiFOPKOaF6oUmG0PZ3j2nTBvGJOWWiVk3xYNuw57r273jHO37ll3+VyRUiezeA3uFkdN15553nnHNOw+JCXJsQYUeqWxNx1sckbfKLCRYoPCMFcWYFOBuW9lc2VWVsMr4uFGRQ8JwFg9lTiHUkZSSYkzQ2ULo+4ogjX/SiFwHYtGlDCMFRJSJBahHxtaZc1zgI5FNy0eFCgYi0uIc69eqZoYiAhYhCLcxMjpkRApxz3g/zDKrZn9dad47ySLVeDZE45zQznYgIPFNln7UBL12XUMae9btZ1pfXu0TveZNCbmJioqqqwWBQVdXl//3Ny77ytQLbslPrrY2yMqw9YtdFIROtfZfpvDghWCyx/Oyoi3Yp/eVf/uVBBx10+umn73SNYn5BYpwL2tjoZRpdPGculO9Z2N7PAVghGFkEu5tvvvk5z3nODTeMrJhUtLB1901fSL6IEDOh0WcopS8Y8ABAoFDXdQhh1apVRx111BOf+MSnPOVJT3jCE9asWbNs2bJ2iDcXhF1skHeHbPsGs1iYec2aNWvWrHnUox6ld05PT99111033HDD5Zdf/q1vfev73//+7bffng6h+0wP9ux5fJG2Pxskbg0sG3ze8573mMc8pqvU7SqQ11dBOb0C2o4xC0F1c2eGT0Te+0MOOeS1r33t+vXrp6amQu1FZKYeDofDmAW19iEErbGm9TykKUNHbW3QO+e8VxLSKEJFfg0j1wCIKOlK5hdB++a90naRQ0Ovh2QfZXpTIs/Eo4SkcpaZBb6qqnomJr3VXweDgQ8hxzyqXHbcnPcPAczMFTnnhjO+qiommZiYCCFUVXXbbbd987+vvPvudcw8NTWs0sEFK9D1XZo6Nk0ERKRC33ouJsyKMXtUIcdIo+PeGtPattyT+1r68ohSFpjgMT2DG2/6ygc+tM/0zGqpB94s0hGrNkb3je0JAwEQ8R5wREIcxFPKs6MJBYhdg2sJTOwlgNyQ3P1EdORRv3j6y1E5OA6keMvHK3UUjWQq9CF7vdB95wS6rVlNXbfNASAEbJn50Rf/48b/uPThkOXeu7hJHMOIk3cyV39s4rAy3dg1rztaFHOrQERv0MHq3j9CgDB8CLWjB4g2rFjxwtf9MQ47Am5SUnhAymmZKvDseruJS7AEcwkt9ghCCH5Y85apH3/7u7h/wwpmNwwCCWAyuVc4HSohampMEWnGFASJWbpq5pk9lv+PY46Nu28aXNMqftXjk5rvIfeakfmnIhVJtk5DKukYJIAoj0K5U+S3HRfGQxLYhqT1QkZO4UooJFejDgpEC5i2OfYoFM838jOFdJTXkdpBN30hzKi7WtCokCI2WfZyB+Ih1qS6qYz94he/9P8+/X+f9/zn201m+4b2KZOdkA12TkD1eE4FWAF84AMfuPXWW+MaV8rJCcU8YmyRCcijdLjJmgHWousaWllLbmkpRm+2HoQx1DjeLl1IKEbX9RAVJGq0a3XMOXQSVB144P6ve81rly9fzhXl+7NybTX2dlNJsYODCFg9LNqBICLZccnMOqPo7GfEdvSl6Y0A9IiyIJ5GAtIB7SCg0GzWISrcEtMmi22n4FQw9+chhRAYTuWh9kerNTU2XrzfeQnMGA6Hb37zX7zzne9sI9k5Nxg1Zb02zpxDHCMlcW9I3fpNMsHbM/v2V/vZevDR2enpFRz2Yn78la985QEHHHDKKafMxpDcVWGEy7vrc4yzIDm9XcIYU4A4goifD6twXiETjyWY2356+3Oee+p1112XbysXY6eR8T9ZnbChQx+YOfjIzQEESFVVjioiqevaObd8+fLjjjvu6U9/+imnnPLIRz5ycnIyE3/yTCH/Rdv7kXuO0TMySkBYBZWIBoPBoYceeuihh/76r/86gPvvv/8HP/jBlVde+dWvfvWKK65Yt25d2pYrGZe0Gx+DqKIb3Tu1S865ZcuWveENb1gYZX6eIE9iL0IsN8v3oz1ZkcMLBJ650rx8e++99x/8wR9gzsLyrLbZ1eXs9TDqc5bdxfXxHNWuSpXLta9jdsTaE9GMrzOpi9GvVHarPM0JWJDkO0sIBBFxzm3evPnGG2+68MILP3z+R6amp7yEpJ65qprQbqgTlpnTgVvtl6vGE5/tehZa3bFhzuapx59t2U3qT81atbkewg/xwIb//NCHp3/4w0MlLNPaOP3mRemW5LE+ymCmxIu47O1UKc8AOIRAcEFqUh2KiKmaYdrs+C7xzzj993H4YZiYDASOPuwGY9ZcGc/U5o872FfnnkT1MQRWwrv19i9+8EP7DYdrQpgIocpWARE3xJpxFttJ7kOybxERRxRFbmOktc8KkR4UZ5qsHnTuTgmPfdYp+z311zCxHMRELloq8YUjMkcswRI8JCFqLSGQ9wNmzEzf+O0rVwVZxkxaNExDmEVcTKjboyoRkbYEIASBo2mRiX33W3X0o8HZVVA6oWw3FkyhybpF943WVWH31ZB2R4m44L3N59HJlB9SkMTBSJU3X8xHRfKD9h5qC4LFA0XHskOqGHXvh247jZhzTsyeeeltSTpVprEmmAuamLxt8APvfPs7Tj75GSuWr44pyRcrPncExJwbBXDXXXede+65s3F5oDNB0omg7DZCJmAQHb9Y6SygcW9f/NBLt73DsXGFGq8BoK7rLVu2rFixQmN5IlNNJnuDWAIAFkg2QvTtUEe83q6hi0rsAoBYWytd+XZq2BzJtJ0Xc9Q6SMo1JIR4KJJCCKzhIXABIu3cXjlVIsziRTsfMVGsXkVkiKSjmYsIg3Tgb33rWzdu3Hjuueca9jgcY23Mt54/4qUlYgvkW7svr81CWyjO5s9mgXT5oYhMT0+fdtppl1xyyeMf//hRAn3Xhd5FZ3FluVzDjtJ5lwbJae9qV2REdozKXu66665nPetZV199tb1troaWNUMbUKXgnFMffT1TDwaDRz7ykc9//vN/67dOfcQjHqFlOZDN2AVUArOvw3Z+zz33POGEE0444YRXv/rV99zzs29+85sXX/yvX/7yl2+99Vb7YC9vHHODvdO6IPJ4VZ17wQtecPTRR8Ow4l0FZtnhHuafHoeZkZghMf4UEUUkRBo8uA1Ea4Wa6UOTOLV9s++MIoz9rGRjAwU0+6BkYh6jHYWUv1VlHw0qABNO806yhABTB08dlOoYrVxTNaiqnJ6x4BjvQStXrnzc437+uOOO+7njjnv9n/zxxo2bdStxZmbG9EGHEEv2ZWrUvcACKS1sYnYV32YD207irQQwhJhwNP4WhqhrTG356WWXXXXxpw8hrAjBSRCRnCKRBSwxDoQRTCacdEOOElGFte2+9mJeBwixT5qt1pcMgIcnckTk9BQJMFO5O2V45JOf9IhnPxuuApE6ti0Dsl8tV9pG/MwNtJXyAATxIBBqjw0bvvMv/7LpB99fC1kW/CCSUSAISWAIQ0gCEBjBETkiBhyR5haJ/1IERGSFIgEcwIQcfwqAAAogERKBF5omvlcERxz+pFe9EstXaBkspQDkfhKQ/wnmJsB9CZZgNwABhHDPvXdcf+2eTBPwFTQlggeghbwJWu1UkruOHRwLU7TJhYiE4JlnKvewY38O++4DTf5l4lkKtiaGZy4AZGvZ6hZWCY5nLpLgF+Mh0itZKgMggeafxq5sIOnA+9O6bXtTxYdetFhZVtBD955FCI1NaEbR/alQ9KUNMEpeE5QnQu2wR71Zm8o3Ny2bPOswaP/Od6/6xCc+AasqNOGEhXrGae91DghgYUBSXDPSkF1V/cPZ77vzzjtnyUzyBOlXewKumCPqgH1FMVPUuKph80gsWuhy494PlkubK6RnytTIIRKAFa96hDlb+CLk3ECD64kcwESOyDGYo1el0ivElYCFwFW8LXXSETkwkUvZzcgRV3o/yOk/4grk2A0iVes9qWWQix40JjA5YmJOJUSIiATMbqCxGLEkZeqSDxChpp/k0mAdCTMcc6W/ApyK53AcAuWsF+krV+QYTMxVVU1U7N71rncdffSjiEApLHon5qBUyLQhIkJNRSAYt34mBntzL1HZI/PFW8Z3o8tC9ZH77rvvtNNOu+OOO7DgWsR8QxxL2xGc0du6x9ygxXltfDepVRUpdvHK0zGQ1ZINGzb8zu/8zve+9705H4Wl5PbX6HAPAfXMcOCqpz71KRdd9IkrrrjiTW9606MffYxzAyJyzinPX+CcDFbtpHRW1V7cb+3+zzz5WR8674NXX/W9z3zmM7/zO7+z5557FopKb5vdpVTcTOm0OwA9wO6cW7Vqj9e//vVY3JrbtgKhCY2nfBSgSDrBlHmjVljSit4pPhEiMjExQdGJFpvqBZh3xbb7zh+roBEhgO3jel0lETdFnKpEG465SqRSZZ5g70nPVllM69cssrNQ06aICMJBSD1nQQjkBBwCBBw8IOr1YYlBmwATAiFETUACgUgIIAc9MksO4MFgcNpLXnLRJz558MEHAiDHg8FAkZEVMwDWu4qs2raZI9Bmi1ZxHAXzIU7sBAfvM39nZohwAILHj2/+/Lnnrt60aU09nAg+H03uhfG7IT3LuN0N6QgYbl93gyoMeAPThr1WP+OP/gB7rcFgAszUDjtFn4KIPhYzG8zvCFj2Z00sckA9xINTMzfc8I1PfOLggFXBT0r0QmphGpf8uVlaapvqmux/kSDjjQFT4bThFAEITDMD3lS5dc79xpln4BFHYmISHIt39y77JViCJVCIYQ7DGUxt+cn3rn7wjjtWIgxEIMIIzX4M9AhRDmg2G3rWaCeaEWwK4cjHPQ57rEI1IJizLR0rd4G1GenbQuuqCNkDQnljnBPr4+ivjPwnKdC7bgRlVz2aQ7Benvy6rjGQLU8bJLiYbc6sEvV+7hIYOlopkkmjY/fehxCYOJ9BLixz9Bn5XRSpiAzA3/3d32944AFj0nvQLuOCHAVWwyGT/u9HP/7R+9//fquZjIdCSSt0qjxBmQPkOcr3mORHVFxh5hB2ATtN0n7M+Nu6K9GuWUSybPY5iMg5l/2zZPLSWkte0dNdRF07v5iU4v7mHm4pkkWsX57Kkt11whtb96SL6oYoFrK9UjC6fMOoceX+6M3Lly8/66yzJO0iLJ9cNjk5sDePmp2FY5LSzLuOrkAv2oQRUmFiaW/4jer/mMViZQfM1F933XUve9nLtmzZYqlx9wGKJbyzEtIlUbR3WNNzPRK2OLKwyHFVjMV7//KXv/zyyy/HPPc8L15mFkIdhjMzM4PB4OlPf/rFF1/8uc997qSTTppcvixb6N3O7HSeT21uBqJVq1Y985nP/OhHP3rNNde8853vPPbYY4ko+ZtaYIfTHUjmeJaFqhT23j//+c9/9KMfvdOHv31guz1qq94KuMzeC33VIr9I3TimTduNQoLYDxn5+RXZa2kf1JUuHV9qMTVF4/mivsXKO26D6YOzcrA7zMJjTkQEVyCEXNy0y50UiXHf7NzTnva0pzzpyeJDqP3U1IOaMBqGxbFZiSGEajYWZSFF7GTMM/mami1VUo8A74ODQAQPPPCNj3xs/RXffRTT8tprDC5L02cLGjKkFnVutzd7kz6uYUQBkBAPLEcMEmuhImJoWXaQMLEXEcJMxXcOZ57wojP48f8TzAHEeuKSWRP05PbzO+PeWAKLVWrrYduLxtlCQyIiqAM2bf7yhz9S3XHH/pCJIFpiG6KlbYQk9bv0blNsTHf8iAgBIunpHDKZh9iMTn+tQdPV4KeMI5/+a4c/5zmYXKb0DSKO+9goSlQtDH6WYAkWPzAzgocItkxd+43/Wj49s4K4EqkIIpooRM/WkfooaxHdRAuU0uERgkgMsXdcO56p3KHHHAshEFM1kLgtpgcQyhRUCwxWYBeavQUrWTUNSqP0k9ktcQ2XlhQluivCnMxFIYnsFYsl9HFgi+Hiq9iNbL2i9+x4j7cXRqGrO4riBqs4FukpRcRrApM+/6P1aHRfZC/qnddff+MFF1zwqle/wod4aGPsgHYN93qPnkZERO95z3seuP/+2R+J6LKgbFQU6qsl1EarLlPXlxlsnaPeCVpssNVVP2oIVg1LjbRckD4MfRgm1S0kPZrQmaTC29JrR4VOaTL79shqtPDR7Een+cmNetkeTuwcGTflrCG2bHpL3cYbGoMAeOYzn/3GN74x1LJmzerHP/7xK1eu1nswogMyG2NsDoFMRte+1VEYqF3bePxyGMX8rVHTuYe+9KVL//iP//jss88eDoeDwWCML2DXAtKwDYoFl4koZ0sozB8Fq9K0FBLjYV+E+Tp7DTE73drnN7/5zZ/5zGcWgKOm/mjmEFQDftJTn3LWWWf90i/9CjPrhoqIjOMY2/CWHe3nmHaIqFmwaXP94IMPft3rXveqV73qkksu+bu/fec3vvGN0HZ5Fzpb41dK2WNzIRRpjgCDiJYtW/ba1762ly3sctBaVuZ617sSObCe9SQAEB8thXzESkvDhRBSDoaW1rrdWBo/9aN46RjYvp4kZT4m+sufSRBCkFgBJOe4VNOPhXyAxOA0EaTcKUDI6CWu9PTe8573vJUrVz/sYQ879NBD9t57bxJIEDjlY2ydyURUjVoVOh+ZA3ZZZCHJxuB3O4i7eKR4lyPGcBqbNt39tf/670988mAJK32oggAhBQf1Awk2kELbAAAgAElEQVScWbR+9DSTCIM0HaKo0gPhuAeW0iQKKta8NlKH4AbV1GBwVxhOHH7YL77kxVi+HIMJ0iPeyG61ljZmOWNHO4S9f564g12fLbqvh5ieuufr/3X1Z//9Uc6tmJkeiI+/E1JmcoKAc3hIWvwSEZbjTwUhlfom4niTLrMgTc376B8QV9UV3cvhwX0POPmVr8KaveEmRP28ps+9WFqCJXjIQsOExYe6Zgm4b/0d13x/T+IVkApEAsdOc4GZ+Egi3XLQ5acnTNMmTgihdm6qcssP2H/NUUfCVUFEz9RZnkzJO1Mo3Aszaj17iLZOn9kstzP9tySaCJvydi2pL3m3cLG7JHphrqYgo66wnbqNW22v25PF79lpxIrAbqSjY41biWzt50xpXdvbwij7vPd+q3cBeN/Z733Ri393zV577X7yTrGneu211157/vnn6/Wua2N8O5kJFPny8tRYs83Sts3QRJ0yqYWlt2ihIN3ZQ4FYiyWNHInpGltIaO1V5Os2FjXfkHW2ou6QfeOY7llfjGXvvUMQEa3n3v11DBl0NWETXAMRxLSU0i9oikVNRCtXrvybv/kbJpYArVo+nnoXkrpsoJB+KLh6nix0GCDazHA8oyvut41bSDcQEM4555xDDjnkrLPOmpqaUjccmaTA2zHYxQCijuk+ZlJoTb347FWrKOXXxqLBTG837LiY+cILL3zPe96Tf5o/3aDozDHHHPPmN7/51FNPdU5P/SEaqjuAuoIDsEnttx1dneVTxW0TExOnnHLKM08+5dJLL33LW//6sssuq6pqYmJiamqKTfFxJbPQVF7OB95jjLz6K4mc9/43f/M3jznmmFFv3LVgVOezRMhIyLPQVXr1ay4zvYMJlLpEYrlB7lWmrl5J2v08m1f3yrv8tWs66Tnh+FUdspSJ3MWgPnGpGk8lIswubz7C+BKJGCwnn3zyySc/k0CgEEIIPtAI5ua9j7mKRvEIq2pkPiim9GRuawwRbD8Dyk6v1JRm1/ZhCO9x1z1fOuf9e9y7bq2ESV9z8k4mtAAACadcnvlKSQr5CU5/c0pKlRuO4KDpycAER2AIxeBAUQ+dEGaENrC7vXLPeOWZOOAguEEQJq6sX7n76sLsWXgo9HgiQvCYqfGzdV87/yP7bNy0KviBeM0myYg5PUmgOShTMxxdsAJGDDhNuKKKmQkVgSQo9hgSs5XHiq7q+CQvNMPYPKh+Vrknn3kGHnc8qgmJ+xQZP0HEp+SiERa/AbwESzBPIDa9MQmIxAdMTW+44foHbr55NfNAUIXAEATPEJJWeJUzIjCEkFZ6FJA186YB7/eII7FmT03iA4npkCVlKhGw9dREftLm3vMEhZRVsCp7FkCWA8f7dWsUxMbStgbbrstVdlCa2IH3lkHoYqbXj1OYXlCGj1TF23Z49LbiQkK3rA3aMrpQB61Lwqp3GcYrxxa4N6qqDTfd9OMLL7wQYO+1vmtvrsld6dx3XnGSzpA65/72b/9286ZN+YbCbJhls4UijvZc2PdmO61wxxTq+xgtd5HAbPAzfgi5BcsG9QxQMl8VOZSDy0dhxlpWGaW994836bvtFOfgipsVNM1W0QJ1Mrt1P9h27CFcIqikSI1Aw0O648o+4sj9IOTaLXd43cILmi5PQ5vys8MFbeu3y9vHv6Irl8dCNEX//M/f9KlPfWrZsmXD4TB3IDc1SvosWpAcmdWeeTuufKxSfyrmxYqY/GE2+RwWHrpuHfvh2muvff3rX9/173QJrPlp23WDRkwLAOyxx/K/+Mv/9Z//+Z+nnnpq5ACMpgzWDkDBW9CeuHmFkgEyPekpT/7KV75y6aWXnnDCCTl7ST7bqzk6qqrSCn55aWu+Dr2icXODweB1r3ud5kNcgIHMN8xqjRCEYLNYQCc35aMUs4uJrChaypy1vdM1WLo97Eo9e338561CV97l60oqHF1WRolynE+TqfRPP6X4D2HmCpFZZeWBCinMcJotxwflXoUQb7TZ6HVEZ0WNQlbrsXZYir2neHy8DBsFsTXj4UZUJYEgLgRMTf/gU5/62RXfOsDxyjAciE/aAxhovzAULRdJ6+N1nZ40bdkOV20iei3bD0ky1IkI1WBLxT95cNMhv/LLB51yCiYG4hxVA31lvt/qf7NEy7xKIGrnCIu4mhpiZnjLZV+//ZuXH8gy6WsykZLdFuzXrIHoZRJhrYGlvNLkXiGASP8RE0PLEDne4qpb6+HDTjzxMaedhsnlMZpdC2X1WYBLsAQPcbCmVAgBQRwBwd/0rSvdxk0rmQcSSILGGbJ5KjNDq2ZJw3VFiGcQ7p6ePvi4Y7FqZWBKofiG4add6JK5LaDqnFOZwNhXWQkmk2rH3qC/5io6RkUDUpKyBRvCHEIx/O2AHvk46+1Z6gssmn0LCw+abs9223ufM3xZEZmBjD9LIZNQ1nGtxTVev4rXZ6HeEuGf/umfNm3YuItSZhcybWQD4Gtf+9rHP/7xrrd2NopQ16QHSqsjeyEp+QXyfFmTzz5igyvnZtgLDoUxUyxJe6VYs/mIt9q32XLrXc7bNEdj7s+LcTFzj9x5SzYFWHLqfVY/13WdqXROipuN7zB0i6gjCotYRasVFEknCzpBn4PJDrxRTjov7cVbCDj99NP/+7//e8WKFUU0TPeRjLcx5CcjYGs4mxsoWFDRsRyhXOBE+owddSfZvwvQ/zGQkZ+hO1k5nd/mzZvPPPPMe++9V4kqeUNYXWZW/5yz7kFOPPHEL33pS69//etXr17DXDW5dBfFluiOgmWPSg8nnnjipZde+ld/9VcTExNZk6EUJJjpUHNkw4Qo6RXv/dOe9rQTTjgBi97vP0voHUUphjpE212tdgmnI8zbA10JOEomzhX+ZURUwai36DCzX9vqBrpIdRGp7pQL+ORny1CVtoi00gR9gsOCJkZs+RbH4F2M4TFK7e5lqWMaxGj0CTU8RNQ7KQLvMeWnvnPVZedfcOBwuKdIFQJHD3jMk5hC/OLgSEDNNk4AJLqHRbizS0BEKjXioWStQajTA4SUqkw7JgQiF4Ah4cGJwfSa1Sf/4R9iz71AFYQAaMlcAWtVROp44i3+e2FeJVDGvPc+9qj2mJ7CT3/2lX++cM+pqVXeV4BQ49kmIom41ova/aS+hFQYXeBa3JNjbDkRJfypE0MkiIQgUoOGjjZU7oH99nvma16LVaswcAEU03ciuxiYyBW7ajtdTi/BEiw8FMIs8meSMDWF++696Vvf2jOEqq417sMybSIiCZGfadQkRUbpUu0vrZRQD6oHJyYf9nPHIe+n6b6iCJEQgkZAixCRs8wtQBZGA5Q+U9aKp6xYNBFSmlFXgBCf0gKxCHHPqYteRYnd3+t2w35eSPungKz973hTYgLNxryueMSqd2Rc3gBiZdKFoo3ZgNYitpZV1t3JpB9C20WVralCI8ogLS9tuZPcBd2AHz9xQXDDDT+88MILERoDozug7cHCzoOMH8XbW97ylrquERqH7ezXkTRqXuk8sqwPRvMpDGNLtzGmyQflErIrpMMr1PIMXe6ULxYIyfc0q5ia4oTj52K8Gtb91c7I7H/avrfPNXC3JIWFPrMi8pPu+bMc5WT57ZyLj/jS6JokFWXWPqyqKr+3tyQO2tTSawB2PxSfCzE9apgbNmx46Utfessttw0GE8Vt3VfYwNhRY++FUfePge2YlwJdVmT09rNYod11mmdkkXCkYmhWZ7Dq2dv/9h3/dfk3cjl7G7E+hr3MOjTNPCLCjGXLJv7oFa/48Ic/fMwxx0xUA+aYSlgnnnYjs9HSs3Ouqqo3vOENV1555Yknnqhe47yQs9pgicreQ+Re+cpXZn/Fzh3XHEIhUApKIwGDujuRGveWv+Z11xO8XLgktqVXo67MFf7HC9O+6410E/Ga6yuenwPUDlJ/GIMgyAWamNlRSv/FmcPrP2VctWai1MPQROIlqAdJpESpiLSyV/TKm96RdLmJ5arbBIUt11Yc812KIACEocfPfvb5cz7Ad96xH2RFCJUIAw5wQAVUhOivJFIrlEg4HaGKTbYzcXaGTKSFXdASEnHUAAEapxoChhJQDYbLl988M/3kl7505ROegMGEDAZUDSifj+hgtSuwdwpkwo1O5OBR1/D+J1/6wt3f+e6+jiYlIDTlaETPYEQVJ/7tznkW/Vkb8yFIR+vSnJ5EIEfEHCq30VW3Daef+nsvq37hF+AmREiTxGUhN6/YWIIl2LWgEGZRR5kZMsLm226/94c/2ouxjBlBIvsXQTrTLSqViVOyCrhUYSwaS+RoUG0hcvvus99jfh6aXseETlg1uhCB26397wgGuja2fsjhk/YUVfFgA3qZeiRaYS1YWw7zo1jsLCjEE42IIiw+57+F+ddVjxYhfuwAvff2aGG/1ZTIwLoyLT2MMh3HS7ExSlRWP/7hH/5h8+bNNnymq9iNecVOge7alBR3YxF10UUX/cd//Md8vNcCEjLz4W6080KQOSSU99eZuYgjW2wwxsgvbiu8OcWCVcjEn9ODbp+GvwQFdHFo89jaaunz1YMgBevI67EIfum1DTN0JensoXi2aES/Xn/99S984Qs3btykxJnxNkayLABsx+uKTT5pb2v1boAVJ77zq/X+wWAAs324EyGzDnv6hE2Fscx1P//5z7/73e/uZoYVu3M8Wn/YVjj66KMvueSSd7zjHXvttZfmZMyO0YcCiMgxxxxz6aWX/vVf/zURaRxlpsP8NZ8fyuz9+OOPf9rTnrb7IcqaKpm6shqQXZMYQYd5qUqKoNx5Q5lfsCsXBkW9d8b/mcCUvKLVrkS7WHlWPJxz0hIBZVYuhVYBHPtW28XxGnMxqm2CzNoKirECSbVYxwwJqIeYevD2Sy65+dIv7S9+hZ9x3jtorkMwULEa1uQAkqB5ErU2jiOpCC4GGCRneTppT0QCQLJ4dmjv21CKuxGCsHqHNYqQhoR1wdMjH/XzL3kJXIXBAFUFIogQSz5MYZAWSDMbpCmcb9jqHpSoo9EHbHkQt9/+tY9ccFA9nPS1+Jpi5AtJTKISayWqt1dS+5z+aZSRkCaihCMOIRQbVgxooBYJIBQCatD0wN1NcvATn3j8i16sh7stKSpHWFKRl+AhBt0cc0Dfim5UVR8w9Dde8e36nnV7CMh7IOj9IWaIjfl2gZhJViQAgVJ62ch4ITPA5oCHHXsc9l0LYuaqsGMLqdMVbPMNIv2hZFkeFacPNOKbOt7VmGOFWxZ+Z7DO5uUxQhep4F3p19tFmVVhG/Ry3QJLNMKf2/vV0aiUITsNGmOPQpAagKXfLklbUs9XLKVlADBqFY/qSfciATkbw/U33nDBP3+Emeu69l4yTepeNxZq6W0TWP6Atlmre+lAmJ6efstb3mKjTecE+vFJRObsYdNJEY2Y8N6DKSByDOmLI1uEMEZBsrZWPg9rLxbEbNtE35B3Uea2c4FGh0gX5vECdEbMziKl+M2uH5DHlv7oOtG2+lK0+Sd1dg1zm//1X187/fTfq+u4+HZRkhsjPTNQG7rr0X7NiRewyHwlxexnE/7ee9f9yZ/8ydSDWxgOKT7XWv3UzuqQpcO2KlHa4otf+KKvfvVrv/RLvzIYDFauXDk5ObloOfacg2UgzHzWWWdddtllRxxxhPeeuSrOy6KTd/sVr3iFjaTeZaFH48qYyUPLDNDyvWwXSNpDzc/m4PccCbjbQRM7qfaOia8L6V909hC5fPQlq7taNTqrwkSU9dICw9p4dLWJ5HSWdvn31LnLM4HZCcuuWN1xyrZyyzliZu+HqGtMTePmWy674Px9Nm/eG2FZ8E4CkWZSU+s6BU4S5ZxrsehNjKYkR/E0H6XDjPo6JsrHirpBMUaWpyvEQo4mJrZMLrvD+18//XQ87FBMTgZ2VORiDGWE0SKBtgOa4AO2bLnqs5/beOP1ewc/4UN5pxIfoneSKbohu2ddQgi+b8sCfeqIF/KONzDfs2rFya98BQ44EFUlxMycd3hys9sqsZZgCXZvkLx/pSeUg2DDxh9eecUqwQpEV5CuNIHUCCLi294l5tLp5oi4csFNbBY57pdPwIo9tI2uaN/pPI3aMQiFkUMm72381UhBmBpzaFvpo7xy3VxXhUU3ys7f5YDaO0OjbutmY8yoy4qL5f9YrGjpqEP6t1U3KX+wotMO2Ty+9W3dbQKBZL3t7LPP3rx5s0Z6jj7rvUihd1kx83nnnXfttdeOP6q5rdDbWl7FVjOJCdTQsIvgPZlko4vkNGUBsye8gkozsypsMOssQGKMo7LLzf14HsKw8Pi0XiHLtC1toE84ok/YKWxVObfrSNo2QtG+vuJTn/rUn/7pn+pDux/J2dO1Vpror5ZB5fVYVOoYk0JtJwIlf7d2+M1vfvN1111XVRXMdIdO3lUyoeuZHuwAR7GgjKLBYPD2t739Qx/60Jo1a6qqGgwGLp3rXpiBLxKwzPwJT3jCN7/5zac//endPKcZFOGPeMQjnve854kIdpcKORa6vggLXVqyLK5ga7uWxrXD0C403Um4YY3BHEcZUk72fE+RajZ98LZla75pFe9yYrqfC+gVVPmn8c/2tjb6x5D770CYmcGGTV//yEfuv/rqA4BlKd0hNUvOPCXik1opRDlbYso+6RlSAU7EiUTPpoiGW8ZD8xDK1YhS1kUwafBSANUhgGkz811UH/yLjz/qWSeLo+AGAEmAhJTMjAKo1O0AyALm4SJ0XxWAAIoZ5IgEfogNG8KNP/r6P39sH+9Xhlq3TQPYJ4c4acdTm4LkrGy3bskg+99DpGOIpKS8ur1GCBVvdu6nvn7c8397j199EpwDNaUqKOVRBrRQlAZcLMESPBSAe+OJ7IpueAsRQoD34bbbb/ve91ayOF87gWbAIMREvVm0CkFDhGJsuDQrV0QCaMphODl5+M8dB0cwkiPf08u9F1KzyZpuvlIYWjnzdzSwg1Db05oxoEiw5pMZSDCJV0rbTHca7VNbNdJ2CdCdTzJuXAujlLzCzZGaavkoF6Hua3tLo6OcLDa6jteukd8j92dDGx2BLQAxZz/R9ddff8EFF0xMTOjBhnQ82fXyisUGFidqvhLxfffd/653vYuZNZpyNs/OBrrbCb19kHzWkgkcLWcoY2Eix1iURKuwfcuqQAsZX5W9gbkp34nF6qXdtWAxEJJ1+uQZz0VL8k9d0rLSf/wrRg2zsO2Llm2vst373ve++93vfncW9LuceJ0lroiaqsFou0iiZEm8KG+ZLML1mFluJpWLL774/PM/4pwTHxA8mQiVQkp2lQfry6BOboqCWe2zzz6f/OQn//SNb3CDqngQsyPa3Qksovbdd99Pf/rTL37xC7Nszd5hGDSeeeaZK1YsS9cXHWltH0g7lqI386l0gsebRbc4OPbCQzF2G0qp6EGfG1dSXXiYtDkG86z5KMlEVqY7mzgAvcE510OCLe9Sx3ncDS3sHczsYYwYa2I3ag8R+PDANy7/1v/99P7A6uAngrhYdhtEal1DROs+ADloSIR1zHHksf10JJz1uHHFTFEwiADEPfZ/CGJRQa6qK7dlsvop5NdOewn2XiOTy1BV7AalXClElCwGfTdNvXasDpip8eCDX//Yx+pbbt5TaFLgJOQumqUbCx0IJTxHWkxpU9BctFTEbdUnosWROJ6ZGNw3QPWwQ37t934PK/fAYIA23Y8ykpdgCZYgg4QAEHy45bvfxX33rQAqiGqERGQ9nXn9WrbETPkWIRqSbGbs8/DDVh15JLhCSlZptcmdrvNJXxqmXvZLbY9qloL5tFR8KoWNj6rTl9uxb7FtWlE9DyNeOBilAyh07UkYDGS+XWyoLkzPtxVCu/R2r8/RQjHLhZuyuGGbekJZoTE9ye0751T5GwwG73nPe9avXz8xMWHDh7fpXTsF7GLJDEQkvP/959x66602BV7BZ7AtKtOYO8kE6dhJxwhm0u35IgFJCb7FxCnsSGv6oX8JpLQYO9blJZgtzCu3pPaWHozpXjBwu1qLm8c03r2h1w+VW7ZfC49SvvLGN77x05/+tE1uuE1g+7+DiO3FyQ5CI036Cp0jo0JioMdiXow5sa/G661fv/7P//zP67rOs1bXtbQDrLJOZZ2boyC/KDeoUuOoo476whe+8OxnP3uMvNjZRvfCQUajyogQwvLly88777xnP/vZknae9M5sXO+5556//du/vfvFBmamYanIHospmEOXxnp1uUW7AOcKisWSeY7VmqzaUDDtnBikh491QiFzHKVVC/u3X6ys6nZ0lHgo7pktDsaCcw4IxAJHqGvcefeXP/DBlevu2UtkUoIjYQQ2CSgBEGFgtljS/8VRTpjYkpE6HKfoAJEEBirW+i0GiVryNQKDXQAPgSmmO+uZw5/y5L2ffCKyA05ts5RZMxkbxj9A0M87he5znBTAiK5DQagxPb3+29/97sWfOUgw6etcG4cRuKnfpNGlADXVbkXEC7yQFwlaqohZg1ItKSey0/FrtCpq0IzjjZW7e3LwtDN+H4cfhomJVqBmhKCHISRu7Cx5KpfgoQ4qSPMyER8IAb7Gxo3Xfe3rq6dnVrJz6edYpzvzSSBmnNS1Rgx2MT2GqomEelA94OTQxz0Ga/YCosekrZ3bBCWLAgqpWVzv93oISFIcpQFpeSs4DZatBZWaEpv7jwzMyyAXBLKiNgqlY8COPVsg242NQmWcc8gqURLfTHBGNPck9Ze2U3J8D7dt4CkLAUTAMecMEXEmK8ea5eemm276h/e8l8jlComL2WrNYPWuEIKqCevXrz/nnHOYWSSWU2/rDI1BJaaU9hjEFngotNNMkzY1vqX2eH+aZd2raKa7VE52DuT+k9ll2ZHW7Fer52cLduwqDubfEpTQuzDHrNa5TXRQvDHPY1uaRxjvoaC+9IjxL0ETx3cXVHHFdiPTlZYyVyATzaCf67o+88wzrrrqqu1DS1te7xBii3Ux+0fG3N/8JNDYmMz6LDNEwsZi0y7s/EryM+rXs88++9prr2WQ+OAl1KEnc19BUWP2CxFFgMYkNUfFjzvu2H//988+9rGPpfb+MbZRddk9wKIuu+dCCBMTEx/4wAcOOfRhQs09edZe/OLT9t//QBp9fGTXgjzvdveuUB666wuJQXX1XquNjPKD7fpQSnDrlEwWkMt5Ku1TokdyRYDGnupqa8ZxSarvAcinfyhlfgAwHA579t6tFOluzHaD4IphYIcFAJIaGkIIEkKoMT3Ehk3X/ttnf3r55QeI30NCBUFP4Ex8VvRUoyMmpqROUqx73umeEajq+hKJTdnMZUrGGS1cuXpQbah4w+TESX/wcuy1D6pJNV9b3LbPyVu8vDOKeaT79Lq2dR08htP42T1fv+ii5evX7x38ZDoG6tLIW3MNBICopabnvVcYXmDlaJGqjAhC8M5NV9Vd9XDt43/h4c99LpYth8rotsM+Pbh4Y3CWYAkWGCyjCCEQMwTwAXffdcc11+zFNKi9eiFFRCBFXgSjwDU6ZdxuBQK7GaL7BY98wv/E5CSIc0IKKyB2uqJM7VM/o9iplbIwVlYeMhGh/Ww3hqWrsqDDrncbtTgx/sYJMvunrN27g5Zhgcb5wKo11zN5bFVHL2yqUW3StjsNiYiJNY01O2d7kjMVENFgMHjve997zTXX2DW4aJVma7JaEIFz7oILLrjllltU6y2choWpoPqrtd5zUwW5Ws5QmBn5b5H7LF+Mh75ToCWnw/Xzhp65gdmo3702v+VaGefWwJN2xNMSbCv0TsrCrNZe/rPdjNTSWCFb9Wd0aMwyw7wwsxdSTIbobDJUVZX9ldpyVVXr1t1z2mmn3XnnndvX850Fo1DdXYlWemZuWRzF1bz8i5bPI4k87eSPfvSjf/zHfxyfLyVbizDi0pbHsac2NSWI7t/lxx/72Md+5jOfOfLIIy2ZFW95iIBdnkXiIyKq63rt2rVvfetb0VFg9thjj1e96lXMLQpc6N7PKRTEUOBER6eZLuy6K4ZvG7HayEMBLAbsIi3wk3WG2teaJz0IiCikRor1mNmXVdiyLVbQ3si9aGpvYVnd3d7TfWpHsRIEAiaGIITAxA6EqS348c1fO/8j+0zP7BVkIgSE4AgiTWwjEbzoPyJiIkYgkgDEqpCxanTWujLTj91mIhe9x4JYeiffrMUcBSJCjsFVDdQTg7vEH/+sZ+7xmMeiGsQ9HRGwUKdo/ai95WLy5gM62rnoCzUlPASoa2x+cOOV377xS5fuw7wseA28cpTScYrEEkPxbGis9mvFjo6BmT3gRfRf6O4/MIQlgAQc2M0wbWCe3mfvk898BfbdD26QC0BJa3MjZld17qHCHZZgCYCthOtQs+4QpEY9xJYHf/jt72y8/bbVQlVA3kQQIKRoLH0mQIRYN2MiC9L8axAhDoIpIuy19wFHHwPEI35oi4Dx2eIWBsQUeSjAspFsEcF4PTJ7ERESMLEQcp00q4uM19h66w7vZnpMd+yjBqhGlLWp8vXmcybcrUFRmmNesZptbBExpQx7Jt3a3r3XC31JxVbXcIpfKZaPV30t0qWkA32UcsWmJKqh9krzGzZt/Pu///usIM4pMuYYuhFhyeyUDRs2vO9971NTIS/nNgIlbrIA6EO+0aEZYHIsVE5BhsL+R9rSb/ySeV6CMAhBxAerps+aeHcObJUSshuoS64Ket2mDugifwl2FRg/Zds3odIuuDy+8YK0coaywiOQfZFo7xyop1JEqmpw9dVXn3766dPT03rXdvR84aHQIjLYNdVIRkiOmrf8zeoqva2Nge57t+nZrn5VCHfLUUMIw+Ew1F58qKrq7/7u7+655x4RCRKCjKwuKO1yTNbh0B1vCEG9k3rPox71qE9+8pOHHXbE0rk69Pln8tx575Wln/yMk/Zes5ddtUT0whe+8IgjDkM+sTE/EdwLCGxPqaKzCqx1gPYudbetlu4aP4w8PUf5+OkAACAASURBVDZ+cS1yPc2eT7UEkOghJ+JParl4ItHq8KozE2mhwRZzExGIJwQiYc5ICCK+UF8t7bF1Xuau2HlyzuW87Pa6vb+rBe7ILms2EgBUVRVmhhjOYNOmKz/2seFNN+3LWCHeSUi3wCOWYZEU9gggs0KCZpZkoaY0WMQCEREFw1sL0snRo1k8MJMQQgieME10nx/OrN3nxJe+BCtXoRoICJWLGdZDQG45fe7CwrCA3reIHpUSwXAG3mPDxq9d9InVmzbvGcIAqCCOSF2Q6R8xyBrixcLOzVLmjCIuqcJsSuVqCk5PLK56kPlWPzzupGfs9cu/hMkVzZn8DkEuiZ8lWIICJO4w1wBYHYhT0zdcfvkqH1aAnAh3Vk1HTseLRCQSgEBwQhQGgymhAx/5KBx6GDhmHEd7F3GnR9PMUhVIWArS2f8UA3E46YbQ8YnYvwWDksWdY3FHgAzYi1u9ofg66uxFAV0bFSlubv7orWUhdyRacXO2zItf81mqLp0ce+yxxx57dK+iRRSTJ9iYEatTSfKwWztWrzvnLrrooquvvhpmRhYDEW51YZIJdfzgBz948803i3ERFjfnC9ZqzZ+zLotEdcuXLz/66KMnJydHdaZRAlO6tFxuwqanzF2FIfIx49op/LCLrq1qlTbVYL5oR9fFAG1jJPUSLELoXZWjaKCAfL3gM0onRx555MTEBKippJcXFJkjyYWgzIV6Mm+3NFlc1EYmJyf//d///dWvfrVatmPGNQYD28ohd5yjWk5lIXN4u4Fa/AqrpRCkyQS+DbH5Rca22a/izP1yTsnMPXSCvIF8XWXTd7/73Y9+9KOzfJcVmmgrFZYDF8fyDjxw/49//ONHHXXULIfzEIFCidJJyftwKiIt7Sxbtux1r3vdNhHGLgR2UEUulGCg9/5R8nQ8qxyzMHc3DLfVYPVNaj4xhyYo1epauUC8Xdp2XVv9pFVkR6FgpvbkC9p8ZDzb/f/Ze/doy6rqTvg35zrn3qqCKoqn8hQBQZpEaVGM2HbQEE0YajS2RhAFPxRjgtJqN3m0+pEx0tH4Cm2UHjH5iI9EbUSMJhoNGrFIQFQCSgpFaEQQECioKup579lrze+Pudfcc699zrm3ivuq4s5R49Y5++y99lpzrTXfa85dhbq1AFBKKYFSigNmoKo2fe/fvnfVF44Q2TdVQZImMtSIRAGiQOMkFUsJAiIhSZAIEaEomcmBGMIuRobzqW0iESSt9aL+eiv8LQRNuKh1uYWoQkoT4cFUnXb2OTjpaZicSAC01CMCU63PC0CLn82hyQ3Uni/NGhCREqZ2PvidG26/9tqDISslBUlW3Nz9ayJANXySRI2YzW0hF+LQn/pGBQBNTylEGomaQAPBTpLNIfAxT37e68/DylUgkny0rbv/91bquQzLMA7GhutoaFXNbmNCjLj3/rtv+sFaCv1UQWJEk/Gn2UECQCOgJUegq08MRJQIYIqBdvbpxOc8G6tWgQPAntnU0vJi5Lzzbyyk1TGdsc57rcarQ1nkH9XAKCoKdMpW7k3gGX1XVrNfvbIKqmN1G2wwqctwNjPVqCjM4pTYec2LZEMgIlACJUvaPfRmeJnMLNptHduPcfW++1522WWrV+8TAlGdUBKWt5RBgdivKzvbSESB2PKnaGt64li/7tix/UMf+gC5kJOF4ZKSjf4efCe7N/tFYrBx48YPf/jDOZNmUzW+00L9wWuw/oaUAApEklL1/F8+/X/92aWr91ujCWOHPujpmOHT6IP9ChcsNiNOFl4+6W7JGfvp56LAiX/WowJACKEgmGNhORPlUgQ/3UNpxaznt2zz5JNPvuSSS0jAOfe+qk52j99rdsVTDN2Ddl1pqa46AClBTWBAmpyc/Ku/+qv3vOc9o0YxY293Y5+KiBrgdvXBopGiM+IqQphsRmgxFGQFXkSCpizL/ZlxIJ5loJNla8YeIhtPpe1483xcQS2VVVUpljRY78///M937NhhVGMM7vxhTf+iov/IJyr0hpUrJ//yL//y5JNPHo+ExxXYjrBthXa1d2YmQRxUFsgcQnjd6173lKecUJyy32vA73oL1O1uRrT5vr8+qs0uLKQMtrDAnX8AkE+PJWI9YltXO6g/u4SSMUHq/JWU5Q0f8NYQEyMCTQSl3YGOTlLoFUUktm/dPu8eAzD5HgAHQIRFMD3Az+5f9+nPTGzYcECSidjKpKYGSgEkl6NNzSIDoOf1mOD7ObzDSYQAgSQgKFo6Y6FACSyhV01MbKC05vjjTznnbEyugOnJDl3kXIjYLd4/J9CVR5vpTokkoZrGgw9ed+UXVm3dtp9IH2Bnc/TQVRBbikcn1sNzL+sAMwtx4iD93tbQ38B44RvOx1NPRH9CuNPDjLS9ccMvwzI8VlCaGWOUlJAEg3jfzTdvv/vuVSTccQnaJrKN3BArAgDKjpxItA3Vzl447hnPsKJVHALaNLOr1i4AeFJQhAINpRJeO/K8rBC4m6PEufiXF8QVum+xNvdWMlXIBkMpM7UT/xUP6pddddSJKEtvMc35sFFKjikAEGPLmj/mqRmjQYtltmHDhmc+85nnnvfa+sRGjjTybyl8yNorVcttoVoQhGoXMcYQ+Iorrvjud787Y5/nFkz/8d32H/zNXgQqRvEXf/EXd911VyFzjn9vS+rIX0MIECGitWvX/t7v/d6hhx6q9c27ZMoe9NElhXA89HUzhkgvMP5H9Wf2BNnfWVAwL78BkNjYSrqNLIpkuwy7AcU+HU+7PBR3Fvc8+OCDF1988bnnnusVQ6VgdnA7uHS6as/yzepXb0Hz5jkDvTgxMXHJJZd84hOfoHk2pvhNYa6y3YCuvow2uaNslqWci1PvMQTaRaVRmqNzxvd6amw4HH+/5NBI73PyBNzIjmUR9VxAsnXytttuu/LKK2eDHGo7vL1AZS0rv9MPRpcuueSSM888c5n4eLCZsrn28cu6hPZds/olv/FSxWGv11uzZs3FF/++O3i7F8qx6HiUC2HS8zsvvHlBd2hrBeyVqBsD9XojaPbJ+nMniERc3icj/nBOfSUaxSkN0QhKDFO9PFHzotuoCXjsE0O1HymICIggKU0PsHX7w9d9+yff+OYhIiukYknSeGKIso3Slw8Up3JofGTKYURCECIhhtTWsKyTqnUSBBJClCR1ZfCs2VKu4spUiWzncH/g0897LQ4/ApMrIBo1SEpRTV6r/ydb4rvP4XYbCAFte2NDwhioKkwPNn33pju/de1BkBUpBkk07DC1otdbLVP7H4iEKIpUkhJlN46mSiUQO82WEAlbgQ2Mw5/9S8e/9GVYsQrESHZCpO5wLhfFyz75ZViGGpwzuseBQYxAIKSErVtvXbduxfatkykxkkiy7VlT19r3ULuxYJTfBSgRUQo0FXorDjlkv2OejNBDLpoIJ/2gLQYtChhLGi+kepnDBXaUBhHTIrSuWiDvvavJEcBFpJi+X7WvvUw6ESHmnldyDJp5Z9LKrcWzY5Qx6Hobq1YQUZ1UZJ5RSu7seQhU56AWEYyMoMQsDvMWSh1xD8A73vGOAw9ca+ukFpTRLGByDmfTKCyAxd5biyi1Ikc7d05/6EMfApBSNSbwc26hMNGSs0T43SHOpV3TlqyHM/O99977gQ9o+Gd0PWc7BFQAERWSjGFSRFR3/a3f+q3Tnvu8Sj3ZSXwkV9EUEWm+c8Mz5cgvr5bUs8MUc+XApaASW5+712d80H/tpg7wP9WfUqMdtFe+ZqTqbtKud3sZFhmKXTlmnQxVyIsrxYIZTE2T4MMf/vDznvc8C360AhRmyYJnsu2kH4XuaecBpbaXVZm2kBYKA/gtb7no6quvVuox39oBeRfm7oKWwK2/uLCZwjKiwaRox3Pp3wShwKbt78KrHTUbf6chH8OIPNxMFSZmb1+YXLni//vry7du3TrL7nlKnu0AzQfkwhoNKxR51Stf8fa3/zfHKZY1xAYoR+OiLdhTNrV/5CMfufHGm/7kT/7k9NNP/+hHP3r00UdjFrxjj4ZCWRhDAz2dRCeuazYwo3y4p4O35wJNJZiuSijZpeGv22ZnlwPQZEWLVSei4cdph/bGNz3nsQwFA4NEVBXHChsevvbTn93v0S2rIX2JXNewyR1DefzRxuLLswQG0JC8lBLV0UL51bU1szED11/dIk4QLW476IVHUrXvSU894sUvQX9COCSC5rZHm43lD0wusZFH5gJBe7/pB2ZGTKgqbNr8nS98ad9HH92PeAJp9CHHTqvDtNC8+ZsrADTXJWqTJRJTmug92ucHJ/unn3sODj4Y/b4e7l4Kov8yLMPSh1pgVUGWWaZ2Ynoq3n3XPTd//8BemKjjs5qbm70P/Ym4Tfk5l9sRwrRgY6yOetov4pBDwPmXtgSJpSHQeFVnDPXwP5Eze1lpDkOFF7gLJSpTs1bIGFp0dS6HtuhALppjFG4ltc6862RgGI/zzHTor0MaXyheWaxkmsnkPf7ZrtGHiJh7Tzrqya8/7/yUop5I1uQMOkYLh/FxMf4Qn/mci7WnuaWuuuqq66+/fjb653wAdSJfvJzjbZTeYQ7gne9858MPPzy0Tb9abLzFSrOvIkKCQLx27dq3ve1tapNU7A1FSFcMs052hLcyZhNLg+7tNpADuMNuXTVMXGq8wqpuNyx075dht8BbfDA79W385BZbQLWeVatW/e3f/u3RRx8tLs7Odr3e48vmKu3S1aUhcmbkKgQMu+ijCLdv337eeefdcsst87cfKVvHlJjstt2h3m4i8Ip6h3HAHFqd0C2Plt2Qvrqa2tDbPInr2kC7nA6O+KvhWOf0wQcf/MxnPjPLvhnt7V7x9McWrYgceeThf/Znf9br5dzoyzBr0OXX7/ef/vSn/cEf/MHVV1991lln7ckMbQbwMrxtLs/lPXcrHsToXTZe1+iGZ+52/5cmeBHCrjRnZ91F+ylLsKkJAsgMQj+bD9umQ0SaaptjgNupvuYVRCIRSawwvQPbd/74q1+7+/pvH0JYKWKFtzVkMmZ9MAEJnMAp14/WlJSprj+dinrTzJyclhpFhCjnTxSkqMKuBRk1qRmIK6bpXtg8EV54/hvxhCeCWSRy6FuONm4pro3Dn5mJZohCnRcguFwwojnUiCjFiKlpTE09ctNNP7zmmoNAE2lAkoAklIZ6o4jI8n5KNuDqT2K8E9BCdIY6IpJ8AL9KUYgr5q3MDwHH/9qL9n/+89HvCewMIFs/3ZstdnPZM78Mj0fIrtAEJM1KaXtERFIaEAfE6vYbbtj4f2/fp4ohJbjzfxbQbUHiSgR0LyllSzmSS4hkcmLL5MSTn/VMTKyQOmopN9XhF4vrLZxNZqgWvSWyMwiqcngxl/IhBTiFAUARLA6nKkiu+JxZ094DXl0pDDd+GQxJFFMwuA6/84epfbPdiwu2uojIcuKIiKRxPHqUmYacrdwLuIG4xyElvPWtbz3gwP2IEUItzFFgZqRUMSPvv3o1akhgLTEELjIqOmU1TU9Pv+997wM4pZHG312SkmcUC4tRdyX+AlGmx1oE5fe+971PfepT+bonMo0ICyfjthaYg4wfVGlw9tnnPOUpxwOpqqarqho3QgIFJqeZ1GKetJI8NO27MXbxuUQ0EBkdFaIwFI3UsT/aJBbR4tKci49qekI59j1bQpuNNrQnwiiaUMB4nXzMT7pgROTwww+//PLLV61a5e1KnibYKWbbUMXOaijesJC64kjg/fff/+pXv/q++34+y1NWu0oJLfan663cHSCCbcBsKWZmfwrBSx2U410a+URAUpeuHbVWZ7OGx8xj8dWTR08x9INZn30n+/3+l//xK/f9/P7ZoKTodkHzvWCmMkMIFAK9573vO+zwI9GieHs25ZkXoE4Al/1CrakmWiosbO6gpgYmQMpou2HhpUNbvip+yjfIKGpjd1qIcVtaK9++R0Ejm2lesdbuq09aCDWaaUVU25+yLYg06tloS8EgbEdLtqc1VGAMjJd75gTs4E+KAwKhSvjJXdf87acPinG1pCCp2Gz6LWJIskjUW675B/O011Eher/azur1R6TKAhiti/pUAiJhJ3B/tfOoU0894kW/jsmVGFZbc1j8yAwBPvMKxZQTESSynld69NFrr/z85JbNawl9kQZjLeJVhr0Y3Wv2s92s8q5jYACIwAwhUODY46l+f4NUg4MO/LXz34D9D0Dom+RBRGrqLXC1twqOy7AMjwWICEkYhBjxyMb1//Iv+8ZqFUC1XFubhmx7CuoCJmiThcb3RZSItsSY1q459lnPQr9HFFDGCYrZGrDY8USzPFhtIq+pQHZdxYjyJyoNr0OoaEeGXlxUzDnYiLpyVTNSdyq5ptJdQt0J2/G4HUPYZdfPsu02FKvCK2Pdae12yeOqi66qqvSGww477JxzzknqB3Rgw6R8Whl5+EUsUr3xmuxgEAEz//3f//3Xv/71/GOqqsondJs9EsYP04+3e8WTCB2XdUANCrZrQggf/OAHZ1l3wjam4cragUt7v//++1944YUiCBy2bdk6GAy6HW5ms72wrfOeppm4aORulIXC08MFFlSK19FYm77fp35h+1EXVM4rEt7unFJ6LFn5liZ05cwiGd9ideyxgF/App4MXSS2PNBeDF4FGKowply4GcDzn//8D37wg0WblnfM1pL/yVoo4gQN59SxF0i2Ud56661nnXXWli1bZpwdQ4JNqP1k0X8FEpQsK8HpOtV2D4z+kDNWSjvvpG06e28xcI/M7hgLWmR4tuH767PprQwT9qzPnsjr9U996lNDxIDZgbiTnsrFdMjqrquq+LznPe+ss84yIrZ7b3lcQ9uTvndj0naZZU7wVAWZphUuVS9vdGVgjJb2/W2WL3XoPXsoNzFQAlbyEWnGZWKtggp7lky2kD3qpx2lUimRLY8M2gxjDAzF766gO6mT2h7Iy0WAJCkxaLB9G7Zuu/XLX91664/2R5qURBKlk/dQGmNZEol1CWml7Akhm9GEKIGQEkOzsAmJRhgJQD0GI5EkRi2DhkCB6oRDgkQadENMHKb6/UdW7fOC887DfmsQOEZ3oDuX1hFAs5XlvVHnbyxyUC7UAk1MbR1PIkCxqrB9284frP/RP3/zAGAiVpo3UojALG36BRe+6DelNWu/BqqvR6EomcsiCBhMkXiaaGvgB3vhOb/5mxNPexr6k6jN6g3k1JMGCxfAuwzLsAQhU7nspxJYtBQxx6rCzp249/57br55H5E+orpY1N9eeJZTjhk3uYSZ64gYkBDHXm8q8P7HHIOjjgb33XOAC7ehxx5Q8JhhNkqj13OGajsNERt3lpnr5MhtBd4gzVRAYw8F5X0a3+GJsMl8gThQO/yqnTuSiCCtJKdo43AMYS9EmfmH4TE4M85so2oyJQhYlH0RkRb1E5HBYKBu0bf87lsP2H9/ZmaE3D7lBVafqTdJuhHGkliWH0iTFlDqRM+SUvpf/+vPAtfymwmCGBcYlYDG+oksg9nbi+n2eLCNY0ZG+5ty5ltv0atNrhEkHEK4+eab2yUUHOYzsSMiMAm1loFmq/Q7NxAz6uyTxx9/HJEAGAxqBb61hAgWPI4k+k9itj0pwcx1GOpuOfwzKEGkjU+zFJCzli4kzH53+K1E7gypJ4ZQFYPgc24mkAiZ2mB7P3MQqefO0dJu43Yds9hQiwXeCOsvFkhesv0fCuRqjDCzEBKG880ucVbws2bLoP6JWg/q8rjgggv++zveLlG9pKErM3iDL+U4QaN73ppJOc2ItSDO+qY9Wbdu3QUXXCBC4+PHqano0iSMNoNdMe+GBHZFfh7jLKg85umP5IRjWu0AmX7aTjR3cpsPljp76y1tF47HM7mYVsyOdHRpu9FecgFQPtT0Rz/60b+su3aWh0lm3FkpJZGkphAiYvBbL7zII6RtbVuGWUA7snJhRawFA60a0jAsY81eqvGMnpxORE5HwPCdUkbsdu/026R4Nean5ON8QiOhaVykkiBmBlItN0IEQsLIx49SAlHgnL4jQTRPeiYj5KxkjVEYGVFVVeUDTU5z88JfFwzjhfD6WJZ406AIh4BB1Y+S7v7Zv17xuUMF+0I4RelE9o2iSsU4bfyotWsTWW0hNs9aYYREYOYoCVJHrErgqR7/fHr6uBe8YNXpz0cvxJS434PzAdpbZinBLISgIwJKrSkjQhyEBExNf+dLf7/vo9vWcOiJkNTsMKWkQ9bx5GdrczC7k6HIHxzCW1d0IdX4IUi/X01MPDA9PXnMsc88+2ysXCWkZ1ZHSkXLsAzLoFDvCCc6AwBigEDSz3/w/bThkf36/b4gu1f09kb+SPlrylYET+qZORJ2pmpjVT312c/B6n3R60GGhLCNYroLDAU/m/Hm4jO5LOyF2I22OO6f6toivUqwd0BhUMAwam/2XNV+pQMFSe8KfEsWY7NnQzaEEAK49rPWTzDVGfwZod+zdo499tjXnnOO6tJeHR2q+3Vf5Dsm0pwQIaKvfvWr3/zmN1UFlWEG5aHD9O+SbHuyG3y9RT+VRkbMnEcOGqafTQmDwaAmWSwAPvShD42LSCIqWiu++k4mSExx9erVF110kfVQX1e0BycTFvFKALRoxdD1qR/MQuFbtpx6cBnTRo5r/mHoRA/tkl8epcia11Uh7RcU0rcAEQsKk7aON8v+LGUQp+hiD+w/sgZu8WiFJb0rfvsro9h93laYmJiAIwsi8sd//MfnnHOORjHrkuBcBsG2ntm4/YskRyzqPXqDRtJVlZXKKZ/67Gc/+453vMNeYTXBRwwBcLSOsk+CXZkvb4edw+m29osB2mejcnVH255Uu9kjtmi82LBG68aPwq+HAm/UPqpfLBXrs9qXmfkLX/hCEb0+I0LG40oExhtPedYzz3jhr45nyo8FPJLn7y3LsGBQEO2hXKktbjQChl/thTDQNS/6/eUZZZf++L2zGwNZdDAMiEhKFZzXSqUsoVbCcRMdSZp8iYUAZhzWW4pR5PUrBMFd6u6uAGsxs+KxOt1+NZCdO7Bt+/VXXTW46ycHpgFXVU2kgASyk96h04KPfxARoK7kWCeXdOsmLxohqsva1occXYsxxYw7AocBYQvJ1AGrX/SmC7B2DUIfIOIeKIRaHwiC0gFLqqCU2TFqD9i8CjoNoXVXAKQYMV2hGmz79/U/+MerD6zSZKxIagaVn6jnRy8ys4gWEQIgROgxSCTk7tfGDqIqgYEes8a01l1gEkJMmCZsC72NExP/+bWvxbFPQb+nKKJmsQpQOjqWYRmWoQGC5M3NIAwiUsLWLevXXbvP9h37JPRSapMbAZo6l6LbsvZAiMZ8ERGYqpQiYzDRS6smT3z2L2FiBRrmOiQDrHrAFpdxyojTagpGY8mZOdBhiqacNDQny9xtiZyL/Cl7K5Sj66hJcLEnqjcaTrx5yzXQktKWIPaaRZ5IEs2Y0MqGUMcEIapshgDuE/VIWBAgBIgFYTHAKeK/vePigw8+EEgUWEWOoRG4GpxYoB3tAAgCWUBljPLeP/1TBkksBXHrbfti8LKfv2KLvCjFa6358+PF4X19jrlXRyuFJoQqIQK45ZZb/s/nPttdA/UVAeUc1hKTnoX327yxpVJd1VCQzjn7tccfd7wGlEIQQuj1ekJghib31MhKG4VfkBozqPW7LYxLr2vVXbsSiGn06l0KKsSsd1azogpzdr2iBEx1bJRWSWPqMfW6qrs4txk6dk+jt7vYvSUEFiO8p8W8tKBhfJlcuN8gKCe0tUHalq8ch9hgo9/vZ45quOp97GMfe+ELX1hV03X8pqDHdWnvEIK3mvmYPsoBlbY+/fb3ZNATRiK69NJL/+iP/ogZMQ6INFSn5uzF0DxC/Ljg6F5hJH2s2G/b+3yb9tVkkub+JFbq2zap5LijPBcYqjEVDHdGYJdKpUUD204szrk4e72et1r2erUqJ4Qv/cPfe84yB8ISaYlbOeCAtX/1V3+lGU6HcsPHDl66W8p0fhlmA8VeQ2dfNGYyQT5TC0ItgXgSISIUGDTDzir29fiVT0SzyZzrG5x/aE7VKOTPbCVVCikR7UMGSZKIgIIQiFmooE6s54RSSp5fUFbHjC/UdNg/7NlwVxCxO2fcn7uxgUWEmEkSYiQg/ej2733hi4cQVsU4kS1lXYd7oUZIZ0W2+G79IqSUkjThgTVfjcnC6SPqaE092V2BKmA7h/tiPOUlL+2fcgr6fYBCCBjG8JYI+B3SLAIVN1PEI4/86+ev6m985ACmicyNfMgkGoy18o/kiA3o1iaiXLuo8TNE95UCp5QSGBMT0/2J+6anjzjllP/wGy/HyhXgHH3gWlgY5CzDMuyh0JJliUCC6Sn8/IGf/Nu/7c/UT5XFhGeLJNS7UBAoypYRItKEx2AaAFtFDjj6mP1OOB79HiigXUCm3cIcxxfsKngdZvwNLbkfLf+e8bvWEW/n91PYo3Xs3QZT1zBk/dScxZ8I9opltx2vAs2yA/N9dr5onIiQq8qOeqRQKQGApf4YaiUNXJv2OAQQer2eZ6OHH374m9/85hiTni/2q1FBr9j+6qLUwv38dWZcffU3vvSlL+npkKGD7V7v7iDrp+Rd4I/3plxflVyOIXvK2x3suuJTv4YQPvhnH5ieGlhnvCHALyrbuR4tXkYFEYhSSmvXrn3729/uscO9VmCjukhrO4nOmI8J6pgwxBndqA6waunt43G7uGJMl2p5TNqatdVrK81LcY2+4YpsCqJfFeNp794BunT3gmybDf9y9V6GkvSu4sAO4BZYvU4Eap8qoN/vf/rTn/7FX/zF6elpdsnIsnZqm68Vt6jPenZslAeOGqDNkfXKJZdc8rGPfazf73sKNpSJexhKFe2nUU/tNlib/r3ksvBrnzmnBbeJsMPUdkWGeWd3u8/+kaHHwH3P7QrnBJ165x133LF+/Xq0qfps6OG4DhNBJEY5++yzf+EXf7FIULDwioMp5AAAIABJREFUxHZxyfsy7CoUNhC4GWzoDFqZKJHz0vpGCkpSkBfffldZaMtpi1mSZDbgB1uMRdpgIoRJBU2APHFMkeyAbE5S5AUPo3LoUIyaDNol1CanIZH/Hsy7hdGkp1gEs8SI9iNND7B52/c+9/mJe3++n0gfIKktk0Ht3CjbtTVFfuVp3kkisNae1tBTphCEmJgTKApVCVGQQGAWCrlGEUFIMRtFwCz9/lbiHU98wqnnvg6TK0Asmg3UyXpSZ1Kso2zGj7clBz9WGJc5qx26D2LGYBrTU9O33nbLV/5pv8H0ijgIIgxoHfM0VGfTxxsfoF5gIiaRHlFAqLN/kjQtaEIuABwq0BTxZqJHVq964RvPx8EHI2h4STZz1hs7eJvzUt7Dy7AMCwz1HhF1HSRmABFVxM7pO274zpZ7fraPgFOmzEpQCZYSRITUhROIWPOxgUWpH4UEjkLTgTdBnvgfnor994dm8RXJ3rOGziydjUk5yMu+dm8owqakoWP1uSRvefEteEUdS2nUCwo+T58XI3LcjRc4xqBoRkVxUWC0alp4P5ubGz2NkHKaMCISNn1St2hirpmm1EYfsajJN73xt4844kiRRmgrcvxhtJAgaEpd1VlXsncawPve977BYBBjHTPtWysGO6TlbDtAZ778BjEMmKEB7QObBn5z6Va98cYbP/OZ/+M4vusSNTl8Cn2gHqnLR2kiL1F4wxsuOPbYJyuFExIBNMAHAPVCoiQsYSIkTUzeI81Wl/KpmtyO0zc096VAc8OJCFE946PWd1cLWmjIQxhFshRpKaXsgqntxcw9+7VQQlqH1l0oRAj9nCh8SGT9Eodify0D0Nji29ca8BppK8hFANgRbxUutCkB0oEHHnjllVcefvihVTXNvWAJK618hPdD2Nrraqr+q1+ivqv69y1vecuXv/zlXq+nBDBXQx0/9OFWy1E/7R50tSpP4jzVbfYp6VHD+vGspPMoLjvfxMda9izAyIj+/dY3r9mxbfsut4wmS/WQkMgkTLzvmn0u+O036blGv0iyPLwMyzAOuuSlJd4TmeFbAHA2VjLZHszZ/4HOsQNkijf+7QrtfTpb7jmf3MprdmTRkd52ZDKD0i1zgVcpCqDCQI0xiVk0lkBMWUJIiEJJabKRMiPpllu88F21Iii7OTsK/4xk++gQ4bINo2yXo26uEVRFnpreceutN/3Dl5+YZEWKvbwibA45r5eGoLV7oUp4EkmFo6/OviySqMouYHMFV+1UUPUpSEKCxB5tk/RAGjzj5S/HfzgJvb4QIzAxS9vE3hnU0JE2ME+8pNDAW2pPipiewpZt1131d72HH14beCJFklT0RA3B5Bx9thFtYrsKVbYfe5FCT04RJvrTExM/27njuNN/ef9f/s+YnBBizX8/FDmLKegvwzIsYVCyVW+WmDCI2Lbjh9f+65qYVoGoY4ZIqaGVejJICWNgPXqZxX1CYkwBj/Z7JzznOVixCr2eIB916NgLTK9YgCGPAu2YT2YnjubbxTSMSnuNSzpI6zaIxys58ufcW9CWE9qyWuv+4Y/vytt379nZwKhlTERWiAD+KFDmqjYoIgI4ite0Xe5IAIDmULM3isgTnvCEN73xgm7eSWtkaMdMdGs6mftgy/jb3/725z73OdPMWze3R03upLbfODLMWO+t/OKiPi3QwMvrOQCxIR2GwP/5P//nYHrad6llBZsJ/Nu18bVr11544YXFGHNIV4ox2jHtLAeLZJOuTaU/vejxgPbqJekkJmpP01IgEUOFc5u7/Gt98j2lJt2Qzw+ln4202hL19HMBxzSXMHRHPE6gWPaUJx5tc6QFttht3iipTXmqxUpuOq4LETnuuOP+7u/+bvXq1X4tNVnJ2mzadjeGFbWwyKNi4jwfn56uXv/61//gBz8IIVgSEuz6cp3ztVEwwUImIecd0Q/MjOwhQPsItmc9PubLN+JhPraqzbViXoczNTX1ta99zcfbFqMeA9KxMhboOvPMM0844QT92jqBseC7+HFIN/Zo8AvV20MKKYvaceVDZcLu1IuDoU91Twvt3vqZ71XnSYe0ZXvkTeYxI1mLRIelGiZ9O4o9zZfSxaSnaf56PR+SLZpFJ7qtqDyqzGYoq7AhjTrGNczhodbJAbbvwMZN3/jEJ3obHlwrcSIJUqLsvq7xBUl1+EZjr+5aoQPQM6OkSBSpS0siJUraVoJG+UHqqKJsoiUwkwiliCphCvIoy8RRRzzvdedgxUoo9+WeL9kjMxkfC3zO6WrT0Sf7V9vyBZDsmkuCJMzA1DQGccONN/3b3//DIbHOPsnttqQekHY0u/jcAfAEJIdvZqY6WAMiuZA6iVomU5IoaUC0mRMddsiZF7wB++8HV/F8GMYS0dzz1GVYhj0UPG1R5xQRQQRJUEX85Cf/99vfWc2YkBg0Z27euCQIzYO5dhpTgiREzTZCJKT1PXohTkz0Djn4sKc/XfUIQANnmqqR5pYYyk4WHkRk6Pk7jzET7rmdaNJ/sEF5NWC+zxcvQRhqERMRi+ZopBMitE9nSOGvyi10m1060F7GScSM3aYeA9k1S0TqUa93gYBBdUK3et8xM0tMJESJEIGYlAsD0Igzk5IvuOCCI488krmp3+0lXRSbi6C11Bu7AEGj/EjaFWwI733fn+7YMaVtWgPdlsUpwH4G7X6V9MxqYG/3mmddnrsxsDZIy+2AmTVhzre+9a0vfvGL8OIpS0IUAgUmRq42PCyPUBYXnPFUUkq/89tvPuqII8Hksh0hxqgmYxHJuaVEnTE63iRRKAkldewn1AnHNRNlnbu8JcGyKjhlpxbJkzombMh3xusGzR0Mq4IoJAlNngHd6XV4KdfP1nKutA4Fd4a8J8VRFprYbjy4RwO5UwXMrHSs0C1tGxZmL4+BzmLIJ9AskEWAJM985ql/8zefZhDlbLxFg0ZhgOYGe4vdXCRGLEZkJOihhx4+77zzNmzYkAOql0Ssw1ArhlFdu+L9QFbdm1w0k4gwEZs6nOD33Xitc26BnI1SRHq93q233nrNum9RYKEEllwmrkV8urYJFNQsf2k6Twh9fvObfoeEAzEXTiJC6TWaZ1j0tbQMuwQFqUFbzvEL0okx2WQJIslCL8Sf8PCPE5FJd5g3NjGHzbabqnm3iIjEGAc5njF6Jz0atDQ5KCFE4KwVCpBQS7NRzxTlYiTRxGMAyilSqlz7bAkujR2klJoYy6FdL9DdTFsnEb6aLBueN2t/uD4lg2kkQawe/vYNP/7nbx5MWBkHIdeiJQHlw1BKvfRzGPYW6qwzdCi1ymHeKjykHSIwUT9Mhd69Mf6n33oVjjkO/T6IQq8nIoqIbuMYtpIWgaiJiDuPTwxUA1QVtm7/3pf/cWLzpv0l9Tu5kIkoJ2AG6iJyrRv0qw+7kBz3G6BKKwVrARBi6k9OTU7ePTV16m++fMXTT0ZvQt9UrxNyr+mMYN6wswzLsAdAQyEzc6V8QgpJIAnV4I7rrpcND+4L6olwFIb0OLCzEnDdVC3IpaQib0P5iQjM0yKPxurQE0/E0Uej3x9KRT0FWPTtafRnaEYtAxPuu9kS0ZZapG2gGSpM793Q1XAKeaBZMADa5/KKZ+1KdyEtWehMd8MWi/xoxTlHSkJJEFOcjoiQKsUYY0yS1a0ozeOKkIMPPvjCCy8sYhX9B8+U0Sml6irLtSYlhHDLLbdcfvnlQ2fE+lAM1hwPFhqJnCRIXCZKZMN9cidO7KKIUFtm0C7onUz83ve+N7ncmuaG1HAne8TTpWJ09lcX5lFHHPlf/+tbi6NVKSGX8QUL6lkApSQpSUoJImAiZl85x0+E0QdPKEII3eOEPlJgiSxvb1ctSLdfXW0j8nC3RCPna0L21BJxd2O8SwFFQ5MYzBL2RHYwapieb/q1UWjvPtzE7wvvF7QclMXmtStnnnnmX/7lX1ZVpckKMwFjuB1Uew6cI6TQTA261LLo+U03ff93fud3PGcfg4eFAU9Y9Ip1zyd8LDJRajyQtPmsV+C7K9mu2M3dPJVzBV7TF5F169Zt27bNvnZPZKJNN7ocqgCjvSeffPJpp53mV9cyLMMugd9B5Fwg7SR4rfALFGrOMEvFUKoyT0t0Dpv1TXnVcseOHVu2bAGwYcMG9U9T7QipjYldjQAdkcMQ6MUPLZXmVa0iF2dbMszcoT0ZQK7K2n2BxrUVIqM9O/s00ubwaMiu9mwwjYc2XPfp/7P20Uf3E5kAGGIZbrj+Kvq4aKyfiL6fQZLRxNlw6fHIXIcfIMdg1mPM3FC98UATJ5JSSuAB0yai/vFPOf6//Bf0eoBECOyQQrYoU9t7PHT60XBKEpmTpZbcPyD3Rz9ogEDuUAIggwF2bN/x7/++/utfPyDKSsR+x+utERmMnNpDoMnp/HCQLRpaW82SL0itiUkUUcs6wJF4J4eHJU2ceMKzznoNVq4AMURAJMh5skof7J7kjV+GZZg/aKuUTjlPCUgYVHj4oe9/45/XVnGlpCCJkBiCFBnJ53MlF/xDpDbKOjqGiNRZNh14Y1Ude8opmFwB7hOF1OK+Wr4NaI70ypisKwsAhYA7VFbw0rA9UqguhYY2vsHHFTTKpPMk19WTBVZOHmNxVWi5SxAKBg3AhVI2yl5KyeclFJczEYkYgYSVg9W+Z6nDz7K6HYWyx5gpQc5//RuOP+4EH6HsMezfXp+ByDE1ACzpuLQTw6nk95EP//mmTZvEHZxrc9ghY0f2PZuXW+MZkU9ha+3dlpE075r2icWmVynl7oG+9tWv/NM//RPXZsEElpRfrv52ACnVGrvU/lETz1D81RdfdNFFBx54YJbZMqlkVDHGQSUiMQolZgmIoEQBTEkCMQsoCRLVRc8lB5SBgisdaRYEDV8dgze0pb5FAc8sCjHeY1JNxjqTenue0zoKwPQHjSeVbA1JaA15N8Y7isbOnw2lC0aFbrjhhgsuuOAtb3nLm970pre97W333HOPu2sx+drcQhfnLQ2w7dsr9nX3r19L/ikA7fz7rOm4LNPr6847953vfldVVaas2lFuWwOF9ouZePrQD9qBz3/+C+9617uYuaqm80kR6lK/BYahAyw63+CWmvzCLTkHSI1xWUreAaAtLs4rXTI6k1Jat26dBSqJiBqcKWiNMtEIM7jTkF1seCBzEQFn/darJ3p9TUa5nHFyGWYLgib+sR1HOUpxsA3oZbx6K0ldnHBOO9j8a133vQUSxN85atd02xlyz7DgOSISiVNTOz75yb+58MK3/vd3XHzOa17zmU9/mnLooU+vkYMrFWqKSkTd+iuUj6z5DBUANAYzafq/epvX5EJbtjnqZTkyqehpM2e00tFH6XR0l70Zw7haqlG7ddtPvnXtPddd9ySRyRgZApBATKdJBEhduVu7w8QiSY8lM1FsSzmeaqeUQs2gBKhPMouIjoqASsAMEQQNGQCJSOrzFPceqgZnnHM2nnQUegyiUGOpDj7lECzQACOkgeLzHDIMaYykrk0iUUnfPJMxAZEkYXpw0z9+NTz40NqAiYHo8bSiPzTMUQAgdKReaJACQxUh5rrSuq6oBAEH6fe2Mt0ztfPXXnMOjjkGvb4QUeillFQRGLOWFl3iX4ZlWGqgxsHQ62HnFAbTm398+33rbzmcZIVIyNu2aweyXaZfdYurppoICTxA2skT/TVrnnrqL2GiD725zcWd1FsHZc73YMeDsa3xhILaFslCjffKfI2fbJR5PNMfP92lSFe7FcuyBl4EKdZb0chSQ2xLJpHiCrJHFSYp1SKdsyEyc4xRT5/lMTdjHwwGIgIKaJt4DjjggN///Yv/nzecL7UY3FqBEClSj0lSoSfXSWzXpbE+M/Ptt99++eWXv+1tb7dN7PlsMXFFClFrmYjMr1E87lvwE+1lIR1H3n3xT//0T2tppCWqtBqvs8VwLkZTp4ppSQjW+JOPfvL5559vOeyt/yIZ4UlAoZbwqbaVMLv0drnEpKcP3UOmRNTVTMavYd9bkeK0+LxB22at19pkn4gotWyCTtpXAbstr5KzUD/2bdsVkq39oTfPOaHwnpLLL7/88ssvR56jM88888gjj5zb1y1ZMGpsy97/alROKYOP1FNHBdoMYgwYJUkpXXLJJffff//HPvYxjbi0ZtGOsNuN4fhFbh/e//73H3XUUb/7u2+uqiqE3dyAc7V/C3QVnFE/GHPUK6wHZdw9XmLR4CadKf94FxaA24rIpk2b1q9frzNr+UZtRI2UxWxaZyl3ddrUx9esWf2KV7xiYQayDHsrdKV9vV6svVJNcEqQZG+l7j5rdp5623QbpWH0sbx06LMiMhgMduzY8ZGPfOT2228ngSCuWrXqNa85K4S+iIg0dIaZU9LMiA1KfbOSAweNfYRMymoJJDVWy8wdInfS7IpIE1veoMPNXzt0k0zz3QU1o23U9fI0AEmVXsL0AA8+csNnP7d2avv+KU6kxACJMJqZYfHRlGBCfUQoIXVUZbXrRmmCJetcSoKEbJEGi9WzJSQBcy9GEWKhEImrwJs5HXTiU576kpdgog/qgViEiOsakVmVrWMAZ0SIuHj73ePEBRARabZz1NqANk2aYtmbrqNgkKq7fvqDr37tkJRWxiqIBBKGOs4tX4uYj9EiRNRMrDMnbQ8DqeGcmTkAGvkAEQETBY6EQb+3sc+Hn3rKSWf+OlZMggKyAKQBspQHAgCiF9uRocuwDI93SBoFoF/IXAiD6t+vXYeNm/YRBEceu6B6aab7yKYHl4FuYmKbxLVHHbXPMcegN+HdUV2i1lUGFgW6poQudG0NQx/0kvToxh5HFImy6ar+ztTUNHN2kELmKxBoX4vri7tsZgQ3jiaLGdqjIJUcc56E+jhb3jWd8ZLWquqkVk6vPvusZz/nlxBqDGvLGi8ZqPE/16+zoq7Zrqe5Ao0b6wkYEeEeffSjf75x4yMEaWObnRRXR9+43jaxnJZpCE5ep7ZFgzrObC9lpqSlCiWl9I9f+6dr1l1r7m0RYQRGszaaPrAwgwKoR3UoJavwR3Xh+BxV9Af/452r91tDdWCUGyFhML2zXroSITFLfkICEiZhJCLhlJBSc0rdxGLNuJpqmVcSYk5JOW7ddukJZicW7gbQCLLMzIGY0Kw0sZhc519w9hrR7KkJIklzr3fGKBy4r8tylmMZtcHHY6N4ag7x5tVO1a+mpqauvfbabrKCfPMSjfWeE6jVECZv2/IWNL9P0SFohky7YUYWDD3lFtNll112xhlnaByl96/41mYJXgkd+qCIvOMdb8tFvQcicTfOZlG7EM2ugl94xcXiLeggQWIy94zdprKf5aDUHMHW7AIzVpvEEMLdd999//33i0ilHvRg1TN8jJVo7Dx4WDRPm6jZr6ef/oKjjjoaLEJp4TNOLsNeCX6vGd8v5BkRIUsyDmhEc7cRjPA3zAbI/WtDo2tQ59/41nYV8vkVvv76G37y07sGsRrESqPZt23bZiwADZkiouDJr4nC2nNL3VNoBESkEle+mBTNADTHNxzrARJzTo3pKYXPL2nz5ydv9Dh3jTimlIgZkjhFTE098K11D91080FCK1PqQTiPgoCQw8L1iBPUrq2JKU2mH9YZyqjSkXgRjaguN5Fcr9UrJSJRUurzjl7vAZLnn/MaHHYYen2EEg+NvI5mpY7Bg+d2cyh+2SLwu4VDgCpO6gSYmsbWbd//xj/H++47IMVJkSDJpNgmOAYwI6VGZ2pwR51S3Q28xXET2QENux6JZXLFlsAP9flXz30dDj0UoZ+oPkVWP7i0NdVlWIalALbpaiVKM6kNBrjv3tv/9frVoH2ILWPvKODGkOQDfAjCQjSFtLUXjj3lP+KAtQgB2VUIAETSznbkWc58jXl24NWqUeAtIKaL+geHqgeP8whKgwa9XndqY8/nl8EwDRaO1JPL57j0wDRz8qzJFo+CVY8pjiWqo7t7VjEjCkCz3vTD5OTku9/9TmKuxbReXSZGD9gSkR0yat6OBr0qESn4/GUA33nnXR//+MeLRd5d0n5f2BX7WqTILEbkqYFlqyRnrLSf3vve98LsmGI5H7l4S1eICiFwPwgTM/d6Pcv6feqpp55zzjleNFXQPlRVZV+LD77sj/1UvLc96ia1xXgYRS4WjowwSccFnsXoFsWOsdmA2V9VB8v6jHiuYWLsQtGwoUOe8dkxiOrO4y4BNbyvfsW6devuuOMOf49lqXo8kH0drA+NNArjP1DOLavJEOHYwS7xR7szhHDFFVf8wi/8QozR1/We29HZ66amBm984xtvueWWXq+3KNNqLx2lHnr86xWfrKNY9t18lMp5fVMLyVs9xf7+978/GAwsQwi5CKlUlykD57pb1nMflqVqeUHMAbzyla8sEhEswzLsBhhfI+eP8QJSIQV5wUYvIa9JX3Nl6FseMyyQh8wIfq/X+/jHPz41NaXXY5Tp6el+v6/2MLsZHc+QF+yLxgvqB1dT0R4s3D/WHwAxxpadqPhrM1TYRH1bRbvjEAG0e5PYajcMBnjggW9fccUTpqb2TRWnqFnWckocdWTr68Sc2GYyI4YNl4giEEU0i5N+SIAQyBLugNX0piXCmXxMAWl9QwmIzI+kavUvnPiEM38NvR6IY8q4EwElZiBbf30VvAIPXvzt4m1OwC2RADC5KdeioUgVUsLPH/jeP3xlbRVXSeqlmHN6ivrb2YURt/snjS0/Dy1lCSbV2Naw1PpAPgWOgkg8FXobJB323NMOfP4vo99Hnb2LkMiKQrbiYpf9Y8uwDEOgplFExCCQcIqoBo/e+sNHfnz7WuaJmNrBWQ1NS2iinvWKNy6ICJgkUBX6WwId98xnodcDQbgRFkWEnPXBnk11iNGigXG42cgEBQbs0IG/WFDvsbL+4yKa0iSJVv4dJovaA5Ay2FNdA0chKixM53cdGr6pC6E5Q9AuNeBlXH8xYdTYLAI6q6kAiNQh/8IzXnTmi84kLcNCpIcPpP12AGLVZkAa0GfdEEnqBheJAlbPawjhf//vj258ZANaskdsTkjkMzHi3RVWnxEJSNyJHiqGXPzkZX3bX1deeeW/XvsvgQNSFmoj7L2qroo0x+dTSixMiSzLrcuMWX9+17veNTnZR42B0gLrxVwPXeFWPxRHmDUggBCYekiEZHRurIg74nULBOZEIHhnfA0u6jlfIRIQNVYDaedGNywF1jQ+oklId7+Dj0Fza6Zm1o10aY4uiaqq9LixGciw1L0mcwyeFaLN+MTS67tf/X6xHeRLoAwGA2t55FuZwJRS2m+//a644or999/f2t/tUYx6o794//0PnH/+Gx988MHF4jvd944imwqWmhOO/hupZ+aYEhoqFwq2pancxndgbkHp54033qgrRw/bqQFaak+VkyRzeUaN/de/WiStzrBMyGkrwcwHHHDA6aefXqzYZViGWQPZn/p73kfiASI5DE6Xn+24xjHjTsAMBoMOv2idcsNMwWqzgNmy2lm/JVmOQ9TRZnXsZIzyrW9960tf+lLKVXGYEWNUwk7DAlPsin026df600IRU0wwmmC0a6j+1Tg50BYrrbUuxVR0e+5l94ybCZFCqJMcgFD/GhN27LzzG9944OabD4KskMR14zPbqtoWy1y/u2OUJYJIaxaH8sSGQ0Mq5m1ED4mc9spX4QlPBNchRcV4C9YyFAlD0Tu3UPTB9Ma6P0kwiKgGd//r9Y/+6La1jElJPcurldE8ZpGLmYPzCPMjQkTJVJFc8zSlRCFU/bAxDbasnDz97LNw0MEI/URg7vnFjeFo2ZvP1yzDMuwSOPNBNojEhCTYufNH1103sW3rGuIJIp6daT+JaAYQIkpCAKLQQGRLHNCBBx140onoTyQ0lgt7kNz5TeMii67XjeJZHqzPZoOQnESmsDEVLS9Q5rilBAUL84f7mp/aUave0NPIe53FM5uZWkQo+qyV3rpM0cs85ExgYxYS3Nobeg8zX/Lu/3dyclKywb0JosnBmBrBRG3DH1AfAwRqCUdEUox2oOGOO+78xCc+4bs6tAPFr6NkuaFinscAMvf3JGswGPzRH/2RNNGmrRQxWlY7/4qUkgb36UBqXX0Q7dXMLDH96q/+6q//+q/DiRzd4YyX2j0aFTTo0ptjUiNM54kbu2xnFAXnGzTxdzsvkxQjTSlZqL2GCdt1vWh6ggmQuvY0rada9/xL/UhbKzNLoUOvdwnF0Ouj7vHtF3PdbS25TaR/3/CGN1x33XXFU4syZYsFpnWbb0nJC7erGcCrRSkBUMOTMUf9taqqcfqDa0r311Of+tRPfvKTvV5vztHeJQVE9N3vfvfNb/7d6emqeNfCzHiXgdqHLsWYUYYBoLHk3luwuEtXifz69es1eYKe37cO+12cqWv9wThajFGfLYafUnr2s599+OGHj2Kdy7AM46Fw1DVSRD7kAd2heSt13TP2oCdWaqA0JQJIlmyhu+ANxnDDx/K3eMt4sP4lqUPjB4PBHXfcceGFF05NTVlUSkqN24naISB+aB5LOWF4GQxePxUTEyyFcSFzupPdLfNaqYW6KUkq8Eg2NpMD31G01Y+SVloK8/bwgjp6BtPYOYX7Hrj+iiv327lzVRwE0cg6jTQwS6JoPsr8Rf9pkUzNS1G/TPXqlBJL87joh/qKAElyfnsiaDM6cQlSJSTwoMcbOR144gnHvfCF6E1Y47WvnpkRIM35cVsomAXMHan1OTkV6krrsMAiIkhETHjwoZu+8o8HTE+tTFVPx1r0aoT4bRZgIogesveQUsirLQDBSqgTpgI/HOTEX3n+wc99Dvp9UHNUiohArW3mI5LEhpaWedIyPN6BSNVIZz4QYHqAe+/94b9ct18lk0hIkQWeDthustpWmmmXCHW1NBEt9BUlpV5vG/ORT38aDj0MRK4dziccR4rCiyg4ev7X5Zf+J3TkBs4we7qdKa2Pndzb4igLVDRyjcY16D3Q2KuAIz63AAAgAElEQVTG6Nbc5XxOo6SFpQ95LM1I/fViIdlgvbxl4KUpzSxZP5W5rT74jGec/PLfeBnsiEYS3aEgsti3Arc1PjUzo8Bx70Rokpd9+M8/+vDDDzujEgPsjzBL4c5s+lzmaxuvJfqfiMhc5Zdddtn69evrd1FdpdEicEmPUyTNhU1IxKgDGJkYCSmlEJil9vYHwooVK975zncSMTmvjF9dxWocBY1yElgoH3rVuJ5a7oXmryQSpOhCBMo3Du0DFoM2du3g9rnZlYrq/Hst0+aD3mbOs0S9FDA12DmxYrI30ddXRKkEKSFKzhVeL1lKCdGui0TN4CkSU6oSYpTKPifElKqUqihVlCqlSsuD1jekSqN97eLQz/qhbicOUqqqarqqpjXnoN5AJMxgxmAwdc0117zoRS/65Cc/2d2nj58IyhqSWHUsyYl0TeU2XbqrsWcNNqnwgPKowTieSDkH6Itf/OIPfOADGEFVCt4xeyh2pdGBq6666vd///eLGxZse45KlOG5yZDx5ogtz4BsF+f0qdGyBmfY5TybjwW0S4888siPf/zjQhHOIqvvDxMF1bVJEIgtKs3YkOYqrX8l+pVf+ZWakizsuB6HsAdJaLsERc4TY81G5VJKjcQF2GcT85BXtW206WqqSgPNbKS8M4SQk3pLPqfSMCzjRMbmgGQ8sUqxSrGqppWReVYI1CzV/tXsElH5Xf2vfY9QyuYx/4+ICCx6HpoEIrR585Yrr7zypS996Q9/eFuOOImGNxGxOjE+GzuAzHwdSgE7SVzfUxMnUwdabstijhoK4I7L9Dz2u1Or91mFnVGiDxyDnzHqpMZCHLCAQRhUd331nx65+Qcn9Xorp6ogqK1qdZFZi9YDsnZIAnAjKzY6p+hhRuSvkurqmKC6LTtp7rMsib1R06Amoq2Cn8XqVa96FZ74RPR66PWFkFIKPTXuNaY0Y/BwO3zhBVMDm8pUF6IRTA2Q5OFbf3jPv914FGFFFEozW/7MtjvkFWrNHBblC2AQI/X7caL3qMjW/ff75XPOxpr9pDcBEDFryAQoNOpUrvE0BGnLTrNlWIa8D2p1ghnTUxhM37v+1s133XVMoL4ISZQR0ptIXXaq3WB2rhBJj3eIPBrTqc85DfsfgDCBHL2lJa2kicBqOL3f8osF5nIvlCjfve51/xVtOrYo2suSBWmfdZB2fJnla/bYMxtHVlFawb9DJ2XpQMfIZUxQvIO3EHuKEY0aWp1ja9hLiQigP/zDP/ziF7+4fecOajZnbTQqpGRTaAsBuvir/fzJT37ykY985JJLLjFbA7lslbZ9ivmaDa5M7uyO1H7dtGnT+9//flsb9V+IVov2/bc2U0IItf1WTx9LzrYGYDCozjjjhaeddpoJu0O7oUFGY5YZlSk7EVWo41aecWYWF2MotaA4PO/tKNl4vsHPmmHV1znxJA5uFZEJeQK0T/K2P+Dee+/95Cc/edBBB4lEZtZTmRpMpzbihDIfq9rio6SUksS6MiUR2XUAJGruTNAIi7xybJVKDnipm0yJ6xKiWb51GLCn9MSodl6TD8YY77vvvquvvnr9+h9OTU1p54ud5U987/VQsLxiG2a9r1W8m5wNV61jzO7YRrOiZqbtzDwYDN761rfefvvtH/3oR0d1bzZQ0Ba0eY1bxuHSSy899NBDL7744nL9j4CuVLDbm9pHTo0aQlf2KPY1snkXEOdbndlmN6+0SDv585//fNOmTZSriqcYiZkIMSb1JNUISJGYmSkloQ4/NY9Ir9erqirGODk5+YIXvKCY2fkby+MWFLExRi3CPoegZHYou1wY6JQlBDLvsEWFEaqB8dBu5zdu3Pixj31ssj8RY9RcBMq/jAkqPn37aCSK5o05vTgxM1I0p2lVVXqn5SJHm1wTkeSzJkRUpeg5oP5KLg5DZ7aqqsFgMD09vX37zk2bNv3sZz+77bbb7rzzzunpaeYgEjmEmAfSODuJIOUMDhlL5y8RgUk0H5GQxARqGHdBrq39zLuFiHoYQb/EdYgoADMznuJoSbdZT2gAgASDiJ/dc91nP/uEqalVEoMkRgIQ1IqtzapR28UKJkATdAAQgKEiLwMRAgIxuHYriZA0yZvI1qvLtUMABAlgpigSCYNe2Cy8z/FPfdKvn4kwkUSj/YQIgkhgIkqIRESiTGJkAMUCgqXRBFr6UiQRbNly49Vf500P7wv01WEFaEiuPelNGNTZ2HUQZSfuMqlRVxKzRkJACAPQFIeHEX/hzBf3TjkVvUnYodFagXHvIooxWoZy+EDOZWa0DI9v8IRUCEyCqkJVYduWf1+3Lmx5dJ8wSXEameKNEuyVmtcMjFQlFYASICFMMYe1a4575rO0si7lkt/56ZSd4Y3Was3OXpd4LFDTn/Ylyu6rrles6JXxP03BUjvtCahzEGtwlOjY4cw3MoTrmb23qfKx14CxDRVMepyPY+jqyXalmFPVoL0GRoWKFOtkl87OL4xaUkirhUBpQpX95LXKGbsXqEcyPAdDfi+fdNJJr3rVqz7+8Y+TeU+ltY4LU8KM+07yIabLLvvI+ee//rDDjmBWKtFK6bh7ysMIobGRVhX+4i/+4v7770fHFGLmxW6bWZtNzLXgHlMMoQ6fYQ4XXXTRKBOha7+GUVgqVqx1gGp50Nt/hbmXEjzGita8sWwMfuYJWjvRqVWFabJY4fVf5+a3iqW1EZAAgJgk4e677vm93/s9EeFeU1zF4u+KK6YmwTZvEiIy2qufRcSMm5QNl7WBWO+RRMxUy//1syEEM26q/gNHIvzeZDiTZb+nfYsxhl5IVewujNJAOYTl7FUgDrxKSe3jtyKi9tziQHH9iFMUrKnxi99t8/TBD37wlltuufbaawvltrh/KK3wF+0z5QhN5VnEjCS9Xi/G2O/33/mH/+OwQ59wzmvP7W7Yof2shaS25WI3tvYYWl0MxJaxfVBnjoXep5Q0IazeP5uBzAfYztK333XXXTt27GiojVp/ErO6GerDjMR1XAox1w4MP3HWsmQT+RFHHHHCCScQBdOyZ9Or2V+fK+iOYujb/SIHWuzSbl5IxlG8dM6tk3CVxxYPalHKeDpmsen8B8/X7ObNGx99+399B3QD9gIANQiqXckeN8NllNTQJccTjd/Z/frBO/BaXNWNAiLKH0WyPcu5tE3HIaqPAbVYf6Yq6szTqU+J1e4mLMoCUoLG7/kwMh0dcw+ApAHaubCI6lhAQI13AlWvanFUJS4dphqv1VgpIsmsjno9pVQW0CnmzH8udk5Bc4ugze42a806iEPAoMLWLbd85Wubf/Sjg4VWQLiJ0AFR61/IdQgVP8F+yrOgggwTWWnyoiecPwQi/UdNGFH9V4jRD1P9/oMpPv+c1+DQQ9EPFPoE5hB8ZQBj3oUIOJQVzahLzDmQpVdIApH005/e9i/XHhjCSi3ePe5BwEllZP+GPcPt3AQpQUAUeoNAD0tMhxzy/Nedi31XI/T1BnFJRry/fVGI8jIsw9IH3SB1cHrNhABJuO+Bn9x44yH9yVWQfk4lbHRmKLmpea3TQ5h7CDxNtDFVT3r60yaPeTImJmvmkGMoip74A1xD+cICw5i3e01JXK5rNMq5wAVSNX/z2MfE1KjmsPCEfb5B6ngqqISiqXbqYbZFAqPeBkNtNEOl8CWV3HO89uiTtRU/+RPu/rp9sM/9fuaAo8UDInr3u9+9Zs0asxp029wNEJGHHnr40ksvVUnXG5XmA6xxEdmwYcOll146+3f5RZIlbZIcvaXXTzvttDPOOGPo+hEX9aAhA/7BQqB1cnALGyaWmH3N5kLVgITmq3/v0oGWHtL+67O8dcduI/WhcxauaNXPNcdct4q9TZ/NGtzGEQc+4F3aNqniQ3cvDD1xbLWMbVcys2SLRpGiCh21eV53xBIEj1tk/CBPt143pCmu2NWUQHs24UwbozSgLuiU9Xq9z3zmM0cccQTaa3UoDJ0jchWuKKvxNr+a8kw1cL3zt9/0O1//+te5k2pzKIpm2YcZwSh89yejUbbjPHXqvtpWuBLz3ejMnIB1RhfMXXfd5cdY7HSpZSUplD5Pi5RcaGJNowknnXTSypUrMQu0Fxj2RKNYq/MBXVpa/Oo/jKHAjysqtCjgBbZiSbDLsO9j9uEmzs+gnUeRTnJJv/6tEdutQ/kd2uTXr2T/GZ5EFKtFRFMS+QbrRlPSRNLlKQfHfz09kezbNmMiRrDmIrK+9Wp7hElE6hQ6ThjwtMLkUntv3QfDCxxxGfqyAoq9VIRPdj/b/UwCiWl6gEGFu+/5zpVXHjSo9k0VV1XxCs1GRIKsH9UdrBuUxo4ZQHpgnFHnNPI4qrMEiAQibtMyJkq1NMyDKBVomvgRGRxw4rEnnvlrmJwA9yhwIrVfci5TTSklphZrGYqWMRcfE8gII4T9LiJCKUZJCTt33Pnt63fec/caSK+qLPuk1c9WsA9lZ2mkG9mExWzWJCFE4p29/oMBp7zsxXjKceivADNxDxRIje5ZKvIrcjdwsAzLsNdDS3hNACDVNLZuvfuGG7beedcawkSKEivLBlI/BcCZEmn4GSKOIgi96cAbA530y/8J+64GNKWvyffQlvV+e3y+Bb4uDCFCVIfGjxLTfQ9NLmEQIcsHWX0FIJKUt/tHxtClWkDY6wRKraRpdLmZYhFICz/wPL1tzvbCmb/Tnt0lgj/fSO6KPT7fuV4pBNlRIuaoILt+fzKHgQwXDxRjRx999Ktf/WpxOmr3FSNgXH4uIvz1X//1nXfeKf7M/nyC7p0PfehDDzzwgHSWjd5SPFLoDFTHUUIPCDMoEK+YmHzPe94zRg+0x0MIlou9O79+7oYK68UjKVkIOWzX5240Wb+XQkbawn5nYCP1B9vH0HD7NTUljCSlFAeVJZyUmHIGyGhXUhXtul7USMaUkqYWRZbJ6zzIRWhtvg4A+X5/3dqxxWx/rWOWQazRIaPmqKwoB4DbSA0VJR8ZLffu6WD6od8yJpajLZzD2aH08e4GNAOliMxI222D61sOO+ywK6+8ctWqVaPcCSWlJSCnWUDHbUAuXkSzGepXLYEFDlWSc889d/36W/zYW8llXQfmagmMoIHDRufwU3dPcrCwe0SxZ3VyZsEg5hgKyequu+7SixKTbX9PzOtRSJ0zVmJTVMQPyht9ROTkk0+eZX+6+PFryS/mRYRRs7REure3QrGhvDGxoSFtMugsG0MceJ5UimSmo/fEzOZSzePqphy71HtSDlD0O8V4lhU/9PzX+GbrjbqqkkDcQIyzdyxF9Yhc7lfJte+ML6Ch5HVKTXMB+nYoxwwy9wB3ZN4xDgAkHPJZbe8sFKmVSiKyOgfKzZs+2GMYFi/jKch4d42fez8SL+rVkkESCDglTA1+9A9fmbr99oMYE1LxMJObBfQlh3P7KdSpKmte0uMGcXrRToVr5ZZUoySvVNdigoBDDLydw/0pPvs3fgNPeCImJjExIcQiZIijzMKLsY9BzoKBnzXl0BSBbTtvvWbdwVXaR6iH+qz+UFpoFuF2m0C9vYe8C/XwEQEhJA5ThEekqp74hGe84pVYuUoYIIbjOn43ygidbRmWYRnQpp/MLFMDqhK277j1m99aOzW9CsI5LcaYx+1nkVbqnypJBWyuKj7owGNOew4mJwQNL6BOWmGRmqksHYnKZzMpoLio1KYQi4koSUqQ7lNVx2HmX/uYOr3kwUi0WXngxH04U47d7x/vrg1tcMwh2UWHQmgZ2sNCeC2UdkOI5f1p5BDOOWdGgC3jt73tbfvss89cjcjmcePGzR/+8Ie19ivlCjZz8pYCTA688847L7vsMoyY6+7ba7G5HYNg9YKrqpqenn7Zy1723Oc+1y+8TiND1PhCQaU2+DutkUKiG0pkCjIyWwQtGRjV5yKGlNopZe0ntfGlDJqP0ot2Fq9h28QwZvis3yICF31Z7D4vMXrwnem+1+JBYoxxUCWL94zNTwaLZeVZLPCoQztKSJFQG3yzumj23FFJ2UIIcFbs8W8vKG2M8VnPetanPvUpH9Xo6aq/mRwb8jfbTtefNMgXWeVMqTlfSUQbNmx45St/62c/+1nT2jybosfgpFjbfqMVVwq65PfFwtMfcuaewWBgBsqhN4vb3XbRB6zZFjYaoneecMIJu9Srrv3BertL7cwVjKJdHvZE3rEnQrFTCsGAXI4LcQZuP4OewnhC54UWtDevODnZ79/kEmjA2yUz2K+eLWqbrQfbVkXKUhTc/UPxgA5J8Z0EQFQnrPS9GtIcEYa14LmJDRC54ogfiLVkZRW92DbkTFbBEuw1s8nzNTSO0k1SCno2O0UMIu6447uf/8IhU4NVkoKkunojgOyJjlKXAwSByXxuPr8mAgFJqDb0SiDi/FodB4MCgeukixDAjn5Q3W0GcxRJTKnX20wSjj76qS99CXo9IY51gaZACL0Q6reKQLhJ00mdaNv5tlqOcO21V3NCipgebF5/6903fPdAQT9GDH+uATXm+ngMyvy7u+B1BREjgQicQJF4KvQ2Ef/H33g5TjgBvb5GjsB1zBJgFZLoMizDMhSgDrCa3KWKmCBx6+0//r83fGd/oB8jktnR2LxYCgSQSDLDClxkgYaihFBRb4vwYSf/RzzpGPT6Oca5jjRRz1jd2tLbrV7G7fbNk193W2Du1fxIRCRlXk4ircT548crIs7/tbdBPXZnZeh6/z1/N8Giq18NfWSJw5ip98P0d9rQhmKgzhqmu3D0S0XkhBNOeNWrXrXrwsOQ2D235sGMj3/84+vXr9dQoxCC6eQdF/tjBSJixp/8yR9v3rwZs5704i6T0JRYhRBWr16tBS7GNtKYwNQUS42BGHAWFguj6M5g8QqbixgjiWItafokbbJ9CmWRqcEsSfQoNPrrXkfyRsYxp94MURYJ1d0s0jYpAtBcTUIQuJjHjnLhO9ntv7QtofnoVV2IAERNGFoqzSXSsbjt9VDMi+Gti1sfiVzo5AY8ogLYbLqhR7B/8zd/8/3vf7+9yJuwAVjUpFJRAoGJQnYEgSzqVpeB9lmc40F/1Tq5zPzjH//4da973ebNGyWbyIvej+dfo2jFjIMd06Z9FRE9HYK20p1SAmsFhMYauxvdmBPwRGD79u133333+Pt1XPYUtTM/tA3fdW2Qfj8cffTRo1or/iqMit7t3jk/kGopW+qXZoNGXVDDnHB7iiC090F35xZkUL968cDuUTJhO1RTTxp4hujbtNeZPObZjSe53aesD3ZPa/GkVob8hlpKc/JgVLMFEvwYc1rnxo/IzJTrgA/BadO+aF5+tfm4xhOQLElINxhfXF6Ogjg0tNu7SYsBeBI/ND7WPptbVdqaXm6PAUiMmB7g0Uev//xV03fedTBoRWpZJ2sDoDNWGkRJ0dVpoVzsu+hwgB7lrotNc+6GSUhDaARTDLQj0INxcMpLXownPQn9CSHm0AeRJCJmUjY8zBw5bNZo+HTOP9RihAhixPT0zd/85uSWrfuDJ0AaScrDOlbMV1eCKYaTZz+/FALmKcYmFj7ssNNe8UrssxpaY6FTAlXxP1SXW4ZlWAaDWj43l92gwqNbb7lmXdi4cT/iXio3Tovl2If21q53YuDUCzsDbeX0jDPOwJr9wP16Y3YOsXY5SvGuxYIZaUhHs40iEUUIfMeQgdGHJbvN7pVg5JrMCde+jnYO4gJd47nJgoxgF8CrTxjLuwsx0TMyOBljeAs0qziaiy+++LEHUbYlYAB49NFH3/ve9/ZCr8ivNOcgIjfffPPf/M3fjMTDCOiq3EwcUxSRqqpe8YpXnHTSSRhrTrLXmevCy6vorOpC4vXXi3uKFxYdWAqUUGH2PRlzZ6EyeVHN6w/exNAyDma82fWupuDxXNANkza768HusTvRfqnBkPAWdwTOflpEKX3RoaBgho1iviyoze+dAm+e2mDXCYuGN1500UVaiMn3rX4REeXUopa9wb/RItYt/4aB6qQ5ZryOn52YmLjmmmve8IYLBoNBdxFiiNjQGBfQphuzH+yMe7OFVTc7xckDi1lGe08tDPgAZJ2gLVu2PPTQQ7N51k+NpwNF+JheWbly5WGHHTaqneKvhy6eR905D1DP1IYNG37605/ecccdt91228MPb4ypNozMfweWYWawlWAOeNtHySXpNsrguYZRpKI1o6J60R7xXGYUnfEbn5xf0J9sLtbwjPzRk6yhXLWg5A3hzU2FXo97Qdr5uDFsH3V7Yi3bWJIrC+5Jrn42OcELDE0gGzrpk4pOSNvoO6pz3a6XnmphSMTUdtx2201XfeHAOL1PHLCWSFevkTCBAyG4wjgaSlkliRl7tmA00NLOHfoe5iCBlFzfaiy0jz2mlBI4Bt7CMnHYoc99+cswMYkwkS3B1jKbpy2jmLR2hR92gZ8Z2dKcAxHVbpydU7j7nlu+/o39YuwPdnKKIsJAcVo7gRO4oZ1JTOuvL6TEucIjAIsUENFqwJQgQhyJd4bezwOd8tKX4NhjEXq+vI7h0PIO2PWF5K/LsAx7EDCB1HskCCDs3Il77vn+1762TzVYkQbtw93J07pAFl+gRC8E6nF2iIGpSmkaaSvFfY887NhTn4XJPiAEUI6adBwhEIWlVh4HmXSPJ7D+V2amwMpotKAXc1A6jiydAAASFoNuLx2QbBfv9f5/9t48WrOiuhv+7arz3Ht7pqFBJgHD4BDBWXAKKmgUXRpUFMcPvxgk+Yhigq6oiySvGk1iNAFJoq7oq68hUTFZrxNOoKgoMSGCNIhDEMcGgaahoel773Oq9vfHrtpnnzrnee7T8224e7Eup89Tp4Zdu/ZUu3ZVcsGLA9ndWtXGrN5mH6yi1l/5NvVkF4NaufJPMYPHF9bxFkeDVfFKmg8hJUsdu1asCvvgBz/4la985Q4uLjsvonN67z/xiU98+1vfSr9S3iHHAocqtgmEvfz1X//13FxzOGhb+6wQweScc9hnn33OPfdcoF81HVNn9yRXqY63jYTi7JWtyViXZaTkHueEAHR5TpjgdZv6rDaSxYwNYEfbJrGt6LqAo3SpaN81BSk7cM4sXOI/a/jaVmoapLntEhrkQ9dcqJraSv8AGXvk/szk0XE9qzFpHzDGlO2DuNC90t0PKeUmC+94xzte+cpXMrN1RBIRyQUD5np6yW1q6aHb7W5mBjHfQgh1XU9NTX3qU59605veRESa9awXyDjRCBEcUrrVdgKcBWH8imvVwynXrQwnhAACeSeJ7cjsDu7+7ATaeuop82233bZp06ZJvrUuktZsAkArYgvA2rVr99lnn24NY/6OOuK9uyDhJNTxvPPOO+2001704pe8/OUvv/DCCx18jLW9weR+znl2J4xSQZUaqe2L4Dboe43KByAXqaC9aVGwU6mzOBhOJjy8Vw7a3tp6qK1X90JXqFl+7tAcx7ZIsOU9NakWY4wu547Mr3jMcZsIYpSR3URE5OX/2lb2QrKxKFOEpp6vjTHWdb0Aby3Qze0bFQtEoC+vRHHoOw7nKERsnfuPT17sb75lX6IZZh97HMAZX+lfDBDB5ehTAJTDJ1OBPPh8CWn6tUFfe4+XTVsBQOXmfHXzcP6RzzwZD3oQBgN4Ry574nITk/C+oszuZJeKxhiHiAEcf/Lt/5j72c/WVm66nVyy08nCqdpCnV17yBhupCOBiNi7eYe7GPHAgx556vMxMw0iiaAsFtWEaFyCJVgCAecciFHXiOGnV37n7htv2ofcIMQYY/fCC7sfA7kvotimc8RM0fnaudvr2SMf+2g88DBIqPi2b67sQU1L5dmC1oUAMzNHlUiuc7srqY+SdivfXoRQiH41OxVdOu9Ww7Mqna1Nz3fYyhcPuHbI8ORQqLY209l4shxf27nnnrt69eqdhSXVkeq6fve73221cOzs9RtCuPbaa//t3/5t+/pe4JPSlSb8kpe85KEPfWhvnZ0F3lJO7E/o0Gfvt2y8V4VVMMrUWTxAO7U7XReABY2jVCvIHuEcZVDZLSWbp7U591NsKUmBjmusm06qy3la5qXQfFJXW+EqumB3CFl7D5A5T1fQNhlVgY07aWFeMZZUTKlx4c/e+w9+8IPPfvazJTxQJqWqKrmDG8arJQKlyJWJvGepJi4bf2WMzcUszBwjpqZmLrjggr//+7/3Pp1J7O25dStIRxVR3Xymo4Y2/j2ZU42WXG2jXYZWpErYPSB905XunNu8efNwOJzwW8WzTTmn3MMS5L777rty5cpuDWP+Fu7aPcOcGcPhcP369evXr//e9753zTXX/NM//ZMcge8KnSXY/WBZHNoeut4zNGTciGjTcLH6CpFn5ZqUtG9UDtolYEWn/argxtrQqMJWsNrhUNNaC9Dm+fLVYDAoFhR1tkNawdTo3/q1SHPmBherXxWYabToYoYwelVbXm8noJgbSrfIpHhOE5MSYxg6YszNbVm//prPfPagGJbVNcWaEGWLDAxQBKV/ymaR+CilJWJunLkAU7rOiBnMHJgCk+xwiUoj2g6Ti9BpyB22g/XVPOFuwvy++x7//OdjehpuwK5tsaQr3GOOo5SMb40PuMBVLw53HbTmBdE5Ql3jttuv+tzn95kdLgd8jMQBOQ4qyWwZD6KGBBClXW5m8pT+01xr6a4lYricjJwAIIJquKEf3OnocaeeiqMejMFU0598Q1P+p5LNns/ZtARLsJghrWuJEJkf4rbb11/61X3mZlcQEceU2df8B5WLyIItEsEjXSMHADFKUhDMOtoyM3Ps056KmWUgB5ItGQGnIfb6ppOpqWluD0COmhmvo5eijREjwM5RZYVxW6tw4IUvhVvwzd4LSZqD4UiMQxrtryHj7eoSg7wpQlTG42pChWTnQtHKGKrWPV4B0aVs9KX23yCKJrFjFR70oAe95jWvGYXSXhhVTPoiHfDef+ELX7jyyivHf7JNYAcbQvCe3vOed8/P13aPc/KGmFvXGCotbVUAACAASURBVAqy165d+4Y3vMFSRYFe+1KbK5IR2XCqrhmglSipaxNZq47MgRho9CYp32iAIQzH5BjdDTAGz92fuiZEbwEBG+5kmYDlAIU51P1c7x4lIld5iefQal3lmVI+St0wkPyAxSiKDhTznsDEmjFYoymbAlm9J2NwjsIeJnZF7RXAY72E6As9QWd9db/UwPMxmBxLop6IZmZmLrroouOOO074VVVVugbJ+MWsewtmh6mgPc6OMP0wNvexDGOsvfd//Md/fNlXLiX0bVAx0nW3+YEjcWjIXsc7nnjGMOfioRVX6EhSBhMRIsc62LaofQPYmNZ3Ot0StaJZ77rrrrE3CjbAnbWMHmJLE7RmzdruOYZezo8OO8Lui4NpZX9mZhBCGBLR3NycsI0NGzb8679eJJKt6OGu794S9OsJlud3Tw8rWE1A/2nFEADJDGsr1PntkqWFZuXmeP+mq/nMDRE1UYsdfbsYGrWdp82Q86ExsQrRWUfNhyTxZ02L9g7udCGJGUjr/JA42yxyIiE2rkn9qZC8lrHDcDbvfc9dJaMWj214vHgrGKKZUUaMuOuub33q36c33bFv4CkJ3QdR1k2ZG1IAIFewE4MI6XyiIEqVITT/srxaup+fTYVZb070RyDvaODrqcFtw/mHPPWp7hHHYTBg7/VIic5lH6NfLC42OyPMjDpgfv7mq79389VXrwNNh5oQMVp9Zk4X9Oo/e0k/PUsyHwCCI+/gqnnn7kAYHHLI8S98EVatADkmxBGsoftyCZZgCUYCM+ohQtz0gx/86pqr9yc3jTiK7+iCUl285qj2Xgog8VUcVHeDlx/2wHWPfSyqgSbxHrM8d4vCt23AY/OI2Z+ScBCByhy5VkFug+thduPHWlMjdwvvA2AVF5hhjiKG5rLv/JPFSWE0YiGe3521nTCkhWDyhtRVYfUtzdQWcy5vW1uO3FlYVVC8nXvuuQcddFCBtwU/tMMpfhVVcjis/+Zv/mZMyW0FwZsGK11//fUXX3xxb/TihLUVf0PgV7/61cccc0y3wKjP7aK2fo3CeNCvrLHN2WIpiJm5abRXjemtefEAjzDXuePTQXstyHur+nbZnUUIt/NOWvKw7cYQyIRRFHOkTRSGSdf6smvQdnXMXKjhpyBheoU3pLug7kscXqCLn958Z11x0IPYfKPajmBJGOnatWs/85nPHH744XVd25QLasfpdpeudMt+e+MKCwqR0EspOTc3d8YZZ/z4Rz+yNNNEBgm355TAVMtYku5HyEJg1QylLg0dIkr5VTXmqDsdtt09wnZk7UwYPqmfdHUni1gtsG7dui4tjeL/XXa0R1brCL2FL7zwwltuucVOVpfHLsFuBov/Qrhw311wVlaSVXFH6Lp2XdtGyfiUrFxuCeJcrTynClFGWfZ/2xb3trAdhXagV9oCmBoMitWqoP9saVYo1yAoInsbi7hRBRtTabm38PmJ9EiaWEvW8vaZiDgAzBQitm6dX3/997/4xX0ZMxw8mOV2pHYNcpcQN17kpNozc8zOXUn27okrl75njkBkJoCYKKKhv7aITSGB8jIwzxNmHc2vWPaU007D8hXwNvqPnYOckO8dYKvX7RxtuxPSJp8KznqIrfPf+/KlU5s27hNrN6wj2EZa2axYnHuP9tKCcaUnsuaQCopX3wnFUyDMVu72yh//gufh8EPhB3DEcPYW4HT7Xgc5e0SQLMES7EUQuUaI2LLlqku+EG69dWUMrg4O7NDIBOFpEu/MOdNuYGbH3qdtOtnoCxxr8BxwV4xHHv94HPAAOFmqQP/yjBKsyE07uxvMpl4LaOzRPCu2khSLcrVipHRLXWRqMl5L2P5kSv+uxcMi0VmtM67XBiBjVqmc1V97FSYssmzxvdO9oFQq1FmrlVrtU83dCSdUtc8DDzzw7LPPnqQno+qxtensuKr6v//3M1dccQXplSEjVtaEYFV57/2f/MmfbN06l+mh1ZkxXW1RF1FgPSaPww479I/+6I+Y073MIQR1LvR2xloXouOK88Le9WGpFO3Z6arjuXdOc5HLiZDc4YYPiLazZ/WZMa03BlWnfLE8x9Nq1zrq/VV5QjTXDjRhFDmnuXMuRTgKZ3bElAPiJB9le1KISO8y1pfW6EqkbvRbylxdJj51OzKDyScnadez1v3nfUlT7eZn7IK1m/QN+lBhNwPGS+TxQDlLxmGHHXbxxRcvW7ZMZtZVXmJ/Gh6LJp6ib6bEGDKOPGpUJWU3nD3pv9zwq1e86pWb77wLMbk4nQNzYCFdxxFBPqvjkCkyRfKgnLJ2wfH2XvBgxQSUhr1japVvEb+cLMwErHeXd5FQIGQC3G8bWI5R17Wcrx8POpAud0WfFO4moLStj2li967THj1QRY38kxkbNtzy7r95b2QaDoddZWARMpbt0z8XidZawKhecduLZ1kitz3mxSqjwiFW7mW2qi3Ebm8BWdfC03R164lpOQogTMwmEbKjKLSaQpqn7JntTOjNYrHyNKTk/Mg2l427LL5FW+chwKEVCwkiUCySuujwQ2DAZUUunc+ziaSqqhqZYbfgGtqhyTNuqDc0vQ1MdcC9W6/6zOeW3X7Hao5VDOBQXG1JlJx8dnkrKhVLhUohuSmbXzUjdo6X7NNgiIiYHKrBfOV/PZz9jROOX/2oR2F6Bt6LmC2Qs/sTEk8OTV5IYide3F/8/EffumIduWVxSBh7I61W0qb1VpmMOs1n5xx578lXQ0bw7o4wxMEHPfT5z8Py5fCOqU9m94UeLE58LsESLBLgEF0EhnX48Y9v+Prl65xbxtFz3gvJxQrJatMtMbOeFWICnAvebXFu68zUY05+BpYtx4grQXpZwaICHntPDnW2PdGK2QkA5A6RUrfgBZLfWz2gkJU7EdLcTeze2lmNWv2pOMVWGBK2e2QAbYSMUcH3LIGNEnkT2gw6Xp0pBV2A2MbzoYrY3/u93zviiCNGtVt00uhISfuC0ZjZJCyLMWoQ5Y6bRlan+tjHPvb5z1+iGteE37ZtOVXNKMZY1/XrX//6Qw45RD/oRhJxTkWn9XSzE3YHq2gpRtHtuaXtUQNZJEySeGFXeIGQ7rruFsMI1PWWsT9Z3isFbKx6UzL7LpHx3Pg7sn8fRR7AEfnCml4Z/qwvLWuSdotgzzF4u0/CKFIplgaZCRoFesv2DqbyVIJ57GMf+/GPf1wMcj2m3XTYmnKdtAPKa1sD7AYNqQuA6D//8z/PPPNMDQYUCpQW5RxYDAHmlgWtJJr0l6Pw2SUtK2GVp2nfUm5Nk9eVxf/rnTgLqqoi52iyNMe7grDJ+Gjqup5k0tnY4MWQYTgwZSf1zMxMbyVauPQw7CGwHUgkAdasqQoXXHDBBz7wgcFgoMzNMl5Duk0EGTrsVMHKu1FluC30R5XphQmLdb/CaK6yp6CrJqEza92ofx2RlS/FXmZaBczq2ShEjDqpuM00Wp9r1kVz8VRRhk2WZxGj0SRs5Y4IK3TaUbu5yO5L2ZhB28dlh9NFmn3JhoaVQ6K9WnXNagF77kp3euy4QgiNO7OAlh/UwOTih7NKEUIgD8SA+eG937/h2i988QFMMzG4EQeOtYHAEu4nmSURGoQ3M9eKCtRfm2ydBDgyF+kE5jpGTj5Kx76ad7jX+03LZp74olOxchX8IAAgzwhAtOq+ols60pmr3R1bJH1IZAEmRAKBEUPA7Owv/+M787/41b6VH3BAZJMqg7JV3vSc4PuONJIlSEtnRAQ4OF/HyAM/Xw02kz/uOc/BEUdgaqrRDg2aJKMZOkR1P9QLl2AJJoXI5BwiY3brj77xjfoXG1YgVswDchrSnW/yKqSCrqy0N0VEEUTkA2NItNlh7dFH73vsw+E9JFUGS1BmA1k+7flEFmRcsa33o7mHbta1tC5KQToRSTrkSqLEyCeBDWCspjXG5NgpYFWlQkvY1WAxVigfvYULncxqV/JQvO/W0Pt+sam5BRR6JzqWfHK4MMCI9VASwPZmce2tGcD+++//ute9rvcaKCXsoido403146aGyN77Sy655PJvfD01N2JlTQ6y0O655543v/nNojN0tcTeWWbmovlCxzj22EeceeZZzdCMn1fQYrVq/bAwXC0Ndy2EpifGPWonNKM3FGOySv9epMN0+Yn8c/yUFUgjE29S4LBgXJYaWy8Jog0CcCAxkJiZQ+Rg7srQ3hpnjcSDFN1jZshFpdIHmTVZcC4FiUiCrcjNKdruKr6fwHiKVcxY/Ng9j6KeaFKF7jgaKVuqp5xyyvve974YoycnMbDOOYkDonznJxGBmozbkruNiKzwBJr8p9oEy9E9M/UXf+riN77xjcibuzFG58EIKTLUO2He3qutFImYJFda+1aK7oiKN2ycqtw+TyrgnEsXM+QaNEw1xsj5Rqk9SLra27quJ+mA9VyMYp6WRXcTUKKDovF5eHYPCC1xfpbUumRTBwIAONav+8P/7w1veMPPfvYz9WjDJGIqpI9WXvy179GWbt0Vap+V0rgPxgywkIYFaEPK2/f4jBTQK8i6Bbo/yYgKWiXjFkyfMPTiNYv5bs2EJgK6UEXszkeBWyQaY5WYGEESFvnClNJvjuByZmdCRDphQB25b9sVprbQ0m7COe1wEikCYM2USPpTL4UIQgpGWlGfmlv0exTNcfuu5wJ0dh0xQsDcVsxu/e4Xv+xuv31NrAciXTiyeBBzQzCLyjmKkc37pmaZXErn9DnmuYui8RruEDlyz7cpA3ENHvqp2+eHax5z7L5PfhKmpyIRkddRs9m5tatRTprTjur2Ow0a1S1Gx8DW2WsuvWzfGGccUwgMniR+w5K4Tl8x+0JDcISI+bqGo6F3d8Sa99/v8c97HlatBlXsiMR44CiHaGzl3QoXG0dbgiVYDBBjdEQYzmN+HhvvWH/pV/cN9Uo4z8PIPInLMErWY8TIcE4i9gHnZx3dPJx7xjNOwv4HoBqkCMoOQ7eiYdGC5uYvwIbYwO7VZ1UgeTAZyJs3zoxU1F/eo7deYA+xRzbX7ans62oqVl6r1Cj0XdW3rF6yoD2z2yyupKJ0zkaM70ChHRbj6v7VaMoJp1K/ffWrX/3BD37wxz/+sd5CYPVjW9hivtDl1HRRCCH81V/91Yknnrjj1KUK0oUXXrhhwwYY9VQdiMXYe3HbRT4RvelNb1q5cnl6KSeb2kFMaf87mw32xGVhpHV1aGt3jeqSYRRlGIK2Yse1x1ml6veTEHBhu+pPlsC6Ja3Z1i1T6PB2pdjgCCto9H0vhTCDRKFvo7bokjw1h9FEluVn532aPulqZOdc5MbLsyDG7g/Q5S32fZfdaUkJ99tZtK8sJYRw5pln/vKXv3z729+uScpATZnUYSHIEIkI7b5Zo6PofLFspcD7LnzfAw468C1veUtdz0tzvqrquq6qik3ulxij9z5HAC1sKcOskS6l6csYI1y2afOStJ8wIXD0plJHCx/V3xVgRzph0FLvFPRKMalTIigXZKqLgesWUFXOOafuCSA9hhDOP//8iy666PGPf/yRRx45MzMj18fLWYFixrU2+95SYPFr95+2TJe1Ugb9dpSAtoq0rjtbQP4ZQvid3/md5z73uV2EFCtxsc2Xpb2Gz5ifCgyPUoa79KyQBg5w9l9bNSYXAvqaSz+aeIventt5UTKwAtdq4C1FfUSFqhhj9CpjZqIocR5WI0ofsgM4xKgGGpFnDl16sNRod2uqor1e1FveGkIw4dmNOOgqasmwQSTnhltnB8MaP/351Z+/5MAQ5YhixgVSWknxLXLaAwVQR0aeVwCOITdrx8iOEICKPDgAGJBn5gB2RMwx5aEkBFmH2VnpnKslVac0RRS8m/PuHriTT3sR9jsAot4JKcALybQnIzPlyVyTu2I1WoUMzZQ551wMQ6qHCPPD//mfm/7zvw8FBuagGUAR7HpSTkUQIV1jx2hRbLmHQ0SSYSNGhneoBsOp6vZh+M1nPsMf9RsYDIBIbpAKO0DuPUdyHGtVRf1LsARLYCHJSMcAY374q/+86pb11x7BPCWXySLFESiQc2xM6JAUWkQ0staRm2fUhK2Dan7Fyoef9DT4ATs/aqelpb7s9BHuIEiGMmMn9xTpeiUoPci5BtIoM2oERVPGOZ5oZ2cXwh5hj9bFE8dieNRP0m2r7Y3STbsvi7C4XQqikpbK3NjxqnJp9Ut1xtlizOzylXICE86mKmqrVq0699xzzzrrrMFgYG2YohW0NctCy4RBvvzqvf/Sl7506aWXnnzyybGd0gjborRo05s2bdJj410Dqdvb5g1KhZvIE3EEH3/C40477YXNjBDIkaaItcMsnA4SQWnpp9c7UHxlp97+lFGXCbK9i5OjZ6StiByUvQehSyTjyxR6u2LVFtZnW6DQ+W1tltiakvnibOdctFqoHAYg0gmA4dWigzMzoclK3yqjrWjrBJjQM2TLU9RWEEl0gpPzRoR0RuH+BOMP/WHERkixUoradpax0xhZzoUQ/tf/+l8/+tGPPvnJTyZGzUyUrrdOLUpYSurKSCdIl/kwMxyBiGND+W9961v322+/17729+bn5x1RDCGbvZWKxfxARSujhm9DvIulUXaydbItfdJ8Jf73tHrljzgddrfrp2Ce2/SVFVLo29KQiR4MBuPr5z5n2R6BVg847UdqkBQheRFkjHfccccll1yyoy3umg2VUdWO8QsJ6Fw85znP6V16xd/dCWNGVOgeaFNjIRBTQmSZbXEwRRYXc9FQ+pBEM8jHiA1bi2idCk9dYhC5yM2pcF37KZYCpL+io7f0D5wARxI/TuYAa0umG75KxDG2whhjrI17Ub4NRKR+Rdtc8SYnE2/aCqE5iSK6U97giQAxlzthPbl7RxGQvPfem++bWbHzrWqixH/G+bkKQIw/+Orlw1/8Yg2hijXHgPJcdjNOFrtQiUP8Z4QYk0xghifxKMOXQgKOAAJL0FB2g2pXJbSViWrQvHO3D+fWHHnkQ59+MqZnUE2RCURHHx1jLE3sBuiSL4Tow5BEzbp37rpvfJM23rEGRCEgO2ibDKxSDwCku9GRQ82JWk3ACEj5SvSaGGME16B58B11uGfNyiec+nys3gfOsfcwh8tgXLyFxmNfLsESLAEAboc7xRBQB2zZcs3Xvrbs3ntXElWx/5io/YqznJD/E4EcRK2Hc2FQ3To3e+BxD/cPeRgGA/IVbeMe+OIBUf1H5Whnc2SgJUrTedu0SWgFX+L2hBBCaSvsIUgCcbdcLDNK9nVxaIuhzdvVWIrmTK6+R3u+RqmzWuEupbpi6if5hNs3rujLXpuNjeKBbRyO1HPaaacde+yxahUX6NJ2C5HdHY7OpiJWXIpWvhf6+viu2tMVF1544aZNm+wnXWWyl4a5bVRbz/gb3/jG6elpi9XieJr2wZKKQBGQYgdSnAdH5+ZiS/by0Iqg7LjkkCNkebeni+2Ca6uvvVAs6i4Z99KDvu9+gs46snPdWhpmfpuGuPHKUN4rYk6XA4hvUjuh9TRk0xJ2Tb5/5Vds7UzzoU6WXJaiQcr3WxhlACrztxNnNwCEn1Pf0tjB/kijH/7whx/xiEckvw+172EwLRZEW2xxKR2yMaStXNMKzz777H//93+fmprqHWy3/LYOStFo+Yy+sQpJURhIeWZ7j0j3IgHbckXbdkBsZ1seA8qci/50xb2UmZubG1/h9uF/l0KMERTBYRROlIVaaV78pb4EGgW5clvuF6goGKD9W7Q7poluzcUbK4jln4PBYBFOSu9EFC+tsLAvW6vPbnASIfMiy5TQnjVktcciOaJZoXaxCzILmcVZz+keZu2e6O8yltaQjbJkByhGkIl/TBxDghHR4TCWDOyybbfbImBmTof3HNCoeQSUaR+KtjpRptsC1pmFFilLzrJ0rbjznufmcNtt137hi/vN1zMcnO6DAgEIjFDcMcTpnm2XIhUZoMBw4mUlOEeO4Thdxs0IoJiiYkTbYe0e5CM7K0QUQZFozlcbHT3mOc/BwQejGsi9ggVmM0No4X1iFO2q5UrG3iAijrXznhiYm8Omzdd//Zur4nAqzLsYdF8KaaIJILn/V+9G10JE5Bzl7CcsKAWiSfTJoHTAwVV+OJjaWMejTnyqO/Y4TOXrFCIk8x2nDECtLaZeZroES7AEcoOa6qmOHNcBw2H8yU0/vuKK1eDpUHsQUtJJIAk8F9FSoIVPQtgXAwBHRHBgHjre4rDZ4fHPOgXLlgPZRBRnSrkWTeraxbZUTRaqrtNBnzW4I8nOnItK9QN9z6GlAVhhPLILOyA9Jwers+5qKMZrFRd0Rtqr0umzKhwWpYX2Ngp2f26prEK1jvb0gh2CPVFbWJJNDUbd3yZbUT5ZuXLlH/7hHyaBa4I92z0vydX2EG1bgvKp9q997bJvf/sKO/YxxG9bkapk7DHGzZs3v//97y/wM2ppdPtpy8QYnQMRPfGEJzzvuc+3+jSZU1HWfLJ6mvor1UFZ6O52CDoXxTDNxKU8iaK1M3NxFzCyki3b9kTeufJuhN0MyvDHFEDbk6gIob7QYIu3pmQ+QtSUYY1lbOWXtMTQygNY8FudRxOLl9h1NgWJKGUelPuL0Sj1eRgcwUUm5cKOSn9NT4hTUEwxcQXpMrPNHLeXwniB1Tvvhblrlw/QnDaw9WzfEujlFcK+li9fftFFF61evVKmusuXtF3LnBsHNDPl294s5VsbSt8QUV3XZ571+1dd9V3vBlFuIoDXItm83QZxLNUWgUj2JyvcbbfRxr8sOhU6hdqjf7ktyyaUueOhyw3UY2KDlhaEYo7QmUFkzUEvLCq00EULiTLZgV0RoMO5QMOpuHUwhYzPUbkot49vdv9aOUvG/2hpG5ljI7u67LldLdNquj3R4xmjfbOgjsr5IkHb9K6Adr2xsGu65Grx0CXI9IZTZAMARIY5zFGcgucs74hb6Eo/xVaa+wIVxRR0NTozDMihBKsCoT1lBGokHTyxUwGKqI2Kr0bIQ5oiwWH33h4pL55DbYiIZdwq7plZbvcWzlcgti/YwjlXtTEQY6zLNDo7CJa/OOc4RuaAYe3q+Otr1v/6uvX7EQ+4lfYrKwfg/DICAVzHIIazkwighAgZQMYXtdJtMqueUzpPZcyBWaII5VLAOBhsjsEfevBvPvfZGEwH8lQNTG0NvQo3WfCw224GFUiyi4UQOQxRh9kf/vC2G36wtqqmOeqxmcitMAFk49M5x1n7J6J8X2LrpI+VKExgODiCc/XA38Vx64rlJ57+EuyzFlRZOus94bUb0LIES7CXgp60prxl55lQh//5jyvDLTevcX4KTIhoKz2FcwFGs9fayBOTJ+/ioNrsMHjAgQ9/yokYTKOqiDxy1t1OjzT8flGDle7Fyy4f0/dWLWgpIgBMpvzxDN/WtlPHtChAg1Z6t/RH8fMCFRbVkyCqa7/tyBDGgz2cWLQ75qtCieymqG7ozTs48t5rSEUR/zIepJ7TTz/9UY96FAwZF8qr9sG6I7Wrxbi058NhuOCCCwpsdNVl2xO7jkK+1vbDH/7wzTffDLOIulNc4NMqZvKcfXyp/re85S1VVdk+2wiCgpzkVzlFZZ9H2Ut2pmxVlgbUnTHOQujbEdnjMAkj6tKPvh8zzO5P/W+yS1FtGDL3Oxt85mcz71qJ4l1Obls6TH7qbAxo/bq3p9qsfCJT2TLb2naBPEsEpb6ZZLB7F1gMFGMcM1hjhTbTUqysnYKZ3j4IqwwhPOxhD/voRz/qzDURhWS3L9FeBWTop+Ah+qHdhyOijbff/qpXvWrDhg2a2KF3jBMK/WR+moikbpcs9+uWKVrk7OjpoqIohp06OwW7a5bexFBIh6JvKiKZ+d57793RTu8WKEQkgLqu5+bmRvHSlJ6yM8v2QdBqy/Q+sIm3hVkvygZ1grIThWwZ5ZMWVJFQRlostIJQ7U8rV64cvyKKtrCrNWeCvVhGoVcWFB1Dn+2AvlFT27ncNN6Jbex9b2vo9sF2plA7QcRtTXJUtUWZ7gJU5Yo6e+024ZIdo3ZSGVH+J2w9vQpkfuPV12TzUCsFElHrxpxtJhS1kjsMkZk5gJm5Dpifx5Yt//X5z87ce8+KGKrI3KRlkF0CUhc/EWJ6CQZqRgRJ2DQTgqSMSZpLBBCYIxCYIlxFnmLyYzbhfgDM8SgiiuAIBGCOsInjcac8B0cejalBs9QpSn4yzpgleEo7YP03EO1GMFEesSZiDpEYlfOIjDpi6+wNX/9GtXHTcsDFwCwYadapXnin8s0RVa7lEY9g8s2NEeICB8Au5asKTDXxveBbuT7qKU9c/ajHYGoaOW2QBGHuloifJViC+wIkzgmoaYfIqIeoh7jt9usuvXTf4XA61J6j5+jBHqjMPj4RaeJdLjOnONnnZuY6YhZuM/mjjz8ehxwER6gGKS87j49ZW7w+yvHuHjsoy+IKg1nR1To8NfZqTvTpW/cNUE1AsaTvF1QSCtWqV/GqqgoTm3bb0f/JQRVxqzVO4kC0M253Lgs9MuYbV6nPddKF3vFOTU39yZ/8ife+qirtsC2snR9zWrlohZnJu09/+rNXXnklMWJMmiWryzWyxHPb4ahhrBEid91119/93d8VnR+/ZJAzwFidNcYoF00y80lPe/qznvUsOxahQ8p+Lvm2+9wde28HrJpadEM/0XA5ZomDGEmKPZbDoocuv7KhN81PjvROEpjRMWDPqRE199iK5JLUog0HSGo4sybQI7B6MHNMRxOfIiaTzlFGqss5bYkIkR1SfknOESuIcklpsGZVccIOHaupMNh6qZc6V2XuXVAYaMXAuyarli+kW2l2MrBr8gVnRgSxuUIIv/M7L3jzm9+qQrzbaHcUNsawOBGZRpXPYRREQqAbbrjhjDPOmJ2d5fbuCCZjdBaU3dnzHFY+FrEvLb7NzdlSeRNiDPk2sF7ME5FzFeDyAbjUh0m62oWCpxWdjzFOTU1NvihGUPQl0gAAIABJREFU8duiDIDZWXVQblu86u4EbjuAVAoz99y53JQxEdxyyNCuqbTAQtSzPmkxJikkE5AC1NIzNUu7OdVBTYYZvYMeSHc6U7b0pZ+Fs5styTliarZ5YNgCgBUrVpxxxhkf+MAH/vVf//Xss89ekBIsMyl4y04ErTENoUNlXV5B5gCBkWvNPOrY7bcxRimjn8Cs34bUHelctGjGUQSnGuQEQLuM5QwFHxYNzf6qrdh+mm4H5jIXFjMDcvgYMUZ7RsQ5V1WVcJIWbtvEbBTaqFUxM1GOkuFAiOKnsjUwB6LmYkPlwHlTikPIRyG6PKicz4XATkxCpXMI0TsHRP6fn9x4xZVrCTMxeuIUNSkf5uMVsqkQARI7G5KRtCURiVJ5zllr5EFarzlGyQeae6U8WSY8D80xuXpQ3U2Mdfs96dRTsWwZ3MAOPHIkc4alK5n2LKReadAERY4RoabhPDbd8eNvX7kmhqkwRGSSqySMH1nEYcictI6RswObiDgSxyL1mFdtL0lZEJPjamrWV3ctm37KaadhnzXwjuUa+xF7BUuwBEswCqxISw9y63bNd9/4P7euv34/5pkYPUP2VSVcRP56ggN74Y7ZR5lUJVVqQ5CkFvcCGwmPfuYzsHxlIMfkQB7sRjuMFqlqKMAjbBUFawbYN8iCsEh9QpTYZV3XvL06/d4O1oRAFsGFZ43bB1t6RaQi36pK+tvkPdml0CWM8fZ2o7yaQfUe30MOlyDjTcNYLaL4XP95yimnHH/88fbGai3QFbJWk+6ODmZe5ubm3v3udyML95hTsib+Y+x2Noa0begDH/jAz3/+86LPLdU8l9Su2j7rG7ENxLQTb+z4RW0/1Dd6KKRo3Xa4m7lJf2LjjrE1iPJoPylywBXlFwOM74mdCHmj02GDKaQo2m4F+1AcMkULY8lDxMyM1oF6IiqqbWg1S69ipUiHNWgX7Rm0yNe/LbXWZCSA6aqlgcIC3068L1awc70gldpZZgP285Kf7BjGuginzjSFEN72tre9/OUvR1um2JJd3qhDQIclIi9kCd/mtlPAOXfZVy/7/d//fQ2m7rK1CQfVi0YB6xPpdlKWilYiZrz2Vgv31mzHqMGb2wQFuthk07M9XLNmjYq/MWApEEYilISU8XbPPfdsa4d3KSh6ex8s8pm5OPZerJ3W+45jS0uOIrP03k66CXWEOcfd2OyGE6IjB6ntm7McXpa2c66ua7LeT+YY41FHHfX1r3/9Qx/60JlnnvniF7/40EMP3S7U7jGwFJjOoRpgTrc0F4ULKFRZasvWLoV3yR6mnu63RXkrRvWl68s9PfmSb33brpOzp6j7CZtQmOKNeEKbseSuKvnpX9e+o1L0BNHivPetc1s6Wupob/2QvK1lnjLx1DLXzMx1wNb56y+71N3y69WgCpI+Jhs2yaJmvSxVPY+tdojy9ixEzyEHCagUXTSmO8E5cAQRk4ugwE0j1CSRBBNFR7OObiN+2DOe7o4+GoMBMxN5SjePe0cVUkSSoJW2NfvkLgOzmxQJ7BiBGGFYIwTEcMs112y47vp9mKvYCvYMiY8RZX+u+to12pSZA0KkyIkAnITBCqHXMWhyn0CYJ3/bcPjAJzxx9QknoKo4cszRvVKGiGKsaXxKpCVYgiUAdOtJwDkX4xDz87j7ru99+VJsun0VeJpyZlgAYGJ26S+I4YlVeEF5JqHZRXcuVNVW75cdduiBj3kMiJkc4MCcU8XufTBeTlkxr8LS+iVtyUaCdoztXdT5RQuFAiHI0ePeWoyMVm0/wWhBWRSbsCe7AUTeiWwdFZkiYKlC1cQiAAEWA20FbnzltgbbhPf+zW9+s0RQ9sa0amHbq+IZbXyKJvC5z33uS1/5MowLMqmkHIs8WXoMR9vduHHj+eefP6r/igfbei+1MBMzVc4DOPnkZ574tKcyc4z1eHXLaudo55tXLI2hny5OyPjUWj85KvTz3hncKxgFZWNMp1LpWeelQXtMN9VQjiWxY2zM47afyNYgpjKnlyJsWGtWMmi12KT5hI0HQfafymkq28PUGWrFIjEzceQQY4wEj0iSgYvaccEKklKgMIXuY2B5Ahbi0mgvjWK9pL+Upqn/5r5t7Fh3UkTm5F2TEGP8wD++/4lPfLI0rZJdO1YQpI18bIn4NjcuLvlpHpz76Mf+z3l/9qeu8ppBYluHxvlSNXQQTsWJDSKJbtP+E5Ge5JMOExHH6IxKg/b59K6EJZP+cpvATjoyX7Xjkr/Lli2bsP5iltk4OLq61l133bUdfd4jUOgAyaPdF3RfUDgRaS51GE7I+eLmVg2MJmoqR88RkfBAZekac+dAxC1sS7XK1YGGD+uvlq7StwwO0XVuD16zZs2nPvWpRz7ykVYP3IlY3Q3A7VQJ6LJEkS9tSSSrMmZZRu0ZRFZFOHtOZL4cGiw1MxvTNKXwf24WgtW1LO+1G2mK+eSANnn5izLbhBRFhfrZnaus0JWo9lQzNVmwdBW4JHAR6+SHCxyZoPGYhcKgCBGGzNlpXrKb3lFNTnbq/pTee44uAr/+9TVf+PI6jjORPYPk0LGJzGGGTJC0k7UZsjqgfKKKDqfASUS514acoE32XwuCS0qmc6LB1MSB6G4Om1ctf/JpL8TKlXAVfIV2pH2XYy4eaGZHhF+MVeVQ17jn3uu/+Y2Zua0riKp0nAbM4LaY4RROCm5PdOwIaSYtn2McwHCOB9W9A795avCU016E/dfBOXbkKs+6aM36XIIlWIJJoDGcOLjAiIF/+rNrvvLl/YiWA94YAZ5QOSKCJzjAU3rp06K3/Dwn9iWedXRHPX/s056GQw5BNe29H31/996RmNwtdAqbzV4xjFx07XDvcoeQMcqouD+Adf3Ys5/60BWOBZasmaRm5IKGcQFsUqrvlHGNaQhmOOO7Z1Wr4uiffWjG7tIlKm7s4W6FUgTnek4++eSnPe1p1k08yty1hk1sX7mgX+nfuq7/8i//UpM2WmNe14jmY0WeFFFeL7zwwg0bNoxBaaFG2qVniYGIJJeR9/6tb33rgot6QaTpc28lPVaieW8J1aBi4YubFgOjsOboqALomklt74O+t2QgP6C9WMb81UoMTSLHL05aDzp1Avk8uBlpes4X7zAzhwjmGBFjRExsRC9b764gIhIHZYG9xan/7yBYgu8tYKOS0aYWSxi7omPKOTWPBBlDva7r5cuXf/zj/3L00UfDUG+XdZPZa+H21otyIVivX5+rXbjcX/zFX3zwgx+sqmrUKenxRNLl/JZuLSaZWzfaF8tT8UMmkA2NQde64crKjklouGCJvb9aZFoBt2rVKr3xfAwS0HdHXHdjT+HWW2819+TseeiV8oW4seW57YIZA5YjaT16WqIo2du0ZWiKanW9FXNnKZ9H+InsTCktFfDSl770uOOOs1JjMUjAAkZRdberijeYhZbonNNhNHlj00EUSwNtzFvFyf4tytsa7BT0ltEwTzYqWW9PJln+JR5M4SImt0uKiQOgtW/RfCUuIO+ZWYjZdqmQQcrWLA4BVGhznAkFT3IU5i4BYJblJJ4vB8QQgqtrmhv+6PJv3PH97z8YcSpG4sho7o/ONUksJskFNpSMagbgiZykusxnCMQ7mTYeGDnsKFLeeHXOETPA5ITbRyfnFwlEFECR3NC7TQgPefrT6JGPgPfIw3fFHMSIhBZB3GJZgZy8+BHMTpzuov398pc3fPOKtRwHLBtvDHNAQMnCoXUiIzHETCj5YnQAcmhb5ioQy064Y3JzRLfU84c96YSDnvhEVB7JjvXMTGYDUC57ysrt/dTaX4IlmADkQCWcJA5iBhj3bPn+pV+Zv+mnq5mmYvTMjjhHMfd7bYjhsmfRpbjxtOJq8HDK0cpVj3v2s7BsGYgkMSWAnEPMrk034nlxAZujx9bM0F/tT4XYthzJKtySAjlZs93sNfcbsIacxY99GIV5tF0h+mYU/+/9icwB3p03rJGtU961s6p57yorZBm3AwPtGzuQ8ZriKCDjHTjvvPO+9rWvhRB6w3m4LdN756tbEsDll19+8cUXv/SlL7X5gLojFROd8/m1n/70pxdccMEoFMFs7Os/VUklc+hM/JIABY7PefZvP/nJTwSDwZr5evuQNoZmtM/COlR7tj+1uEHH/bG3Q8H60Oe01TIRfMABB/y/Z7z64IMProdzsq0lOifpsSypNlt3zqR2tdaL9+pDT7yFmSOCcy4HoTjvKTKRY7BzzoW6BhBlvtopAphTmTrMO5ObNWr+yqi3hrv52bmtW7de8e1vXXrppcNQi0Fghzw9PW2Hj8Vqcu8U6PKEAuziLQhDH5hTetYUubMDqLKGa8F+dUuGyDvHw1Afcsghn/jEJ0466aRNmzZhBGfrJWbbXIEBZXpdDuCcO+ecc4580G+cdPLJkXsuIRhPJEVb3ci4VldzKI7cDaWVSyRyZpWAIU6xT1FIMaRVtk132Iwh+OJ9E2gf47JlywaDVoa03pq1ngXloBTYuHHjvffeu2bNmkl7v6fBosh7D0c2qW5vyS7pKjUKkRTSk/LddF2dqt8cyBJWCM+6LFPrhIjmqGiv3NTCynjl7ymnnLIdWNr9MF6F6ypvvZ9YRhFC+I0jDj/vvPP0KiRmJpmL5DERT4jEO0tekUhEBA+A03NqyKqRyG7H5NXKHLhYw9Hk5ROZG6UeM4xEP21na1VVoea6rufmt27duvWWW275wQ9+cNVVV225Z2sEAw6SpJJkyN65KsY6H++TRigfJk69lkvAhdB0FEJUksOao0R9ioDmGIPwq3y7d5l+F0kxY4CbQw1oL7BibYwlgGb+dLZiqD0BDNx2+1Wf+/xaxBV1GKBRMhri0BpyckkBBypOlBS9MNw5+y5dMzEM+JTQBjECHkG8jUS1p3sc5pYv/62XvBgrV6CqmBxruJ+2KGNJuLPsYEFk7EJQIRRjZI4Jmcxxft4N52+88juzv7h5NdEgBk8gdSWzHOFkYiYTaYz2RLsiAb8HO0JkOOfIxQAiH4mic1uIbvP07NNehH33g69AQM5gJb3UDvfy4iVYgiWwkNc1AIAihkMMa9xy83cvuWS/ul4OruRmgp4PodEtLjNMB2JSeUIMJu/qgb9jOH/wbz5u1UMfJgHjyEZmdhYsXkfkeLCnHhQs5ylsj8IsKYwieUhnDe6b9ukC0GhdxtfQa6b24nxBQ2VyG28S3WPHoRUFkDU6jFb6C122a31Z8TpqyJODGg/HH3/88573vE9+8pPd7ul8FV2yZg86yp7qEu9+97tf8IIXiJ1ZBArZbW3OJ4wAnH/++XfeeWcvTrTpwgBj5qqqRLf23qs/VH7yFUn45Hagyxrn1srqdqwYuFEjW9qvHEzmrC+lDdu9wWO1TT3s2mY6HRo/yzEecsgh55xzzn777Sd+RC5MJk65utRI0+y9RMQczBZX4/hWUyciEBGiMdXMCIidtAiK8txi1/DMLOYfTOvknFpJyVkZUs0XXXTRa3//rNnZWc5OH6nTHvHeDkwuZijodhR/U8SOWhda207X5NV2KNgmZ8eK6Uycn5899thj//mf//mFL3zh7Oysdh4dnlMMvzB5OEMxUstL5Z91XZ9xxhmXX375bxx15LYOzS6xUcLC9lx0Nn3TzUWT8qFFloMzzVcd+90adAt20n6LvoXA5rJdAMLAmXnVqlWrV6/euHHjJNjoDr/7T3netGnTrbfeuhc5KBUkfR4W2uAswFJd7wZhsdunk65bfejzV2rAneYxaJFEIsuyb73KHgwBO+fWrVvXqzkvNujtmHCVovN2DbYwIC4UozDsv//+r3jFK7iTbBTCyuABwElAtAMgVzrLM1OUOkVaJROu87d3pdjukUZ+5fIpwM744siQDRGBiAOIiJGIIYTw05/+9O1vf/v/+dhFFhXUFxzQi0nmtDdVcKECpTEGw44o46q21eo2jLwJIfQc8S7ycfRC00IDjsgTefFAeu/BEXOzd1199a+/e/Va0DSYGJVzOYeiy8qfoX4w5VShREwMB9Lycm1V7q02CwCVI0/gCGZiUYi8D0x1hPixYwA5sKMADpW/g+KRT3jCqkc+CtUMyLEdry5v8qDmZBYR5QHuSUj9jOxALkUfDAC4CNy5+drLL18xP7ccmAIjCmPi9F+MlHwZkYhjh634vAwCcySGB0WiSJw8zjm/D7kh0aYQ93/Uow94yonwLt2ZE6MlZCR5VueLOkqNYVcjagmWYK8AXQvMLKpnXdcIEVtnr/vKZbdde/1+hGmOTbItxCTtmhrADDGnOadsZmakWMAI52qO80R3VtXDn3oiVq2Gc+w8Gk3FEfm95Vi3BRodIVAYA4XgBABq3UWLtirQkwPo/geF4qv4KXCrD6NYvS2zaBXZCUFHVFBXowXml2inINiRsStu3/KWt6xcudLlK62LXm0TxebCjshfc801//Iv/6K9Lc54ah80Wvmmm2760Ic+ZB27o5qAwQ/laA4xbp1zzEHyGTHzaS988eMedzwAuVNlW/FTtIgRSixniMaJpui13Fj0Tzs0+2vvSMdjYzfAhARmT/nph2Rz1TliQuAIR9VgQERbttwNDiEFJ3rRtCUih5Fc2IJ6ZiJJN5Ii8508gyS+3wGOXMVwKSoDHuwYzX/g5r+ol3izYziQ17+RKSIwRfmnto5kESFVAsec7rRl5pe97GWf+uTFy6Zn0HYELJi0dO+FgipGEckkLJ2z56usZMe4uuWWbJxramk78TgjEjsiPz8/+9vPfuY//uM/dtNB9M5gd+Uqw4RygKQvtdyj2oENt9z8yv/nVZs3bx7TigVNKWDb6pUR3S5pllXlxprADoYtd+erwGfvTwuCrd/2H+274GK+SmjZsmWrV6/e1la44zm1PJyItm6du+mmmwDspXqp3tM9qoCqEMVsoj3RgnObF4WMl6qYIORZ00m0opza+hszS15L/anx2Zmbvm0rWq33fsFz/YsBCuagYBc+Osu50FoZKeOkvpFL/GRPCwafzETks6whhkvPItpSLksHZFkmZfr+5pToPc/2b2RCcrv51Eouz0zyqwrWGMEUI0JkDjEGrgPXhx9xxIf/9//+h3/4h/aeIwNy+Ji4L0yjUJ9gyFjf2ORamZ+TaA4AmENm+EEiNJ1e+wwwk/eDpkda+/bl09VKxCfKtdzwcM/Vn79k5ea7V4EHTJW5y88hJQ3tQt6str0CczR30hppGKVRBuBIDoyAgDq7WROOvANTZI5VtZn5zqnBU154KtasQVUFNBRcCJK+vi0a9UWYFzkONeohgOHNGzasv34/56YRXYzp9lDAueTkTWffZYCjK+YmxWfDnoLkyyfUwBZyG5mfcOqpOPAATM2Q9w0XaKv4pqc9gnkJluD+BqMs22aBcKgI4IANN//HZz69NtarOFZgSB5JBoDABZMEAEdy1VWq1oF8/omIeDDY4px7wP5H/daTMTXNEizZDnvf5YPfNTCKXRc6WaGcqW9FMV8cwt2m1IdGQdlb0WjBsmuNBYBRPno1EmuAFTNitRbOt/F2devtBj27tIOgupTdPR4lrQokwFjvWoBzuMEOijyNkjjuuON+93d/V3Nfjoo3tKK2208Bew6XiN773vfee28KR+J8FNFWSJldOOcuvPDCu+++2yqpo3pe4EesILsLzowY48qVK9/85jdrPdudvdrSJ0ZQl+2trlmrRutPWpWah1pDUbOtcw+qNwuuJrtUu3goyFULeO+rfK+6/UpWCnUATjbK0ga/fSYiMn5wsfRcztNK5r57U6Aq3hfflq0ju+9zvAPM/AL47d/+7Q996EPW26LzvgfnbvdDsdyUJAoqsvTQ68adhPeO0nzsg80aqVlx9VdLIYPBYDgcvvKVr3zXu97VFb4F01Oat00XXKIwLAtSJ6KZmZkrr7zyrLPOUpVpksFSex/Lirxun9FmX5TP88YY9SKTRtI5Kvpg8VlUPolmovWPQqN9aVE3MzMjDsoxwe/t5dmvIXSxun79euwkDWF3Qnd03V8L+rR+dmXCdhIVORZR9vOCkKRkcaZbWVwxrVYIUjbk0ZkUMi7RMclDFxWMovxR3bZSoBi7LVaISNoTYHtSvJcH14aeN/CVnyIiZn7ta1/7zne+U+sExDXZojTLT4qAd4tqS076a3GIzaC0OcfQ4m/Sk2IKafS6akN3TyMCMcbayfmOukbkLT/60Q2XffVAYDpE346IdGBP7MCVS3c7kON8TIQAuXo2DmMITCYsqHnIm62gfOy6RXMEuUqcCZIZuyauQcG5u0EHPOJRK054AgZTSGqMUqHPwUQp9WV2Xeda97T6wnl/Q6+jSW9C/cPv/Fd9++2rgCmJ/BTmAjQ7OZEdWjfu2bGlHJSOCexBjinNMUVGcM4FBpMPg8HdFa99yFHHPPWpqAYRIHIxAuRbJNkSNi1qaXV7CZbg/gQtBhIZkR05TXPGIXIdOEbMzm38r//euP66fcDTzC6vHqYUPxmAOsVSUmDxXYphJq0wmTvBA8fg3Fbnjjjh8XjQg+Al2r10YbRhr9myHsWTVeHuLRn1vobmDEL/vd5jwOqOk5Tfq6GrfHTtn6KMQqGX1HVtf9qJ3dspQESqGtmX1KeppzLUXCgX5b5jAlNPMqnt7pLqeeecc87+++8vNYvR3u2nnZriQUGcnjHWkkD8uuuu+8hHPmxLalWU98NFx73xxhs/9KEPWYR0p9sGVxZqrtYsqqj3jplf9YpXHnvsbyaNY4dJYjzax0xrtPdyONK4iVRb0glhO6lksFNc5DsIhVu5CyXdtq1WURnt/aTisJiamqqqyrqVe9ldjt0AgHw4ygEuctRnCfdo1GwTD5IDMylG6HksHZk+t9mLK8pEiJEgbQGUpKGyaLHNXvKSl5x++unIKyvGODc3h/uZXsrG61HwjWJyuQ3Ne0I6iLDQku1SS8ENbE9ggnyVxTE5OA8nd8t6T1Wsw7l/9MdvfOMbbSUFcy6q1RYLJgCkTJqt9W56Vdf19PT0xz/+8be97W1aoKAWexTd7nLpMdtetDh7IhgpeERWYnOhfceBblsvfiKJYs46nh3IgtC7l1awOGonx5ienj744INtse4YbT3dDhed15fXXnutqWYviKNU3tjaYDPziI77uFAqLA0rCcnfaG55ciYEnvs2QW3lvXiGmY7iJXO+trjtVbeLSFYE+tb1XgFd5kNmD6woYyFju9KoxvZ/uxy2SUJ1uYRIWBGvMgrvB3Iy+Nxzzz35mSdxyvslu0GtaMWCVtF4zBqWm8kXYFUS0ulnsmkAmy5ZZaAVo02adMyS4HagrBgAcyDncM+913zlK4M7Nq6OccpcxC7TmA3pkmc1ugY5B7jsJmZu/Gx2JVKyChDR+N0EQU4/lnBlV2FqagvRHRyf8IJTsf86+IpBKVtNC2WLF0qRw+w8EGpsunP9N69YUc+vRBzIBtuIIAS76hLjMxOvLmArpJGNEwZtYdzK/JhnPwuHHoqpaVcNQOSKqNv2jtAYWOTYXoIl2IVAOUuutY1BFBh3b/nuF76wz9atq4irGBwi5wDJpL8inTvQmsQnkh0r4i6R/3zwfgvquys8+hnPwOp94AbNPg+Avjvado+s3Vkwio1YdcoeN0gP3NyYadUUfbOgx2G8/re3Q2GkWeTIT92IiWL4xU+FAdO1W7YbVJXfWdDV41tmeTdWlFKGcvsJTOTjdveE8zUR+vzABz7wrLPOiuZSSNvtQosrtG0yd3Prs4ZSvuc977nzzjvVQCq0W9Xd//Zv/3bz5s3Wmioa4r4D1Gh7x3SrPIS4evXqN7zhDegjku2D7nIe9WvRYpfUMyrGtaWI3ZE+7xRgnsgVXgyw8SYT2ESxMbMnJwEOYo4qluxU2mp7m+vYJGVn9K8SZG+ZbueLVQnoNSM9bVFjVhGAl7/85bbyEEJxLcx9XjstuJwdtR27WJVjyHvUaYMxCOyySr0MB1n42uAvZ8K9pbzEz4YQ3vGOd5x55pmW8ou1byWOnV8Yt46OToWa916vfa/rWuK+q6r68z//849+9KPaT4suVyTxz1hVB2XvApGRJvwXvLQdyC8r0UYNW3rWwXI7vmkShsBtb6ytymJPBph3ttIRb+fcoYcearHXrdzyDV3gXf5cNHfttdfqYYu9ImRvwr4pHmS8MQMZv7luNakCYDefCpc3m9DXrlwu8Gynw1KR9q2bV7FbkpnljvXFPB0CvfRf6CH2oav22PLUXqG7HyyXm6RwUd4SBozhKSN961vfWlWVLGrBQ0E53W5gFPcw/nTbtOWQZBIL6F/keUk5KMfwiz4YtY8h7kQPACFibh6/2rD+i1/ahzCN6Dg6hpjVRBL22PMfAKKUe4Y5srxPUQkAgcgxpwPdEj8UGHWUpMEgYueMYR05NUSSmJJrR3c73ueoBx3+1BMxvQzwnOIJXUZZyogElPseiwXMHj4zg5iZEWP4+S82rL9uDdNMYIrBwUZQwfqwJY4VABHVMUagInI5+IpBHImZOJIn8kSOHcE7VzH52rktjsIDDnjos5+FwQCg5C7JsgoA2t707giK5bHLMLUES7C4gQCCxDqKeCDHiAFzs/d8//obvvnNfYmWRXgjMqOkiAWYUoBzhPzTEaewasAhZ/oV9hYqt6WilYcfetAjH41qCt6BWXKgtLXz3bQHuBvAikCrorXUKW5Zs1CNnACkTOeLX/3a1eBMLk5uO+asASlQILzAnnL7rlttx/u5c0VJ72m1XmtQn9DW/CzsyAl0ylmoNIAxxvgHf/AHD3zgA603pyB4NbwLk08SC1rVEOKaATvnfvKTn7z/H/7RarSFdhtjvOGGGz7ykY8oAVjLs8BStwMFctTn8YpXvOLIo4+Svf2d4ubTVgqLoqvicsejR6rARJbNWwBw+ejJaCpbDLyCTfIKhS4GLH4aq4ByaYZoicluAYnGGPuudc6wXbKD0VySzgD3HBa2v3Zc4yrdAAAgAElEQVTbtf1JA5QpMnqy9o3bzqNjjz32hBNOOOKII4455piTTjrpoQ99qJxmKDB2HwY1QS2LKHyRwn8KF2Sj4TMgpMLpva1/lHFrf9KHgmXlnjSWTH7UmLJI3pF3zrkLLrjg1FNP5XaCMh1alxfpKlARxnkDxlrIdi/HepHOOuusyy67jNpbmJp2o0WNbTnYJWAVrBbtqTOcotjUerer2wplW1WXxfW2W4D9pOD/WqFdO2wu0QLwkIc8ZBTfpqxh2v5z5zbzXtl64403btiwAcY3qunqzH+LBSySWyflQZarwOCweUkg7+zndgMyCV+OGrFF3olB772XZ2fSYmSeyboqLeU7kKc2FeXzH1Bik9TB+RQIGaNeYX5+fidibzeDkquSd3fjVgrYKShmcHHC5MJLt88pq5Fr1qw9/PDDDzrooDVr1qxduxYjOEOnRRa/mbI7pqjBl8SIdSB2cg+e9y1+qE0r+80KrXeuavmGx7DRSYEZIToCQtjwrW/N3vTz1eBpjhVYbjMSj2H5EWTfKEkgIhDlc9+awZVSx+QiHU7FSNi4tMyZC3jDo9No/cANpuZ8dWs9/6hnPgMHHohqIDaoLmZFwmI4qjMSzByllRMZMf7kqqtw+8Z9vKuYfY5+EA+E+bSUZ8qSmuWaZ8d5oG141OB5j01xeORvPQlHH4mpAbzEuYJN/cVX7b4v3lW9BEuwR0AWZYyRiGOMCBFbZv/7S1/ym+5YDRqYkrFPQAqrCkl/JYjLMsbAXDMiUw2e5XgHx4c9+Uk4+CBUU+hkkLGbV3sXcJ9Bjo7XzEq3XvVdjSLVF3tvBl+wM/clFifY0L36UUNT9c6+LFBR/HPxU1ohK3vBFUc52t9a2JHx6sKUjOyC5wMOOOB1r3udxPWosWeN4SImunnuhA5Zo5GI3ve+9918883d4XMOEXrve9+7ZcsWW/Mow5iN74/aThBu4kewatXK17/+9To0budB2z6Moa3naLvqzNXhFB/qt9a/oBibpN09C70mRC9BKgYSGYiBypwP1LAtycx1XVsrtzFFJlgp9teuravKPXJAh219/Oi0P+iuWROOoVXZIRx00EGXXXbZNddcc9VVV332s589/PDDGyvifgO6GGHkoEU754i53m+L970GvJ2j7q/6RgmjMLApb430ViXRXlVVfeQjH3nMYx5T17WNtrFDU6LVFotlLpLOm5T63InukQ7Mzs6+7GUv+/73v295ght7OLqLItufRkXp4z9kPCZ6ZYq+KRBl144dOyYA7a2FUXXapfTgBz9YdnN7pYD9UHEo2LZ+ItuQPNxzzz3XXHON8oSizCKEYtbkZVcSob1SnHNkiBYmsWBL6LRXkC5VW79lrY5aUbQNsaF5k7yZBrEaZgQz6d1VyczioJyQtPYUdAlSgNv6EtoJcFv+5Y53HoubCHv7NoYIdWGGEI455pjvfOc769evv+GGG97znvfAcObx9cNwjwKxSPTcsrPQpkll/rIZBgCIzDmCEm06G0tz5rw9oxXNB4AiOCDUuOfu//7sJQfUYXmMA4JDJGKCIzT+rPQhmleyVj05TzmjJ8AsMUOpY5Si/xA4JZckyJ3fBKQbgpiT1k5EERwYQ0btqnscDQ/Y9+HPeiYGA7m9Sndg5HrB9gGTxbU/k8ARKAWcenJgRh1x190/uOJbq+a2LkP0XCMy2tvH6f47kXBEpDyLmTJVediMP7pW00VLdQzRYaun+VXLT3je87ByNSJp/qD2ER77RuhE7lIc6bhcgiW430CHq7jMspmpjpjbip/97NovXbqa4zKuPUenPiCAOG3z2PjuCAlNj0wxIrFLZiZQJLCvZgeDratXPvzpT8fUNIhAzplMH1IHUb+nb6+GQr+3mnohTdFRQahtKk/Y3E4ewB4FNoeL0T4EZzl5obxaFbnQDvcW5j9qHgtTMII1W5+AtdnSis4xj9s9dmqnM6Mc0HTGGWccdthhtlcF5rUnreokOM6cEEzFcvK1DbfcfP7553dVUlkOV1999cc+9rFeU7xATqHXFkaUXYwvfvGLjznqaGLEWO8UjcsetLRDUHrWDlinldJqERWV3sccwMUN67DFeMROyaKCYj1Sx2tsg6bkvQwq84HGUWVJHQuxPo0hAoCYkrUCkVPuwghEOAZFatvkbqGUmi2mTcQmIkmiivLrVqiIDNZ7v3z58tWrV69cuXJ6elprXBCN9xlQAui1xpFXcUHYikmWfLt9zkddStznV+qWlya89+IfNDE1XqKqvfdyQi5FUTonVyfphK5evfpTn/rUwQcfTOYyessGCyZcnNwsZFbxBh2Gduutt55++ukbN27kzoaKZSMF9RYs0TaReLJEKztKt5JmHpUcfJE55DUY2Rh5cgOE9VWF7eBGxSouVCO0HWf6EzMfccQR++yzj46rt3I1ycnsaLay1nY6w8xf/epX9XMFG12YW9yT1rqlMXnTOtRPzfFFiZRU8lYQp4fQudygbWtWGd3EKUfWs6ES6V8E+jFz4Kg5oOSYaCI5oiZftgi4fFYV6qcT6jLv0aZeHePiVOpsn9IUdMuYBWhVLHlTnHNnk+IGOzhqbvdvpwN1gwBL9cx6hDLlOOfc8plla9esXrNm1f777yc3X+XyzQkJy8/lzLG2okxSslgCFGNkAlMMHPK9Xq30FJkIZQkXW5Kx4dHo29vcFpwQEEGMOmC+3nLt9RuuvnodeCbCxQBuBU5aaiEkEZc6EGPSlbPGLD8KlgLLaXlwTjEp3v+iz6zLWMYPBOJ7Y/j17NZjfutEPOzBqAYSFw2A5FafBE7Tgm43KnYfMGMYQC5s2PCra6/bzw8GLHejt4QlUYqjtBPtiVxnE8+h2VcHIH7hEEIdg6uqeUe3c/3Axzx6zaMejUGFQaXKXKOmlBPRj8Ou3bIES3B/g7TWZKcg1lwH4ohh+MFXL9t6001riWayqOkuk+66kTI52YWc5WSQnwffFeoDjztu+tjjMDWV71dNn9j1vjeC6E+jItQs3ozsbNnV9p+FFuLaFymOAqs6jzfU9y7g1n4m7ENBNr1Y6lUn5J8SDLhooaAK+96qVgqaE4DaB64hdkIIC0ahTgJKYKLSrV279o1vfGPXNi7cAaoF2bnQ44rWca8P73//+2+66SZrnerDeeedNzc3RzljkYbzkLk2AdnetsuhGykjlSxbNnP22WcrOan1q+6D7cCYNeosWuz0sUnpVcypHa8ebiVyw2Fjc+rQdFF0qWKPQJdiewsoinrZoMWSTo33zQa2Eoziapu6qJXYh1HYW9BH2TvM7vtezNhJX7Dj9yVQ95mdcSVsRYszifDQY+W2arM/2RU9vie9Bbgd1t0lzm4lMcbDDjvsk5/8ZFVVbLZAlKsUnVd+ZX/inG6S26C/WuSsX7/+Fa94xXA4TKpXPpar7AWa5b+NH23XvimSLdoydrxSICWEbYtm6/7bEXoeta57ZaL0Z926dQceeGBvVfbZOm0VsZZgipEC+MpXviIYttJEBVBvlyyopNs+UbJNYB2mEm+eegszQEPVyF4w7ZtEsRFRDCFmoa11FkOwOBlTTEujvfFQREmjzQztUQMLFtVjrn5aLMA9B3YtWL4Hs9ycczIRlkV0MbaoYMEujSqQx5jKyIZ6rz6TSatxbhb1WExKWeecXFbtTFLLIkDVdfILU97D6Elyvw2sjYDGORjBHOeHqGvM1ldd8oXBXXeujPUg5UEgwBEiacQitf5rqnSISNzWrLrGII+IRHBOEACAYqPyOE3Qpus25RGrquGgmp2eefzzno/lq0EEOOHqSFyjNHHzNYKLC1pEI/ttw/kbr/7uvbfcvALsmQE9HU9EhCgZJSEJJX2zAiEmA2uEKiW56LxtgZiIfBUc5gZ+0/T0o095LtbuKwdFtT85RRHQ3A7cZL200V5d2bzLULUES7AIoSdXV96MAeqAmzdc9dlL9qvr5WDPkbjf91YROW7qIiJJT5mfGQATavB8RXcTPeypJ2Hd/oCXiE2UrH7vyz4p8QPM7Ml538+oVcFSpT/HYnSMZHMLs7wUFbNQ1ntlPBnY2aPckyAZn1MqdILmJFIosFFgwP7asH1HkPwhNFG8ww6e9t1WsNoVjCGhvyYdyzsmQE5upNRRHDnkO1g5xiAakQ58QVNqQVAtWfowNzd3+umnH3300dYutfZJt0WrcMd80YH02cY63XXXXe9973tbXWUg8mc/+9lLvvh58i6CnYPond77iMiUfJ3kAVfOV1fZlZ4450444YQHP/jBcMx99LAja6rL5axOrBqw7Vth73En64XmoCx6ZQ+n79n0Bd01aJSvZkSWZgAwSkPXekmSc5m7125MLDVsJ9Kz01uG802gjQO0QG+hQ07SSBtG9rOkLtcfa3MfgzyJrTfKN7rn4q3nxQKA0RuoTRkBi2r1GfV2r2upjqI3/VWAmZ/0pCe9613vkq0X8VTagWgxiwfLFmDir3tlWdv+whe/9MVzzjlHTXo4siGl2lbMOV5ZvU4EDYBkpEBUbser2vdIoTassXXIY2FmiTNtTxCNWk3bDd1JyViKMzNTRx99NCDr2B6nG7PP54k8c2AOfWWS9f3DH/7w+9//gXMVzDVK3IFRa1xDFHeiemZpQKemkR0RziUXuQ14TOVD1LzGkeMw1IFD4JBOY1BK0CR+TEFm4uASVkkAHIRVkk8XY+Zf2cimxDOVWhgcmiPMzSx4Pavamlw2Ln6gFCsw7ubFCbavzlU2YrEYSJenMVjSfYYYbDH7+SjeNQoKvrErpEyzPEdU3x54GRFpHnRvOOTBtmqwzndbm+QQz8UiEad0lJ086ba2TJPp9LPdmQ6Bd5pRGkKA9CNE/OQn133py/t6muHoOV1N2+oTAW2PoKZoVZqXEPdeKcaJzYOojXRqbszURRgYNFXNO/fr4fCI4x+/7rGPw2AKfsoGOStOc/2tHZ5FBc145aGucfc911955Urm5YALzMyBwZ1DCg7tdWUSwLcIBc1Xzgl+wETzwB2hXnX0MQ942okQn69L0RPaUBGHVaBxESJzCZZgD0JadyGCYuU85uex5e4bv33lLdev35ewjNm1N95V00KzWkuduwFHVLnaubuBmYMf8LCnnIjp5fBVoWr3f7s3AJmDKvqmLNA2kGyWGat7AY0Q5rwbxtTyUBR4uz8Ac8tP0bztM+0KcdlRelrTsWLFCkyGxp1lVEwI0pw9n2VFZKFdtL4igPTS1Wz8U0Kg3EvT/XBysN0QPjAYDNatW/enf/qnhaDHWKSN0mrsuJxzH/7wh3/84x83xB8xPz//Z3/2ZznXDmI0CayhL5ttAGqd06TiQTTRdevWvetd76qqymYS2HHoKoFoz6BVVKwlVoTkFAq0MmPbVZevtd1Znd9B6O2JJnK3Ic/64HIGtFR4hEXKzBz3VmGxBG2QpBM9/K33r4VR1qaCesCLnwrpsBMdRkXr55xzzmte8xoJhNQQb80sqVBE5+g/bfgk2hjo7fD73//+d77znVVV9QZTF583t3JnIVEIyq56ZguQuXKXO8oMd/ZTdx0oeWijxx13HExyzFFpAbr1WOgOv67rT3/601rYGuzcuWlnd4JEO3JPnhDoPxmtnLaKK+fc1NTU9NT0smXLpqenli2bmZ6enp6enpqaWr58+czMzMzMzPLly5cvX75y5cpVq1atWLlyxYoVK1asWL5ixbLly5ctWzazbNnMzMzU1NTU1FQ1GMjNy3KvfYPqPpxbmuHsOS1IXVaNfmtrKPYqMGJRLCoogii7umtTUui2UeCaTwr63OY+LHosKVgtTt5YPxuZHCkAZBehx4/U58RHZrC2pL4pGKBcklOhEyYwOSiVE5H3AyDGENxw/qdfu5x/tWE1k5PUwpRoRAKFNAQjBR4wmOCYHbn0K8nGL8lPkrYyv2QHl1LVkCTeYM4JLIF0FTWAmDyhLjDXkbZ6v7GiZ73g+Vi9Bq6C9+QqMKN34DaXzSKFZD0TGLds+Nl3r34Ax0FgRpA9N7nonIgAYv7/2Xv3MMuq6l70N+Zcu6qr393QSEsQBAEhCvKIBOWpiIAGjwG9qOgX5ZrwHU+MGkQx4iMSz/0C0WjOPeeaEyOaxGM8JEajOcaTEA4RUDEq8QXNSwQEgX7QXV1dVXutOe4fY86xx5pr7V1V3dVVu9saH1+zau215ppzzDnHa44Hu2R8lJc5WTdcXTkHUBDULzqI8uGoy+h2/HbgpPNego0bUcQCOrErffYttTHgJViCJRCQEypGRRUQGN0Sm7d+4+/+buXkrlWOfOa8Y8RQpLOU6D7JTPXzHk+uAgembuG2en7mqc93hx0O3xH20mJe2TeBKKY2s/mkFDJOqRcZg4z3XU84C2AOoaoqV3gKeewq9oBj7lvgHIioW5UMJu4rnFFdy3X1lIuK5CiCMBgYGRlp57xtjc/PYOYGzlywZmQOIYAAIoToycKUxF+mlB2bRNxCSJIOM+CY8miVOYEuPKv4lWX5qle96rrrrvvhD39oH9bpGMCXzdPSLoEZyWYxMTFx7bXXfvrTnw6hdM4x4b/+f/9N6hVElYZIplSwRIyAQA4OxIHZBQAc2DnJcV3bODKKUJXvftc7n//852fVEvYQhE6GEKK3UdWTUQWsikV1GaZJQEy3uTXHWQi9tImtGvgCQ9aHuAaSzhxvMmSmRd4OSMVeZfXK4nEUZLKAgFqoLH5hCOB+DP0CqNFft9RnsoDlHoUHwWzk5jGAfWveR2T7/yd/8id33333LbfcIn6U0mHvvT0I0S1PKREHDOXUpprY6H0RcezXXHPNxo0b3/SmN1VVpb5oqXHOGkl8kIlIDkFhabsj4RYBjJi/uNLe9oo4E5F3xlQntwNAMShwobZnGg2feOKJ3nvuhSb3XUXpOvQEhqoCAxS5LSDEKUjI34033nj11VcDwXtPjpkD2Jul6PZqhqImrdPRWQ23N2TmspzmxPayvfOCXz3tsssuO/roZ687YL2MKCGnkrEg6QVEXi1BFiTAXxiZpiOoqkqD2WWR9/xGGVVVjU/s/MQnPnHzzTf3+lOfl8p4/lofaqSVqVYkayBuxc8+BKyJAiQ2KHAIgXq/wnlnka8jtREnc/rckOMqhdVGuU7v256LO7MZR3xM5AQxyadNUTnnog3KeQBCIUMoEZ9hSTFsj7XSqUPFjFoqqLpANgMeZatIjh7nXFmWLlSuDHhq+/e++tUDOYxx8AwAFYMInoiTJGQaif9Wspd7FjSU0WcdjCDlqACoJyYzBxaBkSyy5EQnHmuL17QvSu+3VuXYMUc+7fTT0ekE5516oZtN2BPopatDHOzBDHIiPIYnfnRX+cST6zudotzlTOCcEywBPqqFxuVByI3VG03L8X9Olo+Dp6rjt3Lgpx100gUXYtkyOAf06sEvwRIswexBqSuZGApUXYRq23e+8+i/fecZjsaYiwCt1WXfbbam1z3zZQjsXPB+nLFj2bITz3sp1qwBefjC9KGWDWcfBQ3mQn+LTD1bSF6TLlLF9GdVVeQdiMbHx431oeWV/R5CQLfbnZqaIuc0RqkVyVZa5eSFlyWyYRO+MTY2hn1z7ZGmVuQYCGIHGJ8hYmbvnCzO5pLbQxBMikY9Ojr63ve+93Wvex2b+OLm56xybpm+igSAERiJiOizn/3sFVdccdppp5Vl+fMnHv/w//OflV6JUi1fLJyPFk5PIfRsYSpWqJOLqltycdgzDnvDG95gkTMv60Fbs7FCOsbMwVCVLjYZzdAgqlQPZ5Pz62Zvh3Ax27FbJZNAwR5Xc28lNFWAzJSDoRzpEswFcl8/ndYaQWhYLa3oYh8bYIvM2tmroMMZGRn53Oc+d+aZZ953330uZcjNzJShrci1xcaMX7Hk4oorrti4ceMFF1xgU1umxyNiIy9wpBsK0a3S+EUmgx1JGvGqItsfhvOeEZ08zY5udwmfR9z2AzE3ENFznvOcFStWjI+PD34+EwkgRBh2InqdZ2Yi/sEPfnDrrbeeddYZkpAEdROhHfveACX+yiDUnoIkf6psE0KQWjfKVuyor7zyymt//0OdTsc5LzH+Zo6sy4G97q1P1bgzmUpNMdm6lZ47cqGqyLvx8fGbb7659oCRe21vrRRh94htv0kihha40UHLyKIVCz3B1a4u69yHOn/cjZ4MP64E7KQ3Cb7FnpX0CMRgMdYFk988kxzsotX1rNtH/RuoubetRDKbMYiFLAbyEDsihPDEt7718He/sx6hE6qe/U8hVbYJKSFlquqAiiWNGsqAEB8kJgJRiKa2nvkSkKhwAPDkkOLumRGAMoQgRdCIAtGUd9uAX/0Pr8TTngbnnezkhLCULdFrzkRKSRWHE4RqgxlcYWLX3d/81uj4zhFGAY41f43p20ftO25SI2fAOXiSGttEDLBU9CYip+WWmNBlTHm3teOPOvN0HHkE/Cg45pdcJAQswRLsw2C4XdqpHFCW2Lz1W1/+yti27WuYlgWmFE7ZkL8cwRfOecM4hZQ7gBycc0yOfVH5Yge51Uc/e83Jp8A5JnAIMBrmvJtOFh4kR88AoYEaQVv2p94fzDA59cE8Pj5edUuqu1ztxZEMHxAld8g+xVghC8/kUwciKxb/NSvF2mDYTjEKHmYOEsxFXhwTVjpPlj1JuKNvEcXSroq9PV88dgr0uqqqiy666OSTT7bSZPYWTNwlavTHbAqT8kX+Lcvyfe97H4But/uxj/7xEz9/vDb2INI8qpRBjCsUrpBcpbEnjqSAY/afoPFd737P+gM2cC/+Jspg87LLmFkq3tqbzYErPq01M+uAJndTR1rro+RmUQZkgSHrj80KEhVdU30+KtIpt2x8Ujxo1CYbuNPpNBWVJdgPQKe1GYWQGVkyyCjhkBgsRCdl5oMPPvhzn/v86tVr5SBHo1alvIwVnCxZMO200NLssahzAgC63e5ll132ve/c6UgS81ifD1W2ySeNmwmuSDlYGU5PQANzFXqHJXUbgeY0VKpeNxxEHXbhtyczP/3pT3/Ws56lubyzB3QUed+csgnYStyxPoSLUsSf//mfScpa7zredeY9rWRzOHptbZGCeXUwFHNkMw1rWZZaOgmIlokrr7zyw9f+QTHi4bjiKkTxPsiUN21/qT5yDye6tvVJNQDpgrEsLCaQ5SA43LlzZ22MyZ7SNPs0Edvc5vsQ9BOKYK35HKuVykmGbiLNbt8PIbMHTkfIw41DZ6sUZL/VaJGRB0Sr5BAcKApMqZ3W1ZU0316dEpWWVVKN8tXuDYLrZ9SRUJbT2LbtW1/+yqqpyRVl1WH2FCOiXJ2fxQNczttMTpPyJ+oZgvVBid4WjTK+KLVchVLIkCQ8jclNezfuQBsOOPH88zEyik4H5JrVb3RXD/fqMVpKdxrMGB9/4Lt3HuCLUa5cyqDraqJk7XWVORSH0NmMeVF63LoMITgfvN8O7Fix4tRXvALLl8MRO69Ji7KlPOTYW4IlGB5giYqqAqa6mJraftfd9/7rrQcSr2T2zL7JH+rvIqnWUfyNF9E2NM28k8M28MkXXICNT0cxGt+ci7PA8INgYHR0FEbXyh6wP1nx3bJPoX3MPbPa9u3byRQUnqU0zAbmb5SLBtPT07t27UKbpqrI1IVUw08b2gWfRVGsXLkShucOG9i5VrWKzCGwPqkM1Eoj+ZjmyabT1B9ky3c6nauvvtqqf/ZbmXOTXmT7wgZm6s2bbrrp85///NTU1F/91V9RQ+1kjiYsdbgIxhSrFxWYCm+TwTHz8ccf//rXv17Jl+3enuucqrPVZ4rtQYWOUf6UEDn0oSEYSkNkK2R7Ktuh2U/2Zm8FAySDNePNDmn2CVQswQDIrEW6O/QBy8Us9WtyARjiPwzJWFXjPfnkE//7f/+EuEyK12QskWxsEHZQdRW6ZbPkX4kKUxS9tmzZ8prXvObhhx6RH8zrZDVlJNxaO5d2QNFIRGCGSZydbVgY2p51b5ayyryAInDZsmWnnHIK16OD0VghaNBYHZFNO0DJbMTMRPjCF77w05/+VNR2auQPnXewqM6YiH3G4j+k0uoyrUVR9MbrcMwxR1999dWSKRK9Ceo5Mtuv6DBtZ2DwZiG77xJkT0qQ64DxsgHUKUP2iezdPRFs7Lf2XECaJWRj4WTM1YVnH5Boemq4JO+GnVFnZ/i5Z5M7ZA8wc7KtM4BmtLHdobI7hAJbNMozcoAkGNb6pT2aYC30swErxsXCPRUcOQoVyi7uvvvuf7l5LWiEgwOYxUcPkKJTBNdzOoBHz9ePGZ7Yp4LfqCc2ZUlNyXKGAOb0kCiVYOdAHLQ1IgI7JlTM085t8eE5556NXzoEnRExlMf/kgUXDZNwv4lZdOiRe+cRePu992y+976VRK4yfI5Z8CwjSRQmi3iS1hzgpHwYpxpMHFM4gXzB5Ervx50/+KRTxk4+WQrjJOukrZvmmHPsLcESLEErZAIZuMLk9Le//OXysUfXAkI8LQUUGs0kCRwCo6qYKlbBhZkDcyDiUEGYQBjxEx2MPv1pz33xuRgdE3JnyVkrxdsXwXs/tmK5skgGa6VdHWCril6rSS2MMwVbgWjHjp3T09Nz7UwmO+6jELEUsH379m3btuXHXG1c0pnYZzAIZD3yrDxHRKtXr8bC6lFzAqt76B2oD0vKK09MTk5Co9hCJOmbYzHv3lm0SlnzIlFQsk5qEM2FF154xhlnINnRMkla32pq4/qwdcZRCCFc/5E/+svP/tXPfvazfh1njh8VKSI2GGIyH+fQcR5VYOaiKADnXEHEV1115ejoaGuX5gWYuRJ38bZ+63eDSS/bPyufFqNQxAZzc7hcS5p7yu47q3ikivNGAZZYKFtNsTePrtnCEuwHkNlc7OLvLYy2pCitjQxB0icn+1SSYFxyySXXXnut8n01NGR7fHYKeQQdvniLyx3yzhX+rk0/fs3rLp0YH9eMKPJgDGAEu8JLBxLXiO3YcodWS1cAACAASURBVH+9b3HPQ1/uS4CzqKzM3I++tQ5hviHSQPOhcOaZp3vnJcbZ9iQz8dSGGZgYGuDZe4VDzJHLgHPj4xN/9Vd/IW2o71VdA51/sJTTXlgyGEtvp+wBvSFUPQ8sYrz61a9evXo1nFRa0zo2vv9YWu/3rjOq3tySVvqVC3UGHDBSezzZGzLFipHZosqe3G2w8sYeNjUYmjjReZQ7ElsQb1JKqlinGLa1vdrbRYc6/a+s9y7VrWciapFzwSQSFGukrFhrytdGbFgPTAoal4orOjf3gwgbCCBdcA4IpUQpfv9///PIli2riDvMCEEblpMQXX5Kmp0+QIAIu0jHUukAV/efHCkBEDd5bdw7QpCoYzlzisurYuJOsZN4S+F/5cILsGIFO0++QIN8D2ZIQwU9tlp2Md29785/L3ZNrAiBul3qb2hmsFRFt7QsBATOU73qbgTAhGnmnUQ7PP3qRS/HuvXwHoixPz0+LStxf9+uS7AE8wshhBC6hIDA2LTpzn/8x6d5t4q5Y5xZBGJmGo7nVvVdLOU4QYQQ2DkncvM08WNl95fPORtHHoFOrEnSdKdq8t19DohoxYoVaNCfxJ7yaKCeSGelk7ozAhE99dRTO3fuJPJWMtvXcTVLSGIZpqampnZN9hIvGlC0qHxphb9MuFdTGhGFEIqihQu3wqIgPBta60XO7/QYMNVENnomywEyjEA8X/2UNr3311xzjXptaFetKmUnSFvIHAHsA/Lvv/3bHR/+8LX2cxmQ8fGxjQA9tdN7L2fjIoOecMIJr3jFK1pfmRfIZqoVrF4XlZN64i1qaNTUZqaxGs48DmG3oSnO6bV2OMYDNjx0OBlnNcFRNsa+i38J9jXIFHWbL0weyK71MczxOGHwNtRndnMYbS1Qz/jIIZRXXXXVm9/8Zq57L9on7cLGLMZFyWVSRItI2UAOVBTF17/+9Te/+c1V9PGIoDmyu90uouAXNJ4RqVtoM+dl37b39ZXdwNi8QCaInnHGGevWrVO5Sx9oIhn1Mw82GYrjHYrPyJ9FUfz5n//5romJfsRtfsFOjTWjKIW0wxfIjnCstMmM4447zpJf2mOpO1sDgx+zG7n5jBUMmnJO84vN13d7LJb4qD1qb0O2GpsiWTAZjeRf8f7L1t4i7ru9DU3CkrDRbiiTXwMHQi75tzqAs3HQsffFhs4pZUG3241poXYP10yBiOEYCOiWeOSR733lH54WaCzAgcWeKA3LGRETKgbDcePcI1oeCUTieCA2SsmQyA7RgzL6YAZ4EDGcVIBJp1UBIEnMRj4EBOdL0Dho40knjZ5wAsAp1YWz1l+07T1LQYZwITIqMGPH+N3f/NbYdHekLAvElLcB3PSJjV4cxIHiWhGcsRwDomfXiMuFiHxRkatGOjs7tPrII57xwhfCFXKAZ1texLwnS7AE+yIoqwuhdM6jW+Gp7T/42tfcI4+uA8aYC1ARDwh6QFAfQVcxEVc+cYuSUcXd60IIAW4a2Fn4yfXrjr/gfIwsA1GA2OBassfuB9pmxxcI4maPXnIdAEnWtPaInmwRYm4QeVJeIqLA7Jx76qmntj61jY2VBwOltL02uMUBEay3bNmyY8cOrpe7Qd341RSCsydRl/lGR0dXrVkNmpWQvSiLkxtp1e0CUDGabV0aqEMJSz5H0rrPDbPgfA1KVzUzn3XWWeeffz6b0OZ+TLlV9W0qfmmP0KOPPDagw/qwqOgIRClFtUhwVoP1BE+46qp3j46OJXXU7w0vmGzbtg7Qdj573uppqNtlEJdHe/b2RYfWnjSH5pwTX2BihLKKnr+BEWJtSZlNNr4zloQuwb4O2Rao1SVoeGG3TvosWd5s1syeL6qMlXBMOxZz2n70ox8999xzAaREt4M6P4PFxzvytRIo1tJBRJ1O53/89eeuvPJK730ZKslHHA2UjF4OSqO0S0xfbD+1iDYyFZ33Aec9EXnKZsrmK1y4fSocsArdjRs3nnTSSeqW7ky9EQtquYDBnlohes87Ep9TT857f++999/w6b/YG2zUgs6LmhH1mI2Mbxenk2/9Kdod0jkcc6yyS0SjI51VK1cmnIC5Yq6atp7d6+1skKDT0c8CmK3kXH6rn3r2a3/4IWP0dhfLr8IH7Z6y6SBaRYj9DgIQBk5ozJqqF1IjS8gROMq9StkciMirRJ1+ZfXHzJJOCqrVJbklu1YT9VlqT5kwZWmhqtAtMT394O13bL//gbVByuNkPkA9E6SUd7EPEMGL82N8hgBQypMo4ExKHOeif0eiIETJe5CTt4IrvOt0pgs/7uj5L3s51q9HMeLIi0eMDoTrkA2cUhWn/rO10EBEXAVUAY6w+cmf37VpXaczwiwIsB3lGDdgt2KyF4sun+adWSqpebBEIoBZIrZoArwZeN65L8bTDsZIB96j91aury4gGpZgCfZJ0J3CEvM4PUXdLh597Ntf/NLBgLhPOgRiFC6SePnXo6VaoaqMke4xw1Hw1PXuianJDc99zvKTTsboaAA77/s5Ou3TIPhcu3YtUfSfR/1kWxmeSieo+48w98I64k3nArBz587HH3+cZnf0sn8g00JVVUR48vEnyrKEGZ1VBblRnk+fsUKFFd/lz1WrVqHu6LeAI5sN5LEIVoLPuq08lAhsjnvjvzHOuEW6mEcQpeiaa64ZHR3NPpQrG+kiu6+CO7eZOJtzZMcuoLZa8RUNoReyV5YlM1dVNTk59cIXvvCVr3ylbWRvADWyyNkh6K8ZHbCvNB/Owt9a5eS9NJzZQzZq7SrXU3Byw4Uh09bsWGTnDkH07hLMD8hU6zUMidblkU23kvp+i78f7G3Sl4FSMMl1K3+OjY39xV/8xQknnCC2Idu3wU21Ns6p6IINTpSQbcFhURR//Md//Mcf/1jhi7IMvUDIBINtcylPRo3n2mnSVxaR4NieKxnpdPyv/dqv6Rj7dU+Jj5Ul5KLnlOqdkh2BZcuWXX/99ePj45aLzfu4MhrY5BTCyNT2agN0XKpUs2LFine+66r3vPf33v3ud7/nPe+5/vrrn/e852Xi0J53VdePMNwZYWRkZMCCyWS27Eto4/j6IvYRg10mlFqxpzl2yyIFdm+7LTABnC9oinwW9CfnnHNFU2rKhmxJZda4KAVKEmVz6YYqBnzb3rE3NduUHBE4DggBOyfv+Mo/rCi7y8XKBSBGIyIwPIlJEkSx9I1ck7gXMECgmCItMDPFqjpOFxBYjJ5EIEbu0JGBc64bwiSqCVcsP/SQo844C51RUBHVV0SnBusKkQZoxbK9m4h3rhA7GVKer13TW+7aNPnYo2NculACCEDhXC8LBsBgxzHyPWgN9HjhOOX0TMhk51wZOSXKikvPu7ybWrfm2Je8GL4DqZbuejtcL/bFHbgESzB7GEyvZw8qXzrnQlW6KmBy8rtf+crO++47FFiGaJ0EgMCeEMAunprH9BeccjUI3+s58zgH5gAK5CYJE7447fzzsW4tXK8mGBEDHIT0RrFjz8e0mCA0fO3ateIDblPpqUKVmRUos6m5GHmqQicD3vtut/vYY+I7to/jaLdA2PsTTzwBwIFS0clc8ogZP83JYt6IHJVJCW+wc27NmjVr165Hwv/wcFgLNuC3+asVynUtERFz0Ew68b5zHILmd957wMwnnXTSxRdf/Jd/+ZdZJKbVr1qFbDLmPMrK1hPgeulE7efQWAwAOAQCBQ7OOQQKsdh3PB0pis573vPeonABYS+Vce8NlkFsfalzj6TWr1PdJpthL0YeElpfHwYTXquWlT0Qs0/G3zjK6OIG6xyYoUYHNlvbUQDTkqS37wMzi9Rgd0RG61oJBeenMsN4dEfJrUQuhCAfdNBBn/3sZ88999zHHntMHksEuX9erLrWnXReINSstzFXnTwZVSsqRjrvvuqdRxz+zIt+7aJut+u9D/pU/wMkJK0N3BBXhA6zZMzoiTR17ObK/14F0RnlmoiYUYXq/PPPX7ly5cTEhOUp/V+PQICnmFgiklgWSgVmDlwB3pG///77r7/+Dz/wgQ8wq5Gd5+qAz3VTO1BjlJzCS2tMPCGaTb3sVv1XrC0jy0YvvuSSiy+5hKKoHx9Ug9icOtwPtFcDkktaGBkZGbBtmxTA/NaTgO2mUEY5tFIcCNxGgmprT3BCAIFDb35lOarhDClJ4py7MJyYmQn6COf5Xgtq7gsxBbk8E98jzZMQ92nKwRq/AEAskjASV8J5FUKYlYyoSrWlOPFm1QUzumX44Y9+8o1vrSXXQSAOugBCynVDqdP2g4HzO2Y8iibtMRzlx3qWVVQsjgzEBDg/TfR4NX3sGS/EoYeg6MATvLObyl4MGPtQWd84ukESqu793/nu6K6pZeRcEIfbnlqlx1PadSLy2R2jeCfOWyIJoyh82Sl2MJ5xyik46hiMdhCAegZPTrAQI1+CJVg8mK9FboSbgLKLUOGhh7/1d184kMOqUBUhIJ3DiwDmDHkkgjdxPXp06xy8J0ACmHzpaQfC6sMPO/ass9AZATlKMSnxxDvFnuyjvLMJy5cv12NkKz7axECZT5AmvpE78qec2Mu7ZVXdd98DVkD5xYHo08HYtGmTNfKiLpcTaSHTmqyfs1ciDsE5VxRFVVXLli1btmxZ1trwQW3eqT7GTMC1cn8/y93e83axquDVV1+9Zs0aK1zaidBeNQ+07bh0RJG41N2s7Hf1ujb2GB/DGnkTQghlCCW//OUvf9GLXsTci+3YGzsrk1EzyLrdlGGyic5wkn1i2KApj9VmM3EO/cHc7ZFEfR5GN7ORv0M7/CWYJTRn0BJttG2i7BX755Csh17CDZGeUlIzIirL8thjj/3Sl/5u3bo1A3SWnLsBaPhSkcm6a6m6ChvyU7fbfdOb3rTp7rtDCN1u17l2ymnv2K2qZCdS8rrDkdaDbrKbhWGpSjR6X2cXKhx55DNPO+20GRVDHWaUu1ys3kve9fyfiBzi8KuqCmBxoty0adPujTFbsRJqqZGg2a/WwRNteQmbw8k/B+Z2L6jFgU6no4sqk37RZujIemvlaiQE2taGhAg0oSm52d7KGQbVTyJhbCmKKG4YtfdXaM51vyeJE9VtJEWMfza8Q/QZDe7W/S770c6OmyngvPe9poDCzM57VBUmJ//9n/55ZOvWlYGLEMTLT2rOMlBpP9NHOcUR18qTU0iukeIoBGYp7RIABPEQQkVGcyCiMoQAVAyVu1gOe52b8sWuVatOeMlLMDIqIZKcKrQ2hbYBYx8SwZR6Ojaj7GLrUw/c8e21oXJlCTmW873TwMr4UVYa7E3U8TGBChBA9amnVPrGUWCq4CbhJjr+pPMvwKqV0XYea5O5ZCanGRG4BEuwBBZEP0dgVzF2jP/kn26auue+deRHAvuQn1USwxN5OA9HTBQk1puIY0ZZb89sHJXE04V7suBjzzkbv/RLUh6HNSuQNBZ9gPYHLisyx5o1a+RPIV/JU4EDWApzw4gazjlX9BJRaV4h5SbK4+7etKmqqlkcejez/u6roIzVe1+W1R133KE6WCadx8UTWCrg6TOWI0jGLiAWCJamli9fPjo6urDD2g3oqaNUdwbROwAk5xTqIp1liJnQNu8gHZMvhhCOPfbYyy67zOoeTZ2qJ0ikcJas25qEB0jzS4CreVmCUHdPjEly1ZjHzCAb0YOxsdFrrrkmvm68FOcXIbr8mHpRI/Ynq4dYY5zOY1NPi5SkcVP/bJoJFhEylLaOqDW+0j4g1Wm1TrFzTjJU2k8MyXiXYK6gU9+kV6hTjIzuLXRH5w7aeWtAFEtlWZannPL8v/zLz46MjAAgYpsH0OLEUgkNMbaMIAvuFjuaKOpVFTO6et/ZvHnzqy/9vx599NHJyclQst1BGSgB4T6EkVICNGXH1mEo248LtjFj8XLfgRJe4OJf/w+Q6gZNcx7F/zScIHIuSDlsJwlRiEgTOjsQ4JwrQggBvGvXrquvvhoRV2RcumaWwfqZ2ACoZUSlQbmvU5/ZK2dCC1FyAGLAZn63jczXNM2ynU6nQ95Jdmhrk7Xbv+YaXEdX81tqptcCgEPOESyXt/s9hODJ2ZzLMGcD1PPp283RDTlampATn1b7uznt9t7bnPJExJKhMhACRcmwYd7NZFR1e0eaqU6nE8vDzr673HN+rpxzKEuUJbZs+f4//dMBjFEE8frJGFsAmMWJ0iwLsJgps2E7l8eREHEwhW0zfFVBWBEzw/uCmcqALvHWqjzgl3+587zj4Qt4x7Iz53j0N5upWhjQ+eOpaTDw+OPbHvjJGudHmIUMCrGVATprz667M8CsFd2ByozjxHnXdW6csPLwww859VSMjsD5eIjXBwPDkIBpCZZgL8EebnzZVr0tHAKmSwTGE0/e/rc3HliWqxA6VHu497KqhSmFujdVVjkd9nrv4V0o3FMhTK1e87yXvgRjKwHP5Mj6D3L8xJ4MZ0hAmdkhhxzS6XRQp2yaN81qF4IHFUaZmatARCJj1U5Kvbvrrru2b9++iANceFAGEULYvHnzPffcowFEmtgLBqWZNgtjMpMVL0kYYdxbDjroIPWgHH7INmMmhStXbWJAn88u5hcyZSOE8La3vW316tXNx1Df9U3BRicuWrCsStZILQ/j1JNBb/iawps5BFx66aUnnngiUS/aXXs1v+SI+kSyW30sQ4iOvXW+WrtnH2gqn0MFTSVTwbp9qbsrJ3d7xVLmQdna7BLsc9CkVxk0p1hfsX8OCajGq745SJKA7O7p6emXvvSln/zkJ7Pt3+RiKlnpHWvAsnYZleu0KRX2vPd33nnnG95w2YMPPoi6fcR+NGOj2Z8CFuH6az+r2QJvTI61ziI3vOiii9atW4v6Uunhxzky3baEmpOuCkDONWFUV7nudDp/+7d/9/nPfz6jRbPppP2ivG7z36GZDHTP0BidAOonW62ygVJdvcj6PMOHZtfPTqejBnl1W8uSC8/4RfstXX7ee8XqbHqywGDxnG09JOSXZRnEtY7zvJNW1m2dvtl3YJaw6ERVl2LzPnLyxej5UM7ghKsPWJdbK5XZZ0Qpc2hsoRmhl6srBEx10e3+7I47Nt+9aQ2C58AUQjrOCNFTkpkR0CsIiERnmWrGUTlZD0HL47BPhxCFjtTFxEbyJOIRr0jL0feevet6P+5x/HkvwfoD4DuQE2HyGdZ0zaX5cLNJabEAC6ivTEyBPKFbPnzXpuktm8c4OA6xOq8EhKbXHUg8GuwaCSEQPKGXQFr2nZwlxqkhF5zrdootI+6YM07DQRtQdBhgcnB9d9qcyNwSLMG+BfPHegMQGBU4YNfEPf/8z1t+8MMDwSOsckk9iwWBCeQYFOS/ClwlRyXRG0XSCCFUAaX3TyEcfPLJneecAJ+EaRXmHNkEasMpT8wJZAgbN24sikJlCOcceccErUUrlUqIiLyTGrWoy6xFUYTElVzhBe0/feThTffek8kldeIWtBrdvk70hANaE+0Pf/yjxx7/OTEcSGTQqqoyScKquMpQrHVDLFlsql4efPDBohgMM8ZsLYX6/Vw/zyRXjiex5h3hsFzLkDMfPYyg2JZuHHHEEa997WthXIFgtDLbAsG6EBnXoeSto/cdOS1gqHOdtSYkqdbFlNmQnFu9euXv/d7vcRXkpmbF3RvAyQfHtWWPtSJfpojq0LQRM9hs4tpTsi46aP+zmzBaRxyU5OisggNxWh6SJZbUsiz16H3NiNnvu8OGiiWYEfoJAPnWNipb6yv9pr4P09yLYG18mYUdgPhRvva1r33/+9/P6WTXbn9tRLiVNXQ2FZzYJjlPSSOuW8Hkma9//bZbbrklkyJsb2u8I72lP2VPOueEVaOx2bNX9jL0NGXBobhSMvC0gw8+55xzYMILer1iiDjhzBF7z3OKK0csETAVy0FyyVxJASKuAlehqth7f9VVV23evFlKCRuxuUVz57qLH4z5Qs9mvPdZGsf5EowppTK0LTcbp2hrZjJG5zS58xSdk7Ka2v4QkThUAj2Or92bEQl20Q6zKtHKELMNi/r5gegLqOed3EsjVfv7gA43+996PV+QxHi0losUo6T8qceZQpZU4EzW+QoUJI1CehJAnitS5QpOOggRScIyBzjCrITFLAuDIyJx7dk19W//+59XdKeXB/ZtUooEegPglCNSBtDK8ORgnrn3SjZZzGwUHz2A6n2LvKsKegpVsWHDL59zNsbGpPa0c45Di1g5eENm41mw3dj8hGyVEAK6XUzuuvc73+1MTy0HqK2GV0JybIUMBA6MShmDrhXnHBPB+RI0DYyjGh9bdtIF52P5ClABX5CUqmtwUzSwNMzUagmWYOEhyXCuqqpQVY6BsoufPfr1G29cH3h14CIEh9Bv26QdB+aaY3xVVZK9oVtVTAiF21FVW8mdcsHLcMB6FCNMcEn2GqBD7tO6JTNv2LChKAprppGfqqrKBBE29hqxQooq0q0q5ZGqujzxxBP/+n9uQd3W01TeMuf0pugz/KB9lsNkGe/XvvY1zWBtTZNIo9bXFT+5FYPzr4QQ1q5duzCD2nNoZWTNBWCFLUrSiRFKeofG88UZm8uMje3p7W9/+/r161F3t+nXiF7bydWuqrnKDrCuQQF112NLoHQ9XHbZZUceeaTtjO6XeUSLfhd9ZDw0Qj1U+EFdFCTjnG6JBpCvat3+w7DlqZ5ZTG82r2tTb+wFQjMlb4Pd0dn2h6GlOvxhwMAS9AOdIJopaDFjl7pt5zrFg3WrvQeWdqmPWFEUYorqdrvvfe97r7jiCj22seN1KRuJvKtjr5KEABtq1pAxdNeoSOCcm5iYQMM10r5l8cPM2mbTUmlfYRMRsihbL6OxGg39xje+EXUrrQrASBiza0NoiF7I/ZCCxGtelswAHnzwwXe84x3ov4Btr9DwQ8rEOTJGUn1mNo3vVZj3LSOLOSPdvXWFfAvM2IGMOKBBN4aEHWTd6CcYxN/qzC7bpHuPjs1yC9uTZq77284LWHGoOYm6WbQnVkDKkGOlxBgGDoQAU7K1RwHEyV1otaWcbpY+gzDTEydMutXt4qFH7rv9tlWMEa6IG8b+njcBMTkmR8yOHKVMag6pog47sKuYKiaIr48aKxkV12y5nCK+69PDoNBFOen4KY8jXvB8HHYYfAFPTElnoN4EN15v2VGtSF9IYDHnJ5YptzAx+dBdP17JKKrKtxVWlLekxJInxMj2uNNCoimJNwcCYvmggArOcaezvcIBzzmWjj0OqTwugGjVbtCvhUfLEizBvgKcTo8lgsU5H6anMD7+6K1f33rnnesRRjn4SNDieSkn8xkMrRMn9BDk3BghBEkMB4C8C6Bp77Z7t+7II4444yyMjIFM/W52BE91ORiAzY+zb0FinxUQNmzYsH79ek9OYjSIIb4/WZaTHnmXirTCblOWC+eTDFcFrgJz1e1O3XbbbVrCuA1LDnDed5wrlCpaia1ftwfcmZElzbvYx8aMpVrE9PT0P/7j/3IOTCDvBDPipqpPsvGLBKC5pSy2ZS4cemg55JBD9I0hEWGbMEBFacrlVjQiIvETiTJWkn6YMF/eEKw1BJIcycYoXFXV4YcfLk6UPnk+2p5byAiCFU9hDBktSkhg27L1Mmh4HGDVqhW/8ztvZ27PC7kHmGiH2GbKRYv6wLPtSfUDfKu7yh0Gw5EcHvXSEXFPZs42/qKByeyWAWdulWnudJgh1TVC6NX3Vjdzh1oxsd4H1Vlh7mnalmDhwWo9AwhvPwXeaumLrhbNFazZUbjYRz7ykXPPPVd/5frhCuop9uTQTu5TMj5KSEHFoQw9HxHOioOFYC2Y/Qw3PZ7iyIap9WaKwI2sjpSYr916uaizN6G5DIioqqpzznnx0Ucfo0uFWcIXo6d/DckwOd5k7IG5CokUe8BZriEIcQ6f+cxn/vRP/4zIty3mHp9VxGZJKpTTyRzZMF5KVtG9hEPu64feaoeZrX1m8BcZ7JwTbEtm9jQ3aanUdzq1FTrPQDHJyaSOZF4fLAMvMLjcya0HuWBvDpV1ONmamf2q0OcHv+ISNHfu4Bd1Vc+yP7MHixY7atG2VOBh2dht6zNuH/LkimbjnI5w7PM9D7z0WAzxHtBFC5YCikMnuALzQ9/4ZvnYz1c5dPrtMO5lT2NmSZ4JIItY75nwwQCxSToJs3LS0o/2Naho6Mg5Yrjg/ASwdaTzKxdegJUrJTySjPvkjCMdKlC0O+cIAVVAFfDTh7bcd9+Yc76qRKYc8G5icGSpBvccUUnsj2UIFQe4out4IoSnHE4676VYvw5FwUxu6IPylmAJhhPijgsBUlZyatKVJbZtu+1/fn799PQK5k48NjC5wwe1JhS4p0hPl2UAl54mgCepet55L8EhT0fRkacjxbdnS6ZX+zrIKFauXLl+/XqNUFYhOHORiCKZuSkne/qYXGjpT+/9rbfe+vDDD6M/6cvQmEs8Mz3fvDOj7rf3Jk70NJEtvvGNb/zwhz+UI00ZlCBKMJapqT0Zty7DEUApZkLVtsMOO0zX4XAuwhnZXE3wSK9kKqL9M3nizI8oSQ0/CKuAIWWiPPDAA+2IssnKZlAVEjKhFfq81a5VIJZt0jRLZW0y4zd+4zeOPvro5q/2LSvN94sjniW0x7M3XGmsBpJ1ozaDSbxMDcEucqvIDYN01M9KaBWt5s61yAGieV3JKRrOGoOJ0lwVuVnCMKB3v4HWRTJLttXcI5TpcsMKakln5mXLln3+858/9dRTVWFmc/BjjS9qBVBDTDZ2JIVcowwz7tbkCNql/GbDXyn+RDEcThqXIqiB8+DQZrMLDNLn5cuX/+Zv/ibXx4IkYMDQEzUNo+EdZhmBmnqtCeMd73jHbbfdNmCkGW3X2bHyXnaGrf/uveOWJnlcgL1DUnLEOU7rH3XObntl1YTWzmd3KGXztBIC15OHtr47PGBnPPu3nyAxmza1hdmMfTYi0CzX5G6j2tJz9ZHsx/cVOTaGzDoY4wAAIABJREFUTED1L5VREXcciJyVLmz4hZJfbb+vxDwYEVwFMKgKGB+/82v/tHa6uywwcSCpzC2f6SVGpOg7RBC3Pu+8Gu4r0Z0ZAIMCwI5cAJhklUfTZAAxuYpRBrYJLqPESQ5wZUBFrnRuB7nVzz5mxckng1wlh8FSiZVIjr65wQYUZjOLCwwODK6iUT8wqurnm+7pbtmyDCEWWrR2zLpxQ2qpx5qMuRKl/hfEFGsFB+crV4yjWrZxw3HnnINiFJqmwpy383CTmyVYgqGCnvxaVuiWmJz8yS3/55E7vn0QMBKYmQOjAipOjpPR/ti7o/zKuYIoBmsIaXceFbhLNM6BDzrweRdegM4IGHDiPilkmJEoM2OOWYeHGlwIKIriqKOOinknXcFMejJPJK76gJ7d1R3EApdExCGEqsaYJTJ38+bNX/ry3/cTMiwmM52kKeS1EsymnKocneuhRq2iYb9m5wREHEIJI8F77z/1qU+J24gVYalujnHOxZyegtLA+TEYeomnxbN1+fLlz3jGM9J3h4jbzklhUIRkcqRVKesyhjovz4ONUiU51Qd0zYjYV1XVYYcddvnllysl6TcE7TAbvdqlpJa6hluF8tDLFpQbJS1C1q1b9853vkvO3geIWFaa30OngPgVcaauT4cKyv2UBzLGBQZLHtu40aTjHDP52iHPXmnZ2zAbx5/murUR+gzYTJQAKu4ld4rcJC7+MkvV2moani8YBvTu66CbvWpLDNV82NIHuZkpq7pZ9qHZkd5WVbV69eobb7xx48aNSMdIlqVaQpRRwmYIZPM+jIHMUlc0eI1SIWYGA6F+R563Xs8J255yZXYIwIlX4xve8IaEWO9cYcdS4ykp2oDr+TT0QnIisTH+ItWDnZiYeP3rX//ggw+SCaiHGBrQs3vqd3WVthol6xkte7/OP4LMUeJe/VAGRVEQfDwzTCPNGO6MPbEPqDeA5aqWG+4N577dgIBq8A6xIrfcscx9Xpha8/Xmtp2NCDTLbuxBb21uWS/Xhrw7Zkr/iRQRRAZoCoeoH3sj7kFmVrmx964du3WiHLSA+hG+EAI5h6pEVU3d/8BPv/fd9eyWcfAMoh654ThcskV4pB9VqNL8Jw0vRXML/TGkhHQfAfEYiTluchUcQwgVMxxVDpPktlXVc1/0YjztYBSF5TGok6QmWocQOOVEEOuGQ0AVHvr+v6/sdscAh4BYDJ1dsk5qPF3WDhoHoXGWBEWOmHzFPOnoSa6effoL8YzD4AqQIyosMxYYftQtwRIMAwiNdt7L2Tecw+at3/zbL6ydLldXoQhBnMUlo2/F4OjAovJWrbVexBDBOxcAhkPRKb3bguqYs87GMcegKOAdM6MuGe9/oPT8+OOPj+p0VZHJaaKyL+rEvyb9A2Q8Lq3txneKT3/601NTU6rRzUb/Rx/bR7/+Z2NB3dfD/qrnjfat3ZtffasZxnvvvff+/d//vTfZS4UBydoTRwZNFqP2DqtdWAxQSgQWQjjooIMOPfRQHfXwrEyrzGAW3M1Ok31d1kkwdV25sQd3Y9SZMmyXqFHbgtSyF1T/zu/8ztOf/vRmn+3Q6npdryyMzjLV/U0yRdEGdulqsfIoM7/lLW9ZxBkfsA3VeccCG4Aa4tG+xYZn9QoM7k+TbsCoBPpT0+gc9Tf0LLzqtGuRhrYA8CUYKmilb9lEy5za9BE6uUZTbeEaww9KuFRC2Lhx44033rhy5UpLSK0JyW4TvdCIb9sg2mwc3LPs9yBDvhVRUGejGdnXUagQiMb0NYnAwpMpZj7wwAPf8pa3qK1B80VYTEKPORMVUvJi5QppURs3E4H777//1a9+9ebNW5sRM4oWS97RsANYFpbN5n4GIyMjg3GCfvYBA/aOzfuRLcXsmWzG521I8w1K7qyQQ/UkMPLkHmYAsOsza2cY1p7dp3qn9T7MWrILxkpZFpk21YY+oFsvOz/G4PP8VkxFSkoBVUC3++Nbb6+efHIlsWN2YGI0slrmAcguNi4/SpsUYv0ceCIHEAcEEfRZ6vFIKitp31P0FgB65VmZmQmV91OFC2vWHH/22ShGwNEGHOlZwuBMa2se8j7MC6SJdCHAeThQmC4xPvHgv9+5hrkDbgjOHN1WmB0I4reSsjA4EAIrEqqeTBlzdgRwRW4X0c7lK0566flYNgZPJQcOQWzDkdzwoBDUJViCX1Dgvq6JBEIILPkZto9vufX2x7717XWEDgIxIEQvPSyulJpHh2Qfp5xvkV+C2VEA4KjLmGKe8BTWrH3Br1+M1etABYd4SJoJIsxM2H/2LyOImHTCCSeMjIw45ySNJDEK56OFBaw5jIhNWkAgqFcgMzEjBGIWHqRs9Y477vjiF7/oQGJ7YjKTzL2UbVb4Sz/mZ/itMt9gsNxaGXkmRu+eTGM0KE/kgVBVXeHvf/qnf7p161aN+IbBRibfZyJLT0zRwRKswHfIIYesXbtWFY9hkMYszKY/9hl72Gt/bRyAq0C2R6fxlNRg/Sgbx0DxnUSahQ0bNvzu7/4uEZF3mqwWfYQfK2JmY1EB3WiGpAF6SNp+hgoics4dcsghb33rW9Oy9XMd+57oAK0xemR0fqty6PDtdcxmK71n5qqk4dMlLGTkZcDwMzzYgVszdHwtpC3voiCeAvpIPZWI2m24ew+GWdEdWmhlGa1miIwO6MJoVaCGbSP0Azt8pVqnnnrqn/3Zn2UIsdQyO8VRPmjFqsw0abeDYqzJuGHoT2tQZya8wZwQoM8sLPpc6PB/8zd/85BDDhGPJZJAlj4Dj9gLzFWyUHAvOYyVq+srkADccccdl1zy65s3b2XuLVHqHbqEVr9IRamWjpHIpP2XqoROx0tIFTG0Hmc23n7DzxaV/FkUBea+6hZ+fXLfHHgRyBjX7I6DkROQRJpWAjjH/vT0AitU668wu2O3v7InYAlOJvDDkDJ7KpC9qCMKIYgPdZJdS8liabe/irX2K9L+bpnhGCgrlCW27fj+v/zLWtCyUBXRdy85RBJRflIEiG2LUFC84wmewERIAd11UgKAAouLkYwntZkSi8ZBAnBUMU2BtzAfeuKJI0cfg5GRGInTxi12Z+ALCNn5pAOhCuDKORce+9mT992/ypFLTj3JkEGomx4k9af9Vy4yxSNItQ0CexeK4qmqWnvs0WMnn4TCBZBzjuqRDpn4sgRLsAQDgCg6hzsOrgp46qnb/+Z/rtk5sYrRISfMEWbnUsPOGfmBSGtp84XAIYSK4TsjU55+XnWfdfoLVpxwIkZGxR5h2YxtZ0EGvUAgljAEfs5xv7xibLnm5y7LsqlIILOpNU7UbRJGcRgEAEcf+chHdu3aRfXoA8VwP5Rm2mAm+sBMTSagWCk8UxTVT21ewA5Brquq+slPfnLDDTeo5mDtF9KZzLLTOorewFMJP3nxhBNOGBsbm8chzBfMnp1ZhVNv2lxadsrqF7ufWlFlONuglaqRZCKfgJnf+MY3Hn300dlMNV11Mm6e3ee6BSq7Q8bmJX6yioQQwm//9m9v2LBht2nObr/Ixqs323HabdSXtPW+4braQCnR0PBDply13skebn0+I1maYizzHLFrvjlZ2eeyF7PrucqT+xkjWwCwmuRgbGd8LeNBMItq39ICMt5KyUb5qle96kMf+pAyO/031IvXWyJsAXWMNdGFeuFvpZ92DesdNobIJrG15EtV4MGwWDvlgAMOeM973iMFJ/SEUnsuz3BDPNP7qEsX2QMWDzfffPMrX/nKn//850VRKIGySSr6kabsu62Me/8AZo45KM2Ksg8MSF4Mgw2768VAibawnqGC2dA6vW7KQqgvj4wA7gbYVZdRWvRfqwsJ2e4w0CJ/NkMuBDK5K9Rro+veVAdqVb6UT4UQ5mCgtJ1mZlRVuHvTo3d+fzV4NLBP9bsplo1mh/ivi6+DmOOr0REyzRMHhxBr1MbMkiACcQwPp1hpNg3PQYpxS+Zy2R0BxL6Y8sWWonPS+edjxSrAwzlQCwXsJ7EtBuSVPeW4qDnlzBymupieeuz++6effGK0qiiElGctPlCXpcXpqvmfFTJAJH4QjsmXwCSwg3DieS/FgQeAiljAkeKBiywsl5K6DQH2lmAJhgYIra6JkeCGElWJXROP3Hrr/V+/9QAOnapEqKKzs7ZBsSXEvQoo7TWnykTisE4AuhwmyO1Ys+r5F1+MVavhHJic984VgItZxfZT0GP5jRs3PvOZz3QgSdlprTDRE0qeN1miSFyAQFCNowrypLBGB3S7XSL61re+9d8/+WeizAjSmwJKprSEOkjAbFPabpJQq7rYa2sW1H/3MNJEux1CYKayDJ1O57rrrnviiSfIWGrsk1aJQt0wYfvMqkKk3sn95z73uVqDCEPDQfTwtqlYNkEnJcOGYkzPTRuLpJe/bzc6qbKgDa2iZP91qZyrnabVq1dfc801DtTxRSYdojF3rbqZFc2RjrWzx/TTlM7D5bFDDz1USiU00TsAWtf5LN+tDcFRrzh1fThZm2SgRRMjghPv6hAwc/DIIi7pJlFCm/U529EWCf3WQAjBi9xHXv2M7IqyTdkXm9iwd+Y6v/sE7PYG33vAyWSjqB5s2Mp2PRobB2bvYN+Zu4y3IhE0Zn7Xu94lxMr+ajms3SkwBp1++SgzzGQt6838Aqz1uCzrlymzmbX7SQXDADrGyy+//MSTnicBBJKKTe5nrNNiWPHcuo8s87J//uu//p8LLzz/xz++23tfliVzlebCczPOsI/xJenC/R7Yh0HyCWaHcPKTXtuEQv3APqAr38ZxDxekDKeDHmk7NmOT7sYKePbJ3dhunM4e5HVrjENjF3M6ZBXdoVWD6PeVrOW5QG6PyqQFIrYE0K4l0TQzqaAhYfZkYNFPYc7dqV6XfNDxS78tHUIAKkJAqH78r/+67KmnlgMFQGwR3WitpX2rDPT+5ZiCDUB0+nOmkk8ZuGLmgBBQJg8XdoCjijAN3sHEBx/09NN+FaOjgYPNmwMTwWSx1g8DiwsZFQ4hSMofdMuHfvjDMQ7LECTsk2LpVIiFF+1Gkhqw8of0aAih4hCcH0fl1q87/pyzMDoCclx32bALZnjY4RIswXCC0u4qdEGEUOGJx7/5hS+snp5axVXHmG/MK4A1U0ZiyDAbXEVY73xw1C1oG8KBJzxvxcm/gtGRwGDXE173e2BmEI0uW3baaacB0LyTbHz97EVTDshUDgBEpJkW5YEPf/jDd999N6fcfApoeLtzw8fQdlX7kNHPTC7PFA9O7o3ZW7udhjzrgHyxKIqbbrrpM5/5jJhiM3cSTjU3YWRc+6dtmZL9TnooPV+zZs3xxx+vufAtI15caM2a3w/swDlZ33Q4OnA7y/0cRuYE9i1KGQCtY44uY7kpH73kkkte8IIXlGWpL9qpb16gzWCXrW3dFFZFkRVbFIWKLv/pP/2ndevWEc2Qg98iE/Ul3TSLzAi6fQbsQe1S04jQr5Oz6cOiS0TWjRdtHg12vNZSY1dFtpGRFKRsJaBuHGltIYNsjcGsWMyFlFmqOMtXFhKUeg8PZBu5Xw91wWTTnf1q/xzOKZgT6GL+2Mc+duGFF0oQhnr8oUE90H+1W/pvX8+eV1Ayq/dVnVOKmjVrW+O25Nq2n4sLRDQyMnLddddF/2sjSCiJZnN81SS8zVFkT1o8f+973zvvvPO+9rWvjYyMdLtdZpapHMBwBxP8vQcLPzuKDf3TrkZZbJYmNHGSYd45JwmvyaQwbh3XMCzFwdBkTKijqLmzBvC4VsaUrbRsTbZyRpVS5Pi5n4trE/rtptlDK5sQwoM6BnRcQc1xZviW76i0kPl9h5TP2iJBG5lzFW9HDgx0S2zdcuc/37QOGAkloezXlthjUyZIiAXVx+g6HTYBSGkoxT2SSkYgeOeZA3EgDkCQfJSxHeedK0Jylglw08B24KgXvhCHHQYAccxO6rqiPnOLu23M7Ob5LgmghtDsvOeyQllh5+SD3//+GNiHUIAJtYyQzGwL/hp3SurZLZ099CY5DyfvmKjrsQ3V4Sef4J51pOS8hE+7Qvki5BRPFtniY3IJlmDIIMSKAqzELfiiQDmN8R1bvvmNh2+77QC4UaYC5ISIkxgfZZO2KJhEYA4AMTmpqVpyYEJFXDq3i3jHSHHaJZfgwAPhO5DdHQIRE7VQmP0DEnYckWdw4HDWWWcBqLqB2DGBvLNiPRKq4WJdb81HqRKztMxVCGUlWY9DWYl/5eOPP/67b3/H1K7JyYldoayCTfNMTp6BMQrbDCRWD6dkWrKjUK1DrzPFQ0Ad5Sx3no0g0qpKqRBQscSy+YcefPgtb3nLxMSEjS9rtmMvHKhX5jg938N2ZDLRbnXoIb90+OGHz6nniwKtImYGTSlQZ1A5a+8ndrLSqHEi0Q/Dswe7vPWmS7nJvfcf/OAHR0dHNdnWbBaPlbPJqNxIsmYmXtv4HaF4hx126OWXXz5LTLYis/WZGZvSiwFmL91QbHR+/YTdyIk4MxxCyzk7YKZszxWDPYTBaymbiwyl/RDOku+4TZOveakb34d+zc6Xo42linvY1N4AMhZ5AFId2HqmLIrATPWTiSbqLPnSmcqURovzjNTv/RHsLVCOPDIy8ulPf/q5z32uLYhnaQLahDPLtVtn1nL87F9LZiMEToUZck4KQLPi0kzrf9FnRPH2orPPef3rXx9CkNximZBgZaHZ74tMDtFpeuSRhy666KL/8l/+S6czKoWM0u5rb78+uQsnJy/A7Cieddvu3LlzenoaBl3Nf7V7Ga5aZQAN8W6l/PbdvTPEQVAnXFX2a5PZ2dQ09ieRmrTNWQozrdRVr2segn0OGJrv9mu5FWZvzczA7izDyNSk1JxlR+QT9y9C6O0myTnu6tWrHIir3CedmbkKEgxnvUSrqpr7hmRGdxqhGr/7ns2b7lnLED8g1we/DBDF/wC4dJFWQ0+ad7FCNwNgMEFoWVU48hTbJyIiD0cqbQOoAioGe5oeGZkYKU694AIsX45OhxnOFYrrjNfOeeDzCjPydfsAc6zGCwBbNm978KFlIG+CDe2Lg4cmGLYiVC+y3mEX+KnCnfzS87B8ObwHgVysBRybNb0KIWhrs+/AEizBLw4oCQ5TkyhLbN1y21//zzU7J1aEapTgUGP5hjfIIXrc9BQzWIJ8PGWSJBhwxERTjrcgrDvmqMNOPxPLVoB6QaCtnnr7GSj9cc694AUvOOCAAzTi1Z7VZ68oX+y5B5pgCn1GHwNARP/wv/7hAx/4wOjoqBT1FjWmqqqQaltbRmOLIHPyPSRTqhLGUUWZIGbye826NGBym+fhmaRVF3fck08++epXv/ruu+/OXteHm9qU4laaavWvFyRUHEJVnXLKKevXr7eS1nCuzySwzvZh5PJcD+x8tWZaqG/8WkD9nsTv2/k966yzXvayl2nlWdRXglxkc6fvtuowuhJCyiJkV68s8Le//e0HHHDAbisns1/n9hX7lmBPT/WzZq3Xsx1RhqJWpcU2hTZkLi7MiHM7U3KnjQe1+HTYRprD/wUHi5BM28+eXCyMxY718QBiY7awvnv2X10nmQLc1AL2LVDWvH79+s997nMbNmxQeq5DtnQejZIOdgc1qaU6r3Eb8skA6jHj2oK9sJ1pSgtWopA7e8JH9gT0o//5Dz58+OGH2y7ptQpps+xhK12yOUampqZ++7d/+/LLL9+1axcaXt6tbe7TS3cAKH4kIfvDDz/MSbVQudfGACn044Mwq52IxEA5JFwvg8FzmvWZG66Cei2hJ831M/s10/xWKxEYEiDruFDlht3WsXAjLk3JqX3etSXhhQkVRzob01+993M3UDoGA9PV92++pTO+YxW4w5plksWfQh6MVkWAGQGu4miRDHABrgwcACZXMckdOcGQiqsMMEHC3WWYHFNYxvLdEuIdALADwERThB2oNhz9rPXHPxcuVd2JnU6nl0Qa9764VEmp8wyPVYHYTC2h+/DPups3jxEV3ON/lJ/+EFLWNV0hDEF4OutDBQoVM6fkJl1HE0TLn3Hohuf/ClzBICbi2MNUmYGZAKkw7BzANTYcv72fkvslWILZgQMcKICSfZDZMTA1/cht33jw9tsODGFZCC5IigahX+kCYPScoIkonQs4ZjkNTrtMknd46o6MbFu27MSXvwwHboD3AEX6NvBUc78BImaOMVkHH3zw85//fJG6JLMkEqsLqIVTWbG4JzTXY3VT+0avAD7yxx/96Ec/WhTF9OSUnAQK8aw4aOSy1TesZGP5MRqOFfrF2WQHy7rXCv30HKvAhICyDFxhcnLyt37rt779nX+zYoSFrB19hrwT3KKXSiUm0hIGFRN3EnnnX/SiF4krZRa8NmC8iwUWB6091EWSCa/ZUXzEDKp+/nfoM5tNK8CcIK4TxNqp11xzzYoVK8R2b7VohQFG/CaQ8fDlpH5bA/1RRx11+eVvZq5CKHdvCNlbNAsbpd3gABBiAo1+L2aDan4Upjy6zWPb2sPWO4sC/cary7I53ngRE9yBubd/RVg0T3JWiX7GefnFgQwVaU8J7ybJvdV8bAH7FpUg1NZqfjKBtpWsG79G6vcXUH24qqpjjz32U5/61MjIiJ0mixDdO62zqQxUH7OSQOt3lWzKzcw63OwDA2xCI5ttasut/d+rkCFNRK8DD9rwR390nXO779il4OrF6FAn40heaZ/61KfOPPP022+/1ftOWQZE40E/yPPu7aNgl5CsqLIsyzLs3LnrhhtueP/7389VQC23Xm/5tUoFFhTnzmS+xtBwvYEwq0JSPUWgvoaz/T5XaO7ifjR2SEC7ZwpyaqhEjIXm3hEvS1VuIgqh9J4SUQqSsloZR8SeY6Za2e6Y6oEgoYHZifKcDZShqlCVeGLzj77+9TWEkVAW/SVv51rmINN/KCU2YubAwbYlxbulEU/ypJjUeonAADCBC1d2ii2MXz7jDBywHp0OwL4o+jnQLtbiyELnBuiimgMlKgBccdXF5ORjmzbx9h2jAYRg835akCABxb2M1ZFLUqiI7Y7F9EkIYPZF5fzWUB31wtNw6KEokuZs1K2W/Ul90zzNHTdLsAT7GxCRI6ZQAQE/f+K2v/3bNVPTa0I1ylUB1s1P5nlCDAMVv2XZVYFF4EjPEDGhIlc6tzVUdMjTjz73XIyNwTkmR0JVWjfs/ggqWjnnLrrooir5MxKR5i+mdKAXqopD6JcUrymjZDhk5quvvvojH/nI8uXLywRskvgohbfKvxWgtR17tt/PPtIE+/yM89uUOFVcUA9TANPT01dcccWXvvQlzF3zVM/TXv8Tm5EHQgjOuapbbtiw4fTTT5dT99nnm1sUaFrr7J8qYioy9THNq5VhPl0PSvk978YL24Hjjz/+Na95TeY2uCcQTEIxyfqqBnFmfuc737lixYpW/Xn2wH1MwINfyd6d8Uk7fc2J1v7zQFvnkEBm6Wj+qtf29EIHTuiRLHsxWFgdWkVrgcGahDKMZdaiRYEBNjI0lKNsYShYRmZ/WiwfvXkHKbFy4YUXfuxjH0NzgxjKr69kBITrmSJhlL5sGdjnuV5aDXVXJn1eL+ZEWheS22b4iTbKEF7xilf8xm/8xp6vk8wjUvGZnfV2Op1///cfnH322ddee61I0fvF8pwBFPlEVFVVt9t1zt18883nnXfe5Zdf/sADD2SE3Z7Tt8o8+nwWjMWN8I4h3/6DDa+ttDG734qQ2XdgyPGjUB9mNNxnSJAFpuZL1a1iqtmeH2EvuErXm76iX1RlRFNt2jP+3aJczNP33LP5x3etAjoccyCSlEMFA7ZyN3sSV8rgenZMOQECM5gDc9A7mppSWivEB5PFH0nRxESkTIAJTL4K2AU/sXrlcS96EYqRIO6CdaRjmFYJGS+SVojBBURi4wDDMTAx8dD3fzA23fWpaIZMpLV0eFLcy7T0ZGtiQiBwCluACyDAlQEV0ZQvppeNPvecF2HZGKgAp0MnIlCw64ySu2s/X9RFl8aWYAkWCCLpErB5poiZCARGqCqMTzz1zW88cvs314OWcShAnPLDupSW19BJMnW9nSTGSJwjbq6KQ0WY8rTD+ePOeymeeSR8LLrDxpAJov3mfHgAqDT/4he/+GkbDizS4QxTUgOqeKRMIEeuhSPU5jFvHIZzB/DvXfPeq6++utvtVt1S8lHChCpobKk2rj9ZCdJqhrMnmNlbAziaaj6ZDCr+nrEyYLfsTpVve9vbPvvZz2brJJMh+nao7llGRDGLVsrv6Zzz5IjojDPOOPjgg/cJ15vBBoWm3o660ljTTuOqcmlHt0hczfUwXxDdsUNg5ne9613r168visKqzbP8YvZMJqxbNT6E6thjj7nssstE9d6TrF6ZNjWnV7Q/rRvE9r/5QM8oCQ7g6DvpHJyXtErDDAMIglXgWyPamOJiZWYE1vy8qPkZOPWh+EXgLDOCpa7WLpM9Y0MF9eZC9hPR/6UJLU4G1AbN+/XG93mZX4YgNsrf+q3fuvLKK7luaM7oSZOAZHZ/wZJ1Nm+1g9h/hWLDsG/7WPRrTlUEEEzi7KHRbVFHFCUDxB/+4R8ed9xxe7pOolKLpPunWSAR9oiZBEvFSIfJXXPNNeeee+53vvMd59SolFOtPeRTiw51/huqqup2KyJ65JFHLr/8jS972QV33PHN1ldam2qdILv99U/NaDlUa68Jg3vY/JXqtQfR5n01o4EyUzHs9rdG9n0CMkmsHkXhhM4BkMhmRKeEwrkiG7LrVcIJEvcmupm4W4ZQqk+lfm6O25IrChW65abbbluxa3KMucPsECTJZGo0/oeeF4WOM79AMkw2cRE4cK/KhD0hkZajAFxxKIlD0dlWluue/Wx3zDHodBx5dj3msRuS7l4CMuXhBneGJRpf5tV7hBLMmNi15ScPrCLyyf4a6vySQBUH65Clv0beKdgLvUXABFd0poGnqvKAI591wAnPg/fwBTsSfmljJP1WAAAgAElEQVS34j60qZZgCRYRoh5YVSgrH4Dt22+/8W/W7ZpYDYwSObADfCJoPcJobT0gKwFrZEakfIWvvN8WAh+49lde9jKsWoP6OXkMWO7v3r7/ATMffvjhp5xyitRwhFESqO7G2CqUZBe22ead6//o+ssuu2zz5s1SylBTUjKzRNGSqRqRfdT69e8GRbXUeAATacqU2jFRmJ0rdu3a9eY3X/7JT35ywFdm7GQrSlXOoJQC6eKLL142NjbkvpMCM0bZZ5I6Ghl2MtG2URonb1Cv55HD6vKQGT/yyCMvvfRS8aqwn57NF1uf0cGqe0UIgRlXXXXV2NiYrrTdaDm7n7lvzAitBpTBn8iohN61Dw+/8JOJu81fM5pj50gHaLHHKSdUURSuqAX0LbosPSRAdWhWMmWTejjy7r1wFDEHMFoVGhsw45JojMUqnAr7xLHTbECPEsuy/IM/+IPXvva1GVWnulNVNokh1QrTZ2Y0ILKB7NjAtm8/HRkrCMaPcsByWvjZ0XQ3MDLYunXrbrjhhhUrVuxR0411y8n5VBOYqIrtnBsdHb3llltOP/30973vfbt27bK9Mk3uq6TMEnw5cp6eni6KYmJi4tprrz311FNvuOEz09PTzaU7Y5t63SQFCrfffjtmOs0dQshYWFNasDsx45i6JUO9TmDrV3R2OFUR5Ib8P5wwYJ1kLCAXmQB7U2Jr0DPfxdi1bdu2Pfroo1s3b3n88ccnd+3KCKnaMUMIc9MWQggoS+zY8f1/uXl9xWMcXX5c9D9hcXjUfD3WTKle1vYC0ccvjkrKBcoBBwMVUDEHSWgVsRBrBnkicmm5kO96P+7ouDPPwLrVIBdSEF8atgMcR4fBuc3H/EKm2wz4rlipowdQBYBQVVMPPfTkTx5cFqpCDvaBWiZ/WQqo7TQmYnXnJlTMFaoKlX69YioDdzsj25w7+gWnYe1auAJgDe52DqCe8Go7uWB4W4IlGFKIJ7pCtGwm2HROW1WYnt72ne/+5LbbDwKWhYAQXCSD7AkpA6+05h159HzMmSkwxbS8DiTCXgBXAZMOWwocdcbpo89+Nvxor0dCXiRZj5CE+vkwt1ztuxBHp6bAV77ylc65ji8cav6DgANF+bXZihVB7P1IrtO5fU/mAL78lS+/5CUv+eIXv+icEwNlWZY2tMG2kOktqAuXc4JZ2gjYOPVEp04OZaiqbuhOlcTuxz/80cWvuuR//HXuO9n6rcEfar7F5hDOe3/EEUecfuYZVaj2A5ah4r6AmKGtHG8NEMk0qVkF+uqK2ux89VO7IRJUCOFtb3ubOFFKJlCYuWtdrjpApNxeNqN583PMfOyxx7zuda9jrqLUMtNwsm5k9wUGfNRC1khIvkitH82cmtEwKxORZLGU+5Jd3eY1z3S2wX0bEmjWNklhNiAi8o68Ex+uVLucmITvsHMOjuq0YuHq3g4/UArUNeYA7No19dWvfu366z/y/vd/8B3vuPJ97/vAI488utgdbd/12YUu72zrzXIz7rtAUpzBOefcJz7xibPPPlupelKI8lpwWZ0H1PE5e+Lgva9FJIiCZ22UDJfSCoMZbUVymrBYh4LKgIjIuaIsw8knn3zdddclXO0W9QgsFnY9baW6JbR3KlwFYoQQRkZGpqfLD33oQyeeeOKnPvVJ9fub59EuFFiOw8wSyt3tdicnJwHs3Lnz+uuvP+WUkz74wQ8+8cQT2YsDmm3u6H53FO033HDDvffeO/zszzJ6qh8w6DP9JBA250nNxTbjd/VChah5GdHeA8kySckj0kRLAIYdcDoVUEMtmyQ/2ppSpxACcxWkGClXH3j/+19z6aWvvfTSV118yR/94XU+yc9JkA5ETAiOZgrxzrW1qqQQJu+/f/Ome1ZTKLiS2g7qBORcj7raV5nBHFNS2ouEFBA5NvIkIbkPNQRHywCYOcBV3m0PZVi18vgzz8CyZXDejXQCWL2HOLkgoc9p0kKyW8vJZvxuTAnMFULA9PTjP/3J5LYtI4CP1Qji0HRIrQ5TcfjUCwmPN108a2Lnt5fljtHR55x5JpaNsXNwnuUYKrFLXY7JP7knwTS/tQRL8AsOzMwhOGIExpatN3/2fywfH18TuMOVnuI090pgOfsFUdrLKa89JTWyDIELxx2/w/HONat/9eJfx5p17ImdJ5MGThqck3y8r4MM/MILLzzooIPKsgzoESiKOJ2zLBWR2XYww8Cmeza96lWvuuKKKx5++OHR0dGkl7KckGmePn0lE1D2cGpmfF3Yh6TjlNgfMaFOT0//v//tv774JefedNM/ZQrVXD+h0LQ0CacLIZRl+fKXv/zggw/eV1aj+sP2Ayunaix/Nna54JrD0SBlUtE1jxK/ndyqqp75zGf+x//4H9W/OHuyaXdIcmpQ0bOf6KLr/Pd///c7nc5cBarZPD8jTjLTW7+37BCay1XfypTeZk+aNohhWNtkPJebP9m8E71nrD2dYhVFGLOLkJHhV64WBdReYD1KhPgT4b777rv00kuvuuqq66677uMf//jHP/7xxx9/fLG7DBj7Y3s20vratm56rYt8v/GgFNA1PzY29td//dfHHXecJQiWdNhdltEfoux8tOUrGcHJ6WqyBejNmnXYbNV+kE3rooB+uiiK6enpyy+//K1vfetu94eIxC1L0aU4kRpHug1FV5WfRkZGli9f/sADD7zpTf/3GWec8Td/8zfKlzMJbZjBLsKyLCcnJ6empuTPTqfz0EMPvfWtbz3llFPe+c533nfffbNP4dLKKVrvWJ7ovb/rrrvOP//8m266SdjK0CLQylQqh1t7pSV3esHmEFqH35R89mNoemcrTbOMgMwhvS2dpFJEvU1s3br1q1/96r99+7u33HLLN2+//Uc/+pF93qLdaRVvrjvT2G+b24FAKMOPbvsGtm9fwbDlcYjhCSxVnkmNsKik5DOIyYVUAkcuKAWDMxMzh1Ri2hMRTNktdhK1TET/P3tvHmdZUeWJf0/c+zKzFqoKKAoQEaRZZAehBFkEXJpFbbQRZNx6kNX+SaMwPbY6CNgz04N0t8iA0uDYNPxA3HqagVFpXGgZNh1FVFxQKIRiLaqoLasy37sRZ/44EeeeG/dl1l6ZhXk+fIqb8eLGjThx4mxx4gSxB/RuXHJlEQrqOrcM1U777z24++5wBRw4BLAjFEmKMFKkZ9vLO1HQJvTmLDjAhRBcASDAV+Cw+KmF6HY7JG7DkMVryVAD6qhJAMxEKDStSQDL1Z4Sm0nEcNRz6JbFrN1e3dlnHxROts0lZaV4SSSMAGYrgKg/47OMbAqm4A8GWlGKzORcNdrF6tUrf/jDBf92z7ZEQxwKTvl5YxClBKEnZcKEPxcAwBTz8BIxBXDMGAU36mgp8Kojjhx47etQNHJLiZFpTaasr9TnaYsHkY7e+3nz5p1wwgnCxIiozqTGfv0zpoX+Z+UZCOAvfelLxx133N9+5orVw6ucK5mpIIfA7WATqyTZvCjrBGNI57x9ThGUzjlmktu6S9d57LHHzjzzzL/8y4sWLXreGkjr0ZO+vdK+hRAA51w52Bk45Z1/ysw2HmSdmt0MAqXluHFjTI7T3DoqE1n0HkfJB87SYmyKkBKHrTlmZOMGKMV2ArOPdxmdc845c+fOzTRyq39bMPRTUxT6shQiAEceeeQpp5yacFGszaytvWtjnXBSf5qQZRCyo0Nz3pk5TpbBTKycVKC+PZkkh7as+dRGvv5K1uVq7zoPolcbg41BjBh57b34ATZ/1KS1fjeQFWwsTmJtdYkqJXOUT336Zek8V0whhIrZD3bKgbK+SWBdv7gR2aA2ZVe05QO2mt2D4db9GLW/7GUElG6BmDt37q233rrVVltliVnaRrtFkcm2VjfYVgYsS9F26ncS31ZBYx1qwtnG4jl6zFnb33CcrB+on4KZJQPyX//1Xx9++OGayS6rOU4jSDJIcOVAkoVTqdQ5EMWr6mS+PAcmVFU3hFAOdKbNmP7Tn/38Pe97/wkn/PFtt902unqEuOF6y8VBemjzn7VZjOu3YNt90EVniMR1OoODg4OrVq361re+dfrppx977LHXX3/9U0891Q6TX5vPsdlBtyV960sgHBEtWLDg5JNPPvTQQ88444yf/exnk3Ojos2sbOIFMpsN2ZCzRW1/sg61TdfbiQLbh4SrWncN4ICaIDVqTWSc8qhUqBsGKIoihPC97939xIInR7qjAfDgaTO2StfWOABFUYgCyXDejxFB2Y9TBDDQ7WLF8G/uf2AWYQiBmlEGMiixusUFGRX15B1rf4XrMCLnQIwUxG4SWSY0RRoiImIwUQBXAYHcMMJiokOO/2PMnoWyCGNsatk+TLgquUaolQCx9Nhj5fDTv/1tEXyhumUjdhKhP/cMcte2AoFAjojgiArHhZMElPsfewy23RauJFdSipMHwBw0HR6azGvyo3EKpmDzQ4x7r3plCFi29N9uunnrlStnBe4wFynEnKGsL/HJuNxVp4y8NBY6cg4eQOl6Ja2gMDxt2lGnvTvmZJCY9FCbSfjDW56qRvzFX/zF0PRpsWRTnmNX5fvpp5/+2F997LDDDrvyyiuXLXuJUrCSgrUAx5mXtdFO1qjHW+bMzBI1OTDQWbBgwUUXXXTcccf98z//MxxpUrk19mo9+mMN4COPPHL+/PlrTCveF1TRwVrk89pYIBfLjPmr2eOFUh3HXTzZumOOW4QBtd6ySfvct59IvEgOxDHzTjvt9KEPfUiygqIpzcdpp68fUwelpvunP/1pKcz4D68FtHu+gQNX9cn+RE3o89HEc7MIFOecrJes/jqZgpsB+vah70TAuEVqJsBw6U52NVnl17bPZbOBnawNXEdr8/raM2H9V1Fkb0QBcN99942MjKAVd7Meo8jsYcsY1xXadpA2bsWBQl9tPzPded07MxnWyzggE+q933fffW+55RZqOSIxtuu8PTRbk/oBWvGYbTalNLZO9LP5RU8bmFkOzgMYHBz8yle+svPOO2dDy15pL5ksGkulTMbf7ErhdJzFJyiKonTFD37wg1NPPfUNbzj285//wksvvSSTa3U2NFdHm/9k67Ev2I6tJaL6okLHq75X7/0Pf/jDCy+88NBDD333u9/99a9/ffny5evxrfYnbDeULK28KIpCnBKiVKxaterhhx++8cYb3/ve9w4PD6/3pzc1WBaXlViMWY6HMbyWaJHBBkLWgQ1vcC2/NX4dVQCst5GICnLE0EBmdWrb9CYZfoioLEvv/YoVK2699dYAdq6US/mmTZsGU9m8TkTJ19XcZjYdhTHvvEdVYcGCpx76ySyiMnBBIKDixj6INK6bakRy8RgAFHCSx0durXVA6SjduBoYTPHUsh4iJsB5hAqByXkmDsQpLxDgPLmqcCsdue13eOXRR6IzEOACmFyZ8OsA3f8nvcZucopGOwtJNUCQ3UsmrFj5/IInysAIntIlOQzIGGVfm1AAjjje5c1oKEZE5JCiI5kAN+pDF9zrlNX0of2OPRYDg3DOLE0QCOzMtd1CcIGortVnIJNAIk7BFEwIiALBIWC0wuqRZ39wz4J7fjCPeSgE4sCsGb7qDQZJeeEcyDHDR804BiK5gBgM6AF2qMCrCUs7bpfDD9l2/uvQGQQRoSAiMonV2vrcyxtkvGVZhhD222+/t7/1bRLDuEkjO6w664risQWP/4f/cOH8+fM//slP/Oa3v/a9SoIgREsOxj8AJHbfjM1cJ85pTSNRILyP16pVVej1fAr3o4ceeuiDHzzz8CMOu/rz/3358uVlWUK0jcIJNUKC5d3GwZVqNnI931lnndXpdJxMxjpOh1g1ZBxh2DTypW5TA+h4jJ3adO9tw5KpN1SjjhXMfsO6mpQbBah5PFNKvPfnnXfeDjvskJWvsbUG6Zq4IaTN1BNPPPG4444zU9/oyVigqcSy+hsw7gh9uZ81XzNLI84R1/kcrGHWdgbZTvb14Gx+GKsDbQNMK6tdQURwJNne66kpXMzyE1gs0rGa3RLBWjf2uQ8aGeDaQaCQUg8H7zlUPlQ++TgohPDzR35xyWWf8r2KULvse73eenfYrhR1hq4fWBMUzRsP2g9k3NN97fO1p/x2I5OZimQVhBDe+ta3/t3f/V3fChhjryKzvPq2zyYnjMVk5K5g1RnETQBHVfD6LoCxovLbTHViQTsjPGSnnXb6l3/5l9mzZydHQR49KmhtthCz44ldDI19c0SFpDdKNMnxmCWSe6UKPoBD5atur+r2ut0u4ODopz97+MN/cf5BBx10/vn/3/333y8iIIQQKs8+aCZlBblxeA28YtzhNzwq/SKK7HZsSGl5NLvmokWLvvnNb55//vmHHHLwm9/8xquv/vxTTz0tm829Xq+qKs9BzzuuPSjVZUQYkd1szXuPwMSsB+qLonBl8eijjz788M95vNQ4Ewl9nYCZKETTx42mgzLjdRsxXHQ9lup6s83xvyU0r7HJIQQRWJLsVL7rvQezWDcxG1Jg9kH9+957DhUhILDW8VW31x154IEHHnjggRACECSN0uDgIDcDWs0Q/dpKuOA9OCDwYw88SIuXzAA6zA5w6ZSaauCcs5UkUOXPpMyjqSNyOt8tvksbTETkHMFLds0UpSDqlCuLUbjFI73dXn8YXvVqlB0mKouBtpRtd2ySg8EbORQIjCVLVr7w/DQXT9brVUJosL+mJgqyLFEQniJ2yTPBlb4olhPP3X2Pma/ZC6VD2SFyHKIAgJGg2NJwOAVTMDHAoMBwhOefv+fLt249Ojo7+I7htrqMiCAKBZG6KSVvoMRCxowNVQieGQ4eCK4YKYsXy/L173wntt4armC5L8zI1z8o1ySaISEi5D75yU9OmzYt03o3LtRcN510ANDpdJ555pnLL7/89a8/8uSTT77pppsWLlwYNb/Q6ExyU8YjSaj5c81p7ZxaZ5BVZ61Gq3XK0oUQFi5ceOONN77pTW86+uijb7zxxtWrV9swKA32ISIST+7GwxWlox+vfe1rTzrppCjd0yG1jfWVTQfj6AyqwjZUPaNpqGZvW5vYJcnmcvl58+Z97GMf60OKTbDknR0Y1Fe0pCzLSy+9tK89s5bdW9dX1thgbT80NfIsSET/jeVJ59EK6j6QTd++PZ9UvoBxwJKltcQ0bxSalK/8RBevvouWW2GNvIubJ78y5py9tclx0Q9s/xv9DAFmmEh2mnVT2gcg3HfffSeffPLCp562tLERbdqNApmhnk2ZndDMSm+3s66eGmwha0dYd1VV559//ic+8QktlIdxuOg4P7WXGJIot+sFTcGhb1FKvDh+t9d1pJsBpNtlWVZVdeCBB37ve9/bbru5RGOud0tXVr0BQAktIR0pZXNySCVRZrc658Tzkhx/XBT03HPPXH3154855phDDz300ksv/fGPf9ztdpXj2UnZ6FjNfBQh5S4PKblKURSrVq168MEHP/OZK44//vgDDjjg1FNPvf766xcsWCAyvZfAyjvF21p2mFvX06MpQ7VBTsaFNBzP0XsfKh91jMlqeWTSTVdZxgMzViYz0j75nh2QynimUp3VzxXa8tHKmmCOSFvay55V+HI/ObvGf638bSwrlekmu6uUaIAkQi33pQ43N7Ey2nOggtzSpUsfeOCHV1xxxaJFi+J2CwCgKAoyunG20Mo1TKr0ntg5QhWweMnDd961XRWmETsEYrDkamJJU9gnWsUHT4CLTjKxwx0CByZy7Dm6+x25wEFTHgqdMBMQkx2Ioy1InBFcIHjmHvMo0chA5+Djj8fMGSBiL/FGcoKSiRphApuCxWwciI7GZlnsbTwvtvqFF0aWLB0gkG9kn3TxGJkDQJInNEKQKBBtKo49XkzpgmMPrCa3hPm18w/F7NlcdAK4IEohPg5EEPXUwVxFOlmZ0BRMwUSACniSpIehQtXD0uXPfOc7Lzxw/26MAQ4OYIaTEBU4JzsHiWd6Rggx8a6sVGbAsQ/MYHIFE/kQQlmOOreMsc1Br93mqGNQlp6Dk3sdkTYV8nstJhIzmwesnld0yl6vt+/e+5z1wTOvuvq/W2NgI34oa1M1DM++KMrBwcHR0dHv/9vd3/ned+fMmTN//vyjjjrqyNcfsccee2y//fYSB8Ax+VEgR2AKAcxR7RDVWb8lzJvZk4mJq+Oe4MSp4hxWr1792GOP/exnP3vkkUfu+cG9v/zlL1cML5e3yk4nhCqEEFB7GUjEgwZOigBdR7B4sEK2KIqCyos++h+mzZiOpK5tYNTPZhPfa9NPSwlEBG7wAdGO+lLL5gdDLQghfPCDZ1177XWPPvprGN4lFQFoiOgam9U6p5xyyqGHHirP6zFHGz6tbdqo/2x6CqxBYucr/oqoccE4UJxz7GX15SrupNInx+d11jarSx2BKMh4U9rcbPjsaMnSl55+9pltt9226vbUm8nGgpUMldm3NC5sjX0eq3tq+aCfAm+5sda3Tal9Zev3fSUr7OtCss9p4PV6kefp06d737vuumuvvPLKpUuXt2ZEDbOwflr0xuWB43AnuzrQmp32i2ntrBWsk/dkYkFJaHR09FOf+tTixYv/4R/+oS3y1qlNi9LsW40KIMl7Bt14ZjhyAGexzJMfRPQrRcmFNvvvv/83v/ntE044YfHixVKt5jlWkgIOxA4heCRZJumM4CLKPAcARco7qZNSUhFCkBsXgiQrM643r8nfCQj805/+9KGHHvovf/Nfd9/t1UceeeQxxxx38MEH77zTK+fMmSOnQL3noigQNTFqS5A1g11TnCIUCMEcduz1/LJly37+85//6Ec/euCB+37+858vXLhQPEoDAwPiLxvtdUMIxEoqiXgofgXrEt2ZccW2zw6G86hSCommBIqi2Gqr2X//939/8MEHpoOw/X0aEwt2ptqcTatZeYGWSJIXh4eHlyxZMmvWLIkxVH9i5rjE2EJE/pUQaZlHz0GcY0LYUT+neAKZDI/pS3V2XHJGCmPINWtHWHFPRCGEkZER36uQ1lFVVRBlvigQqChiELdaCiGEnq+kQSLyvYqZqXAOVJYDg2Vn8ZJFTy5c+J3vfOeee+5Z8PvHQRSMlUGOIdcrGPRyuohpPAdlY/y9Cr3uit8++szPHt6FaMB74kbIxVgsukjSm9L9DsRycpjUIQkg1IkOLUoDat0anL4YwIEA53oFVsLP3WOPV7z2UJQDcEUpdgWRa943VLvnthyIXgpmhAqjvecff6Ic7U13Zem7CDnZMYPBdoScGEQ9/IgQMFEvVEQdV3aqsjM6bXC/o49Gp4OyiJlAyRERhxAZXz9lZQqmYAoE1B6TA0Gu6lK3h+ee+z+33LLNyOhMcCdKI6SVK+sIROQDF44orXdmDix6CwMkh8EpBDgKcCMhrO4UKwYH33zKu7DDTig6zjlyLoTgzDpd+8OwmTDeckH5fEjXFFxyySW33f6/nnzyyXW1H9byQ2iKSNVIvJfzQdzpdMqyXLFixXe/+91//fadZVnOnj17zz33/KM9dt9333332mvv3XbbbautZsyaNasoOoODg0RcFAUCu6JO+yJJozl590RjGB0dDSEsX758eHj4+ecX/f73v//FL37x+OOPL1iw4NFHH121apXUlB141o1c6tN5NvuxMFnS1w9p1l4N3p/01re+7W1vc85REW8N2kDkb1z7fO0hUwdVtUBTWVT9j2Ki7LgkN3+HFVT7tBrzzJkzP/Wp//T+97/fBpgkBxwz96eTTAfQCp1O52Mf+9gGdnIDp7Wtqdt+2kJLolrfFmY9sebEOH2cKMpsQ9smyUZn+2m73cabvvvII48cf/zxnU6nN9p1CRqauvFFapvZqlEnhe1b9qEGAzH7GY2V1STprNuWaAW0nQwVGcYsZmw7YnrZnigVSc6oECrnnDwT0dKlS1544TmNm7Ef8t57v0HcQKNZN4TYFJlZ9+xcZNOR+ZqpydYmCeVvIlDJWFXVlVde+fjjj991113Zr2gtGQW7LuyDlRpt88oSebayNPppC0K7Ff363Ov1Dj744Ntvv/1tb3vbkiVL+soXIiKT204p0zkXksGrxNluwXMANaLD9EIFaoSES7BALHz00d8++uhvv/SlGwYGBnaYt/3e++5zwAEH7L///nvuuecuu+wya9bMoaEhOW+uMxI1f1HFkytWS2xNl+47BnPwfnh4eHh4eOEzTz/xxBO/+MUvnnjiiUce+dVTTz21ePHiqqqKgsqypJRqYHR0NFKRI2aJb6hZIhzBB9E6YIRdmyYt1Pg0eqDVatg4s+QnywxDCG9/+9v/++eueuUrX8lj39o0ScCyPgGZO/GYt0U/EQlmsqX93HPPHX300RKH277EvI0EnaZcboqWGFifJVOBOAetgxLxWpc6JYvtkqUrThkhKFlDaDolYSbRUman09HZVykvPmhmloADVxZV1YXcSYXYsrgsZdckVB4AEwYHBwsqq6pauuTF5StX9nre+14Aq4YZV2jMS9UnlJCZS0mykBCaZw6KTJADAqNbPfzd7xZLl84AlxQ43cmtzs94iLtGvqRBDJlRklCgV5HJ/6iIkZhwBB/VAmJmTs64ggBH8bOF84xeWSz1/tCjj8QO26EsAJJtPKNwCQYLpbaxCGiiIHoRx+hOCMHJ2U/m5x5fMFD1BjtlmS7Y0JeYOQ6VbYmDeH6bikhgEIXCueCoAo8WbvYf7Tb9gP3q3FuoE0yiibHJg7cpmIJJBEFC4hFCFdg7OKxa/dPb/teLD//sjzgMhkApNqfeKgLAIHBBBRgFEQeuokoWDxsSEZhFjARm7hRVSUsdbbvv3rsd90YMTIMr1C6SJjNFbY0L1urEWzAwkEYhR1mrqpo1Z/bfXfG3p512GpoMcJ2gbcWhn83fMC3kLADQ7XalsNPpuLKgwi1fOfyjH//k3vvvE71n2rRpg52hrbfeesaMadtuu+3s2VvPmTNnqDNQDg6I2iSN94/80CUAACAASURBVHqjvV5v5cpVIyMjo72RlStXLlmyZNWqVcuXLx8dHV21apVoSEQ0MDBARM5Bjnir5hTgCcRVKIqCQMGHmNU0BCJyLJH2hKQkEcbDGNUoH2M2mAty22+//WWXXSbZJzkwHMWd93UnNnXOruuLGwsyc72tyMYnRzFDtg9wssOXDrdPkF8VTRoWRZzZn3rqqddcc839998v/WaWi3pruoZhDplxCFuP+fTTTz/ooIOwAU66jYsca70753wrO03bF+CaNnC7TuZbb490MrDQzAgRyDgVmtJBsk0VzjFHriVGUUhRwBIqM7p65JmFT1M67pphDONyyPF7u67lmWGWjah/CwQkI3BtoG8HxukV+rHKvJwix9TQy/VbLBsldK7h1DCQcTn0G3XGB3Q61mMs680uNjMI2Yv17py75ZZbXve61z3xxBMZZtrYQz8XPJq8oi+3scSjCHcuJoxWibJJR70pQPssPGpgYMD73mGHHXbbbbeddtrpzzy7kElCRKNDhCMEInG7lE52+cHMcvoDBdUeH5G9kQEGBtWygBgcmIDA9QkS27cAJomd9/U09Xq9p55e+OTCp+68804QOmVn6623njdv3s4777zzTq/ceeedt912u7lz586cOXPOnDkzZkybOXNmUXTKsiSSGSdmrqpuVVWjo71er7ds2bKlS5cuXrx4+fLlTz+7cMGCBb/73e8WLVq0ePHiXq+nPjJRYsvSMbOEsImfSOnEccEhoEBgdpFPM3FDTgVw9O0CIEKKcR5nRWdnutsUzhDOL8fywyte8YpLL/30v//3HyjLMoqNEOLVJpOVPCm57TKBgn6LkZv3pyNxrV6v9+ijj270jo0vd8aXqv15NXjtZZ/ihMX5HioiIiqYmUmiO8VG8ETEHikAQqwPlQOF916O20refeIgh7SSM0qc80nfQEFUslmVlJzCIYRyfCFBKTLIhYAXFv36B/9nDmFaCOLByg6DBUAuWCHzunGiSUn6CQQkczwEBwkAJHFKSs0QmAjiiYvOSmYUBKbg4Us3zGH1zKEDjzsGnQGQQ+HkOgkgnp9suvD67xtPTmCNZ/EVAmN01eKnnppBbtCR67f0I3UkI9OBlJvIr/GOb0eO4IVzgUaZl3a7ux50AOZth6IACDH0o94wQY0uhy0BdVMwBRMCVVU5Ihc8Rrv47WP3fvnL24FnhiDhk3r2gRH/SRtjwVGdkkMhcgBItD8x0At+mMpFA+4d73wHdtgRRcFU7+LqO7o812advpyyVVoVXxwxf/qnf3r66affcuuXN0qbqsRwcyNU1ZfMtBOFgZnFUylRNiLU5V/v/bKR5cuWLQuhUkWamH3u/TPHCanxFdnkVB+KJEGjdBUDMxN1AMhuot7VACNfcrNKNM/k8G2Pa40gRBc4/Mf/+B8POOCApL7ISdLAPmhqm7VpTVXJte/ARgGd8bbOh6aLx9bkIOdz4lJ3cuPcennGNwpYypSVrjvqZVlecsnFJ530tkZ0SU3hzRgWw1Is/TPzVltt9Vd/9VcYl9uMozPY9bXRQXRLad1q+frQ/rqdWYu9FLUUyTvr8ORRikhuWR3btWQpFsn1H6MkxHyX+IsU2UFEcumiHKKUmpbn9MUhEvdAk2FmvXLpVorMJmzPkf6pndepkSFnjWsFonpTUHurQTEaadLGUoZYTZuVrRR9yw6/jXyBgEZat74zuEmBecyD2JazQddOawrsNMFgYJyW8w5sgE9z84Pt6sDAgPd+m222+Z//83++4Q1v0HuTLbS5R6aPKWWiiXNbKDSpHBt6rjl1aY0SefJwpHFAVm5VVUceeeS//uu/vvOUd/z20UfRlLzOuQDPunjFOyujpxpXMEP2up3JzML6QzoaMK6Xp82COLlLJGLRe//iiy8uWrTokUceSf4+J87ETqfT6RRDQ0OdzmBRFEVBnU5HUjqMjKzy3o+O9qoE3W6XCXoDD6WNJf2opgzKeBrikZq41xhdRU0OTMYBZ9tvI38s3QZp0y5j8iIXonIIOvGkk6688srddts9hCpGkcOR2wK8BBKOitZ2i4Dlafqvcw0bLSM5boVGZmAZ5jiYaTeilS1nVuZse6X97DvX2QD70gYlz2BMjVg4B3JOtrTrxp1YnSDEs1lChIFZXpeoCBGvJbNXwWCltnNOYpZjBKVRq1SsE1HpXMnMfdzdiQXE61iq0ZHf/Grxbx7dnrkMTLV9LXVFnxXXmP4SIP7FBmrgJRaSQoFoCxXRuAaDAzsih7hnEgCSBFleTG/EO0eZiEGrAm+7117FvvugU4KIQyBXpmyMjSFlMzR5Fs84/aDkdICv8OLiF5/8/TTmIgQXfIOqAADRMaEc1jRPRD66SNKNRlT6AN9xXJajHbfXYYeh0wEJ6uxNrhrIbXvVh1oyhr4+iJiCKdgCIRK8Y+ZAQOEKdCssW/nQV7/mFvx+DrjDISURkX3O+l0CiS8ocAAkCNoBEG6dbjAJDPIcuFN4RyuLcsY++73yLcdjoBO3X5gBB0mhQXHLOHVsC0tUtH5QS27UJrc8BPDfX/nZ+x984IknntDKa9Nm2ypTAzuaCrJzlqSknOfNrA4gt1WYK9lUdM51u936bgo5ny8WO0OlZppKq5FoWEGcZdlgR/IdwOgBzrkQKgCO6oAda3ERg0A++LpEvot6IJkpDuTe0wxv8vD+973vrLPO6vmuBJ4UBYk9gXLdHOIT4EBPvjm0kvdnpnXc/JM1J1QXt59jM2tptLdhA5N12g6jZRIrJbzlLcefeOKJ3/zmN4kgfjxrlijoi6pc2tVxxhln7L333uNnG7Q/ta2pDR9mXxjLHM3MD6sT2/LQjLtMeOunKk8afTLDLZzkCIKdOK1gDfv4YlIXQwjpCCEDCImMM1uIzBnJNljbSWu256JNVBnj7TvGrFxZX7umPNk+EJHWb8/yWCPSmpy2G4EGK7SU1kfKSHX2TBN5Tw4RpRz0tdM2Q4LFcN+56EvtYy2Bvut9kqyXtQHbc0oRxAceeOCNN954yimnZISX0bDRxIj6eSiyn9BkRG2mal9MiJXKbWERmDH5NUCiQk577LPPa/7123e+733vu/fee4uisMdaY2QMIeZob7KLWFFuW2iz9JhPrmGijt+ljPIjd0o6vBSK5mYPyVah1xvprh4dQesuLDvvRVH44OGkt2k2oy3QmHqYxaIPXEOl8lr8hvLsvXfkmOqjk5JnPNJK6ONH60uZFgN6foU59nj69OmXXHLJBRecD4TR0dWDg4OSIR2T2wmgvep7/Hks8iATR9luzb44Pmm1FY92gxnlWOFIZidPq2VxtdTaVSIiDn261VdUMTPiUSfPIZBzngP7HjM7cggcUEXtSLJFgeF1rxpEjQhcABJ4kWGp7qfLZYEVFpG8x0FofIHZhQDPv73vwemjI9OBgoNDYHBI/0nlkG6X9lGxaev39b+Q4CBxOnK09OQeW04KYpKkuX4sVb3rLA/hNUccgW22hisDA5OeHa89xAn2HuwBjCxesurFJdMdIBEoDI2jJJDsKlmmZumgJnpJFRwgmXAq8Cpgxo47vvLAA9HpoCiyFaJrUpni+L1Fk9qmYAr+QED4b9npYHQUK4dX/uzh/3vbbTtQmO59mfYLZAWFVuC5QJAdGmY9gYLIo0FERafTI1pdYGlBR7zrVOy0EwYG41ZCsjbtW6rT/CGA1dqRLC6R5VVVzZs37+abbx4cHFyjAmHB1iQTlATkMjjWHCM4wqqYOikaQhhCqIKvgpdcNnF3vepJXpteL265hxDkX3lIF8XW/aQmKM/PjOpg7mJWdZaTT4pbHkyrqa89UTHzYYcddvnllw8MDCQ9Hmhp7ZMc7CSinxaFpnfD1AQTULgaY+MezBnr0+v0ytpARoTS/iWXXKKJh8jE7GTas9IPUUyJJYVbb731Rz/6UW4dKx4f2kMzdtd6jjpbsDDL005iRsb6bNdmuzzr1Vid7Osm25xgU4MBADfu9NGBaPAFDK6s4UoUrzK3mIRBoHIMjeBWv7bWUTaSMT3bArWYZPshe0V6IkHotqb+qf2xbM1+yLaTfdH2mYgkNkpqCnFKs/ImzO092lpWksFY5RMFZKwGRQLGmAv9qS/9j7UoNmRRT0IQCgkh/Mmf/MlVV13VntCMpOu9UqM2WJGKJtVl79o6dvFm89UG+XWLwLx01Xv/qle96o477jj11FPrbrv+O4LZLloIgY2qwynpdqbAyE/rtAazeVENU+dClDFRzPS71pmlfZDK3W7Xex84dliUfvST+Drv9vVsYcpdKN57Sv4WG+3YXtQu3a9ouSWbjStLe9pOzfSAEMIRRxxxzz33nH/++c65siw7nQ6ZM7l2CGz8epOBD1g9p73c0E+L0Ger5ik2Ms2Zxga00A6D8EyeKsLbWiinIImMEjL5m2n12UjbUFNL4SBO7eY5p2wZqvdJzy5kI7Idawtc++Cco0xvSVCWpYsBkm0gpK0HIAArlv/m/gdnMw3IkfL0WoAcpm5tjRI8w3PtryS5rorg2EmcZQBLfwIgJ7PjsgcHxBCV+JC6HdIkVcyjjtxWW+191BEYGIBzRKJMjD2iSQ+MPDjFOYcABF688OneyuWDIAf2IXik+HI0VlEAe45WaIjsGAAX0TeMtA9EVDjf6Qx33KsO2A87zpPL0VXlYiahw4ympVMWwxPOdKZgCiYQhEOyB9hxr0LPY/nye7/8ZffCc7N96ADEgVj3gZvZwQghaSji15AkF2AHjpuiEpzZ81XPYUWBuXvvsdcbj8PQEJgQiKJUYPUPmEX68jm7vZagSobK0YGBgaqqDj/88M9+9rMORE0JunaNAo6YAEcijKhwduvPORdv24wamGDeMTccfFGopUOFtS+AY5iACHJOoQFrDEmzCl9f/07UVCh5IljuJ27418SByIn2QmT8FGVuGnj939gI1PLddv2jz199zdx527ky3tKjavE6oH2iQW0huJqorKmjD7K9KtMdbY0AeGMdraOIpKYvZkNgLOmsWuwhhxxy2mmnIYWEZAO0/YFx0GvJhz70oV133XWduqrvtvuzzmuz2UJWosEFWiEzGtslaAfKJZs2ri7RioljfHYCPS+8fp3fmOCIishGhC8lh1qtRWeWjBRahsPMYLDScNw7q0mi7SUZi9Is9urGW+F4rnlUTfuWAQwRamXbIJlw9WyMdiq1nXG6xyZQJdZ3VOMwrnrO2s8602d+JgORNGfBohqtbmfz1a6AtNb60oD1bmAtYh0mOajJzcwf+tCHLrroIjSd8n3fspZUhnnL9DKibdOSBqa04+AUxp+pyQkkl8CAZ82ZfdNNN3/yk590IDk6SkW9/5Edyy0kqksKkfJRECEe8awbH4u21wiWLXBySsoXdZ9YNo8Rr8DyIgvkWbeT654rHxaHCENiPLPZTFFpcpqGGyzRBx1dZFAuZrHgpDdGHVL+g2QUrHl+4KC32VgasySnUZNKn977uXPnXnHFFd/+9rcPOGC/gYGSiIiKsiydc86VzpX6FcW8vr4hwn0Dwe7bKWPPhtyGNa6jPgIiw2eaOyRNUuvUL7p4YTczyzxK32TW4oea8tcSQ8a69ZnSVVraAhwxWHQDC7ZN2NDdULdph1ZTZoiJBOtfxUSSXomtRIWaoulbuWUab/Fu4RCp9prAV/C98ORTzz36m1lACXZoXHlO/eav7SBkjidOUieg/+p2b2jpjukng3cQqPBluTT4bfbYY8aee6HsgMQLOylk/0YBoQAACAGj3ecef6zjex0CgijJuYYnr7CZY1dv+DSQSURwBQM9ouFO8ZrXH44ZMyWDJ/pHN0jhmG7fsVb4FEzByx8S1wYzVQHer3zwR7++6ztzgaEQOlzH1DTu7oqvcixvhmmg1tgAAI5QFquJXnDusHe8E698JcqB6MrM+5JbSn8IkI1U5bcz99mdd955F198MdZ6I7f2EJn4hUzMhXQFjSoc+kW0djK1b30DCe2WLIxRp+9me0VaYtW+rI5+KLAJnGweW9Y9ebZ2EVHWclvjtF+3o9thhx3+8R//8YADDiCqt1W3OCCqPRF1iVWbmpda6rO5pA5o4m1T97kvjP9dmbuPfexjM2fOtNEZSB63jJMohUg0x4477njBBRds8jGsO2RmkmWqFiGWW6LJRuwqkxKNR9B32zEO1HIrbGawvIibZoz8bIevN2shuV3s0rdGHShey4HmeJUStGScMArtSdtclD8tqtsnHPWLil6toxPBzYN4GspkOZXlwO1Ra512iA1zI9DJro6smu1tRnLZnxMOOl6MvTrQnAj0k6HZilvjFycVEtYV7Jr6b//tv733ve/NOKSe/yXjzUTCm64RS4qWntuhf2jukLEJj+LW4dM2brcIVVAX48BA57LLLrvpppvmzZ2rjm9NfWsDsoK5vURRYY81oIlDrIv6lz1oC3pLlUuxsVYQ2HnUT3PT+4PUFdurrANtLbGe6+SuyqI1+4/LxEJKsJvcnKNDsJpMxrQphZB77zudztlnn/3QQw9deOGFQ0NDRUFELL9m/C3rSbtkQk7SUFMXzYRRxgazF9Hss2vGqKLfWq5/Msq/xsA2LIK03WuRrw8RnFP5KwWZ7M7q63gbs8ONNKzZiqjZSHKY6jDtd5XYxvqQYpLS6khT79wYqpSGP6O5+S1/xnCPPsF7cdABzPD+8Ycf9i8tng4UqX8OKGIuTeGejQZiyHHS1AMoQF5RlhE9kpJ9zTMFuYMbcLBrW9Gr/ld4cFV0Xircboe/HrPnwJU6WLmqZwuNoxTPY3wmhuOYV260+9zjjw8GuOCBeq1wus5MiKIgFLJnDhQUd9uIibnBQYSSPHgEoTdr1o4HHwQiMbXRcnoiuTUT5FjdQsXhFEzBBgLrzhgziFBV6PXw7LP333rrnGXLZjMPOSKu90wYHghE5NNBbyI4F5cwszBJBIAdBwqSNzaAPbmKaGXhpu+596vecjwGhpjiopaAN/1PLlx7GdgA6wTZSK3KpRBCuPSyy84951y07OesHSLSEEIqGm44i1i2yoeLN2syMxBCqJi9nOsnIkk6icCkoZ1lwVRrBjD+oBCCxFqqpNcKMFqvNY/tGK0ZUw9KGD7HfE5k4v70E5RaED1Cv5LrcASLHHl2zpVlCebZW825+qprjnrDkVS4pnq0+fYO29JnneWRTKmqsymKQWJpZSNaQk1jJELEQ9w5dI7gQGXtWUZzRiZcPhpVkkMI++yzz+mnv0d/ivTQ8g2peqoq6Z//+Z9vt912EziQ8YGNMkPGsdIu78sNtBF9tx0uYSFraqIgxtc4w8Ri7jDKEtFmmwfKOoK5n0EmXaMF0fJVkTkHbQPAtXJmFuq7fcnMvqv19c++HdD69ZZJ4dgsYUpRS7ZL7W/ZTzTCOe2pIxuRaroduWKrn9o/bd+hSGeeJoVtYjGQoUL9a7ayPmdLZhye1kbyywCU/Jxz11577THHHGMZI5pxsupTa+/q2dQxbXakEbukct/EQSs3y8Ltx5rQyQ8OcgEsM/Ppp59+113fPeyww0IIpSscGn5byz3GH2a7zvgsmpJDSh+yNaLsUXsSQ96MdGCzS2TrAOnEDAO8Vj1ve2akoEFIQdRLyC3eSoFiG6imF0KAo3RoJp22pPoADbf2cqqqVxR00kknff/737/22mt33HFHOHYFqa2xRpy3Z2qzblqnL7KJIUBL2Gkn7QLMZIRFi7RtCdLiTW7gYWaZF6Q72a3MqrFBjjjRW+D6RGx6F6jjphUyNgJDaTAUXhdyPPhBnLPu+l9HdYwnId6Slzpg5xH95C8ANjt/qadBjveJwcpxSVVs1A9DD067re2siVaYETyGV/36/vu3CpjGoURjJ8fWlZ2FwmCSmourLz0zR5eb7Ayg38ajqcwMx0UxDL9i2tC+x7wBQ9MDiMwBpZcViLm6csXSp54eIh4gKqwoynkBSrmcm0BERSJjTle4c0jXF5JD2VkVMGe33fCqXUGFcwVQ++mBNk8fk1SymRpfAEzBFLzcgAihQncUq1c//+CDj93zg7khDIRA3rfXjNXW9YmIWGQhALNfF8BUOE8YRlgC7H/iidh1N5QDzOyKOt9udjhu0wxyCwNVR+o8Ysxf+MIXzjrrrEyKUwpzaEOmo8i/Pl1KU88k17neVG8wm4fqN4wVgtxbZ+prN7TExgfZf+VBDZu25QPjKZCPU/pu9Fm09vPZuDWz2KXM2ysl9tS2oJd92HrO1p/73Of+5E/+hCfURW6HtiH6gNJMnNnk55USMtvjVn91KS2sEkwIAcy9Xm9CAgcsBvQqRvurDOSiiz46a9YsbkYBwGifUq7BIyGE7bff/pxzztksg1hPsOSXLWFbbh8sZ+i79gUsdVHLz0VNf/Rmhhj4YMivYQ61In+5uaVhK8u4bMCI/qRH2rkZtZRWQb05EUxwhDSobu6sNdum5YGw8ez97Ebted3t1KCuYm56Tu2UWbbZMO+VibU2gexbim3LyZEcmnrvkLYwGe4t4RSS1saqYkknC2ZmMzqBmcGxvjVRgmDzADPPmDHj5ptv3n333S1Bao5UQbX1c9klIzzZct0GYs1EoMmClFC5FTZo5zR7mPyga4eZ99tvv7vuuusv//IvkdLRKD4tcfYdXZstKIzFnJXCMyYAo1DpnFLzpnWt0+ZLaOpRfb/edwg8rh411rcyhm/JKTS5YqZMppParixLyR5eFMX8+a/72te+dvvttx9yyCGpK41xtXvV/pWSK9DSf58J2BTQ7KEO3zJqZLKjSTB2Cvri3Ao7rWB3dzKOqq87k7VAv9W3/Tadq2xVxtLuZ2je5G5H2h5mfO5XyMyaJ8piKWsWQPsCd3nIbu/UV4gIjPaMNBhdGjHyywnFUe8DqgrPv/jkT346k9DhIM7UEIV2HRmhh74rrhtAs9VkkwVXHxEnIOb2stC4BIYYyZsbOHiwL4pVBc3+o90G9tkLjqgo4516jQvyXNsjOxZvmoQQAhCImdHzWPzSiueeHQAcy8l/FyOwor8jYprIeXAgMBMzBYNSwS8RSYxxAPuiGCndboccgtmzwaCQY8ZSduIvlCK2pmAKpgCQZUKBfQ+9Ubyw6N/+/1umrxqeCS6V22nN9FAY3sTcYP1Sx+pDVUC3cCvLzvRddj3kxJMwOA0AUZEdOqg784cJrX1mK6pF/smO8XXXXXfuueeyud5Bsrbpf5kkyjyDAMQ1XNiwBQYxZJ9fRTgRubKAa6Svjv1pGq5qXQhzlhiozJVgJTcnHT1+vLmLq/qN1bpiBQYCg2LQrvqbVE/KdCarx2j7ipaiKMqy7BRlURRz58677rovvud9/44KVesnJuMKb9gufUNDIMqyKBAROWhsLHNgZilgZiAwk57BAkAoAJBzkotKG0E/Jc/ChjtY7bfqzudbiXFbd4899jjttNOYQ1H08Z6wcVsojZ133nnbbbfdpGI4Fl1yu5SWW7pFc1mRPQSd6rPxo6k5l6nddh7b9DYhqqZo5nqIT7RobnmXrNdJ85fBIISaYYbOXJ0kNbXE/qmN27Hrd9vhY1kda/wrscEcqVOEZzYhmqvJIR7mqj9NTvNFkr28VWKfE1OW7O3McoFFpAHimJuFmW1+T063g4qVpZEp1gBTu0b7ZmZhIrXozKcshX3npW032rnQh/bmx1jABjbWcCYKKJ2f3XHHHW+++eaZM2cKxjSEyiLQLsAMe2gy6rok0VXNgsy5h6aXJzD79C8QLT63+TxBGw8sxmZOn/E3/+W/3nHH/3rNa/YMldeMk5Z4MkKytLrG9m258hyR6RKziWRlO+f01AtSCZqLQpvVT7Tlgg2nRXPXp10TTc6W9Tn7U2oW5PTCHCuyIU7zpHYWZkOaiMrSEdHAwMDg4LTBwcGiKHbbbderr7767rvvPvHEtxJxWSYTA47G4F2ZGNVO6s7TONXaTY2Flg2B9oyPtRLtBoBOQcYM7UOGajKKvTBboShLHpZFWKmRMVvvfRYlkHUpE4XZYNl49qwlomnlmVIjyYaydGPHq5G2Gmup7cSfbEbUwNSMERZtRN2R2m3ZvGdmzettSGWcCEpm5gpECFj+yK9WP/3cVuQ6HIj7sLzGsmk9xPbAAHw/MzJOHshRrnkQkQYxBMAVRXDUJVo8MrrXEYdj7nboDJK5BuhlA5EonYOjVc88O7Jk6RCo4KAspl4MqDGm6cbIHApIraWMbHCesJqr1UWxx+vmY2gQZSfetGr4r9KWLoT0Z0PByljJy0DtmIIpWHsIIcAHqjx8eOa733n6hw9uSzQUQjHGOnCo9xOkJBN+nPa+QgieQyjdSvCz8Ae99STsvgeKEkUx1q1nU6BAzZTqqhOEEK699tpPf/rTWYilcDxVH3W3WZUMZXTKXdVOlrfEvQijZCRlus7Dou9aFm1jlJR/hpRqXfVIfYDRTe0OqhotNkYpHZsy2lWT8Cyr18aDyXGTbf7LpyVCRHo4a9as66+//pR3/al14ypsZonQUEX67co2RduYffPe15LPjItTCigA4Bot5qNyJ4k5QBRCt9vt9Xr2623kt0excVf3+E7biy766FZbzVSDVj9t+yDLwXu/0047nXfeeZhkcr/WpJlHR0fr9ZIWCPrZJNrzDOf2T2EI3W43zVqmoDZOim3GEecQQpCACzYpRDW0B60AwOiAM4xIRxFMC30ZqZZYyCJwbdSklrdbs5xNuZnUt6zYft2SJTfNvHZEhrJ6HXtI99Qr54RhcSDKNGFtUHuFppGSDSd7a1Ms5/UDHVQ7vqYdhcctJGTt6MM4DspsUZCBjT24CQCln/nz519zzTWKDfk1+iaagXhKvUon6Icl+wn7wDE+mMnk3NBvEZHmbbREvlmQsdFAh8/M3vs3vvGN991330c+8hEpwrjDWeNgx0K4rmJmDmx4FAiA7uKQiaPMosspS91rWJOSgZ1NZRp9d7+sLO67XjLCUDJgZtXf7l3b1gAAIABJREFUlB6gt8ZxQ2ksy1Ju4h4YKJlZ7iI/55xz7r///jPPPGNoaMhuY4+P2LEqWPpfy6aypTF+5TU0RfV6VGHUltcZk7dyCk1+mAkLXePOpJrNckTaeZeZDSl1qbZgxaL2IZPIffuQYSkjbxFVlhKsvMNYc2GokZMfiZlBdWhhSKqVT1yoKEs056u9c6ndUwpn47ym5taLc9mNzKjDUOQSBq48ur3Hf/LjodWrBmPiKksuQc5nM7MsT0iOBZNhJWZVA6eYEYBdiAF9cAwHiDogVNHGtUQkBJ1aom6nGBno7H/MMegMgOR6UvGv9VHBuZ9uOpnBTjBXHlX3xWcX8qrhDqFIkRrE8dJQHZrUV2aaBVg5BCEtZmaCL6jXKWfutMO2e+4JV4AQbxki0sgXwzEBw52lSW08o/ItAsNTMAXrB22R6Rx8bxSjo3jm2fu+8rV53dGtmDvMLoTCrhzzUKSmZK3E1ohdAQbLRhsAJgRXVM6tLAt69av3f8c7MDiIogggDsG5Mo/CiOx7YiLXJhjMPqFCpoOKL1Lk38UXX3zttdcODg4SUcrdAyKW9KBRawQV1LBpkQ5chBAQWG+5lRKJwSF7LDoer9aD2A1LzzpGMw0GY6hlzNzISyUJEC0amlv3RGSjeOKnJV2RKMcSN8ppjzCdKgNDMuCwngxihnNEHF2TgYjhe9XQwOAlF3/qhBP+OI0o7/YkkQh9JVQLyVFKVlU1OjoKIqbALmo08UUCCkIBpuBkBgkpTjZlGmIn5xfIRX9HVYUosdMd0JLUIfbHKl6tTm50aJMWM++552ve8573tTUKVYhDCDJMwJ15xgclfHJC5P44Fgsne2/lypW9Xo9DiAm/ABjb0tbnMTwv7T9HR0dFqyLSFMDMzJpEQhFC/WJnNhz69c1o78klkcXq2vpqKDIzlO2k0zPWJG5EW5jWMqZag42qSKiwWzhaWFAMHZJoRPuJkE5Nto0uNfPUhtF3XfMSEn1F/2zHZkodiXmHiU2LHWZoqETDvAzMPgUecn1orLbizHCsX9iOwu5CbX4giver9nq9tjKDJj7F6sa4Ikl+6nYr58qxvjhJRMCmAEve73vf+z70oQ9VVeVAsqYo+YyyW84tJtsstCZdk3FSSbdeSjGsJ/rsiqKQZ8uClIA3PSY2PpjVR1ttNfvyyy//2te+9pq9XqMROWsHuT48/rvxi6gje7ILr4nqbH3c7wpEbkLshDkAbne7MQZH1Z/s9DVqpstM0FpiomXEkx6hEd8ncbXyh7gmCyodqOr2qm4vhPDHf/zmb33rW5dffvmcOXMMZRYbaFPYIaxNfRtk2pbX7fpjSiVKqrurV5ll6RmTt4VZhCwRaRSklhBQUH7qKOszGbmpMtrGk9pXdBSZXNMptos6E4swq95GgOpXyIjmKMuMFcPGDBG2ZbEa+xwC6ViSGUKIeU7l7JfNdBmXQ4q7ZIIrCS655hkA9KRLG0IIfe4TqBEdmDhgeOXjP35oDlwntdgkALgxBFhWl/OCKCwdOQfnANmVzCYj4QFATMzvO245eNs99th6/wNQlIz8HFZjCE2H8QRqBusKIQQ4JgRU1YtPPtkJVYdlheQRrEp2jAa30iUXtQ2gIAe4AFTOLQ1+5/33w/bbQ5YBkZxryRrvywGnYAr+MCETlvK/ogro+d/eddcLDz+0HfM05hJcEIWW6q8Ls29TXOe7i16PULphxy8Ef/i73oW99sTgULwUa0KNnC0FLOcP6ZiJPHvvzz777Pvuu2/33XeX0DaiwrkyeJ9trlrFRfc5YRSO7E87L+IPtcqopQH5roIziSOtrgCjZKD5sbbm2u6Gflet9CLla7YmdKPn6SGkDFlEVCQh2+v1qqoK3o+MjBxzzDF33nnnn/3ZnzFLXMPkPVBm50Xx1vdkLjOvWrVq9erVqpEYTZ1U00UrCxXGMlECC9Kkjt07nBCp2taepUuf+MQn5syZY7uXv8Xsg992623OO+/PN09Xx+zJ2D+FEHq93gsvvBBCQJPHCmShClZNshq8tZHEv7B8+fKVK1dmn9NGsNbW13pDNnBq+sWQGFR2Tr/dwxg91wyszkyddkBHaJ7UQ9NwUgSukRcBdRQPDEvUOu3ybLLsT3Z0tr6C9tziUP6VJWl73td3QC1fTybK7YPtnuW6tjMTrkvblLiWMOxktQUQ+hkC8lOv1/O+Ic76wqZeIBMFipa//du/ff3rX18FLzEiFsl2LfTFQ0b5RVGgacdJubS5ZMkSDkHi3eJXJC/5lhky2QZFhZ7VAPC2t73tgQce+MQnPjEwMNAmxTb0rZAhJ1Oi9LuZHNcaIQQ5bK6pRdHiMFbBYOa2SLUhY9n8jtOrBqRtZvRbtpy6iiZdcYqaLNIeeQjV6OhoURRvf/vbv/vd737lK1856qij2gPZWLAeDUr/NfqvbwvjdDWEMNIdRUuZt8xN0Zgxw4zbA9CUIEiOYPVPqTZI5uK47M737EO2/exbKndgqCgTVZZa2nQSGXg/KyYbVCa80JJiuhzI5CXQ8qwpS89q1LDRDZQ4yfC3bCq1t87uMBBiwgUAzgHsEarek08+86tfTudQorZAKLomKf7LANiJgyyFshT2k6kwMDyCR/As93ezR3zkmOIwfoWImIMdODN5Jl8OLCPs+frXYc4cOAdyHMAe4PxwWXsCNvp62xQgc+OcxLAQer0Xn3hyukeH4AybEpwSs2MUIOY65yRxkClGGrJcPshMAXBl2Ss6w0MDe8w/BJ0OHKFwkIkzRJm+khszWwQOp2AK1hPY/GcKLBAxc0wX6Ls9jIzgyafuvfmW7XxvNnMn7iNxYdhrjC0X1UeaTdIk8veU4YPgJI+YJzcCWlbQrD13P/gd78C0GcJu7fU4bJ+ozybQHzJoAAjMMRNRHYqi8N4fdNBB999//znnnENEVVWFEMqi6EiKSfUthpi6UfdOZR+VwbKJHdIDkgNLs7TowTdmZrkzMUFMN2m2QMfSRK2Ah+xVqoQlZyM1BIgoy6RpFSAAwXshRe+9bKJqCzJezURDiOGW7IOvKmJGIPbB96rpQ4Of/Ph/+vpXv3H44YcPDQ2VZRl1gckSvRsybykZt4vN1aXZuySDpMQXLFiwYMWKFQS5srLsE4URWLI2e++D93LloiDTJaTF+AUGgKVLl/zmN79CZAJu8mQG4+S17/V6r3jFKy644IKMWhpAANHZZ5+94yt2mFg1wC4Ta2nIcKqq+6tf/SqEIEdqbEfVZpNzNzBKORI2XEqwmGw8uYaSVq5cuWLFMmvsoZmNsb14Nz24EDQdRK+quqHywytWwsT36dBUf4sGv7raXW2V2WkVrgVHIlmiQcLBvigh11JbG2Hr6QPL6TDFp6QhCul0uXUEWKOob+ftkbfYBbNXp9Xap+FgWJydOzv7MCpu9qDto6UbZ11N1lCfL2bfmhCQPrRd7QLtDtsh09jOr+cXPbdieGUIka+OtRAmfPibFIioMzjwD9dfN23GUArGj25K7uelEmCzcMRQ1vUSxYolbzA4MOOXv/ylZEQNyS8Z+u2DbrmgC1kXflmWzDx9+vRLL730oYceesc73oHWYsxe57hpugZxm951RIXV5RoLPLDmorWaG4wMtWQfuWUz3YQ+6HEc7rf/gTFYTfac1mdjNygL5atXcfwpMHvRUnyvWj28attttz333LMffPDBW2655aijjhgYKJl9WbpNp8utPWVa1p0ddh5/NaFpsr344ov6a8aKmVkTx9uI1FpPSMCSUzjabGl+62CBhqMt3uNE8CkjYkhyEGnerZsvyse09gFQ4TTHceCgmSIbYzQAQ3KNkpTiyeKnZuPUcLkqtiWTaVyD4ID8FLaiKCN7oA6WlD475ySyMrnUC0GqCu4ipiyrz/jKia648LMBw67tXoWq98yvf4Nly2cQOeN5rdP818YSSCYJXJATpBQEnX7RamzIQo2l9K48NzBoXaoETzTsw1Ln9j36aAwMcOGojOeq0MTylgsyHO892CN4rFix/NlnhoiKUDsgBEtRwwYzmMhJ9iuD1ZrFi20cwEyuxxhB6M2Y8crXHoxOB8yA4xCQMC+feHkgcwqmYD3B2sBoLIqkdjAhFD4g4NF/+ZdVv/71tkSDvirBJbnSUZGySVPK+xd9lC1DxadFq4suwPmiGC6L54Cj330adt0FnY66mv4wDYANATYYppQSKIQwY8aMa6+99n//7/+9x+57Vd3aaRhMWhkrTcnsJYraJ6IHuitudChkRmwzFs+qF2RckJm6ICXiMM0UFOsAtVPPLSXVegEcOXU3tPHTR0uOypsLIVRVRUQHH3jQV7/61csuu2zmzJlI9z/CxAZOTtkRTPKv9kpRW8I5973vfc+qXw0tMGhioPQmJ3syodGuUHmoquqmm26yX8mmcjOD7V4wN3R/+MMf3mmnndoUGEfE2G677f7iI+djoufXrhS7pmR5/u53jz/00EN6IqTd12haGN1SG2nH0CmlvPDCCz/96U917mwsoTORBZsHbCcpXX4IYHh4+De/+Q1adqyaQ5aPAdEiylhB/jEiKJayDWy1zA3faAipVFgb4SB7ajLDv5bbgBHtiL172q4gW9POqV1rljtl78IwQFszNEFLuBlr2YB0BRkbQ9r2bUwkbxYgImY88cQTq1evRpPto4UKncSM2NrNLly48MEHH5Q0F+06k1McbAogxr777HveeedJ7rNs3BlaMpKAIqqFbSMvQISydD/+8UNPPvmkfV30GZroHAIbF5TTCvsSTSOE8JrXvOarX/3qnXfeeeihh6Kvl6SFActhspyPGbVnr7cnQtd6FkFJJmJaS7QRLdHyNksZK9a7vSSbO9INxtsWQ1KqzFAix/fZZ5/LL7/8xz/+0Wc/+9l9992X0ol1jKEgbX7ou0DGGqN9RSGEMDw8/MjPfwHDqLPsJerhhQl41FmG0ZGSpGv0hNNWn+X5URQw2NdzSsbNKiJbiceOKDZrc9C35pdSkKYsDZ1ZOzorlPriSrlNhlIdrzVh4k9GDrZpO/ui2Ava7Uzia69CCHJUq9FPZWswa6Axu8wAoed/+6MfDla9QfYlS45JJmY081XqM3EogMABcdYBcGFUcQ4Q011aKozH0iEUxMlzz0SZ040CHJWdblkMvGLHmfvuBweWnIwUw1gmw6JaV2jgMbIekswRUuQXL3npmeeGOF24FDdpSWOLxbtr+BoTmahYIs8c4KoAKlxwVIFXk5v96ldjp52RHPxElK4XhimZgin4AwOS/4KEK7NEVUElBNf7sczcHcXoCB5//MGvfOVVPmzl/QC4kIjuIBtBKNIyKmTRMheF9UaBk7CJu3AEzwgFjXBYijDnoAN3efvb0RkEyDPIOWaSbHdoqClNVjIFAFr6vYAKdTGovPfHHnvsDx988MILLxT1t3QFMeQIj8RIRvD1nRJRQQFJSGN9Y53s/qUsVCqqwSDE/F9abjtm9WN7HkTqiMM0MxE1Cky1k4aSbWSiKvpCYGgq9JxibzPVof416Vtbz97mE3/18X/9zl1vOPZoz1U5UGi4KGhS3Sbf3v8P4kSVbJJxOkMV0k0C0vmqqhYtfvGGG/8pIdMz+yhu40XARegFySFpj1n1TZyHxE4AfP3rX//Od74TQgiVT+hMqiR4M6/fTFnUkq233vriiy+2dexYQPThD3943rx5ycE0AYGgljjt8knIR7fb/cIXvrBw4UI0UrrnoEsmmzUyoQGIkdTkPQNuZKR7ww03vPjii/ZKkHyxbBrXgHaS0z3dagsRURV6nqtut1q9evS6L17/f3/yY0r7KDAMBIYdqQCSgN/YPpipwXYiHzNZa/XSLWZWvkgpPsD2M9ZJUWBaooEhNspbSTEz0bUzGWLruXONdkg4MfJu1OM1kTh920STBizAROLLDeAZA+/L9xpUmrIKEvXJPLvpQEfqvQ/B33LLLVmCkTHRm0DN4EwG6ftXXfk536tC5dGCSSAONhMQUdXrve897y2LPg6UNq/oQ9hpO1tXmdU3GAhMIeDZZ5/9H//4JVeScCcfk7GAeUvKYzYOtMlMNRw93fKmN73pBz/4wT/+4z/tvfe+iCQ6ZrZEy7EtbQsPgSPREOTog5wrt9GUGt0WX3SNTJTZVywHQ5P/oMXNRBFt5PClFJxOsG81RqHvN2NsuRmrWzOfeKtymDZt8E1vOu7LX7753nvvveCCCySXNDMXRSfxuUK2GTYRrD03aHNpq822Kze+kl7/8pe//Mtf/hJco8LuJSNhUtIQZz/ZL9azxkDTCogiUtp3JKm6lWFKOxJZH5r3VmUiKWZylF85ZoGXjrmYFlK8eXXmJUtabEA730cnF5U0Ku2ktkAjKNXVm4j29m2ViLU30weNdpSTW8SSSxBE9VmuvrJYFpfkqZDIShlvSBK8PszSpwnnUFVYsuSpR34507mObA22yaIpY+W7Sj7pMGPjV5/wnppoOMXs6tUuBUj8tes591Kv90evex1esQNcR1DFzLJM9a12P7ckYGaxlyoPYOWLi7orlg0QnGe9ayh/Awy4wK0AFhfJmpmZ0K0qBoWyXOH9qw9+LbbdBq7gAHLi591M45uCKdhSoK8sTLFygZgxvPrem26kp5+Zy2Eai48/Ji+PrBzkgCJagygonheuM1SaPbcoeIrCF8Xq0r1UFEed/u/wyleh7ARwUZZbPHObILBS3JY7J4l4wlZbzbj88r/50Y9+dMIJJ8h1vWVZqmnKzEVRSE2ra6KlzYiLc8xpMgqW7Y8qNKorqAajgtKGFJHZ+9Vfxc1NpPG6DdXWBgHpoIzWUndG27eyuCiKd7/73ffee8/HP/7x2bNndzodq6lYzWFdp2azQCOgNVMQM8Xu3HPPXfD442RcPMwc5CIRdeU0wxm4aRX0RUK32/3oRz/6/PPPO+dC5UMIGuhaz8JmxJ7SkkuXRwEIIXzgAx+YP39+H8uZaO7cuWeeeWYqmJhj6mOZNzJfy5evuOKKv7vxxhtVfW9fnxXV+rRVYK0ItPzLutzkzzvuuOMzn/nMSy+91O127U2da+zeBkK2WvWaCDJHurrd7k033fQ3/+W/jq4egbkZxnYs615m5yjHsFZEzW2arMk5R+aQGlrRHArZQCI+Ke+h5WxaYn9qa/ixMLMXUgviZci6Ecyhy/bxcGryzIxdwNpKJo7Scg/rHs0wiRaxbQbIeu6cu+aaa26//fa1fEtBB94+zSrw7Tu/fdVVV8mlbTZYdYNHsGVAJAAGMVasWJHlgYWhqOywZLud+IA8NZ55xTnnrrzyyrvuuqssS++9MHB7W9cmG+hmBSttkdQkPSErmPmzP3v/gw/ef/311++5557M3rka1W1sqNLSlzvZyrqHbQ+vkHGsAI00GkIAqmUhcVcVssolVKD03dSkpv6mmgaZwM++DDZjMvYn+e4uu+zykY9ccPfdd99xxx3HH3/80NCQ/FqWpXNlX3RNLGiXFLcw3JibYeyWw3vvq6rqdrvf+MY3Lr74Yk3/PY6ssRt4FslanoUTWhlk+wkjJeOOgfGKtuc9A61jh2N/0r5Z6aMk146etkgjaxdEZ2v+RYsibqZDCen4gpV6GrgNIKSrwGwfmJmpEZqaPQwMDLSDNxU/JQM286W+zMETGL9/8sXfPbYnuMNwYIe0ASjqOlLEcspdaZXW6J0E2GwHIfq2EdgTAUwMFuWfyBH0OiRiht6hKu/2mHvOrXa0z5FHYmAIJBsmJNu7jEAoFP9bCkhnLdsCgcgF33MAut0Xnvi9Hx4eADmCQ73/DMhlSZK/E0BIvksHh5Cc/SESGZhQdAZGHbqOeNrgHoe8FmUnXt4NiczKF20b+i6hKZiClxnE8Lj4bEg9yKZTCN6Tr2jVqpF773/4G/+yR+DpgTvMjgngtBQjC4uxV4hZOQrRPoGK4STSjhkERzFfDoNXEy922Gn+a3d9y1swMIR0eIrNkcMc5LDe1D5DP7B6J8ycyr+dTkc423777PvPX//Gfff9nyuuuOLOO+9COtqsbkcyeYVEHbGBjVao56oMgVPCE4lt5Cz54xjmXBZSJEcIYUqskpHeMV9HbForUCGxwfWhsHjVo0GUkJmMYrAzdMIJJ5x/wYfnz58/NDBYFEUMzHTMAIcwmQInM2iEEjC8aAgMT44QJSmqnvdVteiFxb97fMFll132b//2fedc8ME5B7bRK9FHaZEJQDxdduaUAJiZY0BHAPDII4+8//3v/9yVf7/bbrsx8/QZM0LEngNkZ3szITAT31Y97XQ6//k//+cTTzxRf9JqH/mLC3aYt31SEibLXDP74eHhXs8vWrToc5/73A033LBq1Srzc7u+xkH0iWCyB7hivFsMhQ5EzntcddVVq1aNXHjhhfPmzQMwc+b0TTg202dKYdRgJop6XVVVTz/99OjoaK/Xu/HGG6+77jrJLRj5CQEU+UwcXNvNZxJvcWjwrrqmRIyYS3UQnXSmJiGEQFz31rZAADGCmQwCBe8jI41ZbxvEllky1liyRloMZiGxEwiAXkpujcC+rEntK/SLgFafQv05guQAjK0xUDvBYyCq7aSadmKkIdOuN/0CkqFVVTU6Ovrcc891u90vfelLV199dboXbt2i7TJ8NqxQAMBffeLjs+bMPuOMM0JACBWlYLfJJxc2GhjRzMzc6/o77rjjU5de0u3mV9O2RXxf5AutZ4IgezeEqqqcXzl81gfPvuGGL735zW+uKpF0vaIoxiGsLWgurHpmOQAaXnJfFBRCNTjYOeOMPzvllHd+73vf+4d/uP773/++sErvvXMlM6t7UJU0WZWBAyim/aOmFymuWaSEOSGyJ6Jacxtr+VgFAE1nljzEyDCwKwv2gYhcStORPltzPNU2hdkpsyTJ7ieimKDcG+l1+dBWM2YeeeSR7/jTk0866aQddtghhEBUlCUk0A9BmLCY/5MkgXgD7KRLCSeombYPVBQgdLvdxYsX93q9lctXfPGLX7z+f3xRk+02tOg0vQ7U8KgYhCMZUyKfrEQTmcUEZzBWv5gMPTYuRcn34Ki+NImam2T20zYbAADJmG8RkhGe9i0X7qZjdWW1HpKPkk2b2YNZKTGrFbNJ5xKYJRG/nFIXD57sAhbOOYfAHgzUuTgb3WM458piAOzkAFYwe/aCqFKD8nQYIYSiIGZPITz5yCPlihXT4UpULg1P1ghRVCnScoolLfqKzsvMcnaIleV30nNk1qstqpg42wqHsljteNr281712oPRKVE4pCvkmdlNytW1RrBECSByVdkhD0Cvt2jhwjKETjQr67eQXL0Z0okocCC9Y5TIOec53pvjqVjNYWDbrXfYey/ILBeDqcEGGayxzxsZEVMwBZMGlBPqQ5b0xHFA5bF4yXevv26b5UtnsR8IlUb+O0Ywhi7iUo2Bk1JSEBHBBy5AcFRxILmmyhU9R6tdsWiwOPE9p2O77VGUYFChmZXH3B6YWphrCQlLogfIthY7F7M6HnvsG4844qgHH3zwmmuuufPOO5ctW2bDRqKLMwTJtGzlZuaqY5PTB02KsnWU+Wt5Xz0j2x3N2qm1rqQ9xPZTHS2MFOhIJaZoBrZ9qbzNNlu/9a1vPeessw888MCBoUEiKgpyBYn0lpuC7LcmH7j6Wj/itHCiqiCHaYgocHXRhX/5tW98fcWK4ZGREcV/OyhShzmWZZI5NdDanb777rvf/OY3H3jggTvssMMHPvCBN7/lLZtq6ONCX8NPSrz3b3rTm4499ti7777bYmDXXXc999xzx8r9NLFw++2333bb7Y899tjDDz/c6/Xs6mscXGpB/3kkInUKIO1WpXkcHR39/Oc//5Of/OTMM8/cd999d9ll5x133HGTjAoA4L1XnNtgau3pZz7zmW9961u9Xu/FF1/s9Xo2O4TWsRRojWRuknV7LbON6DFMBoalWMhtITW6uG7f1my0n0oymy30Sx2bWVPSAge2vWrzQ2v1ZRkz2ASD2M9l2AP6xF3Wp7YNGq1coLSNhCbJbWp5rZP1qU996oYbbvDer1ixoq9wWSMo3vq+Jb92u92zzz771ltv3WuvvV/96l0++MEPzpkzZ7KKhk0C1/+PL370ox/t9XqW0qjpUFgbtNvV0XYcaJ1nnnnm5JNPfte73nXggQe/8Y1vPPDA/YlocrqZNhzsOlVSLMtSfvXeDw0NnXLKKSee+NZHHnnkn/7pn2677bann36aiJ0j74PEcNm03UVRhFBzD7TkO8tDP9FPROLbylxXWqe9XmxyCVG3SNTI9Loc0MnWiw5Wjr4CIDl1nuKKiPQoQF3Te///2HvTIMuu6lzwW2ufmzcza56lUg2qQvMsQNhMZrTB/TDD08MGYwPtsIPA4QhH2IGDCOzuv46O7v714oGf28bw9IDnaJvGfm6aYJLBTM/MQiCQkEElqVSzKrMqh3vPXqt/rL332efcm1UpqYbMrP2pInXz5Lnn7LPPnta3v7XWunXrbr311nvvvffNb3zT/v37yYVndy54cGswN5YMOnnxRqdlXjnvBbmnTvrQWqFZkhnVT3ziE//0T//00A9/dPjw4SacSJt0s88Wt4TG3ZGZM3pqTNszXlvaa6d0DsY5Kqmqt/fenqTSabadk+sh0qXSwrKzABu1CPInTUfyhX1nYMmvQ0QQJR4zkaUVQvNdUWuTzKzatFsmbtLoAY44p4ADaZtVdYhU4zivsVQtVUhiE6vM2ElASAWDxUe/9Z0NXnoqEA9zpCeVpjPktbNUMwt7AgrtkUvhKQEKxKgloA00JTEEgMRAErXCETHREJCqmiXafvAAdu2A4zRwKAAhGhf1Y+Wj0/RFxBz4RZWkxuLCscceq0QdC7E29QICwCn0J0jCPpCKeNtQoRjZPDZQqYU88UJFW/bvx46dUIWrEFfg5yA+OgVODeii1UpBwUoBZWNjmDC850GNs3M//vtPHf7qV673frL2HLZiW/bcO+jkAAAgAElEQVSwZUhjgkZ3XM6SbVP4k/WmYMJ4xoDpBHTfK16x9VWvQa8CQQAeZ2R2sDLpgxUMpsa2dICaV3dd13Vd33PPPffdd9+hQ4fuu+++T37ykz/60Y8GgwGazSFK+a/DzOpYolAmLEBt0o277kSN8w6Zbmjc8iLN3B1LJqzGwrIpLk0I0KYMYEor5qhICtxoc8GYcNBrKJtXoajoVNV+v3/zjTe9+c1vfsu9//7AgQO9Xs85x4iRklI8VquElT4JBI5SoUDQCGgT/k0BmpmZuf9L/3zy5EkRAYd642ynOWGsbZkfsigrFHfRQaTqk1rW1m3HT5z64v1fUtWdu65+zWt/5RLbk6N7LRSR1sFE9P73v/+LX/xivrL//d///c2bN6+EeT+VIelPv/GNf/3UP/z3uq4l5ooZNWCWffWWpoCa92u9w9h8//Wvf/Xb3/7m7bff/v73v//ee+99jo9zjl8tGlQKgpzW6io1QCLyrW9969ATj1uLTVZcJB8VTTts1DfpLsnWauyTphqCalIzbUEYzTBuuZ+Nby2LnZo8PLnJ1DpN4zK+vbzMlSb53JfbVxR1lKO1mtuBiBZjpwy5xduJ6pWbcLm0ynYK81uGwGEUrNZ8iG5VRXap0eJdcJjh573Oz89/9atfPX36NMaMYPlQcH4qP7er0WYtU9V9/vOf/9znPtfv9++5556Xv/zlF/KRViRSJSwsLHzsYx+zkGoYIVOWeZ0wfY/M/jnFkMeZmZ9fvO++j330o/e9/vW/8qlP/WOv11uqTS2zGCsc+TjAXMXPrternJO6FmZ+/vOff/fdd/7pn/7p/fff/4//+I/333//kSNHEAnN1M2992EtJAIaY/zGqNMZqwUgThG+TX51MPr68iMh8q+FSW63E9WYdCXcS5u1GeI+D5EKUch8oya9FPGqWDc1/aIXveiXf/mXX/e61x143rXr1q1TVWYCeGKil0ceoFSWJdibizc6LfPK+cjf+WL3TUXeUEQOHTr0hS98gYiSYL9Tw82oFWin8Kd8QFZtJcPRuKkv0HTG6GPYt7wKopq162E9Mh+lz0YrWxl85kydX5xGWsvo5/xIfjy3L8Z+pZmwRIMC1GeB7+NlmSh4F+WFz9djFG5jG3dm6pi9Q4lNh4QXlGrG3gtBoZxtKFbpEyXmGKLDmqA4M/PEgz/YpDShysaMqgBgwOdPjvyVdRf1zcAKEvN9DH4goW2kOLAa/gMzxRThYIJ6VXbk3LzqKRnecc8LsW49iMWMDxFyTOPGl2eEfDFhSBEfLhnCqsjH8EkgzMyePvxUP0SyM1ISgDnL2EQWcy/EsW5skVWViKuJ3pD0tOLmO2/F+nVKTIHn7a6izoG8oi67rVJQcDEQF0AhXW/ezFVqEo+6xkM/+ee/+cg1optFJsLMF42yQEO1hsTUa5iZRFNaEjAQNmwJ7IZEp+HPrlv35ne9G9u2o+pBiV2F5OJ3oZ8UF3MtslqQ6paIer0ec1XXg8XFxd27d7/vfe/74z/+4+9///uf/OQnP/OZzzz00EMmkejK5URB7TWQV44Tc5qh0rLJ1it55Gxki6dROzwVVY0yoMhWpKulE0zdGW9h30lxBm35a0tVqT0RGUHgKnfgwIFXv/rVb3nLW170wl/o9/sWmMg5YmZzjl7xdOR5EDpdtDFUlSiIFMxcQUw3N4bzWA46tmWHssl2jyXupV+YB1s2EgWZFblZB6dW/apXveqFL3zhN7/5TTu+d+/ed73rXdZmLvtYkbpG0hcsLCwMhgu2udsxBZ/19e1zuw+GI1ZFg8Hge9/73unTp5/jQihfTSX1RGO6RG+YPDZFXOuHZap4Tyl3Z2jcofSU3OJG7gXANvVzI7ylEMlqY9RWXMooGl+faNlFnWLko2hemd1Br338HKvQlp0Zj3QeoTPM5gc7pmA+elPcCgr1mT8jNVarDdHNFN++Iy5yJ+oYsdZWW5FJnhVGv5vXoaZNHVUAg8Hg9OnTl32suGSwGeSpo0eswz6LSu68tdHPhtFNFzvn4Ycfnpub27x581LXfy6vfkVBM8eUTt8kon6/r6oiunPnzre+9a1vfeu9jz/++Ne+9o3PfvazX/7ylx9//HFzkkBLk8jaXoOlsQVLDGv5wLX8kueXNZgMszsdxwwhiG/NVU5EXIy/SURCAqhtyFVVtXfv3he84O7Xvva1L3/pL+3bt2963bp6OKxlyDHj81K5g9YARIRBxOx9PTk5OT09fd730ukLY4ep1Kha56c3yOPnkdHA1nn71Ahk04qNzLmjQF6MXEI79rnO6yYy+rzngJqSN7bAvEipJMmUUNXgRKVI56fZszvTiVoqhmYposqV6/f7Y4th9VOlB8j/aBlyho8/OfvY4X3QHsAAqbTOagytkOaGKIV/seV4nl7Pgv6GhyWynQGYJ6SqRKaS1JLVUpjoGFA4L9CKfK+S6YnrXng32CkFDzXT4j73cTdvT5dhWiXSjKUG4IwOnps/e+LEFrBTERFu7XKqVVR0n1EEIxJ2nE1hGR/FK4mi7lV+un/gjjtABK4QjWSM9NKl2JDRjnch66GgYAWAgs7RRslmgAYEXqj2ODP7zf/6sd5jP9+oQr62Uc2ky6yB89ewNQfYvCZh8dGZKsIc4FUdlGnQc8cJt77+lze+4AWY6INdVGCq7RhjydHOxoY1uxC5qMjFRwCItN/vT0xMeO8XFxcd8V133HnPC174v/7Z//LTn/7005/+9Gc/+9kHH3zwyNEjZojaFq4jhuOM7olB1pISRwX5/CKNk0i+1M4XPXkh1fZ1mUSy+DihhYUJmIgUDhpcuYns+hTIcGYiFRE/FABV5bZu3Xrrrbf+0i/90ktf/LK77757w6b1tgwyNqrDSdkTrbY2ZuuMJqK9NmskAuC9N21sHpdwyRWFLUCD30m4HGBbqRoWQDSqSbClW63xfNtyviwT6OgdW+RXbHt/9Ed/9Pa3v90+v+c979m6devKmevTupmIGDQcDsV7dk68dNbHecz0FvEU+8voxTt2qSoxm2oJQHfxPTk5mRfmGT1FXtScocsf04EJlMyhsCRTWChjZun1elA4iraBpgZGQZxrQm8O9CoFnUIogV3TtBLBd8dckqAWQyrVIaRV2k7EiZD0M6vPpraleRc2yok0GpP0pB0KsmP4pSOjXXPU1OxIL8Pztt91MhfRaRjxmulgKknIQhmH3KY2ogRUtdnPtAhlzXXSkP8sVL3PEG1bRrwfzs/PYzzVsmRhOpMR2uNGc1wbobmY2xZCO6wHw1RRF+bBVjCIXF3LcDgEtaK+XmgEgcroe7FZbAmFSlgZro0XkTdvxDVbHpyBiIgmKCjRePfuPW9724G3vvWtMzMz3/72t//lX770pS996bvf/e6ZM2f8wFvHZeeaBMoj409+L7v1M+IlEzTrKXbNFJvPkobBBm9LIx5Nd3Zs6zHvPUSh3otUVbVv37477rjjJS95yYte9KLbbrtt/fqNyY299rXrVQ4VroDel9yxbUqamKjOdTZFHZx9ppj5MF/LRSe3zsyiSPsvUVMS/z6yZsi+m77RJqpytrE1DcUh1A6KSvKRakqSjcz5ZNeZT+1ZMG6C69ZKbqRA1QvCfM2I/SsVMl8bhKk5804I7Y3J9SpIyOTjnCPnvPfOEYC6Vma2bOcT/YpYiZ1tMItIHjkqaaQbnthWzhjK4z/6MZ09Mw1mGWB0yd1UdKqF9jPHJ0drgRjOjGZ/7ISEPIZCrPRo3jMvqszUg+k9B6qbbkBlgdgIKjQSSmY1dkiLBKrm4u0c4GWxZi9y/MTC06crAkkysGyjFpG1AEiYyKIk5/OTRprfq4KdEtdE87W4LVs2Xn8jXKUEYofsLSCrwHOzk2N/LShYS+gMKSLCpORrLCwufu8H3/nUp3aLTIpUpp0gsxtD9EmY/SvdYZNjSA4AAhDgvRCBHAvxwPFpwuL2bb/0m2/Hpk1wlVc4ZlvG5FPRODwb2qh04VHk07xzbmpqSr2Y3zcz33LLLTfffPP73ve+p5566hvf+MZXvvKVr3/964888sjxkydUVSSLGQfW6C4RLpjivqmSNmNsWmRjZPc1nRDWLraSYEoBT3MiJg/PZIVXeCLbXg4RiDZsWL9169a91+z7hV/4hZe87MW33XbbVVddNTExod6mjNyXYnSruZucdJWAAfPJb+9OEwOY7E/v37//6NGjaeJLy6F0ZmP5OCYK3gyJlEmvRmrPzBoXhZoyLXqoai1DEbEU3t77jRs3rsDel4r0pje96Y477njggQduvvnm3/u931tp+S7yVevBgwevvmrX5PQUhOq6NudWztKwpm915AYadYvpTUmWoTKeYwuzOj9u12TmqakpO+1ZrD/zZsZZpsrRhjf6RStGr9d76Utf+uCDD1oxOioMi8+OGF4gGRUdzY5zztqwI2bmoa+Jgq4nM1Saz0ZoJsMjCECsZ2VGS64D1egi19Sqb8lGqO0fYOOPjw776QodQyufmq195qr2dL7XkAoMSSGSOcmmCybrIx3srIRHSdjgwUfhiURkEJGXWW1dTtGx9OIjVUJVVb1eb8+ePT/72c+M47Cwffkskz91Oj5aD8gM6fRoqddEj3KfJpot21bQlsYlwNTU1MFrDxw5/FS/32fmqqqs/sdO6J0PqS/kcTbyVUE8Yq29BuC9Hw6HdV1bN7nxxpvXrdtwJdV3C7GSra6aNpzGB1XdtGnTK1/5yte85lULCwuHDx/+1re+9fnPf/Hb3/72wz995OzZs4OFxTRldBXr47ZGOp1iZKXU3X3BuMG8EZ3FvOLNxRU2XNg5U1NTGzZsuP766++6644777zzxhtvvP7667ds2ZIt+cKIl28qn4OTWnuwV3bNNXsnJyf6/amqqkadVLhyaaazOS44IMf1m50jItTeiDJiDsgCeiAl0GuW3CGBpChFT22IBk8Fgs2hhrSWSG/K3rVAGc3MaGmUOGR8asbkTittzTXx+hiZsxoFrkiau/O5sproOef8sLbr57NqVVVh+mCyurKhiSsHaVpdmi9MGum9P3v27JkzZ2ywGgwGqc0b824LNgvQmDuT2a8til2DgwKh9hgMH/v+A5UfOhVG6x1HZpYSEe2TMKBFRGdfgTKx+TU6sAb1HyXpZSycU/UiErNMMBGESBxhojcL2X3brdi2DUQpg5IIiDg1wlU3I4Y2apVgYmwxX08H6OyJEzK/0CO4ULFsLvoWntXq2WuXzqdAgjApgYSIlEmJBBgwbdq7D7t2AgQwVEEO7YEV7XX2ijJLCgouARRj2jwTaz2gxQFOnv78hz/cP3Vqo0glIiQcZVmWNsXGRtEQcdLkVq4i1WaGssWIqgbBnqp3GBBOMd3+5jfizjtRTaiA2LanHOBUa2ZGcOGz7VajQ1ta6YJnjWQtoLNVw2xp6cwA8+LBtH3njje++U1vesubB4PB0aNHH3zgB9///ve/873vPvroo08+fvjUqVMLg0V7fbZDR0FbYSN9aF8CM8Kdl5AN1tYMINtxsrfsY5TmbJPWNqo4RreM1AMzq4KZHTMRVdXkli1bdu/evWfPnuuuu+7222+/7bbbdu/evXHj+omJCY2u36oKhsvcSZo6ySf21Q2moCWxtxyy606v3/C//5//xxNPPEEapApxwdZKHGla1LEUbRM/2oXw80gL2RiIR0QUGA6Hvq7reuBVnv/856+oiTW3jlR1amrqIx/5yJ//+Z//4R/+4bZt21baMoCyNd873/nOV73qVa5XkdpWv/c+rJ6NN8GIxqFDU6aTLWBiUg6qqqOGL4g2JKeMq7fcctP4Ui0bS9muS52cxij74p/8yZ+89dffNhwOoV4TvAiah8q/m2yYRONKlsZao8eZ2Ve50xbaeupk1eQWUccsT8ezqhvzRMHcgqpqxS69r9E98nx8zo8kPlqz0Ey5v3z+9nOjvUMidOq287nzrfx4ijaghLNnz/6///2f/uEf/uHo8WPSzpmQWtrFRqptEZmamvrzP//fDh06ZL+a3W7CIY5Oo/YQRES2F8rZPEjhgqqax0JlUNqJIXKqWntf1/X83Nzc3NzUVP/uu+++BE96eZE3xV6v/5d/+VfHjx7r9/tGeVhXtLEodc2kRcp7X2pRqXlkUw8555QE5lcXDiqRE5HFwWAwGPT7/f37909OTaUW2dkWv3g1cNnRHhOaiIqdUSvBe3Wut3//gWuvPXjvvW+dm5s7ceLEgw8++NWv/ssDDzzw0EM/OXr06JkzZ1JAwEDQmMeKRFFbJBAxbjhCNhjmAwvSRjJaLAwzixditiWDc256amrdunU7duzYs2f3bbfdduutt9588827d+/ZsWOHc67ZhlGY4k5VuU1xdsqzxpE95Rt+7U033XTTunUbrKJAFiVQRZpN4kTYtZbTEalu0+d0Tr42SF83PtG235KfTur1nZLm02X+IY0J+fHEIer5ggKltmq/pg1U+zUwm1mallavkWbwYW4tmfLyi0jY2pQQWKY2RrUtXhbvnXOJzWTmEydPnj59+scPPfS5z33uwR/+EJCqqjSmGBIPaO52lu4oRNqoYeMygqEKFczOPvGjh6aBnmrHuTucn9xEYh7w8RWn8FAXAlCCAqsWaelw60ZnlL8AK1AtvgbPEwa93q0vfSkmp1D1VFVblOhzhV7y9Xd+x7wJmhjL5JGnjh6R+fkKgFrDJQKpdnMTmKAy7GFHAbndwqtYVG+BetDscHjTTTdh4wawY+dCEYgs0bsqLB9TZ7l2CWuloOAyQyPX0DWrpEY9xGBw6kv//JPPfeEGYFKEVFThLQgGhRBg0ckbIaaygigoJY2tTJpLYhaRWhXMi45PsK/27HnZr78NG7fAOVPJEVdRLB2K14wbl6F61j5G54KwSAXYOWbu9XoaZSOq2uv1du3atWf3Na9//euVMDs7e+rE048++uhP/+3RRx999Kc//emxY8dOnjw5Mzs7c/r04mAwHA69976uybaakhxSIilJpB6gEGrYGpCFcs+3oRAEYtzv9/v9/rp166anp3fs2LFj51VXXXXVNbt3Hzx4cPfu3ddcc82uXbvMF9Was4hS4/Hc2mwfM9qvqfHfoqRkCzU4x7jzzjvvvPNO84bXtpdc1hiWG0JhqXXJubZwVxjske+6666Pfexjadf9chdqSezZs2fPnj3jVyrLeRntw4pAxIjpD0a/2vFTebbI1VJLRdTpYNQY3rx58913b6XRFSGWNz1o2OdI5Wn+0n7p6deOzCGtFXPJ5HmRS1nDZeMOn7aFkOeu4XRCurUsEWwxlX85jbnz9fR05y2PGa5vfMOvfeADH3jHb//WV77yFatVe15TvZ371hcQHPaoqrvvvtvoQhvfmMcQKEF3YkZploY1me5GhDSmgcRmA2WQ2WOpHa7w8e3CgsJGJq573sHrnncwbh93kbfnDm+FZbTP0T3oxgbOJ6xz2uNXDkapOop+smlDEUCv19u3b9+ePXt+9VdfB+DMmbnHHnvskUce+cEPfvDwww///Oc/f+KJJ2ZmZuYW5ofD4cLcfLoW2mEuqB0OYrQ8qdcQkai4uJKcmJjYunXrtm3b9uzZs2/fvv379+/bt+/gwYM7duzYvn37xESjwBVpiIL0FEFTdr4BbYXP4BcQO3Zs37ljezNBt3tNmhg7AyCIcvcaAuUGV/gQN56BFqFJgXhpyMq8I+c9PfeBSxNcuEjcEUy/pr/a3JEISu99K9nR0tFRUvnTQR3bBCQfkZrWRTaZRqmm994GfJujNcZiTmLMIOpsL1GIyHKXDxYX3/ve9/7pn/3ZJz7x35yjqqpUfGLqbburPQYCQHDxNiEoE4W4SCAcOXrqZz/fA3KWISd7HFP+5A8Ysuc0DcAO2opeXch4Y60CHhJ/bUVAISJm2KLFx3g1okqOpeLFCr3tW/bcdSeqCqC0jiFC0Cpl9R3v/wxw6XtvTv9Zm3bsNDRuhRcM/dOHjzrveyBunlASVxHS5jBbAi9YmDuTh6sqvCDIKEUB4iGz9qs9t9yEqgeCioAdgNS8zebNi2fIO/OlqZyCgssFiukXsmWBqhddWHTicfLpL33kozvOnJ3SmiGqFDT5AFRZNXEcaQPHEGLCQqx/h6nChHKMIWOxx8cm+BW//hZcfwOqCSgRV3ELR4lDWrQg1AoTbxwVnm2/LJ16FKMsgEHjrITYSNLmpzWYuq7B1O/39+69Zt++PS9/xcucc/VgWNf1mTNnzs4vnDx+4vTszNGjR2dnZ08cO37q9NMzMzMLCwunn56dXzg7GCyoal1bdMjKXCRsUdLv93u9ni1n12/YsG56esOGDRs3bty0adOGDRs2b968ceP6TZs2TU9Pr1u3rqqqycnJZlURlziqYG7cOtIDhoWUNqu50CqWJnGa+rmwVX8RwaOfKS6JKIaWxAgfm018y15RRIO/e6klPi/jepetk446Ha84BAK/KWGLaBvPNY85HltCs/tL2rSQdO345ab7dK+8/IJH8wMjZsbyL5h15fzoyJGlKEvKWjyTDWfW93PLLcuE2VhNwR2Aug9i1FUyntPNw3VUk22W155rV2nnZ14hidhFu/4by6odD2up5eu5K7nzp2QTLnWR1gem3bt3f+qT/8+rX/3qBx54IJm4pr9f6o7LKdUzRXw1zcU5Ix/bM1061H7Xubmb87MpLmoQpD/78W3tgLKf5zirrfzovPFOO09EcDY75zPXaBHyYy1b+MpZ7I0+KWWBawBYgKWwIxxkrSQi09PTN9xwwy033/LGN/yaEkTk6aeffvrpp48cOXL8+PEnn3zy2LFjx48fn5mZmZmZmZ2dnZmZsV2H4XA4GAwobjUZ+Wg/nXPT09O9Xs/WbNu3b9+4ceOuXbu2b99+1VVXbdmyZfv27evXr+/3+wyyjqRZ7hRmCkOpBaoZif879nk7aP917USrH31wbldDp1LSr2Nmmc652Qr5XFeMR1Jttt1uuo2Qcla0TWLazGVhgqIvlCZX6zSvpRgdnXmNssG5c7w5Mib3eAzhEletzvVC2WADPgAWELmKkcpv/rdKALNdU4ioqiprt4F5ZFILza+Y6E3u33fgQx/6kCWtstPqYT2sF0GiyhqXDXHiJlVpxRONIfABkdmHH65PHJ8CsSgTiepSL/4cUakY8Ahejt1KGad9TeuMNNObe50nmvF+z2234ppr0JsAlNhZf0WbLV4VGF2Jhl9VidnXtSMFKer66aNH+6KVI6i3NoZWlFcgkJusmm2qpA3qxnGAhLContdv2nvDTej3wc7YybxU6XNen6kjXbT6KChYWcjbPzOgpFI7UiwOHvnMZ5785rcOqPS9t5Mk7sVQCIEDxJ+2ooCGzRmN3KWt5sVGLyZ1rnZ0TOr1t9xx0733Ymoa5ACGY4hEYV1QWAdpJ8ZtqT+3Jy1YCqMrmM7075wjheW/sxdU17V5WapIr9fbvHnztm1u3569RAQmZkitzMFLrq49AItz531YqeRmf/yZJopcwxXMFQAW/8t7b6Gpordycx0rdr5Pi3FtYE23ita6fDlPevFqYym7Qi/5qqZTknP/utKQlc1iCz6naLzLNPaee52MWi9L/Wn5F1kOlip5y0Ib5dfH3ZGYzzsHBQFEdl6Kn5WvKpdPF46OWulIMh8SGTHW0MASrzs3+ZZJaNIIs4xouWzbtu0P/uAP3vOe96QTbGSWdrRNakceTJEinhHO2xpbhsY4mnX0YP6Mneddzh2vWJxbvvyM9h7SFXXcztkzuvIVZcGNH99GtisSpZI2V8wnxte16cWYeePGjVu2bDlw4EBDbpqGDiox5mxd16o6HA4pE7j1ej0impiYsJ92xBTreVxy8yW3ldtgOLT1YRrQOks1dLYMAyOwthds58Jzf/BnunH1TK8wSmrlZ46GOo1u6c2AnE9ko3NTIjFpCQ1v8xUNO0znWOqkLpB7lzvnLI6zpf9K/oWjz5sOBveI6BlmfxWRjRs3fuADH3jjG98MywbuJUWapujVlQrMzJUpegLZR87S1GI4fOonD0/ML/SgPUBVHTUPoKocMzw0FW3Fyo7Y54qgaopIM9UDYQlVprBH7RWqqBgWos12DABAWYlrwcDxjMMv3vMCTPQBUmIC2wgjWhMRWhW90ncGxi6twqtND6KA6OzxEz2oM9mOwqswKLkgJcRGGTenI9trsTMUCiZPXFe0aefO3u6rAbKo6S1nt8yNJV12dC1e1iUFVwg0aknE++Fw2F8c4NChL//NRzcPB9NaV1BKwzEAgNviMo5DLgGqwROKGTF4bPjpoTXjrKOZid7/9M53Y+9B9CYlSvUshrOE4IVhHlqOM2DBBUc+6uVGchozyfwGYuho08uQ40E9rKrKqwyHi2mqNvbQGGciZWbnevlSg1pek7bJz3Xtiaiua1tYO+cGg4FlP7DzLSq//Rqi8IwY3uMfj0dG9SWG+TL6nxuxVSz3zKWQ1pqXYMIdXaee49cVDD5HSZfDv+S/5n08XX/st/JlUuqzK6vSsrIsWQ/xz0ArCmHUFzdHgnnvlpiGuPX4cX2OkERunF5sKe5vbGnP2zhzBrDzNkc/jF2NL+e+5/hWoke3bt2aj73eD52j0ZgJ+ednwU6eo2zLOWE5z7Wc488ImgXtXWNYql5yumH0+JLtjalzzaUqftwbGT9eXcmItW3hdIGRUH2wUK2Oba9XY9hQ80fJo/sxc7/fn5qaMufcRBXlP9N9RaSuayMx7YhRP8Ph0K7W6/Vcr0qU0GjQj9H392zfaDEfGix/nH+mVxhrI2DcblBrBDA36pFN1pyYzn/mjcTuYrFExqgQbBrH+PvG8ggRRJpzrP0TwNR4YScmVNUcAhqvhTC1ccNXBu6PiMAAX3/9jf1+L8S58n5+ft5uJCFTtI+RZEksSY5Gf2+T+BAEQ3/owR+uV/RFCeKCuwZUw8lEYIW0DfKlX56y7chG0U8u/RlFRosAACAASURBVEk7tSK5n3hIgzOEqnOL4Hr99IF7XoSJSUGkU5dg0FYjmvKnD77GmdnZ48cn2Tmy2KtWPdE3lCysZ5eppHYwBVVTm9Ki6qzXfdc9D5u3ILjtdJlvyvj19CH9vKK24AoKUpdklT47LCz+4ON/e/ZHP9qlOiHqRnqDmDQyjWIEr3DBuDO2kbxtzCB4zQlImeeJj+jw2pe/fO+vvB6T00kppyJKcTdCGyVdwUoGZSqYnIVENFxpJFmnLYUpcpeI420e7i0fnC3ItDUGy3VjdCTiqjetjMfa6qt9ulzzWL1vp7PHeQXiSnj2fKTCM+TQ89HMjiwz/ubyy3bZXwFFHcr111//u7/7u0eOHKnrenZ2tt/v7969G+PY0isNK+E1FRSMRWqctqZKS7IUfDzbcvAa05sgJjlJn+1qyelbVXu9HrLRz9KJcJaROX2xLPXXKs6d7ubZoUPaPMeNn5xUTWZFOpKv8TRq4uyIZlk3c5UlxZzmqrpjx47Xve51p06duvnW2w4dOnT77beTCXlCADQCMksn7DknY1sBUZw4duShH28SdUg3QKKnVBulZKrjpVLTiSiMFCb4pBFEeGQTbUiQTNsTigZlJYnUgBOieaKt1x3EtfugPp/YiEhDLq3VOtVp28VbVUkVdQ12mDs7c/zoZlUnxM2gRggZfEMiKYR6UyJiqFjFMnu7FDGUh+J9jxd6tPO6g5jogR0ouJ8aiCi4qbZiUAZlWIfsL/ZtwZqH9UVm1HVdDRYxlPrBh772iY9fLX6dShVSaYetktApEDTwsasqQAJlArFCUsdRJQbgVbzDkHnW0dltW/7Db/82Nm+G6ynFxDhEKqY7cRSiB5ZVy0oHZRJX+2A0JQALS5SnTeB2Fl0AFmJGM19szZw4qJ2uobO9hDa/aSePBu2+DJVScMVgVCBwpeEK2c1No9Az+lYnDwAyj+8LVaoLcp1njXyYvfXWWz/4wQ/WdU1Ew+FQRKampjCyRZQMQlxJFH+hYApWJjrLqlGRWlpf2WrtvFcb7c4dAVAeVLf0i7WHfAV+wdlJZK0IsS09u1uMChridKbZzKYp1aTAgvE3zt3GTlIWayWf5VX99PTkRz96X13Xk9N91ZCiZnQVEayh7kPWAhF/9Nj80WM7QJxytkQ59LNbd4UMcdT6enIbd5G7BBADSyoUAnjVAdFMPbz+jjuxZQuYc3q1VfLVibwRNA59DHgZzszI/MIkM6mnmAYdTUCSyDtr6+2qwhFrilwACAHkBtDhRP+aG29Eb8IC5qkKxwiiSUU7irVU2wUF50a+50MEqX1lOwJPHf70hz7UO3p0i68nVS1MSM5OIlvQJJm5qkJJw2ZMOo1UBcxK8OzmHR1Tf/1rXzv54hdjog/mpi+qErnckEORv60G5C8oySS5nfMx/bWz/F3qUmlZPHb9SlGVmX9IJ5cGU3BpcCUbV7nBeSVg+c87SsZ1NlfWUrPp8A7pZxJP5fJ5+0ruHLeWqqKgYPViqZHtmY7zY888x0qvYK3iYq8QOqz3s0BuL4zuNOcX7/y1Y3cgqibzI0lr2e/3+/2+wDOIw8THmRHdrA2yXIeBh1SIPvmTh4czp3tqzt0ySkpyO+BacC4f98AS8uQwQHaOI2Vo1Y545UJ5oiw6RrFRV9XM80QHnn8Xqh5a/vOq6pcy2FYLUlhQqT2YiBkQqEJ09sTJwdkzTgUiCk8AgxhaEZihCO/FgRwosiHM7ACJ3KV5hlsm9Eo3bti4b6/FxiMiJgZRcviPb1UyOSzn8skygBasecRGTgBsePUL8zh54vCnP/2zz3x2u8qkSE/VqeSDjnUeIyUpjqo2lBFZIpQ8ToIqkUCF3cDxrFO3+6pX/Na7sWk7uJ8l5nYgNzrflG648pFb3WGwbUeQoXbY7PYOU/M5t2BHr58+542E2oHVE62J0nIKCi4VSl8bxSgjmQaoC379lQMbkBPS8xaGoqBgteCCjCorbWgquCy4eM1gKXth+ehYH+eckgQQRkzYDSRlKI14bmUbciF5jKqSMsAqpEKqnkgj46Tm681dao8E3mNx8YkfPzRF6JFQVD5mhc7+LeeBY/B9yp537FOny5okMNrwWGDqb9+6+5ZbTF5k1l6yuNbArnUuvFJ4wJzedeHMLNd1ZX4fAAeOI54ZapIUqkx50zR+kYjABCav6hnzqtM7duDq3WjlhFpW7ZWBteDKQRpVHTEGC25uQf/t51/88N/sHCxuhE4CpIKwWxCH2ua7IYAkh00fuxR5Va/iVUx4KaIC9sQz3j8FvOCNb3K33oHJ6RAgmblDWhWsLuQjamfKz10e0F4ELEVD51qbpfYzMbI6Ke2noKBgpeFi04gryhYo4qkOvPd55pCCglWBC9JDr5xuXnAOXIJm8GxvYZTikuNz7scdviCS5P+GlFEKmb1jEfbT/lzyFafoZ2DnS5bvO/gTjBRBcHbu5w/+cEJ9pUoxb01aTpCCQihJk0MicY5EcNToKDmqihTwEA9RSW6RyYgKES2boJZNpEsFuyHTHNOuG2/AVVdBBdUEQvqtlp/I6gWlbWTHzPHFM0P83NMzUntWxFpXAF7hVZWcsSK1qAAiIqJK8BDAAtWFmGUiAmZPvEjYeu212LwJokRsWaLCW7B/wXLuamHXQCUXFCwTtnhWSz8lNQY1zsx95b99Yu4nP94O3/eeVDiNP1AJaakAhNAcFlEQsFw4iYFKAjpSIYBqyNBhpuf4hutu+Y1fx/Q6gDSImnPeSs4xYRSsFiTSsKNwHDXURw34fB9xOVrI0U27pQjTgoKCgkuPsqS8MuGcW9UebwVXFC7ZYqmsygpWHrq2p5m4kV5UIjVeEZkzRGQh1Xip5DeALG1U5vEdyCXvLSqhmcmOKCSnalgq+x4UOHny5M9+ZkIhjoebn9Er2RYYxjCeC+kL42D0ZX79cJBICQJ4difFH3z+Xdiw3jNDm8dLj5p5hq9uROKZIQLB6RPHWdQxs8KBNESfhCq8eABKIIJY9iMg5UNHbg/DEZEnLIjfsm8v+hMgjlnGGp4lL0OnVKNWdBlMC9Yq4nYLAYJ6iOHi3P/45vc/9Q87SaZ93WuCYkChlCJoxP2D8CdVqDhQ0LqrwLqtqtimApOvqtMqp3ruVe96F667Hr2eFx0lpwpWO5ZDFC6lqcl3LHP15XMsT2lgBQUFKwFlLCooKFgtuEi+3mXDpuBC4Tl4UHH2c8mLj1oxuZ1in5NkMhdUdtLvJBWOtuM05r7hFTp9Q8Q/dmjx2PG+klNALShhun0qV/jBI92KmRBS2bY5RwVIgGjKR36TKZG0pApwk0ZAoIuEuYnegTvvBBREYr6TocBstKyu8jCUGSw/hgKEuj5z+mn23pFVsgAhV1FoDWSMZEjw7SJ3mV4mEYFIRUW1Bg2Ydh88gF4fzojqxsE/BREwjIp0OqPnlTOYJl7gynnkKxZpbCViAqGuMfQ4cvwr/+Wjm4+f2ALtq1ZxSDO3bsuAQwDHTQLE0V0JArH+aMJKGyoFKkxKNM98osLVL3r+tW94AyanQ7hJojisJayNke1KRz6MJAcHLE8LiZEZ/bkX5rlfpKDAUObHgmeN0nIKCgpWJi5SNIYy6BVcPCzHslgexmfjbP/VbBlTOnoi8iHJAsE8f0GC5JuLUXdAgRJTh2lJJlJeAlH1EH/skZ/25ub74eqdwgEIQdY0cIwNCxmFkC120gi0rkYyPSJTh+c10g2AgLiaWCSa3LFj8uYbUfVTwpYOa3uhpCWXHUSB24UKvCyePlNBSVsndHQ3mUe8ReNuHPthwe+gyuQduampXdceRBW8v01EmQIHjClJwYXs6gWrCqqoa5yd+/nnPn/oK1/ZpTrlpadKGkNPWlDdJiwsgHSIOI6rSR4exkMmr6QV11V1muXE9MSr3/1u7NiFqi9EzJxFsyxYU2gCbpTxpGBtobTngoKCgoKCgoK1h7E0Uc4nIkQabNFKJp+0P3nvz3uL0ZVkN9ogRJ586EfrfF2pRTNUhlrmBwG8wlwUvZosCD5K9rwiGdcUxH0gAqk4Uoo5XpBIH4tlKUTgaMMroERNmj9Pelbqq26+Edt3QuGqijKlZEbDnT8s1wpHKLyxk0Y61nJ25vQEsyNlNK77kR9h2Ocs5KcEXRdH+tkpgRx74kWVic2bNuzcCWJQCkqaYgfYm9CQfadpcyX+XcGVgjTsQAGpsbiIQ4e+/JGPbl6c3yDDSmpH6kgZylC20AhQRyC1TgTXHk9V4RzSHpAHhl69ola34PQU4eZ/94bpl78M7EBg56QRqq/6vZaCDjo+DgUFBQUFBQUFBQUFBSsGo9EnxzhvmeQiUZBBHKdwxCkeJQCR2qJVEi1p2MYs3vZZUxla9hKLYHbmyKM/XQetVB2RNklytFO8dCuJYSgtHmUroGWkLznkiMhvHyuCxHWurFBVrzogzAsO3Hk31q8DVxrzt4zW1Go36VO4UDJyVxSLC/OnT1sO9taZFiPP6F9VTs6DLfkqSV4nFS8Qtuy+Gtu3GkGZ/MTHtrk1QPgWFCwHHT2ypc+G1Kg95uZ/+Im/nfvhg9sUk+KrOODZvovlB6s4KCjTdWyLwatXjem8GczknCNmJUbVG/T4FCl2X/2a3/kdbN6GqoKrRIWpKordNYy0CbnaZ6uCghKWuqCgoKCgoKBgbWPsAi9xVmOByFo65+xIJ1VMIpo6SswknkNL8WOCuRMnjj/yyAZB1ThQo30q2Vep/b0cuZoSIRiiiTEbCtVS3SoFa5wBUfMHjzymq8RVg6rad9st4B7YxXuyghUtKeUaMOmJqKk0BoYDWRxWzDEmZ0PvSohFSQQiIkfKDNM7dggOYz2FaUFp2+5rMD0dQ352hDxM5ELqYdKM52bTY2ZnXkGaysImrHnk40YcLhXeY3Ew9+3vfOPjH98rMuWHDGLAhq/832ieEyaAhCmwlr6GCqmSaSc9YUg67+hIj37xN/4DbrwZE1PgnoqIRwk3ubaR5qk1MFsVXOHotOHSpAsKCgoKCgoKVi0szhh3rNH2Ao+z02AiSiJSJYtR1viDs5Fadr7vKCjTNUdWjykrTa6gVA/vZw89vnDyRB/iVEjhYijJcLt07hIPF9y6MxdvjKQiRTDVkHKOBzlodIYUAth50jnxE9u2bL7uelQV2BFXy4nRtnoZpea9KrA4mD8zWylRw5Tl54qaQ741jjZREgIAEJRIoAPRs+q37t2D3gSIlRsjeTl1dcXaHi2eN5KVOS5r6QouGgY1jh//4l9/ePrUyS2+nhJwpCO7ZrkiH3ItDmxrwGQSqIjUIgLViocVHZPB1I033vCWt2BqGlx5AGDHFma4NKqCgoLVhDJqFRQUFBQUFBSsXix/LWdEk2kkjQ/hzIYNzojxmklrmR/sXA1Rw5GEliJSxXIBXrG4ePiRh2lxMKHK0JyHNMPc2LKcXG3SuoS7Bv/HTnqd4IBMUCjsJ+xMgkKaDNSREiII81nWrfv3Y/t2MME5SwQOQEXyYF5GFi1Nx64ChBcMAkG8sPdYmB/MnaUshXoM4qnpZ3hQzbMpqaondva2VYUq553zPbd1zzUghioRA5LEuZ1iIOb9WAJXnMgrr6LV2LQKOlgqggEzQ1TqIS/Mnfz/PnvoC1+8TqXvPREobemE5N1A7I8eSgolqCozAXCOVdWxSdxt0BVm1FCpeKHHs1X1une/E9dei2pCBeyYmFUE6olcVlAA3YG0oKCgYEWhTIsFBQUFBQUFBWsV0XYOn4nIuCYKtJwmXjKRjIHXAmqxoGfGaPEI9UTM7L0nIuZK1QNgqjK+yXsM6sd+9OO+gilGU8tg4qB02cb1m1pG9HIY2CxOZUMWJM6RqVKiAfOJ4WD/Hbdhw3pUPaUovGynGkhpg85/1xWMRELbZ1QVvMiwdsRNnu4R3Wr+0JHPbidrJyjxQKSe6O3YvxeVy3jN84eRKjrBgjWGpH61caMTFAO+5sEQTxy+/yMfvmp+boOXHsHp+JgGFnGXs6Ab6cppcymcyQCxMM0xHh8uXHXP3df+yusxtQ5UwTGx7RJJ3t1KvysoKCgoKCgoKCgoKCi4XOgoewLFBB39U+5rSDGRTmLtxqniwmlsFKZISjaTBZYUxdkzTz3yaE/EJetYGSBLdyOipo7kdv7uHOlIY1+3vSAlqiwjzJXd+DXzUedaPJjqyp3t9fbfdSe4UpC2tHtNJEQLnpgLSlcdrOTOOaXgzw8FFuYX5xc4xuW0fNsCFct0HitVFR4iJAypGA5svLaqGgkt0CFpb/PGiV07YV8UpEzf5660tRHcs6AgQoiUmMGtrY6YPlvga5w9+8Df/92ZB36wU2RSpELXrRuZhlkTkygxCEAWOYGIwMoML6ihyu6s49ObNrzst96B7dtQ9b0qcYVwsqNs34WIQEU+WVBQUFBQUFBQUFBQUHCx0M5B0vlTJzalABJ1NWR8EiBJrJM8vskxuJUGJ/8Z7Wsh0hTOEoAl7c5YP/E49fTTTz4x6bgHdpEfpciFnZeq0kg+ms0evMrHxFNvM19EIsFrnRwrkRILu7Pe07YtW26/A5XThvfs5i3JBEyrwJo/L4vKzMyMYa3D2imccxyD33XUVUycIn4mECsA9aHVOOeEaUFk3Y4d2LZ9lPDIOW+039TqJXwLCs4NG4Hss6oSSNWjHmJubvCv//qvn/jbnarTvp6wTqGthGDa7UWcAuNq2BiAiIpEqSaBK6eumuvxERne+Muv2fbSl2BiSoi5FyJsqIzo1QsKCgoKCgoKCgoKCgoKLjLOwfyMpkZMusjcZTA/ITFX9tc81mT6YvpuTuURkXMuEpSqUBkcPrx44mRfCb6ON1CFmJN50FGeL4tzEkhqzOOTsk4DcIFmDQEulUTUMzkJ1CxbOM2aadb7HdffgKt3g5jhrCJi0d0qDYY4lkVN1LKlCVJVVNVwcVAPhlAVE0KO87/2Cq8gJVYWwKsRHRIjkjqvpMSLwLY9+7B+AzhFEm1460yL2mo6q4LwLShYPizvWC5MNHds8UPyNWrB8eNf/sv/a+rnhzZ6X0FBEoj75husBLtMcuwmUgVDbeyCANokCnO+VlVdZD3JOvG8/a9897uwfSe4B5A5d4tS9PIuKCgoKCgoKCgoKCgoKLh06KjWRmnHyGCyKqWAZsxM5JI/dIp4FgOXBWfF4CKcuYHbB+bKjOpEVqqq9z4mzhaB9ycPPcZnz06oMqSdGDqPGjn2kcBBLNmcE3+2dH9t8SMAMJOPfuxWVmFXM896ue6F92DjBhM8PfN6XjWwd0wK8d5+xWAwmJsn9Q6q7dzBHbkoUUsOFnMZWeMgAYZe5+p6255rMNkP/O+YVyiFjixY2+jIkG0QtFGTiSDAzMwP/++/P3T/l3ZJPa3qSFMc3hT+VRFyUqV+1OlQuZLbOfbeU8/VjuYqPjJRvfwd75i69Q5Uk6Jg18vLUFBQUFBQUFBQUFBQUFBwyRFdszOl2qgKMhKLLes1N4fzMJSqPrd2c5M5P5Kn1jGmsgIABStQ10f+7d/6Uju7tKbM2nanFq+VF8qS2BKBg2d3LqLMk+qEq1B0Bk9FCTmALOgaO3I8JF5gHLj7blQV2I3W2hqCMJukNHAbzjlUPJifk+GQCY6YoQoKeboVREQqVgtk7IkGt1V7scxO4iFhUqq27d0LrkBgZlCjRY0BRQFICkx5meqhoOAiIo22sZGLqhIcVEkUc/P45nf+x19/eMfiwvp6YEJvAoEUGv+HmM67GQktoRis4wEgBdsuEOBVwDxUWXB8knnPK1954N+9EVPr4SaYe8hG8E4hS/7ugoKCgoKCgoKCgoKCgosPjg64lD5gJJG1waR1CKRfo6XLxIjEzCJ15vpsDr6a0oBHYjHEn8xdpauqYlUFCcRjsT726KPTohW6Isdwv6WfibQ5efRDm4vsigGRcbGqWouvgXmVia1bd15/A5wLjsnxK/l9V3ucxEwBCxDIUv2IArS4MAepGRRiULboCqMzLWu7ZdNoOWgnnlsIA4D6/R1796PXAzkA2pbspgh6GMeYFBSsAeQdLVOkk4qgrrGwiKNHv/ifPjj95JObpJ5EzNydRQvudIw4cCFFj0xDmcYtFyGoo8WKn2ad27Lx1e9+N67ejd4kuAfHaGswS9crKCgoKCgoKCgoKCgouMQw+c5yzjQjOn2ryYqTOYlLzMZg1Kf3Pr9RTltZ/pWknbRzqiCWFMWZ2eM/e2wa5FTNMNe2BJIzR+8cek7L2iRFeYFEiZmVJFnmwUFcWUkVKo7OiFx18HnYse2cOiKJaXhWK4iCJ71AGRTIQi8YDhcX5oxGEUIFQoxE6QBROIDgiCxzEqmq/cwpFQ8F80C9m9q4accOMINZdSwL2QQ6RaEpC9YWVCEizAwi62g2YBIRyGM4wOyZH338Ez/7wucP1MMp7yuoJcaxXkGk3kaZtNGCIJi0cygykgaLn+EVYFqEzHHvyASe/5Y3brjr+Zhcj2oCTBq2EEwbbj0uz3V1KaqloKCgoKCgoKCgoKCg4MqGABCxdN55MEpNmspc6JNOyLkjEbHz45HGzo0aTE5Cuvj1lsbOrhZjUNptTp8+c/T4lMLFu3JM9ZBwbuZqlNhK6bzTA4iIc04zntX+5FVqlVo8mGrnTg3r/bffhqn1cBUy1ejI9Ve9gjIEoCSSINoiEMFRXdcQn8KF2vnU/KRETouItBOjS/CXRw0aQNdv29bbttVumN86jxeArJEVFKwlEMUIvSoEMrKSmcnXNBQMhgtf+9qX/uqvd4nfKL6vIAVHn24Aqk3wiiRkzkJNWvYwjcF/ARvjHWpi36ueZvSuf97z3/Y2rN+AiT6qkA+H4mZR2Q8oKCgoKCgoKCgoKCgouCwY9dTuOHp3/HQbf8R4fvIET9fphJ7MiaYkn0zHk+hSVaNPsZeZo8cGM09PgIK/diMgCpme7ZqO4CjQaJ2M3qP0lpneIuIoqDfBZNEWRaDSlCw8CZGwGzie77kDd9yByoFChoqxur8kQVqloJi9KD8oUEBlWLOCIznSiByzmJ4C1CIeGrOfw0cam4iUwJWrGZt2bMPG9SAHcsRVCHBHjsjlXvaAEI1pQAUFqw5prMx/JWUVKFmCsCFqwWCAx5/8wn/8j5uOHt3sfSXCljCKlAhCkPNtyYSk3nFnAYASg50o1cyzqrPTk6/4n38HB2/A1DobRpUAsEWURZDTj1HUK0SXp7QvKCgoKCgoKCgoKCgoKHimSHSkcUgpf3I0pcWCSGZqNkn5uhNr2da9JU1l+C5aqSAaUpKInHOInuP2axUczr0/cfgwLSxOAI4sHcT5sfzss6KSknp78UTElLsVk4h4EFU972jBCzau33LjDXCcuVquTSR5KTOrF2Jl50DknHPMjkCQ5LdNZBmGIIBCNWTHgUgNJhVlQKxGmdRjILrg5ert29GfBCkaUZhaWNPssg2KqqtgtSPf8AFguyPMEDFtpDoLq3vq9Lfuu+/wV7920NeTKpWGnDg5OhylZir0oEwHgSTdV1SFIFU1Bxxled4vvfza178BGzaCK1QOCCFj8x0AC7uBLCpHQUFBQUFBQUFBQUFBQcFFRW5+JoduVWVussXYX4NXoggzJ3IvF0ISOWOczH1bpFFWGlKOnXQ7ka4ipwqKvcHwyM8fg68dKQk6GXGiXjN7jBGBXZARjRPe5b7rpGCGkuaFMyWRqg699z2eU79x7x7svsoOEq9ljrLl5skKQEXIC3WDRUYGJPf6B4gBsfzdIUioxbX03jP3lNyQaN3WLXBWgaLaiXwXLm75wzsFK1xJwWpBZ7AbGy8jySqdCuohTs8s/MuXv/XR/7JbdZ1qJQJSAgQas361BmWj9cmiK0Qek2DxJ0NcSyUVkGcMSU9XtLh790vf/U5s34lqUgCOG0pGQwYxZQjS29WJ09od9AoKCgoKCgoKCgoKCgouO0JSmAAGCFBmVvVZdMgmTGTuAJ3FrwyUXTLDO8obkTp9MVroSgSiQHqm8xkAxGMwOHHosUlGFW9zoUBZKE0E526BNOlrBVALoQjHVaXszgz97ptuxObNcJVF07yA5VmByKmTUFdKbS65CSaKwEaCCMR5hNCYuVtUAGb2UIH6qtq4cweqHigItPL7nqMwa77aC9YS8s0ZzcKz2q/e+zAgKhwxBgPMLeCpp77wF3+x4eTxTVJPiOesQ5jjthGRFjBXst2kPC1YGnwtrCUAciyuOlvRqZ77xXe8vXrBPehPKhG7ZmNgtIsV7WRBQUFBQUFBQUFBQUHBpUTS4iRdzqimMp2ZLNk83U1y0M4VkZ0TzBhPScAlJnCw0/Jc3pGQHCyeeuKJvoJVmLQj3cl1kefO2d0y3aPs05zZEwcnAGVyIQVERJhUWVQ98Rx07623otcDVRk1O6onsmde3TojInWOVCk4ZhMrPFS9iqpXMAAN4kaOKYKDf3aiU4w0ISgpExGUvJIyPGFIWL95C9gJiMECpXNKI0f/VKSUBasC+XYN4mCXqEARgXpihvcYDjEz8/2Pf+Kpb3zjgPip2P3M7dsuBsD4f+s1AESJiFU17BQBCMFfNd5RxcEz5hknKux44V23vfXt2LQV5ADOilZQUFBQUFBQUFBQUFBQsCKQtDgWAbIjZaMQLTDZvsxsZzoztHN1ZGaVVyaNFJFACrZiDFpy7iYeZa6grHF6ZvbI0T6RkxBO7QIa0hrJtMjIZsdVAVhoTGWiyi2Q+Ilq3y03Y2ICRETVWKHfmkF6ukAhe09EYMtEFF5hdL1uKVtNrjUW1giIK09EvYn1W7ciUtoU8w937nsOnrdwKgWrCKaXzJnKXH+uw4EuLmJ+fu7rX//af/34DpF1Xpz3eRvX8FM9oAoP9VCL+ioqRGSBFHLtZNh3cQRXDUEzLMenJ1/xrndhzx5MTCkTZWnOUPpUQUFBQUFBQUFBQUFBwYpBrqbJTencMTEZv3aaiHjvkWnaBbxtEgAAIABJREFUIh3Z0I45+di5F7VzeduHCgAUevLk3ImTE0q8RBxJnE87OaqyTFEpU2miiDJwlEQEZRB5EXYMgWcMINPbt2zYt9+CsInWRA4gSEhH0dxFW3TnKkWMCKnMDLFAkgLTwYJc1MTGWKQSnbpJBARSaNTOBgd+IlJRdq5WFZCbmtq0bRvyVOl5iiV7TUp5qL3CnhSsUlhncc4lvTaaDGJgIqoFwyGOnfjnv/qr9UePbFSpoI6IVB1BFWJRN6AEkqCgBCJfSXAKZYKIOsdEZGSoACDUoJqx4HDKuVve/KYNr3oNehOgmOcbbMpnCpm7MborEPr2uOcqvbKgoKCgoKCgoKCgoKDggqNtbxpp6JMWMp5g8SJrZhaxIxaV0tnxjI6Eqjc3xRhvrUKWyda8EonIHMFdFgzNLGSaO/k0zS/0mJ3q8jJ4P7OnbaIromEn03EGqSqYlOn0cLBt/37s2omqwhJxEtckIjMt4j28R/b+fOSeO18hIibm7H1ZfToQAK/kRWpmmppCO1LAEgR26yLp80V41oKCCw8bPb33+Q5PszlD5AeLGA4we/aHf/d3j3/1q7vUT4o4FcqGpjAgBhfvuHEEomwLxkZp7yXcKGjcnVY8TzhBqA7sfeW7fwdbtqGaBJhaqc2odK6CgoKCgoKCgoKCgoKCy448O0LOOLWdEUHkkg+4nZY7dOde3vYz/eqcS6LL9JOig6+FpxQRYzaZOeSNPn3kCC0uuBQpMnJVpI1dnn8e82DU/dbY84nIjocbQWJcRRWgdm6B+Zrrb8DklNFuzrmo64NCobAEO50KXc0Qc/InIq6cmoCx13POgUlilt/4mDHFO5RD6g4B1BEYIO0kRhdl6q2bwropEJSQy3ED1BIWCzrvOr9OQcGKg4zN5WUjYC7ZDmF3iUjhFFhcxHe/8y8f/pttw+F6wQTEGMmkHCeCIzhStqgUCoZF3FBHzABZuNcIJUfkhgpPWhPPVXx8sv+y33oHnncDJqaz0nb6FI9N/0VL7A6VblhQUFBQUFBQUFBQUFBw8RD1iw1Ug+mKxu+bkxySYxyzxFqqEpETCam9TSOpah6Eknv0xjMlTxrhvbckOXLm2NEJVfN2xMWn/Khx1lZRVRU4B6YBcBa056abwE6JFcpr3b0x549VlU0mW9dge9/KIFEjKqExgXBQoQIwboXIQ/NrqqpAF730163Hxk3gnBEfTc+UiEmk42u72gvWHnIGsE3Ei4jycEiLA5w48ZkP/UX/qSe3kk5I7TLVZMiSkwJTIIRQIIKzwBQhVReFML2A2PDKBCJfVQuMo+Kveekv7v21N2F6A9hZ5x5lHUc7V+luBQUFBQUFBQUFBQUFBZcSuYIyBWPsoBOzMTufiMLnmKc7EE3JJLfjKZ1Ozn3l/o7JHK4IgPgTTz7ZF1+FVDZwRCZUzIuXW/yj8ShDzm5qPp+3IjKajMCkBM9uONnbefAgKs4epl0vMYLbKL+7OsEhGmcQM0JVSYTIETnVGjF2XeR0lQgEp6psRIkyECJZ1mr6UgsCykroTa9H1Qc5aKjSSHLmzSsWJDq3otCUBSsa5+n71OQOU4C891wPMT/30N998mf3f+GAYlqkMoEktcer2H8UIAjBorsSCAIl1maHBwoCMXtVzzx0OO1Ud+547Xvfi917UPUBtgiz5+1Eq18GXlBQUFBQUFBQUFBQULDK0Ar2FxQ5rb+mz5FeVNUmKmAil0wy2XHlTt/NaFBRDURfisyWn8MAMKhnjh7pg0jFDj07gzmxludOp4NR5pUAQJjnfd3ftq23dzfEvNnH5pteU0je/qFliBArer1+v48s7iSBmFnRVMVYyoOIGKRMzCwEYbdu61ZsWA9tWl5e+VlzbBxm12Q9F1xpMMG5iKjUlSpqL9/97j9/+MO7vGzwfkKUFM6YfABodn6IiEApACWiJDkFpsjPBAAmcTQDfRLykt98e/+eF2FiEkzQpsN2MKLxLCgoKCgoKCgoKCgoKCi4bBgNCZhzccm+tiNEnOsf89PiCQ1hZcKdPHhlOjOZ1XYphq8xPz9z+Ehf1AUFHxBjSoboa1jCzs6LHu9uweFaISmX+kqWjMUrKblF1fVXX42tW5BpJ1N8zRFKbnwculUKERF4OAYAFe5VygQmsL1vhfiKUgAAUXhSOGImZVKFV3iG2Pv2wXNepzdvxETVMNuNLnX0tbRS6ORcTEHBqoJk/8Ag1EMcO/L5//TB6cef2OSlr74COYqhcsN34j5PCI+rBOV28ydFyOgVOgjXIp5RV/S0o20vvue63/gN9KfhJpQYPBpLIbtUa7wuvaygoKCgoKCgoKCgoKDgUiPxciab6/zVMjkTqcWLtGw5AFQlsXkWnJBIqcnQvaQT4ahyLrl7iwhDFGfOzJ08ORlds/1zfsKO+2XLgTLSXnlxvZIShPis+KuuO4AN6y3eW37O2hYc5WJG8YBq1Z8QR15VYG8LFh2085Y1onMp+zz0fmrTJrBDuyZHE4JHdNM2japzCwpWBcK2jAOGQ8zOPvypT/3s/vuv8rJefI+YIUtForAoB9Rm8PNwE7GLsaqS40HlTpI/u2Xdr/7+e3HNHvT64JC5e+mOVlBQUFBQUFBQUFBQUFBwOZHIQYzz8yOiJKtMKXHsgyXgTuRSh21Mv+akZ/LsTnl1LDGORFRVVYFocXZmceZ0T5UtfYqG9LVjMXq849DNI+foiAopwSsUqoQa6hmLXq+5/jpMVCmRS3rC/FEt+mR85jUSJJGIAKdSu6oCV3AMohrwqqFKCQBqBae0HhQDkzau4qoiDAapQIUxMT0FR1BJdG/8vyJqwVI0TxFhbvmPUxavtKBgxSImuU9RWQF4hdfau8V5fO97X/rgh3bW9XqVnqqDMlI3CONIigCbxicCieWtUvUqIDCckfi1iICESMnNOzrc0xf9xr+f/oUXoz8NrhBDTyKpM4Hzxs0sKCgoKCgoKCgoKCgoKLhkMM4wZaxBw78x2vRlhESFHKk2ibyj17Z9ZmqS5ECkTi7eUWtJ9rOu8+vLcFgzhoMzT5+SxSETahGvqkReo4t39s8w+us5kJ/ZPFAKOgkQQUCqSuwWVet+teeG56EiEIhIrgAv45yi9t6HX0V6E5PUm/AET2zV6BVi6Tu08V/1BMvbnjzrBZY9hzxBmNdt3giK7S5y2zn/mBdmLB25tuu/YA1CFfBExKKuXsTJE/f/5//cP/zUJvGTkCpKI63jxF2O9lhnObtC6m4FU+hfAMjFEBakrlrsuRMkG26/5fZ3/CbWb0A1AdckxhmN4pGVsbs3dTFrpKCgoKCgoKCgoKCgoKCghTyy32iUv45brckhEx1pn+1gJ+9NcvMlIudc0mCmK3vvAVRVZUpMO7OqqgqKUydODuqhAh4YqlaAI6qtQP8/e28ebllV3Yv+xphr79NVC1I0CSCo916TIOZaNIpGuTTRKAjEBGLzPq/C4/ESfX7GazTiu49EE5OQG4x4RYwNcmMXIxixCdheAUVUepSCQgSUaqi+TrP3XnOM98dYc+6x197n1KmqU0VVucd3vvPtvfZac8055phjjjHmaJwSTVBzKbKvjBR0DFYmkQiAiFU1dKMjBUAEQvXF1HXNVrCoUIYCkTElMUwsPuioXwdgqRh7LbhVg+YvWEPZ/gvJ/9HyfAoRRSkD08jEIuGiBAtpqaRQSjcHItGqjrmIRICJiFQsCQCTMiK05NCKMjoxgSKYXTOZS3rCvb2nKgbjfAhD2BcheU12/9s5j6AkEKRDnWlMbn/khn9b/a1v/5pgjIOSZWclhTKTqEaAmUTUeFfVqrHgdOyTV0LUSKiya4BDJ2BbIZPLJs7+40tw1JHgJsBW26p3HVGtt9j/GdcQhjCEIQxhCEMYwhCGMIQhDGG/BvNt3NE93SI2IkLEKY7ZArCz+ySbaYo5AsTMFrhNRFZRJ9s0VZW5ACBSMhdJa1YABVg3b9kwjcmpRomADhAUDPUZ2IjAKaIcgBDYkiGKuUAKAGaoQlUC9TgH5UBKZkgUcNWwqoIQFQgaSSd5ZrPQwcf+Jxx2CAhWXlcRCUVuSlVrSv0Bo+TbtIUQVIQZYO2QylixPZRbWEZUMv6thg4qxIpK9YEJShCBkgikXfBMA2WjoaMFVJAeyOaSuVE3x68u0P4AQf4QDiwQZgY6QAvlxvaqH//7v1w1GjbrKLYIGgGsXW5WGf5tQanAXCMVlvJVkBhOrLzTI8CspSgICLKdsTbg+LNeuexFL8T4UnADoQB4jpTAQxjCEIYwhCEMYQhDGMIQhjCEXYN+L78hLBTMjVWfVhLdkt893m8pHliYOcbYrbMikl0s8xULJHdlG0hVCqDdilvKReU2QZsQurZI39HKzihSlde2e4QAgAScMrqRQhUppaGr6xLBVLVjrpcgiFRumW1BO2B7qc98zrEYawoTiYAUlQeTj0c+cHwnPRAFIlIpq+8F6QTL8uaataUWaHJV3BvJFxVqgaRVCj1mMEEBDgAjAmigFSCNwIsYWoIrs/EstsXKHxN9GT/3+MiHMIRdhQF16KVk5lI6gVsUN2DqZ3d+/9PKD48ei3YHiGgR2HiUQgVa2rEKooIVUpn7kUp5ww5yGGBACAooo1QogwO2Mhb91nErL3oNxifATUs9icqCn3N4VB0drqUhDGEIQxjCEIYwhCEMYQhD2B0Y2igWFuZn9uF0rxKpSHRuj+kOl9zMvDJzCZ1cTscCEVXNGTPkqt/Z6ExUFGg9+evPWHrBW166vLOhUbBIWYCIELUESYpwDDnanIgUkdSVqVG2NJgASCKRBYJHopCtoaqRu3ZLAGZ3VREpRblo0NjBj21tHPOik9AkMFEI5vZnXpMHsJk825IBEJFICQhpOXHEkjNed0b74UOWhakGRSYJIQAIFnUvShRApApGsJj/KtVoIATmZrMMI2t14pCjl4E7ZoLsT3Haj9I8y7NhO/v3LjwuhjCE3QJhZkXJXJJswsyDUxtuP+bY9nFvevGYpZaUsusNLgpRRCBGAIiqqhJVBOaIjsrSSLGtIlIwAyhFNJCAi5ElrTg61TzkqJNOx9OPQXMCaICTu3c6VlFjgDxcMkMYwhCGMIQhDGEIQxjCEIYwhH0damkAvfsaEanGEIKZE0XK7EQYY/QpJpF8JH35E1XLbWg3F6pkDkaUUqupagFat+jQ6SXLJxpxKzRWTkBUIrBViU7dTKneSAGGMkRA6DodiQCx8jjSCABMEAuVFFATMblfUhUNDpGq4IuSNEaPjkct+g+HolCAK+fMFOiO5NOURnfgVMX19j6xuH2CUotW8G+cfkxcv3akfAJxCqQghZQpyFsrfCoDAQSQQLWKulcFojSoCIeOHd4AzYAiSJlmw1jP9ZoH5dCVcgj7A0jFNFEibkNc09r4/eltty4+Yt0IpqECjZW/sRGzOVJK8pNUJSCAg1QFyyACLiBVBgvAlpWWAtGi1Cbp04469mQc/psIB6MYBzdElSnYQUy1YNjYl/Gr4SIawhCGMIQhDGEIQxjCEIYwhF2Hfco6sRc6s6dfkaqh2IsCZimSU+tDcpbkfHuvIVJVVaQMIVissAhSGjQCNISQatj0BPgSUYHOk8XI1jbWEa9hhkhkiqKlqgBCZvOq8k5yRGSV3KnK0qmsqiDJ8eSoslIWUYQoMDNR6Bq8IszjTxSkKEUJjekYJvXQJUtGwWAqwIGUVQm0b5HggkOe8lToSEmVxhoyOdMane6MrWu1Hx2hlmqLVFIBIoYoEQs0KgU0CGwp9ApmVY0K4tES4x2eGG1MQ2aACFVRSb613WJMtW544qh9GMIQ9mUgUmiEbCfdoJMPTG+5g/FQ5K0zPEMiILEVlDioqCoVXbJntUVCqpWN0vibVAkombmIMSqanbIx1SmKJQfjsGMwuhxYpCgsfYWV2dmhG/IQhjCEIQxh74CXeVL69iEMYQhDGMIQhrC/wj6lYe2Fzuy18c6/0AgRWYFZb1wSqYrC+uLd6OYMZYBUo7cyWRUdpKhiIhKRAp2tBbVDmA48E2NHEVWESIishq0SBBAihlBBZF/tNSJCHKpwb5JQKCoV3cKWS1ZVLVU1xsqlE0ARGhZDSRxUpNFolJ2OxEXFyBiKMXChlbdk5b6ZbLq+Wu+BJl/msusEARQKbo5avGrRiLGzPVAZSEWEQJa7E0TEVAAMjlZjh8jol4mBkoSJpjlEBCvHTuTL4ygIlJy6BFDD6rAGzhD2H+h6UpcSmYS1hbgZnYe2bfhRZ3L1aNjEOhNUBCVTVcfLniRSRZXtgquDFjCYGKpW3BuWuSIU1WmSxLLgIoJVm8XIikOOPgWNY6GLLKtCatbYVk+24AOPX+3vMORyQxjCEIYwhCEMYQhDGMIQdhayHpE/HygKRZVl0l3pJj3rHSNnVdcMjiI9B8D5ZhG4Z3tSDqqqadw+QyUqD8r2plhuCTody22qUgQyX0jVmMtzV3kSiVVVNEKUGMzEgVU7qRyEmUxZoaSSHJGsj+BUu5xBUUrrmZQkIqwRVIApNCfQWAQUyiEXO59DjTyQElMmq3MMgaJIIEIoODREJGorUEfRFq0qC1mIPKwqDjMUoWFI0MqcDVYQtK0oQ6GgMv+K7E3QLQJSQb9DJXCAu68O4UABKZiADnQbdP3Mpnvb235a0MZGmGbpSBmN4IWEFCLKTBClrmlSmcj4G6BEUKSaX6h4aIyxaDRUqNPh6XLZ0hW/xUv/I8LBQIPQQF/yhOGq2ZfBGyiHLG4IQziwwR/UDxf7EIYwhCEMYQhD2DvgrSsedlYaybWw95AY0x9EuzNXKge4HKRSOQH1xqxkw126x54NIggh2P2UMh8WceZJ0i2xszVwiyCxhGqK1K6MmgAgEoHo3oEYq1yTpCi1Si+pKqooGCqKnLhScyC6NVGhV1mZoBCAhRtoLAZPAEzmyieUtMdUrzq/fYEm46mFykoLZZtXWNh7hDKItVSlQjnEjuWYRCwRmJQUVFknAagKiFSEmYWElQEQV/koRcpOp9WAAII08QSCVlNDVTf67eUVDKX5IezDYAwuggSIJJPorItbV01vvAPTDxXFdpaOSCQogVREVRlVttfKkg8hQAmaMudWdb+q3yvTJBGJWnwgR1raXP7biw57PsJyoFBqwIyfCIlZD3Xgpx7mNjummbK8J4xe3rfXJm9/t43u7/3fWXDj9Vmwdy4j9lNBabve2wMMLL7H4kz2wrv86hAoAB5mIt4rUAWY7YmWfwWYXnV0B2DhcPirgLchePAz7ovB+s+/yrDneNTOwB6RB35FFnu2oyEZ5uz6wOF7ry/7vwurwOx6s5k7a7DLs5Db77eEegMigKhWosHGXhkrmdliptNDkivkWDy0EisAMYsiZ4T0dlhElCFbSCYDl1HaZVmKRIiIRJGoWpVmsZDrqscKBlS6gjYRCodn/7lbCEfMaFp57KmqiICqIuDMBWhkZHw5eAxaAJzMBOqR1Q/76Rrwvp9V2HUXmWZXJiqaioK4QSjsTq5qAddbs0eEhJmJVRFVo3l+AQBFsOQ77fW1nszRySEM4SkBy0aBRIcxRk3Qe1sJgCAk08AWlI9t23hnnF7d5E0BLahQxYVEVak6z7EHNRXrBjlGklP8pjMVJSIwURFEi1Y50aHDlx/xfCz+j6BFSgUoiCiUa2dKQ3hqoSYNDPzVZ0V5SmB/J5X9vf+7CcMtcr+DvelBWXsRpRw7Q9gTsNcW4xz0M2QIc8Cv+GbxKw7eFjO0Th7w8Cu42H24tx++vzK3BXM+YGtnns/uwiv6XSNNdzZVOfdfxMKsu19V1ZR0pILdcLVVcvu5KfQGxZel5Jo8OZclEbHIdpGpsmyrVecmVDq7vRiIPXVu2W7Ilq7syclmu1RSIRUS2B/AAHfNaqrgqkFiWOdIYpBYjIwsBTVBhcWG2ym3dbq28ROEIPv1GuiOSGMuvW0pJlVVBeAiNJoURpS4YuiUcAeQ2kQSAgtBqOtMS2TB9cTKEEIsIaV5sVZv5K6cbJlGUaUZ1VRZyX7qWVFDGMLeBJ+HQlXN9xu9PFekZGZoCZmBbNbpR1obf1huvzvI2kaYYenEjkDUCFwjEmNEN/uEHb2okiYPdeN1pEpCAWAFE1PBHIQXt+iIxStOKJb+JmgFMG61v3JXEy+WdCyJ9NlfGcKeBYWow3btYLP3Xs7uruT+hjA36H4exLDLm1rd5LRLEsguUNpu78LsXCT4V9Z9MsFTg4H9hbfU1ImnsCc7BTV59SnB9sKrJE8Rq/V74hCGsGvQb6YZgofZ1tfeXfQ7uxvKnF8PTJiVet1UzfPgSlO5kd1ZEXt0NamD/C4ickWwuwe9bLVprcwsV7W5iYggnNzuiEIucAIwc0EKiDIXAFuz5ixiEGMVul2WwoGmmVqBNfs2KkGgzGSJCn2fnKZH+ZWqYKauwU01wrrLgZiUGCSSTb8gooBuU0QEboKaobkYaAKFVfDJTkw1jBwYYPPd/a4KImaOUZkDMQNFszmuCIJCpes7mb1Q+5QliHRD91VVBCIiWoJRJSVFrDml7pDQDyScD2H/gtp5lLEF+0lErBKXoiTuQDZD1pTbH5jadHdDfzESJlFOEyIcAaens2tk9RYVqJCI2nK068aBkNiOILTL0VZc1ljyW+OHrETjcOgEqAm1YmQaQqicNB3LGsI+ArM5t+7yMeYQ9nGorcHarrffTfp+1+F9Cvr97ocwB3hL335nYtg7K2U2VHgvkgMAdnMgBwwehrALMNDAMSSJAwlqdrcDeHLniseiwXdm8FpGtmthN/yI97TaMrC3lKpsk4sxp5TB3/yHkt2p62s5sKnaW2r+PdkMWnlQAlOsM0RKCgaZQZSBGLOXZdcsAKigqn7DWhnFoCRVasnqxawgUUQlAaJKR1mBmPK7JQ8XVVVSJZTKCKNUjAMNUFBwrrHjenDgeCFlAtUqwyZrOkypDMkUgEK0EcK4IkSod0HVlEES5uAFCaSsHMDZ8i0ipVrJ9rJaQs6f1hHKDnwrDmCmM4R9AmY/Lhy4/yU7oAIQ7UBb0CmUT8at921+4vs68xCV60PocCBmZk4HVopQMaiqJSVkVqZW4UuRs+8aJ4xRAVYKipFSl8Vw5JIVp2D8N0HLlJpQtvMbpkKVmIvexXXg8Kv9CwhM4FqKgMF3DtrmhxxvblBV54G8L8JAWdkrS/58blene8/5JA7gGwtKkwccX9qRw4mddM8y6j2Hjf3b00QtssfBQNVrL/ZoJ2DhO2biwaATjhoP8ceoCwB73YnR88bdHIi3dM8H+rfsHh+OIexXUFM21amfQ5gbdn/R1+ScBYUqZNaKMucEgoMmd669dT81btYtld1IvB2MYgEHOJe1dLehMslVICKlvU7EAhDZEqaZ8UpE7H51cYSVA1CvUKYusrvW/5SeUpkRQrAq3kZORVGwdDZDZyBtmLXLbIgpTVvN24gop8NEhKb6OXlLQ28PFCkToioi8u5e+VESUYwiYEWTigkaWQQqUkQ57dFpeKrA77g2MbOcVDOowaGpYaQUBgVnVK4Mwfk8Kgd39y8QEZFYQiMQUX8FMIuK3g8H0hQMYX+BzARyhl24HByKklAStYBN0npk+4Y7MPNgoRtGm22ULYbmp5KLdy8fS+dXqpSdHlSzH6WKSFGwUlDhtozNyGHjy55bLDsO4QhgjKiovMuVfYeHK2UfgTy/O2uFHMrQc8O+r2ZQqg+ItOH6I9nanf1a9L6whGt92B2E70fS/xD2HcgVNvOVfiraB/lAvzi9YC2ja7AbqG5hf+CN84eFVQ1qtw00oPRv2bsZCDmEfQoOmKWx70OfH9KCt981J8zylh0cLezvbLPHYpOuDBzFTmWN3OU+LGCbJj/3etFRut5zp9kSkUpE5JSMSe/u2YtzEHdm/l4sz351eW+1/0y6HZhikhCIWCnFeoPJ3p3SHlZ+ApSslgK18tp2W/VuJsnfyGr1qDKUK+OaEsScklRUlUCEEWCs0ViKMAol5iLbpa3AThrhgZBHqT9VsBd6qnki8/UKaEyEYpxoRJODpaoKVcXUiUiZIlQFEiEETRPRXSokIiWorB3JEFmDlLQXBhiikLoys6c53RCGMAdUPI4zE7IrIloShLSNcjNaj01vvqe19d5mWBdom3ZmiGF1wgKISEPIOTJcqLgoRO1wxfLn5vM+OxGC8R/hUkfbcXmx5LmLDj0FYQUwCmooQFyAQtb/7QN1UzfsrzzqwIPeBM/VPBsh2SEOANWougej8/Y1E9gBAN7Zx1/0go6tRxExj7BMCTUxCM6QVzNZ1hb4HK9eEKj6Iwqt0e1Ot5SVBL9997dZWxc12A/sm7M6nPgRsU9J5MCu7wk/SkaPc+c+vRckCo+qMSW819zn/nWRc+RrN6Qr5mzLe4Jg5nCT9a9bGElVu3/VeFWQ1DARIR0QoDfQR2Cw48A+BnlOkRDouUT/f/9Ufzu1r1mD6J+mfoNv5saewHb43iHsm2AzFWN0zjTz/T+EfpiVBzp+tcf70J0drclO7ie/7Xaf2t/nd7b+ZwFkMLcXfapStu8Cqn25m/x4Tl8WYzQiky5EQBqhoB4/Oa2si8lUqIRkb0wNUle2jDFmr4L8wSLKmXUqoAWyzQBq5W6oW1fajRbZz8j8MNWivMnfk52UkgTPddOydasKpWQGFe3YLEaWIYyIhlwVR1W5p7rO/kHWfpL8da8a+TvzDZTi+WFOqRRQjDVHFikaUb2BpvI/RZ8jpKenNM0SO9MQr5Pvijy3vyB/CAcY1FTrytBAQgTINLAdsr698Z721vsa+osmNje4oxCNwlp5FpP6Q46K6w16UfezsVclFoSOjHRkeWwcvWzFSRh/JmgZ0BSt6kzV0gbnV2C4ZPYW6OyANAuDzjAlBSL0qJqDJYwF6id6qaK/t/17xN6BubFXu1Ibwt7sZ63Pedfz25+/6A5+6745tQ+qPe632IdCAAAgAElEQVRRtRvyAW+NHen8oiBrqPOzPAfasXsJbdXJBtlcW5Zl/w3pK9U60N+x3YFay/0dmPvZ2ShzHu1k42Nlf/Fz6P77DwsGaRfadQTORiez4WGO/wOh1wzkF01PUnyk1PWaVodnqgtIJ3MhYpZB1Ea6AKnuNM2bc5P0XiFIxx4+46S/J3csX9yt/uwBqGUK06Qodjodu0Gdl2gN5one3Kw3fSJRS4zRKCprpxmlxqZ0Tga4C/Tf/38PkuuuwoKMCzvaX/LAaxd3Hye+D5ScsPIS6LcD+KdqLczW/wWB2fC2C+14HGJHdDXbuHZrvI5f+Qel9+uCQL9chD72mN4+FyuuzfjCdnJXYJaX91NprZ/GtWr35+OWCgNun93NkfqZ3eHNu7Dv9B8dqWr/aZwtamYOIVTzTkQUiNiL3MbbiYiJU0Hm7uM1ldmQ5s8ziKgQ2Q5tKSJQPa6qTCRVWxShQSnPn7LFNAoEBIBApFKlUUwG82ydrHZzJYWoVhHipIZnZlJllVBqc7y5FFQwsaqCzLO0R23YB/f4DBmbcKoR0uz6CfOj6GHWVTukKsRExCqBlIExpRFCUCVSBgkrmMhs8rZeyF4EMFcSsTUVoIHAJOAIRECYGlXSvS5xW1dtgfVsHrN1dQhD8KDz09JnhV7LYK0pu6JQAgmUSNm4h8yQziA+Gbc9ML3xRzr9kxHawpjSGKta91R5dhMhpB2cFIAyCAqpyo3lXcfOe0hViAAKUAaKKBMtHDlx0Mqw7DfAh0BHrH6YsTrmHjdJO1xJn8Vtevu0+8x+DYlgpIZkVVWNaUK7h15VbSUR5G2VYYId+wOx3QN1ylWm6hijhTn4/SLfn68QqsPIPcp2E3K6+nPqZxa2lMBQmC2+khDInhUiUrDSLGUo90Aa71qbeW8Fqpw4OWVKPiGIUYuiMrVs2bJtw4YNa9euXbt27bp167Zu3To5OdnpdDqdDhGNjo4uXbr04IMPPuKIIw477LAjjjhi2bJlRVFkgdIkKhM9/QGvl+QyGpGUc61ZURUQtQqGSLTBzL0ZPa3ulgBZjjLCFvd5B4hS1Sz2W09iyikOYRDbjKqACARKhhgissQ9DAKUiEFMqkogaMWrZ+PSlocJ1rbWV1IWfA09mJ9QMUAOURgawUk7MvQRVJXUxNjoX5oNkXkBosKMqkoWmk2QGtSruXFuHq8EqmpKJixFq7UGzIq3+Yx94CO+qSzLedVitv/94H/NdSxhwmRKN6ZVInwCKpdkVFMZLcwLgCoT5WOAbg/zehnY+fkhwrQMIkBtxfnHE279iIhIoPm+HbzRK3qZcDNarP0oylSWZRV0HKoX9ftfD4RdYYZdCb36thCc1oySPacslBwjytK4GQMgRdnpbNiwYc2aNY8//su1a9euXb9m8+bNU1PbjZM0Go2JsUWLFy8eHR876KCDDj300KOPPnrFihXLli0zrTXzxloPjXaMkOyKMVJ/m0/QkXdMw3btqGnX/vsWPBprM9jP23cP+bWHu62gr1cL9X8gDPyJ0oFE/tVXq/CzOUeb5EzSRgN9a7/7eXp6ev369b/85S+feOKJX/ziF08++aRtyu12uyiKRYsWrVix4vDDDz/22GOPPvroww8/fGRkhJxFbLbR7RTMRg/zhGpnrL7AdknKK3bgG/06rtiT++wFCcAVm3C39LfsjSTugSwI9Q2tK0uYHIhBQulsYMYGADFGk5EyD0k7exCRrVu3rl279vHHH//FL36xbt26LVu2bNu2bWZmJsbYaDQmJiYOOuigI4444phjjjn66KMPO+ywZrOZuajRYb/It/vzXolzcPt1hRIThigbrbJEYb5+pURmFnT3Nd/DnJYx47ArB0KzC2X+yUuJ+cP8mQzTbDM7XySY2GMihlbekdaaElHZ7kxNTa1/cu26det+8fgTTz755KYtm2dmZqYnp2zg4+Pj4+PjT3va0xojzbGxsSMOP/Too48++KBDJhYtigkVthGo6d6cbPdQmDFTe5iJqsWVdw2vShDVInBbQonYnZtemhBmhviGQGSbGCR9rcTcOn8H0qIiQug9obascESkKIDxxsgy0IhyIIsjF2EuUmrzfV299xjzHHk2+dKDIdBMMJUhWUsiJmLwGDcWIYxLGYgJoTchaJcvoXaFQKqVu1mn04J2QJVcT1Rg9m0mdWlY3HYI84WFJZVsDuihcxAgzLC8ENAW6wxoK6Z/Nrnxns7UAw1ZF2i7SoeSJpMhRjCRpdPtlbQqPSqPwnRbe7WCBM1OHJmRZcWy35h42vMQDgUWqRbElkV4IeWkIcwHVHXVqlVXXnmlSQOUTvBCCCFQZWCmwMxjYyO/9mu/dvbZr1iyZAkA1chcIGVUiTFCI3OI0Xa37r7Uq37vOhv0j2s6UF29evU//dM/rVmzxjxEiKgoCksLLSJFUdjh4ZZNm5/z3OPf/e53cwg7eM1ugPVw06bNH/jAB9avXw+g3W6LCDRm3DIVVTJsaLs902q1tm7desopp/zpn/5pCMFsErM1vlD9zGicrU2qAk8QQijLMhsrVfXhhx++4447brnlljvuuOPnP//5pk2bpqen7eY5oNFoHHzwwcccc8zKlStPPPHE5z//+cccc0x+C9LxdVEUmVryCXDe8b1bkF257bbbvvD5fy3L0lyEMpmJSNRueKPRxtT2yfPOO++CV59flqWqFEWhVQGvATTZL8f7i7XwOlH5wQ9+cNttt7fb7bIsc09ybK+ImNjKzEVRhAZfcMEFzzz2GWramBNp+qdm3bp1n/v8v7Tbbcud7z2n7Kt5SBlyWq3pww8//A1veMP4+PgOaUBVH3jggc9+9rOGPY1iqluj0QhUFEVRSkdEWtMzzPy7Lzvz1FNPjTGCqtlRjTCTrBkxu7TTgyskJR07ouHvfe971113napaRDNzwcymzKTNq8ofT0Tt9szznve8V7/61XMP02D79u0f/ehHt27dSkQ1j1fvN5F9NPKOCSdwMhdZCRlk4O5+JrKxG/P0h+tRlWKMZSnt9kyMUaS88MILn/Oc59pCoGSvz9zYq2cZe/OsVTo3s73vvvuuvfbaCsNuy2ZmCmwrcWRkxMwinU7nWc961rnnnhuS8pwpcKC6+81vfOPmm28250GjzGwv4yJUW0anPPnkk8965dn2dls1ppyb1dJrnvktO8UGVfX73//+t771LWtTY3VmZnQuUI2Vz6OhtCzLc88994QTTtgh9vrBy0JE1G63m80mgM2bN//kJz+54447fviD2+67775f/vKXW7ZsabdLhWqffzEBdmxsX8fGxpYtW3bsscf+xm/8xoknnrhy5cpnP/vZNilIzMeCuphZBMycAwnzdmmReXadmdevX3/ttddu3ry50WjkDnvDWf6f96xsILOWbabMedzzH+tVURQTExMTExOLFi067LDDjjzyyKOPPvqQQw4ZGRnJ7GuOqkfzwbmfmk2bNn3oQx+amZlR7c6mH0gIgUJ3IXu+rQ7y2/NgcydrKmcmy9qV2j0icuSRR55//vnj4+N+1F4cymF54tyK89zlgdhXs056DNj/tWvX3XHHHd/5zrduv/321atXr1+/fnp6em5tlJnHx8fNUnncccc997nPPeWUU44++mi/tPtR3Q9r1679l3/5F9t/MwF4/FBKvec5Rs7qkN27bLB5r4TUnNC1fzieyPPppvEuImKQTbpBjJGZW63W6WeeccbpZ9TGtWXLln++9n9NTU3ZQPrfK+5tMzMzixYtetvb3jY+Pq7VkaiZ1SpZQtNBJhw/R5KTc/5B7UldVY0JKaug78Pq1T/7/ve/f8st373zzjtN4mq323PPbwhhYmLiyCOP/M3f/M0TTjjhxBNPfO5zn7tkyZJ+OXynWFwN8hzZ5NpR5eTk5Oc///lHHnkkxihl2UlzbeSRpbKtW7e+6EUvuvD/vMgGEsuY0ylmnOR1MXDFeQzPtjts2bLls5/97NatW0XEdiL/ayY5I4/YKVeuXHnOeeeGXdIRbPbzEDqdzsjIyNTU1MMPP/zzn//szjvv/O53/vfPf/7z9U+ubbVanXYUEbPMktkXrRFQCEEJZVkWHJYvX/70pz/9uOOOe+Z/eNZJJ530W7/1WytWrMijiLGjqkVR5W+szamq2umm9AZtMHOhaKuWIUBElFGZO+0EvbIvp33M8rVx1xBJRACpasjWSco/gRDUNH1Au7a1qqiEqAIUowoF5bHQXAxuQAOILeWiqhrH29ndd2+C79uu9dOesNJDojEdehChAWo2RpYwjysCcwHtkFQH2r1+Z+jKhwQikmheYBFUqrQhEWyxsQyNvYkhnA+IRY47f+Z9Fu1DOJCgxq3y/7w7Ri1NOQEUGpkj4hSmfzGz6c7W5ruK8omRxhRiJwBMQUQUavcLKhsKM0E0inKVGQwpHyVgRkxWJlJRZSghqioaJS0PY89YtuJkjDwTWAwE4mAuTvNYGvv6scq+D5kwTLZg5kcfffSqq67K7mD5P5wckOGSSy658sp/TKKVECAxwr6qCRMgUuKQRVSzgyfVfde4X+WlQkSpiFwl2r7tbW/70pe+1N/P2kBCCOs3PHnppZdSr3C/S52pQ62pj3/845dddhn6XlTTgqq+EQKHL3/5q8cf99wzzzyzOlcbpPzvaciyYFlWRQbLslTVRqPR6XRWrVr1hS984frrr3/ggQdmZmayEGnRKI1GI48re3lkfcOoxRwtv/e97wGYmJj47d/+7XPOOeess8561rOe1elUkpYRobVZM0dmjEm3Tpfec889//D+K6yfc43N5AHig5528AV/9IdQNVkoaU0DkNyPeSJSZZFK/fBiHxeNz3/huiuu+B81bb+/V5kPH3fccc98xjOR+jBQYVBVAj3xxBPvete7Jicn/XW4tVkTQJ/3vOddcMEF4+PjteXs78lzfc8997znPe+BJQTs7Wz3KVUAV3/kqo9+9KPnnvvKTieKRE4AgqpoOglWQCPIAnyo8lwGWXXSwXJ/Hs53v/vdv//7v+9BHRNE1VxQqRuNZPe/8pWvvOCCC+YwdmRot9tXXnnlww8/7NXa2W6e+9f5QK0F/7X/p9NOO+M5z3mOiJ2vaOqhlXA0yt+xS0j/TzU2DkeNxvZvu+22v/3bv1WCuUrUOhZCMLWtsqGAXvg7LzrrrLOKovBn+LXO5K//61P/fM0118BRWq+CA1PKmPnyyy9/y1ve0mq17J6yLM026unWr5GdYN2iBNxyyy3vfve7jYSyw0dtg/P/ly1btnLlysQZ5sOEOSFVRcoQGq1WK4RGq9X52tdu/NznPvPtb3977dq12eJgL7XwPCB4g4W5xhj3y4Y/c06/5ZZbPvKRj4yMjDz72c8+8cQTX/7yl5944omHHXaYmQhV1U4LRISoYrzdOEF3oEJEa9as+fCHP/yzn/0M6cgnU8WOUbrzwMzLly8/5phjXvjCF774xS8+6aSTDjrooEaj4Wd2Z9v0UzM1NfU//+f/fOKJJ/KmgzlX3N4BG9epp5563nnnmYlf3dlSHnXlDAWgN3ogy2aazHkhhBjtitgsr1mz9oYb/u266667/fbbN27cmJ6t4kO9nSufZ2iKWhCRmZmZRx555KGHHrrxxhtVdWJi4uSTTz7//PPPOuusww47zIJhAPs/qzL+6KOPvvOd75yampoPX92b0OUStoOoggmqUeX000+nXoPOY4899qf/7W2tVgvzWAVEtHjx4osvvnhsbJwqf3KTbIt8g31IBG4mOVQBHNVPWh31qZmQUBRFir+pzgMeeOCBf/3Xf/3Sl7507733Tk1N5Wft9J16mXBe5vlQbXJy8oEHHrj//vs/97nPMfNRRx115pln/tEf/dELXvCCoij8s7lL6OPnGDTpmiyn9bXGJNBOLP/pYx+99dZbVdW0xYFTA+BTn/rU5s2b/+zP/mxmZsa2G0nO3daaEiwxcd63iCy0o+pQz+5G1dGOd6eZnJy8/PLL/b6P3imuMYoXvehFZ770dxctWrQzTKmrm9j3drvdaIw8+OCDn/zkJ6+//vqHH34YADPnRB8hBBAoMIlkbp/XOwUmk6uZN2zauGHTxh/d8WMVGR0ZPeqoo04++eQTTnze6aefvmLFiomJCQU6nU5lmjfPVCKzpzNIpOTsfOzmsQCV0I5UE4lEx4aFblhP1slFhZIRVUGqyt6qWr3A/kQIcJ5K+ddKkiRiKqKQ8hiaiyENVFV1uvOya7vCXoPa2tvldtIWyACYColCRNAAHkMYFxRl1EBV+RyqPMIS0hmxovVqPRKR5S4lxFhOIbZR2JZAmhgNnGfB7vd/CEPYZfAbT20Tsm2MiU3/IaigA9mO+GS5/aGpTfcW5WPNsB1xCtWBR6xcIFPwhTHTspRAYHbv6koGsDhQ21HsUeaxGZlo6WEHPe23eemzEVYAI0Ah0tPIEPYoZDznXSB7WNQUhn5xk4g++clPnn/+H5x00klFgwMXsfQyN2fxSEXIF3pbCMtyTcJg5uuvv/4rX/lKTclEn5RJRDHGpUuXmvRDu310PFuvROLMzMwnPvGJ7P3k3ZazOGX9ybEt5sH04Q9/+IwzzvBI23Mrwit42fzHvQluYozNZnP16tXXXHPN9ddf/9Of/tTsgERg7uo/lQDjDrotvrsmEWbVyChtenr6lltuufnmm9/97ne/7GUvu+iii84444z89uxNmb1+cgu5tybiL126dOnSpRs3bvQj8jRQ3UwAIFHGxsZsAqqT33ljOKu+fqXUbqhR3UDJPgv3Y2NjeS767+xOk1ZOKNlJBL2E5FVZIirLcmxsLJuPa45RuQ+U/B1sUXRiCQCEbATsWVMAgG3btl1yySWHHbLi+c8/qSUxs46kgZDZIglEgbXymUwGXJpr+ef5MstUURTMXJalucD4eTRTWjZ8L1++HDuaRBtFs9mcmJjQZAOCCx/r5xXaF20wR7f7P8OtcXtdjSllGrZpGhkZyQ9mk4SxgdRJ5Inuf2Nuv78P6OXheU6791teleRflhdpXqd5McayfMYxx/quYhCFG2RHpNnQpZUKQ6r6Z3/2Z8uWLXv961/farU4BTLnRBC+t3ks81+2IrJ48eKRkZFo5UO1h0VkhNswzY/Y3B4Hdns2cByeRGRqauqf//nTH/nIR+6+++5kYq7bl/PsG5Lthszu/OrzC7/T6dxzzz133nnn1VdffcQRR5x11lmvfvWrTz755KIozMDNzGUZG42G90IyTBZFYVM5MjKydOlSW2W2DcEth/zq2ilL7YpnLJmn5c+ccl/aUxs3bty4ceMPf/jDK6644vDDDz/++OPPOuusV7ziFUcddZRZJWzhz3NOa1NDRKOjo0hiDBypeATmefce0/0zWLuY+UD+0N/PHlaZfOIMRZ6W1BkK86bJLkog86X8oUalQLVt/eAHP7jqqqtvuOGGDRvW54GnUddFfT/k2iQa6ozZttvtb37zm9/4xjcOOeSQV73qVRdddPHxxx9HgzIAeJiYmFiyZImdLvit2fbufhbksZFnxPu1eXLqn5HZ8J9nNhNA9RaCqnIgAAItO53FixezU2Hyu6zDtSwKuSl16Q5FZHS0GUJjhwRb2yBUOVetqMbOHEu1LU9EAGIOZVnedNNNH/zgB7/5zW/OzMz4MeZnkUjCO2BmIvQ7wsjIiC3Gxx577Oqrr/7IRz6ycuXKCy+88Pzzz7dAKKDOEucYhV/j+Ur2Nc6dsbhyOD5fb5TJtvJ3vOMdS5YsueSSS/IBlSZ/AlUVlcrJDJUneNVsso31LO0kbJDDEhEtWbIkGwH9RumXrUFZliYk7AIvsm6UZafRaNx+++1/93d/d9NNN01PT1ufs96RV2Xutid+8wzIC0eVbIgiwsSdTmf16tUPP/zw//rnT/76r//68ccff/7555966qmHHnqoeS8TAgUWETCZL5EdICt1p9gsgSxlhwMZOeaEaqoghWVzq2rmkEaI5NSUANUUOVJLIKkWDMCkrERKhKoGtbN7AkgqIgEFwjiKiWw4Q2WS3oM1AfdBUNWc2YECgxtAk0aXc2ORIrhlnxliVz0EIKIkBCU7/OcAYg0UVTpA26WKB3pWMud9ovbTrpH+EIawy1DbJsmpRlBV7WhskUyj3IzJB7ev/5HMPNTA+oLaUFVFhAqh1LRtE6WlIUQAW0o1JVaX8cB8BFRJBBGAEiI1OjLSloMbS/9z46ATEA6Fjqhmg9HQNXLvQd6//Qf7SRJkmaz24NTU1Af+8R/LTqfsSFkm14AYCbC9zvY34sIiHFFdr5rf1Q4bqVVumxY5u2nTpssuuyxrwk5L1P7/BIyOjpqsk0e9sGAi1Fe/+tWf/OQncLpB9oXJAm63XoFCLdQD+Pb//s79P/2JqOQDzz29R1Ovwp87af1ZtWrV61//+uOPP/4973nPvffea06OZAdymqt4a47tiglsgD7sOt9clqWZLw1XjUaj1Wpdd911v/d7v3fOOef8+Md3htCwR4iC+cx5/UqT9u6HYM44fhQGdkPCoZj/Alum1O7w+znPrLWnrf0sUNpXo3/nx6Re29ReqHUbTkoe+EZNZotkGu4qTl4z8S/KJp7Z7vTaqc1XWZZWE5NQOZuo08cqoRaIgvVPbvjjN7/pZ48+FsCImgRQAohBUIIywFAlZiirkoKB4KRg9H7uGYKpUmVZttslUYCoZRdlkAqpUOXlrZVz3JLFE/Z5jpWStZFs+8umkxyT6GendmWeApvvQLbd24esRGWsZraQV0F+l225oSBAqIoThzcQZEvEwPmtdV6dISl/9rwoP2VthhAEKlBjUOZoo0n9W7ZsWQ0bA5FTo/x8sWchiCJV5+nE8s1vfvNNN9000qisOVUKtsD9kbnznQ6LyiQI1KxXUkaNolEgmvmSrVzDht9Hdpbx5smNMV5zzTXPf/7z3/zmP7nnnruyPQK9lpfaKzyW4DiY56WeB5oLlTlCnn766S95yUuuuOKKNWvWAWxOdplHZXsN9wYRG4vIFtKMgczJ7Y35J0nR3Hn5aArRzZ8zAi2uX1wB8czlmHnt2rU33njjn/zJn6xcufKSSy656667iMgMZDuLdo9A64n3/RcHsTfO1E/BwOnOrI/S4VCNktFH55kG/IRaghS/DHNv1VmRusf/jjmbT1l+3C5++9vfftnLXvY7v/PCa675+MaNT1IqwyBdq2gZYwfJ0OmNPn6Xz7NjCaMNP0VRNBqNDRs2fOhDH3rBC07+/d///e985zsAZ1KpEaoRWFEUtoj8dGcJJ1PIQLDOeMyLkzzngHxDfsqHjWfSlTLa7hBj1CgEWjyxqH/GJfneSq/1tvY5z6DlP5qTJOv7XW2mqnmRbqk9Y+xf/vKXTz311LPOevlXv/pVb53sx2TGeb7iSUuSbNbpdOxOEzlCCD/84Q8vvvji5z3veZdffrnFPnt6nhsyE/P8xFsn7dU+zzj61oimg0ZD7Jvf/ObPf+Ffm81md41INdhAlbAXiBkpMQIqU5cSoopmkcZi+NBdU5T8iHOSIr99iDsmJHcQG2N0rBkD056qxiwlqpoYSQBWrVr1yle+8iUvecmXv/zl6elpJHo2ubfCcOpCNpQjHxaGfMygqY/V9mTbmc0pU/HEmnVf+/eb3vSmN73q3PM+dOUHH7j/PpEySsd840ghpS0rMVE9T41JU8yBshudphIrRJBusG9lFEuGRbtUPya121BZMx2D6NumtVvakBQclRujy1EsAQdC8KtiAL73PchrbJdb8BtwFR6kEBFwAzTRaCyNGqJCq7oclI+pUfljK0BFr+sZACAyq5RTKGeA0kR3e2FejQOlqKFpcghPCdS2n0SfohqJBNImbhFtR+fxyQ13dbbdH2RtwdPSmQFAYIkVC5LkvYLq+A7o3dXU+YkDEE32BShoRDA+XS7TxtHLDjsBo8cCi4BRooZUhzjz2iCHsCDghS1yJ5/zmQJVveFLX/nhD39o3gHSm7mS+qrQLojp2duGsh7y8Y9//N5770Uva+0fQv7VHqd51xLZqb5lCfJjH/sYnISUDQrZ1pBFEJOhc7c3bdr06U9/Gr3eiHsU8lblJRhm3rZt21vf+taTTjrpmmuumZyctHmsyXZ1iTM1WMMJnARmjXPKhlbJoCE0m81Go3HDDTe8+MUvvvTSS507BrI0nG00mf/YKyyNWsanOh3PIIn1FWvKQrCPf5w/rvKEZlxZg81mYcvBDxx9FiV/g/eg3OHb+w1DZt/Mvpya/EG8LSMrwLWJy185ZcXq77YfuLtId911z9vf/vZOJ9oprOm6lMKQK2JwLm/zRK8fWrYI2Jx6W4khPKZYOXP/2an28zx6Usk/aa9Kr3Oqyt46k9X+GGO73bZum2ZoX6X3iIKcP4j1Jyu9TAWUM2kRkT820D47S1at8xW7P+c9yFaA3EjVbFWVq1qbVeJUUfMkKsuy1WrloVmCl3nOYFb1d0gAds/27dsvueSSRx55xDw0NbucoAdLOzXR2aFGksUtZ8oz7Jnqbqpjq9XKCn+73Z57pDWmkWlm9erVZ599zhvecOGqVavy6GZ7ahdAe60PZhsSkdtuu+1P//S/veAFL/zsZz/rXXWcOiPqjCyU9HYDb0BXZ8HvMfQ402TmMNILSLZO6rW4ZQEjv9p6vnHjxquuuuqUU0554xvfuHr1arNz7SaKch88unLPvb01/9S/lj1nyMPvx4k/jTMC8xcz5j03g9sN8+qosRRPJ7mREMLdd9999tlnn3HGaTfeeGOn03Xh92OpLXPptT3lV2eOkRlsl3UDRVE0m80Y4xe/+MUzzzzzggsuuP/++7PVOzdi9zcajbwh1tDijcIeDFGZWWXi8cwWs28fHpOeGfqp8VuGLfD8xoJDLaN+RmPGhp/QLgPsdgxIp1DzAXX7S2LTJXFlymdmi8q/5ZZbzjzzpWefffatt96a7A/1FjwG/FZSQ5oX6qR3syAiM92Gu24AACAASURBVEM//PDDb3/720844YRrrrnGz/5ANpV/zSKW9TyDOjmt0Wj4EPI5wHpexvKiiy668847rV4TgKIoOGWMQd+2BaS8MTXnm6x9di1s3TWY11o2XJoLuW27+Yb2TGsgBgZCpltVjVHe9773nXTS8//t327IK3HwltUbDJEF0XzF82dyx1oxRlFh5qjVqdX2yekf//jH//2///fXvvb/+MRHP1GWJVQrDpwOmzPe8hhFhDWWdnZcMINhsfQV7hhKHJPAb5Z2STZHImIoQx2lZXxUedqAyhNTq6xfABAVSkxkJBsURWgsQjEOLfxE+g+DaXGwyXhvg0doBj+L2NGWn/3ewWQur0wMMKgBHeXGshAmFAURRWiEIpDl2VMFc+UIVO1VpJoqLQohUieWLUgLdhDcFYZqTg1kWe3nXvxDGEINvPy3+61Rj5oqREkjVVFE4hKyDeWamU33T2/6cYiPNWg6lm0AKIEorEAJVghVJYeJSErhboU8gnLK2NqNMUk/slIh2uzI0jI8ffEhJ/H4M0EHi4yA2I5g87h/dTy7n1rwjNR2Psz7BBVAq9P+u8v/R2u63WlVZ7PErJVXk01ojhmsbdE8h4fa3OCk2FI1rl279v3vfz/1mhhmGywlmxTQTZyy4JSmqvfee+/NN9+cBYIs10aV7LnphUX4A3Cmz33+X7Zs2aKqVWkdJ1/K7h3Xzdbh/MFeEUL4zGc+s3Llyg984AN2Apy3YK8VzNZUFir6VQvqzYrl3xtTlF+r1Xrf+973kpe85Fvf+lajEWLsssHaNpqxYfUrvTCTceuRnLuTtfEkQc5q9egbJuVRmFxbFJyydFHKIdWVCL1M7MVEA1MS5jM1ALxHpJnm7UN6tZgInkfUr9ppr+JtEFNqs+6MVH4AUFUfnQOnkSrwr1+4/tL/9//jRpFNPNGcDvJ7lbuBO0pUCbn5b9bxateeEs13wMaiqkwaGKVEE+csL4/oDkzMXuivUQhm4QD+kZoeS33m5qxE+Q/sYnLhziRMI6J0UGFgmhLARCEzT/vscWV3otedJyMnt5k7mb96W1vt69TUlDgfHE75GQsO5u5hilalggK+6MQOcR57nTTnulk0hPDwww9ffMn/tX37dsrWf5D2Ee08wYi3W7iJyeoV+dqvcFyreqr3GGzWxp3hL8lo9PWvf/3000+/8cYbs95b07D6V+UcMAfeMie0pZd0bHr88Udf97rXXXXVVdwb5epfnck+y4Seu8J5XObbePYYZ9+sJ0h/pbbTSXIINfYVQmi325/85CdPPPHEv/iLv5iZaSfdvob8WefC2o9zlmirrZfaMGu/+onLo0BaTR4DtZHau2r8oep9b93t/Kv0ug35p9T59k5NTb3jHe845ZRTvvzlL4mz+9dEgn7iyg1ms3Wm8NwfnwKvLMsYO1nesEQBn//851/0ohf91V/9VVkK0D2F6idmj2HPmvpJkdIpFLmN0h9DwnHpuaEf257UB9zGpKgbcLNFqf9+TfY4zxD6TRM1qC38/KFi+lTEsupDCI2NGzdeeOGFp5122je/+fUdjrr/vdLrnKsuSXemZze/le3YLIkPPfTQG9/4xt/7vd+77777mNlW5UBRU3oPOfr3QU4h57PNSP+HiooUmzduuuiiizZu3GgXO7E0aVlcscTukky8nUG+vLr/NBCHeezehm7W+XyYVwlRc0xABSyCGKP5fW/evPk1r/kjnyg8DbDnmWr4kpJ4VHkFU+04ELlw+LyJMxdEwU4CQEHQjVXvdDoailaUX/5yzV/+5V9+9lOf1jJaSJaFnOXIs5rMwyngsRZ/AThDpF2cjRpTcyAr500UQnfN+5/8eFTBzFFJtBGai0EjoAIAIVC6m3rttfsgzNa3fmY3dzsV4yMmdA/xoAGNpaPjBwuNRy2i9LsndCnJXcm/S4MJ2oHkEO+6v8BA9u336R0hYAi/0sC9Xle7D5nXJ9qz8DFFOQOdQnyyvem+ret/xJ3HRout0GmGUiJ+4zMqpGqKfdcdo1olVQyFqKqZ9d17CRpEmq1yfKqzfHz58WOH/Gc0VihGiZs5E0IS0Xac9msIuw9Zzsh70/yjq9Jt/NWv/vunPvWpnNlaXEK33NQCcjxVNRnItvPR0dErrrji8ccfR93+Ple3LQGZP7FfkL4h7fIhhGuvvXZycpJS8Cy8AJB8nTx+4A2UwEMPPviZz3yGiHKEWm7fi6ELBZ4GmLnVal100UWvec1rHnnkkVon8/3zlMtrilxtjnJiPu4NnSuKoiiKu++++6Uvfek73vHnrVYr5ybzwnF+NoSwffv2bdu2zaGgamWsrL42Gg0kwX2nNAFyYlt+e/7ADG9wrCkJNcuRtTC3lwFl64YqmDLGKDkvZNFWUySXZCe4BJlm8hQkbNQjf+foSR6Rx8n73//+f3z/lWOjEzEmry4tu3jr5QDzVzW7Bn2Xv4ySQdYcBERERSxYaG7DBHonMQ9hngq2v9IPWSXLZFz7AGcipF4zojc1qqsV7skDzsTp7Qt+KjNW/avRyxLF+XBlPBie2zMtu6m7rqVrlNTkxmhXqNftbm6Yg6hqaM8oajabN91007ve9a6at8vu8+eo0ul0PL7IWaA8+629a45XkzM+MtMnPnHN7//+7z/22GOmRnKvb2xt1F1s9zbYf9H/2v/V8JYjB+2lq1evziRXMzR4mje+Kql4S6Yfj5ZsccgGAnKmtNq+MLDPHrybkl0R5wc6PT192WWXveY1r9m6dWsIwcTCeTKN+fABuOXvF1etS77ncAuQetOM+GZ9C3Crsnazdo9eevDmWXGtHQDNZvPee+899dRT//Zv/zYH/HqKzX2wC9RrE9Q+ASwLKvlF0VVJMguD/8mOT7Zt2/aud73rnHPOWb364ZqlVdNhqrd053Ghb+OoISS3U5ugGuxwcvtRV4Pcn5wEQF1KUFtEXjL0e4Sq5rMlZnNgKuzR/nfVxtt/nZNrfAih2Ry98cYbTz75BR/72MdyBZUax6g11f9GcpuLgV/L/mDSp2LMIiUz33jjjSeffPKVV16Zc3q02+0sS4jz9/dWyMx20MuR+pl2/6TXPjDzj370o7e+9a3en5Hc1pknpcuC0lFq/1zXwEQjbzn1TEOTsDFwdc8GlHJHFkWxfv36l7/85Z/73Of8LAwkg7w2/a+1XqlLWJlJzq5kzFQpUIiKomh12p1OZ/PWrZs3b161alVlx3T9rHGYao7spWa+spNQJYRgnpdIvkIAYFkhfYuVhwmpQvyvqgp0UZCT6Ws1U0JqxjIGAnEzFItBIz7wsrZDD1z5NC/78Z6C2Zb37rQGM7qTFXNnaABGuFgcwoTCrCSVYYUIINGcj5KJyApDsYqd18MSfEI62p4GSgvkt4Q62WuAapPaCws1uiEc2DDPvXl+TXW1IKkCvhTaYW4D2zH92PTGOzC9KmCTxO1MES4nbtFIso6AJPluk6UaA0DKEAIrsbKyukqtJEqCopTx6XJZsehZiw8/CSNPB5aKMlXmyG62YAD5tGdBRj2EGghUAdudpYrJ6qjGHRdBrnMtUY2XX375k08+KRESwVzkjIF2hxeUe5+d1YtqIKT9VUVKkZJIi6J55513f/jDH/byqKrusOVqe8YA0Wo3wRpZs2bNpz/9WaKu5St/YASmoiag1N8uCsWHP/xhk/jVFawoimL+1oEdQk2Jsm488cQTr3jFKyw+vdb5/gfngDwp/eB1PK/05rPDGDtElTLwN3/z16eddurtt9/uZRVyscwiUmWQZEIuLESAK2yXu81gUgaSGdFlRu8bwY7pM42R/J2NRvA3ZHEzX1GnSHN1XA5x3hy5tz0Ip3T2TJVXGlzauJw+zKu+fvi+NXJ6Y5ZiDdvpfei6l/nPrj/2QaB/fum7vvjFL46NTtjhNzMrkpmAFZTTFHRzKc4BmULyRGd1Nw/NpLFuukzriHlTQnxlQt/b7hp0jhgYxKA8SfhXewL24XL5orcU2/8oUVDFlma/lbIso8ROTKGgYtbduqTocZVcKeu/+umujctfpGT01F7d0qDT6eRAME1e3rmprJEiUU6teszcMJvNaDDrA4hoZGTkgx/84NVXX829Cc52yHNmA0vaVRFVakNnUfJzf3x4XX/P/TrVKET0mc98+v/+k0smJycbjQYg5oPWz1tqpFXv6mBe1PNq/zWzl3zopapLly5905velL8O9PPKkp3lSagFT2Sq9mzZEzycrUdnB0OUqKQCiSrQqk4RmXpUrZ18FEdEX/rSF1/1qletXbvWH84B2CFDnvuIpbZa/Zr1ljXpjQdHbySTn6A5Rl0jb3+yKC7UNM+L/+B7aIcEn/nMZ1760pdams45yKO2d9RmIc9X/lyLyXA2SgbYz5RJhmYi+drXvvKyl/3uLd+7Ne+eULTb7cnJbeSipvMQ/IgEqg5t9vbMSy3vredp/QPZ4eRi0Lr2kGfBI80umoGydpIEp5gYf8jPziLZ2k86h8OvZdY2aVmV/uZv/ua88877+c9/ZnY9w3/PWJh0RxGtPbiiKrWv3ya092RO3T6l6QRiamrqTW/6f97whgsnJ6eJgh9vNncyswhyJUzPXvwrdkGutqeuvfbaK664Ip8c14SoOs4pTcQ8Gq8kfxdS4OVwv8VUBtb8MNUjriqKLSNEAxXTkzN/8Ad/cNttt/l7alPTf6W7EHojq+COD0WqjMmm+GjSgyxqxzYpEWmEoizLosHKdNQxTy9VSsk1dupHSnkItmd0jaAZmJGP4muotbGIWImJ6jbt5q/sv7/HChuSoyWUozCoGRrjoCaquPCeSl7YSQLamzA3l5l3I93P3fEqAwRugkbCyLLG+EERI4KQ70+zBMCyhRox9Vi+SUGqLB0pZ6BCpFUOSmVQprzue7EPo3oIBxjMsnbE30CsHBToMDrANkz/fHLD3TNb7hvjDYVuY+1kWT5tcqpWDiyrsdpdX14QqXZIu04gCoRmp9OY6SwqiyOXH3YiTzwTOFjQZGqqO2upaYnD9bKHIFdgBxBjJ4sv+VR5DsikRemY9IFVD3zoQx8aHR21POu+BVk4dz9yjkXMbOa/d77znVNTU3aiWJOHBr6X0gFyzqHTpwLtFpj08KlPfWrdunWUnC98TwYK3P1aBxHddddd11133fj4uLiyAwu7KLL0md9+++23n3baad/5znfsjL27C+72Wzz0DxbORqm9WnGj0bjttttOO+206667Lrv55KP7JGtW2gXmlAs5AVLdj3x9oQaI3uA+xw977IPeJce/XZ03R24h/6RaaYxICVhzgFJN7qxYsMO2/w9nt/I6+cBdo58A/BIjwszMzCWXXHL//fePjU2okEQwFbnPu4ZSbwvotxf4rtoHnz1tjg7nxv3X3FqNgeQlkEba48fhn61N7txDq3EDIuIQ5nYAmQONdmJR85UYuGw9eeSLZhWanp7OiO3Kt8mSbvfkoD/s5Hrx+v9A4OSD7PtfFMXb3va2r3/9636d7hovytirhWfOdrMO4iH9U5CEIjHF/rvf/e5FF100Mz3NLq/fbGtqYFN+dH4G8681tHvi9D0UkVe/+tVHHXXUwG73DCrWNUFO7reZBmbD+dxbg+8YVVYr8v2svTcjM3f4m9/85nnnvWrz5q21B+eAPL9z00k/btG7Bede5U72X6m102+Lqe372QBqP2WrvSdIbxfLqy+E8N73vvf1r3/9k08+OW92WhVjGfjbwM03/+TtmOg1a2buGkJ46KGHzjrrrFu/dyu7lJSlVEVFuvPtNqAuupxtqL9z6J2UGh3ukOQGfhiIgVy+yRNkThNc7bYu9WTeYvwyyUty/jud9SpH1ajqH//xH7/zne+cmZnx6BqImbkx0POrpmTbvXa3/inO1zOzIqKPf/zjZ5xxxhNPPJHLcGeeloySqHWEXLR+nrL5eDT7nmeaufTSS2+44YZa9pvc/jzb9AhRF77tx2tHhD4dqohQqv7qjcL9DNmP9DWvec3NN9+8U2SgTtiD48DkrIXo4zbkTpdzMp9sKe50Os94xjPOPfdcVc2RPeTk0uhzuaRDS4ioiERVAQIpQ1iZlRggVRCIfddh7knmplcZ0IHg5sXSKFKNgWrPOlGFCis1uRgDmpboLSGlJxPQ/NG630G2AjvSJNUqohRooLEIjaUlxhQFcVBGzHYZsWVOCAxABUJQJqHqeCRQhJbSaQEdpByU3ch9JiVBlwIVmFe+8CEMYTfBbVRAL1vIOw0B0KjlNHQbOmvjlrumNv2ooU8gboS2CwaJeRMTEcES3TIiKhftKBCAUhgfESEqCSIQoWJHQsSqVEYpUbTLsZIOPeiI32ks/8/A04AxaIPAVHlaZkYku5ydcAg7BdQ1aghRIKriDXeqEVUl5vd/4B/vuOMOuOTZcArPQnVYK8ZtGUv5E5/4xE03/XsKpgMgSfCtThcHtgCg2WxyFZDbtVhht/dBQ+bk5ORHP/pRr6BmWcFEmkzbaS/gvgSdlaXg/e9///T0dBYmFnbv8N0jCsx84403nn322Q8++GCjMZKl9l3GSX7Wf8hDQzX8Lja8GiMpU5J9CCFMTk5ecMEFX/va19hFTbqWEUIIxFk1AroyHznTUpIEONfOXhD/WT81vQPsMVl6iTM92PWMGzi//VOQxdM8otqv+b/3evO3ZUUr9817yfV3YA7kMAdmXrNu7RsvuvDJdesZwXxDLDcTIVTlvOfMO9k/XuozSQykQ49zf6X/5nxFeuMoe8fCHg9dfyKqgpP8cYtncTWNJX8morxBetUIACxzVmDz+TXdjnrPs/uHubPQr+FkHY9SrSq4aEd2Hot+leUrWRGa59sHTqUfERchez1TMspYH1qt1hve8IZ777236pXs0IVoB0jYtYMoj8O87rxZH8CmLZsvvPDCyclJpOQhfh/sgX5eP8gGqqpQ9YVotbcANHr5TP5aFMXo6OjFF1+cOUCtD35+zTtPym4Skq5FRgWcogIVpD1OWBjEl2p968GewpxMAUCUQfk6KWrN5kZuvfXm17721a1WJ+F5B9PXzw0G3lDDc/YL8+vXX6lhOK+U2hSQO1SrrRq48FhOpTn86qBkdMgHb2Y3CSG8/e1vv+yyy3LVoPltx/PN4V4bLxyXyGei/qXZiFMUxeaNm/7wVX/w6KOPMrMotm3bZrHnaoWGezf9/IEUVpq5NpYKD+YX72anv7ezMcP+3uYRDbzfc0KjSdgZZ88roW4s4pw93Ytmkx+6XpC1TvpZ/q//9b9effXVfo2r6gAJVs3AsAMC6P5q+4sL7O1fsLM9rhqZ8f3v3/pf/stLVq/+WQhFFiTmz/nnf0LjF5fdHELodDoXX3zxXXfd5f0o50f8gweV1d6Yyh8Z+FPPmAv9pdIvPCiKOI+rLMuoEhrFe/7qL7/4pet3umcESS+CaMEBTHbF809m5iLYtmFbYT6StNpoaZbBzBMTEytXrnza0w5SklQrvn72nJmYiJihvWtstoYwKK9t7ylovr//iprFsx9fqGYxXSQoNYCRojEGNUmxvmjnXsNPIWQkLgiI866vlpnJzTSCYnFjdIWGxaUWtd3XvsWoRGSmybzOiUi0regU1JmZ3gxEaDuVypFqAFjIIQxhCLsMng4tqJAZIh3SNvF26HpMPbR1/Q+59XAzbCVMMVWlx7RXfESPKAMoRPKfaje0r9pyylJEWXSkVY7PyIpFB//22IrnoXEksEi10MSRnJBUjzPaK+j5lQPtjeBDsnqICz5C3ZJC2ZZnCWKMRduHbdu2vfe97+33GsACbS5+nzKCefzxxy+77DKflC33Ci5Li/dHy19HR0d99qX8il3oar98/4UvfOGnP/0p+sra1ER2SgDADq58s/b1Bz/4wVe+8hXvXrSAK8LPMhG+8Y1vnH/++evXr/dZDrNguiCTmBUMSk4EIl1pzJuJNbkn+Pd2Op33ve99NdtcUvAwMjJihbwrk3OqYGPfsqNZfqTRaCz46WyeWa+AebWqdh29s1Dje4YHLxZ6oTGTU82i5Fv2VJcP2/Nt3l7TrzH6pmrSLZzjniHcvFzf8pa3ikvkPU9lxmPPz2ltULM9UvvcL9DWFmCukV0DTpUBKLk22EIwWsocBk6zrZk2kOwdPZjvW+x5ZfVc7Ntn9xD42c+rO+PHk0HeF/zj4lLXzf0W34ifU/vcu3jJJ9vKnWHmNWvWvPa1r33iiScquh1oyJvHEp7nbTXIi8X7viHNcj4pYeZLL730wQcfrI1de3NZDHx7bYfNn5nZCpfn0lU5CW9GFNIkGlVbPrJOp3PyySc/5znPqW0Z5FI9+tFJivnNtaer9eIP2KCiO7btZmzUzBn5ela+MpkNNBl7RH3ta1/78z//83meIfVbY/tbpt4TqRop+uv5SrYb5uHk2czbTTZtUJKI8gLPi0V78/Bm1pF/ykNIVip6y1ve8g//8A/9A6n1diDMZ8vup0lN5vWqBccutNecysy//OUv3/zmN6dDxEajMeKdJ/Nhhie5GoZrjBFOcsvXjfLzPu5x6wdbG28/z/EvRe/UZ9+62g5rD+evmnIRZOttbZXNPQvqJExr5/Wvf70lcPeTnunTC3417PWPNBMbJ4f03CD1DmHujcazylWrVp1zzjlr1qz1W/l8uGjuSW0qB95JvZpFJoM1a9a87nWve/TRR72QX0P73JDHQr15k/02V9saPHLmQJQf0b333vvXf/3X8+lPvZFUOjyEqvRNIB5pNJm52WxaHnbzYNUkV2RzJCV50ti+tSBlJKE//MM/BLgITT9kcmK25zwmrNgdFZaVKCoxm6XApgeqUAi6DKHKLEkEtT+HKAH+f/a+PNyOokr8nKrue9+W5CUhJCQkkBAMMSwSQUARIgqMwAACLlEQBAww0WGRESEMmzCO/BAEAxkUECIyYTEQUBRnBAmLBGWPBIIZCNkge17y8t67t7vO74/Tfe7p6nvvu1lQkZwvX75+fburq06dvU6dcoC8Qiefr3QFTFIMCAOC0IYtGDQDWkKTdsMQxVysp5GqQP8AoA2LhCIRHCFgCNgcNg8yhYEEIaEhUCi1/K72tB0hn9keAxBCjFCOyhuBSoh8hwnXARFWXy7dBtvgrwhcMDLNSWQdi0hx3GOgDNgF8UrYMK9j+dNx91+agrUQdxiMoOIO8JndxInDuaNvpN0kv5hv8s4hIgCCmGwpDrvj/mG/8W07fBLC4QD9iIqAASKyCGOWQSQDllvZJD20DTYVeH8GpWdtO5fErMWn0gkCmDXNxU7Sa5tBEMx66MGf/fzOQqEgRbU3NUJRC7Q+Jop5gXfKlClLliyxNkyfQVnKNirJDlT+mhgcrNS9r2wesWnDFwDK5fK0adPyVo5eeBdbIfXQqsSGiIhX4H/yk58kKS3pQcab0UkP8hbYG2/MP+200zZs2JCeQB1zbheqiHADSGjwu4bJyhiDmFzLVzSN5eMmkyZN8hwPPacOCG0SOTKAFiubZcQTlgtNvbBVRU1+mjBnp3lkI6OWLuk4rG6Kax7Jn/KrN18AyemW8jnv6GdQ7InqoJ6qNOahSPdTrN4wDO+a8fPLrrjU6KRphMYLmWsmbcQL0lD1FX1Huzf5X0FltYBBGyZusKx5VHWJQW0DFy9LuxOJcZ9WBEq5HomQq61RDBQnqS7GQJyeL1RnIFsIMgQdN5HIrIcQ7y3BQK/MItiWCWX9YlKQE64tGqTEXMY0qZPS1TJr7csvv3za107duKEzTusY5mehTn80j1dsmsZAxwSrtsw088ILL9x66621WN5/C5I0UK1h8111zjmgyCXnFEFCnxbRhmGR6wOyrIMKGxrWhqeffjoomhE299WxyNiqZ90SiJzhPiv29wcovCD0LwVtTe4kKD3kvHzLI/D666//1a9+pVFUC3oNUGp94RVw0F/0pIQsOegQpHxOtI8sg8nrHgdJrBlzZT2lHdH1HPWeNm1a1VGLtVMVISm1Yz5jPa+J9J/eTYqdPhyZ1MZSsRKfeOKJZcuWcTdKpRJAxbbRRg6qRQgUexKBCyvLTYlPyf/MgzraJXjWTeVRoTWCZ/BoJCQrLmHAVXf91T7FBbkp8JcDqz6WR7LkAXzjG9+YMWOGcAcwRSVfJCZVGbU8Q0SAHFiyxgTJYTKArEQcZ5q7JCTXSK9qjY7fnTv35RNP/PKGDRt542kjI8Vs3aRKt6s9KeuFnnpli2Lu3LknnXTS6tWrPcuwQdDixaVVSurIEK8DUK0aTOX/2FHswjC87LLLurq6Gu4TgEFjAmvDQhAWgpDnLo7K5CIkcFEclyNwBA4NWHDUVCgywYdhMQyLWpzKqg8AIEGhUBg9evS+++6LiHHMqZCZALEwBaYWIJfDZ7WYOQM+dmAtpAuGIvQz7ODNBVWqClSJ+1YuCCJyAEAWiQpoihA0Afhrnmarbr77+wc9WM6GRQgclYxpCpoGmqB/RMWYbGgojmLLji4bTAQIEBNZm9ABGkMECI4wMlCOejog3ggmBnCJSKPqhjlVQsrbYBu850DEqi5rSiIBRNYSUBe4NVBe0rHyue51c5vNCqS1BnqMAYgB091piICQiKmK45n+RAB8n+/wWgvyA2DQ2Iiae+J+cTh80NBPQOtuAP0BmhALBABkOJVPpCeyfZMEOj8Qayd/E9DqDRJlnJhNksOiM0SIyForVrV4kjZ7AvLFF1984IEH7rrrrpDqwq0So/TIwBgza9asGTPu0vVxIKcTtfGq3QAEaGlp2bqkJXbMb3/72+eeew5qmEHaPhB7K0W1y7/BDsAf//jH/fbbD1TS0xaCNlaIqFQqnXrqqQsXLtQVfzgeKi6ZmEEVNFYJYwERBEFQLBbb29vb2trCMIyiknNu3br1HR0d6Xb1SHIEtBchHwJl9GvP7eqrr544caIehaJPkG0vulltF4lNxukhaZbBVtPIqOLOGs+Q2zlLylfXj7nsWboa2/yAVHSSuJKIngAAIABJREFU4ciFS0oLVfpD4JcFoPQkDcjylHRJz6ynNbQ00H3gTUb8TLFYvPrqq0eNGn3aaV/bDHdCQyOmKVbipJk8HdF6mI2RQUpReoAi6DSWhOT4XXaSKXbiSgkm9ezwNctJSuvHxeQsGiIygByDAzCIFJMzxgDvJ0viOP557u+pBhQfEtWG0zx6FZL9In29Aj+W5IYkBaqqR+UoK5SE+DlD5DeP/OYb3/jGLbfdyij1uKaRPoisa+QVUFNZv03u59SpU0ulEmRRpL9VSxcAQBAEI0eOHDdu3E477TRixIgBAwYAQGdn5+rVqxcvXvzOO+8sXbp0+fLlK1as6OrqQqQgKBBRoVCIXDmOY0ZBOn1IRMOGDfvsZz8LSuZoiZ3h+jSzGBpDDD/U3Fw0xpRKkUcegg1E1ClmkEoMYc9kX3kDxUD5wjn3ne98Z8KECS0tTYi++tO0pIWAB3kvnUmLTQgRbjqEwf2U8r6e3ENVLU4wICqGVBSSpTq3rDWUdFsElEkzMcMwvOGGG6699to86+lXIMekoEIPaa8S6d3S0tLU1NTS0sIan3dka4UC1Qg1T8YVjePckCFDpk2bNmzYMESz4447DhkyZNmyZXJoiegyTSHSoOSn62fE3gDFZXqMWmSJ6vGe0egVhOtiiPxnv379tBqtOnwP23nM5BVxfZATny+//PJbb71VYoiCCiLSh7FozpWLlOqQF76NMcVisa2tramluampyUVxV1dXR0dHV0+3LG/oYTYI8vCjjz567rnn/vjHNzc+TGZwY0yhUEDlaECW+AWxmm35J+55oVCYPXv2aaedNmPGDG5KY6aRUcgnGjlbUuPH42V9U+jfOff8888/+OCDjfRE2jXGWLSFQtDd3d3S0rLD4CG7jB45ePDgHXbYoW+fdufcqlWr1q1bt3r12hUr3l2+fHlXV9fatWsdOaI4DEMiWygUWOMI9owxLoqdwy995UsDBgwghw7Im3pNRXInMOy9GwDASA6ks0lWExm18R4AOMSVUGiSVZ8uczMGKzFKvh+rOykKEj+fnHVgw7AVTAhgEANFnlxG1zs59x8W1KwAJPwToQFyBmwBTJ+gMCA2LbHDIDDWOuBTFREAIAYwCJg0Ykx6OBaAQ4qCIO6KNkDUCWHJUYSJFYpEEo4UmjCQ2gL/8AjfBn9zSGMKRmLlMUUWgVwMWCa30ZgOiBZ3rXqxZ+1LIS2xsN64HhMYcE7bgUQA6AgADUf2kQgJAE0SU0EEFlgWABwYBDIYR2QCW3a27FrjcNTAHQ+2fceC2c5RM0KAgAi6zDImsgg4+h+zAv4rYuuDCNosQ7VF2tPHoPS0mN3iQ0JqTADA8uXLL7744rvvvpvtsHySyGb3E9NVWUTs7u6++OJLOOtTnslacmzAxfrrlfNVotgLBGwhaN9g6tSpVeuC510IUAE4osRDzzokjohKpfhnP/vZgQce2Mj5RQ2CUyWQwjCcMmXKU089FYYhl47iVC+DSOn+a0IAk/zp9RxSDA8ePHj//ff/+Mc/vueeew4btkP//v2bm1vDMGRPde3a1evWrXv99ddff/31xx9//KWXXlm9erVJamGLwVcJXLq01ICknV5zzTXnnXdeVUxW7F0CJKic6qgoGbJhOFm20Rbb1gIdizTpiRkA3uRWv9DtkF89yjkXJUufnI5nGvI6vAEKWgQhoAsT53aPatNWGhGXg3vID3PQ7bzzzhmx47BDDz+sqk/SOOp6fVieIcpkMyEmy8PaEZI/MU0XrWqyG2MsILhKjMwYc+KJJ+67775cRE+7vsmo03OKJMzHsQ+mfGMgCIIoctZa56IgCPizRBQEBowFgEKhEIa2f78B48btkXeH3jv7XIL1+vQAD71VXfdN6g9naRhjJXUI8o49hyfIT7ph6jLW3j79jp1Hjbz00kvL5bKEiRnnDXYDEZGg1yqWms51WnFVgkTExUuXzHzgfsWk8huPJHOt2xk4cODnjjn2K1/5yi677NK3b9+enp44jpubm4MgIISmpibnXKlUstauWbPmtVfnvfHGG0/94enXXntt/vz5PT09nFlDhM5FURQViyEAdnf3fP7zn+/fvz+oiKHXYUEvAjLd5nFSa7zW2nPO+9ZnPvOZlctXuHQjcLncI29ZG5bL5VKpGwC6u0udnZ3d3d0LFiz405/+tGjRop6eHkyXNCSOX+tbCtzcuXPvuOOOs846K88L+k+veoNwq5auEgIjoubm5osvvnj06NF8XoqoGw4mykYQUKLbWiunTOgMNSkGB9mgBkuJcrm83Xbb8bKoS3eLa+GvNYUx5tFHH73kkkvqCEO2bfI/GROkZo8rFMJRo0aNHz9+n3322XXXMcOGDWtrbW5qajLGRFG0etXadevWvfnmmy+99NJTf3hy3rx5nZ1dVb9VFdtENH78+LvuumvMmDFxHBsDgwcPuu+ee+fMmdPVuREgKa5HCJzTh4gUO+dcTC6OYy5pCmlspaWlZe6rf545cyaXgEymzBHrFG0mMd7iOB48ePCkSZMGDRokfZNd9tZaihOFy1GtcrnM5pMOnH3q04fIdCAle9Orpm3VwYknq2uBWLD85C9+8Yvvfe97omczMpYzPwCJEC06UdBAQRgYsIgILkbAtj5to0ePHr/PR/fZZ/zoUbsOHTq0ubm5UChEcSmKopUrVy5fvvzlV/48Z86c2bNnr1y5Ekyl/tymwi23/Hj8+I+cddZZvaplzaESoMTsgisAMPtjNgdQLkAtEzY1NT3wwANnn332tGnTdPy6EVAWAvnyuTfQJoHcdCrBn4iCILjzzulRXH3fQ9UGrbFBEPR0d+88Yvg/H33kcccdN3z48MGDBxds4JyzhSYAcMlGCrOhY/3GjRtXrV7xzDPPvPnmm08//TQvVpXLZbIBAPChVHFc5oTTQdsPPPLII51zzDTSW0GaZ/gRUYCIfF6EtcrfI0LjqzS5RMxk31GanYSqlqUodcg9icj0DYAmik0haAUIAWzsYmOstgyItk5Gxt8/pFoKEYHrXiGiI2dMABBC0F5oGtRtW8kVgbodkE0QTVRJbkVENFIqiM81wjiwjspdEHUClAwSgeM3ZGa1P5Dv2HtnfW6DDzKIABLRbwwYNI4iYwiohNAJ0fJozdyuNS/beFHBdgTQTQBIjjLqlqyBOIbkoNGEFzJOizEmPbUejIEYAB3aMCy7MKLWbrdd28CPNm3/UQh2IOiLGPD5CSx4lGWf2PKaI7ZWytg28ABVnJENPlTpcpALTeoEOp1iKSaXWBv333///ffff8IJJ8gpAVsu4nSmEiJed911r776ahiGEveRLqX9dJS1k6QbxpgYKqcxbkmvGLQSnzNnzmOPPVbV49LqIKv0q2Suadxaax988MEpU6bsuOOO+pUt6bMEJsIwfOihh6ZOnVooFJxzbJNoI4b74xIrjUglN/H/zc3Nn/jEJ0488cRDDjlk++23D8OQiFIfCSUDpa2tbfhwGjduHCKec845ixcvvv/+WT//+c9ff/0NQYsemu5DEARTp06dNGlS1eFrZOqJ9qJjQor58PFW17+expcZF+c2TyFyR+Nf/CX9a+ZFTo+p60HpZlFlwkoImCco2Smm9kjKhkTpg7dFUVyLymARAGDjxo2TJk166Fe/3H333TXZN4g66fAmPa9QxwRQ5aNVJZv+U7cjxj0AfOUrX5lw8ARQH/K6qoepMQwA1nLIElIuJ1544/pOkeMsVENEFgM9dqHk98I+1DSGqthrVbR7MnyT5A9WagvwhyrMKGcQ6WQ6wVFF+DiHiEEQXHHFFbvsssuJJ54oSW24KTFKrdrqUJcemrRcK65KRL///e871q1r8PQeef3kk0++7LLLhu0wtLOzk8Nhra2txWKRx8sLRRzmNsZst912n/zkJw8++OCvnXbKhg0b5s17/dFHH33kkUdef/31tWs7wjAwxsRxBEBtbW2nnHKKxqQoFz2QBKvV9jBKP6v2v7m5eezYsR//+MctVkqLxnEZKtzEe5/5W8nsO+fWr18/b9686dOn33fffStWrJDctzrf0oCIN91006mnntrU1FTnMc6qE7Epez4YmFS0EO7u7t5zzz0/9alP8Z/a1BRbwpNydcCpoq6CeU2fQtJ6XJqi+M4777xz3nnnrV+/XuZOq4A6KJJnhg4d+rnPHfOlL31p3LhxLS0tAMCRwDgqCRkP2m5wEAT777//F7/4xZiit9566777Zt5+++0LFy6Udan8V+TmEUccMX36dA6Fm/RgsQMOOOCAAw6g2KExyWKDQeLkcfaMTWrFkQrtGQMATzz5xIMPPlgqlVAZoiKK5UJYuLm5+fOf//yYMWMgJ+eTb6k/tV1RYYHsAc3MdphN96uFasGDkEx9qSivGGMWLFhw3nnnlcvl6ks12n4AgLTOIJ+YAQCBseP22P2EE07453/+51GjRgUFCwBIlSlzFCHikCFDEPGQTx/qnFu9evUjjzxy883T/vCHOXUmtz6Nfec735kw4ZDddhtTBzOQnQvmwTzZkzoPiu9zioPYb9JJvmhqarr55puHDx8+ZcqUfGseaHxKsy5bW78RyBOVR5MAsG59h1Sf6LU1hiiKdtxxx+98+4Ljjj+2X79+hUIQRS6O44gcAVG5TERoWZgEza0tffq2Dh4yaMyYMYhYKpWWLl368ssvz5w585lnnlm3dn1XV5cJrEVeYiwdc8wxo0ePjp0LTOjZRbKYKkNL2DYGIgOIlW1oBgDREpFD4HO9gQAIiQCxGhL5wGmsEC5Scn4331dY4A6JVYpkmkzYAraQ4Cg14lNJWjlB8h8etIohIgBjMCCHQCEE/Yqtg03Yl6CYJo8lEZMKeuO0+CQAmdQXchFSieKuclcHuB4AtRBtkNTn8qan9Oq9H/o2+MABywpjDHvlSXlBcohAVAbXCbSGOt/YsPJZ6ppXsB0BlhBik+psh0SG/4EhCA0AgLWIBggIDf/jGD0QOGeIT+GKAQgwBiw7LFNTlxvQPGCPfkMOgGAUQB9yBiAgx3oom9QDlivnspRiueStMVaFBl3ZbeCBNovTfFUTBAaRREcgYsyHsVfIKTEgxHSWRlxaMfDyyy9fs2YNV9ynrbHLW7oaRdFf/vKXa6+91qSnTKpPx7I6bFRlbm3ii+BtxN9ovG8S6fjJT37inwKZA0pjVVLgTBNw2ive35D0cPny5ffeey+oXZlbCGLoL1++/Fvf+pb0gesbJvOIUDldlwhcer5hOuNBYI477rjf/e53v/zlL0888cQhQ7ZHrDh1UvxbDkznGFccUxAUdtpp5Pnnn//EE09cf/11O+44lOuKiqmq0wb79ev385//fNKkSfJdb+JSHFZwC1kj1WXrFYCi+S3HpAfiYMif+qO6V3WcBAn6yyvamUe9TE0ciq8hABGTE6IVtWuniF/U6YRyIQPR5qJ0TO5Ya8ERJedqOBcl+9feXrzo66ed/s7SZQBJxLBBBMp8NUjn2o7SbF7nFS8Y57iyIYLLbqxD5VIWghB410DV6p+qehqmew/5ThAEXDeQ7wgEQWBMgGgDYwNjwRFvAxe0e4QENQJJWw6Uhuzre62C3s3QtlpxSDuiLDQpUuq4as0izwPA5MmTf/e734nwx+zRB430BHIGg8ya1IiQr3v1FiDH2kT0+GO/B8qa8Qic41wJgKhrY8y0adNuu+22HXbYIXJxc2tL/4ED+rb3a2pptmFgAhsUQj4hoVAoFAqFMAyttSawDsiYoKmpZd99973gggsefviXDz/8y5NO+kpbW1scx8ViszFw8MGfHDt2bJ2x6z+17m7kFQAYOHAgxVFTIeSaaNaiMRAEhTAsWhsGQSHdhGEZo7Jw2Nraut9++910003PPPPMVyZ+2WLKL9BoidpXX331ySef7DVyZNVpS6QMFVDhZuFuTu8Kw2Q4oHgf07qH0ojgqg6n8IUmZgm1CJ1rEpLntTV11VVXzZ07l/vjp9fVGDWkiqO9ve8FF1zwhz/84dprf/ixj+3f3NxKMSCZwFgkKBSbg7BorA3CsNBUZBeVECwGO48YecG/ffulF168/vrrBw8eXB/JEydOnDFjRnt7uwRkNamgOhtHV4I2QXpsnbUmsGgN/2N+kSmQr6Rnb1QCUsKGunBh9U6mjfM/E1j+h9bYMOB6zSbtp57cqlaB9xX9JFFmI22vEEXRBRdcwEefg5pWPb8VMosdUqKgWdV+eLcx//VfNz36+8e+9W/n7zpmtAkwjimOKTnywiBaY4MCoAW0jpJdR+3t7RMnTnzsscdnzpw5btw4b8o8uq06fETs6Oi46KKLnCNdvaE+aH7Mcw36NaYqwxc2l90JTU1Nl1566V133eU1lecOPREekjdJh1Y1JPSnjTEvv/zyggULoOHZd84d8U+ffeLx2ZPO/Hr/AQOcc6VSZDAIg6I1YRAWTWBtGFgbcjVhTDdkGAwAbbGpZdiOI44+5pipU6c+9NBDF3zn38Z+eExbS2tLU9OggQPb2tqOPPJIZjuOzHpcg1lIyFiChgDJ0ds8yChT0C2zGKtHy2vk5FBPLmLGLs9hFgAATUAYOmwKim2sBQxmch82w9R4/4KmUW0hISJgANhqCwMwHOCghZwspDOeE0ZinzedQSCKAQgRDMbWlns2rgIsAcQmSV8lIjLZcHNVobANtsF7DakFQwYJIULqBlpLnW90rHgu7nqjaFZb6jRUQpL1ycpSh4gaTOrTJ1Um88IjoWg0gBZM6FxTd7kNirv0H3oAtIwGHEDYYkyRiCVmtZQNpWy0BtLy1H9lGyttFmhDXDQO6zbRQRKPkP+lQpMWoZ4/iYh//vOff/jDH/KRyqR8zs3rJ19wWaswDM8///w1a9ZoH4Ahjsml4YM4jtJoXqWGiUnPdObTUbcYhRVgD////u//7r//fk2odWDo0KETJkyoqpWwsnxYuZg+ffrGjRs3dRG4PiDi5ZdfvmDBAlnl1klkkGU0SnfRclrKqFE733fffffdd9/HPvYxNqDTsIuRlXCJCbIvGoYhu4LsdSNic3PzGWec8dRTT5188slCIUyTPHcDBw686667TjjhBKjN5ikl+2Ih/6dHh67G8URbAp7rorkMct4mZoM+VeUeX8tFEtRurMNUO1rnmSWgfAkJ7kN2y5VuU9jKpbu8oVIIj4goCIJnn332rLPO2rixS17UQiOPc2lN9EIjpC5dZYpqkDt0FEPcaR2N0r01xujarFV9IcGhUK9mXi1dUaUryh2vkap91jHirRKslN7q4q35xzw63FTJKbPJWdXeFAtXQrXzczVrMHR0dJx22mnz58+XqHrjPWGy1ANPDfsKwetZg5zbnEdLZ2fnggULjNqu22s3Lr/88kmTJjnnZP1GEKVRoYmZJ4gjOMVikf3Ppqam8ePH33zzzb/85S+PPvpo3qR/xhln6OolHisJ8zq1Gbk+xrymCoUC5zB6OMTawBgWFTNixIg77rhjypQpUhamEWDBMnPmzPoY1gxFaYItZPWarGsy7bW2tuq507wp3OE1rnUcqiUcLVW8ZzSBQTUhL8T/2GOPTZ8+XQuKvIjwMAMp8UyYcNDs2bO/+93vDhkyhG+GKSCizRI/k1+xWGxqamKNbIwpFotnnnnmnDlzTjrppFrfOuWUU2677bbW1tbNM6JqcaxTiedaWUs3xDoiIpbJaXKoD42wod+rNAytM/70pzWdS4cBAKChkzwkqHfPPffMmjXLpNv5ncoJlZC0SRe8ZeoR0UXxpEmTZs+ePXHixKamppgqJ3Tb9Bg3keRGrRDLwU0WzVFHHPnUU0+dd955JrdeWx/4Qw888MA999yjkdAraCLRMoHSxAJmUplZYQQhAGZh51wQBF//+tcff/xxbiTvnuT7zBebpy6Zf/la6BCzZu3zzz9PBICZB7w+oFrf/eIXv/irX/2K6xIgoj7rCW0lOpf3AmKq7BWL47jY1LTbbrudc84506dP/7dvnTty5E7d3Rs/9alPHXDAAfxWetZlJXHEpKt6oNwNADAu3fjvVGARke2izJnfDiDOpgk4B4gQgyNDhBD77FpZSjdpJqS0T4QEFrDJBq2AIYFxGYp0nFqlj+75BwYZo1InCMjMYIGKEA6wxe2caXMUmmSfghAcOZcsMvNNi4DEJR1iwJhcT9SzFqgbIAaICbiqhcM0oydlaYeqaFpVG73q/9tgG2whOF4QoQhcD8B6KC/buOa5nrUvYrwsMBsCKIOLAQBQahcASKYOkk1PszSUlMpN/jSQFr8HIi51bxEtQrODvmR37L/DQdi2F5gBBEWEkACQlNGPCW8AAJ9uBllnD5JvZUS/J6+28chmgDaUUeW2eGgX3SbGov6/asvc5nXXXffaa69J0MGYavHoxiCNP8ZBELA/ZtQxr9lgh3hfSQFT3dWqYZEtBG6TDcE77rhDIqe9woEHHnjxxRe3tFScvWQAyYXztg7NnTv34YcflonYKj1/6aWX7rjjDnH1PT/WAAVyKjQApCfwxnF02GGfmT37ySOP/Gcx640x1obGSE4o6uKSQlfiWgQpOOcGDRp00003/fCHP7QWOWLINDN8+PD77rvv8MMPx7obDpJfKbG64jRkzWcsio3LsXWoUKCr0+ZmAzcle1cFsdoZkOiedoydSho1ahOWnhdOkGikjp6A5x5ALloBatenpkMtCmTupIeokzoR2LYWRyLJmw7sAw/OuviiKeBAcvR0m9IxacqL3DVC5xU7e1O8ZWUkEzgygEwtmF0Gk+tkrQV5WS0Tw8JsIJKyrqweDiKKnZ7a/+Jk+juZ6o9dIuCND7kqBuq04GlhbDg06bVJRGL0Yhq7kcc0DwoCq3ZGfMKFCxeeddZZGzZsTGN5DdX/4kZsGMihpiZ7ZLCnCjUSQDGL1+DKlSvfffddTTMAALU59IADDrjooovEtZYqJeKRipAUqk6ZLuk265owDBE5Jx0/8pGP/PfdM2Y+cP+//us5n/70oRqBWsLI6IS58pxYG3cghxkGQUFoWOR8DpxX606+YoxBay6cctHkyZMRMSwUoIEOMJYee+wxPhqiVsRBk1BWclZWg7zJ1UJPhwIhS/zeTe9dwblJt89XxKMS+FU7rH+K4/iqq67iE4FJ1dXJP+k1QkSTJp3+4EMPjB07hnfAVCBAB7E+tJVNdFKhELQQFoNCU9EEFgAGDx58yy233X779La+ffi0aBZ8RHTG18+cduN/sTyEWsmv6pc8K9R6jaNU3sySSqbTs0DpYgNkmbR6d9QUVwUikv2OWkB5rOSJrHyv6gBjr7Oz84orrvAMAJdLkvVWUsFRW0vrj26cesPUH7W0NaMFADCAaZ4yih5J+Z34H9+XMCVzfbHY/P3v/78777yrX7/+iUXRwBCI0JgAwF155RWdnV1chKLBgYtQRbW0qQU+KhNI07kwbJxCV1fXKaecsnTpUkhDZ71+XXRxo+qywiYZs9OjB7776quvktr3rMVC9qPGGNOnT59///cpYMiGJoocokUTEBjOftWN63YcoSOU8jvW2iAoWBtGMRHAqF12Oesbk6f//M7vTLnoW9/+t6ZiSxRFQCyYrezE0njGysqHTcOQKjSZoj6mpLJkRmLKtXNkjAmSMm0AAJQtsQyq/IHHgQmVgnVkbdBigz6AoYiY9JmK6toSQ+f9AloE5BwAA9gKYb+mtqEYDoghdC4J3wL4dKNYCAAAyRmIAlvu3rgSelYD9HCTUNtiVnKkisVT9f9tsA02GxJqRIMQGyoBrod4WbTu1a61rwRucTFYb6ibOJNI1TQwJimSxXdSkta/YlppiPiahR6BAVMsuZaueFD74H2aB+8DwY5AfRCbOF2Z++T1UCskr+dVVUtemm+DTQKRUZ5FKPJNVnflAtMVTjEl69jcGzZs+I//+A85KcL7tXGQ54vF4qJFiy699FKqloSVtyRkgRpqy/CtBc65NWvW/OxnP2vcWj300EP32GOPgw46SHePUhAPVlsqN998M7tnW95bALDW/uAHP9i4cWO+WrlYBRWsmqQP5XL50EM/c8899wwdOlRIIu/1yXDkpraNxDyVfe5BEEyePPmWW24Ro3PUqFH33nvvwQcf3LgedFHMxxokSARy5DQyPSFTy+VoEKoKJVctF6yKaata0OkD2lIHFbX0NuF62NDo9e5IBASVk+Dxvske4yM3dX+ELHV/JPirB6uNK2vtDTfccN111+mSc6CYNP/KZtuim7rVVzAmiZMuzdzhGem1MyJJKGv6y4ukArJCGOIAC56hmh1ei+DzEefNA48+vdmRzstH69u0GvK9yifF6NY0fmohXPDJaXePPfbYlClTJG+oFuVUby3HQVojeCESyq7J5RtfsWKFnN/tIaeqeX/sscfKt0TeVk2Ry/E4AGRC+Tpfz1p7+OGHf//7329ubtav56WxzgmqOq46IN+qM8ZaLzqVF8bd+O53vzt27NgGv85IW7JkicQm6jwG6WCF2JijqRpoIvTGpfVXnk/z3Cp3dJCr6ru1tOT999//5JNPsk70vqLpxPvfOXf++effeOONLS0taHjJkCSZTmSOIF/6ICAP8Koh3znxxBMf+fVvhg4dyhWiAOD000+/4YYbCoVCSnuNTF2jUCqVtF4WaayfMdnDoPPTtHmflqa8aw+0Hm/8W6S2xdx6663z58+XpjSAyi6nbGmC1tbWW2655YwzznAq3VIWvfhhjyuF4ySMyw/w5JbL5S984Qt33313nz595OtVRZCQB98MguDVV1+97bbbJJzVIGDWUOTOa5aEVLzLvAsZsIHBAUpjzFtvvXX66adzwnj9Pmj0orJbGgTdvvaAKg84984778hCgMaV/lPYcMSIEcOHD3fZQkla+GuxZlRxCVRnRWK6P4OHZYwJwnDXXXc9++yz9913X37AYCCZ455mN2luBwA4FzsXG2tDXVmS6Z8ILIAhQOLak4AmK4/AcEoQ55RnAAAgAElEQVQTL7kiVXIkAYAj5MkqFUJ6rHRqWECSnIkQkGmCoBnIpiXerOTx1Z1dfwXs/Qu8hlNNlhkgg5bnIQBsDZp2MIXtiIoEBhEdAjqwUBFYQu4xVbCDJg5NmcproLQGoAzgDAJBxi1PmbCyfp7p4QcgQLwN/oaQElgErhPKy92a5zuWP23KbxbtWgs9XEOSCIAAwSCXNXBgCADJWCADlIYmyQBYXhpJZAhnIaTKEh3Ycjnscf2LA8a3DPk4FIYD9AVTBEBwxCt/YtrIMd6id1PWcDqzOy+pNtsW2QYeeFkDROgccPUfBouGM2A8izxvoKctJJrov//7v2fNmsU16WulPDQCInW/+93vrlq1qtcnIWtb6E7qc3s2uz9V4aGHHlq4cGEjzRoD48d/5KijjgrD8Jvf/Cbvis7nG0pTlO4znT179iOPPAJbtsGT0qDJK6+8MnPmTD4bR+xjba0SGgdsDBGSMWCdi/bZZ/ydd97Vt2972r1KwCVPD3UMfZ3hIaW+Tjrp5EsuuQwAdt1111mzZu2777692qCVNp1zLiJKquPzMEh1Rqn+JFuNiLakBnfeyRT7UldH1Q9XJQ9+Uget5EkhgwzFyjkD2Za1tCTgBGLQZfV0B7yPela1fl5b0vK8fowt/zRdgyRqmZATuin/ftEDDzxo1aG9UC2oatS+Nth0Cb/Z/pL8b63VdVc12nX4TALKoHYjQm5yvT+rcYQBSHZdeRHtXvu/heKrlujW19pZEgc7T6iNfCXFD/J2SJ0x5E1Eg51HxKlTp954442QVh2B2kaC5iDnHKrkVsqGbGTg8qc4tJSrpMwvrl27tqdcEl2pxRoBgcFkJwrX2gNob2/XgWlKI+NCTpC6oHpEYhYJa/AneIegMYa5L89TdSYlbRbFBqsOCFJPU/AmTdWeMgNgRAJDTkwRUd++fc877zze5O51OEuTIENev379woULoS79C0V513JHP+ytalQV2nU+5F3XN1P18RT6i0KKpVKJSRpU5ELLZMihkYXqmWee+b3vfQ8RESw5TGlVUtWs53VKkEK1rDO7jbXWIjgXfexj+z/4wKyhQ3YARxMnTrz++h+FxSA5iqHByDL4+ZKaKjT09PQAJJan7iqkJpAYQqBER1W0byogIlByBI2H6qoJn6ax7H5QM+Wc6+zsvOGGG+R+/VcEw9bam276r+OOPz5dpEREm+ZIMgYqkSEETHa7gNHznsg6awiB68aWyz2HHvrpG2/8UbEY8t4XUGScypYkB4WI0h23iexdvXpNHMe9xog092ke0etAqBaZPIPHm18hgF//+teXXnoppvZ8ra9rZtkUiq0sNXnte8IhjmO9ZcoznATzkFa/2W7AwEIYxjE5B6ENKPbP7RGWZBWg62JnidyZ9BAUYwJBEwGAodgBIaQSwEmaEf+ZM0vS/YwpjpJApP4cUfLPUwDZhnw1gljzcSICMkQUOYOmGWwTYMaFkDnbElfn/QjaWBeGITAIAZg2KG4Hhe1i2+ogJOCgOMjzUuCMtDeCjlw5MBH0rHEbV3KAkiDGTSkMjw0bZ9tgG2wqpOqpDNQFsIo6X+tc8wJ1v1HA1QVbQlcmio3RUpJlEb8LoGodsLRJ7FqDlfIZbFKjNTYkau6O27E4sv/QA6BtDEB/MM0A1pEDMFCNzrUGeu/xsQ0S4MVJyCZ8MYjTKDkvXlZRfW9c3r300kvXrVvnqeHGQQxTRJw9e/add94JtT1qfdOotBq9AMu9il28SUupvQIi3nbbbXXUtwbn4PTTTx80aFBzc/OECRM+8pGPiH2pXXpKV4/FiYrjeOrUqbzVfbO7Sincfvvt3d3d2mPUC9oyFmZx3iXUv3//adOmSQGdqv/X+a5cixb2Fp8B4Pzzz7/kkktmzJjB531DwzIBa9dU8v50yXlKWxPE7OY/875ofYeEQSKAoCz7dBYq+7CqNqUte2MMpk1JRS1QfOFFojX+vQip9sTkLSOnACcTlHCZOEKpvZRwbnd39+TJk1988WVrA21zarGTN+4bBx6pLhPZIKCKjkHqjbg0WVV3T8+L7qrMjg66QVajSSPi7QgaxSGRKahPJ7rn+ZubNHDMuvd5t18PENMMjk1yGTwksATWSZQa+ZoSGpQk559//m9+8zAX2+q1M6KSQHEcqAkSkasHKCee5bvEd7q7u70qh9LDJBJqjFHHRLz55psS4SUi76APUy1TtVeSMNmQK/+UD5pXxWoifsHHeWYW0mumWO+omfo9rPN159zRRx89bNgwrTflf6wcr1FJJgKAt956q9ZYPMwIpeVzJ/VjMgS59trJj84TlVWfz/9vap+ezE09/fTTzz77LEtsk5477PWNUjXBKIrj+MADD7zmmmuwMkcBB5t0V72PUq7Uhkd13NXAWEQcP378DTfccNRRR9144426Io0Xr99CIMluIwIlZARjepq8n7YcECtlnTU3IWKVyIuPz17koUurJM2cOZOpt85jXvq2c27y5Mlf/vKXKF2x8BYR65jWeT2F2YWNUqn05S9/+eSTT5Z25KAwVDtdNEIYP3/5y1/uvfdu1no1cFK5mRf1oAQdZefaU6O6EX2NiN/73vfuvvtubd7UAi0Sez3B0uuSoFcHjgS9ROSiWMy2PO9TGmLm51euXNnV1ZUsX2UH6LWfl1F5PsV0z5MxgV7ZMiprUus74XfpcDLRYNABxbGziMby2AAAYsI4ObkbEAAIDYBNj2GJISlhqMmfiPjUbyQy4PiwNHIABA5MTBWJAwBAhtAYWwCTFA0hSGLeoslqL1brfM33N+SXQFIFEyGiI0QMnDMAIdj2YssOttg/hkLswDnnEGIgziYjAy6NzlgEAw4RAzRIYFwpgA2lrneBugkiAOco5ki0Bu0Y+J3c4lWgbbANqgIRAcTgusCthp4FG1b+sXvti01meQAbIS4ZA0gsBIENZyAgBzGAQ91CsraZrOpwxRZDIESOBsAQFkqu1YU79xm8H/b5MOAQoCI5BECDgRB53mDSVggA1K5ttA22DqTy3/LCmGh67Zbr/BHclEVIBkR8+eWXf/jDHwZBIHtvN6mTopXjOL744ot5E1DaiIHa5ck9q0gsBt4YAluWhOh9BRGfffbZp556Km9aVYVx48Yee+yxURQhYrFY/OIXv5gj/kwPOa4RRZEx5rHHHnv88cfZ9dq8GCtjY/Xq1ffccw9bTpIRJqYYGzpIDsnJij1RfMkll+2zz8eyqGuUSfP04xnZbIo0NTVdfvnl48eP14Z1nWardKY3RSrbR7h6HSJu+X4RmTKelMaPuQQAPsEcstYkpBgTR5Qfds7JQdJUaYGICFTWMxJIsWsxTDV9ipHqOX7ahYBsmENPRFZWIBESAlf/9PrPFvPSpYvPPPPMFStWElVCXZ5zRdm93g1C6ndtggWlUYGIbJ8LHjC331znenh4kDF6Dr+MqKozyTclcVWelyBvrW43eLNX0B4Lj1FXaPXaFGzoDtefI+9XdgtFINd5GHtbqld9cz09PV//+tfnzZunOpnh4nweYrlc5ie9OGmtTFgpqeHhRAtnF8XMkogoOw8QEQkMIHMin2UcFMIHf/kQJ91Quv4Eige9D3n9z2NMD01e195vVZ6tpHDyw2meDlYFQIsmOf44PUSrVjf8yVLCWI+OOxnHcb9+/T7xiU845+TwIkjqCAm9Je1LNOTdd9+F2uSHKgZd5zENIgbr82/Vb1W9qdvx/s+3hsoTnzFjBtMnZKsYYzZaRIRS7rm9ve8NN/ywpaUlFYNV2LPqR73+628lF8k51wAAx3zu2Dvv+nl7e3t+4DUwXE+f5v1xSG0zpjespsK1TqHcqsYWAlGmBiWkY7TWmrS8jZbV+ruNS8Lbb7+9EbLUs7P3Xh+5/NLLYnLCoZDIOgQw+XmsGuxIu1Ix42VhOIqiK6+8cqedhhuTnr+nlq8k2C1qDhJqhB//+MddXV1E9YqDM5TLZa0EIbt4wM9oK67XmZVGJk2a9NJLL5naZdlZwErHvMUn74sVMAickg7kdVsHIhmZXIzVpAs8Hk+p1521dtmyZc8/9yJvKeM55UZEuLGAJSJ2psHFfG6th2SXHNmuh2ABDNcJZc4VEwsqE5r41M452UJEhMbxVmIE0c6MJZdotcpnIudiIsRKV9IpqVykiAApU+rhN2NUEYIpgC0AWIDkFG/oTfL+w4OoBOccHwoCaIFCsP1scWBMrQ6aAHjfGQDwIkpCf3GcSRwAAKLYogtMd/eG5UBdCBECCaoZ5PX69tk22AZbGxyiA+pC6ICehevfeaZ73UtFXBGa9QZKRLHsDPJkK6Vp3QDyf8UyyJjyBjnGFUPYXW4qwfb9huzXPGQ/CIcBtBIV0FgtT7ULJFk2VU0oeV7/tI1ftgooSzqxGPgOK3VSmzFrOZb1G6e0Ms5111333HPP6aYab4fJIwzDW2+99emnn25QYXlfEXtIUilhKy0ISSOc2JjPB6wKZ5555vbbby/9/Nznjh84sH9VzIgfK/5zFEU33HADEZXL5fw+4l5BFvN/+9vfLl68GNPEKMwuWMqMm7S2URRF+++//7/8y7/Iw7XGWKc/+VeExlBB4w3KoJxzQBBFkcRZoPYU69E10n4dEPxjGtvlP5Pdao21LHazIFYvccuUgbIi9OgqeMu6AV78i9LwH2brJIpx7zG7DpZ5VJH3B/T91CiqUCbLljlz/nD22WfzBFEuGKQb5OFXrSmp6UQyQUBZyI0AEQmdyFZ0nd5Y9bv62qhDunSv9PA9PHuZL6ACPaAYU3dyE4a0iaAZTSt0owqfQXYSUdWohaxLWbV9uXbOcZivkRHpKcibBF7iiTFmyZJlJ5108ooVft0PIj5f1Pd1Ozs79eKVSyH/ReEOD0Uyd9xCfnsyZMOFns3/6p//fPHFF8siEGslUUkeZ9VKUqsq2XTcELMJbnp0UvNBY1UYSoSPZFSFYcivyIqFpvDGqdTjDrmz2267lUolwS0ipj5XRfhoYluzZk2dr7CKbLBL0rHN+El/ser9qkxU58nVq1f/7//+b9Ut51qGC9qZck455ZS9995bqw/d860iQxAxCIK2traqDW4VO4rHVSqVvHLGApDlKe+BLe+Ax/h5QkVVdcGzUqKo5rq7no558+Y9/fTTjXRGRBMiXnbZZX369iWKeUN3HTOp8WEKW/GqwMCBAy+88EKpfSQy1qlazC5N5mWw1r744otPPfWUl0RZdSzM3aJk9VFInkyoKlKqjpSf6ejomDhx4ooVKyBLFfpdbQKVy2U2zLz2PaEnI62fbklE1to+ffqIEpEXhfv4QnC7bt26yy67bM2aNXJgURRFfH6jRoXh8iDZ5Rw9Rj0oo0pVCiZFXEOWcbifmNiZSeltg8mZuAYAyIGL+UvGWEBDstagWQIADDgDLlkJJwRigxXBERIlkcqk6I+UnJBjuis4CoIiYAEg4D4QEZcnkCjsVuHwrQL0V9hyTgAkM53k4DjiYG4Ipq3YPDhoGkSmldASUYCoa1A65xDBpUXa2G1EQ8ZGoS1FPauhtBagB/I7yBxhqne9X7aKiN8GHzSoz7bORWliTgyuC6ADet7sWvlcaf2LYbyoYDaA6wZyvPJDRGgIOBUbkevhYpqQQwTkgFwSpk/yAirujeXwAEEQuZYyDCr2+3Dz9gdAuAtAa+wMGitrfWkTyemTUC1mkYe8o7IFaNsGFUBEIj88wfkLCIly2WztIIq/s7PzqquuMsbopdQMEFQtSiSfXrJkyRVXXAE+zW9O1lsyTICYtpqiWbDgjVmz7pdghMumyWs6R4Rhw3Y4/vjjeeWZiJyDESNGHH744RXzT62Be8vhRARAv/3tb+fMmZPakS6PT23iezc5b8U5N3PmTEhDY551zo9ZawGMc4lHGgTBueeeyxuNKVeOTcMmsad+2KMN+bOOhZoJKiVFzyq0VId0ufFCoSk1yoPNy9eWTgoTsdEv52Y01khl/YYbFPrRywbiV8joMI2bJCN1JDybBB0ILHo73zNI9lw+UFEYVMFr8VK0L0HpElYjIoKfmTHjrquu+i5nEGCm1ntmA2NqQGe8KaZJOVVJVxdJ96WJjV5v949nZgMA1+9Lx0+Va/VK4lBRstvAqbNNhAY0K9XiyjxLMphUNVZ6lWth61alELRXhoAQU2ZdSndGkLAZ3eg1ZlSHx/WfnrACAGPMc889N3nyZPb0FIk6Y7LYRgCD+YxIkbGesquKBN0ZRtR2223X1NQk5yyJdaR5U7BHsQtscPPNN5911lkrVqyylk8utZi6jsLdnh+0SVo4j8w8ywMLT6gsHGvS9UwCgIr/4rWZ+VYNPa5f0V9hjh44cKAsnKSf5nMZeEGlEgll5HR39yJaG0qSUtioWi+lEYRrgaxlrHddXwvIM6+88srSpUsxjWiAWriSC0jCIsin1vTr1+eb3zzbOVEKXHaQwVSs7i0AT6B5+q42bML+SzE5IK07X7VxTGNnQpxSd7Xx4TQCWvuIFhYi9KQEKEWc77bG3u9+97vGTzhERAN48CcP+uyR/1SOenTV7E0eTpWrChgDpVJp4sSJY8aMBcX7sropjOnSQ67ksQceeACqlYdiEMJm4S8xSo9Bql7U0pJ5mDdv3qRJk5wDXqyXvul2kvuA+agMIsfE/AOpkl+rSTzQq6TG7LzzzjpciCqYKBYUL7HEcQzGPvn0HyZOnPjqq3MhoflE/gvaEyzFAC7JeRT2z9MeZBeKEokEhJRoE+eiOJYwq5O6pUQx7x+K49gYLHAgLKXjFO+EQJmQrT6aIF1HSv8ElwrrSs8IwTlCBKqssVcwaG1oTMHYIoAFteoFafS3io75IEGqepFiQDSEAUAzhP1NYUCZWggKVMmRFPUJHBpmKrKWo+DOUWRNKepZG61/F2AjYAwAqGvu5sIxeTGXv7kNtkEetDCqAaxdiHMnATsgXlZe91Lnyj9C1/+Fdg26LgQyqaeJiGz/pB6XklEppNnEcod4Gw4RobFom8uuuLHcCs1j+o84CFpHOWh3ULSmkJjApBIyIdP4Npr/G4IkavGfWz4psnYnSrypqenBBx+8//77i8XiJrUsFH7llVe+++67Wng28lZVEB2/5d4+N2WMmTZt2vr1nZJmkpouxqgdnam1B0cfffQOOwzjFiTmcuqpp/JWkUYGWCqVpk2bxokt0JtZLL9qG3rZsmVPPvkkByspXcXl4UhGj96q7JwbO3bs4YcfLmlWW4i6LYeKz69yObmMQCOv82D79u2r1a6XAAjZnCl9Xed/7lV3dzc0TOp5k0AbZkJmkJtQrQgwGy8TPGiKQsSqIQQZOCLqs19dmnTs0r2ogp9abmSvcOWVV952221hGFJ2/5GHB0Tk3DSOSAqn8GPcSV2XE1SeQv2O8QO69q6edM07+i0RF5hGJfKs6qU5QG1N7Y2Ub9VFW5UubSGkBm0ycEnik6/otFlQ8nyTusHipVfP3PcM6y5JajwzMfziF7+48MILpUqJkJY3I0QkPdkk6q36MDc7cuRIPgkXVLqlfl44S/5ExJtvvnn//fe/8sor3377bbGjhN0ol9zdOM7lFZEAel1BntFqGtK0SmYxTFdZSAVltPzRZANeQLB2Nz1hJXwnREUKoMJoCb2JqK8zZAAQzVXnmUpnEcMw9NJy5adab/lDzj7vSTM9ljokh4izZ88ul8tG1ear2nNElKyr448/ftSoUZ7wfN+BzH6dZQwtn/MCdiv2xLsQaszf1zd7tToQ8Te/+U3jveUnv/WtbwVBQdhtq+fXp+vQrqWlbdKkSaLamN9FFvFqolF1YAHAWvvoo49u3LixKvtIhzcjo9mDXgn7gQceuPDCC63Nlm1RAxSa8XJg5SctDEVxYG5LuJ4FwcMee+wBaUEGV20HCaXraiIKHnnkkYMOOujcc8/985//bEyytVqsF1SLMaRO8a6KEI8j+KNaDWklLptXPDsnANtEWDbGOYj5vnPE504QkUVM93z7IVsGx3sogau/gc3qicrWSecMQEyACA6BwDjCmDAwIZgC5KSYtPD3I9re4544AAC185qn1gEgWoQY0AIVwfQNmodCMDAuLy+YgKKygaQAv0VEIMdJAwYgFUzW8raEssGu7s6lbYPWAwwAiHlbfYJn4J3kTOUuWSPJ9ZBn6b1EwjZ430PKJsnJmB7XOBcZYxxFiA6ojLQO4mXR2hc7V82B0vyCWWOhy2DMidyyCsKVX5hWHUGaRleJKBLxQgggkjHoHJBLSBXRRrEtu1YojGgf+ilo3RtgO4NFgJDfBABKjpOrYnD//cifDxSIzvbWpYlQ78fHhiMRYoWLvhcNbYy55JJLDjnkkL59+0Leva8x/6xr58yZc+edd3J7rCYxF6ZJ/k/fAoB0Ab+m4SjZQJjdDdcIaIQsW7bs9tunc8BFLBjPsWRDJwiCQqFw0kknRy5GgwZMusIJ+350nz3G7fncC38CSCNIaVQ/B2it+dWvfvXyyy9/+MMfjmMypp4Gl0nhLvGmlTlz5nAlrzxCILsELXDCCV8oFpsha//9rUDMMi+Fje3RRkLP/EpHR0dPT093dzejRSxyseHEQM97iZCas5JrwNudELG9vd07a74+E6EC7/k8qVtrk6OBczHKDHKsiePYGq4jZvxfcy40QzYHLaGBqt6XP5w08pnwYI1hcpvnnnv2yJE7HXLIZ5wDw8+ajCHKF2EY8oJ9aAPpg8QoUe25i+MYQL9OuS4Ybe56Rrw3rjz9R1FULpclfY/SY+I9RvA+IXimnF+tcaL5vT5sXb7z+u+REOQKIJpNLw9KuVpjDQArjkq2TlY3ZeJimg1/8IMfjBgx4l//9RtRFHOkUvt7yCY4kYtijzRq9YxddKm6mEcX42fQoEFjx45lVxNyyVYeNkAFBN9++61LL/33H/zg/+23336f+cxnJkyYMHLkyPb2dlaPzpX1bt/GPTU9X3KhPy0qSWSOJ0Xlf08u5WWjSN302xWU5juqpY38H8fxqlWrGM95GZt+yhBVTrrv06c137K8y3zaK5Z0f2SATh1KIxjQ9+X5vETVs6OxBKp4QtVuyOtPPPEE+nswKz3ULXMKeRRFp532dY9J/2qwtb6oR6cnzlN8kFsi0uuF7x3kJfxmtICIa9asefbZZzfplT133+vQQw8tl8vWJmd251XklgObTFEUfeELX7jmmqvfffdd/pbmYE9uQGo2/+Uvf3njjTc4QqdBSJrD6FsYoGwE59dcc83w4cO/+c3JWin4e4OAYoo8ZkREIsdbnFFZUzphWYwNj4UREYjGjx/f1tbW0dEhL0qH0/kyAOgcU69DRGttR8eGH/3oR7fddtsnP/nJww47bO+9PrLHHns0t7bwWiwAuPQsMsYe25aeCubC5UQZWWQMb9fOyDfeY21tCOzsZ044pAAwBAyIujEtZShH5hKRS3bVZdZbnEuiA5TWjCWutYxABHLkrtP94GeQkc6NI4FFWwS2A1GUeiZYmUf93xD++qI2JQhAExAUjOlbbB22PhwYl5odWURH6EBtdLKWsQfa5nQUGYwNdW1c+3ZbvBLsEIDIEZoE2xYzvkQNUxV8g+avj41t8P6CHIU4YwxBTBQZjAE3Aq2CrvkbVz0fb3y9CCtC04Wuh9OuAZJ0bG2/UhqIBABpW+lFXkshRAA0RAgYxK5Qpj49NKx9yAGF7fYGMxSoGTCME9fdEBEkconNqYwV+Hclfz4IoE1qb9eG58k06JFq/03nZcjrQRC8+uqr11xzzVVXXQWN2RyUZpRcfvnlnZ2dxlii2OutNJVvkPvea/su3b+MWpr3Blp13nrrrWvXrs2flayXncXE2XvvvcePH+9FMBFdn759Tz311Of/9bmKW5JGW9NnKirbGLNu3bqf/vSn1113XePGH6oF1aefftpkC3t5mNEXzrnm5uZjjjlG9+FvC9IHk5Zy4z85C7WRd/n/q6++evr06WIIStIopM4zKb3vbXHy0oTl2lrbt2/f+fPna4uuKiliLjqm78vrXnZz0gFj5FwOMYtR5QKwgctHTEpQzzne9xrzTkD9dXGqhTA88qjaW2usA6Jq+UT5hyktgrl+feepp546a9ZDe+21l6wg5L1xTEM5eV+d672KnW2t5cJWeWTWAt1gVZGiwRjT09MTxzEHssU3riMhxZETySB0JSovCW0T9O3bNywWGuzz1gWWVKAQYnI7fD2c1yHpfIe9TMDGe5WVkJmAr25fngcw3/72t3faafgxx3xOy17v+Qa7DbUPqNEf5Rk8+uij7733Xk+N6m6DCqeKGOEHNmzo+J//+Z//+Z/fFYvFESN23HvvvffZ52Pjx4/fZZeRvHlcPyx9qO8aaP3u9Vl+xawvjVnnXCbapUeNo97np0aa70av+BXMsOblpTKdZASpduaxe7m9/fr1y2NAT0qvxqQ8zEPr7OzkhHfhSukeX0sWOaRUkc+r0jjX7NPW1sYn2EAN/uVXVq5cOW/ePETkTQASMvbQIkhwzo0bN26//fbTN9+PoHnNW9WWZ2SuhSa9h987EJ0lXKMZXB6oj38iev311+vXTvWeJ6KJEycWCsXIRc45TvVzW2k/u8c71toogiFDBh9xxBG33HJLGt+oEJWgXct/ACiXy88999xee+3FalFH/UDJmcY71qB81s9DSgPnnHPO8OHDPve5zwlv5p0FRJSDgPS06tWaxOJy5KByahDUUATkaMyYMR/60IeeffbZqsaAU8fRePINEbu7ux955JFHHnmkGBZGjhw5ZuxuY8eOHT9+/Lhx4wYOHNje3i7Gm7yYDV9yhysd084X2x5s6QVBJRE+vzQbgAkJLaABcAYAkSICRLAABBgTUVoLMs36IDQADogD2QbjuBImRYQ4dhyjTFYbOUYLgAbJxQBJeS1CQLRoQjAhgN5NkyGg969020Tw9VZCnZVypGiwCbDFFAYVmoe67tcchdZwqsy9aqcAACAASURBVBhQZXoIOMRMBJD6wegAokIYd5aWQdcyaB0FOIB3hAMggEsz3RwQAVap/p7voebzrYuIbfD+BUUPVTJwiXipLQIqA3WBWwXdCzpXPtOz9oUCLQvsBnQljrZbQAcOANAlchkBgcs2VarLA59Ez6oxWfYAIOBrJAdkwlJc6I4HNm338aZBB4LZAaCFqICI1oQAABylB65vWckp1jble4+2bVABbaBrOxiyQUmta/OmA6b5XFzA25hK0oo0Lg4GIhaLxRtvvPGEE07Ya6+9qvs2CXVVFLkx5vbbb3/00d8HQUBEiIEDAgKK/dAJX/BSsHy9VzyIh9ko4nRniZxznZ2dP/7xjyGXNKHtWgCDmHg+p512WhAUwBHjWsymOHJHHXXUf/znVcuWLdNmBJhKa/JdRvvdd9/9zW9+c8SIEY2MFNWBDET0/PPPNxjN4VGMHj169OjROsHkb66StAwRS5TzWLU9qi8kw5FbMMYsWbJk2bJlqIpbSbNy+KPOKJTPSZt5C0o8KAbMeq3eEOQZzTWeFavpip80gJWDvHMrCknrjpyL5ThcAIe81g0ISSJ8NjcnsTPjvAfu9VbDoYce+vob8998801hW+lW1VkTT2DhwkVnnnnmAw88sP12gxCRYofGEGToChEDY/VZ5NpNgjT+Rbmqr0nCXDI61ol+jEa8XB2PqNpnAIii6KKLLmprayuVSpzjIJ5MVZ+E0qiKrpGa0XqOjDF86HkxLFx//fUfGb93ra+/RyDkXcEMd4+qLFZB1hz1iLwO5FVJb+A+9KEPlcvlhQsXVulh2qZgkvvCf5bL5TPP/Jeddtplr732jOOIb2oi5xsKBbzi6us1vuDQbT5XTl8z/Rx55JG77LLLm2++6Y00H3ST+6o15PXgUqn0xhtvvPHGG/fcc08Yhttvv/2YMWPGjx+/334HjBs3dsSIEcVikYPd4qN6csObqVqgpaJCo5+wJn8Ku+UnseqHqn072esDsnCSaqJSqfTCCy/k+YjUypB0jx8YPHhw/gPyPCJWPVwrjwHufFdX1xlnnMEnwCBiEATZ2fFj5XyfD7WArO2qKwyIrrngggsOPfRQUGlAenFC3n377beXL1+u0291Hzz1war8s589UmcK1x/y3znI/FbVlZ5SqDBUevr81gWNfM0soGZEHw7jBebygIhz585tvKYQIoRh4Z+O+GxcQQgSoTHE+2m93m7q7Fd9Po7dCSec8NOf/pRb1QmqQoSQk2l/+tOfTj31VGlEr75AanY2LvyJqF+/fn369FmyZEktq8l7Pu0YEblTTz1155133nvvvdmE8YapxR0oteJ9yBij/QstIb2vI6JDamlrnThx4rPPPpvOS6wfICJID4bxVGFC7QSIWC7H8+f/5fU35s+aNatPa9uAAQOGDh06ZsyYUaNGffSjHx01atTw4cPDMDTGRq6y9pY2WPkQn3sDwPmSaqE6oVUj9Wp1PmYAptnRBkuGA4MAwCRNDpDNRrFilbJEBGMwcgREfDYOABhAB2Q4ZJlzrNgUS1FjrAnAWRsWAQ2gdeQMBqBkZVW8v19A5nsLAxyYqlQECwCAzRAMbGobvn5t39g1WxM5KKNj/QeVXFdHxgKicc4hEIEDisKghD2ryusWha1dBGUAi2AJHW8IJyLez1NVpmg+8STyloxuG/yDgTYWs7ThOEEmdpE1MdgSxGugtLBr5Qtdq18KaLHFDRbKHF9HR4QADowFAgBHnF4tx0dVxGgMaFLLzHCuODIv2CCIyZZdc1epv2kb0z7sQGj+EEA7QBMawyndUrS7anRDaH4bkf81QTufel3U06CefZD/01o7btzYRYsWrVu3Ll2vS3SZXr0Uz6Gzs/PSSy/l0tq1QNPG4sWL//M//zONBznnHItqow6TlQ7vtttuu++++3333bdJqMg7IY0ApfHTu+66a/HixewnaNONVO0YzhdGxBEjdjzuuOOktEtqvTlEi0jDh+/45S9/+eqrr5bopEmL/mhnSXyYd999d/r06ZdccolnOue7iohywngQBB0dHW+//XYtn9NDDvdkjz32aG5u1mGgvznDemKQL7heoQ5Sa+yBv7WnyuYybYXLUrP3MKkNwpC1O7FSbJTELpQXhcu8tX1U2UnCPvnB6q7qz2leltelZc9DILZn0xz5zH11OEODszB69OjvXHThscceu2bdWnEV6/sV0r1nnnnmnHPOmX77HUmeQqJfMmEXiRChyjrkKKrJloJCldPqNZIndfnVCwRUdYx5yp555hl5USz7fHxT+JQD3J5zW/kWEQI6IEQshoWlS5f+9QOUHhhj2NehildcIVEBeb5xgblJohUAdt555yuvvPKrX/3q/PnzNSVruhKnUdLqefbfeeedr33ta7/+9a8HDx7kzRGkkSOQPBQOiGOlQREj+aoOkGVDPen9+vW74IILJk2apC0c3WeR214jokcgu6ctiqIlS5YsWbLk0UcfBTD9+vXZfffdDzzwwAkTJuy5554cofOMqDwa64tovSQpgh3ThRkRMt4CgPetzdAF4h4zI7/22mtz586FakTiEZtw1siRI6u2zL2VErq11KK0w8OMoujll1/2wtB5/Mi7mjX0oPSka0vgqKOOOuyww7Qm0oKLUWqtfeuttyTDug72dJc+/elPE1V6+75e5tfclP9JI3xThcnmQVVBJ1pD57XV4j4PXn/99UYsrvSLsNNOO+2yy0jIsrkUvvAEUePjqgrGBABRHMf77LPP0KFDFy1a5NnDQtUiFkS4vfLKK7KrIL+Ww5q618istkZGjhx50003HXbYYZ2dnRrz3rU2k+Ri7dq1X/rSlx599PfDhu1AVHlMNC8nOkgPtU8KWbmtLfC6PUdEnDhx4rXXXrto0RLvV/2up08rqiGlChNYcs5aWyqV3n333SXLlr7wwguI2Nzc3N7evtNOO+22224HTTh4j3G77zrmQzwQk3rZaU8Mka7E4id0U3J6SizDZ3FkwLQhNqc5jAAAhgw6jLlOIZJJN7pwzR2TBmOJ136pEjN3aYQLDDiAmNCBSU/nocpSlQMkJLIGwyBsBiwAgEHfLIa/FsO/FyDCeksbYjHPBzkRAIWA/YLikKC4fZla4iS2CAAQIFowjGkkgJin3CAaRAR04LpD3NC9fjHABoQehJiAtLlMYKjG6WZbbTjb4AMAygFzAI5cRM4BxgQRQgTQDbQOosWlVXO6Vv0Ret4OoMNQt3MRERlCisE5AgCujMEJXZBIAz7UjI/NMUTgYkhyLh0FxvBPBBhHtuzCnnI/bBnXf8cJ0DwKsD9BEVAEWIXU5ZzcvHLNG3zb4D0FVGWnjDooM6GlGrZg/k9rceDAgeeffz5RpeC09y0+jo7VYRAEDz/88IwZ91S3RxHSwouJjvv+97+fniGQJjUQIIEXFDDGINrzzjuvqaW5UjylMdB+SIOviOrs7u6+9tprIXW3ePguPbYvGZNyV0444YQBAwaoFURCRGtDRASDMcWnnHJKe3t7RVmITWYNYRoXc2SAl8qCn/38zuUrV0jIMt9PPS754rp161atWtWYoZwYUrvvvjukJ2xWneW/FXidEbcha9aT51VSurufredyDqTmIBFxEaU4C7oRba8TkTyQj05Kh/No1I9pm9K7w39ytqMJLEGGVTUlOyA2JmPixSgjx9ZTEitJPNskmyl2LoqjKPLIpj7y161bt++++/70pz8tFPgwtEztjlovumTfaHj33ff+59XfB4MxcVIx6FCO8Lt+Ufbd66n0JlezD+uyvOySZzTSvD7rmdWqSmaW1DqEPlVcCygGL7hPic5NOlAp1JBMy18DvHQtBkwT0GTgXkC8cd536Sb3TTqODBGWLl26y8hRP7tj+pAhQ3hNxZjknOX8PFJaMZkJIwzDF198/rTTvsZuM+NcRzDDsOgNIc9foGwSTY3ep/WLX/3qVw866CDtXqkeZorYCkloRBHFXGZR/5pSE61fv/6pp566+uqrjznmmAMPPPBrX/vaXXfdtWTJku7ubpFjuocum1DsgddzImLuc7lUcQ9FAECxQ6p8qGFiMM5V1DoLGedcoVC48cYbuVxv/otVe963b9+dd965qr6TZ+S4OVSLFho/wsUsbTimqV8x6XlB/BOfR8ekKLvd+RW+0IGb/FxIaWPdSXmMuWPBggVVc82kTZcmtvMrffr0+fCHP/wPYzVTtULP+tdaOqXWK5vfE1adzPtAOkNTBKaW/PxTHUbgnxYtWlSHJfOw++67t7a28jnLKkxmAIzYw1sJjCTT9enTZ6+99gJwlB53LeQnxak9Ml60aFFnZ2fVjTUSnexVSkiTiLh+/fqPfnTvq6++GpSxVBVv0qzklQdBMH/+/JNO+kpPT4/wV16weHLAGxGDvCWsB9WIjR8bNGjQZZddxhZy7TFmTDX5MybngAgd++aRi7tLPT3lUuTi7qjUXerZsLFz+coVzzw7Z/qdP5s8efIRRxxxwnHH3/qTWxa++daGjk6THmQSk3OATLE8U94yrXPs3CVcZkwgp4cbwCbCooPK0ym/1RiMY3la+ZfWjOPrCnZEm6KKOVbm1aGDwGAIkJwOLpKaUpupFkLfF7BJBlPV1/kiNV8MgAEMwPYNmrcPW4fF2CeOM7vGUm3BtgsJ3yIiUQxQCrGra8MS6FoBsBEgQkBrrNdbT19W7VVVq2gbfGCBlFMttFHR64hgiCgGKhtTAtcB0eKoY27nquehZ0HRrAuwBBQDEToiImMQlWwRq1gaJCIAjrZUvs7XxhgEg1CMobkU9e+BYe1DPxH03wtwO6IiYCENRLL4a4iGt4SL/z97bx5vR1Ukjled0/fet2TfwyIJTBIMghiJIoIsgqiIyDKIoAbIiIKobPIl4Mgu4iC7EJAYSUYgIoiMKDM4g/xA1iCyBUgAAWP2Pe/lvXu7+9Tvj+quW3267303Ichi6sMn9O13+ix16tR26tTZAhsLWtuTyRHdq8knHsRxvH79+iOPPOqQQw7RNIkqKZ4IJkzt9vPPP3/ZshWN1A4G59wDDzwwe/Zs3ioUcSsbm6COnjnn9thjjyOPPGrp4iXpeAo2gbyhkXJttMhmdbE4jufMmfPyyy+DWomydsQGY9dDGIalUumYY47xmjPZ7EUTJkz4whe+4B0LJXWLYtZZQK+//vqdd94p8ZuQlRq6Zj0jy5cv37BhA7QmXLgD48ePlwrfpMx9i4AxqY/f8nsttSnrWtLWhchc70H7r7URK1+JpQpK78Ksc0raBZUiDbObBNIlyroPIOcmy+iQaTG91S/lgcg5x54a70+6Tsj6qporJxqIqL29PazWDjzwwIsuuii/vrzyHtXwfP3oRz+aM2eO+CVJhUXI8pS502/Y+OGUbVEUiQdECuiG9AIRjGlK8BCCRYFOEosnTgqZX8hFtqIK1ILsqvEWaeurqUU21SJo5gwAfHEzqMso6oSU8+JBmry/T9ALpElP5JkIarVatVqdNGnStddeW6lUEK2gWoSIRBLJt3Kwt1wu/+53vzvttNM0wqU8Xw0POc4AWX6rF75MZb7PQielUunGG28cNmyYt8Q2dsqyqKgDdyOO49dee2327NlTpkz52Mc+NmXKlDvuuGPdunWaz2he0bwJGYKQoqBC7Bp+kAUoI9IdgxYoU7icrNwgCO688845c+ZwpLmuAYt0A25uhx12GDVqVGEBSPm2yR4ylYnTjkj9OTMQT3zLXpRsUBFRGIay+aSZkrReiGduV/7qsmdL+XnVqlXevORBz8LWW289YsQIlDst3r7wyc3FlPQGT74JkVNvUev5qkgsnxypy9Lgkn3yNwBYuXKlLIE+e4KI48aNA7UQ8hG+mxdEfZo0aRKbhELh3vAhK79WrVq1YsUKSOdIMweptmUBZwBg3bo1q1ev/sY3vnHcccfpOkGtCwmUFpSKNK9UKvfffz8Hs0tn9Ics5oRbyhjzUkAG23xhsoUyZcqUI488UhdoMmqtZsgbIkoOU6tNQSKqVqtdXV0bNmzY0NvT1dW1ePHi+++//7vf/e6+++574IEH/uDiixcsWICIgalzUSEzIuIAEf2SlWQ9WAOmH1EFwKiBgzGGHEAaqWSRLBLwGWBM3JeIYAAsAhACGQ6w5EGl7jTH0ZfOOYn0S8Zv0CE6QIIAIIAs7kRRhn9iL1gimAkNpLYfAEEA0AbB4PYB7wM7zGEbQeAQANiVUzfpwfBtRYSOyDkEZyAyphfCtWHX3wDWAoQEMW+Kp4TisOgiY1CzkH94r4JmBFugOciaVUKO46aZ0xGRcxQR1MCth2gxrX+ua+kjbsOCMqyy0IMuNkiGkqqS+Br+SYBJoDihA0NoCCyIsFEED+gcuJgc2TCG3rCjascM2nqv8rBJUNoKsAMgSBMmSATZRjsfPfrfQiGbHbIWWvJmk2wqU6m0d3R0XHLJJQMHDkRMDtBpFZzDBMXgMcbMn//ipZdeglk/gvKTxkRxrVa74IILenp60pcJJYjMEveBMdDR0fEfl/6oXC4DQLrh3fDe4UJqbIVEPZOGiK688sp0jJSnVWV0OQD4xCc+MXHiB6Q5zJ7qFRfVSSed1K9fP211EJEBdFHMbsowjmJKNkKR4Oc/m9nV1ZWqAxkfjdc3SHXrJUuWaKdVn8AJ0aB+ruOdCHktthEZi0mpC3g8x3NheD+1/q2nXluqeglIK9oXQOnaIOVQ0JU3UnbrSi0BUoEWkUgEStZCnTIdUeJtcJwvqH5ntyNSW1PNHRwa+vXr19bWFsfxySd986tfPgah4Gy16ls6hARFERiqVqtnnnnmY489YUw9GQhXEscxRwSgiknUVlMe1bLoxKAVAJURUndPG4GFsy8vpQ8SG8L/MkhDOszWs/FkjjLzqLGEUL8K+S0WfIXzS1kvrWLjPt5aqV88O83H4v01iiL2BR988MHTpp0DaeoGLsl32joX6dN5kOG3UKlUrrvuussuu8xa61ymw6VSqd7DzAoigIbeWFB3HBWO1Dk3fvz4GTNmtLW1ycsWkFSIigJOS2kcE6TyYvHixb/61a+OOuqoT3ziE5deeilnbeONsUYIz79MVn3smANAdhHpN47jDYE4CZowK2igxuu/SroDljucyPWRRx75zne+s2HDhha9TozPPffcU6788gqLbS/rS/NbXVXGK4GZNBHJSMEfIGQpLd+xQgygny2OJKBM3LVceO3atR5/aApm5MjRpZLl7Ks572SzSK7NBRvT25bqcSpEtLAA5OZx05ZYI0jWPqgU5450PLtHV3r6moNzjudXG3HNPxk9erRLruTNhDcRcdaszaOJKdwmNLPtttumbqQmheuwYcOGpUuX5rml91UjlSD70wFAtVplJnb11Vd/9KOTARx7rqW8fjbGyIkKETSVSvusWf957rnnm/T+N903eaNfaj6WH4u3/PO8kXt13XXX7bbbbs3RJX8S/sOhgwmWCOTmQz4pJeM1xlDsqtVq5OLung091d6Vq1c9/ewz5194wacPPODrJ/zbs08/Y9EYwDiMwjAmkv1vy45HSKVnijGSE1EGgkEO2wBLzvlISWPxnIqLBMTEL5A68TMD5gnyhq+UCUjCOMmQQ4PWBBXRejS5pB3wk4n+k4CwGOcyS4jAAFQA+9nyVtA2MqK2GEpAmUTRiBC5pBKeiMT1QxRghNS1fuUrEK8E6AVg36bowQ05Wn7ptmgkvHtBD7CRRtWiDPgnAc0cEa1LEgiSA4cYB9YZ7Aa3jDbMX7/sibDrRUvLAtNjIQZ0JsNMAFRIC1H9YpzUC08sGFNuw4uFYkcAhrCtFg/oqg1pGzypY+THINiKYKCjCoJ15Gu3VGRVNmHfnjB7by+BtwVkTTnnjAHEetQMQytKJ0+itdaYYPvtt//ud7/LB2P1X7V3QF4GQXDdddc98sgjXrCbbnfmzJkPPvigSRNgeXay7n8c07HHHvuxPXYvB6XER9lXt/kBG5z/agIsL9gZcc899zzzzDN94keiRU488USta+olgMpL9aEPfeiTn/ykvjaUUs+RS8/LiB+EiJ566qn//u//FmxI06gy8UlDvIG8fv36PkeqoVwuDxs2bKM++ceD5hKN2Asp8Gxs73OpU9MGpW4see/UIZq8sC50pcmiwNQr7dnb3pTlH7y2vHicPAYkTED64NSJLX6QkEC90JqvCC7Z1tZWKpXY4rr66qv3/PieeQ3TQy8/W5P0DQAWL1787W9/+29/W5ioy6lJL94W3VWpVsaF2WPIlI1wIeV49WbW657Ml3SjUfyjx9YK5wVyLEVXVbc6suTnzXIhzjW0wrUagdCzoFFa8aqt75Qob4s3fP1S8MPBGhvbsSiKamFvUCoBwBlnnHH88cfH6p5xmXfptp5ZeS6Xy9OmTbvnnt9bW08mCwBtbW2c8xTVfgB/xGqPRypCVN46FZCpdM4ddNBBs2bN6tevX5/LpxBU5T5uNS8SFsRhRC+88MI555yz5557XnbZZbVaDQB0/tN8/Zqb8Utx3GvEavYlC0ovTFCSSyQ1ZFNb8CfGmDAMa7VaHMe1Wq29vf2222474ogjlixZ0iJ5yNo57LDDPNx6MyLIEaeqrDi9Zuv8M5uygx+ontatHnvVqFceV/EmTrvRNdvxlg/vxbZOMwMGDNCL8R8PzTGzCfVIbd6bPFYZhFe/mdYbVdsIq5r7NepYHpxz1WrVOzBh0kSWAkLkRMTZLVDliN/sIwW1fvlnrVaT/ZUWwTm3Zs0aVOd7hC2zAOWsCB47Fcj/jKIknLm9vX3WrFmjR4+O41gLYom0lQXO38oJACIql8sXXXTRjBkz5c4rBsZ581Wj2aN2l2v5qHsu0zRkyJC77757jz12bzJRWvo3onzNWnWvklEDoTW1Wq2np4e564oVK2655ZbPf/7z55973pIlSzgJu2bpkC5SOQuvVxkiGjADidojh+x8BADJI4AIxHFQiMRXfVPizU5LquEZ4jSSREkwpW7MxQBJzs0ErC0BGLSc/a0YbbJINjuno3eyd4kAoW4Wpv4aJEIgCxCAHQDlEW3930elwTFUHAaR4MeAA+CU4kxyDowDAwCOIoLQYnfUsxDCJQAbEGJKkloQIpJKBdUI8kLuLRj/OwI8Vcl7D1ucUznQrK2unQORixBioB6IVkDvy90r59bWPxu4RRZ60IUZ7yShiwEcILHmpP6LidPdYrI1gob4jDYYQokfJyhFrrNKIzuG7jZo9CegvAPAIKCSMYFQtog9LZKZ/VFTnQOye+/wnqb/twt0HCJLstT6ssYErWzwioqAiG1tZQA44YQTJkx4fzrpcujYz8fEIr+3t/f73z/PJSegHd8Kn9KMWbhw0aWX/ocxgYhqACAEtImur3prtt569NlnnxW72ATY2dkJ6QV0uquF/RcF1+U27fOgS/K31157bSNFR7003Mlddtllv/320/3xlkA6RoeI3/zmN8tBxVOD9INYJozAmTN+Bi6OoprupPYUYGrYx+nFqc0H6yGqUql0dHSAWtTvQBBSaUXl0PxTc9T8v5oCCw+deMxKv2nST68b3pv8Qx7zaR7JDDnpnujyQi3OJVGUhMB5j7hY5CQzUUtn0KQVRki5XCai/v37//znPx8zZky95wZNYPPYQ0DOYuSiOHIxGHzyySdPPvnkdWvWJye1k9EU5PpsYkCqP8acvUv8I4wfaxGRODaB7RxCYK9U4YzkXWBav9eBV4I0r2PeLEj9yYwAmYCzmmfK50eXp2phX33MUxHo+vMGsFMhC8I68t3Ij1T8O6hCwqGxuMcGZx6di8LIAXIBuPjii/fZZ584jtkVDgC81QI5UiflO2Yx8bWvTV2wYAEor1mlvQ2t7xf2epWRO4qx5IcvsyAC8fDDD7/zzju33XbbjNrTgiqLdYu0mINR6u2SiF02RBExCIJFixZNmzZt9913/81vfhMEQZN4T290TiVJ1CurUAAREbsa5adseAiTIaI4jjmHL5+P7umpEqG1tlKpLFq06Pjjjz/uuONWrFhRyK6bIGrcuHG77757c4EOatkKrmRvA1KeUFcAoK4J1KvKOaoKxYrHuvN8Ser0Tn7kYaOEMoBjpauBj/JtO+vQiDP3CZg906nnwmOh+hNoYVltQk9aGYLJXr3VvLCwjuaKB79n5ZYdhaguwYPGjPRNAqXqojGms7NzozzORNTb24tqix2y09eiNQEAAIksCMO4VCo558aNmzBz5s0dHR1GnemWdnVzlNlEiYniIDCnnPLtRx99PHWPOkSyBhCbTZZkNJZWhFd4ZoJIBJF3RDRy5Mjf//73Rx75r5CdLN1PXadXWytyHwlclIQp8JZPGEWAuHzliutvmH7oIV/4z1mzw7AqZyuNAc5uqWsjlaAAAAxAJ5lOhBJh4smSbiW1KIwk3xgeEug+p3605K9C94woACCoB02kQroEiQsSC1Oq687AZgVM3eqbxrPeWqDEB5OSS8ad6mIEbIfS8I6BY1wwpOYqhAGPgVUOqYbRbiwAOgAwQOBqJRO66tJ49asAXQBVhEyyHklrqvryT+qOaSRj9Js3uUH3ngQixaDRAcTWOHIbkFZDbWHvqj/X1j4XxItL2FUyIUGMjoSTEJFEbRMBb5kwvoX0lPLKNJmEAaOxBKUwbu+uDgj6f2DomH2hcxyYYQ7aEUuO0GBGhMiDR9uN9Bihh7zw3gJvEUgUoRgY0AIXotQ9wTLIWtu/f//zzz9frALKHoHRoop3RP/whz/Mnj07yZ+YBshwtZdeeunChQtFiuU1AynpnPvOd04dOXIk6y6VSgUAPLO9kZEmnWwlEkEww0mp5s6d++CDD7Zoc8ZxfOyxx7KPz+tSnucj0t577bP33nu79EQ8KTnl6RnsAL3vf//w+NwnyuXAGJATZI2GI3pJi8tKa2Yt6u5vC3i6YKMymrcI5aPKeS+ELUMWfGrlMu+prFu8DXpCWZAV4dGe0O2TgAAAIABJREFUN31aERdKQEySFcmbOL3tWteg58uzbYjIuUjUYlLxuS3imaFcLnMNQRCEYbj99tvPnDlz4MCBbE7oHXv+VswMfZkyf37PPfeceeaZzkXOJRu6GsNaiHgqgTdGPQXSND/oRVRHjnZMZLdSpHKhEC+EUE9NofDS0wc5AQe5+0ykOQ/teshi627yemw0y5hOjcZD/it+kDPXhdUK9jy/ni6MDbYTZNuMsT1o0MDp06dPnDiRQ9FB7bVAjpeiMgKttcuWLTv22GP52isuUCqVJCC9kWgARQw6mN2LhqOskYypvbPvvvs+9NBDxxxzjK6/cGa9JZnDg8+ynIq8lj5I8sRyufzSSy8ddthhkn9Tswj5V2Kd8qNu/obrrNVqnIpRsy+PPcrkhmHY1dW1dOnSp5566uc///kRRxwxefLkWbNmed8W4l83ysWOOeYYTiHanE3x3oO3pQFZHkJFzn3NwzHnX9ZzAY1XuveewXP665hNITNovDDzIKN7M3zgnQAyI4UCsfm43qJR99moFgGtfILZbR5vsXiRlZiq0FxYOyjfCiClJ3jMv0WIlfbusqd2pKrmVrwsRiZnRhQHP+6///433nijKBJSm0ckemkLa+rt7T3uuOOWL18OUF9lfaZO1qsyb30IyFIV6cCj7t+//+zZs6dPnz58+HDKeVEh5U4gDCSlDXnpKaLSnMwUZpWcMIyq1SrHVC5YsOC000678cYbJXc/qducNHvRsiwA299RJbCBZDRgWkVLRIAOQJIacG8IEChm90EONRKGzs3V6d4QAFByYNkYU4odZ640AIbTVQAigEn9ETzUt/CIN+W0yXcKsP+XJx7JUX1/AwAJEagEONiUR9u2raPehY56A7RAsRzSF+eOADpCi+ioZMNytLZ71asDRqwFuwGgkrrtEZIUEhnIUY/WHlqNaHi3gzfMQgViC6QsDyCJ/wUiZ9ABhEhrIV5YXf2XDcufgN6Xy6UNxkUIzkB676IDIiDe9gAAAEOAAGkySkREQs7EqndFDAK4mAgByERQqVJ/aNt+8Nb7QOdOYIYBlREDuZsewQLy6kiJPm+xb5nZtxUo50YRA0x0pkLBjDKziUKQXILM5Q877Av777//fffdZwwH3pIxAXs9MOsrISIAuvDCCw899NDOzk5EcEBMpg899NCsWbOMAY6fqvPGVAVh/d4Yg0i77rrrcccdR5REQpXLbekA+/amsU4g3WvCf0SKsSvWWvvTn/60lZAHotgYM2LEqMMPPzw9MFE/J0jKqcH4tMZEcVQqlU844YT7H/i/yMWusXMQERlFtVo8Y8aMj370o3HsDCA4cpRcyygX8mpBPGDAgBZNGq4kiqJarQbgAAqE1zsEPG21URmZaA+rMhFyY4NnxheqMaQ8yKCm1euSBr3udNNSPj/L+ZeZpQScRS9zjhUACNWOU8Y6ylA6K57GGE5IZC3nt2oYher1hHXf2MWIaAIbuXifffa54oorTjzxxCiKgA2e2HmHvMiA3I6KBBQ7ZyJrccbMm7Z539bnnHOOc44PchWisdCrBYrOnWPNNkaUHA6MbYOIJj03lx9Xnh5M9lZxKexZDqAsPY/dERGw0k3gnGPNk1NNGY7eipOUoMIQXHqtaqFBIqZFnmu1CMogrD8YY8g5MMblCFgx/AyuIMuXtB4rZbQ/WjfqEb9Xj0nv3bbWErmxY7f76U9/esghh6xbt65UKoVhKJ9rYtAvmbeXy+VHHnnkjDNPv/qqq+MoDoKgUgoMkCNAQJe5MZ0nNJMlA9I8rXpevD7LoMQUjON4q622uvHGG4855piLL774oYceYie5c44IBZ1QRNuoNkucc4wVIh/bGnuU2t7cvba2tiuvvHL16tU33XQTKsjjnwUENb1AOQ/d3d3/+Z//+dhjjyFiuVz2wpqIiNMlr+tav2rVqsWLF69YsWLVqlVdXV0sMWV1NG9RExvXP3jw4KlTp1IDu0AQgtk0lLoVvTwhVQAasWvpIRc26oY63f/mNUiXQAkLRru3M8GpUfucBamqWq3m37+90GhqmoNeTZpWM8Kai/xDfLAkzUHqJSDgPiAmJo2eWWrhtmFjTHt7u3wovF2XEQ3cWhuGIV9jCIkOqZUutxnDY4WZsEyJoqirq6t1VsCgSVfLPkwd8Xq7N68sqdWU+O9Ea7UW4zg65phj3njjjbPPPtsYEwTlKIokCpKyWjqkzF/w/NJLL3zrW9+69bZbwlqtZFNm1UzBUUoUkTdNntxknqD2qmNj0DkMgvLXv/71z33uc5dd9qPZs2evXLlaCJsInUt24Nj9BC7Zb673oIFy4qFLLRbjHCBSrVZzQdAW2Msuu6xfv37f+MZJ6b510ihRrPsvExGA7U/Y5viWGwkxtUAExiA5HxGQ6pas20hF4jhARJ7OpFjddARIovyMIyKHLvD21ZFtPS20iOgt4m/vBL4JjRNGaOWPycI5x3YKYImgHSujOgeOXdP9SlhdHZjAAZnEP5zxsTBzscYggQPnoh5L3T3rF/Zf/wYOGgmuHUyZwCA4zIVPeiAzuwU82DT59x4DxV8IgBxFiATUA7QOwiW11U91r3gSam9U7DrjqkAxuETKAotevyoSlyWiumeQ4zIVOCDEMmFbGA/opa2HjZhsB+8CZjRQO2CJs/CaIucFMcvLrpfmsGWi32rQ6JXYKzGNCoMomVow2dapm6xEseSdRMQLL7zwoYce6u7ullQvhdo8c+NXX331qquu+v73v6+DHS655BL+HJSRoK0pSIN34jg+9dRThwwZAikHrlQqsv2mh1moconhAUXuJ40iNVhyzv3tb3+78847W0Q1EX3mM58ZNWpUumYLCkhPiGJjAnLxAQccMHHixGeffw6UapL/MO0f/OrOO6ZNm7bddtuxt4qD9MWpiunGOCtVo0ePLpfLnoWjR5o+AwBYa6MoWr16tdfbdxqIMtOke/xXPdd6ZiGrgIrjQ97wT10Ss/6RwtAkD6QJHWvg6YvsB5eVIi+1iStVpcvDH2bG9WKMMSaOI0Q0yueV3jRSj8xqvp2MWYM/qdnawGB6XsfGcTxlypQ33njjggsuSKgxRQtnR+LuSbSmRi9RfPHFF47/l3FHfvGLURTxMd7WQeu0kOU2GpnQmE40s2LwjAHhkJ7NoGvwHiC1eJNvwe8JpZeHeF3KV+vRSWEHWoF8eT31ehVIAXapgIpeUYwi009NqEJXMtLC1SQPjFtrLZ/mFlPNOTd58uQrrrhi6tSpbMNzIAxlLUa9mmTnqa2t7Sc/+cluu+025SvH8p3vxhiCiB0O2WFmjmHyK5aPhZsWnjiTlyY9/nnAAQd8/OMff+ih/++qq666//4HarUa7wQQ1Z0U0pBRwfKqXUJ1zaBRqR7zi5HSOOhyuXzzzTcPGzbssssuc9nzzuIp5m/z7t1C0G319vbee++9v//97/MdSApzbelP2SoTEmrSUCFw+RNPPHGrrbbyqMhbR6BOhDRqCLGe2sJbOx41am7QKMLRYyz5vkkNQhU6EEy6zQ6sFlEBAOvWrSvsz9sIb7IzWhbLQkjGi6k6kuPqmxcDRARFMo6IAJOLSiBLGJDuDTSp1lo7cOBA2XWot6VG4YUuLlu2LOUP7q2bZJHFRBRFkbW2u7u70bpuVMPAgQMhp0ILJ5eUkZBbbsJOhdVzgVKplNFwiM4666zXX3/9hhtuKJV4yWSy3Gq2LB/ym3K5PGfOnI99fPfvfOvbUS02GCBin/6VZMECShyriBVv1vRmoSAEAJxzo0aNuuKKK0477bSf/nTGbbfdxplGWM4GQRAEQcj6mEWRZVInPwtCCjWZvJYiNGktnnvuue9735iDDjoI6g7oDNMjpYgaoDYw7VEcuPRuXJdOUxwRZ+rio/Psv4oJHCDf3y0TqhWC+upQ93qza5iNHQIgg4SOKE6SJmapqsnP9x401kcJHP+HiDZdLMY5R84AtIEd2DZwB9uxLQX9YrRgrEtRLUBEhsBy1D3EiIQQBbZK0equNQuAVoLpBYi1P1MrIiAbj/UtNaP++6eDwhUI/wRU2iIQEZMQIm+wVwF6wC1zXfN6V811vS8GtNJCFVxsCAxaciiINAbRABowFtCw7psmnYSYwDkEh2BSf6KaAUMuCF2lSkM7R+7VPvoTgCOA2gk4dhIRDXGSA0W3mAaJeFPXXP5tmeh/GLjsLR8ugUhHLwoQAVHG2yh2YKpe4Ic/vNvXv36iJ2gLm+b3l19++WuvvcZnKQzgnb/69X333cfHE7TOoY3PtOPu4x//+JFHHpW8cRQYWypZVpNa0bH0wBt1T54pNeeCILjtttvWrl2r6/Ee5KcxUC4HU6ZMYRWQ83Q559hO1vzfJQl0iIiq1Wp7e+W4444Tbbj5QIBgzarVs2bNstZGLnaQSYPthfwAwODBg9va2rzh6zLpMz9iFEV//etfKZud550GgswmpoJWA/SxF1ajTZrniIEvDpYjyQyCWA+9DPocXytdlQ9BWdR5xTSn+NUp0zkHjuSYja5EbvFGRH1bsTWA4FLDIODwSWOMc4K6lvKGc22iW7Pa7ZzjtXnOtLMPP/xwSW9vTIBZv4COqoD6iUWs1Wqnnn7Kn5+aawDrt6k27UMevUQokojpVvAJDTx6BuoeDZkR0eN1eUrdDUIGQhvev3UgMJD66Qjk5G7CVYDCODl3FpOTW8s1JXvhsYKxFkmuEfbkW33ELE9m+o1nCnrg+c68yNlCtqxXQdpEfd9IS6ijjjrq9NNPj6KoXC5z7B7kGLU8c5QKg7WlU089fd68F4MgWLt2ba1WA0QH3jB1Au16VyXOTny4mki0j0kPk1kH27f77bf/XXfd/fjjj5933nk777wTm9+IxH5Ya225XC6VrLUobEcTkuwIgjJiBXUeMomI0z4aY3784x/feOONWgp7ElnchZq6GpETKtsYFN/jPifcshTYUmCDwAaB8E/hjZvgnRTa2GGHcaeffjoASBBQvqsaRYWKh6BO/jXGiEzLEE/u4KIWo6DWTiFVkPKvcbSv91dS5h4TSb9+/fIjagTGwNq1q3XNby8U9qHFjglmCt18+SluRdBvMvCkyuYey80kvtiRi+ruKo8l9jlxI0eO9Hi4kJAWNEnlAG+89jo/G7BAGpmbwSfgqRBaBC9ZsmSjKKpUKg0dOlTYi9eEFnOQWzVKyUFOW89stlwuY3LHtJVcw1dfffV+++0XhlVjQKIfKI0t0ytOZsc5F0UuCIIzzjjjkUceCYJSGMZE1OA2lhyWIOPr9LeFsnvAzjm+L1sGyC9HjBhx3nnnPf3003fdddfRRx89bNgwRKpWe4lii6ZkAx5vpdJeKlVYHCSfJ+nr6w7QvFCWYQpi+UBbGMbVanjOOdPeeOO1KKoRxSzdXHorAAAIwhHJQHkAQBtiAGSI0PE93QD561L4jTgcKb3IGxRXpeQIAMfxIRlPrmQ22YwJwBq5OEBjVSa1pel6N0Mz9pHZ0UqSDhhjCBFMCaATyqM7BuwQ4oAYKpTLH6pUK4A6NccWagF0rVv+IvS8AbABINSHR7xe5VU0j4NsLjy8k6EQLfDPQZ+tAzOUhDVBDFBD1w3RUlj/4rrlT1TXzSu5ZSVTBQqRHABEUQyYbMEZY9BQmgEDoI5h+Qnyk+mRVwahQayE0LkhGlIZ/MEh79sLymPADAQsAx9ZBURANAYUD9WUrF8WKo5vDba2QB/g8RmTO78GWXOdQV8+2NvbKyYcIjpH55577q677sppqiBrU2ky4Ddr166dNm0a34ezdu3aiy66SOtqDEadiGE/CEvACy+8sFwuST9FWRTjVlsjjcBjvPq97qr0Yf369TNmzCjEYZ6MnYOddtppt912Y22AbebEBxwliWM4pVcYhr29vb29vd3d3bVarbu7+/Of//zo0aO9zjTp/8yZM5cvXy452rz+CAKdc4MGDWpvb89PrkyWVjfZzH7sscf6xORmBLljemM/lExzhaCZD0vqtra2IUOGDBkyZNiwYcOHDx8xYsSoUaP431GjRo0cOXLkyJHyMHLkyGHDhg0ZMmTo0KFDhw4dMmTIwIEDBw4c2L9//87Ozo6Ojo6Ojvb29o6ODnYxFPZB1EqTjYX0ykgnRe+UNzKYfM2N3ogzi1GkpxsRJaxMNyplCuuURecFFsn9yNba6dOnf3TyR9iKFtrTI2XnhZevFtEuXrzkhBNOWLZsWRCUC3Eo4OGNV5a2G8UQypev6xvkoy4vwhrJL/mpl0/+W+kPP6f7QC41oqIVK1bUq4L6IV89I17/tSG0acB98Pinxxbyo5ZnnWVfPvR4b96vKp1HZbiS8gJ7tGfqlgsCwPe///1DDjmEQ+wxtdmcCsCXCl16IoorX71q1fHHH79mzRrngI3eRitUNHk9BAky8taODFBr6VyAPXR8f1QURf/yL/8ybdq0Bx544NFHH73iih9/9rOfHTBgACfH5AWo+8D7Inn+oIfpkaKeCEpl1umnn75gwQKJu/SIk+W4HFbQfyqcLH5gmtHEw15guTpWnnlcIvIadbgJ8CdBEEyfPn3w4MH6faPyzrkm2VcKsJdGd7a1tbW3tzNLHzx48NChQwcPHszSYZCCgQoGDBjQv3///v37iyDo16/fgAED+vXr19HRwffFS9JMIUVZKaR2YYcPH95kXN5cAMCSJUs42K1Qe/nHAGVd2x60qC1I/8XVq5c/pdZI5mf6IWUVxc0FnsNLN6H/JP1sxUIfO3YsKJbLL0lBhvsBvvjii5t9XAIezQgjjaLopZde2iha6uzsZNLVWBLZJJICVZYPVOfivUUBAJVKhVPJexWWSqVf/vKXnImYRY9mKboGGRqlojaK4qlTp3Z3b6hUKuVyW58RlJ4wMmkMuJZx4r4E2erI4hPVeYsgCA466KBf/OIX8+bN+93vfjdt2lk777wzX2UmF53xBhWq288hFQSiU2n06t7KSuSHMAyr1eoLL7xwzTXXoPJsSvSGHqYxJgDbCaZCEDg0RtyOLpv1BAyAS94gsK+SkoqSNHIOk5WcNgAuu91NiEDpqU5H7IOFzHh4gb1V99a/u4CSRE1kLJKrO8qNAWMMuQBMB9jhHQN3qK7ZKupaEWDNQA2yZz0Q0SFYEHw6g0QUVmxvHC6qrXyx3D4BcKBzaEw7QYxonYsRTWFASl5Xzuup70loNLT35JD9aeXwDfDnWv/L73mDwTlnDLk4tLYKuApqf+1e/nC87i9lXBlgD8ahSVmHZC8xBuPYGfE6EQCAQ0KDme251DuZam/GEZAxjsrVeKBr22XwVvtC2/YAg4nKwBm+0pBJ1opBWThpnwv4aXZQ78EpflcAn7oS90Qq+ME54GRZ4Iiy4U6UbtmxHHEO5AZP1j369eu45JJLDj74YFHmPO2BQWh7zpw5Rxz5r4cdetiVV//g2eef0ec7OJiIgNCgi50o+uDwy185Zu+99/buKtUKbtJJKNZgZJ9cm16FKNICPgiCO+644+WXX84XE6GsY5EI4bAj/rXS3oYGKE5qM8agNYhoYyutO0JEjKOaMQYc9fT0vG+bbT/76c/87Oc3ExF7/nV/NBpZoXnjjTfmzJlz8sknyzk+jedEZUQDQEOHDt12222XLl2K2aA2yK5ESk9KGmMee+wxfsg7RN4KqYQptFg+ZVZg0bT4FZPxpEmTvvKVr1Sr1TgmRAzDKlGiNaVXHzLls2bAnogoZ2wbr7xz0Zw5c+bNm+dZAqDwrH1D3mBdetxJ20Ly4JwDx4k5MnV6HFU36ljTMRg7Z0zgUj2bHS5SXvxKns1QWCeYhDl4WOUspQQwaNCgmTNn7r///kuXLgWIIA1qw/QMrKBRSzoAsDZ48smnzjjzu15UUWGv6t0DQDJKN66ftC0UQClqkifKzo5n+ZTL5W9+85vjx4+vVqvGGPa6hmHI7nuTJkyUiZORpj6aEAA4ro2XZxQ5/jYIgp6engkTJnDrBlkR9feK8vSzWRad6LGIBsAAQZqxOuOy9LyEhSB/EiYsPzU7qvNwTPJyyrRSmiIgjmMkwxSu2RcRlUqln/zk+nnz5s2fP1+ni5UJlVUgSyyKIhPYoFR6/PFHp02btttHJkeOzzM1C7XOk5lMroxO5GYeRemfXKVSAjDVarW7uzuOY2PgAx+YuNNOO5188reff/75//3f/33iiSdefPHFV155paurK8EPQUysFVo+H0fo6lpi01UgSOACXV1dF1544axZszRa2O5I7h5wJPG8fdYmjWqpkSbVBAAgR87FaA02Dn/2BXGDQ4u6P5dccsn++++XotRCjg61cGwFOVIDd//QQw89+OCDwzAGcExUqFJ+yVr2KE3zcBaU7DRn5wJnISCiD3/4w4JDAVl3zAYBgK99h6ywKEQRj3H16tVLly4dNGgwz+NmF8GFeGvGSBsXa7FyFgUc7e634tJkJrmvNrahpp1ICKJwUPon317FOoO3NBrB9ttvn1SFrFwbkX3gCA1K4Hwcx2hh/ssvbdiwoaOj05Ez2Pep5E0GTPcYWK4988wzjctm/VUAADBs2LBBgwYREWc/zyuQ6ZLhSPC4UKsxhlgCAADHlXPGXu1QI6IhQ4bceeede+yxx5o1a/TnTYbGVBOY4IUXXvrmt06aPn36kCFDli1b5vKxgQqS5aae2ckIinsgnzJU+pJH9sYYAGMtxHHc09PjXNTe3jl48OD99tt///33P/PMM5+cO/fRRx99/PHHX3311cWLlq5evRoMd9gAADgEgtCF1loTWCKiWJIQAufczyOcu1ouB4hgTekP99236syzhgwZYgCBwNWdVCCH5JyDAIJ+ttQvxgAIjbGIxfgxZAAdKdWTa0MSEZj0ANMjAMIiNd8EQCIgotg5crwnyI5qdoIkpwY8QvknBMra3orimUocuBLgQGzfptJv+/Ub/mai9W3GxBSXtPbvyATGEZm6FIkJQgs9Aa1es/T5EUMnQccgY0oEZYQAcjpcHgp107cFtDjfApsLND4xFT/+y1wgQyobnDHkXNWaKsQroOfl7hVPhOufw/Bv1nYFGLoGmjdXYwwS1W/BKeTvdZvBWAO25tp74v5Racyo7T9pBu8KMASgAhgAAIIhIMoaVNAC2WyhqLcdhLpEgmC6fWetJReLaBCDGXNbhbwBCEpbJaIDDjjgsMMOu/322xtpb5q/EdEZZ5zR3d19ww03cIVsJBhjXGoqm/RCU/5q9OjRF110ke6zKPqgDgY20l0QETbm9japp7e395prrikso3fRZdT9Bw4gotmzZ1s0xhj2vRpjIhcDADiqZwRj3cRF1to4jOI4Hjhw4DbbbMMWu3NxvkWNQ67npptuOv744yUuJsc9kr6VSqVx48Y98cQT8lcZoGBbdB3u9vPPPz9//vwdd9yx0EppEY15yNcmE7pR9chch2HYJJxB7EOh+Z122mnq1KnOOU5d6hznrTOUpKKqOyjT51isREXbhihOURc45yqV0t///vd58+ZpNlhIjZi75QOVZ036rJ91YV0PKL7tNaqtAiYA/lkqlaR1fam93nzVJKG1cAIChDiOoShwgC32HXfc8aabbjr00EP5JLig3XPOSnMyUmvt7bffLiaBUHKfdmDe4U5NV7o3mxqxuqtBEEydOnXixIne1JvsmVlSUXX8XqaS70xXSEAByAYz6snSSmmfY9kEUCOtv/HoSiPHtXCYUYMMWWJD6rNft3GQlCnrKRJ5GD582C233LL33nuvX79eeqVb1FjS82WtnTFjxpNP/blcLke1EBosSVCrBtJT6uylguyh9UKEuDRuFxTpVioVvkrCuSQlQhiGEydO3HnnnQGgu7t7yZIlzz77LNurz/zl6bVr1zpAQGSh67gDYeLlbyViS0T2bbfddtZZZ73//e/nmWVeJ4iCFPONFld9vWcMzKwT3xhU5Oqofu4vJTDQBKbr0Wst37Rz7nvf+95pp53WfOHrKWAXT5/40Z3ZaaedjjnmmN7eGiJxngrPpa5bF9utsMPCroUMXHrjvLeOuHVujoh22GGHIAgknXe+k4zbNJjLhGH81FNP7bjjjqDc1i2OetNA1ql+qdmR5lqtVytkY1LwRJj3oP9U2NCmdQCkAczuMSv5K+AcH0STzvTtPtxxxx2ZGNgBilQXeQDE74VpWGsXLVo0b968yZMnQ4sHkjcevNER0XPPPffKK6/0KWf1LEycOLGjoyPhSJhBJD8kLldETPNs5pe8pIJxzlUqFX2jmm7UOTd+/Pjf/va3++yzj9yT1gT0cjPG3HzzzW1tbbID0efnoDJ46BTMEjXM7FQ0ba386DfW2s7OTukSETkH7e3t++2337777uucW7ly5cK/LZo3b95TT//5ueeee+GFl9asWdPd3WOtDYJyGIZIiNbEaj8M+WIJLN7gqVbDtrYygl0w/5Xf//73X/7yl5P+ZPfYKFXtAjAVYzvItFEcOBehDA+A5GYbcKD4OKT+akqdF0RkEAyic8S71wpNxBESaWEgZH8kJoEwaXAWUn1bMqGovq5teQ8DI8EzuRGRNUZAQCzFtYrFwW0Dxq9f89c4XuOwZmwtptjUK0ld13JVNwBQZEwYmK5qbXH38mc7txsBUAGoAFhI7+Fia8dxipmEYWXuZySilPf14dDcAu8iKJCgTSc2LZ/suBpDRDWDPRCvhXhhz4pHu5c/XI7eqATdhkJyLvDqTsWGSW/LQUyu20r2PzDDc+UhJgRAglLo+lfNDiO33S8Y8iHAEQDtjqxBBE4ymTj0/Ua9B/1Ta72Fes8W+IeBxnzeGpH3InSlAKU+LKEZHWNy8cUX33vvvXwnYF4V0DNujHn99de/9rWvhWHIN4lFUYTpOYOEFF0EBgNrLQZxHJ97/nlbbbM1RyiIzCYi9oNAakbGccx+JsyOiN+0EhaUZcV47733/uUvf2kdtxu6ui88/wJtiWnbyVNoBIGQ7nIZY4gcJ7eW/nuLGIWxAAAgAElEQVSmDls4rCc9++yzv/nNb774xS+KwpdviONwdt9991tvvRWzaRMNJF4DQuDrTRyQA7IA69at+/Wvf3322We73FbEmwGPojSiNDaaQx0hCJJ/s5DqpHzSOkA5KAG4lLVSihBSSNbeQ0lZEBNpJ7gYG3EUOfFlQNaM135zseVksBKGLDaDPHjKtKxEj117LFfffGrU0SFdhqvi3nLUT35qiigzqxAXUQOlzrtPf/rTF1xwwVlnnSXGiSj9ggT9oThf+PSrHl1zo4IgmX0P7XpEyRuDRCDJnhpdYaxXHPdHZsfrrS7J4NQxWErcW4mU5EWdhl7yd0b8v8Yw08tYaJ58bHFd9AkcJW8TDMREcRLV6IBXE6pLIZxzFo1L+QNCs7lg0OyF0SI3IwkkQ+N2U1dLIR0mz46AaJdddrn++uvZ7ipc7B63TNQbAkSc+/gTms+0ApRGGEE2piHfw1yHrfSBwZgkawGf3WP8tLW17TB2+3/ZfocvfOELALB08ZKnn376/gf++OCDD/7lL3/p6emBxE7cOK7Low7D8Je//OV5550npw2szbBZXvgeDpugiIjAICXJyAAIKHaYveEnB+ipiCbN0Vavs/4XY21yIPryyy8/5ZRTBIF9DtnjMI2KeSyFJ7RcDtKVa4lQRRhlMuc6dSjV+1fYuxCwODW8IWiJwGXGjBkzdOhQvhqlSc/TuEsgov/5n//50pe+tLm4QSsgeCicC5EpG1un8ExSZ94ZvLY8nlyoimxCB6QhIuKEj8LYNXvRsi+KWssPnsLYsTsMGDBgzZo1mONXvIYA9FalrdVq//WbuydPnswvrbXgiHCjR9cI9GqN4xjAANDdd9/Ncdx5QEyWPCNLKpk0aZJI1UZNeA5fyHEJYa3QeGcd0vWy++67z5w5s+50a8rG5a8sKW688UZ/upsCpnv/pLRTrYBpUdWomB6gsII4RkdIBGjMkKFDhw0f+aEPT/rSMUcBwJJFS5999tl777334YcffuaZZ6y1lUqpt7c33U52iBizdaS6TwhoDMdUWmt7e2ulEhLRr++48ytfProWhUEQGAN8043GbRRFBky7KXc4KhHZHOIAVOJT7YHOYw8T3yLPej33iskRBwCkUZOsU3BdBJi5xK05N/wnAVL2AKQ4SaewZEv9AAbaftv3HzTB2cG1uExQzzAlQg5TXycAADpEAqoG2FuGNWuXPgVdLwOsJ+gBCBNdWhi68k6lSozOnvY2X5XTomawBTYWNPum1NdTWAxT7ySAMwacqyJWATeAWxiu/EvPqieD+I0SrimZ0CDroMyOETFxSiZyCCgxMOo6HAAUmH9ERGgRSzG098YDenHU8G0+URnxUbCjAPrFzho0johSi0yLilb4vsCm6TRbYLOAZ8UVRgPxM6bHQCCrcDBwkimt9APA2LFj//3f/z0vX7SOrijH1Wo1UtY+5ZIvQ5oBeq+99poyZYo4LyB1koq64AczZrfcxU3TCtVJ/Vznddddt1HikpFGsaPYSYquwsUucRaSvSuK4mo11J9kBpU1cUX6XHfddXxXrP5KrzL+d999961UKoL/ZBZALf/sLFcqlTlz5vT29uoCm0tzoOwECQPRaqsuqX/qyFk9WX2qrRlep0hRjumhiukwKg0Q52jng0h8G2N6tU7mKmQ9KfKmeSifDFAPQWhbpkOGnMeGb0Bma9D90a7SIAiEYGQuZMhcuZgNGhug1pcehZ5NIjrttNOOOuoo2TyQWdPzrocjaq039d5EN5pZwUCGtnP0wO+1K99DkR4+T7RXTB6YAECxF6YNzkJYqVSCoFwut/HVLqVSqVKpBEHAGfGFfvRy1pSv+bBJMzw2Gn7rIMgXrOqdHo+QEn8rJYfLCvFZCLKOyuWy5wEXtkxEqGjSpdCoTv7kqKOO+t73vpd3LnvrmqsVcaJJq88heAyB0s2wzKZONpMgFNGbt7RBOWGFq2Cao9A5N2LEiAMPPPDSSy994IEHnnvuuRtuuOFzn/scZw3GbMB1i3DfffdxMgduVE48YOOY3DyHzCxtIsD6/a3CnXQZvUj151LeeykLp1QqhWE4evTo3/3ud6eccgooZtJ8mFyhT2ZNywOAtXbAgAE2BV6bQWC5J+kVRiX5yZ2UBcvMUz/LHUe6z5Iy1WMdkJLQ6NGjJ0yY0IQmPQZYqVTuvffeFStWcPqXPpGzCaA7k6fwzd6QSBbvvf7Xa3pjlZB8YednawFvmjxC1fqJ6lXf9DZ8+PDx48djGrYstSUPkPE/AACnXOzq6qq3uJHbKs1BS3PmoqtXr77nnnsabT8XtmuM2W+//aCIJEQE6z9pVSRdIH793if5bjvnjj766P/3//5f67OvGb5wqla+FX5LRZmOpWbNUeXDbAfqLwXzqICIJH/6iBEjPvWpT1151eV/+N//ue+++7429d/et+22Jk03wQm4gMikWoduDtWxD45auP/++59//nlElKTA3k4A66xla9vRlgkDRz63FfnAW/meBoBg0t1wvt07Ix2yWE5iAYgICQ2leiQCAMQu0mjVjHJzEf27DvIyIyNaiL0wgcMOCEZ3DNrRtm3jzEAwFUAbc5YA5q3OQOzQAUVpThwEImeoVjbdpva3riVPAa00sAGoByBW24mGgBCQY3qA2KvMa+DtvxunEWHkJcfmJSFRUjdWAr0rwGNeeS4DddHrEEliJwmIKDQQglsP1TdozVPrljyEtddKtDrAGrkQgIwBYwGQyBAZACDmhABgAespJjEJJKkzbgRK9zkiAiJ0YEPq7KbRncP3aN96LyiNBegfU32BMBMyKV9uxJ1bhPfeRL/DwZuvvJpL2W1GkdY6TEmOL8kbLuycO+GEEyZPnuw1581yGtuCSVo9yhzOwtSHYowBRxZNe6Xthz+4BBGZSejYBCJyQICiNSKy7Zc1FTZWo6XUe/unP/3p//7v/6Bl8pZehXFUi0KnrgtgpAmXEy+kqA7OOdFpCpvTcyH4D4Lgscce++1vf9sn29x+++3Hjx8PWScgCX5cOuOck46IiF544YVbbrlF8r411yM3GZwK5c4PwWsR0ztkhVDzxkbjplhy13VE5WNKsokr/yRwCnNjjDGBtSXWL63l/xJnZalUYmuW70aAVK8Vv7leSk16KFffUrqT5LJZKcEgpMEUsuj0+iIipGTvU5rQRmY+qEeetQlh0it6xfeqJ0iw7LXuDcpae8011+y6667aA5XOQTGhNlct8pwq/yciMoA2PR6kx6uZmNRvckefdNOonMsyj3XRma4IzyvBDgsAQKQgSJCZzhox5YihknYjIMrQhh7pJjinmoBFoy8IIiJQN4wjZE4uyjwJneRvOm4EzIc9lzRCksMUESl2fMs5/4yiiJKTRQDZuyUJwQEBQBzHZ5999hFHHFFIcv5CI9A34baiVepJJCJZkmLAy4rA7N6erlk/a+cyX6uKahsArTFBujViTUyO7dXtttvu3/7t3+66686nnnry5JNPlqysG8V7FyxYsHz5Sk7rpkenl7lXbZ7Tgl7jBOAIXD0tZoJVyaKe48N5HoV8jsegMQFfh1UqleI4JIq/+tWvzp0794ADDshPRxPQZZrMr7fA4zgul8spcXKAEiEWI7lO/CIYFHPQLrY8neQrEfbOsOeeezYSrN4bdogsWbLk5ptvlijdPvHTOmhOqGv2+I/XaCN23SeIZGm091YIhSTR/MNCLlHHOYF3VtsTBHkFo0lPMvUAoIW99tpLy+V6tRzMjoBICM4gORch0oJXXr7lllvqvKUBTW4SuDRrTf1ewdtvv33+/JcplwM0P5ZEBUG73bbv2+UDOxcW05xEEzlk+Qw3xQP05F1hN/jbOI4vuOCCz3/+861jQ09cK/yfQVau1h9Q6TCUbnJAU/r3usnZzFM88HXdVi5GY4U2jKJSufyxj33siiuuePhPj1579U/GbjemvdKW7H0aqzOAM13JG+FmzkXd3d1zn/iz6BV6FJBKIgOmAkG7MxXAksdQuBx7HiGdMEi9kAk2jSctMh7ZRkhJC1tWt60pRuLmZW3vOtAiUx44kxQAIFjEwJgOcgOxc7uOQRPiYHg1LseOz8DVxVX6gMBOegI0ZDAqm2q7Xbtu6TPxqucBlgP2EoUEsXgiAZLbUYiIFOXqTr5dc9Ro/ec59Wbim/XaRNhv3prfOaDHhcq6JrW5oTDsjAGgCDECswHcsmjdvHVLH8XqghKtrNgaUIiIogjJJrfJHkcCNXdEFNgSkKHkUAMRkUNwYAIbOCj1xp1dtUGVQR8atO0noDQGcLBzJYsVAEO6b6nJV9TtTUTIFni7IM95hIT0zpsO7IKsm0wq6ezsvPzyy9vb26WqfP2Qddx4IJ+49ALi44477iMf2c2lByehfrGPo2yMZz7ORdsP1thW6E1zuZtuuskVJa/xFrJ+KPRJgdoM0zihrNtFXubZrJb76bZq/RDN1VdfLdFqkFuMlN5e/ZnPfEZms3AIkNpvvO9qrf2P//iP1atXi2ampUDrOl8eNEqNylKX708j8DoDObFe9AlA1uLy2Je2KvOki+pid/0SslMv+jRkhaanb+ieUy5UUFYfKEmhv80jSr/UsVqFg9ImRP5DjRbxlnr99zDgUYVzbvDgwbfeeuuwYcPepIzID1CGAA3CPL0hy6TIEW/MgtcEfx5FEaeHy6t83ti1+xWytC3fyoPMqe5nnsN4P1t0U5IK+sj/1WM+AJm9CqFeyjpe+U3rrkkBiScFRSQaIZByG8wcqq3vV0lJmbIgCG644YbJkyc3YT6bTGZSZ6lUEjxQ1rrT4I3FY9RQP5xbd457a8QrDykz5Jj6bbbZ5vLLL7/vvvs++MEPbhSzRcS1a9cuWrTImLofTXi47kmfD4U82UNI+iOzpgq5hHPOWMvRiMYkiQuOOuqouXPnzpw5c+jQofnKWx8yNghX1xVKMe1q9LgrphFJugYpo50UmHPn6bELM9H1I2Y21Q488EAmtvx4velgF0YQBNdcc82SJUs2CjmtgLdCKes8KpQ4UETzfUKeMPQyzxfz0NuoDy2CzH5+4pp/5b3J+6AL4dOf/rRm8gImCTOvv5E918suu2zVqlUbtd5bAS3amNkuWrRoxowZfY4FU9nHonbvvfceMGBAn+jS/BMU5WuxgipWUbdVWCHXMGPGjF122aXFIRfyrj5ByANSM0SrEIVMO88x8toam+famlD6b/0sC6aXJvXr6Pjy0Uc/+OCDxx57bBQ5Ih9XmqvoZcvFXnvtNaYx3mwjiiVaggh5vkvWthvT5ij1yGYDJ2WMiHK7aLp1iGTSRwNgER0kl5siEdckCafVUXHmfen+YdNlvLEC4L0HmjNCIrkDJIO8XWAqgJ2Aw9oG7Wg6tndmANmKtSVEJANkgCAGAIcQy3ozZIAIYqRagF2Wlq9c+Ceo/RVgPUINKKZkB8MhOaQkUI7QcVWUzGyG8nSHNy/D2lhIWepblRnzvU2QhbKwToGABj3Tl5lRiBiB64JwCXQ/v375I9WueSWzHLGHKEQEQ8wfuIn69gYAYLI3iADoEBwCIiBC7EJAxyUtGQRLDglN6EwI/as0on3Ih0aMOQDadwQYABAYEwAgESBYQOvUjqNTqXA2bfreXpL+ZwZPziXuPEBU6Xi0RNReBlSHzvQMshX00Y9+9Fvf+pa8xJytkoWG6SyMMYgwdux25/z72TE5YY8s4zmHGl+vDN4RUUdMo3LsiyPCtGHQCCfaTTZ//vxf//rXkCq1EvqUjNogqFwK2vAoZOBe66JVeGUKO+YZD6IySkbOhx9+mI/qSLU5TCIiHn744RzlB9kFm/+EVZkoil566aVLLrmkVCpVq1XtwsjrSRsFHhWJgt56DYnhDcaALRSXeZAxJmcXMhSep0MDfOUwON5zlveyL63/dSqdOWwkP9TD9+Yaisxg+Up/IuX1YKWMDuaC1DEEqcNCvHtM/9q/KdVmCDXrBcsryogYRdGECRN+9rOfSSTaxuJEP3sWFGFyxKhcLot9ZYwBk+RUReVoK2zae6MRLlTB60uoVMdRCk6cSpkvFoJJM+LJUkVE54CTUnAQr246vwDlpzdxfSJN67SNysiIdLWa8OQhkQ6SfbI4r1QBmDTMObPS01kr7F5KzDYf0SNTSUT9+/efPXv2VlttpbvdIvRZmAvwiV2B/OxI9/Q+RPqneoGstlznMHl6hkzsNi9GGwRlF8W77vLB//qv/5o0aVLrIyWiMAxXr17NX+glgKmboBWKQnWOWy8QIJKr2OuhYbmrkEVcIoJkw6DYxWEURbVtt932jDPOePzxR2fPvnnHHcd7OZQ3CqSHhX58TzpkBgLA0UwaOfxXz9LRCPSeIZ1QIYP8X4UPeB2eNGnS+PHjm3MAYUrMWF5//fUf/vCHIv2zY3Vv8hBeiitRrqJNk+9NQA9T3F7JGIGa74M02dh+M93IkQSbTfWShcK3j/oBkGCPPfYYM2YMJDNO/B/Ljfo5fUSntisWLFjwwx/+MAiCovl9M5DwnzAMWRJNnz79pZdeci5imjEq2F+PkdJY8sBYA3jkUV/M8/B8P7UntNDvLMpkYQ36J5dkaTJ06NBbbrll2LBh0MIU5JXVVkDvXuhtDOGcUrmnDzT3ejMu+dAYJmqJlDSEYII0ZURQTw0xcODA888//2c/u2nQoAGaI2mKNYCokpBwr3p7e+VnyledMTIQNIAlLLUHpQ6CioNMwgLnmuFLh1USJdkn1SAhDUpHKZblZU7ho3ifB7a4BgowgACAxpBDIAMUoO0EGAAdY/sNmRgHI0LqIFPiiFpEZLVErz1DLJKJoAbU2xZ0R90vb1j8BMBywC7EKkCEJrMxJdLOE6JF3fsHufD6PIq1BTYBCueubtdlD6ABgCMHEAFEABsAVkLvX9cseSzsfr7NrKiYDRaqQMIcpQkgzqLL7zGTOMIYw2zH+GEmBk0ZoM3BgGo8GNt3HPa+vWHA+wGGAbQDBEAWwBgMpM+J0ZLNSr5ppPKPIekt0ASYGNgkK9welGL8UDjRRgX0AcBpp53Gp4kble8TUiqDadOmjRo1SkhOBdqkyk0qTOUwtRf7wHTOPsrmLWpWbIyZOXPm+vXrPe0Ks6dXtF7rPRe24hVojhzPhtQKkM4Bypi59tpr8/dRSBOIGMfxLrvs8pGPfEQrVfm+SROMSWvtlVdeeccdd7S3t+twWrGp6kxsYyZaa3vOuVWrVk2fPn358uWFxkAedJlyuayNnD5BzGBP+8z3UH+Sf6/NaaYK8WsUYiPvEfBQjbmj0JDqwYV31GqdQRqVoenQQgBg2pDCMmovXkBiDCG945vSGDfprR64vPT4A/ekVqsddNBBV111VV696ROkWt1tBkkRKF4w2bSQb7HILtL/SirDRgqPHhc760mZkVoOUtapJ3xGJlSiv/NYorxt3BghrcRRNqnNIxjlP8qooBoJmtr7bLqwRcZbUo/y6oLyuQiZNRqCYJIfxo0bN2vWrI6ODtgkotrYkk2Yg55rSO21wsLeOoUs2jUwTpiZcP2jRo264oorKpVKi53nateuXQvZ9Zg8pLsRhQLLIwm96QI5BOZpRh70GiGCOCbnXL9+/XbaaaeTTjrp3nvvnTt37o9+9MNx48ZFUSQ5JVocYOGQmywiIj/tpjC9Qv4JOQdEflyg1q/3LeTWkX6pi3V2dh5yyCGkJKkurB/4WAMRBUFw/fXX33HHHXxX3sYgqd6Hwu5BqsgxT1q8eOmvf/0b8XRs1ELrsw/FnaHkjCI01kKxQZzsJoCm+SaKh556ryd91t/e3q5TUqSSC62th/sQkXMUhnEUxQBgrb3qqqvuvvvucrnMM75ZMM+9Zb0RAB588MGbb74Zs1H8kN0m4Q6LIuGcmzBhwh577AE5YvAoH1IlQe86u+zRokLsFQ4W6xfZ2yiK3v/+98+ePZsDA/sctWC+bwQVjYVBK0iQPQOel/66Er3e+cFYK5u7XnyPXsu2FBCiCQIAqFQqU6ZM4dwXxdxVefmS3gKtWbOGcxDLDpMel3OOA5tKYDsISsQxj7wHCWCgHoaU+BSyd3mnqCI0iXPbIhrljCBKDDNE48CgI6PyrTiIwUVAsexuyRx707AZmc6bgda7sbmWKxQQIgEAAaHlAFUEKIHp72h4ZfDE9oHjYjM8wjY0ZaprwKksd4SOIpdqvRQbrJVNT4dduWbpk7T6eaBlEK9DiBGcg7q6j/V9dZ+GCrmwFo2bBQl58Hb53qJWtgCkeUmMMWgBkFOExKzOGQCACKEXaA30zF+/9GHa8Hw5XhjAWnK9mKQvQUpNHm0pp7PGm4CJxhzHLslFgEQGYiD+zwERmYjaumv9o2DM8LEHQv9JAEMJ2gBKBNYleeoMgDGARuU48wR2S4N+ZzCcLeDNoFHx0QyN1GXIBRHoMixlhg4devHFF0scVtOOFO/5c0/23Xufr355SpqOmsKwagwgpge3ySQ5tupiMWM5yE+njoc3EnyYNR2XLVvGClxDDCQRyiQboQlL51XXl7Jb2AEPVy576llAlB75q7X24Ycf/uMf/6hHLVnP5PNSqXT88ccXaPnZzQxBAmtRYRh+/etf/+Mf/8hXGWi3gijQGtVNxusV45/GmHPPPfekk0767Gc/O3/+fGx6oNjrJGDdb5tXb/IfIiR59KgoqwYB5KbNqP+4cKy3vuXQAyhFthDymNGrT2rQtYG2nIs6p0eKnM5K0T5kKUTTDyhBz2kTNf3LeinUN2R2hBQpG2YogIhhGJ544omnnnoqZT10TSAzIrUlkIzCGkJBlDMGkMCiwazHTfqcuBQBwdUT25PyCOgFUijRtFmi68esASYvU4wh1WMl6jWn5ZMgg6YIqWcNA7XXkq3H/9mEAgUtyQPWIyKTrwyCwcKBezjpE6QVE1iZL05iqKtS6MrsfOT5BighVavV9tlnnyuvvLKRq2ITFFdNM032LfIgznEdy99IyuhqsYFPhJJ0JRGAA0O2ZKJauNukD0+ePHmjtKwwDCl7D7hmON6b/IrWa8QY09nZ2a9fv/b29o6OjkpbW6lSLgelSqnMmwSBsRaT3LUWjQHs6OgYNGjQyJEjJ06c+KlP7X/aaafccsstf/7znx977JErr7x83333bmsrh2FojLG2ZEyg11froJdwE/6vyUkLUCnpXMFiLPTgN/rpcZ4WiYeIjj76aEkzmu+/t2Y59UochyeffPITTzzBLhvJiiAnA1rBmNSs+SRTbxRFixYtmTLluCOPPPIb3/jGunXruNgm+EMLwaP/+sCpnlOvER/zgiibsLvWulKP6c4wkyJp64nsPueX+zZ16tTOzk55o3cE+fIT9hkgIlGSHTKKopNOOumZZ54zJqhWq0Sxl1G3FSjkq6zOLV68eNpZ56xauYayXnjIclpULlRrLVH8xS/+a//+/aHpOlUsJXYuAqX5yJ/yqpcU0OsoP9fW2jAMDzzwwB//+Md5kd2kP60zlrwgyPe/DmkOU+dckYbmJ1d15NDK6QrSEcrGGGMCSLMGowWCmLepurvX77LLB5JoffRj1dNmCSBN8ALQ3dOVanFBcscOGLnZyVoMAEq21GFsJ5l2IL5BBYR/IAICxOmpzORNfcVmfJHs75Q9BgJA4+MiBkLAiPgIpqpXhlG0S7MJgvytAD1JPs/KAab54zdvH7QkIPYZA6LpMDgU4q3bBk/s3bC01tNtTNXwLQhAFtKeWOOI1Cldotgh9Fh0Nlq65PWHR3cMgXIZoOygv4E2gliO+XhX2kNOJuU72Rw/W+DdAURgUN/nnqo1vGcRItQAVkPvqz0rn+hd8+eg9molWIeu1xiyBoko5utuQPMQdM4ZAkSMyFlr0AHIviifSE1CvoHAoDVEpZg6et2gyG49fOs97ZAPgtkKXAeaEoAFIIO8VZWRzaq3DRwBDehzC92+Y0F8Cs3VIJ50yZjDL1MNJjnwGEXRwQcffOihh/7qV7/aNA3SOdfR0XHBBRdUKpWYHKR8MrWdwFobxS4wBWEXomlpQyuKIqQCZpsH/usvfvGLZcuWidXkaVRYd5341o6B5Orb5qDxbFSCMPmrvNfPeYWJo9ustXEcX3/99fvuuy+pNPxei865ww477OKLL37llVcgt23pGXi6MytXrvzSl750xx137LHHHj09PTzFPClCMyZzI4TvQi203zh25gc/+MG1115rjHnyySc/+clPzpo1i0ehJzFvvCUvCYwxfAJdz2Be20msyhSHgtVNo09Mvah6Cz2PxiYgQQrc20IfpX7QsXtQXwgZVyPfFoXKVQdqLjzSlffSoqY3HS2bAQJRgsWmlR7yoLiSUqnEe/hxHP/oRz9aunTpL37xizwa8+jyOiY1pzFWdf3QkatUKhpj3rzzpMugmEiaG8C6b5w/0Qv9AOXOcNn0glp9xSQltE/23jZJnrxlvLrFfElvTvX7RvxNeptMGd95orzAjqV8SlcCLXqWPeyl+EHIUi93wKPnWq0m7mOphFLXiUnzD0AqCMIwPP744+fPn3/ZZZfpgesPW+mkt+iEzWIas8k00AiI6K677lq6dOnUqVP53pVE18q54/PzoqlIGLtmKSa9bJdrHjt27IMPPtjncKSJjo4ORHDOXxH8IDfU6/e6BiEq59yoUaNOOeWUXXfdFVL6cc5R7AAgyb7iyBgDBq21JRu0t7cPGjK4vb2d3ZrlMrdloiiK47BarfLi4kUN4LPQ1kG+8tSAvJ0r9AbZ2HmfheZqbt5uIaV5NJwRWNn+ENHEiRM/+9nPzpkzR/cnT8n6PSIsXbr0q1/96u23377zzjvHcVgo8QtBizxNeDytfND+lVf++qUvfenpp582xsyePXvhwoW33nrriBEj9NZUnw21AikB+HINNJtKMcbvC48hv3nI1+N1Sdb1xrY7fvz4Qw455NZbbwUg5yi9soL9U/VieqIR8e9///tXvvKV22+/fcKEcb9ZlwgAACAASURBVL29veUAjW0phbquhJ81b4njuKenevLJJ//5qbmBLXNyOfkkrypokTFs2LApU6ZsVB/0QZ/CHmI2ctBbLFrpFbZjjAnD8KSTTnrllVeuvvpqaLzTo6ttpcMs+0z2qLvmz/m1PPeJJ+66665TTjt12LBh4Cjx8QHEcZxWkqmnkUQQLGF6uRwA2CCgGJxz5VJpzJgxmkVDzk1ERNZyuBshIuf59Varbs0AWMCSLfUnKMVkiAhM5s5uSJ2SElCpaJT/h1IUwcpPA2AIdLKGWAVKQPIXBwhyuT2l0Mo8vS0gMgNacM9vdu+kVz+DAwCwgAPADgs6d2zrv5MLRoaun4MSp7d1CAEqwkWHhhAcgrPGIYQB1trMOux+oXvhn4CWAKw30EsQAhCgy+5d1AWezFSLmvQWeFeCBC/U5QFxolKAiKAG8Qqovtqz8pHu5Q+X3Otlu85CaBBMwkOQU6Emz0lGNmcR+K75ABEdkUEymOofRIAcgUIAAIacCV2pJ+qIg22Hjv1UZfQegCOA2sFUAAICQqgnI+PeIiLv0wqry9Pn5lIatsA/BjyB12d58a1AShuiw4kygYgXXXTRkCFDmhu3+T9xlC4CfPXLX/nYx/eISW4+tbzBiGi1pGADsrDbwj8TV4tBMA2td11Jb2/vDTfcIEq/mKwauJ+sv+mxqKvUEDAJSgKTwZWUl5/yrxZtWj+mNJWb13+ThrlZa/ncnFLX+NxGrCIsqLOz89snf8eAzWiHVD8p76FCml6yZMnhhx9+3333tbW1SRylpEky6UU3eZRqcwiUP4vDZy644IJzzvl3YwKmn4ULF37uc5+75ZZbRF0rnK96neDQ1vP0sQ+Lb+fANHOo97mnPGRmBPpIgaVS6xQ4JTchwESPUdaRrq1Ob0UWuO68Ho6uR3e4ET5BzRQpgKzNnKZKr7ucSN3KIt2WAtrRc8MNN+y5556Q5R5NZId2IiTDVOtIfFWlUqnevaIZSfrpnFx6U9huHlAdeNdEBVl/VuGUUXLqHDxMSuWJi+f/Z+/N4+WoisXxqnN6Zu6em9wsNxshJCSBECCIMWxhjQLiwi4IsgiK7+FTHot+UUF/EcnDXSAQiCxhkYcIisjiEwUlBCIEkkBECUGWQDay3dxlZrpP/f6o7urq7rlz54bwRF/qk8/9dHq6T9epU9upU6dOJtYs0sQ0IEK9uz/bwYp/e9Nvgm1EVcNyx1rROScZjlpHAYDkqPd5VE5Wb2B0SjjwxAcT2WpKOUg1YZ8r+mejISneKJfLs2bNOu6446CSHcmCVrZybZJZt9KOyEuVnjKSP/jBD/793//9wx/+8COPPCKyoMdUNxhdc/A6HA6ekXIs0kRnu4HDoOyQDLgQsS1btlTvpiaUMUby8igzr8ZKB0ZBUh1py9Lc3LzXXnsdeOCBM2bMmDFjxiGHHHLooYcedsThh888YubMmR/5yEeOPPqojxx15Ic//OGZM2cefPDB06ZN23XXcSNGtA8YMMAYUy4HpZLvl8oGMJ+vKxTq8/k6z8vXMmrVIUXk3mhCUR09oYCSZdB7ILLNpuRX9F4qZ1YvMeq/KcoL2+i+n3/++YVCQVf+rd7lICBE/Otf/3r88ccvWLDA2pwUrMg+nL0jOpnv8LvOOTbrL7zwwnHHfXLp0ue5sgUAPPbYYyeffPKqVatQZQq/e9BETsUiMRPN6dN+bXfQDAAZ497nMAHwIRNARBdddJHneeyhECEn1xMlFE4Ehijs+7JlS4477pOLFj2Tz9eV/CBQJzhXRxgSNggjloMgoC1btp599tkPPvigtUgQe4YurlSYUCNMbfaxP336Z0aPGaNPJK8OuuJKbwinopOgbGhIDnVcJ6qVV+fc7NmzjzrqKEFV911/BZPrtX2CPCxLrZiMCYIy2bfffvuVV145ffr0a6+9trOzExBZM0TKM7YmTtXw4daCgHjuID3imXWkPZDLYiBiuRSsX/sOr8VGO7cAINwDoRg1nJgjwaDWNs8ziLHCJyLZrMaulQe2Dkw92AZAy9mTGIccE6PCHdfjKPQ0yiGLkAotHABQlKyBiJTUoeH9pGzXOEj/y6DXwPvUzu81MhFTWgQLkCPIAbZCfqemQXvY+rG+aXOmsUweQSj5IUoR2qGPAoFBQirlTGedWb95zeLi6sVAbwN0IPQAhY4yxpMTiJpJAFTySnfAvww4XT+CWPf7CF0GN0P5jeLGZ7s3PGvLb+RxvWd6EAITHf4OAKxImTv80BQBInieBQBAwmjvI/BsylpEdAG5gAAMmhyZhrIbUMTRg0YdUN8+HXJjAAcQ1hEYRw6owpRYe1qQsdO1W9Ad8P4BzOxD7BOk9pae80hT3Nr48eMvvvji6lOIlFMFENZNbh/WfvHFF2uXVE9rxb3mhco+sWUcKhbyg4wDaq297777eK+x7qy2oaHnpw4uFQImoreqWo12bioqeWnBRqBdJe6ChGwk9CPEgSiumhpH7epxO2efffauu+6qNUOfBOR2Vq9e/clPfvLaa6+tq6uTiZbv+xz6EcpErhh7KYlkDf3Mli1bTj/99G9+85tG5ZQZY7q6uk4//fTZs2enXFVIzhlSvGoUMOmEgELMbGiylo6ngBQgYhAEvU0O+wThKI5Q9DYiWt9Ckn80VvwTqRB2SlFrja0HQheZYjFhSclOuTUC0YmQ8U5wjJ2ZWArkc/X19ffcc8+UKVNSc1H9V4NgyximVsIknwJV6FZa5ga5I/KiibJ1aoRUUTxKBJjiVAQZNRkRIYJmYJcE3YJMI3sjdcrmyl/t2Kfm872BlkekyvV8pGWARMgVatAVKS0HqaULChdvKhqF6E5cTkG3KfpflCQP6Ny5cw844IDqVkb3C5IinPqQVu9QNXWU7y9atGjx4sXW2scff/yoo46aOXPmgw8+KDqZP6EZPqInUwLCTNYoTUlrQorC38aYIAg2bty4ZMmSbB9F3CCTwiwbSyuC3kyQUin6gtHI5XK5XK6+vp7zLgUxVJP/lBmVHnmel8vl8vl8LpfTqriKMu8XaB2StbPymNZRogdExaVsjbColhcZJhed2qFFPtV33ZrGIUteItpvv/2OPvpozZx99poRWLFixSc/+Uk+iEzHPvS3dPdBMbn0CxGDICiVSvl8/ve///0xxxzz0ksv6deJ6PHHHz/++ONXrVrF3Fgul3kLRUot9yt2KdyljQUk9U/FLrwXUDsTan6rEfbee++TTz6ZonBB1rCmeFWYefny5R//+MfvuOOOQiHvnPN956KzmLXpkS6AMjQUmWauXup5Ibc88MADnsfZsmVBRsuj1J72fd9ElXza29vDoy9rphKqsFV1cmlmMyq/Xt/XBoULUObz+ZtvvnnKlCmpx1JMkpKLLJLZm6nrrOvI3FIsFh955BHj2ZUrV55//vlTp079/ve+t3HjRlGtkGRm0dUpPU+JVUll6QistXX5fD6f//Of/8w+tmhsQQXVWr6IUnNzs4REjUrJFxIZAASTt/lmsA2AubDDBEjGJGf+ihxCZQ5WyAZ3ckhkiIAAOWcqDGKz7Q5JBgCBQ34kKANAagNpvwLJ70/4X8afAIgsQB3gYKjbpaFtKuV39k0r2AY/QDB86DcAELmAK4GGXEjgnE/OR9eVNx0FXLPhzT/BhueA1pLbglBGCIzRla2IKNI4jo/7znpRDjElZu/21LYd8I8FThYLVRgiQOCoCNABxZWljc90rltAXcvzuCEHJXJlgDApI1RfrJcjjmC14ACYDx2ggzicYYyBaNkO0TqyZZcv+o1lHD5o9OH5IQeAHQkwgKAOwRIBgmQeGb0HJ+s3aKgunqlf3ztvYwf0C4jIosGaa9xopzzFD6yvZJp03nnn7bPPPibenpnwztNoAIFBAnBAF1x40dhx46RlIkIkcRJCQ2YQbR9Bh9QUxSWS1uNnSCVDBUFw9dVX67e0E2mict0OwormUZgy3J0hOZ6e5yEBF+cywAmgNhG1QUBruF/8jEXjGSu5HjLt7I3Oui/siNx7770vvviiC/NxAoBwVVbcUACory9cfvk3svSpIrxCga6uri9+8Yuf+tSnXn75ZT4QPDUjYuDQJZHTWWBBQEFARFguB3ffffeBBx545513IVqIau9qX/n//b//94UvfKG7uzs1BMJg+o6eK6IKDOl4JZ/vTABBcgN+gucJKtZ5jIA1Icqpr6TCc6kZTu2OiolypoyKcadaYPwr1gfUrxhAaywmt01VELTM5m7NSyxZjhJRs1Q7+jwT8X2FsfW3MIolBUEwZMiQ22+/ffDgwdpdlsdS1JMhttY6B8Z4iBgEQVgH2RHn5WnekO5IBFCrHYnD1qLlEJFn4LrvMpFIDbfIqbQsCGidEwFXlozzIyBZkwvj2JYE9CQpIZ7zmOSivg41Vu+g0j9kLQJASvOnBgIRJQXSVRUPDYykc853QZyTobI/EigBAJFfKnP+ptCZPV5taDSzcVCmtbX1lltuGTduXEX2S3UkdQcM8q72FPdSbQFfRJw7d253d7cEyh977LGPfexjH/7wh3/xi1/09PSASq+TSLQLN9KyEEVzSECkMKSOBM4PHBAYdM4Vi0Wb8669bs6rr77K+PWGFuPPBjGfzw8ePIjvC6ukeEPrzOx9Ac4dzuc953wM09Ixl7OeZzwvzCy2Fvm/1qLNecaz1uY8Lx9Fn4A33qA1mmOjLRHbYU6XklBUyt9a63keO8/SZeccQHySckSiQOZTKV0hMi6qTwebKqpTEQG54BezUoyIX//61+vr66swcAqERTds2HDuueeec845b775Jqp1I8iYZo0PB6E4dFUulxFx8+bNl1566Yknnvjmm2/qr8j1okWLjj322L/+9a+e55XLZX5XSCERsX4NGapAcKjwMPGTxkFGpBYFXitQevdqhFyvYlbz1w3zNj//zW9+s7l5QJjglplJqU6FdYeFPdauXX3WWWd97nOff+211zzPstWI/KtA6xZQJ7/x31LJD4KwCuGPf/yjww8/dOHChbKDmK1TsmuOKE66ZG/WWuv84Px//8Lo0SND7dN/ee2NaEwNzbFVLBEo4TLG+L7f1tZ2xx13DBkyRLSKNhZ9ipJ8rjfbUaUF59MTf1zw0t/+6vs+AIHBl19ZcdElX9lrr70uvfTSla+8zLolJW4QCYsxhpNlUVV7CMj3XTl0MJxvPSyXy1u7ula88rff/+F3jKpFI3VaOZuVVIwyCMpc9Kl1YAuAcQ4QCdLVrg2iNQAeQD6Xazam0XcooShTaaRSw5f+b5QnxUEMFceU+C4KikQUKY4weiWPbWfZ3n6QckGqI0m958JsF0xQ+dxABgADsoDNkB9eaJlY17pHmYb61AJeXZDcDkPJyJFFQnIGnaGegtmKxb+ve30BdPwVaT3QZoAyUKhiIOkTAGLi/8k59nvU8R3wjwIiPnvXBa4EUDS0BYK3acsLneufga6X682GHHYB+V5YuwQAuKxyaFskZOky3EFR5CJ2AAAMegg5wPpS0LTVH1I/5IMNI/eHwi4AAwnqEHIEwGd2a1NXkQm1qG4DZ24Xx3QHvEuoqGeqPw+ZnXGp1iSVo6WlZdasWbxDhGN2EojRfieKeSMCgMmTJ3/+85+Xn3RkUx42KlGuCrYptpRpZ7az4vf8/ve/X7x4sZ7wCxBJFDJcVvVdgIjDhg0bNWrUyJEjhw8fPmzYsPb29qFDhw4ePHjIkCFtbW2tra0tLS2NjY2NjY0NDQ1ywQcOyHVjBA0NDU1NTc3Nza2tre3t7RwHhCj0pmfOet2bH9i8efO8efOifAqQpQUT5X0gou/7J5100jHHHJMytSlapbxDiuZ+1tp77rnngAMO+NKXvrR8+XJOjeE17WxcLDW72Lx586233nrIIYd8+tOffumll1Jha01zY8yNN9740Y9+lOddevhQ7f+i6JDrLEdpuwxqgTqr0PoFqfiUU9v/+6sDZSKtk/W0PyCL7UYdES4SFE3+4xilxkq+IrjJZEYPjZ5SpmY7qe7EFsQY+Zamc1aHaGllDpwyZcqcOXMkVojJ1ONUrykZ8yUV8uN39X5DTTeoxAMVz7jvDWSI9ZRPyKjHRYuG/npqEHXQGaMz3zXDV6QbolhhQIzlXQdKJCRRS7oKJstEpBCwFc6kRt2yqzlDSgaUqQnJKIl+TPcCEJ0DxDjxPPWk4MONe57n+/7YsWNvu+22AQMGVERD+pKSLEFMpsdaNKqHWvj5lStX3nvvvXqUWZD/8Ic/nHDCCfvtt98VV1yxfPlyHiljjOQmo5qUcpqSCCaqhNliseicKxQKc+fOnT17NlTyskSuhYz8iREjRgwfPjxFCmmZksFKSkbb9aDLT5L5aFRkPEVkSHI+KKHApB2vQtttA81dEqyRXLCo+7FLDADOxeznkrmHqUmZfCUly5hcZUkRRDQkJAVKPyBoT5069dxzz9WyWR3068aYm2666YADDvje9763detWbUpSqyMaAYjMyttvvz1r1qx999139uzZnZ2dVT66ePHiI4888oknnmhoaIDkHth+hSYFmRStWN+lZFDrcMgYhe0IqCCMs/TCAxDGstOBmiyIoO2yyy4XX3wxZEwzJH0k/SHlZrh58+YddNBBX//6N9544zXP8zzPQ7R6B3G2BVaPHR0dN99887Rp0y644IK1a9fq3GHe4wIqvsxLYpotGfbYY4/zzjuvRrJrOarlYa2+tGNDUZyHlPkQ7mV15Pv+5MmTb7rppkKhoMjVtwIXEmmJFhxSdyribCzecstNEcHRohFpuvLKK/fZZ59Pn3rqAw88wPLIWJVKJYnsl0o9QdkHANkPHgSBRWPROOfAke/77LG8/vrrn/3sZ9etWyeaOSVumkXZqairz0+cOJGU55/SP845D8ACemCb0GsCU0dgiQIEcKjKVnGHEQkSgxoyHiECujDISlx7DgEQ+ehAPfyRJCNZAzZMQyFCQoXWeyfb7xI0Vn1i+B5ZuGTjjstbETgAY0yeCBEHQmFMvmVTuXt9eUuXwXLOI/KLGK25kYEgvCYAJCKLwMU9jOlqyEFX5982vPHYoF3yUO+B88AMQKgDgCiODLx8AaF/xqYlZkpB8n07jjug/+AQkSAACIzxwW2CYJXb/PzWtX+CrmV5s9FQD6Evx3YRogNEjFgu3pQEfD4HxBJEYBAcWGtZU5ALgAwYE0Cu5Od7goENQw8cMOpwsKMBBwLUA3iOiKOT2s4pbFnPMDZseit0aQd//hOBuNEU+Tu1R1kwM+cRxxeiKdnMmTOPO+64u+++WxKpKNrTCsr5MMaERXkMXXrpV1tamiCclsvCG+ebJ3Y0QG1ukICs+WdZVPybOXPmcHlEUmmVqRQnIuJZNBIccdjhV199NUbZl8rbI+cHROSAg2hlCOvOpHBm74EncvzFcCqYz+ebmpquvvrqH/7wh0JSPYchlW+FFgDR87z58+dfcMEFI0eO5AKRoSvjyAA6IGOMs8Z3wfXXXz958mQ+oLPisKYmNpponud1dXVdc8018+bN+9CHPvSRj3xk3333nTRpUktLS0tLi2aMYrFYLBbXrFmzdOnShx9++H/+539ef/114RBEktiidtaFl/7whz8cfvjhd99991577cWenEslnTkqF0uMrRypjIhSpDxumRkSDA+BUztGVc9rZaTIe3bGGK4IJihlqdcb6EFM+d+aGqiCj7x0qblXPq2nc4IAJk8UNMkQcMXMhSqYS9e0p2vUvpxULyAjaEEQnHjiiUuXLr3iiit0prAEcSJz5gR5RDTGQrjbAB05ay0FjpzzrCXnOO0aAR2fpAnAz4A2XogI/dvi7fv+G2+8sfPOO3d1dRljuH6lbGxElfcBKp0qOleXuHxbuK9JbZnngBSiravLA0A+77FVLRRybW1tfNoVz3mi+YUhCuT8zSjthbh8JH9R61493NUHMaQKRuRhNsAwoTIVe5Vu9kk3zRtEFY7rTD0MSYuDGLoWTL1IEkDjySAMXy6Xp02bdt11151xxhl6LAASVikUNA6Zshrh36IYmrCHTIyruzE//elPOzo6jbHst0cjy58zL774l2XLLps9e/aee+556KGHzjz8iPHjx/NKlYv21RpjHFeCC0/hCGeexWKxq6srl8utevut7373u7fPvy02QFWJLwhPmTKlvr5e+FNEkkdYgvWiA8NZt1p4ADWBD4KAiBmSyWIyhDExcuqnSLlxgy5+cruC5mdtQUhlLaV6unbtWudcEBAf1KYfY1KXSiWKQuF82Fdi1KKNkyzvTC6uh8sMyX/ZH7DWtrW15fN5jZ72grjxr371q/fee+8bb7yhlX+CxJF61Lqah9TzvDVr1l1yySXXXnvtkUceOXPmzPHjx++88851dXWFQkE3woGPzs7Od955Z+nSpb/85S8feeSR9evXC3F6IzL/+sYbb3z0ox+dM2fO6aefXiqVmDe0wu/vwGnHxrDwq/TwVJt9imS/AUPVot2q2MJazVE87gnr1icuMpTOuYsvvOjuu+9etmwZARrD7BSLpxbVlC0mIs9469ev/853vn3d3DnTp33oiCOO+MAHPjBp0u5NTU0NDfUR1/nOuZ6ennK5vHbt6r/85S+PPvroQw899Prrr4ty44yorGsnXdY/cfZxoVCYfdV/tQwYWIHyGXnXXa7OTolmklytlQ8ovhJjJJrWWlssFo8++ugrr7zywgsv1F+vzsnC7SLvIcupVbrq8PfX/v6rX98Pas2MiIwJU+m3dnTd9bO77/zZf48fP/6A/fY/7LDD9v3gPqwEGhoanAsrvnOQmJxxROxj5HM5D9CR29rR9fe///3Xv3lg/vz5b731FgCGW2whzaWRP0bWes45z/OGDh06duxYiD5h1H4jcQ88AACTh1wT2KaAPF4BRaywGZ6JiZhizbB8ZBSXiE1ThJZeDorW8EOUfHA+IG8Ej82zeR8nUfYLtmG5pkZQ440AgGTAEIJHRID1YIbmG8e7Ae90BR3Fzm6AYt6Qcz3kgDfLkOxAkXw2dJ7FAIo5pDpruza8sMXWtYytB4+Dn4iYj0Q85einff0UehGr7dji/c8LLvobIBQBtgKt9jcv2bJ6AXW+WI/rPOwiKNuoPikouxjJcRyvgTCgA845hxAfwhMrfgtoA8iVXH130FZo3attzCHQOBFoEEA9QA7AIBggcsmF1ngyo6CKU1KLD7H9XY0dsE3QX+fSOce+OyQHUfslkPQ2Zs2a9fvf/37jxo08GZDAGbv7kMzuP/DAA0466SRtpLLOk4lOeAyCgHcB99a1lNvHZVwE59TSIiIuWbLkoYce0jMBHRHjZyQo4JwzBi655KLx48dXJmDCgettesYTaX4oXJQCpeovuuiiO+64Y926dTJSFQNhjJ5Fb9OmTdddd92VV17JRbh5kib15tg8FYvF4cOHX3/99aeeemqWYlniC9ll4AAgn8/7vv/HP/7x8ccft9a2tra2tbUNHTq0sbGxrq6uVCqVSqWNGzd2dHS88847mzdv5qldKoyYcp4gw4ovv/zyjBkzrr322lNPPTWFHiKiNTqDTLDVX9EkgijGJA/0FzSSoXNGFAQB55BCzRFzymwPrDBBUh5FmFyAcQRBC4VEqdh9JzXHM8la73JH9SIB1XGGpGgLAln8U1ZD/E/f9y+77LIXXnjhV7/6lUzpdQhVs7eJdlZ6nic5g77v8/HTfjnguGEUxzR8srBR++4FEyIqlUq1DI3oijPOOKO+vl6HLaJiBQFzL0ZhiygnK150cc6XCa2ENlSnTJRNDhxqHDGi/c6f3T5h10mqO54LN6KK0oh7x8Q3ybTZ6qkfehQSNxHi0+3VfFPGQmY1NW5dYprHe+RReTAZOvO1z/luLrG9MVYFRJSUC1C2JpfLceD7jTfe+MpXvsJMlX0y/BYHOtk74r1o0cMxMhHmvZlFInrnnXduvfVWvQoivMqLbXyzq6vr6aeffuqpp777X1cNHTp03LhxkydP3mWXXcaOHTtkyJBhw4a1tDY3NzcX8nlrrfNdR0fHsiVLf/e7361ater1119/fumS9evXW4wtQnWyQzRGH/3oR5OWIhFMEVUpa2l6UEDpDVLHp/TXVZCH31NPj5FnPaA7kmZyxQ9BEHz/+9+//fY7jTG+XwIl19KUNCj6k7WQZLxKWFMidMx47OFYazlMWSwWx40bd8stt0ycOBEUeeUvRrv+hwwZcs011xx//PH86exwa42qdG+4MkcEnue9+eabc+fOnTt3rrV26NChw4cPb29vb21t9Tyvp6enVCp1dHR0dHSsX79+/fr1W7duFdNQC535i52dnZ/5zGeWLFly+eWXNzQ0aBXULxCtJdKqTbY2Lvr5ba74XB1839c2MfV1jBbJrA3VIC9z9gnSL+dcoZC/+eabZ8yY0dXV5cL76V3/FVuw1gIBIllrt2zZ9PDDDz/00EMAht0tDntZazs7O4vF4tatW7u7uzdt2tDZ2cmcGbFHvPJX8SuQ1JP8VrlcPv/88z/ykY+krHn1LruoUGaVxzR5eUy1aMgzqefFNMhNFrQvfvGLr776qi7NlP0cZCRItyYXsgZZ0ZKKp/HDH36fsyON8SjwAQBs7GiFlgXolVdeeWXFivm3zW9tbRk9evTuu+++5557jh49ety4cQNaWwcNGlTI5z3PA8RCodC5desrq1c//+zzCxcufG7JkldffXXTls2iXngxoLcgHqctspMzefcpY3ceB6GrwGwWyzhj6AE4IATTaHMDHBYAPKCyFFlwxERx8RIvQcqMExAimGiaExDYMEzJ8YdwLZUJwckmTEMAB6q4gANCsJhYKTXpuPcOAACA6Fgrw66msWykHaJH5CioM/nhdQMml8qdgevs6exBQznrA/iRE4DoiGcuiOhC58ehQXLFgulCu7Zz/Z/Res07zYC8B2ABGgHqAKw4YVwtxTnlYDEzECvNuIA3o7ptRuLeOAAAIABJREFU5mEH/O+CDk9oxR0AOHIlNFvBf8vfvKz7naepa5nn1hizNeIgEP+SNUboaaNBF6bVOFTyzksdIM8bACQ0zgGBV3b5Ln+AaZk6cNTh0DAOYABgPYEHwAUNgMAofVLZv5SfZNmkvxy4g2PfDyAGW53tXhmUP+F4U0hvj+kLduLHjRv3+S+c9+1vf9vzvIAcWmMQObsQ1LKeMWSMueyyy6zNVfy6OBlyLZOEipO37HRFG3iMQH9l/vz5xWJR5sYULQWh2ishyBDRpEm7H3zwoRBFqUC5gKjO90DE1Nw+5f4mvYe4hSAI2tvbZ86ceeedd4qLmcp9CyMOhIDhfos77rjjS1/60qBBg5zzOXGVCMEAOEIk3nHPG70fe+yPc+fOFY1UnYYabUl8EPdu06ZNGzduXLFihRBHMk34Rd6kLM1qb5hDNojonJ+dlW3duvWMz5zeUF/45LHHxzgYJBftRyKS9RhNWO12I4FFE4AfRYTf7STHWhsE4FwikpLQiVWBkjERAfGe9U093Km/4bGNQRxxgHB5NCaCZlpQUq8D9AlM1GUCSYPgwoqfQUDOgaTWaZHK4g+S7wYIQOjZG2+88aWXXlqxYoWkERljfBcAEWT2ixA5309UzXfsLgOUyoH0zjnHEwNU74LKmOhNV8id6CKUqdWrVzPuAMDlosDFWWapERQ9llA7mBxrIqB4a2Q0IgbAbdq0Ye2a9RN25SRxUtoDIK5ULuRNIM85XLWYVC2YoJlNTUOET6KskHBeBDUHKDUbkOtVGlKjEJAjBBfENROi5mJ+0tyFkRssavbLX/7yM888c8899xQKBYwKYpjolB6JwMbzUiKsJK0S9a4YfGHSPfDAA2+99Za1lrvLJEJ1Nk6qm74L3lr99lur3/7TgicAoK6urrm5eejQoQMHDmxpaWGEt2zZsm7durfffrujo6OnpwcRjfFyuQJRQM5RrxP+2KtkVBsaGo488sjIePkAwPn+RBhWRoNEtgqpAGuoTxEAQh3LZCyXi5zJW2260QcDvidpJVk73ttj2nNYu3btunXrQsNBBKREA2L7xXrVaS/XxS4Bv8Z3UjpB/21oaOBFo2RatwMIA/IYLSwdffTRF1100ezZsyuahpTyx2h9gkMYElizNoeIQVBeu3btmjVrNDdq+8vDLdGrWgyiRuD73/++53nf/va3YVsThkj5YNn+6m5Gd4SkfWghGehaVKL+nFhD4RaI1RSiSkBzrkKqWW9gDDjnSn5p6tS9fvKTH5177rkyba/eSGzXwCEPMplcTjyuDRs3vgNqvSHWukSc/ygdYeopGaxwoJN0GTHcbf3BD37wa1/7Wq9IZqgrZNerxRUhqyE1Jr1RQy5YKUXOLQHA7NmzX3nllYceekj6IqTIfg5V4qRerQEAXsVUaCQSCxARCV5dufKnP705aj9AG/8qwVZU3wKATZs7Nm1evuyF5b+45z5ezm9sbBw2bFhdXR0vghaLxXXvrH/nnXc2b9zk+35A4RKI2K/w63HYT7ppEMOjw/Nezjl30MEzcoW8Sgo2WvvxhQdgAD2wjV6htWTry0VrLFoAcLF7gdFpbhHhwiGPAhDhtUHeaQyk3nWOogd4JAwAoSEgR+A48AFEgCFxtdLsjQN2QFSzP77DcyfnfDQe2AYAgvqxTYO6O4LNVOoslVcili0WnQsP5tZBZsf7zhwCOYMGqDtvgdBsWbMoCILWsRYKDqgVsBVcHRirj3jPDpM4ZCmx3zGg/5zgAIggIOo22A20Drr+umXt0/6W5+txbd52WwxYWRCR1hiIoVNtCEClmUC0vid+rHMOCBwBGENowXiBa+jyW6BuwrCxh0HLFIBBAE0AeQQpaFKt9AZkmG2HSvmnBrHfUhWuN6A4kBTnClUHmRYS0X/8x3/ccccdr776qgTsxG8Qd4GITjvttMMPP1yjp68lngLhmrbhEu+Q9D+qAGeC8LWOzvDfDRs23Hnnndo3RbWlix0+4XZeJT7ttNNE+jjwl/KEZIrLv0rHU16UfkX+65zL5XIAcOaZZzJigpLulPRI3l21atVtt9124YUXch0uay3nCcnw8UzJOXf11Ve/8cZrDz74YJ+kMyb2csT1wWR1S72yzRe65pF0WYfbtEvdG1M556buveeMGTMqkdeCiQ5UUUvigp6eZsjApejcXzDJjfbbnNOREoQUPikPO6S/S6QPGGMCSggFI6aFItWyuOYU5ZxKWmvFXqRvInDJAkQCcJErHk2Oa4uROefa2truuuuugw8+uKOjgzPgdGRfQttCZ83kEglCxGKxyAUZUkKkM3O5p3zcvHxCHuOBkIxaoa6adRuIfkATO9ISeRcicyM6gmlsMl5JxCuHutqjMZ7vl4wxfEoGAHC2Dk9iQQXU1Fw9MaYak95AJAIUa5nw+BLCSC60mOuUQEmllO5U/JwMFlfaEjyrCAiLqTyjD7yqEbS833DDDStWrFi6dGnqTCQ9NNFHUdNTG5dsHDbbkZtuugmjCJEMdy1mkaGnp6enp2fdunXZvvAQRMnFiWzZPttn9E488cQRI0ZIx7lH0R7PWAMwSMejOBeiClgzSH4ZvF+nGzVipVVl+Bfj9XxjDCHIkVAUlQ2RCLkBJBOzE8/G0WDFxgXq6upEQrUdFI0BEUOWy+Vvfetbr7322p133tlnX0RjqzzZsDyumOPUWqa2gCkwydR1sTtZAko7EydOTCne/gIlIfWhFJ5aWuWit6/XgpV+XcqVpjQkxEUnY7sDivh9gnNckcM4B8Vi8eyzz3777be/8Y3LUWVQ9gYpH0YveMtYs2jrIdbqSBRUBtnE5kv9szG8OcbttNNOt9xyS3Nzs7YdfSLsIqjdKcqyaJX2tTskd4iorq7u1ltvPfzww5cuXar7hcrlFrrJkpt80URbvFnXaU7QjEdECPjjH/+4s7NTHH4eAr3mJyTVzMOvB+QC361du9YY89prr0m/EBFMGFkmDE+/gYy/KkOZ9CtCve37/pgxY0444QTNCaJ2NCkMAAJ5YBptrgVtM9iCQY9XXCwikjPqvDDE8BDe6I6KWiJQxBxhRDJ62AGYyHuCWGbI+WUqlWRp0CQWXGudy/0fhnj9VqlOA2QM5ggaiAaaunFNg/bJtewe2OFlaibMo/H4ZUQ0EBuqWJkGvqMyBJ053NLkrel55+lNK38NHX8GXAPQAdAF4CM6AEfOBwoA+QTDAMAhOKRwt0V2+HYM6D8DmMgkyLZuAnCOiga7IVgdbF7asfqP0Lk051Zb2kKuJ0pLoUjGI7USDXcAzqEjQwEEXPCa0ATqRE7xu3xnnMsHQa7oWrFxzyFjPwJNkwGGEw4gKABYnfwi76ZMRW8m6v3psO6A3kDYg92I7P0U6PFlTcjZTNDX0GNUyhoRB7UO/OZll4PyElABPz9kyLBvfetbRCTJICmUxMvX2R/avagO2tWT1D9JeDHG3H777ZJxoJ1mUiFUUPOBpqamU045BZKiofulAwfyTPbhLJL6ju/706dPnzRpEuNTfY4qOM+bN69ra7fn5a21TlULkf3jPIH3PHPXXXcdccQRVSlnuASeZhihj3j2gp7+L6pzRfWTqQ8E0Znj2W8jwtixY35x7y8HtQ0REgEARKE6Ioyq/oWqNXLmjEZG8qeQVCP9B+E3jEJ7emQJ+khDlmuhD+rjRJIPS7OgJrR8ny+MMRaN7N8PZ7+OgrKvRSzpy5KmiQhF+AxWSItIARFxUNhER1T14zReBH7XObfnnnvOmTNHov9ExFmuLjyDPi4jqLPSMJoC8U/FYlFoIpl3Jpnei3EFrnhug2rNQDKbEJHJnNQBAVFYW9YBxceoRhtgeUqjSw0QkR/4ATnnB/GrjuQMa+d0nqBDxFwuJ8Otg0G6RxUZiaHPSEGK92KuSDKDflhonloCyWot3bJLFuisKO+ZVwAACrl8yFH9l00hUXNz85133tnW1sYklSFGFQzSxCQVmhQ8e0OYKODk1j/96U8LFiyQcKc+zKHK6ymEZWRFlOQgLDExclZvqk2tGZRXCYjY3Nz8la98RUaKCFkUAID1k0vmTSMiIXBOZdysI2ZXJGCeh3ehM987SDFqjaA1HgWOAkfIE2qReMcUSIROKAoWRCXhwzUatRCSwkT/lFlFMJJGh0jGQHRUmps374aPf/zjfQp+1poA13fzS0FQ5lqT/FfrUn5eq1ZI6hxSoY2KpAOAXC7305/+9KyzzpI7/aJ/Cm0dGE19SPABgFgJ97UKUF1HVX8rhR6o8Nm2rUSKdLOAl8vlSy+99Gtf+1oVPPX91IizoeE95lxBFeJxDCtLULyETM6J9nCZf70h7JXLwc477/zzn/983LhxeuWmT9AU6xf9RVKqPybaUitPjBZvBg0a9POf/3zo0KGpx0Bxlwij/Bo+44jjNpmwuNVpp0FQfmPVm7fMj4t7iL2DSiYgxTyxZTRI7At5Fq0xnpXz68W14IJU0nHnAqKAlx600IUxoqinn/nMZ0aNGiF3KgmMIwo4qmAB6rxCq801BZDzOVoQipz0H1x4GHSiDeUrMP/1ZjLjKR8AUBBYJEAHFAAFEAl2imo7oDcQJk7pBWMMog0IEPJoBoDXbhsmNA/+YK5pkm/ai67JpzxgtDPRJLZLMIsgogFC4yx2F8yWeruuZ+PiNSt+C5ufB3gNzHqADkddACXOSMDk7loRyKxGex/6DTugEoiacATOQQmgx2IPwAbo/lvH2j8XNy6xwao8dnpYsgYh2tMTzSMSzMlcINo5bDcyDKzsDFprc4A5xIJPDV1BW5DbZfDoGV7bvmBHAA4gKmBYzSChHESl9KkxdqiUfzoQn14793K+dvZ54TqZ9veZbqnBRYk5p5122oknnsg5jNqLkvZnzZo1ZswY6IWpZDYlyCOi53kNDQ3aWYFe9CFGm60keRCSXlGpVLrhhhu0vgXlfLuofCFFa6FBEBx44IGjR4/e7uo3hQMiNjY2nnrqqeJq1PLFFStW3HfffdYiGOTzQ7Jf4Y40Njbed98vTjzxRAi9sfgB7ShTNLeX0dEnAumFYv0Tp/Lxf3nhWvu78hYkYx/arWxvH3bvvfeOHTtWup8IkjowEMdBOFSko0WQ9Pmkd7Uot4qgqSGWvUYeIBUG0uJWBRP9uexP2v0FVSQ0e/ylTgqTiJ5QqU/89QP8Cc8LNxZJd2okgowsEZ1yyinf+ta3yuWyTLTkgqLYn/RdmyQ9E9D4Z3GQ0eH5IShOE7SFRFrMhWdIHX6lg+yaqfSdKJIJIM84RxFPMogsMJJ8kc/nQQmRnlBVpKSevdTIzKKNuWWufqV/omghAdSChOCgDxDQHQelH2rUxqkByuUK3P1tBlFoEyZMuP322z3PE9lElU+k2Y9/Sp+nVCk4Ir/yTz/84Q+FMXQp0lpGQZtdVNNmYSemvyT8BslT2lOGKdUyEV166aWTJk0S5DUXSXcCdTa9tOnUck5K7Qh7b9PIvIegRaCWJ1NqP+5gJKQAYZWDlL2Q6GRATggrLJQK4qS+oskLSZrL88KKROR53s9+9jOuxF3F4stgQTL+AtFKFQcoRXExI8lmc4284C/jbpLHJYHS2w0NDXfccceZZ56pbUqNyr9il1PMmdXnGhPtfPb3oylIvU69g3gUWmnXLuxyzTHocrk8a9b/94Mf/ACUHoBMvFK+m9W04gjpkeUndSAsO7PrE1WuoHrQQQc98sgje+21l0sevlcdhANF5dbyXQ390jCaV7Xyv++++xoaGjQX6Xil/FfoKSImxlFeTBloRMzlcj/+8Y83b94sKZMQjYj2TvWAkqrGEGJrjez7kbGT5YTYhYiUf7TMAM4lDIdunDHZZ599Pve5z4lXk1LjIubOuaiamymgbUav2WEdgdV4AwBSmFhlQhUTUz87ulEWVfS84wp1SA4lhsqBZCQ/8HsAAwDRIIniWRXb3wFQyXPS/oRFjwgBLEA95Ibb+vHNQ6dBw8QSDikGdT55aDxOdwyAHIIhgIAMgQU+qRnABeTKLujyaHOj3YDdL6x5+ZflVb+F4GWANQY7CEqAJYCAwBFQGJcKB8txrDll/3bAPwPE0Ukgh+AD+UCdQOuha0XXuqd6NjyD5VWWNhsoAjl0BIQWQhkHMoi84goAgJxWScaQIUKxQwatNR4Bv4IO0JF1YMuB11NuorrdBow4xGubBjgSoIXIICJBKtHGcY4AVFpRzELWxld8bAe7vt8gtkGIYj7F4lZ0AfnJ3sqQZYc4tseRs/KTH/34wP0PaKirb20ZMGjQoAEDBjQ2NtbX1wPAYYcd9ulPfzo9K8h8Xd8Xj0qMNKo11dTr3GxdXZ087KIzJfinBx98cPny5fL1it3RnjQRnX766SmEtyNop7xcLh9//PFNTU398vyumzunWCwGQeCo4hq4QwxDIQ0NTbwlnGWfJw6q3JgDSNdATE3I9X35SW4mfA+DqpBJYramXyEiBNhzjymPP/6nvfaaGqijQrVfGIUIAslkIcJoPu/L7AJU+Ek8yFp87t5Ay06U+aL4zST2SOpfNcUqSlkKtNMfU0Zv4wKSEmnicMfnk4TvEh/il2rQmLA8VsxRBKkClJxTSUDSIyKuGxIvWvRjXkHA5d7kxUsuueSss84KA38IUks0FfuDjEhSFFXMzqCqPA9Jv07apyi+BmqbrSY4Z5PxP83SlRz1aFhjksVUFWWLiJy3RWCkiBVkdC9ldrhnn4SqLKRBN05cFI8zxbjgYNRZ4PpQ0bmdIc8A8LgLC2kdhdHMB5KTtIpQUerjSl619KSX3jFtDzvssO985zsQhTO0rOmHJbksxWOan5MqzhDh888vfuCB+7ODUpHreus7qKCSTEcT7GTCHX9iobQl7Q0+8YljL7zwYo2Y5qKwYUA+S0qeCRMGkxCTxREFfZ+/9A8BLcX9fjmppQERIo0anzCJQAiaOFk1DoqXoBLbUxTcT2keiIXIcga6MSaXKxBhLpe7+eabv/zlL2v50pwswxHWteWmkrZAXhGLLGymI1yoQDOMtM9bCrnZUaNGPfjgg8cff7w+s34biC+KhaMzkGR+rWH0HZGU7Q69CW9Wdcgz/REHI+PLUC6XvvjFf//Zz37W0tIi9ksrUuhFf8YDhA5MKt7tiAIwbKBkHKFKawJq6N0555zzy1/+csyYMTzEUPPqo+a32llC97oWkqZa1tLBYrj//vvPmzeP7/OSJChfRetDVAtLkS2GIO0tx9mmzqdFT/352muvlXPYKlYGALWiI3xLKoead4oIDnEXrJE8Su2QZFmCIvePM+ecA4tm1IiRP/zxj4a2D5NcWgBgH48hMiXG2hy3awHy6DXawqAA6glzcnhNxFVAFP4llVapqM8Pc95leB0GKVT1Ik0UdvwI/LAMJZCu8CIcUKND838ZUjwntoQIA5cDGIB1O9nG3Qa0f8hrmuSbdh8ay846NICxxolGkMfMISKSM1S2UPRwS4PdYEsvr3v9dxtfeQS6lgG8hbQWXAdBCagMEDjngzJpWhr/ARTZAdsIsq3bARCgAygb7ALaAD0ru1Yv6t7wXMGtqsttzZmyZ9h1SMx8YuNNyEpPNCAkowMQVU1F6wF5hJ6DpnIwsGRGDhi+X92w6WBGALQS5RE9jKvvb5/l8awt781p2wH/ECC11qfNR8oFSfmF/IBkaVUczexN7a8AgHNu6NChjz766MqVK5cvX758+fIXXnhh2bJlS5YsefbZZ2+//XaOVGad+CxWoFirUCjomZtYdMmL0eEGTreUd7XI3HLLLZBRrSmaCPV83x89evSRRx5ZsePbBVLWZ+LEiYccckgtAiU24umnn37ssceqZMWC8neNMVddddVtt93W2toq3g/oaap6UeMmy/iS5pP9q/8bbh5U0yE9L9Kjf9ihhz300EO77rqrPBZtKI6LBxljcrmcjr7pYRLQrJ7ak/7uRkl79sqbpKg8WRKM2lXUp9Ovx1pjS1GiqBRUldQJmSSn+qhHDdUUgqKTnfqQOEQWJL6ZiX6m9yH2AWmHCq+99tpPfOITEi1KKajqID3VN6WnqZsyQDrfQbgdk2UcUjRPEbPiF8P+RbWasvinxAGUEkYM0xdSsSrNWpSZLeuW+6SVtCa2vlAo6FqNqKIGullBxlXNAkuxmZ4cVtSrWjljsuTcuxFM7sV555135plndnd3c+OSlhgoIGUNNSOJUSCiFHF4IKZMmeIyx7xmaVIdSVCDS8nZGSWVp9zR72bbmTFjxi233OJ5NvVrCsk+5YUf0L3bXtpyu4MSn/5b4VR3ZGoNQMnE4ZQ1TH2LKVOjMk9pD1KmFtSaKwAYY77//e/Pnz+/sbERkkX3UPkwrJwheh+SO2NS+MunsyEkSq7yxtZZ2ampU6f+5je/Ofjggyl54I/2B2oBTQQ5Ok/6BUllIqoDVU2VVHe2GVKUl5saUkrvXYKJtnuXSqWTTjpp4cKFkydP1u2nTI+AFk+NqMaZr7BSkKc35CMCW0RsbGy8+uqr586dy8c6GXXIYZ8gtKrRvemtkT6f6a1Z+a5z7uSTT/7JT37Cjro2aqS8I92a1q46CC7fCpW/tfX19Ry6TQ1Qb9epm+J9pVbFZOhB6RPNhNJBjZgMjTHQ1tb2gx/8YL/99hPktc8gvo20ZgCAHAJwGcpBYFocGeYDipUIAEBA8bpxkuLcMTDJX7kqJYHjit0AUTYlRBsZACkoAgXAZ34nNfF2EbN/bSCI0wi0Clb8YYg8gGbIj8k1T2kaOs207F7CwWVqcJQLV9yjvQAIDjA63jFwiIiG0AQQdCF11Hkb6/DN7rW/f+fle2j9nyB4BcxGhE6CHgQfLVEYaGbGFQ2eGNQdY/qPB1L/EqDcbiCCgKhM1AWwCcqv96x9cuv6hUH3yrzdYqjHgE9EhsBEi5axk+TAEBjQOZXptXGEkC0Q0QXGgQ2CXI/f4Od3aRt9WN3QA8EbC9DswABaACRCrogb8iRKU9VqlPRKgAwTpqYlO+AfDtp10KNjetkkKM+4aH8cJauV1QLyIhHlcrkhQ4a0t7cPGTJkxIgRO++80/jxu+y9997Dhg0zRnKXbMV2tIsmnitvtXCZOmIaeZGRxsbGhLxE1Hj11VcfeeQR3anUiynPAAA+9alPtba2wrbq3lrekjkDAARBcO6550qvq7yund05c+ZYtEhxDR2p7ymr+qD2vJxyyikLFvzpkENmOOdzfqWeHoAKlsnn9KBkpw0pavOFMXF1SESMcjSsVLoEgPPPP/9Xv76/fcTwlMuLiNZy6p9BRECsr6+XGtwpUmBmwkMAvgtSndpmSLmJ8cknUgwBwwmVZFlq6dMbZqu0L+5pKrDCtArKPrhk2Auhp1TUTnbFbnJSKo+Fc44QABN8HgIgl1oDdbaSA4KoNggA9MNeYOjrCm8TUaFQuPnmmw866CAKHFL14Hu2F2Xo5zhKNi4kxVzoDJXkPUvGXucnSRcgq1WYHxHDRDbBQThE9Ju86DI5ib1NX6sDJVdxcjnOmSBdTS9sMBr0WIIAnNpvkW0cVXKofEWmSSmE5X7K9OhR2AbQduG73/3u4YcfLoKQypfUs7VUUNj3S6mccbkIgmDKlL0WLnx69uzvNDU1ZHmmkmaWKuIJDGOlJFmrCg0DKLJAaiNCiiGlhWOPPfb+++9vaWli7kvZ6Oiaz7aKCz5onHVPE8QBcqpy5fsKKvWx1ucTgiquO1fehDC7mUeBXyQEtCZOf47sV+oTvZnmlBnN3pQ7xhjP86y15XLx1FM/tWjRooMOOihwAcks0iBaE2KsTS0BUEJXVKRJCv9QJwBGRe/JkeMtqIgY8iHBWWec+eijj06ePNmppMteaVsDmOhwtorFqVMCIncwuR727i24tFD7qlhvCrA6SMvsbuVyuVKpNGHChAULFnzxi1+s6FNVfF3+X+XJivYr0wXL8ShEdM4/4ogjnnrqqc997jzWNuyx9OmipCAlHbW8oo3duxlNzcxBEPzbv/3bhRdeyP/VNaadOhMssVKIwNnHqcU5qRVLRADBHlN2f/bPz1x4wX8ak6Bzn6AlTuttHakUbcP4oDUE0baSyGuSbsqnyfmTd9v99ttv/+SxH2ffhndUR80aotAcu/QWbwSAHNhGr67NFgYi1hEHBRClpmQQZlBW5rYoJh4nV2KUbhktnyQcrHAx0BXLpW4AHygAAJ3I7vpTMun/OPRuaaxBD8gCFMC0QWGMbZjUOPgDuaYJvh3mQ3PZ5Qg8kONMeGIVpY0gb48CZwxYKFu3tQAbGs1qt3XZqr/9ZtOr/wNblwGsMrgJqIuoCBA4CggSBXr1stkOeN9DlDsJAUAJsQfdJii/Ud60pGvT817wWr3XYakLXRkAMJnJKJqIRV5rT20DRKiJyPedH6ADG0B92Q0o0YgBw6bXD98fcqMBBgaUR8hljB0BGYKEQ9BfiDXmjnD5+xW0q6cXEvP5fHalFFUgjFRMhJcl+/yQNmqkyh5RJotTfzHZSOXGtYVmV76iYySugDQrM3NKZojccccdxWIxhUZvuYdElM/nzzzzTInr6V+rk6VfIGhzEPbQQw/dbbfd9KBAkmKpa0R86KGHFi58CrFXz49UNIGTZCdNmvTwww9/97vfbWpqkjVnIWyWtpAJTVacVECyAg4/zNQzaGRXLBGNGTPmv//7v3/0ox9JdVHtsegLIoJMKCfVu+xNvfrtXL+XYSoCs4pOKrFojAm37orznTqmozq36E65aNc2Y+6iokWa/nqAdJJjakTEx5Uth1x/NvykWrpANRU0xkgVNqnE2r/EyQgZ6R1Fkwfn3IABA+6555599923N084ej1Nn1Q1veqQOiFaFxQDpalE1wmS2s0WEqW2X/WGNiWnMXwpKoji3I1qeaMVlXOf/c1CykZnE6kg2dnU/d7qe+i35C/nRknSWQpABTQ5KUq3AO9Ol/InGhoabr311j322EPOE6/IKllKlkrOIiBDAAAgAElEQVQljZ5+hmXcWnvxxRcvXrz47LPPLhQKuvE+scqqsiwyol1ZZ+oz30VdyxcLhcIVV1xx9913NzU1pRqRZlMmIwiCoOxnSQGV6E/RnP996Nf1F6Xenq84NFlbBpFcSGaZNnO9tayLNVfBLbWkxDGscrk8YcKERx999Ic/+kFLS0vKhiKCUbyhBU0jUHGU5RnuCJd0CL8e6SU2NGPHjr3rrrvmzZvX2tqaEuFtA1T5XHKOYhUM+XNifaCq9tPeSC0gZqi6YGa78C4VFI+v7/t1dXU/+clPnnjiib333rui1u2tCVCRn3hEEuxRIeqHiU1Fzjk3atSo66+//v777999991FvbBX0K9RrigvtZAClHDV/rmK7cgyNhFdddVVn/3sZ8MSQMndEkQJc0NRoA2SPiEqB8CY8LTpxsbGq666auHChUcffaRkHPeJXtZDdqrwa0pXi3MlRQHkSfYhwzxi5xrrG0495dS7/vvOQw6dkRIZPRzcKR2oDStGAljAvFcYSKY5wFy81E8IZAh5fzjvGOd11fgsb8dhVBS8wziHRUBKxKfIYCDrZhAgBBQUgcrs9iPEEcpaPOMdEFIsDmcDZBQfgSFnifLgWmzDhFzjlPohHzRNk8pmiA/NZWcBc2g9B8aBQbBEhI4cAkW1fsLKJhQYKOexp95sqqOVPWsfX/23e4K1j0FpBeAGgyUEP0x7MbxbP64IBjuGsgZIjFpt0QSKoPpjiaYQ4n+Zr3PuJFAZoQhuE/ir3MZnO9Y84Tr/lseNHnUbDCwSOsfLlXKEYpjI4CgMSRtDkTrjlg2BIUAHyAW+iYjQGBs4zw8aizi6adiH6kcewrmTRAYhh8DeLUZGTjyOXgs21UJbgQqqfwe8P0CPrPY/5LRT/XBqVoPh8iPwuaJQdXDFodTGmI2rUUZXn5GX5boqbCiuAy8M8k2XqfVO0V4kfjifz8sDIuM9PT033nhjbx1P9ZTpMG3atIkTJ/KcbdvW82t/Unyg+vr6L3zhCy5Tj19fa28GAMrl8tVX/xhRIhHhamq2s9wvay0R5nKF//zP/3zuuefOOuuM+vqC9uf0W7UIuDwjbJCa7EHMIX5LS9MFF1zw9NNPn3DCcRyw6EUXhRlJxhgwaHOeHvQsyH0iQgB9kvL21U5xVQGIfdZETzFcrSS1pag6MOmCIAhPm005IcpOqXegXCzpGzqMLvMTfj17To5Om9UcJTfL5XLGI0/kiFUBPUaoYnzOucGDB//85z+fOHFijdObiHmw+ujrz2mmzXrz0iylZy9IFOb5qpvpg3EBwkqd0UQRdNVOlUgIRImDOAgCcKSLaXIdoWx/3z27EoCcyMzq06IBF6ZppCQ69bmKvlPqmXDyYwxPcUEVyxP+kQmk3HEuvk4JzraBtDZixIibbrpp5MiRWVQhKZsaeIc3hefqhPZOxDZaD8OxY8fdeOONzz///Oc/f+7AgQP0d5MS4WQLVPbrqQt5RkIMLgJRoaCqBx511FGLFi366le/ylMDhUCFMIExnnOxw5d9JqWuIalh8N0FZd4L0BzV73fVVcj/SsbDarMQCyIqseVnuJ5ynxawRiQjzo93OSDaXC60v/9x/peee/b5c889t6mpgQJngABQ7aijuCNKiVW03Sn0dA5X2JTjExBoUOvASy655Mknnzz+xBNkl+c2C6YmlETYeYFKm6fs89FFmLNfHYEamSH1RW3RqgyoSA3WsAGi4rvyCaZAPp8nou7u7unTpy9YsGDevHlsAav0IryfdM5Tgiw6NtVHYzyuLU5EzvltbW1f+cpXFi166txzz5WFlv7GJfUX5UP9UhTaRvT3uxUxkdG85pprjjnmmIrikFJxfOQHqJWYcBqO5FyUkEEGwXI+495773Pffb964oknPv3pTzc01GHvSQAp3IjCKJ8YQVIQoxQ4A1wuELlGMJPXuQCRkMAzdt+p+9xwww03zps7bvx4AiBI8LA1YI1gFe+Xguj//JsBLIBpyeUHBS7vwAMMT7oIokBldDAFt9tr30SC5BnE2JsMuQodgCMoB36RixgCu00A8F6WmH2fwHvaO23Uw5LuJgdkCRsA22zj+ELzlPqBHygM3KNsh/rUUg4KgbNgLBH55FICjGAdR6OQk4tLFjrrzcYG+zZ0LVu98ncb/v5H6FkJtAGgG8GH0PRUPsViuwj2vypo4qTcsqyfLT/JYFW37tlPJIH31BBAgFBG6AbYBPSmv2XZptVPUudfC/hO3nR7XmCIWC/pxrVrKP4xqfwOecw55xDIIYGHJhdQfSlo6iy3NQzep3nUweCNBhjkXAExb9A6chCdkBP6X9Em0Kz6rpG2vXn/OzjzfQXizmoPhpJH2QjI0GlZIAJ9tG4V0Iyko4TbsSPiJuoeoYpEgCooBuqcXN3Ugw8++Prrr2fdsqw1kZZPPvlknY31nk7bxKkKguC0007bbbfdKjpzOp1T1Jcx5r777nv++eehd3lM3ZF3x4wZM2/evIULF55zzjmDBg3qrY+1C7iOfOmuAdGE8btefvnlzz333Pe+972hQ4fKr9UbZ73X2tpaV1cHvY9CFcy3IQewCujVX1LH12R5EgD40MYqrVGyopM0K8hnu6Mb1z/pCL5cJNcJEgEjQVVfSGtcAbN2slQHjOJZQRDstNNOv/jFL0aNGgU1yBSjmjoXvgpk49HxSGXyKBkSkVklU4KzBn4GRMqiV+RbKQGMVYerwB4Vx/fdG1MCMigRQHBODWUvFjyFrRQt7Q1P8VJ4OYqiZST+VS74VxdWDtn+y5lC8L333vu2224bOHBgRVQrvsuC6aLzE+RFKdTAVeT49XHjxs2ZM2fx4sX/9V//9YEPfEBnqciIa0itIWnR09obkqETzYpE5HnezJkzH3744XvvvXePPfaAJHtkVb0MHyISgLU2oD4qfspNFjGjNu+/f4DU8mftPgkoEiHKOn0y64d/zYRa9KBICzJwFT9H/a+KIy2LenEORo4cef311y9cuPC88z7X1tamRSbEIRmfguS4pxrXpgQxPryOZXbw4MEXfPmCP//5z1deeeXgwYN1Dle/epGlhoBoht6Cg7GGVP9Npb1vL2RSkt4bKGSoSjp5LS1AZPs8z8vn89zaWWed9eyzz86fP3/atGkJFo2ej0chaV+0T4jJ+zx2ss2IYcyYMZdddtnixYu/851vt7W1gXKht3mIUU0oapRHUCK8bR+tjkyhUJg/fz5XTRXQlTSySGZ3dyUIosbCGPOhD33olltuWbJkyTe+8fWJEydWISD2su09m0eZ8pNFe8idfC43adKkWbNmPfDAA8ce94lcLpcq96xnc3qhS06jcs55AIBggQLAHOSbvUKr8+pcYCwAITiicEEiCnvyXm+rlZ0jxDAiRfHYAzmwNtwyyu/xKV5EDhAAnQVyQTdQGSgAdJy+x8jLbKe2Uf6ngZQbtF0gGp/4OrqPSEAYVgMB5wEWgFqhbmKh2SM09Vjo3rTcL71dwE6PetBYA+QC3xiOIAM5Q+FZUWxZHSAC+cY4BKy3VKLXOtZ0O7+rbQxiIx9m4hFYYE4Awn/FQfxfgNQ0DDOl2VN+mKtaJDhp/rkdbWsDRKIwa6GE2AO0GYK3oGNJ1/oFbutLBVxvXRdah84BEjoAjkMjcMololL6AQGAQQRibZBwQwkNOPAdASK4fAkaytjePHTfllEzoTABYCCRh2iZkQ16obyA1Zwt2nMbVERvz4ut2sGu7x/Q7osMEKfwJMWB/5L+ixhHKKqPaUWPdnuxAbcjW1+1syh+gHaS2Gbz6XvyEzdyww03YGb3Ym9zNmNMU1PTUUcdxeR69157nyBTIGttS0vLOeecc+GFF2Yx1JO0UI85Z40tl4s33jj3mmvm8C/Vh4P1GBEhhu7slCl73XDDDVdcccVDD/3ml7/85ZNPPrlu3XpWPv2KKaQ0LcPQoUOPOOKIU0899bDDDqury6sHDNawIs2UaWxsNAY8z/h+3z4uGgjIF990+w+cAULnggh5RB8dEYSTPxMFIwwiYnd3t3bodTNCCi4qVCqVAnJgsGIwi0Hf0Q1ibCwShk8uOGUgVALJE9iBl7cpdIMQEQiK3T0UOAgPJqrV48r6UQLi1gdBsNtuu82/5dajjz66p1Ss9GwCjAlrUFY30/IVPjIlxYeaFNoCQkxS0YMxiWNq6y65uKfhS5nnw2mDpA04CoA1iS0Wy7Hz3x8rXPuTRqFLRF1dXWAQOEE0xVAYZzbwwxaNgVo3MlOUjFNxmUebD9/3OUDp+34vDLItoCd4Bx988HXXXXfGGWcUi8Xq+PNLHGD1PC+aN5kUdaV30tlRo3a6+OKLv/SlLy1fvvz+++//7W9/u2zZso6ODiEFJXP5s4ZDP4mI7AdSVBhU3ho7dszRRx99+ulnTJ06VW/9hnD7SwCAvUllyFeARBhVK6tGDYoyiZwf6D2w7zdARDnTo/qTKTGMXBz53aj/qW1qqWgFUQAB/5CSEY2SmBhEZF6qjYDpsZN1L859mzhxt2vmXPf1yy7/7cOP3HfffU888cSmTZvCT7tq9r2Kiy5EyOXz++yzzymnnHLiiScOGzZMuJQCh9uUWFcdWILkJJPKiEXXRM5aWy6XjUkI0bZBdjgq5v1VRMza+Di1/kIWZ1mBYAb2PO/UU0896aSTli1bdvfdd//mN7/529/+JmuZsVpLMl6sdfn0gkR+epjUgohDhgyZMWPGySefPHPmzObmRgAgQmtzUU+3oUMxDoKhtTYIAv5bC0F07Gz7ThAAYMCAAXfdddfHPvaxZ555Jott9q34J4MQ+k6RSGI4x+fGWSUaY8aMGXv55d/66lcvffbZZ3/1q1/99re//ctf/iJDlp0CI4V2TsYo64TwT84PAMCRA4C6Qt3gwYP3mLL7scceO3PmzGHt7TnPC2dwYcBUjDjrMTZe/F324di8kWetB5FLg+gBNthcq6N6R3mHRSSwlvUXYHTkI0bLFxCqTbImJpZzZAx/BozKLCYCRAIIA17hLnAMKOiBoAiWuHsGPbH9qCpo/MtAf126bYZwRAwiAJFDMGiQHKBpADKmyTR4tpxvRFtf2vJST+drOejwoOiBbyw4CI/BdUEcF3dExpggIEBHLkBDOeMMGPDMlvXLsDCsbedBYBsAChCeamKotnTiHcCguT1rsLU/re9X93V64zR13yESyyOCj6YEtBFgjetYtnnV49T1twKsz5tuNAE64kRqrRwjnSLrS5Lg7WQrVqQTADieiQaNF1B9KagvwpC6tr1bxhwC9bsCDCbyADxADwCcAxMmfpvIgwqnYdqpqtLHfkHWEd8B/xAQKdAXFO09bGhomD59+rp16yBeQgw3BbP3IDELY2DEiBG5XK7PL1acg22v7kTImOHDh+++++48v+XIKRHx7Asz28zb29sxGX/ZvHlza2vrAQcc4JzbsmVLV1eXbHpNAU8z6urqzjnnnLFjx8ontlePqgNG6X7HHXfcr3/963Xr1nFw1kUnaMsDJiqGTYHzfR8MLVq06K233ho5cmRt83+uvp8YrMGDB59xxhmnn376hg0bnnnmmccf/9NTTz314ovLNm7cGAQ1hSmZgLlcrrVlwK677rrvtA8edthh+++//6BBgyCKKWcZproK4o+2t7cfc8wxTz75pO87qfYlxNHXRAER+r7zfZ+dy+3rCLW3tw8ZMrShoYHjOBht5xFHkzA+cdszYaZV1n8FNYgm2gg2YsSIzs5OJBDG05ELBt5/SkQjR46UuQGp/cWawlHyGra0tEyaNKmrp5uIKHDifPOTDoiIkMK6VA0NDdOmTfM8771gfKm1es0111wz51oi4hUFVInSwvAAgEicUFyLGBLRuHHj1q9fj+FqBIdiwy20OtbDTr9IE09I+FwmZlQmXeghGHUyjKPUuEjqGURLCKJbMBka9jyvq6tLv169Uzqpbdu0ECIOHjx4/PhdnHMGrDg8oXo06HkeH+MTftEPOJeqFlIbY8aNGzdhwgQT1bOTfgkIGog0bNiw5ubm7c5UQt4TTjhh3bp1c+fO7ejoAIByuSz7plkeI7Uf+L4/cOBAUDFBbTG5NZ2vFHUBASCXy02dOnWvvfb62te+9uabby5atOjpp59+9tlnX3nllXXr1pVKpayeFF9LEA7/RlmluVxuyJC23Xff/YADDjr00EOnTt2rsbGRzxMzmRKZ1bWl/JrP50ePHr1s2TKdEJpK0pQGPc8bNmxYFK59v6w0pwRkzJgxmzdvzuVyKfQUiXSCmJERpER1bFTD4SoeVE3hfC2Q+8LMQjdmLeYo3/dHjx7d0NDwLg2NIM9yOnTo0DPPPPOMM85YtWrVH//4x9/97neLFy9euXJlV1dXauZS3TR7ntfS0jJq1KgpU6YccMABBx988K677irHiIOSgneDfJUeDR8+fPr06WvWrIGkFGi1JofDOeeGDRu2DemoFb8OiosGDRo0YcIEWe1OKSsJn0Vj7XbbbfK2DajumuZhFjSISjwj4tSpU6dOnTpr1qznnnvukUceefLJJ1988UVWIxhPD8Nm40F3jHr4P2vtoEGDxo4dO3369COOOGL//ae3tbWxVx9JOmJy3rdtIO8y6UaOHNnU1KR3LKUcFVIbF3baaaes7/fuQeSxvb39pptuOuWUU9566y3IqFznXLlcFsesublZTpavTpOU1q2rq9tvv/0OPPDAWbNmvfzyywsWLHjyySeXLl26cuXKzs5ObfIYspIln6NodlPI54cMGTJ6p5FTp06dcdAhe+65Z/vwofl83lgbJlsgGrBAgBjOdMR11GpcWnbOWVZfvHGdnEPTBcEqv2Nhx+t3eT1Lc2azoR5esWQGjzKroSIpOKBgoliokhxADO8HRACGEIAsUWFrMJSapg+edALk9gYcQcAbiivYs38ZeJfSlYF0NlzqW4AI4JDdREQHATgH6BvsAdwM/uqeTS8WO/6CxVd7Nq+w/vo6043QY42jIHRtjTHhuTdk5A4fjklgA6qn3OAuf0iPN2nM5E9A/Z4O2pA8QAtktSkFCBf4Kh4EvwOgr/QKqjQ/TL2lJwP6yeRbDpKKwBgg8IEChB6gLeDegK3PbXp7QXnz83laV4DunPGdC4wxMi2MFUoiBo3MJ0QUVppEJIMQOABwCAg2CMjYvE+5MjV3ldvrBk5tG380NEwEHEZUD9Gx3UAmWs8I12N7kZowi2obqL0D/ilAM6pYMtm+56JCVyDzVbVZwFpbKBTeD0aEXQoOTWJUrgsyTrnMRQcMGMBFfwR5eUXa0c5TyqvgzTj19fWcPim7k7a39ancU7kul8u6v3oiLb4mEfGpJr4LwOCA5pZCobBt300FTWSG9s477/z9739/5ZWXV65cuXr12g0bNmzatKGrq6unp6dUKgGYfD7f1NTU3t7e3t4+ZsyYcePGjRo1qr29feDAgXH8Kz6NhONu/dY5QRCUy+Wenh6uVsG7Vimq8e+c4yBUEARBUKYAWlpahrYPAwTkyXaV1L5+Qk9PT0dHR1i/nMii4WJDPBZqaDhhuTxo0KA+A/1M81KptGXLFjm7Q36CJIvyBR8d3jygpa6urnrkQlooFoscspGHKVE2MU4By+fzuVzOGMPjVXsGZY0gqyaMj46Y6L8QqSM+I6sW6SOiUqlUKpWi4EK8AKNf13EHviPz4axLAKnhMAicH1Fpyiffdc4x3aIOWt/3S6WegQMH1tfX10io7aJzisViT6lIRFLiSpQJ4///s/dmb3Jc15XvWvtEDjUBhZkECM6UZNmWry15aHfbkie579t9uX/i/TPui9vSlVrStURKNFukRFIcAALEUHNmRpy9+uFEREZmVhUKQBVQAM7vw1dfIjIy4sR0ImKdtffubq+7DwaDlZWVIy48XZhtX9oNMFzYltjr9fr94QnZJrzJsjoajcbjcStwdzt596qqqhhFcn39zLlz59qQx+574+H7fO4sbU+bjY2Nzz///He/+90nn3zy8ccff/7557dv37579+7e3l46IdWM36T7y/r6+ssvv/zmm29+61vf+va3v/3666+fO3euOd/S3nuslG27u7v3798fjUZppWwiQEkmj+20EELz6NvvF2tra2bFo63x5Egn2MbGRjemAQtR2N2f1P9trtbUVwN1X52evQ379Jzd/mfflnT75HTWpTv1mTNnkljzaBuI2X6GnZHXdjRld3f3iy++eP/99997770PP/zws88+u3v37s7OThJf0k5YWlo6d+7cxYsXr1279sYbb7z11ltvvvnm1atXz58/3+/3F1+UnsyDTWohOspRdye3W5oGIEmtr68fe0cRY0zjB3Md1Ny9tf12OBymxDIPi6T0Cnb4bN6YCluxOMa4sbHx4Ycfvvvuux988MHHH39869at7e3d0WhUVfVNrdfrnTmzur6+fvXqK6+//vpbb731zjvvvPba9cuXLzcJN9iVAvd9831M0v65f/9+WZYHZXZqd2Y6uMPhcH19/Rjb0K4lbWC6z25ubo5Go/YQt0OS6dY2Ho/H43FVVZcuXUoieLOYw7Sgfdfonajtsixv3rz50Ucfffjhh7/73e/+8IdPbt68ubGxsbOzMx6PQY+OXq8XaP1+v9/vr62trSytnjt37tr1q6+99to3v/lHb7zxxqVLF5aWltLwbSq83t5Mp3aEZic3s003vPtq0D5Qsa4kINHGwNfY+vn9P/w/2PnFAF8XtkfBXSlKpg7iPkCgTFAwY5xVWNvdFuvfmhCE3l68PO796ZU/+r+x8rfAK0Bocza3Z8Zz5qBcPO0ej8NOSocIuioDyQCXI5pB7rQKKIFNxJvjrd+WOx/6zu+r7d9p9KVhq29jqjS6JIOE+rYRqyb6gyBDdETvW3+9squ3dy+/9q3/q7j4d8JLRA8yYSpQ1p3L8b1ivYC0vZiaUQvM3iPJqZ+/HWvt/rZZ0mxOH7rkxhKYABuIX2Hrvfs3/t9y81cDfTXgTlAVyMojmlcadLvyppYCgPrQytwddJJOSLIU1UGAAepFDCe+vBcv9de/e/HNf8bqnwFX3HvGoZJNG4GkqzIWMwJ3av3MqIsf18vn3MN65pTQfRGde/t6Rg/WwRfmw/22OxELLwbttymG5bFa/NgctMnT+0LqOR7+5rC47YszNONqaUKd4L8VfNOD1L5v+HNLa55GHuJB8Ohb0ay3ebhqOtTpPjmBu+dB+3/xNDvGa23a07a1EReWf9DqDmpY9zRYeH09/uM1XXSnSO6+7T+O/Zbee2fOz4M44uraU+mQu56UXsX37zq6O/zJqAPpwuDsxJM7Sw/gBM+lLoeeTlPhrz030mxHuYIWV4T9RKWu4FtVVVmW7cBAGu4qGto5uy+9JN0rM1t8fnu0/dB9l26+S9u8OH96c3ys9Z4c+/YMc5fh3H9TguA6a4GLZoJIzkyfNbmrEQTnpmP2Uap7oE/o2mlfWNgMJrW27tbtmwZcp0U/yH6/n0Z02oW0C9x3Q54wD3t7Oum1H76WwxWbQ/Gj9HXpELfHxZvwiG4fEmMqc1dHExdFEUKKNuiqPbGzIWZPJJls96LD7NmFhStx7icn0RgcGjq8+LTTac9D35vay2pxmWlYNOmhZVkK0SMYLNCSbbPX61EWigKsB1DRPDM0WLfnmeud9t297Yf2nUVS0eaLAwqgj2KVxVqFAdgDxu4xsBYWDVD7LHvASS8idnoTM0tJjqOTTYEdkvIIBWISq12UuykHpXya67fdd8/oW+hBpJv38S3vsNMx3akN0xgxRUqpDFzhDrM1Wm9w9sxg+NJe/2XnOvoX4+6nk+rrAjvEhOZkpFOI7m6hLgYnT3HfBrrgVRwT0WOdjEntE1Nnq6eXlqYTj28/PP/MP5/NTlSjWi6+omP+yZXT7ozO1K1wgrgJv4Hd3+zc/FG5+W4fX/Wwm6oeVfJke01Pf5JoMw89s718tECPJqFtjtdRZUVEmMSlMV5evvjd9es/xMq34eti36wHNcus8xmZy9uR8HYVs1Hwx3YK7bt7M0+d9ogsfnhYTsmtpNuGh23PvvPv2yeg2d5ucZ6HbusxcdAm15+bCY/Qvn23vfsChumzRBrCVTNjaN2Ri0Jkd+LCfntceeKQYzGdvLhPjunodd/rD9r/9fTHkEQP3cbpPeuI5+Q+czZtW+y3F57sj1lO6jbmoBfFfWd40GvkQd/W8UvtPF2xpqsotffi7sPAvp+Rzu3Oi9ncOQ8gBS501YS5K+KRO+SH7YsOmn9x4sl3cU/aLdE9Im0/JqnZ0ORP3OeHh++KxRMVC49Y3tSnSn5JzD7mdZ/9AEjRLD3yWXOaFUAK6HuwD+tw1Bhq9n24RaejIomFvB+nh4O6ju6x6B6adAhapzNJWRpYAAC4zAwCUY/1tNVjpoHhqBO8Yb8LtttVHtcem7taF194U6a89Dc1NZ1gc1JR+2HxfvH4j4KPyeG3tqPMebxrP3wtj9GEB4jX7YWJzmFq6f6w1wtFYUCP+ymAzX/DNBXYgyJoj+uB9vD3i33fCk/urFvcOdjvzCfZTdXYtGeal/aI7ZvbUnWq2ipFTlsxHIalAcSpVN31QrpcnhqZni7qNIBpID/dBzqPDemS73okJXkaBK01WZ/6q5JG0XHCi0CBYqU3OF/ZSvTQM6berTG/of3UbhprTbT9b7OwmTtryoVIyUkgekpjTRc1QdwDKyC2o7WL/dTpvN+ccuZ2YxrZcK+glEe4AAphQPYxWFrqrQ8G50YblyfFWd/7Qzm6JW7Kd3oWi+B0FyrBk/poNJBy0YpghWIIxVJ/aQ1I5RcJtKcM2jYc9HjxIjO3T47SI3M2d/vcDw+5kXRmSIMtThCYGCfwDeCWtj7YuvHvcefXff9qYDtmEarrJsiRnnm6zZhbabdvtQA5U7roGCNkYOEcTqrl3Xhp+cJfrL/+z1j+Y+Gi1Df25HWJTCJg2tvMvIB1N+QY+/vQJw0AACAASURBVIS5YZzM6efRDtazfnwfdqv37R9OjtNzBXEhsmzfB83E3OtQdyGLi33MhnUf6A+a0p3+mKt7YEuOPv8DbytzEx/Yo3a/XZxz7r9zwpzUuC+fOIuv34svaQfxON+286R4uq5c2I3/ZUfE6QbCdx8Y5sKpupvW3aLu/ItmlqOcP4sS/xHPjcWtPuKc+7bhoJ+fnv7qoPN/rkfSQpLWR+aQS6+lm9pv7lf7LS0d08cK6D6onTxYmny2OOI13n7uJqDcbwiBcz1h+vx0n2YPWW9zNNH5y7m/+y7kKL3rIg8UuTJH5NALf360o9u3zP388LfUw59XF++8D70ZzwL7X+MPf+Y/2v6xTv2u7rMWZXUKoNkETd0RjhCCN6/8qC2MbP4ma+1iuU4zY5uHShJSXqZOqvquQQnywLBcDNZlK1DhEokoJdtBBNiU6zWZJCfSgA6bEjrdv6m+HgUj23O1MwAEUB5HXu6YT1KWyrYxqt3gFWlPftzyKLTPece4zBO6r7RNjbEMIXiMcrrDAiQaBmQPYWira8tLV3nvynjroyp8UlU3Ge+Uft+rEVHSjBQYJVVVlEluZmFUcVSFYukSeueAwmAuNUaVekyv3iiHBNjz8KhxXBz96XnxweXoS25GUqdhQZ4SgnoZrIS2EG9i592tWz+ZbP6qpy+GxYis4LJUipsEJEfqCNKxFbsPr2ldzjTGCyCKhihILhjYg2xc9ie8tnL5e+de/e9Y/gZwARjSCiE4HM40RNH2aOnBF/Ouye6HY+gZHu3pJ/MUeTEP2Snf3lPVvG4G7sMfixc5uQ1ZXPLhj/4n0oZmBUee9eDvD33NOLoed8ic7X2wm8P0EXbOcY1CHf0IHi9tj3fQy147Brzvs8Gc7NjqHYccwXb+fUPtuq8o3X0760uYX8XDXomPzwPlktPAA9//27+tq/EkVv1A1WBu4uxvD8oicjxN3eeOv//HY1vjqaJ74XSvsvmrspk6P+WZ4rguzNNzgT/fPPAZZu7iXexzjnKknt2jefSnjm5Xz9lhifklHLC8h3i6W/xtfbtPJkebapFwkkSnBkkzZtkZ47Q2Y1LTbHMX6aQ1ARts8sYwBdnODiE4CRahs3BIKqaNozH0oaWif1FcLRUKBqOso0VIjZTZiZZvtmq6W9IHCWZI47vA/DnqLsqDqljtGSIQU43gxRHp0zPU2eWkm3RcW9090dO5JU86E4yFy8HgcmMA++itLF1aG65ejbuv721+NN75lH53b+9W0K5pHBipUoigu8xsELk8rtbGWr904ZsYvAQMm+eDuuWGpvSyUgjGczESepIc47jffqdQ652UMAlWAZvwm775/v2bP6q23hvoxrDYUdyzMO0D25GNtmJjUyipXcV8Igkzc8JkLtJ6zuGkHO7FiyuXvrv+2r9g+Y+AS1G9wAFAd6ju6Nq+bGYT8lhoJpN5KE5b9urciT0yi/LcI3DY4/6zzNyjcpq4uKVHVIQX51k0r3XfoPad8+ivnZkH8uRV3cwppHtN5esrkzmddG2GR7lOF+/R7a38qTzBdsvUNLk+AMyMO87le0mSIGlzkZ2pRCGmjwo+t5AkYkqpEFysoy1nH5WLJrFl3RSzvvUvWO8SqxVgg3D3KjmZzAnA07qsHdZGAEwG87QUtl5LQY5k+28LZUgOgzxKCowB4zjZ7rFKX7bbDAEuNOLr6eTY7xBszALdKm+PTydfckgnP4AoxijSIKUcA8SAMqDH4VoxvLa2+vZw7w+7W5+w+Bx+J07uxrg5LKI0liIYRiVKrUxwZfncn61c+BPYZWhJIGBN3EFTepIEUu3IfFN9AMd43OcWldKWA+6KUiQnwCYmn2PvP3e+/rG2f1NUX4Swa6pkRhc1sywAoJPwCDTqZPqy+UBAAYTgaYjCSfZcRaW10q6dufi9tVf/O4bvQOeFfmBfMgBmIbkvO4PDbLuz5+x9MpPJvIDkTuwROK5X8efmxX7upWXeQnWAaeVx6OqPc4s9iRx2mUwmk8k8izQ+xKPm4nig//TJ0ybraJNaJ0shwK5xcjZywgEaTe6pcG6UG0kE9zpjsjtCqJ8fzCgJBtFTRZMQeqidjmr2m5uxaPRaICU2Vg/DS8PVl8Z7yxE9Y0WisTUpCU3oxBpICkk6TQnLk8GKxEy0B7qr9CatJiGiLEcbQ03AKFVAYRakWXHkVHISJ1BrT8Oj6jKHewSm00l2gmcdlbEnVUQA++KQOoPBem94+ezZtzC+Od74fLzzpU/u7Y7uE+Ox79H67C+F4cX11TfWX/oLLL0JnBEKIiAV7wZSYZTOQ61LOjgYJHP8qBNu35SglbEEHdhCdWOy+ZudW/9ebb7Xx82i2OlZlCpT+9v62KkGIVhTxGZqoE7ulvRBcrPgHmkFGCoNK6zuVZeXL3537fV/wfCb8AvCkCiSdi0RUDeLf7PkA2PQMplMJvNCkUeqWp7krjg8HjyTyWQymcwcR7xjdiMS5n7y5J95GjebA8nNVpfZrFPDdcqLt7XU2sYL0/K5geYSOgW+mtyUySOZdg7RlMRJnspUv7sRFhRjLJqY3BRhTaCP3lnrX/Kw5lU/chJohKOJ2g21CEkKMgFyRVrKaSeKNKSWNct1Egh0NXnrRRkBQl6wjJNtxBFsDAymB0kAUzD8C/RgpONLg91lLht6gjSy/coAA0NdvIl9FwxnwWXYOQxeGrz0rUF5X+VWOdqqJnsDL4veStE721u+gN4FcAU4CxRyY7CkaUmiqSnNLElEeFEO5GPwWId+pohX6jiab7yCEZB8YhxD2/Cb2vrl5s1/961f93EzcDtgLPemUpXQ1MhKFzlJY4DYaImpF0hWXyW7JACKEaIVQhFZlHFtj9eXLv7lmdf+BYNvAOfEPhHENKJBQOQ0jxWaXBUvzlWfyWQymcPJd4SWB+6K4wpmz/HFmUwmk8kchW6RmaPcNOeyssx924Z7P8nxyGZd08rdbTgjKSkC1jYMcKSo2fnyPjIJTdk0zlbqowDCU0Vvn2aHax2aZpYMm0WnTZSDDNDK0trV3dtnYrVUcCQfoVEPuntJUuve7OKu1k3Z/mTfRDaGiijLcgvVLnpJknDSOrk+X7inolZCfrSTct/Qnm6NEaX0pI1ndib0CQHJ5kjShtErog8s0c4QJXqX2Cv7y2W/Fo8JrgB9oA8ET4WYgrkc0+QJhrmw/RePuVeFxaSKc59PpjNyGoVIVLQJfAPVV771642bP9bu+z3d6Bc7BSu5m0Qz0Jtss9OmOsTO+EnzVTJX1qW7zMzhgtH6jqWyWtnyiysXv7f+2j9g+RvARfcerQeY5Dbt0bx7yTdJJ7C4c17ADiGTyWQymaNzXDfKrncy338zmUwmkzmIfWvKHcLinE/3PttVJ6VIhtYtNJdispURpz82usT6Lb72I3aXTNK9kmRIbsppZYs5EZOkBDMrHKoLcdNgAvrwIfoXQv9yOfqkpx2jgWoq5aT116VPyDpW2BstUk2NZkEumBH17p6m1XSqUSPcgnucoNzFUgVVTVuhJm/hC8UTyuljdYLAaWSuBMjdQwgg5ZAQQj/6hGYeYRaEvhFQlURx0CCmBKRgSHo3YMZUVIldabI29KaD+0xWlnss1CnOhY7odpBM+ejM6tIAamO2nHQoAuM6svvuL7a//lm5+atCNwfFqOCE8EDKlRRqAKnUVrpWk+ocIZcHUJITNNKbmjnuMJPTRbCIsTfh2RFfWb/2l2sv/yOW3obOCoVZT4AgYwEnaUKsL/k0nKKpYxzJp91sWH47ymQymUzmKDz+HbO7hHz/zWQymUzmEI4rauGpUjsfU3EIAEI0YxISJZdS6QigUXjQCh2caqxNKHfNVPqApwBKNYJmkibbH8YYSVZV7FTxrkO8AzBEb33l7PW72//LeU8I9Cg5AYiCJBR1jkF1dKi2rVIjlcz5V9vaRiTlTiLQ42SnGm8WGEElWMd7Ai96veeT0NHbZbp7kiO7inUTXU7SRDkUrC844ISBKY7Xk5kuWAAEifVpqqRB19KSJFqtX88GCr1o4/CHbOy+T/9z1/PjmRdS/a1IAirJEr6BeBM7H+zd+7l23h/wq55tBS+D1THbB72QNA5qkPQ4U+fL3VMCCY9gINiPWqpwdi++tHL5r9de/QGKd4TzUgEzCayl7bpAkzcFvOcU20wmk8m8mLxozwnHy3GFeGcymUwmk3mSdO/dT/gmfshjQ6dJoSvuJSGy86skYqoNEu+GY7aigbfpHAF0iq+0hsoQQmGguydXnSDCwD60FAaXWVyI8UahIFXG5LgDgZS70CwpVKm5020DatGyNuelxkGtepkkSCM9RtKByWTvfoExTEB0icmXlzkZmlD/yDrHILVg7qPLGKSYTijQasXZANIAl6zOYgmzFNndGIDrPKmtTD2z6uf1ifnwTUtXXdchexQx7lF7KJ9+UlWrk5ggbqH6Ervv3b/x47j5bk83etwKnFCCg4AFyKcnQx2r3w30dpmlUlkIIFxRTrKSTCILKDj6pc7s+CurF/967bV/RfEadFbqA0YUSO7otmgSZHWWigCAnLa82eTcD2QymcyLxfP6nPBkmBsYzmQymUwm80xwCqK8WwxwYlrcuA6tbDyS0594k7FtWt0bAEQHkfxNikquODNTFEFaW2sXrYWxlTINTdi8RCIAPUcBLtvyy2F4sYoDoN8YPqdNbuqF1//UKJVdvbJ5SJpJQ2k21VxIgtFYjXa/BnbhY3SMVO1PnjNUm9UeQDfy96EWntyRh/ww7eGmNlPdnvQr1PJ2Rz6TyekOd6QzRE6PMBaApfPK3esyO7NbNxfajOf6iXnxeKkhfdtVJ3HkHLqPh5NOTIgRuA2/qZ0PNr74kW+9V/iXQ9surAz0uhehvFOeG7NXYtvmuTwUaR0hBFcAC4XVUhc2xhdXLvzVmVf/AcXrwEVhidY36wGsfdgSOp1Ru6IjXhqZTCaTyWQymUwmk8lkToZa20mfF41WU2dbg5ktvt3Dpy6uVqTqqpNdzURSjLGYTYQHksYevIf+hf7Sy+XWWtSdYEVKEGmq3VkiGzUDtPl8kbXiCYGQJ4FymhHPDJIcEKIUA+NkdAdxG0FSBI2s6wc/l+kKu0doTrTquvAeTanZT/ZKR6zNKdC6bdMqYjqdWlct6gPUhnuHpCkrOmkgSES5YJDMitkwZGtb0WwSCM5Wl34UDgpZavfS44VCHwPdHdht0uI8B01ZPB8Oxh84hxAJJypoD3EbvIXdd7dv/7ja+dXAbxTcASZ0uZpsDGlQQSApV1vBRm0KUUDRg5kDEqrU8jqin0KoNKiqtR2/fu6Vv1679s8YvgGccRRkLyV9SKlrk3cb8xlX09/Q2YIHb2Mmk8lkMplMJpPJZDKZx2Oq17WQbJXKRrXwRvQQCQclMZWpgUtqIiMDgMCUH3K6BDNva4K3KQc7Oo+bsVsvvBNWySVwbWn1moc1977TNJUaASDGZKSqp7RSQ/pv+jZpkJ1tAxqL31QLgxfBq8kGJhvQuN4jTaTn82en6jrFFgWsuWPRys9H2Q/7znO4j7IrcqeJrY+y/fmMMZDdLKf7KINzq6v/93gHcXET5pyJ3V30FB2ac2d428j2c5sFtjs+kKbHGNsr85iak669EhjBN4Gb2Pz1vc//rdxM6uRmwUlomt3daXMnW3sCtMMd4jRjKUnBQhjQBuLaqDq/49dXr/yXtdf+EcM3gEuOJUO/tnZLQsot0ISQNztkrunZR5nJZDKZTCaTyWQymcxpIKmHSaybEYhmZrA2pySApE0qejtDes1v81GyKVHTtVW6+4yDslFMA9ADVovly73h5Rg/A/aAEeAOzjWGpAGKsraYLxBRK6XJBynWKlWq9A1YSkqZfHyGCnEb4/tYioAAB7pGqmMqcHw6aA9AezwOmifNoE7iwsPtgQctqmtcTAXjG59jmqHe1YsByKidsKhr3YQm7BewtMwmx2g7f6OXN9NZf3fw/ngwzZLn/87NcxpOj67uPHfd7tvCEMJBztD9WHQUdqfMjHgIDpXgRL7F+KW237t/49+rzV8t81bP9kxRcvjsnoxg41kWIdRVjlIWWQMJujVKtBExaY6MTtegwvmRvXXm5f+y+sp/Q3EdWJcC2asTkcpaobM909KHg2T6xzLcZjKZTCaTyWQymUwmk3kIFgM6fU6siILRauNRUorUOsYayciTTJRK3ThJd5CMEegoAGbmXnV8mgAaB2VCddkdgn1wCb0LYelKqdUymkA1SkprnHRH4w+DlGxWaZVpcZSYDHmNKjcVbpqfRWBC3yn37kJjoEIdDFqrs08xaPck0Ewk9VRgXlSgkzSZMkUeJMw9LEdZwqyBbl5dTGfajEkQUjNx3kGJF8sH1/oKW5/g1Gm4cJS7svsjHdn9I6AFF1LeyV3gPnVDO/9594t/qzZ/tYSverZlGjHFWi/kj2ib153etXymD5Uamy17xkHU2l68VBXfuPLGD1df+T7C68BFYInsE5Z8k2g8mCS7Ft3F1WUymUwmk8lkMplMJpM5DcyJFUZzeSsHASCnekIbOdrSVRuKopjTFtDkh2xVsqL9WSdWF0AAllCsD5avbRfnFe8Qu+CkURaBiDrEE4hCCObuAlL2SCThiqlgNOQwgYDXMcJCUi7ggBNVn+Vo5+seR0QJVEKQYAb5PtGmc1v7DMmXrcMuxshO1ZR9pZm50Olj2swHpzjsrmh2nQ7A0hI6fsDaUsv5E5dJaH6RaE3LmI34nu6rxkWIBcvqQ9Je80o5JAkH4HISUAnsQZso/1Dd+/nO1z/37XeXwp0i7piXANpUtSLUHCYRIF0yS9cw0KljE11mZH3+iAgyg4oqDvZ8vez/6YVXfhAu/zXsJWhZKogCgEAi1NktUZ/PbQfUbsxx6e+ZTCaTyWQymUwmk8lkHpL56ExJdfQsAEBq63R7EyjLWvOpzYsuCZYmq10kSSESRmOMEUZFT2pYKrYco9CRTer1tRoBSYlAEPvgSu/sK6F/pfJhVEEUzWx1Me5WUugU4pmRFBuxZrqtaQkxOslAk5yqelaOtm8j7gJjVwr0npFanw/xolWFeUBmya6VrFuJ+6ls/tF9bU/96Dz1BiTaHArdndY9gVUXsrfDtemHgWicqoIDIibkCH4H8dPJvV/e++J/VBvvLuGrPjaJpE5OMz+ys/JFHyVm3NdNllICMlioVJRY24uXvP+tl9761/6lv4G9DKyDS0QPYBqEYBs33lnaXPx79k5mMplMJpPJZDKZTCZzOphmI5TkPhUQk7bYtVu5V23xnK4lq/v6n0SSNj44qZPs5D9Eox/WDsomlaClNIUCiT6wjOJSb/latfuBcxB9YsZUklnWamcpVWYSOywV904NcxfgKUxYlqpGE6CEorCqikajAV4Ke+XoHqpNhBTl7UYCbYXhpo1KUeZ1baBnUdfoBnd3pzSfBdS1sB/PYXcMLPjannJ7Hp8DlO5plfPHJF1vi8wJc/t+dSiL0dzW/cpAeaQJiMBY5W36Z5M7P9m89ROOfjvgnQK78omlVLWpqawLUaXktSStljoJwDHvcGyDuw2FyNJD6YOxn7czf3Hp+j/y3J+Bl+HLsCAUIOUpEUQSZ0XA4clW23i0D9stmUwmk8lkMplMJpPJZJ44rf5gjWtyGojtXpEGiYDqGUKy2JGQO4BAQi41r/myFLgpxUDGxtqVvmzlS1JVVdmczEcGwAiTB2CI4sLy2qterFc+hPXamUMIIQRpGuxLspXUko8yua7MOCdAtCJdq7EGjGPc8t07wK5xprbvggq5mDQzk3kwB5UkOgme4GlpAFxJnSyJHfht+mej2//z/pc/wu4HQ97ph90QKpM4mwHTmg+Ll+e+Vkcng/XAnnNY6cxufDmsfOfim/8nz/05dFk4A1sCeoSxtnu3XuB6Ud3hkUwmk8lkMplMJpPJZDJPnbnw2U5+yeRa269+Ric+uPuhm/KOnfoc6ERtJjFw8bdoc1B2rYpSMvE50APP9Feuhf6VSflFwd3C90BKHmNEE7ttoCSv7Y1IBZ9T6V53d9aGKamp/aJUFThlq4ShclSm0d7OrZX1PXBMrHhyEYIgXd7sgNRAa6tRP3dixxF9fP6gOY/NFfjccPCpcnr3Um1rnq3QPf02jWZARrhPjLuobqP8VBv/Mbnz01B+1OedoBFR0ZONWQZE1E7m1OXM7ZbWWYnZoO8IwCmjszeeDEq7unTxb9df+T6WvwVcdPaJHhAAuqexh7QMa09FJre1vFvI+8F7IGuamUwmk8lkMplMJpPJnBROppjr0FTiTm/i6TXcQbpXZqnEjXlKPZnkvGmmO0ogTYK7UmFeAtGTupje60NbhznJAt1Yb4nS/hofpeSH7AFrGF7pr1yLth5jD+xpmoCSKWy7zjuZMmS2Lk6pqbCBxUyUAKKimn+G0jQabd+AtoESKZteMmEt1PzFiy5Y7F++OXM4c9kVj50nb+YlJVREBCZme/DbiB9v3/7/7nzxbz767VK417O9YBExSvMpYlNjWxNlu8xuAs3WBUkaZM6i8uG4Whv59aULf7X++r9g9Tuwy8IqMCSCgNbF3cmgOtPDpD5o3wSsB2zjvP86k8lkMplMJpPJZDKZzDGSXI37ViIRxMYISRJTVUHsFH8mmXSAlPsuSYJtHjySMUY1pF+l8tGtetDJQdkhWSwBAAUwgJ1dPvvm7v0PYnUnaqswc1WEJbGDpCXdNDVcIFE5zACToEDKnU6SStKENcYoAyNBOaqeldXoDnwTnIgV2ZckeFtgA7COz/P0ut5OB3n/zHPSpZbmkjYezzIPmC5EItXGqqSS2EG8hfKT3a/+x86tn9nk06LYDBwDFdwt5YBkbbdMS3DChOR0TH2Np+yTVMoySyKm69slGoxRg3FcKYvrwyt/t/bq99F/CzoLDMl+3VjVqRva7sY9tgpjk70iS46ZTCaTyWQymUwmk8mcCpJSIqm1CXYyttWJ8gRiWgS7dUQKcMioRkZMBXCSc4lGyt2lmIqAJw10sTxON9D7ECXLgCAV4EpYfaW3fD1qudIAKtDIDakSTquupinpbzuxG3CeNE33JgxcoCVBpDJOyr072LsD7Qkl4YvRnUc3XmUyT5fjPlenttmkTgoOlMTYdB/xBkYfjm//ZO/rn4fq44Hd79keMSGUOppWl+xc+UBArEXDaZHx7pVbd1LWE3oVViY6P+ara5f/67m3fojhN4XzzhVgABCy5JRsvNmpG6oX7vuZoB+KfOFnMplMJpPJZDKZTCZz7CwaiBa0OJs6K70ubjF1HnVK09R/kZJR1vkru97MrjiQ5M52epIO9nFQamrdSr7FAYoLg7VXd7Z+4/Fu1CTQSA9ETAHkTglIdb0dFqDOBkalZSYRhCQDPYmzMsYYQaNiQMlq03du2coeUAIVaJA1rivbN63iQ+WzO90clDXycHEn55o8KnNX3WMbKh+w51sX4eMtH5hmogTggljX7HZoAt1HvInRh1tf/niy8WuWnw5tM2BMlVbnXSCYynwrXUjJI0mHCxYQ5aR5Y6iGIPfQKyq5JMGEYuKDvbhWhetnX/nnlav/FcVr0FlhQPRAmxbnQhpO8YNGRZLM+Ai7PVsuM5lMJpPJZDKZTCaTOTGMFCDBksyH9l1ezmSiBGBTh1NUa1IEOvW41SSghEBLEdzTWtlJo5yVC1KOx1SH5gCauQMwRLiwcvb10L/iWHX1um6m9DGtLOXCnIZ+T0vzIITQCWgHU2a66M1s0Via7+xu3oBvEyOhmtbEabYBs16qkw7azTxPzFnwnsCZ89imP1/8LwGgopXALnAP5WfY/c32zR+VG78s4qdLdn8QRgVLuuBO4aCLJXmnJYj1IEbbOzBYJQkE+yGsVOHMSBfG9sb5V36w8srfo/cmsO5aog2Jrjo5v642tUTrqUSWGjOZTCaTyWQymUwmkzk1NFJA/c4uTEMwWyGODVJsdUhjbYFMpEraaByUqZxMk5VyKu51Iy9bc2XrxyySWgmEtn1sWgBITrIHrmD40tKZNzb3Pu3xHi3A3euwc4gSRAZAcjeDarFSrevTPVX9Zls5RxID4YqxBElN+piMt++s+haxB5UgRHeQjcyBacMAgEqa7LNe53fRi/dovsjspjyMo50hR/WxNnpfd/4k87EdGXj0ts7CZu2CQ5GM8l3iHsovtPn+7t2flBv/aZMvB7YdMGaMgAhYM4oBwDuh3NZJyOAupiSTBIwOQXCiqjwUQ1hv7Cvjcm0SXr9w/V8HV/4K4apjlRrQCnibZiLAk+u6rYrTriLtqCDJLCCTyWQymUwmk8lkMpnMYTxRbadrDUSKwgRSod0m6WQ9w6IHS06CFKJiq4HIHWQtGDZlKlKh8FQmB0BSC1tbpLuTLulwB6WRBhbAMorzwzOvIlwsfanyQmDKPtkqnbX80SwvCaOt3zHltkszu2sawQ4EGhGDeWHleOdr7N4GtsEKKNu9g45ke8gOzWSeDAedcid3KgpOOFkBO8RdVJ9h+72t2z/avfsfA30xDJsFR8YoeXtxzVEvJ6VckLxprRmVUlUaZQQDe8NK/d1yZbc6Pw5vX3rtn5au/h3Ca66zxArYS31l6iLSZuMAO3O6ZqddVcdleUI7KpPJZDKZTCaTyWQymcwj0/ocmwlteHRnomB1FkrvipjtnOzUqAC8W++7DbLsWilDCAW6qkon3V0tOxKAAX1i1ZZfGZx5Pd7/vPLNECIVk0MqVdeW3EiZuTsF43wJDjOl2PVUTkN0AHRKETCqIib0nb2tG0tn3wHGoCcTZ2pQrb+qjVEHOvrus8JcpG0SkhfmOkg1PvqcmUfjqPszHcduCtTukX38BJfdE0MQIHlFi/BdxK/hn1Yb7+589aO489uhvg7a61l0OSQa5AAggztC6hfafBCoS221sr8IyUUKIOigWEQMRnF5VJ3vrf3xy6//heRxMAAAIABJREFU0M59B7gMrAqBKAjTdLihdjHTjrS9U/tzHlTIZDKZTCaTyWQymczzRjf+8tEUmyev85hUBz233qOOrDGtZlOLCkLSJpXKywSDVCsNhLvMzL1qFYMkm8QY2xRwTXB3vZCpbHh4M+UEjCiAZQxeGqy9WtrZEgNXj7SOfbJuR1WltJJMmSglmSVxVFJKfTlfLsMsGazqzHo7m1/At4AJEAEXYtpThrpC+EkcjUfg0Sxgc+0/gc153IrJmUNorYjpHO6WneoeysdUJ2eX4AQJN4vQFnAb1Sfl3f9/66sfa/c/B7rZt92CE48TSk6J0+hyM7R5YNtldv+rlATXSBI0Bx1F5MqoOrsXrxSr/8eVN//Vzn0XuOZai+oRA8IAgywtOWWU6O6fQ3ZaJpPJZDKZTCaTyWQymVNFV9OYUQxmIyCnMc0khJS/sYngnlaeAOBedbWIND0pFemvuycxQVIIoZ2tmNEoZ3QVA1IpXgjBOISdW157Y3fpaty55TaRjz16it1OeSdBGE0pkR1rO2azJc0ayNp8BcJBdwS6uxCDxX6YlHu3MLmLpXHUmDTjsA1KRWvx3Md1+BR4bKPc43BIVoKcjPKhWJR0bd+v5oRIziZzPZGWqTKaVBKlfJu4jcnvx3d+Prn/M+x8FHS3F8aoxk0ctYqQyklNmx3TZ9apWsEmxLudUq8IDgpF6b1xuVSGV9cu//n69X/C0lvQOccQ7Af0BUgE6rSSQD1o0C5nYVcksTWfiplMJpPJZDKZTCaTyZxGZoK5k8eI6gQrOyDKkKaTKegzzZhCpN1jG9OdRELV5TCcCExVL1jX7cA0ABwk2+o69qBSHgYYEQACfeAMBlcGa69FnK2qvlAkV2dXlGgizNHdvNZlKSF2fKHpr7sAp2SoCk6q3dvYvQnsShUBl7OWP08XD6tMdWsle8ODnGXZDvlk2Hc/TycexQOYhguOcEwfolVGAhOiBLeomxj/rrzzs92vfxq3/tfQbg/CKKg0azNBIMZ6RCFB1v9a6sywrapIeZ0cNoCD0ldG5fk9vbJ28W/W3/whlv8IfMmxYlwy9AV4TFs6HVc55BJY3Gnd5Jh4VA9yJpPJZDKZTCaTyWQymZNAislQKMwa8mZzFeKAKNJWcJSS8JCKUhQA0vRuLsvW8pVIDsoHOgFTlHYgV1BcGq6+vtN/2cd3o7ZNk2lVnJQu0sUUet6s2F2ATFalAj8Cm2D11Bw0ZX1iHJtNirgz2brVP7dbWAU4UsZJ1ukwu7ujzmIpO7TxJ0vKQtj9e9Cc3fpHHWmZBxseD8pcsKimzU3JhrWHZW6PLe75dCEFNJfrvhdkGhY4piY5IPfSrES8D93G+Le7X/9s785Pe/GzwPsB49DWw2lTtbKjCSplnkxNTelcTQ6ZQ62P0uQSzNGrNJzE85Pw+oWX/9vq9e8jXAPOSn3CBCNImFnqPtJOCGjO/27Y+2xE+Uzl7kXH+DHtq0wmk8lkMplMJpPJZDKPSDdCVIogDYQTqAvkpIDupOU1Wl9KHAc1ap3E2v8EBaaEeHVRDQAh9Np1uTfFZtwbbSGldnxQK0lCJAupgJ3prbzaW7peatW9T+t3NqbWMFAnv+tW6waAgkmhq72EXZ3CFUlZcOM4cHfz/h+AbWkvpazUAf5JtlLM07NidWXHB9lRpzzQffY4LTqBZb7odN2yzSWpVvI/1tPPm7+CSrMR/B5wEzvvb3z5b3t3flZMPh3gbg8j80oxBhooC/ufS8nU2V6DkjT1WqeuhrS+cziqVnbKC7H/zktv/nD1+vdRvAFekpbJHtgD6uS17WJbibbNcXuSp3Qmk8lkMplMJpPJZDKZE6HRNCwJSq3okVyTMca5aMikM3R1koX0d+Y+nW1uXa160OoJbZLKYna+tNb54GVXKohTAAP0r6ysv7O580FVfh1QAhO4CtYyotNrT5dSpR8gOa9iCnAGiQBCiHAz0BHlSTmlBE16Nt7bu4Od21x7BSgFuSvYrBULBCFZ0iifuizyeA04es3uRbruS1+Y/mjLfNE4yj6xuc+NMP2wywHaPKoz02avWzl8gjBGvA99ifvvbn71k8nWe33cHHA7cAJEsC4jnlarxhIpwUAAdYIIiKwVSXlttDSwgghGh7OIWtmL533pj156/Z+Ki38FvAQtCwUZBJNA1CW6mxZa6pRIOtIoigBf7DcymUwm05DTQ2cymczTIvfAmUzmSfJs9TZJ2Zgr1Qsi+R5bOcBTleykWsrrUhNqrEyCpbyVIBFT4QpKJspBq2M9Uzkd1mZMEq5Ac3gqblGHeHfcT/uEagJI8cs0I4awi4O1V4vhtfHkC/PdQSjI6J5ERriQpJuurczdLcmU7hIiaktXWkMAm4Lk3jNJE1Ube5ufLa29DUwAN0sVOTryhwB1ZN1M5hmnObcdEDhBGCF+jfIz7P32/s1/Kzff7+PmUtghJ3TBZs569zq5A1i7JknKBavzUaqpZpN+FpGSLvTB4agaTHC5f/bbF179R579DnAVOOOisZcGF8jpytKSm6t72kWcdLGgTCaTyWQymUwmk8lkMiePSXE2SrJO3ti+9bfhpKkA91RwlCSZGUDJMdUQplGYbYJEkjHGtoQ3koPSvWJdUmeaQW8/E2aQR1oPOMPhtZX1t+/tfirfjhoVdASTHERBkIxyAFEwQ0jtkHmsbWOtnOGunlkbhUq5VJmVfY1HG58uvXQPYURUQECzU2ZrCz10pZrnBT9Ylc/eydNFVz5n52/97YxxMgISxuQuqtvY+/1k4z82vvqfofz9SrgTuCsf0QVQsweTBE0koqstq518jenCstQ5ECQribKI4D6otDaxq8XZ71587QdYfhu4BK0IRgt1zW80mVWdcqnpVkgm4ZKz59WDstlmMpnMC0u+C2cymczJcXhOfzt0nkwmk3lxSTU2UL/LpylKudwANCpcXRy7Se5WV1JhMIcMKVI7uosMZC1NJmr90UVa8kq1ikhbxKUta+HuBeioy37v29ypSuouVzAOYecH594p7v52sv1VYdsON5R1KfE6Un1aPnimYHdyTRoFUCBZlpHFdPlgNMSCo72tL7D7JVZfc6wDgbC67HCWP4AD7qyWq34/c7CukpSMkw6MiS3oa5Qfb936yfjeLzD6aFhs9myXqNIPUKc1aJcANCkmu0lQu1duCuxuxjJ6jl6lpVG1VtnVs1f+euX6P6L3JnAOWHYFY5GitSFz1aXn6/Jb9YiAJZ+mmXVHUbI6mclkMplMJpPJZDKZzLPCXI2N9Hbf1pnomAt9GsHcmKI8aX3NosxMsXVI1cHZJKPH0OSaTObKdtVGSopxKpIWxrk0lPPFsltC6EkRELiKwfXhmW/s7H1c+n2zKFUQyOYHSZ2MIBvNzJJHElJdNKcWK0OjnkKkiS4vizAO8U55/5Pe6p8boyBCjbJr6IieZvbijYYdsqWHfPXAvXSIKzPz6Oyr2LX5XgFA0T3SSrKC30P1BfY+3P36Z6O77xXl571iw7RXwN1dFFOGyZQQgZ4GL9CWuFdHuDQ4xHrEA0ZEgCjEUGplpPWq98bay99feflv0HsFWAeGrkALgBFKqWIBq3unpE0qpMwMrc27zUrpLrOsTmYymUyXF+355GmR93Mmkzk8p3/uJTKZzOnhuBzfx9izeR0fyWlEdbJApemt/sZU2rt2R5nJW2VASpUqRNK7JYW9sqm+aRIVvVUdU+x1GwNa56AEkGK/F9XTuYaThALQR7i4fO7t0eZ7k93bQZO+Balq5/YIs0Y6UfKC1p5K97rYdyrTk/LjuTuDWYCLRDSMe761c+/T9ZfvoLhMDID+fDOm7rNM5lmhPl1r2yMiJbCyUAK70Cb8y/L+e5u3fqbt3wx5uyg2A/aCPEYnFIzRa1kzGbDVcVOazSR+FRGMnjzUIbiMZhGDSVwe+wUuf+vq9e/j/PdgrwBngIFgRgPg8jRokQZL1Ol0umMpnWuwHSrIJspMJpPJZDKZTCaTyWSOiyc0xDJXYQKNYthNqzj1VCpZDmfml+occ2pq2zQ/mrM3JV1RrSrYaqBFURRp+WGmSvZM+9CRLJvKGANoxZavL69/c2N0w31bvgMBlgK3671XR4RCaNSTpE4C03BUOj15O+vKG04jWRZhZ2/vS+x+gTPXoFVxiTSAyXipuhmtOtlkseTCZjznHKOyngcVT5Y2p4O7m0EeaSmsewRtQXcw/rS8/5v7X/1Ue78f6Othb0SN4JUAQjA4FIxo/JKKsPRF+tLrqlitqdIjnCAtOmhF5aHE6gRXw9k/vnD9n3HmT8AL0Foq2E3U163RZvJmzl5TnW7BOtvFhW8zmUwmk2+sT4a8nzOZTKLrXLGFKYvfZjKZzJPncMf34Z+72s4x9mPtopKfEW0SSTKJGDNtSBnkSMopgXQJjlTlmwAC55XHJFPWE5kiPTth49EtaZ7uRdcs2Y05n5uCWn0IUiR74ArC+eWz7+xu/N53vhZ3AgWUZoyxVmIEuQuWlNdp+Q5r4s9DsFSNXJbaSkg0FOZUOYobO/c/Xll7GzwPVK4iZbZEx7eVBZHMM0GK6ZYEuhldESgJASNgE/ErjD/d+OKn463fFOUn/XCvr13zCSCYDExF7AHI6ywPJFvLpJl5dLFOnpAgGdOVwp7MKiyNfXXCl4brf37utR9g+Y+BK8KA7BMBjTp5+CZg4dKb+5AvyUwmk8lkMpnMUyJn5M9kMplHpPu+P/dS30kfieZbthNTzGXtaFQt9zUGxxnaYjjt6lpBo11+AXgTgr2fdXMfHyVBI4bAGpavL69/Y2/8h7LcNKvkJQGjxbTMlCtPBGgC66x5pKdwdsTo9Lo+UNpIGqroRATLgL3djd+vvPwVelekNWMPoCsaLVUR8lQxxGVmKTb+2A/Sc0EeIXxqJLMkmopXyQotj2RFRPgutIF4o9r49d6dX07uv9fXV8OwE7BnmFByeQgUUx6EdAHDjJjmrzTA09UEgKaoZIDkJLqFwlW4Quk9t4tV/+0zl763cuVvMHgNOicOoB5Yq5Ppck9L5X7qf/e/c5bJ1JNhoSPLZDKZTCaTyWSeIAeVEkXORJnJZE4HB+WaPMrnE6wp0lZ86Y70tHrlnBtJQCpTISnFXBqo2qTYFNqtsVaLjPKUCVLRLRiAZKJMekKqxFs0SeUCOnW+0dEapFo/bP2PAOROW0JxaXn9nb3770/KO0GjnpWuKnQqC6fNcfcASnLBTKjFUCVV1N2dU1ulWQAcKoswHu98hq1PcP4t4wQoAXabR4AwMHZizzOZU0SniFOdMpWAWBElbAe6j/hFtfGbzRs/rnZ+O8StYdiBjwtGdzcqFYdyTS8oM7pLhBmagQrGJh9lFEiKKfVkXzZw9SY+3Itne0vfuvLKP2D9OwjXxPPywtgXD/RO5qspk8lkMplMJpPJZDKZU8/xm8cPKqCdhDzVouLUJtlmq2xFxW6oZYxOMrAWJYNZdJ9bQvpv0U4luW+li+Y39TzuVV0aXAPoDIYvL539xuboRhU3CoyA6PQ616RBANxJVC4zWrJqAgBiRGMuY+svIxljBQbBAid9bO3e/Wh5/S9gF6ABUDSVhZlMY8l2+QJ7Jx9WI88jh0+OmRGGdO3IpSqYAzuY3ED52WTzV9u3f1Ft/3a5uNfDDlUS0V0AHJbyO9TpElCrkwBSvey08FgPR9TqJGmuwKLwyBj7ZTWM4drg/HfPX/tbrH4L4bJ8CPTMekABCDAhdR+dlgM4oP54JpPJZB6JfP/NZDKZJ4bv5zbKPXAmkzkNHCXX5MP2XcfVv02fV8lkhGSrIc4keUvWqBQyreSSqovEmM2Eb6efG5Ou0cgjRF2wJv23U5anFijbguItc41of5NK7RgJFtISi0vL597e3fqk3Py6wG5hFVSHtXZVw1AbOBUCEesiOWak1xU92go+aWuFyjDqa3vn3qfLoy+wdBlcBYby6Y6YDUg/piOSyRwHyZ9MslXhhUi6sYTfh+6g+nj361/s3v1FmHy6WtzpcReaBJOqZgnNMEjtRBY9ggYJKaMrJEednVI0I12MbmAQlyoVe3E18uVzV/5q+doP0H8DvCgsCWYsgAIAlPzM8y1Htk9mMplMJpPJZJ5JchrKTCaTOQaSTxEdVbCZzvYrNMWx3b3J/TaXKNLNTO40qyo3s24myq7vMkmZBRna+sLNCubTySWRJbm3kpgoiSpoy9Aall5fPvONvdHnVblVMLqqWi8USMhAEu5J95BUy7tqtxkG0GVCHQRLmUOoChuhujO689Hw2nVwHViGDQRPem3aI42m66c+KHXRPfHk/RR55PBkmcssm0K8JQnRKNeY2IB/ia0P9u79bOfOL4vy82HY6rGUygB65akM1DTLJJpo7lSg2yECSmVzIJcFOCBBYBXJ0JOKydhGcR1Lb5+/9g9Ll/4CvVeAdagP9AgDgtxpRZMpYZokAk0xnrTmI271Kb/wMplM5hSQ77+ZTCZz0mRpMpPJPK90+7eTeKqczz4JTDU3AK2bsNEPU92KFCcKY3c5U9Olu5P1b+VuVgdDd0vsdj9MHZTddnQKgU+L86YpbbZHSSIMBbQEu7S8/s3x1odleSf4qMCIiGQrr6IulLMgY7iLTXGetIoIyZUSXhrdNSq4vXHr/eGFd7B82bFqCEDfEZksYJ0G5wrCmadINykDOuMG7g5GY4R2TZuovvTNd7dv/3yy9auB3+jbZsAEsSporkjOGI9TZslm+Wi/ZRLpU6luiTQXaT3r9SexP6mGbpdt7e3Lr/09178HuwqtgkOJtABCIq2AE2nAAOrW0up0EE9q32UymUwmk8lkMo9FViczmUzm2OgqA9ivRsVUAAEgmVmMMc0VY2zTUCZRca6u94xa0vgo0w+LfbXYbvQ0gKaETkymsNr2SHPJbBnVKpaur57/9v3RrVhtBOxKbo24aaqr4qRWAWi1y+QFJRk7caZmJkJRQhWMPd+txjf8/u9s6R3jBBhCbpzmypwLiT8FHOSUXPz8KGQd9rTRVfc6tZ7SZeKgGyN8C34Xo4+qjV/v3Pk5Rh/141cD2zFMzCsARDTRAZq8MVC2VXHA2uMsGgFB1ngsSRNI6zv7kypM/MxYV1cv/OX69e9j6S3wPLTiKkijWZNOImmUSf50MpCIqkhaLsadyWQyx0bOO/lkyPs5k8m0b1i2MAW5f8hkMs8yBz3nnMTzz3RpjRKoVnhrorAjSchSjQ3URWGSBlIkwdEsJANlinVultzKDEamahueNBOzkJaAlIpusSrOXDO7JXTcY/MheboCijPAXu/sO73NTyf3vjRt9+nSuF2UpDprXr00mNVKKpJrUmIw+LQZllJrquqHKvr9+1+9f/7Cn2NwEeqDfSHFtxsQsBDl/tyTNcqnyFzpG3QytNapD+ocChUAs0jtAVuY3PCd3+3d++Vk89c2/qiHu4XtkmOmCxiq60qlwHBCsWtprH2UyexYT09NCMHdaYOo/iQu75RrNnzz0kt/M7j0PQy/AV6SCqJndVJY1mkXFkYgANhCFtpnlznJ+Ok2JpPJZDKZTCbzRMhPfZlM5tTRrRiDpHSdRvzwLrTjDgQApYjvVLxXIC2JlU3Z7fonnd8agBhjCCGV+ZY7TK3FEk2KvOSgTCLFgQ1KC2q0jCA13i65K0DBuIre9bXzf3p/9w/VeLuwiiopl+QpwWWdNbKu8uNe+yhTjRwzQE5RqXGpCA6iu1O7fettj2+W9z7qvXQVXAGWiEEymUkRdZGcqeyStJ6OHlorSikq1k48Y97ibjzmUzCrkyfFbPnqfZ257ORoTJdxK00m+V+CJJqgCtgF72L0h7jx3mT7/b07v7Lqy8K2+2GCOAFFgSZPCSUFkp6kSUKChSApFbzy1Jh0tpvDmeyPrl6MReVLY16xM9956dW/5/ofwy5Dq46C7AEmiAhCV9euWz5NbVtP3yf3xDPHovx6EO1AzYs2yJHJZJ4Ip/MB9Pkj7+dMJvOw719P0pGUyWReaFLVh1Rw+iF/evQe6Vj6Lk8iZFcNaHVJAFKcKo+1ENkU055mnCTJqCqEYLKUg3Iu3aQBUgyBAF2epLw2Z2URPRIhBXEfRFEUae5uwR2JSP4k9qEl2OVw5p3l9W9t3/66jLvBSsfYVDu9urJoE6Wu1FYA7jJLuTTrQ5fmMRoUzcYh3rt781dXzr2BwTngDBCBglR7DLpWqTlJeqpWPBfFPLKM8mQ4yKZaZ0+AJIU6NWwtjtduZ0SgIibAFia3fO93k60P9u7+R7n12x5v9cNODxNKgCChycOQLupuagaG+oqD5O6wdH0IRBRBwnpSL2qwF1cmeGn9yl+uXPs+lr4BXpZWhYIITDHdjdE4bUKT4FaHX/UPHEV5KhyvfTjrkpnM88Siw/3wC/yU5YfJZDKZTCaTybxAdJ9FH/U99zGtRd6sNxmY1BHrWgugzcqUan2U3YlI2RolACEZrZCMXLGdv/ZXuhOMHkOo5Qgza9NQFsai1RwPp81zmf6bVuNygMYBfBnFlaXzf7K7faPc2Qy+V1h0lXCYJVdjajpgcHcDrCk0DoMDLm9XUTdJETTFvR63y/En8e5/hpdfB9aBICct1DVI2Fgk5/UUb2p8J6NlUF1q5Bkmv1CdIAu17PfDARpMTboDUjFWJM3gsQQr4xjxPvwGRh+Nvv7pzt33iskXy7ZR2IgoTa7oDCYoJZK0lKQ1wL3pEZJ+aC5EEhbgTeLWCLgMDIohYmkU16vea2cv/93K1b9B/1X4Wdgq1E9DB0r5Kmvv5OHuyH21yFOnUeYz/8Xg8DHA7G7I7M/hyWoOn3+Ww3NJZ8dNJpN58iw+v+U+J5PJZE4D3efAg/rq/XvspjpLUnjQpDE8ZPlzS35gst0Hy5dJnZSoWo5zdB6SVVewZkcZiKlgttw1zSnJabVuJTtV4+r63+y967Nkx20n+AOy6t7b3Wyym2TzKVpjWfLYO56RLGmteWxsbOyn/Y8nYjdiPsyGdzfCs2Nb8lqmHrYepCiSTbLZj/usA+wHJJDIPKfqVjcpiZQKH7rrnpMnE4lEAkgkEmlHt6Hwm34FykRMLCLMFgq5sbZUsa93Ev2lNPGbaCW6ES1EN4nu4ObXX3j5/oPzX11dPYLKGsIF5jQlT6sJUWbWSexPEbGe2u8cpElEKhMgBWdH8tEn73//5XvfQbkDFGIWBVNJnt2FwRje/h54N4YuxJUsvyt8fl8h4pOH52nfQInqye5SSCHAhssV5CGmTzC9d/HR3148+MHlwx+Wza+O+fFRuVJMbPkRiBTCTJZrUtlOhgOxWdEijiEAEZh4sklLRals9Hgz3brEXTr52utf/Z/x4vdAr0NvK98krMm2JvxkN6pfu26DHLjlAAc4wAEOcIADHOB3CIeE8gc4wAEOcIDPDz7LAl8UatGQ83fJ+xGuJwKgkxCzuaMAOwwq7TComsNVlUAgVVURT0+p+cc0TakJUZXV/t6KcE36JTlSXR7qeR3lJsrrq+f/7MbdXzz56DFNV+uiohf1dg6oJcNTVRLYmW4g3wGigYsHjgoxM0hxcVQen56/N338T+WVe8AN4MScLQQFlVqFuXVI1XFy9c+52mcYtC8mRHd+z/r124fspPeErIRZTgBz88FTFliuSYWKToqrgnPQE2zelSc/unr4w9OP/15O/+UIn6zLWaENZENQKIiViKTuLZiLs156Q0RgsbBHIposLwFV9ERpUhDWE46u5IULeuvGS9+888Z/wHN/Cr4HuSVYW9LJ+fVbABQesd1gx27MAQ7wO4TdHHjgzwN8vjC/+3UOB548wGeHQ6TtARo8vd1+4JzPF7bR80DnAxzgAE8LPPu9v8bfFi+5D+xjwe7VCiFd4QKgczTFG7YfIgqAmBR+tNdu9w7vJFHNK0lQuwebCUpKIPP+TZY0D56h0m64YSUwU9zivRcNsja1UEfPZ0ekRXDMcgfHf3Tr5X93fvr+5eNHZbpakTBdQYUIxGQOTr+aIiIlW88jfDIy5alOhE2hs4JP7r/z/776wr/C8QvADcKJYgKVCI+M/ICRbjIfif/9yDeXj3hvjx49wGeGzJTtmQIRQWwev4logl4WOoU+wPm7m0dvn3/yd2cf/2C1ee+kPFzhYsUbkYmYTQ6QQFntGhxzrHtodORuaDkd7CFxUSXhleLofHPjCnfXt77xyr3vlRe/ifUfg16E3ACvCavwTkqaBfDNiwMc4AAH+D2GZ8tBmUyRL1xSiwMc4AB/CHBI33SAAxzgAAfI8DTxZ5+b7To4mvxEaXubE1PG5RnZyTY432pJqjf9wm+1If8mKnHnoABYqZLd+b0PxtGkQBkVIREhZZAS1lAF7uDmN26/fP+T0/evNudlbbFhlwIBNNyo1VEKEHijwuG1ZFUl86rWkFEFkUyb8xU/ujj96eb+36/eeENxC7QCVgRSTNR81URLHmJKFxZ/qeFgvny+0F/cnYCwtI0AAEQqKgBUNkQT0wb0UC9+RZt3pof/ePbJDzYPf3iCjws/Wtfr7EEKiKIoAJnM9ZmqJ7vpvp7LtihgQlEVEIsqgZSOBCenm6MrenN9+1svfvV/wnN/ZoGT0BPwGroCEZTstm5GQZrz5PktvuxwCBY+wCEK6QDb4FlzUFp+7m1JfPa/6fXaNEAH+AOHA1cc4ABPC7slMLa83b/mZ6vhYIcc4AC/3zDPKfm08/2Z85jXwm6j7rZI97FX52+3RmjGAe248caeh0shjmbDQqyoXkOtyehWnZhZleLSm1xJKWsRISZF9Qrac7skp9CKqEVQjs7ORYzjByeXTj3xrcK0ElXWm+BXj+7+m+ce/+L0wyeXIkdlwzpBBQpPsVkDFwSwc+LhkbX+MhMR2zl2AArhwiucn5RPP/7191+595d0dBd6DDoSnYhYVCF2DH4r5uLn3r/UcHDQ/HbAoif7Q/T1pDWgwERQ4ivgFPIpLt/gQJVWAAAgAElEQVTTJz85ffAP55/+YLV590g/XJfTAiGdzOtumwQacTpgsZjiyvktatKahpIWMB9NAmEiHF/J8RXd1fXrL9z7y1tv/i8oXwXdU9wULaWsVYiIbLos5s3UmvhSv+ysc2D+AxzgAAc4wAEO8GWHbM/nddDvFqsDHOAABzjAdifgM9e249T2NlfmbxvCE5h/RBylPYz4R3NWWmRVvoA7KzIPQFQFmBjukbM6rUwUjucisor2cN3if5qmcPBZOa2o1zoUIF6p3qDpDtZfufXKt09P718+OWe6XPME3RDbqVa1W4DqmW6qaSir/1VRCulkVyQXO0XOhUQm4quj8uTq8tenv/77m3/0EnCsOCI6MRcQlxIdGcBI6ch/uXe9DrbL5wsDNVPcMtCoLXXOkqgKIIQNsMHmIfRjTO/gyU9OP/yby0dvr69+fcRPVuWKdENQkEsZJSKC1BhJACRks9piiWWCRXNaAgQQQVmEBDTJ6kpvXMhLq1t/+tJb/2u5+xcobwAvQI6AdSlFatg0mPIdYXaenLUGg6rvbXxRhOABDvDbgi+3zD/Abwt25yPbvWu9u4YDHOAABxhhsOf3MO//MGO0f3OZIj9LDb9p+h/slgMc4PcM9pzOnyXj+f6xlsvfEo3RiuT36w7ewhp6ZdfiQEUmRiHCpEJMBI67auoBcNS8dqhp6GoNIqKqDBIREJsLhJlX++zXmYOvlKKq0zStVquMojkciYjqdT0nKICe49bX7rz6lx/94qOLzSnR1QqXanFn7vpRO+MNiDR/EMHuK6d8uQ8BhaG4Upyt6OFH7/3tzZe+ilsvEG4BBXTcu5OAmft2dwcPcIDt4cOCbqIC2AAX0AeYPtDzn51+/IPzhz+gs5+e0Eer8qTgQkUIpBA7Jp4TKwwTnogmlYZAYaq5LY/Aa2B1tSlXensqr65vf+Plt/4T7nwHeAV6ArqhVAhF8zU4IuQSpO/HwRF5gAMc4AAHOMABDnCAA/x+wP7pRw5wgAMcYC8Il6L9GSe781sDc68RUSFWyzGn7dSylczBklGzeRThN9mISHVXMkdY5WrwyAxulHnaS/NOOuoMELPUrJREKgRWohPV56Cvru/+2+dO33v8/uNJrkqZWE9Bk5/rVmJA7CrulmUTCj/oDYtcE1FmhqpiQ3q+ok+PNu8++tXf3v76H0Nvgxhg0BEglsASmAAQldSta87bH+APEDzDwuQTrAZJGreoTjajbNPAzneLblQvCl/g8iPgfTx5++EH/+3ywfeP6cN1eVTklLABQAqwcCRstYuuSMBk98uLiNbbrqpjXy1HKvEEVV5Pwirrjawv5e6m/PGLr3/35NW/wvot6IvADaEjaCEqCrsdq6iFVbOdDzJuVwD0pTJTcgT0IVL4ANthH37OnP/l4P8D/E7h2utxDlx0gN8OfJm09gF+u/CHzBW/OWfcF3PG7ZNX7nAL+QEO8MWB360k2R0vuU82zFZDHLmOd+aWNN+a+wZVdQI4DoDXkpo/ABOLCpggkwUmKlQ3YGb189/MELHLvjfwOMtVVDp4TAOGh/mEeTxhZsZKocykqqLKfFtpwuryuXvfPH9y/+LRKdPlijYk54TxIHZOxuk/zFlr3lnyPJ1QkTVdoHz68P1/uPXSX/CdW6A14UR1Q7SeZ5k85HM5wDaIcOPYB8hXyrSQZky2GaB6yXQJeoLLD3D5zukn/9/5J9+X0x8f669O6BHJFUNUVVG9mZN5HRWeqKHy/TRJKSxQKoDSZKe8idQurSJWPp6m4yu5daEv8MnXXnnjP65e/CaO/gi4o9MKvCas1e6YIlK/FUdEwAplYFryzn8J4DBVD3CAA/wu4LB5eYADHOAAf5iwOzfcAQ5wgAP8AcHgOhsSJRPFEWe747tdbhPuwfCogKBQJlbUCzlkmkopyuQxYUCNoOyOkKvqChCyIMTxiPRk0ZYDukpCxP1N2WzxmMxFRJitkhXRbUx3cfMbL7z64OPz+1dXZyiXa1xYfbVv9gcpEUMUICqE8L+CALBiAhQTYUWsrJcrenzEH3/wy//ntedewfqm0k3zyDjJzK87Ubu5+6B7DrAMRMWnEDyU0jJOGsMLqYpuiDdEF5CPMb2HJz99+P5/O3/4Tyt55wifnPAZ0waygYKJiFh0UgWDoUBRcz6qKrG5ERHHugUTESmxKCYUovVmWk2bG+eb2xt+4+a977z4xl/hxtfAL0Nvih5xWSlWNUxSCcSVw0m5lHDQO/MjCZmID9onsuyLuZ98gD8ceNp76Hbz9oGfD7AbDrxxgC8OHLjxANvgD1mX/UajBb+AJP1DHusDHODLCE97uusZYMdZn8/hhnFVJRKLWkxlOh+auxHr0WxzuCkxmOBHv1tApUxAPaMKsB3vViVA7AIOO2PKvKonu5lUlQBmXrmbE/BYyLidB8kv2fI5Eif8EH7TdN0PAAUK9Aj8AvDa+oV/fevFdx5/8Kjo5USXK7qETrm39bpkq1abj9ZbIQD1hm6ZAALOj8vjh49+cv7r/37y1ovQG3bQW5SZukPrh5isA+yGIW8pEAHFCqjKRHzFdA55CDzAxTuP3v+7y0c/orOfHE3vHvNjxmNWyzVpzGp5Fgg1FtqzTwrAUOkmuWVcUGJRRjmGHl1uji43Ny5xh4/+1ctvfOfklf8RR18F7ihuqDLzypK2MpV6u47U8Mm8p4EFtj846A9wgAMc4AAHOMABDnCAAxzgAAf40sFvdsdim9PMHRpjbsr0qnkL4+qb4Xw2EU/TZNd4C5p/b/gK7udcZYTiWOsuXO0qnhaWpSJgz2rpHhlSFYCJTpRe5KOvPvfady9OP758fMZ0qfQEelajO6FEUCG/zQdKsBOv8DDRyTpvmQEJRFpwxXR2kz7+6N3//ubdP6HbN4FjYM100ruB6eCaOcB1YL5Dda6zvJMQnQBh3gCPMd3H1XuXH//j2advnz98m+X9G/xgzY+Bc4KoCikps0IlLowitmtxSBh2X5USqPdQMokS0UqwEj25ujqywMnj5//sxdf+Y7nzDZSXoM9Dj0HF7uP22EklKqJgJkYEC2Oe4mDW0yFye/7kkLPvAF8E2D8b4D5Rlgd+PsA2eNq8ZodLCQ5wgAMc4AC/KzjomgMc4MsLX+SZK8OiKbsdVZv/EQBQVMOHwOFF8EgvztGNHnE4EamCFJHXcbJYK9lMRCQqqhMTK3N1UAYSEbS4I/Aw3KI5W1+4UeNOH1UmUsVK9QT0Io6/+sKr375/8eH51TmTEC5JJyKLmsy9ghgCWsPB6u0/qnYqvEaTAqCLG+XJxeWvf/0vf/3an9/F6iboGCDgWHRDKNyuM6ZpmuwqcGzv1wH+AMFjh8VTGQhg3skrpgm4AJ5APtLHP354/x+efPh9vnrnmD86Ko/XOCVcgYREQQTNt0u1hKqqihoqTYiQSTvsTQRiQSE63uiN86tbF5sXyvFbd+5987nXvovjr0FehJ4oHYGYUNDu8LFwYzUfqIV8RtRzoDE4K1uEckogu89siMmeq4ppfoADHOAABzjAAQ5wgAMc4AAHOMABPm+49hbH30hD1HkMaga5uEw4jlzXwiC7OUaVRCbLKUmk1F+hg+oJYSKp0Zeod+UUYhQ7hyql8MrbVo8dY5HxFu/hd2CjSnaDTXgDoyQzq05MRXStckz06uqF/+H2vQ8e/vp0g80RX6qcQSeL8axRk1J7SESiUG+npqsEFEwFBFYB5FJxdmt99vDTty/ff+PozZcgJ+ACrJiKu2L8WLqfWE+EtjPpLfOm+Xq8B+wUrBeeXBcxMf62qNIIbUvw2SMvavmEW1d/GrJt0aP1kH4XSeeuqx7PsV/mQY9z0AkpAhFoocU97ima32uk0ZbfG5UdZHEEO/KNjlza+dlFQdVhnwv7vFKogux+m4mJRDdMG+AC+hHO39k8+vHj+393+egn68t3jleP1uWc9YwgkI0FS6qq+g8hBVAAkKgQM6tW2lhkMUBKBKVLAfFKcKzTzbPNzQ1/Zf3CX7z45nfWL/wpysvQF0BHgjXTkagaFZgKlGQSIxiBoJbcsoGJBlW7xT68pWRX9BBxde/72XMiAthayENgPyLoun8uzKQ6VQprTXxrMc6R9jKcp/MITR+j+ezI/LA7UqmN9VA+8/+c99TvIPM/Ew5qZJXgq+5WspoWA0bVGf678yEu47+U3WPMCdL3caiHl/6cy4f6PPoe0eX1hzIo1+P08G+33wU/Pu9C9vsyW+TScg4UuxVuKQo+y6JtgmUuhbaMi0uGkUvFYvttmhifG92mLWMxbzfhWWlofQMwEGgXbbvRr98+o77Yo8V93i6X927t08pWvTkb0I5vF7dONUmb4cdT9ksGydDX32TC9pq3wTChhtnR8TNaB6+Za0ldz+k51n/trjPGEyfLVMq6tVYoAKCUntRHVUVtw3/L8wX8l+TGgtCYv5r3aLs91snMub1xLWXmPXJatcNJQb2kT6fFMiaXjHpRZqD89vHa9mSkz36ni3bro2tpMgzZPvoRT7kSS/V0ErK1u43/O07eOcezePFnVYWi5uWn/tstWPm8mFnvQZMdOh3DXMg8VllCEZzTW0rNZu6B0yb6DPOt+GDsV+rFdTIzz8dxXBYkzFZI65GK/27LCtuZbdsr74tOqkq8WqoT2dYKWbFDMV0nT7ZZL9tg+a1fOLtNZ+V8VpwWv+N8D30076OIsDsQyHlryfbLsM/69/O3Tz6P8pn5r5djS9S4tv7qN6h/1/XpSMPtdkhtV3uDPtdgdc410W77YT9Nkcu3dnt91zTdPnbLNfKn10e+DLWGOsHS93dPjdn9GZirah+Zs7992zDZ9ud1sOwn2a5bh8LXNDSW0Qndbd3ZCcB++pkgajd0u90CcwmaOV29IjUKkQECqo8RlZhF7dxpUdFJQUw0bYTswOl0VY9456BIb2CMwBrcQPmHqgbrix9jVTuOClacAHdo/ZVbr357c/Hw9KPHoPM1K+s5IMSAJdSsUZP1tLj964fHSc3boqTGLjpR2az5/CYefPCLv/nKrT/CnWNMBWUNQFFAlgdT4f2ybkaPyLMGOq3j6vDBfTNX6uO4YrbE9etWro1IlWzD5Ym0ZIxmylsZycNnz9NgdUbVvOZmbKnQdQFxOUYva9wBt76nYo6GgVyLTzKhelFCQxl74l3uoneHeoboP/sxNmHhxlAiJShwwXQBfayX79Plrx59+P2zT/5Rzn92gz9erT5dlzPClWIiFbRqWVVQMxMYlwLK5ruTyn6OLQBlLSvW1UZOLqZbV3RXyxsvvflXx6/+e5TXQHeBW8AavCawAkwrEYvxDNeYbVS0Yc0u+DzEGTwkeUoqqpWPCZKrQs+6/rsZxCrNBanVpZMnUTt17g/HgXgmEJeZeSh56L4PB9CU/dho9yfJ8Dwwdzlg/Iyg27PiD1SCtAXzsAQamHYLjAuY9DkS18UWVDNQTNHWyknS0mJf5MkIsTT3+75kebWXmozfS4IC294+MyzXQ9a/PBb7W2mfA2SzoKKxaO5+IaDxT3q4r+0VXJE1VPq2CtJFzZVl19yQSpVI+rGs6RaxzRImF1jCc6FHTwW9NLu2cCdRFyGsuG0V2smSQX3sCQOe3eeqUK2Zzq/T/tveZq6YFQx+27bFNUNpabNq3voOfNBJs2VumTcRdsjcBht6OrSuIuCxifzVnBt3dG037Pe5zNvd55Onx+3zEbODmboNk3gloqWUbO3n/Fm5zrDALZpiqQPmhkwt9qUWzbP29XanwDYZpflGAlVp59jyJFomLBFNKky8ZaSWbQxqZtBIYZfJ1eLF0rzOJbPTZDbdtvZ61I+LPDbaJ9nOWZZLMU+HmxgWSZdpCIxmW+7j8GN3bYuwW+PMy5jLIG6MWOzv0C1K66n2u8YGKXqaA82Vtg2lzyiXvnjwVBsn10Omj/FbnrZ53YR9VwRAMhTnXJ3rn7PEPjbbHOdZJbuwdeHQ1gVwY+bZWGWfr/IENLOoEx1bep3kf23Ib4PJ4VnbWGJ8Pqysh1Xe08D+m4Kjy3tbox1BoBb5hPGE9LL80fDdtqU3BZHr2WUiESnV/1B5W1Vte4PZ9G+lszttWHUCYaVxFtXbEDH1VqIvIhuLBUNCxb4K1VIKAUrpCh3mlchGiQofT5MWuoujrz//8unF2UdnTy6ZiSDIF+Yoq5ASIQUyiKL+aXSQ6goBCekV5MkKspJfv/fz//P1k9s4OQZOgFsEKMokV2Q+SjCYocLMohsmHqzBYDunvgQj9aO+YDoQUY2ZI1GVPgqjLq5yOOdQQ2WI1qii/UkVPXB77MoDgGoeaQmENR+Q5+RYIsOz4hA7YNDSsKj1dH3UdqTXKTNSMNOK687y3MSuu7iaIkE0boo3K8pkwsygJ3/QWTxewHotWsNu1dCvbVX+qc0BUJ38ZieAhO2ANm0IV6AzyANs3rv65B8+ff/v5PRf1vJBwadrOi10Dp1IhUigfp6atPoihYjBwiARQkZSVS2DpCiIV0IMPZr05Gx67kLeuHHnL176yn+i218Hvww8B1krHREVBQNEKGr7CwSb+SBwtnqVmevNPG6gdi4e0wcuO5AuxdLgVeNhf95V4oHNld+oRQo0ElcmtLkPAYFggd9NC/puz7DLndeNoTtzmUVxzHky2daCmHu0dacOuUAj4UNEECRJvTCjFUwVEytWKRZGm2byd870/c0X7rvZ/vTaNEd0QmFr/p112nZFkz/OEMYGrM45yUzRhD+HYLHaaEYZhFlBqHwfZYgldm7rHLfxqGOCNveXMTfqOR2WV2Ko8nHYyq7f9rvW18ZTdPKpw61WxjHiFSuiLWMQ+C+tKvNDmnPIbn+Z0WSxyDYchif7lN9zVxlbsOU6Il105zakOegpSet0YFM6GXkh7VMRY1ratuTrjcgMC/vwczq4PMlRJJlLhybgUnEBmiRxCiDFR+xhms/lITByxQK3m52X0Giq30ahlDJbw8xrM/xL9LeL0qqemOYjIDAo3BajrgeZwYM5I410oOI80MUg52IhuNDov5VLk+Wgi2UIYpqaiBQTobiCqDaVKrimTpcYzNyuy6fWXPwO/UukgHh6FgaIWVQFzAqjHQQTMbktnQw4NiMmcV2TmbbmU9K0CjKscsmux41P5uTqYe5q3H+ZVDeWsqX3DNDL9i1QX2c9kn1zlLg0kKw2ABUW12ibSZljeaZh1Vt8iLNvMwLIt2wNTwW5XWh/Wa9ZQ260GJPAbcEbnt/WGupuutWmoYqaeKy4KTrBhZkM5NxuMQz3Xi3XnjoBWitmGVcrvfTzdIZq/yov3W3jwVOYSZIhM41WvcSdXZH4LevQYfu50wI10CeZjsRQiOu1TJm8cmluu4yUVPloa7a0SUxiS8VsaXffjdDsHF8ccVDDNUjbqqlokCqIQdTaavRxiWElTca2FaW9Uke9jU6dOyWWoaEvZnOqQb8W3n/jIUXPeXttLPaC3bbQtfV0VuWzwV5zqdo5APJx0Q50IZvWDj7pTjtRs8OrsWSqPNcXeqE3/kPejvZJ1umOWJubNJspeROx/5F5w7w61mLro/msUo0+9WrJjixLxuGAp90ZbX+6qg6h6XQTEWJW+B6PiX2CILx1yOXDmrJGFRNVnSJBQwBgivWRYPK52ntROgokGhryneQxP8mcP2X4EQ66TKUtY2q1m56ieO6r/pBa9Un1JBaoVoeHgIjJQqCgUJJSSFV0soVndbKpVpWq1fXHJvWZS/1VreuiinrndSlVlsXv3BMal7VVec+v05mmKo5t07iU1aQbhRKOAYJOdPtPX3rjkw9/eX5++aMTmhiPCy5IhYlBJP3oqJmDE5LwtTUNEbFMG6Vzhh6V1ZNP3374zkvPf/1FyJGCiG+pCPPa9PWkUBFOe1yDRtljkbAVEkEWNN/QVqZedNJtjihgwqXs2ETN4+IVdqud5LDXVHP9AYAo3Ybkls5ccQ5PGubegZ71o2i3Vs/9VSWQYPQw0kB/WyS4Oqem46sFo5ZT1GvWcDnFTfS2BMjzM2Jyq6FMEoKMsAGdYfMA0315/C9nn7795ON/0Iufr+X+ET9e8xXhQjdXvBoX1CoEuOdHSVWZiiHE1gXlGkvCK2KadDXp8ZXevJQ7OPrqS/e+e/PVb2P9x+BXFCvCMZhIWUHmn9K6RdFtEc9dkD43u+SwUTJH9ecR6Y8wj/XHCA/80MaxY63WqKgU6njPWEIxzeYYA9P4bCf0uDUgs8ucw8P1RshOWAo9mmnY8Sc47RkgzeuFlefw7Q6cl77iJUMqlc8eyS0RSQ7LrrFU4xLFms6wB01wbTGgozJFNR5HtOeLnOz4eDZa9U1Doak77Eewd9dqcB2VKiwIcMfqWoN1zyaeGj6LhtoOz25/fxag2A60VNnVgU4R8r9PDYPTZMsUu742m+zzwlnQb/EddIu0bc6X0FDD88XwkyyUrkF76w48D8XcMJuILEDMbMQJWLRc5+4qcUnlNS9pClUNsWkm5rLtkbZjB2kTXJGbnnc8bC3/cIGMc0KFipxZKVaIYVZmtJL8r2GoJNOxs8F6fBaYMNuciwq3b3Tsb6unur2aHd61NTvBsEiQZ4Vwqu5T8+AMSj6RBp+v8FmOZFng8PQ2vzLdNakQUSnmjObgSR9HoA1T1d06iy5R6DTDZtiMoe58yXxtv3XVoFB38S9Iv2zmbR+mrcuT/WGwJ1FnfZMAPT41TcqW9cXYU0rhnKrUoiJ6tH0lu/DK/90mTscNGGyhQ28wz8vvonMzKWdSfSdui2DpwqKq5dV3KwzlSm0a5GroO/tsn7Y1RY7nFm0hBjcIF43M31P4LLLrehMxk3EIhTaIBYLO2M85ZDmZyTyJDTqlvKBWsmTLhXfPmuGrbb3b9m0tmezDHZ98FlBEhqfkkahzpCV00vliZybPMZd7qYz1JfT4vujpNHcEdbqm24YZvZNzlLbUUEvmvqANcdP7ETMbrgNba1ucJoMVWrj45lnEobdrtDMCWvfISYTM61ij6aEerOo6pmWUQ+RPHPdL43nuLXkYZ3hDA2/HYwIJRLkoplPQA8jPn7z/fz9897+upp/dWH1a9CHphvycv9bwtKLumM3DX7eQFaiYrKCrCScT7pzijXt/8r8dvfI9yOtCLzLdgK5qNKASM4cbMAjdLzt3S40dvmrEjhbRsJu0LUxgOeLGfdUj5bfhoOmzYdVkHQXqjqvaTeseZZaFi0sTdyJYi3WCtXlIyCemuxiQPXpqXSFQnIweAh/gC0770zOnqkbWPEdYMpWMy6kmYUXgo363EjEILUGqCEopIhuQQIQLpumi8AZ4Av0YF+88ef/vLz79oZz9gqYPin66LucruoJuWDfu0AQRGWsaf+boEp8FICLxyAuqmWBX0KON3jifnrtavbl+7t/de+vf49Y3wC+BnhM9Aq0IRZWYigiYV539Z20pSH0HhnL8i62Tk0hV7bZVAXS5ZhYWDPE2iTyIbJJcK05G8cXQgvKwEck1z0SnxShRxCjVD303L2ro50JW1a2efhPK36qisUSlT7dI6PnTSc11/yNj63GBigXFYtHlGcN5T/M8mkNofvslacb1b7rf3dwHZnlnUuG0MZeoN+xGpjrr7xaRGmXScAzuIQKROabnfR/qz1h2y8UtZRyy0jXW2+fbthnuMiTNqTGqyJmh1lP70qTQFtye9vleZdILWRqLp2rl84BtMVO7Y6nGt8ar2VBTgYcq91qv5jV+ChQH/kSd1zxIjL5w4+T5zvw8z+x8n/+65UqWb7n+0Yh0blysU/zfjFusw7dikt1zmf9de9IgvRcPTSfPS5sv2YSYH/XqPq+9tljIiC9YwLb/KkX/zfAMyClEkhWU8+1Gj3ibSyD3KGtA2y/nzuciqd0VAMEEgDHPUbsQmTvTa6YH66EqVa2xG9BUfryUEkt83j/s6p9rzJ7ORoFlfZr53PT1ol5I4BrTX8xp/ozycBcsRjyNlvOC0ZvaUreAcwdn9WREWx8XrRFa/nZwN9jCynP5zfT4YNsACCThrtLAP7pmNoyX1yhjp0nc/s+bAckhmGmSfmdqmBzQypadPjX80+pvznvZzu8wt7fp2yzfUutLNmEqd42eWpomS6yS1nFSd2QXI3CxNMswa2s8KnQdLMQA5tVQ01y9DTO6SJbm/uJYZ9im4xYt7TStltfRbZt9yYDu+c1k/ue1dfF0lsnS8330+7PDfrJuwe5VkZm+5Xn52atot9G5l89J53a6vrMKYlnrK7jWFyS5imfcJ5Ow2ZbWHa2tJTt/H+s0z9km6HvZO9ps2LJSqGVqT0d7Y0k+dDik2Tpleg4Ez3S+bnznbzMOZkXsSowTPar4mGRVKFou7FpvtdubTHZrsL6PotK7Ptv4qsJNuJxQJTa0RKTluA3kolzrYsqPEPWa5RT1egLKvONkppXpcpVpIr5BskF549bLf0lXjx+8f0GiR9gUPWVcEaoTDR7R4GdXm21BAHO5mqZKbILqtNILpodH0+r9f/nrt07u4PmbjJvQAmISUiJTLXGwYsgFMAzWQI19BjLRjRRC0CTgOq3QTTNV6tbzHeXHOanaH0JvMFiu6TlUq71Vxw51OTEMt2CY/+qCRsMkBZJ7Gm3fAVsyOGyhYalJ3/2gzFAqE9P4ONs67v5r3knHakqfeHmAGZMKaSNRKaS4AgmTolwBl4XPoA9x+cH0+J8f3//BxaMf4/KXR/jkiM+Yzkg3TFLdt5TbJQBsg91YXRv9uRBgbrwJDC5CNy83Nzb64ubozZff/N7Ry9/B+i3QPeBkUjCtALZITLulyni1Vsas7SqCmGs5d0+jXnBazrdg/GAsOgxJb8pkLrI5yDPuImYOHuibCAYejRln8qa/tvkeeh6m9HCXwov4ESuNKkxbBxe/6iF8dr0zUfsrhHrYp2aKf3qE/W17r4kseRFlMD8S64ZmXfSOWKlfAtMNq1c2BFv1uH8FZzUAACAASURBVMXuJRABG+Nuaj2y5Ee9dw9N9+RpZOwcGlcE1tfvssoey17uzUFN/ByLluVQnd8cqMbB2Gen2BcKyHlcXKPlZMGhkZ+BSRaVI7Csp3ZUPgx9PLTPto3FXGWbwbLbIkzLxR1DvBB2ETpiR+Vzu86lqLoozgJ2+bTvjoc2cIOO0NmpNFEpkUg0H1HuKZCfZJ6fj0K0lbPXzYyx/GOQdR2pcw3oTFzL/rKgd5LDl+bidxuEZnRsAcDjIsnHo0U8kZvW19Y8OCaWxr2zdZ9lcmE0CPcBNxmaQ+26VhZ8mtfBNUFJA03CcEJHGYJr2KcVtr0FtbxZiET/RHmOyeKr7hGl4K5C3Wanh1J2J5CCCVuUZXNlMlXb3tivw+0Z1HEks076ER0OjSxdj9AWPgtNDzP3WkbN47i7WMypRfFufYqmNX0YGov6oI1FtIeH87Y+o/Eza6veqJVlV09DGfjzs4PJKxvZkJZYWk17+eu3JX5PjJvPBtvGaJBgtHTawJ1HIQwjBui6GRQLhOvkXgS4kbsvWkDubEJ9Rgs/6syLfUc4WzLXCIe5aZHI2B7apo76DmJ0FkmWJuD50fV+jDrKLw5BnpVVRLSt0BY1qb203KePMzAbqQzaZ8vmbivTPCcI66hZfY5260KfZ5OI6iZZtqBy6GUmWhhg0zRZwJmqrlarlXeSiHSaplKKf28eLnNSrDI5cpNhPE2Taf2WFBPVgiyqUzWKFaXc0GlDx1+5+dp3L69OT+9fApfHLIWJVEQnEEACgcL20JTV92dMJwuVemxTVDakLKQkOMLDzeZn93/+X1/+1y9hfQRl0IroyKQ3ARZJxwVak2xy2EJaY6Vp2FeUhZ2Kji28cDhfiEBAZkqZ7wRGHlCM/Ne83VQXw0CremFXR6Goh1B890PZ8xXCmcwdoMkeypDNKTJLlBiw64vqkSJHQ6pa8lRU5gR3ZHIMyEgrrQExVK98GecUz353a55sVAX7OSWLusMuEIWqqBBUMblPbVJRkEAnpQ3JE/ATyH2c/uLJBz84f/iT6fTnrPePypM1X5Kckk6A1J0CDcNOmZlQr88uxCoChZ3A9aNtrKqKAl5dbQBeT3K0wd0zvHb73rfuvf4fcPPrwF3QLdVjxRqqoGIqBgAxQZVIPS1OUW2HeoLoQ5izjcsgzjqx3gl61hZWQ8mjRc4Fndh15be8Ch005eLoAyU2x0x3UveWa/Nt6dx2/mP0w0Dkmo9JFMpVGti6QgGIVp+ZqR1Bjbw26Zojal2RTE3UIvdaiShtAA+OS4BAOS9PNNKXGR56QFxbfiB93gp3Z7UWbhmO/rJ1ZKakVCci7k9BymDZZMwDGK4v4y4O28hAzabqFGFFM0kZNB99qnHGVomNcluGkdEjKkDdL50vOXKy5/jWskVg5MBl8DLJjbtl3zXbL32OHkmyrpXs207SckRhYRXdiDfwj1sRRDtiCrbtD+c6c1TCjug8pJynixUu70JnWNrZHstTxsc9NKWYcKj7TNXQKZi5g7e5Ia4pQ0SWyy+bSl66ypk0v2oe5Cjimx9sUXgzI772jtqevwQlrFpvN88z9rbI/9ZqKjf0BjoPgl2dJ7Uv3wqHlTKzYlvWJLc35ovEkSeX5ovYKqUKM9g2GDrzHVyIUY+WY7C2F/tr0hhmDdqL8ZYzK2m6opNvThygZrZamN2EVpKIQHkftMofUeEq9xawDT2ryaXm6jVptETJEQ3H1jOMW+yhkp38GN0ZZglYl+c3GglFwFx6lb/NLaaqQjLMpdYwj4RclRHcTbOwLZTjCqMhmHaeE6FrSHNex5GTx8L+XGcRTx4Z1GJequbyMuzJnqrvz8rpRDXDnxJaPuWtzp1qLy1spg7Qu6gikq5jjwW3l+dzrDzeZlM9t+Pqv88EXVcxMMe6bSTPaGgFW47XuTzf7iPuVTBRHuyKWzqg7dExNaekr7OWwhi3K4/R1VLFqO3Z73JAuK1oxC/R05hHAPqIp9S1NFM02ZbeYeecpfkyLPXDMtcuOGZ3pN6yxOj5kH1WmsyB1iBxy61vG8x5td7dRJR8MVvsnw7SUtRW4jWiStMEaRswSNHifb2S6DZukD+NnfPZn29r65pR2AFG/ByZSMv9lZ4+W5318+cxBcKYiQIzDe7rrJD1o71apWU+htwq7FoPA6ZM04aZ40TRfAdx+DbPwe3jkqEFLWU7fL5mmXV2AZbmWocbOtu+zlNUelYrsFkLKf0X0WhM+hPKT6z1NAIZtzptm5lmeNYnndYw/MMfNXcmbgezmsrwBJBh/e6zuACAKLiu+Ny+YqJ6rWK6vinOT4/booO3gdy35uYoiGgyBtQpvJYiYonRTZ5cXl6uEopk6iw7eno10+Idsuc1/KZE3UnyQFRq0uACEtEVledUNrR+684b39Pp9OyTqSiRflpwyRaSY7koiSDqqqNMKkSsAiGpgl5BICEpoA0uV3x6E+XRg7c/+tlfv/QnN1FOoCtASY8F6LxsswvrEikHHqI5Y81h0YjJhBreMrPq1h2twazcDfM8CIAAxWea5C5kPFPrbQmqsz3eTJmej8ndYdeTaDBHckBvIJP8Za07sa7L5FLPLDlNnY702prjkolFJ8tWKXpFpKJXhSeiC+Ax5COc/urswY/OHvx4evKzsvnghB6syhPGJdMGNKlqcaEf28XWikroCRCRxVG6aGUFC0hxRHSiZX0hNy6n58uNr9579bvHL38LR18DXlQ9BtaiVLiAICoEDk95lpJ2aVW0HgORaaXNEOFUbHAyjvZ0/JlpuPg2q8PAbcslbqMLIGHb8bvlQduqkvNvF/2qdacrFQtjtF5tjsSo9TmR7zAvh9HNccg1DG0NhNrG+guzW413idH24QP/rReGJK622zZR1ddQSnK4sT3Ko5MVXp4v0eGczGEonyuBG6aLCmmOuS/Xu6dz/2OGxWoXw4jUozZ+c5DjT6+xBK6BveR51/Rwsub6ndJngEWsPocoUbe/u+Amo+HSiWBbN7ag+PZi5/HhpUZTpb2hgiXWqgFTS6w7i/WO7fS5Dr1mdKywCKwrOWJ0aHTPnpIvUXZzxKBk85+Y2Wk+XsuQ2wo5s21odho2Y8ltpLM06uSbgujokx2vGf/8+dzl2tDw8o0OWb0qwDRPRtyGLHg1R154R3abdiMp3IqewnmRmXbWxwW1C7Dtwg7W2jaGHFXYXoIl84mpiWeRRrMgHRlef27yfLuWCa2xHCzpEXM9/ZfJFRZpgNiN2AD6uTnTv218TfXLcG1EWgnbJgpm7uDFKOB4RbaxKko5WaHX8XmF5C/aFfHbci45O8cegGJfroPZbLl3OYz3M+rDJE/muyZPXdWMK7LSGfXaZ4EZ6dJBPXdYSzpR5IJOZoGre6mb+UiRB4vM5WEU3L/+LyHsdoDu8+3o3N8xHbIZk58vlR8QyFsO2459TMl7xWmHb2E9aDO6aa7rZIiaI2pWZttiYXjYP9niZNwlRrobfhb0qQneTp+2y2eGWYxe8iDxfIbcXKahXc68Df95W7lAVDskLN5HhOZZea0tnWYxQRQzrssJKN1WX2Vf5+AryCRSVbuZBoD5IuwQNwFEZM4cSqGN1rUWGjkQK5tEgTQRmb4RmUzYDeeFMzb+7eSGr9bjtiiFbkMn3NC7X7nYyHTxcIJuiAmYSCZoOwdERKo0qTIXESlcVJUKVCetNylvQNOKyqSX0Ec3VqsnH/zNczduHb9xglIABgphJTqRCve7045qXNMxDLYki2mcHsPsRVM/MVRTn8bYfDc25GFJiG2FomZvYSQRP7Q4B1fSJl+8F1R3IwcJiOrpk7SXuLBamAtNZ4BmKPTlk9+qbuuOuZYsAjc4CgBREVHmbkoMK6i40wYg1BPltVn7kS4hFaBdFKPVTydqURuTsDEMrkqZgEfYfIjpw+nBjx999MPLRz8tmw9X+uC4nDNdQC8IV7B4G65OPQaZ2ZoPdgEglMmW3DUqrG7dT8rKJ6JHm6sbF3prKm/evPfNu69/F7e+BroL3FY9nsRuO6RJwSCmlR/hV8Xk0RmTiDKKpe/Moo9M7qvFh8L3uAb+JDSRMRhMo2wNU8apNzhDG0v4w5a5PHbJcqNpKIP3XGE1BdD7WD18Mj3sxBHCfVZXhiluwgSff+6yOO5NUxDyDafdfKyzT9zAiwiR5RW1/9q1H1iLJRLZvCTvRVLbAoB3RtnY7plfv2d5M2xGhAEa9Klk1xo4DgugjmHUertoa91GzfYJVeut906ftnpXKvkqTAF5rrSwAzRnbUMyZPPmR40XqcBACm9tlWvtS6OAkbGL9En0IeefMU+/tzLAfId/WzQlpaXutr33ZcM0Sad4YlNemLjul6bae1bLie2BJnPyXi4PXw30QZ4vJpkrn3svcia1pPHRnRjKfcwU2GWOJ9pm2wWomz1bcx2mgbMob00RB9tay5F3nTml7txfXGXBVv2pj2Y2wWeN1gDzZhGyEYfanb8uzQTtWCXHQjE+NARtsN3QDBuJiEghszXHSOfBZCcaJC0tfmXv5/fJ2D2JqUnuR7n91tq3zG9mP6Tr15biQ+PfAc9kvtd4VYsOiOduexTHP0CISFEEauaTG4qa3Q1ufuTVlx+GTErQuIW4jWbjvYXVV8fwZqJQjdPUQcO6otREjaryZnw+mtn+pH3lCz0Zd/n8rBmhVKeb786qqtIE+EEtbym12OKFNUU4dpGDVjjlLnQpVPU1lqDSGdlrzKgPh08Sn1Am8hiFtC2yKaozilUeIACS2soLdQa1OluZtOumEFEplKM3Ej5VTk5hadgZC6uoEASTz+hgN7jqFICznTOpsFteiZ7VOHcKkHcxPJtwKe1BO9ksh4jlCUpbCIN+tHjtJXouREk36mltyeVivyDv+EEkWQJRsi6XE3c5NRomc3vA54uVsAGQNC4tcnYU8r2VtU0LOHEBny+GhbNT00d5Rs+NDZ81E6E4zlFeRbQfqIC5Pl2m/1yRBUug2nBU1xE5v55/ka6a4CRh5u12O5TJDJD+YYNUWx3ViPZK+sK/TV8FluK7770907AarKMkweawTL0enjb6clv9DXJPO+5dKj9bSmtjuSpjq3vI4pmIyGVIW1nP+TkjmedRP98HyMEN4YJoUeeaIjG7BrZuNRnmM3Omdba3bP1hf2K1G9+5Le1VIeHZakurEqdDjaP31xE95kGJFsMzaihKdo5tMySs+g6Ky4C6GspvmVo2xTxqPQ+k2rzdWSu1vqoM2iyf83nYpf53Nby3zZoeh8WgvYgPJnIvLSxxH4CqcupJUwvCAxCksMPZ7ZYOJSFWX6Uqc13PBpRSVkhSLzuSIi4ye4sAiEzpym8fEKd4DvWKi3vc6GTVDfNKBULHXO4ChBube29uPtar84cKfLDmifR8XVzgAoRi4WnV6pKmNjQbWywFILpiPAKXD375f91bvXDyagGTiiqOQGuAgdAPdcPS7NS50IeLhkyvJd2w/KdWb1GzOJeYoLd3F/Yidnonx+bGl74mkVxmNjH2cLI0az4s71DG5hVq+W7S3oLM0QtDqhqCiXM6Q0EnIp5762cWfMd+Pl4tOMLOZShdQibmS+AM0wNMH8qjnz366IcXn/5IL99dy8fH6/OVnjFvAFFMdoAhE4EwyhQLutmI8KqIgIgVLAqlAloLra/kxsXm1hW9tL7x1suvf+f4le+AXgPdAW6qrkClFBatct+4uhKkHoWzg+SspJlNXF2pxuwPz19aF2E7c/ZB1F1wChHZYZyxIR+s1v20O6Rplyys9mgrXaPUDfFsUjR3eRhb0dbw78ClmStsi2YxcjDXNjwfTp+p6pCVdX9IAVb5YewlPEudAGyTar4D5hVqXrQg2RmL/LCUVGWosEGLAUdbVhAVqd7I7iufcvNNoDx8nERf2vzPI3XdpuvckqAaJ9DJtx0GHPkixIttoUhiRaNHILCI56yJDvn4d8cQ9LA1mPHZ4l8iyjg/6v5qk0XHd9dBrDEC8rgHr2Lr6PDSLdLPCLMFwBY2aLs4UM0Rl8jfWmVUN1xt/bA1naJ2fFXt/gVrL/HDnp3abkt0rwL/LO7COdD3qzel9ourCnsgpzY3KRSY+MbGNPQxGu11RLMZhticQG+h7+5Wc+mn4TAFyF38bQY1Wz4Wz0ngzDVC74AYdQRRdTQHk2fKZ26ffTgOOrkLMivZGcFz4ezQLPmiNk15OedRZrkJzPm8H3ptS+WyKG+xBYiyvlvu0UCNzw6NquoLqKdsJdszczkGVNVW+hNYnjc/Gop9NfgWckZm3OLy/DG5jDk40mZbXRgbemMG+aGPwZmDwBn047NBmsXLBUxnZGvTsmmp+9Es4rjyYZt9u1pMtk1nzCxq7d12woLtN7M6iLpZbChrU1vNPbQcgQsQll0AOVBrG8KYzco5pE+YyOIwmg0/t3IXdcQ+kDFR7U6rZDm2OL9CI2R6YvvYLVqMlIznnXT4HcI+Ds0F2GGXavenHSPg0OBI62i0hdvSaTZa5s/84fzhEm6dt3rkim1jt7QQ2AZaHVALq0VUMXJNPVmezGuYP5+vpLTb0/LnO6XHAg7XrHO9rWYtVJkzfJIXMoNs3x/yOj13YRt6qmo2cHRkmtTo5OkfTcRb+ggiaoeB3EaivrbmXuhNTVJVMVulhVWqiK5Wq81mE/1dxV5E4JR4JQg0MbPtyTGv4Ctt1U0pJd/undNkuk+TiQhMk9TsbxblIbpifg70Km7pnTfkwwmXTzakV0eMCRdsok0Z9WyjnZoguMdNVatQJipEqgIoRArzET0Sff/+z//Lm2uil4+JV6QEWilERNG8rhES6EHxdQVO7nVmD+qCT9HeEPHYByfU3PpsnGpE6+WI7QtJ1Ou115i43ZxHfjZki0zJzBcLgLquSIzeuXKW6llo17RGFAx97Fm0KARorxoFGt7Seud7M6btHisBM3u2lLowqOtGFYUys2U9oOSYs34xQ2RTeyobQIlVdWOuSb36kKb7OHv38Sdvnz34Jzl/h6b7N9cX63JGuCyFRKbKA379lCqwIlWViWygiEhogu3YuIRhKgJsBMQrwRp6cqnHl/ri1eqtO69+6/Yr38bxW+AXVY6JbqiuFMxgy/FgaQrUrOEcB2fZFpQASin7XLRRQdva7Rb8w2DZqxzmXMo6nhMpUcxZtVNmRtWQoai5kExaTUMMqe0a1Ri2cFlioub9X5SDlPIQhULSepjdv4v6816cB4wwgfwYS82Hon7uTwTMpSaIYEWNE0NeBAb+ACyyzJcAtggxRmjobpsVOeNq5HPxOdJGgZuaGXe68u3z9ZP6/7BvLGASKHUyyqXHqMDEOQNJdhFBCOQxwbGSR49VZz3XsWnxpBU7v7Db2ayuy6zdbtwdq7yx0Rb2KbApWWBpR9SY0dW2PWn0dPp0+7euLLG0B9ugqkqMkJ9T9zxFamSe9JKuVqK87c1S3ijyDhrlBYklvPxMdHddWMC59TfRrW/OVrytTo9aCn/rUOc2g7tpyXmUXF7V6yzzss+7jPNgUKqiuCqsMscX5PXoTRJxMlApg0swIuJhmySXD7rVLIRc4+6Cz4N/xvWVCDFb0GAXZ22Z3Tp3vI2vRT3TrPsJ80rVRk+PRMhyY8GbP4eEv6FRXIoiL3J0hme/tO7iJU00NqysEmZLDE5V/AedxRw3QcB8KzdSvk5XKJOZebbmZ3Tzep4k3vqhRClsypRyW8dUH10jZqOne04rCtWx7poOrt2lk2Op79q28dwOzEMbKGIey5N1osRubkVYtZ/dwZ9Sg2ubwMu6nniV5m87UdGd6EwLP5u/Cs+K4m61uaOz+XYRc3Dmck12bF8+Q7NyXUa1uP5cJsO2HMFLcrvFlY8XLyJsGIo6tZtrndMwf51omN0xY/R3zBoz6Dx5S0NVVW3lMp+xcQokjbzpr/xkIYNnWwHpFPa2/a6pYFLWxXlUlyQk/fdoA2iVwyX40K+4RPKsekeo5nt1qSJATlbgJLIlAJVg+5jpUWxJrg3y0FYgUj3RaTQHaUmz6BNr3TqDfoUSaXZGu0iVw200uPxa/Z0d7qHfVKc15bzGYyD2tU92QEdbt6BSp6ptjN5SRYqbppne6fNuVxGq1OecrQSZnPmHvGlWP9DWvFV+2lqbhnMkNlIdEawvPLN3JNWzD8yjRPeBXXHES/U36GWLPZkr65CHuxxvvpauvCRuebpRESslpnYhgfhXKkkOz7HKN7HUMlT3VLYTYXDuhyTUXECd1/MiqxVKM7SzB7bY56iaSMJ5snSrdeXn9HUzRTyg3wKeNmEN5gWEAljaV8g2vGM4oVE1U6Oz28kOVsKjxeugNBkldc3USGcOtgXOcXmV11/kG+HZru5Hucul7sXakZeB2nXVjAm+4TEJiEkgDCqFCIJ6U3lNbAMfYhEwk4oQCcECDMWl3zRnIXM3F9Tjw6WUSZVAzCSbONAMjttvfLsbSNItCGRGJHMETg63N2a1pBFrSemU7sYy7Gj1hRMVmVRwwlxAxLdx7yvTx+9cXD5R0o/WgOBSZcNQgRIsq3UzZM0MrbjBPbWAkpJeMHQN6ES/+ul/eZ1v8IvfBr0CFZEj5iNRISphbcyvtE7DSZkhBso0LulHepubz55si+3KfJJN2G0lK/5h4LqrLr0fvx0M1jksIdPAJ9hYJvc3z4Ew6ZoUmFFGu6yIFj7DdotT3gEOJyZURaSUVfBVYKU6uREPIqWi0CvVC+ILTA+hH9P5L88//emj+/949fjnK/3gxurRan2xogvoBhC5klLKZJMnmSybaUNE1E1ypnoDJFnMt6hSOQaVSY8u5eRKbk/l3s27f3rvpW+VF/4cq6+A7qiuiNcwe5RIBDHQIuKOWvGRa65n712lZ51l0LrDLgLWTPzF0UleYI18smY0+LyuTcdoRp0uBCeiEqHT1KJdbHTtjJu7Nak1PZ8dUXnmc8VEaBHcqqrUDOg8y/JX27dVG8PYw23ZN+azLJubtq7g0acJJ8hyPOa2+rcVCLm6s4ZwpC7MQaAGRQ5hPvE844k20CNfzaultoIMG6JDrFHG7EkC0niJCKUYnnm7A55zOviCczTZszU2iCaRDfNqvpAeOmg8Zr+20HMm68Ll2/Nkjqac4z8nKy3ZNxV5Fd5u/Qz6CEDWX93o7BcK57Nv3/IV/+0Mk1ENadME17KMqkI70NadOndHo7MnY7bp4c9Mz0HCbKu/eXD6gWiSGdXpk16yn62bi6B8umoZT//RWa7bxE7mgf7z0fMS+AzzOnDeUWfIZ62OPABa2oe2Ja6+2DEk7Xnl4pxOd5APXdeqHZb70im7IWJdWgxst7qenVjshElONzm3l/xPyugN6U07zpG9rhUGqg6vjNR2HJ3CKVZunpU1T6g8eWM0KSmDNoIpfsGzZzY9nlvJvXNu2dqRmZTbFVWkqr4xsy9kJZhaHDkfMy5trNW/262156+MCO4+Dm9Lm/WqkeIGbfFcM5UHu47bVLk99M1lOZ8jsscu97Z3Hcd6+7wd9e30e2/keHNLweAzajS6AXUTekEyuL2h3SWKJWNO1clbnPPzsqueQLxGLEDNYpxL7FEezhzWofe5rk97M2ZGIqIa0x2ixqoJae/2YUa4pImzMIO2Cfy5xsd2Lh3MnqFk9zvZLZ0pSNXXsMUea3JVjasT/ib/oy+Lmr3Snxc2iVWVd4bgOIjvh81z1z510OJvAUQknCq7LYpapnl4h+fdN5W8ne2dgg1tgNxO8JtsKduZ/tXQDofLzH1O2Q5fcE3umGvxsGeF3m6H8pIXYhuGohKREK71Cm23VxPfUsjbiHQe5tSucelte5NRc0G0bbbGeHm70ceZ4J2to9Ejr6qCGjPV5mMSIJT8P9TbVCGHh/JYknVxkCWeM8M328jF3oLgyhQgIp1aTKWN2jRNRCWMFma2ZBeBtv0QVUYBUay4RSSnWRlNWGsFUD+p3Qwm70YEdjYHHBGJbIgME56mSURIAakhnSLCrGCGWqzTHQD8PO6+KR+9S+enPwRkXUMeNaS/Z3yDql9FrQqdtDJudf8TSPWK+fQYDKH3f/qfX9dLvPTvQVwYoGK5AIwDNB2HiWMIqMao2dPjXS6N+dLw9JJI6kxJUFkdyPs5wUJEROPym7p4ovZ5QLf/MGM4OzCbnoOTnVSbSEOZozZancOKaFllWnQVmPoAUp+TRERTDUpsvIGU0oII9RolKnEA2aWu4RlELnkU1CxdNG4uK9JJQCCeQOeETzF9hLNfnX/6o9OP3754/M9l88EtflzoyYquCk8qG9WpkEphIUC5FNbNxMwTJkCLFqjvbkfOfoE1p8RERXk96dGkq0t5/nR6eXXjT55/5S9v3/u3OH4Ncht0S/UIYFFSVWZSqVeK2604RCuFRjYrESJmz8tgbGnSiZobEYjgB/L1UsjPNF5TM0V8RHyHDSn1qrg8FTM67UyBDU1a5EyqatrXahQoUwljxegDAMqguoOkapfKW+KwyH/R+DOzU4g6IkK9fX506GtVFYJmUrufGqTVj1Zv5YbNBZKIyYVl7vPFjLdrxi5XdkZ1rDCtbO1R8XddkqdD/taX6tWiQu+S0NqQxG5etu18Gtq3FDNwWMiRjyZ6IGcPE8jOM3UpNchtgcJYURWIkNUWVVHHkSKiKtejVSCPVUO1GlthjOcjkLX+MOuTueAObtNrEop8Wxo4IkZ6zh7pZY+oa3TXzrnH+S6Y1ykyvfM0GZ0dV7ecPDKCqMpV5406S61YNr9ylE1AWG+KTrZvs/4FSlz36tCbhpluc7Mvnhi3+w5zX3ePwFBDUgSNON5fk8nNRoHPF7hGqFj4ool8Qe6U7BpLancKlMICyVZapSLg/vQcTWZodIsltOllZ37rgIoIMcZ8nfnDWHv7+Fb7BwRAbPGm2hsGEZE0OAhqKklVDnwyzvA8g26WZII07kq0AiC7nUREOvPZ5SfxIwyV9qc9658wWAAAIABJREFUqZujUIG72EBmm5nsrR1sJQGwAOKplg3dbFFUuawggpmV5BIHyUbSOTs6FSjO23q7VqWvGxtNZl22F4SET5TP5p9/i4hQiO3SCNODRkbOFG06s6lq/mg7QE0xLyCwI8ZNeghqNkkAzKZzY0TcCVXNibmPxoaQokXUBU/sAUu9v3op3nMwevNSp553QSew0P0c3Su24FQFMIUe3AciAler04+G+omGhXEz8hd3XsyeTDb/5BqzUix4wKU9nHPgbl6yPDsWi1bpmdUWm0FGOzWRx6yZRk18XgnmQy3Ucr4RBFCPkWyOtprpzERUis7xnsbS106re75pxFmRus4yOxBUqFEyUVeJWySOBJ3VLVOrwVMutvVhGDxKEN24NI4lnpshtihAc/U6H0oIA077WCZX3Wa2ZwuRvGFhIB3ZTnoQClXY8thxaTqlkF+nRj6bcq5t9O6PwMOZs/hqpUYbOT7WiH2+HCvjHttxR7zvVwFQuVHhAx0GofmCjSYtQAkQcpfUIDTIxVpe1g2gUFI/ykZCOo90pkikaMfgYlWbCIXZ1BjqkbC7hufJltgB2/TgfGXROZHj+VKdy1GZClAE1pDVZRF/1R5YJmNzSAGeBZ7SELe8gS77/BVDJ1QTuppxUhfjNostRy1Tu2CzypK0wUZISykPqQ9UByNhQLv7O/pr0sl0EXKa7MQPi/YkYF4mDXkSu5jONh4svOSt7rcQZqPjlknCx/U7FGnHUYlBsfZl8mWc84khjPptMp+1rqyrjPId3Fiv1yqN2jXXMzh67wItYpXqeM2t92ZfpX4lahY1qd6MmbmvGREpGbNSjU/rORRzqhUVEd+hsDOs1bKtqd2saI0qrUapSSpWlaZGRaifZUpUPUJWGzN7wLrJKGLu8kB3E3IUWM01QDl+bRj+HNCRLjmxHmk8BABlsOq0Uiq0KhCU56/u6uajX56fXwjRxysV4mnaXHjq+1pPKTxtoCI1Bq0uA8zbSIAwgfRK+ckJ9OxK3/3J//Ea1uXFb4PuQQE6Bo5ElbBOGqsTUo5n26nOhql3sC29EunGWTEL3crHEEa2cxOLZ7ZWJ2SzlnKlpYHnDnXCI0+PCOQezfsSlee5YUw6r0TVGAaq8B3d6j5XB1S3ZvuQklu9OomYVVUwqSpEOV8i5imfzexeFYhcMW1Al5An0E/17J2rxz87e/Dj84c/0ct313L/pFwcry6AS9VJLQpYKdSHoaFcJk8EGRR2bmfvFBEXoEw42kzHG9w+m26tTv7oziv/5vlXv42Tr4FfBp5TOlIhppUv2nwCAxBVbMgOa1cbtq4tarx0bb3S0A0pikMBCrufMUL9xcy/MIbyTFyc14l/CJDm3ch8YhQm8zySCTVVjYWfWaC+oRq3E7gVUsM0qhMwsYc6NWwExX1bsScBZ/i5/312xmpLcFbuaey/YalkijQEqtRit2K14m9jOKoLu5S7W7nFmAbxq+hY8ATl1bLb0Nn47syX7TuQ3emkbXZVmvjsDqNqn5Al+/d6GJ6QRe1sj1br3Jsw5do4M/Nbbi4j03YyOxuogg9iU7dRfkC+cazPEW+Lfby2UmAb3ebPXVo2jUC88kjVWC81mQybAiTqdzEZ/ux6gWybruaFW2g09ze6EJM3qfZo0R2dbaE49igTLRbPwW9eYPFKkNpv30yKWcPB0oOe8h1gZ48kXgb12n01sz0yEZC4LuuIwDxRJhfA8ATjhBr1eH5rEmnAyv9M9EezlDv8VRefR/GenhJCwBVOQ8/xKcMC1ePuYXk5BmLugDoQfcBU7ldySV8jUSueasnPneVbv9VdFdm1B2g9KhF/586iOxVeVYaSbkvrFr32UMQBZ7Zk80GiiMhocsOe+/mubXZUcG7mycGkIaLJL1fJkRE7CKh1GUCxCVTnqX2ok/vClj/sL/Zx3FL5HNyN6iiZPK4Z1UPRhOfWJXRuuhE3pYGaUX4ZBg2yG5aox9lsGJFcqpJoiBBvJpPfbbjQYraW53IJIA1XC0hSolVJdLj21tTRxk4Tcyam6hox9yUGN9Zias+orq9DEmI2RkuSzSRPOk8DKFQ92mVefqBzJtFoJZk7q22Lwg25Yr20lWmd7zUDe6cXYsZx2hxyG2ZcO5Dnu0Tvy4i5k2rWrpWEfK2g1jVhFto5yvZ47jZVpnmMhWfTS5FTWzYAvImu8pHgSb1mu7Hv7wLE86BbN75NFDTjNgrX+Rs4z6ST/+Bkb4ze1d2aagGf9jJOee9l480rHDDp3zZq0VJuxx31e2RuC1Co9bgd2OvZ+lWO8I3xSusgCTScTxrDENVsM/G524TZKDLbtdMROUA+WhfPbuZ82xYdW4zDvSCaGOx5JO51VCeksU5qq/JP4FNrqxknWnlVpPXjQOfxTACoORC7yZg+5JotkZpM6OdLLm90MyEUcqbhENHlrneitspmbaaXcG6IdDfjDR62JD06O39O/Exw/70wgTQJYSUQtSTj4bvTZn7n6RwhO7CDzlSJZ8dei6+dS/jH7cNgxYah8+o0TSuzS7YfgSTy4E+/H7nWktFV9yg5vZoJMmk19JM1U7sPIQWLKuma+S6maX1b7r5+9fF7dHbxkxusa5yWslGxe8N9P2eaOOVJCOuQqaiA2BxjE+SSCGtsdDO998//+XW9LC9/D6SK5whEdKz1PhBR7QI9ZthWdZLHOF7VCJS6qGgRTFE4H82JZ71WsxnSLwIrkw1x7AL3zOcJmJqri8nkDIrAxpbRxgdr4xaJ12Mtj9iKpqC8rBS9wNSiRTxpUbAspTW2VovNysJNZHiz5rHKlCmxfCAFgaTuoq/MYvDZKwQlVsgl8wbTE+inOHt38+TnTz55+/zRP+PiVyt6sKJHq/XZCpPqFSAkk3IBSKqBTsws5j1kYUBEOSJDuM1AP3xNwGrCepLbp5vnpvVXju782d3Xv7N64c/BL0FvACfAkYLcs8OonsciMqlYfkTjtCq2RM2mZOaIOS1q94nX7UK/lNYMR9NGnmEthiZPRh8Fkw720HYtbKqa8gNqCED4EcKurVwd23ZaZ4uyhUhWQ8VUc6FqIAefmhwWIpoMH+XEdVLVOlHL4hTeKPtSwFBwmwtpoa4e29Ji9EI3pFkDQpEqblngJrJSiNSYY0RkaVLNJnfvqrhgRYuwUAVIZSKOba6YGgKfyi5JLBa7VK89M2D3xuaTekpUs6/W45M69RONkbVsDb33yVgtF6Nnzu+pQLvs3mtrDpEwRIkoeYUMefL8vMbFmah1QeFzuN0UkWUKuVHeHqs1EzIrWNqVfX9AcvBOej3qdcKZrUVwZ5/p9ggdy1lTZ2Fd/bVG2+InzJd6AgJUXUIksZazAjIq/O7cKNwiNwSjR7m81R9y2HiJuV4KG7hpNXPDD5fXV+EP6jUaLHIYdYfUhC1Qg1HaV6PBYpwZyFsR17nDPoHMhH8wUl7YiFc4ZE1qCWRm+aXEl4raK4iFNYZqCKooI0kYjsKh37xpWXtqbIhHnNk8Mt6zmeKuINQotmyr1RxwVV6h6gvU6GAqKeDdZiuFDOmNv4qPqXKfStWqE5FMDVf3nLczM2F7XZ/9fZLmTpMGeanmBkneIk0xWZUhzeIktf2qZgd7PDsANRZtMezRLpCnLaCxorPHEtYvkXoyawaAdKItz5QskbwbvLi7A5cz85V88H+8jNWNXY4HKOqBgFjVS8gmn5Wd9egaGYCHe1LV72JaoGIe911WQaV1m02aLy7ZYwSxGFT4nKr+4NBGvuHn9vxERKITlGtUZnKOBOGTsobP31pP0DYuHcqKODK5x9qy1igK1iSZ2S3nOscbD1QQzFbIMbKa2KKN48wRQPWQmqEXc4RC7nlVHgGkttQN7Vb503ZSbXKkno6yKyY4PIdDxmfgh1qzxvGFjmODdGwM0Nqiuv5Lg2tYOx00kQh5TGfjwr6wVSdCmyZ9JEq3m9Lbcta1qkok/HM+N312aPAzEatvDVDVEQRPwB56MAhFpDkJgTNCpxEG829uPxijDBvAQ+5Lf6h1D7ZNZFIqbRnlh2Hcfqv2CYV93nrQuypmmxxEpMq9byF6NKU/Gz/kHx7iNfnX9aEbE02W5kFEs7z6Ro1u9VvPZg64DhJVEBVf9hl1Bo1R7TGPmazbui6x84hI47ds5ySEKz62DKqR1x1kgwdNkmTlOGXecDmG2YkExLjAT1imJhovOY6ULEDA40k7puztSa+nOjEjRMzxaesgL6luz2jkpktiVlKQCpst6LPYrBfPhaqArfLanQGJRGrrN1QN3Qshnj1yz2DES9oizd8u2Fn1M25y2yRku/skkSvK2EGukuaXrdcWmKSNQn3eRXZzyvajzZpskeBIZ2tqIJ9EcFDzsSQ+abM1yw0gQmE88t3Wwtljo3UJH7VxPb9DQduozTS7jX8jlE7QgRk6L3aba702DFqZL8InTrXcKm5kd7Vw1j6VqxWymahAlZRYYL5EyWIW7kUHWGRKU4zVL7tGPRiqRCSbOupuf8QapxD59FjMjZh/5NllD3MenKCy37lcJRcz1zVQaYwoorbIqT5HFOMVWr8KwfHd6S6mT3+1Ob8QZV3zxLQBpnYXPGPaqCEtqmQXa/jgqQCkDAgp6+Vx0RU9vJh++c5P/vfXsTp6+VuMe5U96FhBhFV2uEdf4EZDHtReJdfC5MZ3emvCIKg9QKiHKjOobWITUYqXa3uwrKrVUauScnKbo72GrUmzCuBcFT/aUHqPKOFgHNLJiSyFgyaZAvbbju8zRStptRwCpU8WGfwWF30mRmoOdWYSUbugyZ+Yc+2KmZmgKkQCuSIWyCVwiukJzt+7ePzziwf/fPn4p1env1jRgyN6dLQ6LbhQ3ZgwZRW4a9lnAlSqeLPzMsHhdvRbqn1VGBAtwkeX08nF5paUV/jWH730yrdOXv02yuuglxU3YEe/wUBNB2vRmiBFuhcIgEibWS7oSBWFWCynJlU/ClOdL+6ppyByXHSumJgsPpyd2raR0CUhzjFZXgwEVhL07EpEEPbMJK4hYMhs6pQU0RrMExNcgm1CWRZea5X14R6tEH/aZQUxp9QOsGoQRzvEUC/tyWy7yKsi4nkeu7kw5BFzRWW5fs09MepO9RkFmI+t+tDnPO8/ZvVjpb6+jFDZmOxNtkAp7b5EfE1uKwRFfCie2ivj7H9K+jw7klqdnm6fI3dk3rgaTIGoB2gbV7nknA5QhHwIcRElm2xpzosgdrMsozAAgG2zLteJaqFmt0vbgcuc34edYuhC7sucVUAYXXLODB2VoNAqqBVa5S1F2CNQz1n4UZGel6ySiEBnWzjUt+hna0OP/PxsXu5kTUR+os0vrNCsOOZjTVWptfClsZupPHOhuhcyjHWivCp54oW0JKjj28+XpsVE6u6C47MMbRI5qi3CKNU88AxcxUzT5M9H1sodmVPVkWysgqqjNfcr8LHpLyI5dUnUoDOzMp9cGQSO1uQ5HW6RD2vAeXHUunma3uaBCwxT0y08PBQT0iwLh6B/G1zZFtiGZ+5UwmewrMh3YTPyuRinQQkR4ePbTDIGJhGwe+/YZwE6cTpmZo8LSSLhdQixaKJHuy0z+vVDpj+Z2aOqEVvRZ++lECxBtODnYbw6ju350wPWKH9FKPT/M/auy5Ylx3nY9+Xa59Ldc8fMgCQuFG+2RViUGbTECFrSL7+WCb6V9AQOR9ghCqJIkbQJgIAwAAYz6Onp6zlnr0z/yGut3YzQCXJwep+1a1Vl5T2/ypKFOS/HnKUIfypNZTt4BRK3DE8vBacnv9s8s5gvfQuL/lM/By1UwPyDPK4cBaxlmEI2YTgDlWwdIhMspLNf2GBUZLSJhVdRScDBum/5udQtUyO99ZcDJ/SrJfT5PAFw2PHLtwzHQ9YjwDNZEIOBx0EutSKS8dpcNj3bjhRaZ1UpHjDveSh4MtJidEq/JfLLn/SYyA5zyF88YRFRMC409liLBtOsnsC6Cy6DSCkOHta3HNY+EKEGWQQ2P14c3UvGWEm6+J+XP2Y956FF4xPpfvTTs1r84UmB0odH6znkd1oup/bYr5HyeOt0B3EmtS9WdzArlZB6ywgHW/lPEWqKSem3/04E5eW7JudjYa1/akVtKaY/dsl1WOOd9euIQDA+cozNVMIhKRffch1o4m1CyOnpYeHDplUCKaYUvJ0UF+Q9Lj+f2aqAfbFMlvyit9L1lRyGOkifvdVXXDl2Pl+/9b+5+D/Doi1poilcaI9oG4zU3t2khpl5a7sL0k36S9YGqKrGbKiVqnmC6iarHHZh3c2KQVy7GkDLU5J1a26TxYybd1T35lJxqYypsuMgkNwVhb5Mw+qQOAPoi53eY7gOWGRZsi+PJT7IMxTTR4xtujzQ7dmBQ5P+hFWOar8a1yC8HvC3xy6KCK4oH5s83H5gdj4//cygKmbcXumuyBqImQnhRVgA5pclCUDobiShNMYRDNvPp+3O7Es1/ezv//1vnt/cfPNPM59Gw5XaOW9uhGMZGEk0Ah5onedO126pnUlmJdDc7o7eAcdyXB1tF5FIj2lA8yzKS5JMS6KvF8hOLgIRg/pcrfsHSdzVQhOezOj5KZAwr4tWXRZm7YRFCmaqDEQuzFsprfc9RRpx7uxokZDGRi3aOogmt0X/lFzmMRew7/sm3rmDsXIzoPPXAHyPROS830tApc6gGnahYtthL2Ff4/7z/fmPXn39/94///HDi59c89nj7cWG1yfec7/jZlYNO6Ja4lF63IKSKZRdQsT8um6FYTeQJzWjiOl2ttsHfXLPT87X3/ngm3/87qd/hEffBt8H3933K4Ns25XXEYRbOrV0iKLaObE5Lqhxcrzslu9R5RxJqvODs3z2cTAzoZiqQrdt23cjA95vBtfadZGiqu+4J0eEFB03obvwKXZAhLOQgNAUXfcgKWqRZ8mAVOi2DUCwa2F2LK2Xp2TEPHcpp4RaqhEMVC236UkbubaMyEqPAH6Qqtyd0W8O2+KMp8RFkBl77jTSSnZEWGU+aaP3tLUEuQ4DXyJN5k2+LvIW/YRLLiq7UeqOI5KJbo8yTZFktoISuJrNzJCRMFgnow2mBq9emQtyLTaPFra1TMtaDpPDbNI9vThTnDrKOWOcKYusU0SoIZsBlqoyQycBnZ7wdi55stksFLOiKnjkDBLQeikOawywlCXjZQy8m7XBGn6DFwZYXbi2bfMvFXsBXDsMaiibTMIkRfufw6JjYtCGBcTMCYijydLcdrO5YWHfGpYPtezvVgKJyFOnJ0iwkUd5o30HGBi9q4INGgZV0/P5mJlidGRTUKKlXTp/mvYhvq5ZX52V8J1pIKbzUPvSFAt58c/9K0ugq3FNNixQ5wX9rvDJd+Q86j0zyAwyK0yWrPHIBaROYAZpFqAJ0qC2Z/CWKqDEp5IOFna/sg+WrSSKksOGEtpdxxF6aZ8psNJLMD+t53JkABS7iEBZDlWsSCX5uk56BT5uiQZT5FM7zc+dQWbVKvUP4Hi9cNCc10KF+m2YPVrWWqKyyHCP4uZHUBUq2HjMcc+7WWSV5Sx6jRqJeffyJQhp+WV4yK4Belh/3hk+3yDVCQ6RzgCQCC73RsQV9YhUuQXoUWDVYi86EDKjwSW+Ko2RSZD2rIrgAJxiWx4PZIRktdL2ndJLDGteIpX8dulrOR7Q/6mAxOUtcXmFqe5m3KLvmQ2fbVuGhgcttm2ST7pySuUcwYnF7eTBuXvl6GPy8CDHUDYi/Iq+7bfkN4NIS1fEXbipn91Sy0Flx57mQewa0xxBHjJjRX9PkQN1w3sc1mZEBCpxFEIz+723FsopJh9ylgDR5nXWLdoSmcGpGjtIYx4GrK/U76HbQz+0FJfmKfsy386KFUboWwQb9muEA+muZKJT0CngsZute5dB8klNS15TYurD8EOmbUXGxn18KvU5MrAKjQqtfn+uAYsU3SMitHRzRXNdFy2Eqxfknwc8wN2EJYMxRlvKBswIzmRwV1mHsLJqc70Hs2hmGaPJsn1xI3BEJlOaBnvbFDRPNFscqxcs+id2LRjG7Wxb1Z5V+xJLdBb+tlkkX+KU8aDz9EYC5xthgo6ugsvJAwa5zZbuI82frkRTeBHlpbG/SW0Udtut8GTvg9U4vLd0df1JxKEY5WPH+JPNaoaMqfUnxR4S9wxL6uewR3PrSXoUsiIW3cKeRcSFntax1cRu50vTM6mUn5rBPFxjRCLuUYSEpq0p57YFYWW21qvJ/64ftuS38All+RbLh/QFm1mVByxyI7Oma+1fDeKUfwigMbyxI2mMAiqxABEASJTqxoCukVx9me/omWR2b/Rneg62K8XBMw4IWzLXk8GCSt6AJ5MtRUnPeu37Q3GUloJV8zQolNVGH1kxFenrjPyVMm5esQywjXtYFvpeWzVhY71FFs5MSYF3/XU0j69dxPp0SGh1v8xWFBagqwjtNh26HSC5l6d3qACJcN+zy4qqwUREd1T2GYijhPu+b3/xF98v5hsyVaF7C8+BX0vk+juDA46Z14GvdNuTrBlutHADNkC4PQbl6vbxJvL69XPVe0LhnSVz8FQG0lQ2aWXnyyNFtg0w6CZ62oz68OWXv7o+3Vy/+y4goJhJYPvDxEl6WR2IYui/lOHMGMJM65YidyLLMQqn4ZIgPmJupqer412DYiRRSDTMpZsy7vmR/CQCcQY8ISEDigKCmXb4NAWmNiiUmiS2p94Xysv9hrYotcDFwPg8GQe6KzAwK1A5VP1othWgydQbTxz0kb/dojsNHZ3unqIBD8Qbyj30GfbP8fDz8/O/f/H5f3zxxX989fSvcP+jW355za9uTq8FLwVnUNHnWwFuVv7h4kpq+UwKozgWe+N2UpzAR8r3Xp+f3Okn59PvvP/pn3783X9388mf4OZ3gY9hjw23lCuRU0gTNoCEGFRkQ+41PbdOVz9iIwtQQiQIKqeSMnVbmzwvVeoSye+Jp60QvghbcUcy2lGcHDvMZPj02vTAGEymCnfZ+WfbtpmLt5mYSX6QTN5hHOto7yTOn0Tetopg064MK+UyDjJd9niTg2qlHTv/gzSLpvzOAK9WPYxR93VqXkXqUPRPq8TYgnCSau2lAdodf8s4PshAPBXZnW6M/M44gpOLyuONpVprFQCiw9HQ9fMxTGbLhCAY/EOXzUzAJV/0+xcdHzkpZjo/MoZozRl6K3iDkhQo0PhY+KEAlvOJnjgaKhOVAE09DHQ398U1DN5Lb5eevy8qDZoMHkBu3IyaYrv9menvzvmzg7QaR8aGxjg5bH8396UDHpnzD+fAk5JF08JaDl7NRbCc1IxtxhvNzLyFeRw8mUnPsPtanxdPAghsV0Qm/XyNn2ux8afgqJQA1nqxfjo3HesP86eUUn3xQNW53rA13rDVmj1mnJkPJqLPo9H8G4kxYZ/A4gjVODkxlEO5csV4o6f7LZzO2qmpRbPgQWNWc10JlDCyQl/XBhELIl3h4tWi34Uq6BkGT5gVLzGKTHKgl7NOUKTlIv5U+zJ/r72w9KBhb9nlwwynnvTndCgUkU76TzktdTMs4PIz14vmh97Q+CWmKEAq9fGYW66c27AvloqSGab0a2OXHSo7p+RniYb2lsIIH+DeNf8xYZAMKe5sFUqfVLrKWzMNKcuQpgOVphYXv5fJV5ZLp1xkvQN/EPontHQxC4nyG9dpBAPFOIu4xQjeI7KN/fAHhkIIo5YUrrccXIhUyKnPc7sXvk1OiO2YpTuSfSiP4NCxiNOsUt9NO8j0nUKuZ8RkaZsuyJLAvKOl6MmoKSUMciG+56ZMlva9mHqj6F+yNtTa0BvJ21NmpwLM/c1AGu0PINCpPZc2JYN/ht3PzJlVjrJp7jqkj/4Mv2Lw7VvkOnhs9es4Ck4zG2ajHJ4ftSN0IB1JZAuOA8EPxK/VoZ2Bop5cjNzyi1TOyL2/dJNKXorzLSDMPRGMViHMI4z5ZOL14gTeAUnazsx8aW5TG/rgMauKSdSTe19mkLjsSNAhveUDIX2YmKd1x0aZWTCwqmtuQWa/+KkzZWGMZpu2wtOBKQ0zvsJ6JjNFk1vcb/A5a71xXdIy/hg59/FoQ3uGvhkTGa3aPJ8PR5SXz0ZLH0SfMQ4Z9x5Ercesi/0Lj+V8cje6esFGP6XeuDzT1uSZJ3U4LEWyUI2P5afXOxgbSX8OmzxlquXC/VJrj9cm/X3+4ufb4w02A9LgbXThEJ3ut0mXEnnxStjqd411Bf9I9qPNzfbVEkCW65irLrXmLSaMpIYHaCIS4XHGhr6Ifq/Fk2hvqsiV/gYXB3Ly/Hh7rBSkJ6ZrBV0eGxw734L07oqG/hKGYgzXaNu6JZGZnWpT28xES8vlp8zDykzxM6GUPgnNS2xKJ479q0O7OyCqXr3MdgN6EvkGTnz86WbCr35+socf3oqRr6h3hG3087ZG0kjzzOu2Fd0jk2MwJcEoe+LljShoX/74P9jDV+9899+AZ+IjQoATbYvLKH2v2/Vk+JQxOt0VMm/2YaFO/KCB6+3g7GwupFkPcWRZaeEQbBjRMCLSVJW2AYBsw8mecdWWhbsKYFwQRVX95j5zsXQjYCoiu2NGtT2kibfPXVzt8Oru+NKK1aaTUSyRhlQQgYR/prPOs/Fk6iALnc5BtRlFOJ1xJtrOmX3XHVSh6fmNnB6gL7E/w/4Ubz579fTvXz39/85vfnrSr57Iy01fXW9n8t70DNuzl1DoNp/UJpu/wovKtcyiifAU1ONp1yvV6wd7cs8Pz/LN6/f+4KNv/sn1B7+P08ewJ8Aj2KYQ4VbAEVJgBFW9sAkx7maRAIaZ94bSrkLYAB5m+4pWDRCQLkFq0ZGCVle+LF6LCUyAPc25IMplAlC8SAKxKKOFsqN1qrQsCIPxA+eY9yRa3uhdX/Gh6mikrceER/I6V1WcmWEec5IAvLsu0q/CnnFFtSyJJE4Ap7PBjRkoyPO8rmwT1+PdNsvwSOY6FWZX7tONAAAgAElEQVS7a7zOnESbFsXuPE425svzFCKwvTp4hoSaKoRL/dPSsd7K4LmUePcAzV1lKezUIYEf6Qqbb3RMvqyHW5Q9Z96aHRlgp5tY1uhwMFlJ7j5uoEhiZGcJEHnNS1iHIGC2R5mJv6kZNIp1kqsmveBgO8L3DUZD1QAR/Ub9HRZSGzSLwqtZbLXBccrcJCBfoYS8OUvitgpBsALHmKKR0y7WddPfOnZquXCBx7nd9L2RuzQ0JINiw9jnEbNMIs06LZC5g7yF0ecscqp8VgmpwihbZm6CjdQ6uVN3R/oTdb7VwsEyAIlQm76n+NNO/wQFp9u2tDFVePvw0U24nA9FXvO3MGoEhLQABlc/iji1YI6OC2ToQCO21xGaB4DQC4QD/ZoRUqVOusLfLQ5CSMuDNIuTAbaXPKb77ittj81voq928pN/Sl0HzzgltKPK3cs/Tr7y41u5ZcSelpEkJHqb5p2P/p/o51sXmYYxdXkJ5xuuxxw9YYQgbn8m6Aj61A+u47aOti48gbVsqY6RFMk77iRFuDhfR5IoyqWRgkKikzLEdcUSxoip8TiKWwkyNQD73j2M0rdU8QYj5T5fHE9TmJoywn62nz1NZwBUYHbOw1Peo8oLrqw+NnVENGwDkGG50lwwIzzw3FwCvr2iQ0NUpXObnHcp0uJfULLW5Iz9MfUy805y44Z0NjXcjsosqIVCoLAur6NZFhtCKowZuqwc7X6sJf0rqRGhslZN2Yy0xExtLuJbBBQa2DGczQKnxpR3clMngDT/u67RcRTRlgCs7HMezQYoJzUlgES81vzLIBYnmFa61iU2FhJWuaUs1bpHN4bKhjO0aJej4vJ36xjOjX4Yas9RugrVcolLZMTVT2l7X7jmMSxGGhq6mwgT4Alzy+vOVYb+tqd+7nSVWWVJw9xqZhWY8ULvuzmbBwXobaOKJiFetOyp7dOVONQ8wxQoUZ3O3I+KpLP73AoTgcPTAEwcfdA5jaMF8HCDpGIM+qMXWNODeuuSllOJ8oFZNlzyrdKoMfd3/TSaRl/xYvV80eyId0T/5RzUSQtDXOtKGGwb8/TnM7+x1yoGIiz41jl/Ny376gcL0gvyEFVYaF//JX0SoJi2abtHId/M4D2d/EiMeqgbtsDJv2Og/Ji4yHKicgJWvlMHEy4vGYJyK8mogwFgtEe0Ob7a4daFiCHgl+oignKEmbCidQ5FgO7HtjVIjyVcumOP5pLE4H83ooWdTx9hJFs598j1kYHMqR/HTx/G5vg+0HCTpJ5M5IAA2MNSi5MCqbGjj2+KEhy5xLxaZ9riqEhFbr48LmSHUNdUZow8r7Y+WPL3QM+ncs25xt0omV3NzM/QuhG1WSgSHumD8q+UIpumWJYuMqvzqfVSp9JWnkZzDZB+7yh2lu12djSLCdlOCa+1Vs2REyya5z97x6eKyHcb/QRJIg0z4UiminQVx5F2SNWQUpa0TZYo39LmVza3toJMIDC7lDr60oAuQgDWV5ElQaotW9BDTu5JCqJKjXYKISK2a+sbKhGQcIvb/ARA3J8R5Xw/3n5OqpYzTJL7vp9O1dsnjWbRx9fz/e//eZqwbgZXrLNUs3lk1nqmvjLaJ6XT2YdDDxUzD0JiWL88BKBsJ2Djdo3t5vr28Wnb3rx+sZ8fgF1oQjMv57rnmuEQKDAxqPBEbpU08StEdt1p+8Z948OGh6+efn6+e/P4nSe8ukYUc2hQ4cYBUsv/kqSpCsUAP6bq8C82TXx1o0aXZC62K5i9ZYRpx56mgOdHRxhTElL7MoWtfme56Taii9C9/oy7O+SqDkJS1qEsKwb9z1E5n1tfD/jOzvJgzXzWz33L3Dg69k1NI3cauLx4xbY53tCjBAV34ZlyR7wkv4Z9iYfP8ObHzz//T1//4v+5/+pv7PUPT/rzR1dfX/Ol4CXsntw58SlJOZ+Mtz2X6ttVuRDZAE9rU+XaeHPm413ff4OP7+Rbp3e/9+Fv/dl73/232zt/CPlNw3tmj8yuDEKc6G4mgED8kQjXzYKRwutN8FpcGZMlgWI5zD1yWgIehnV6SnUH3MENvyDOLEfsrdu2JVw8HJneOGRp2qVvbHfzGEIyJO8XSyJa8rNMqArZOmQdjPAQ12rY5uE80jK86niz1ZHnHGy4Sge9VH/M9n7JnzDDOMpXgxWF0VKJ4EwApsZxoYKINJwGADJ8GpE8uaCPrVx2Iq7MrrgonZ50gqUSSUPtoA5WI1XNMoWk+STmEOccgfOREtt5xtDZwISburtkkGivbolMyT7G4ZaRcfjFE3nNHB3FkTn7IEcGaUicSUkBCnEDQCMMSIYsByVfUmon3BwvKAHI88vhmUyNajY/P3hFK91iuocHLLHnoxlF50fG65Zf1M5++HOMmYQMzVasGFtbKprc6qaBnDAz9mQ+OzghX1rszb6bu/3MMT3pjRl7JxntAqjbUfMrwcOZhnCCirWpj559vjvDxbcMHmqiGKFOI0zj2KzAzCRx5POn7EtFqsxUV/4pDhm5gKpGqfCI+ECkHzNyC1fMpcPHJwQ2PaKkQvHPwJRNForJuI/g2YRwE5msnRKtezWUCJ7ZzzJtQagUT3wFrULPOxLTqT0QcAxdl3atfO9IZQBZaVSHfTlVUcscsDXz887GVqFBiOVMFtPnSeuWHGNjUlM2MdoP2ZDBLb5u9YDXSNze9V6MTcmvgyCz13NzS5GlDqse5ajGCZ3ZAC54mc3RAbVxlbMYgpeuoBWtFhMYzO12yiwKh6l7MScT2clJNwBFf5KWqWFWGnqeieshhzpgLbu5tBjMBW9AQhr6DWjFthlI9IrMTKLeGmFwoTayG7JlXcmFK7zQ5IHUQpLGKfd6rCFZke4vDV+u1p5rrkOntfuD8caSD67OYIYszBhQliozL+PxOaCNY3SFZY5XyOBFDluWiPjSloxscItraRiUHQ9FrWisoiBKGh3P42JdJTNJk1houH5wDGwR2mUh5ty+R6Rwx5YMfb6sejzjXVyQaC/3JMtyxQWPZmom0okGy0ICAIWCW0yZALwj825eZlqSg/4tK96oRLw7KkNelsxI1YrIIUcMnpwYTyB9GDd4Q6aSGZxRO5HhKT5TMC+Xy6BvSERs0VLj6V+kj6QHE8XkG6PX9B88VqeL5piLZIXH2sjiGiU7w9Qd7sGHxQ/pota8DpZ66AknVXzEOQeG7c64L41Qfs7gz+QKq1oFEELQU4n+6c2ZycK5feGRZh790t9rfZJkCK3O7iDc/ZQWW18OydjZSZO5oglkrrcwnTqmjUD6t0nHoWZjo5lXpMYnzmmSEeJsicBUTbMlosumiFhwlrOXlmjMk1hFz17RpFKGnQy+sbkLyRCtMy9HXmJe1mPlz/hy2tHKX5ZZHSwUls1KKSu/dNll//OsWHR0M95V5snxwuGfWBQGUqsmhsD3pbYgJxNdDSdxDvrHGnrfRENPFUzoT3Zy6+uVNNuLWeaakpHik37RsC+xp+zdHGyQv8QmR+e3sbNJk6QAB8IXcBMp1VTN0nMuzKZIn4GoMc2Mfh5+JharHlIUTURSJwVsNPUsx3GeHZ7P1/IKL1aTyFp69XNRUEkQZ+I19Aucf/rm1//51z/7P7eHf7jlr6/k5Yl3+35ucpgLoa/Hk9Zu7c9Ih8/nfzYFro239/beq/2D7cnv/ebv/ju+/z3gU8OHwBVxDTtZAicCeeftvzK33SKUdCgDVjIzCOUEiUqRRV/8txw+mkneudnRkTCwMEA5Tza/65+rmbE6mBCJdwOy7hF1gEjmm5k5SEozWdBrjHucJwg/X2S2bQSw7z1O7XLt9Vwd4h5Vb9C+NOHu9XLhLtJjLxVTUMEH8LU9PKO8wP2X+vqnr57+8M3XP9a7X8r51ye83PjySh6IB7V7ej+oSmooCcmANmx9CRhF6qYal0+YYDvtZzN5pHj0en/yev/k9oP/8f1P/uWjD/8Ap08gHwBPgBs1L+RKOZpmJjwVyuwiHR9h2BCZc7GTc29d/NLutblRc/c9rIsRDJDpZgjEyuw7Zka/POm4O8En1emvz53VrBLl5Oy9XM6AiHRKBGgGiCUwMzRUpPlynKLAwNPBvILk4Zzfne024i3HFrwnFM3vCQG84pu0nTi45EAhrWoGM4W0POzYB+8/su/myPGYA6neukFYEpqBqxlMsMVGCxMxNKcR6RKMmpJv5RQQf+bwyayrOzHZfXK7amdZfc1LDIaxHNRA9hZAoggbFhe56bjlJnqHGUZ9pH9831cdUlaQOc9hzFwTSvJwN7lrzq9PHKCULf/i6/u+b9sGyL7vrnNqXZMPSe77w7ZVWqMr8+n4moGCQBuVIxWjAZadCl3bZ3/jXvV0DtzXmXo4Jctf1dXjdIgx9jF0bH1utg9MBCe41TfcRdkPSqaNDmfIws0Sg3Ek6Woo3+sxq5CXw/5agtF8gRNc79q7yG7OMimhZS+gjZ4OEfM7r5CGZixN6+jfhfwW24hIcsimqH6RnvaQ1p/hAkZCAXV0QbtD3BwZWPjzQJ/kLZ/PLNcz9wIZQu/1V0SbjpBryRR2Moa/a55bAQBvbtMcxcEPJM0NVoQ0CxgWcJ5BeF8Y/luveqh37h7IDXRt4G7S+kxBTv6JCeecd8lWZRJnPqxlPxdY52bmCank59Huo4kTnOjo+0KRFP2n9JmFoDBLJsGxGgq/rIP36wzfMm0QybPT3FLDl4cQ7kBrZhq8UXklsiusZfaDCw6x7oB8YDYzU7BuuBqCicQXTBvX9FfsQCBesSpSDN9vcVoQoUP6PH2tTaTsp15NCgxPI32GygPRgEzEnE1EcgLHK9Hgzm3I4IaWl0V7IDVttOINzVn6VhldrC232wIJFYm/yW8LdyFVk79pM/Q46p20lliGIwapOXDFZ8xhnbadtrDesqlD6uSEsQAzVvSvV7RqDc5vjyV2Ky9SQGsMMzOKqOkWwX/7URlTaG2+Kf3htrB7YLpJYiAB/RiDAZXHSTW4oy1LLHv4IRHXTA0AQPXsvZ7NO6R3oodxYqh4IAQoYMPx7dLzQ1uW77R6cVpHYUq3EI7T61p4ykLvRfswCIGX7jzGQF+mr1Vykds9/NV9Wvzcifa73Bpug9+aXYeSRJ0e4OoH1l4wjr2Zo79Lz/doKC+uuMW7gfd1WBNbjTRzgCMoCzXse01EkBvi5nbG51mxie+1W7qaZNF8JEkrP2A12/K+LBM6yRtV4PQEAmq/piCgVE2KYYIYlHCOTWcmHwjWAj2OSobTOX5/Evw54xT3t/328Ml1i/6hW/aq+Iw1Jk0WZGXZrI3tP8yzhjEgrNeYyMSpfA76qn4pPTNzO2PCe8ahwSGV7i//aoyzD17tddUzRav0hRa17NwbfC4Byym+bd2YesbLukWr9S0LnxT/hH+LneC6p1LyGL+HD9Pe0aB2aekQvfknX4vzVebplr8ibbEnjl0oiqprNizlvVmvOdb9TIv8DLhJgPEjpkglaRGn1H19zW/pB5bPNk9C1H6ZmWALR73zdY5SH302I7YdcY2rwYuYN1+xp+ooT1h5iKAh9UwSR81MFadT3+uoqqd6RzZSDAJNJpusf5AKP83NkQ31xOX5XND9bhs/w57MZra4ipyAzaM/05PxVrZvQk63H22fbFfPfnF9/+of9v1XJz4/8R72AKe7GOEIekZNy0yJLWx2n6vfYMCDml3T5PRw9+rhJ3/74qPf+tW73/5T8h54F/YYuKGcoJtfNIdoIHiyXc2smLIoCPTB5Et1ALTfmWvsu+GLmAdowFQ9s7qVAjfw/PFF3xcp3o1zXZ6dSL4pqU0+bi+zXheZL3qGG+RsWOlbyVrLzM0X39c/3VnJ0FcqTA0+8TQZtmCJONPnZ65lt7NBtw2wM3gP3kFfQp/x4Zd294uXT3909/U/nl//zM5f3vDF7dWZ+hp2D9252UbTBB6rv+IyKCqeA7A7955AqsKwQU6Gm11u3pwf7fLR1bu/88mH//zJN/4Qt98FvwE8Am6wb5BToQPMMpbDprZQrF7MYTAm5xSHIA6hLFIT39awnRGjSgSrZmbD1Q79kvXniqjK340N6l4k2v4pR/cHm3duTFfeSj8U/7NqeswgzpZ7sco01iepaiKBW/mydNSPYZulw1EwHxisQBo5k/4lz2r5e9sBDT9gRqXppJCnUySOVdXBTpNT/PfQvxrXZTpVd9PtLVfrxjFlTBPL3riZvK5C91SzMc7451Qa+WHLXXCXLQ4xI9YOMF1opxFrOdA3ZNOLGrYfWHFOyQ+FJZClLUX2neBhO2YsO//kbT1i8OxDP5IshtGOJIth8+owTY1UG8E4qBSvaKWqYwKyKthYGth4hEhJaArVcFyyInpQnrlT7c72khNjMMvmBashWadDc9rRhDuHyl0asZkZTFUyZVuAx2UyFgbADAadMgX4/3XJRBPKXcZiMBgAKaew6v8cmHfm+QCzpkCid10NLo5gRkiFr+zI7cL8LetKLORwJDzVA3+Rf9I4psNClunV5+sDpcQOKgWpeoFlvWP+NuwgxxJQSqz2v5ZsGcAEp9QMgQr0/J/G9manQh7dQitHVjUnzWVKaU5P+k/Z6X1ZqJ2nx50DEvJfcICSr1Jirs8n0VS1OAoDH5TnOgcvdDwWAX+03Uhwqz+V14zOC3BywjQSto+EjlPG0wdeuJCtxZBrnJzLjO+KIIGB9YqURxxePdXyNBn9TEv8cQeL/vOfUxwm/TPMXjRMyBpC8g0twuuUjomS+facg3nMWInbkO4tzsStpmdOXggtBTj3+q0/pUIzDQEsLL0EIEniyaWLOCMFeUuHxEciibWV52Tyw7tWSW/SNVwLlodS37KJRJTT3JnZoo2S+zlL1mD57hA9i8pNH7SqiWXiz/+qVkeV02Z5gNdpCAlk5UKfeunQPDGHhOpIHiXBsCD+JV0KNqEicu5tr93JoQe9maOcFVNdMVAI+KQc/JwQAUSi053UKSkHBiPHccUCZSe6du5CfD2tD+IclWuqhM54RjWbhxw0pFkcDqX7IYEMZfk70X9gMaYt0SSBLZOYUysu8q7diwDeaKI3aO7ghQ98eIDu13VkFxtUBnQQZOqHIm+TrlwvEdm2uLkOWYAvQRjcpUDZyi6Z1KqDILDUBhPK6klYKcqEe+BPRhmlnXC/mig+pagFvjINwW55Su7gYBwV2vBj5zOVbo7Xheex+MbFmQcWnb7f5CUb5mPWJPJJlHvfa1ydzPr65TQOHx5UH5obL1zWed3W0BvJbv3emnPJ11Enl9Ytz7Nq4bPkE9SmiF9/UzEgD6MBRYyc7fCN8+LKt9vT+Xx+uBiaIuZMaKxWg1i92fpifeI+w5TTOek6X2hmxpa4CoQDezAOxKQZQoaPBlI0vBqkjLyVDUrfLkP12r0KZbXYUFYWZRi5sJ65GMZjFXWqukLAGnklTcI21c757aY+Zt62HRakMk7xS+XmBytc3gwVPfJciZfkqurpdBqZzSM3+GocFwPUReNLF0xmRtmymmrmd3+rcCffYP8K+nN98TdffPZ/nb/+r9f2xTWfb3i9cXdcd0zHoY55SkjPu/fwYQbJ+S4ar8DTvT56sPfu8I3HH33vG9/+13j3fwA+Ad5TuxZeGU4ZJkQPSl8L/B+psHLju8IwjU3FDFO6pk2K8GSl3sxX5pORzkOAjAJnFyszAbG7QxDfdYZbjp61ITRSLGvscnjjqFjGlGoQHirAkYNTkajiFh2GTiFgulQRzcwcmm6s3K5CjeGlqFGFCr2jvMH5Kew53vz8/vlPX339jw8vf4b7L0S/oj0/ba+5313JDp6hu5nJFlPPfe8zDkxdj6GJQuXKSVUgp13NeKV6e8Y7d/hYb7793sd/9O4n38PVb0A+BB/DboynXUWwQbzVI0Sgprq7dHnUpbEvgEVfD5I0qsIEXdv0VCAQTUBKEj09Eok2R0fmzXGeh5c1I+Z0dvonWwSymIyA2OJev+y8M1RqMxvA3t+tip9zB2eCL1KZQ8XPJ8OZ5imGzrfvAa3q0pNDJKK2qTSjo2CmJZ6ap5RdQ0sCQzpRISGJg2OtJDfmGTV8VVVBRBcDYXassjIVAQBPRofg+N180+EIpKHve64dXKt2BkSf01X3+kVSU28M/ClYeqBmWEvOwXvmqSEB+IlVz2/bHDmV0qaqPunp+BbND+KT/GDJt8eCZ3NFYIJcgZya/hNW6cosb2CscUKUveSQCr9mNdVpJj4ug/P5z9GlMSicBxbI0l3VGyh1qa+6Lb0D3FbkAmtPF+zJQqVJvVlR9J1w53tpcJmR7O4SnuIptRZbKsmokVc9rIdpZAW7p1h1YyA0o/aNyaU856GhsDI1QG2lzwcoNEFXsDUdxG2907ZRxq2LEhPW0ZTXaY5HEILNwuUNXBuA1CEM6iY3rvzsmeitwtrSpY0WCWQxc1laZ0pI9gm1XGmOIwet5Vm/RPlZgiCXZzIFb2PhC0avuWWxuTj8dUhregL++RDSRJteoCQyO++zgvASIZt2dtI2E4Khz2mu3MCLWbnECdKBLo4CCjzRgcdyuxidSufiKKYdGWnrwNKpaary7vCVw+pBx3ImicaAU935X8PeJBeRPOu+yQZoIUwn/8ydnVoo8PcXdaAq0oRCaas3EUze7zgqN7UX/s9c0jaxMAf9U4hLJsopJ7AVPZPqekFhn9gM8KatTH8VcK9j8kzpEOcWt7lruc6mhE6/aL538MwB8tZe+lrsaTtYJwAwfi60ZaMFMbJLFkUaNQtfLm9l7TuUpyVCZlXqvRgJtYC5h0/SiOacT+uQA4Jp/hfuZyZQMc+lDZlK/vH91aEnD2p2cvv0l/xPhU9v3nC8IasWwjqHsbJQE7AEob5SH3oU49PVOC7dJx4MKLSdXVzDUrw9aAKkRkJamWrc47FQnQjx5tdIH6wEp/nBuji373GMrMJppPdbRdbsp4yaSXkLQGDGJ1oz786M/JdZnupwu+mePMbqhq/ru78Awkd6Inqbus4Jrgg/s9ZbNJyUrH2fiNSUIyWou0n2Mk4kZve5u+SonHZsnfNFPVaEmHtXXEebsuk/4+xR+j+t35J7tdC7lnccp43n6OEra2KrJ4wqzpW1o8LPjmEc7EkNvO41+8RMZ5wP8mjpsc+i7yiRc6ZNy5CVpcgldzfS4cKHY7tH49ljGrQ2pezL1L2a95G0ZnOgg2OJYL1xodVjvMOmF0NOkZ/vLUWd2zT4M+zIkhuZfDU0ZL9uRqkzOV7RnHVBopGVK55iJyP/46/brRHH4T+gyJwkHdrev7VI/UBAzyWvFic0idHPZ2ReMp4zeoIyf88tYFF+VvqdWepsYlHPEjxemEdyo2FGWDm3I2q+5BHlz++OJnG/bgew5z0QZdnrRbKexvYzKLudt23Tfd+2bc8/mtn2/e9/X/M6iyTNknEws1y2v8bXLzO9ykTGzRpLMLTGdeMkkcdkknZlAPyffrWLwUFe5ugSoVxDrnj16NHjd83wcD6r7vQGhUTkAOA8rDBHb6l/dIkRICFU6Hnb9hPvBa/fvHr29Vef32w83V5DjPrg2RyhgDRVhpBzSBaACRtxByt5LaVI8iYWtHCO7/evKEoOsNvS341uq3NHks47PHCyWP+Wn0s0sNfsAtNJfYkO7kJi3gKWVArrIdkfs34pi4Uo8SG9UkUIoQsGBn8TaDelzhn5tRtq3hpGhQoqZRfeE3eCl+QL6hfYf4HXP3r96796+eVfvX76N3df/d22f3bav7w9Pb+SN2KvT7gnd1LJaJYL1nJKdfiCgieLC4yewTwZr3e7Uj46450H+/DV/hFufvedb/7Jx9/5tzff+GOcvgv5xOQ9sxvKjdomcqJI5qZo5sLKoh5jvxgXmpvlgfvgk1I30eswOpWPqrvHybGx4pJDRs0ahqmpJbtLpHw5kxTzZzt7Hp3yFXa+/NVHcNkcZjXktL8C8qLx6HiFJ0ODOXv8HFeyVu9tyaODmPlEUQvMjXWvZ2Zm/QEX6k7HH9LotSKXC6d9lHTIiOCFpoBBtuppiJxsmQ0zSEl0yF3ODQe17ivwGeYFDozejrW0eMJsfuL7b91VJDVn7KmZ7nGJp2Ubr1psWu7oYiYO0Rdq6cCSBUeJ5incivajWf9CumO/mPqZe53qnBd/AhHQxaknmZpfVWM6gaiw1CflgscVTWWnADgaPSfmQ4WWnhPEKCEC8HZQVcks2qZxIpmdmaJXy3SJ0MwPPRwVz94uQXlUDzMSazUSHauvTnwq+yDoMJotN8lIPp8cg4WAKHud/lJb8HXjOsCr/XPO43CIB0nbDSrrU5+4WqiKbqiLAZ25mE9FCLmDIUcd5k0nujQAyB5/sTJkqGEzM0THdo6Geht6UUNlKfxKE/P4gjWxsTW+MakFU42Xt4exX/2tpExT20xdz1BcXRWfd3+rUtrDoZIaebIQUP5V/xxiAGez7P5WtCpn2uftk+9ORgYFClsqxclzXbN6n5vp/Dl3HWRo9VUbh2/r7DX0tjc+czXfbxwaOHykbZPitItYJfgEcRTLjcXirCJ9lRq52MkOTt4ItMwKaLwXFyFX7lQpmz1scZ+EHRxrU1Lq7TnDVVJWz1P3Hcy2mGg/MGWzOaSLaUcfj/HnOlYcjcxaTmcFdDqxNQ/r+CrcE79/mWWV/F1R4ZDgiKEHSPodW5SFMqkJMsCTbSgi1EqT4ZVDDY8NtfWftb/tXBz8ln4mzbXL3cJabV/CJyeZ54r6RYlw9OdGdhjO5xWzlLD4B4O81p8Pv3vZ0PmR+5BmZjAZckG/lCOfIf2uxrx7FSyYYUw+deDcr+Pax4RonhOxmozTfGqMSUAbyeiZvoyFE4X11vCr4c6zaciz73Mg6cbgxa7NJ2HwJzxCGm4cF8QFtMdtB7tvWk8sODy86PjUXb/59lpj0C3ly/WDmU1rG3XmXKzUkXyXYrafhjjO0i8/cAPLXueJPadw3Utv6poAACAASURBVLbhNyiEREhpbJRNX532WjVqj1q/95FqA7C5j5pJbv/dEgg8x0GLc7nQJI00SyiuxhVAQ1ePfYwvLCe6Wi3aeCa/nquLQLo+iaz34O3g6oNO8Dnr2Cx0Z8xsMe1h3j46YCY1UkGt/T2LD9sra4uwIO9iSR4jS6rZ5UdkKoF4jUXVCfNWDN8fYTPPVH1Tbx+s1YHDkbapKOb7nkITDD/JODUV88cmfWBriHHMe/S60gGYOzU8YXeiekUYPBPuXU4DYWf7PPvcI5I0GteJObMFQVzuwiOvpMcwdqnxdGhLtp4HWBmJkoh6MjCMJBuMAvWO2BSLeoV/2eO4MBMHNZu3DSe0BUh9Mg7y08TvakvdOQdhXng7eMnpEBcAADhFFltFxNThNbptW8WwiDaDW+UTWk5TdFU1o4/4077vNNvHMd6cYGjgpXY96Nt3OSV/BKtdGqRLVMuyeYmdrPfG80pQ46pbnEXuoc9gX+DhJ1//4i/vnv61vvrh7fbshOfkA+3BLC5KKxqvSC4BGptpBLHtIEyUt8Z33uzv3uPjR+//wcff+V/xzu9h+xh4H3YL3piJ2kaeSJqvwrw3pTHrFbYW23NF5mA3OHQIoy+A9bdK3XvnC9LrCag6xhTFWBrqlkwE22UfyXkugN7hHnumwFnM0WKQpwmY6YNCVdQbV7RI0LaYYcLvqw4wFVAeG7f2l6mIm4520lTPp9MGuwfPwD3sa+zPsT/V5z99+fRHd69+Zne/Or/5/FpeC15eyf2GB8qZpuAZaoKIGzLdpkXnuUxLxnAuBTdAjNtuMFwrHt3p43t7X26/+/ij//mDT/45Hn0L/BB8B3ikOBk22Cmj+gXCs3jtNrm6O3v6I3nZyNsRQD55P+1OE6x9OnLjuktLoRJS3A5IVa5cZDTxi/nqkkxb6pw+fujBqnIwEZRz5iQR1cg0qKyGzY22nlbq8Pt4L+uN9SECH0QgBHYgLFDzmeGHW9d5wHlYdI3KT7aUZt+fzvIyq//g1FSOVg47kBRYldiCzDLWfu2ux0Z84nbI9QYdf5ekyHZj8RKnCdxmGarHqNUbnQHKbjmKeRLwqJNH71F/zplj6ufg5AyrmsM90K9DQDNi9wS0uSx7uiHe6yPndhxTnJF8QUzasvh86SAWqi53lfW3mmchB1V1266AqIiO6qXOnjuXpwQmuoQGL+r6xAFgLdr1KlJCURyeN0EjZXMVge7fhyECufxG/1Ufq0m32ty06TZ7ZrFwiCOSSnTApaNpjvbCkM3xrpaRS0ttwTndOMKpbdY9d6pvrFOv7aOHek4fhKRvW90QClXbZHAXYCkLlfspy5vj+PNdnbahGY6oJdJQJXrLt2jtJtTI2r+gIrnBr5YUy2Jy/bV/Fh/A1UmE7oEeJbl2C+0RstXGEYk2EZSlLWu/YoNy54zdnMsn1NyYCBqHMJtBA+A9DtD5BFOm6r21OgDe3Wy3M0maLPNf4iUUV5OMbobD/IQH5ZiRPYDwlt05xvW+PWb5J1W9L301GTj41i8pFb9gerPModD65nef4XIIoK4yWPXVRGHkjxQ/x3G/zEfEudQxwJyeu4XFA1NLY8r4VB3pHSP1Q/k5JWupwx3dNpBZY/5pl4OrpVqs7C3Lqf+LrXT2uWY7e7FkGcewSl/NpaF8XeS1W0402pAvrr10Oafi8592ahQgw52zQxlhGPHik97BhnkhBSXi4JmNlezhNQ8kAqh/ul6d49vonjZ3Ey0+nPNvLXfQzxeoZM2I2LB77/jMN5CE6TlBA/He+WqQB4Z869xmWdftFNqHBLP7qu2B87IOg3cIs7toc07pYU/iFNoOadn9p/R2Idrir0KCht1HLmMf1YDsJRfHFHkEIx9oi1UMJ4IYFRck6RLRTyRMaRmNNEO0V9IRNzlv5DZIdmbIU1Co3Zz8HCfZl1NKA1McaY7lZFLvy0gOHr5lpSrLe0n9HCs6ChkK3Q+U1T6e5slvddJnvaRunt3xoaXi09Ud2kmqnYVOh+DYOCfBrRCRxXWSpwYrYzBzN+2NLNQIFEF5g5fwhakrcvypRrZBtDzrGUu1VScf3dfiuvG6OAVSViOZavD/QO/OU4mrgQirXVxULyu6BVeHil3arWLEF4BaylHxbdAwc/wkQ+m9TZMclpk8GYFC1ZoVfm5G0y2xifoM/Tnk+nItmF5uPu90L7mYfZ83ToXm3Ouy73whjc4+PNY3hgeScfJJyYXnN51ikVmKMHzGF4EVKxmp9YpI+lFAeMJbn59IuTsiwfMXDXgHtq00uRNquTOmfYw1Vpr85rN1FKTCHO0LE0lE7ezf3b25gltOpTxx9JQyrxruQdnfJd7h6LuNPMXrY27f//6fF1MiBZgjy5v71HnrueyZmGsXJ4EAiEDYsDYQGeP0K5JF/FN64laEpgQ2yiPINeT25p2Prq5u9h3n+/td81x3lDKaw2rMOnmRVsz5RUVsIwVn4uHE84n3d6++fPblz7m/vnl0hZPBzrAHtV02B+f5Sr0yPLKDqz7KhRDZxyTbq/iTx/RBbCpAQnfNZ5rCNbI/PENQS2FKzoyvhCKLJwywpfmuAdb3Qvq3SsxqQlwB1W/VvHMEAMvNm0OTglkJoTKQHHsc4Zez8A72AvYM9hTnz/DqH199+dfPf/GfXnzxg7tnf2uvf7LpLx+fXlzx2bW82XhnuNuwG86ASd+GQyewyGYWn5SgUrbkBIAnxQm8Ml5DHp3tnTf63mv9yG5+5/GHf/Tpb/+b20//Fa7/GfCJyQdmj8Br8spMNjmZK88QPAK99pQO34Jh4bBHSO4KP3fpQMaxb17fDhAlJRRo2gw3n/5SG+74ZfiEsRflj9Ngwu5kPxSulpJZh5q+HYeTYTW+MdC7qpo0n3PuwuBMbV+svVKTnXykY9YyhDjokJIUdxV8PYMz6V8S4VyXD5+1R9a+MGz10q8TXed3E+t7spT72jHyJcR+MbzfRKmUg4EoGMIur/KgG88WN80bw8cb/bIIT+BWlFtcMdNeY+9Mt9LwAS5CEczPGsZem/giyyk39JRiUWMHvQF/PZ8OfOBKorG6NiRqcF2sR81ICbcmUU+1Fk4blC4TkH1q+j+xF2lYmJuGDOaB/iiFrT1R787p33IEumfHnP4b8w7BUc9zoFbJAkMUcvyoYDsjBg/UoemDXmW9S9bq+tzHhU+c48DRpM+K2Vgwbfaip64e0VnOfOogQpV1h7WZkUg/eDEHpTIOm+Uv2T2pMdADkQwiBgeSjN5D9dV6b+x4NH0dpIsl912ImWjwZIfzPM2Yx+JCOZuqjYp97kI2+XURZCkTX6N/zsgSdD6w+Xm6/plXjUi9N4zt7uec+5gCIusx9Oqoq7t5W8uBw2tKSobnceBSRJk/35ucm3yTk0leqqfMXKbqdZInAIgofVfQnqlRF4hedRT1nMA5zuRJMiBNFuRx7vJV1EsjbvSdDVTmMKXtShUngxZnDpB2mcWNRdspNaW9p70oBVucmbxMVkksVrFEtsje21h/ylOtod5WWVwtXU4QQcXyPVpXlCBOO1m/SRRx94LU+VmoRIsPG9Q7Yj0GKQnVr6BF40iXP6mtey+0VukclmuaI7P0ZJ4+6RG0UeG1rkF/lIxosbh1hrH3DgQDbZfyUn1XkD5VaIkD/Wfy+vIn+w+ixxrI3KknsR7nKtt6+ViNXe2q4J30vVOzFwKtucLyfE5I+jBq8VfQ0Eebj5uCSietr19tEBAaI2S/F0ISiEM8GPzgzxPAWVX68EibobI+qooAWKSqTXFC2oV+12TVOqofjy2l7rnS6QvFckKY7K0aFeHLuYroBinxi0tQMDNrnHjFoE/BGIHWq4Pa84+9d4Jep8Lcu7b2pQPtzpGgWfQJzEbxxu1ZxL/T7RmTis+rj6efLkqE/vSXVisWGnEIuxX/x+eJlJ+s5RosOdYt4KYZyIFUCxhmEihYxZmOiy7qECOlePg54XDDC2MT2JuM10ySGpJzkGkLgoVZzVkiC2xpymtWzWadum36OLFkUTUd2U31lfb3cP6mx/MZljLZxw3LMZ+BQ7yohbjPGeZaEqdZy7fcOssip5nVZKaqrMX6G8Hm89yySP3O8bHKBXKn6nesKGlmAFL6vHraTtoGz5QFCzUYL6R3VgPozTrGY0O5hCZL//9oAgqd2pvl7TWsY43BAGUXUrLIkDWJJA1J8TYDYaZajqbeKPqjJ9USbZ0iWBVCwODa589yfs/TJWiPSxopLPCjDxQS699deRsYIZuNgremfma6E2V/i6ipP5Wk7h2ziIiIBKrLz4ozUZP1+pmULHXwVgzgVA15++rCu5qdKMfIR/gGyUINOGH9SdlgdhY5E6+x/xrnX+4v/+H5539599V/3fafXcnzE98Ab1iopSVr9tbx60cMYryi3DzsN/f6ztk+kEffev83/sXtJ3+Im9+EfWB8YnhMPAJOgECHpY/qSuTIa3U20Ih+41tX2IbCYrjgrVinbjqwV1A+upOQyw13yWcaRtH5OQp4AAIpo3NnkeZz42gK4Oit834w8zNZWQi7QiIUsoykl+loOpeQTWqMUNJoZ/BsesftDvoS9gJ3n98//9mbr//b/aufPbz+Jc9PT/ZM8Oq0nYn7q5NB7wkd13f6ehH032TMM/nHE0Ah3if4+TWeHs7Adq12ddZHb/Q9u/6txx9+76Nvfg+338bpG8AT8NFuJ5HbMENK0pEtlQBwLcKq/SbxCGAP4cS2sa4DQiN0QvH4RV2QuNs9cwp5/MdkIkS8whBKf8CzNctN4h36sKWT3Z1Saxwzpz/tAmGRn49PHM8bTnCn0tIWLvs+BMr7dGxGavbT3OgpjwbFIM0P7Sg7AVcaVWjbvabq3BhJHxc9R6NInNDR+tDsiLyLhxHVsO6hFObTJvog/0RGtgy+U3m738zRNB00PIGBGNJF3tMvDAO8m4rIRMhOzZBmCsUD9YyIKHbC+zTFXwtJXWySrMOCfU0k13rz+zD23fdkT9vtdbA8P2g7TJImUcnUQHBoXqLdN+1OPqGIKUijwbDbgtrYRv669JhEyXMEAHlZRO9fkndwaTo6Rfno0jVqzlVb9n2sJzE68y6oxuAfHO0Uu6psS9gZVfG32p3s7xP7MnmgESV1M6lFN4jsH9o4ozxBZPkfYFiZKF1oCnIifJ2/VoaXGrnv+QULFxb6IT3etQ9R93KaPQ3XZi+L8z2fR4JoJoIgMwa1uG7GLxQMROfSpN+SnhU1ubwvSPBh19ByVzvoW+o6PBP0XSWRuNi05CjYKEYQ7vtecpFuuVNbRMQxtiuCj0FtR6DnntasOHywoXOaV2vHx+oUgO3zFkiUjBT/k+mBt37gHrSdNXNzrkBobAsFKxIGLlLAVs4MUgt5z+uAYDvBVHP5Fjc1s5Hml0g0/zw9kDl+BXoduVUwEEiZ0AM7ClsxPBmsXu7UwEjF4Puexang5HGLZYe4ic3h1Bs5yWJRqVc7ckp3SwSEpj4xx3CXvPiqdYRDqXVdWsOOAGU3F/S3iLTxVUVgYAM/W88neHxADSwr4uuOyDhDennL55Sp6qN38TxqjzB7sCKOmzE2tM4HeIgVt2iyGsLM3lhuf6PBUSj4sl9zx0ua4vL3OpDOpqFlFFWInkygk+Kf7DlaF/MWfnDjvOu2bYnddhns4kFq+xCBZrvxs3Kmgjr9ySgQsvWwj+l9UXXpm9Y/+YrWQi4pHG+8jC+mFipNUsK42kdgaGyzoqH6AXMzMwpDYWslbepd+25kswo6rlmuCEdah9IPzQ8D2Vq3Tvfu1Bmd/kRL56f+1+bJgbzL/T3aDv+ffVBsUu/QOfcA5VudwElnd+Y2M9tNN9lsrOVSppLmCrXq951gYU5O7nO5ZC22OEHH7k9ezWl3/8SMEULenQ8n/SfLpaKLUw5mJpkjNsbZxKJkLt+9AvRYo+46EZ05foTe1crA0okqfsiTLm1BpqLOPqqNMus9B9bOg3vHm/8EXiyjyIQEBid4c0wxU0G46DFBq4SJHOR6UDL8Txv52djUSlbGhXhtHMdJxxLbPnESGmZ0Ksz5LzmfA8MUl0qHpeqqldgCpxlp7Zk7a7tglZpM/on35jV3Q9sAma0qXiIDfb/sb8w8uKSqd4wTaek9SjaWXfncpd7fK+C0L4zqi8+z4ynb2x4N1o3djCnZzsA2VnZlnjrd5y4jY4eyR/7eclMz/1CavEWg3juGavvSaidyC74HIlud+AG5DRS5x4NJYc9y7N1cqDCY/oK666byeDXbMb0p4CxU5tAwNEdQkozeQ+tJ+PpCrbDKFKvJdKbRvNhrmUdNpSo/g2QV0E6/wUd2I1G5zoqgBLzm6YncvHd7++R0dfPm/u7h4d48PqdALbpDOB2jDtSnks102zaPtECIcBMIzqYPxMMVH662+/PDs5df/fzFs19e4e50u1GUVJiCZmqIFhvGrifYvLoovDdHahjUNFL+svQ7yB3luGE7yGKJyjngMki6DvOeF6FhJ5wbmb0DsmZJ7w5GLsY43ugbNLqulMKuHaxj45WexhKH+3GPlAEzeNhTeC4xQIVG7OCD8J58A30OeUH9Fe4/Oz//4Zsv//rZL//y1Zf/5e7rv+XdT6/OP7/m02v5+kpenOR+w73pHezs3uq2ba1q/fiNCExMy8n0BBwZfCCUKwMVm+FW5fGDvfNG33318MH59K13vvG/fPKd/+3xp3+M29/H9k3IR7DHihuRG1WG1EaKxCv8IXBJ5oWkludsLXoIeqcGWsDRwxv2rYhTTrAovs1KmkbfL+2+DG0Y9tll3Horo1jrFDCHSLidJmM3y8ZwacTm7+3kyPC2QmVElyvNLs4Y/TSLRfN/obs3xghvkoCN5ruxXv9KojlaL4+aVvK/3+rjJnaPlIcHCshqjI+PkAipqQzZrzeWo+MJzkiqynRE4u8RoEa05GkRrHXO0Fc+vqqR2BgUWyqfWtCCGo+VMotnhKP2mNtaaMFgM0dS6FgRKmCzfMbMZv+cpWIW6M6WeMvmfkUfs9BvQiK7lgBhYj2SJWO2QcvVkWLiZQCoo6I2MXN55WxYPgSoTEwfKpkov5Ayfzr+Go5XzcH30UVmVl9jkZnFAFD9yGofJ3o3KjTjJEGgP8I/aFup2far9jolK2cKZD8pf6DLA7ZWXIc0Rba790skD9lwvb9Vkk3KF25ESY7TjLIisCZhJaP9SLHEK2Y4zVoQAlEVl7ZFhVY1so7DvFR3qumd7CRSH7ISKM4nSRyQALsHNLupZ1CgHNDiNMY+ZpY9uMpsYLeTwmqm406wSmd3ycQ7OJtV5aZUaNNhyEtBfpz3ZOyvG9DNIlCyVEiekJIirUbagUVhWEvJ5I1cckVlaXA9mHf9A7F1l6e+ij1C91p1miedgQGomfrTDDSTbQP22jBLzqyEi2shPwRjibZLrwnL/FvIy6Cg/joWjrQ7TYH0XS3ZP2UhSOxfSpzj0jocxZBFopLf9nsHN1p68s52g24TZ+p+WmiwWBWAcUrJRrqfAV3vExh5DK2pEPLeU2oX3eUCCOTp4BRUn77ed53a5lK/OXCpKeAYxrAL8YhM+lv35cQQ9EFJHUiTlhdWfOEyUighVBSAkuL2gRG2LNoRIq1MtEGX5ObcF9++2etzikllbZzER76iANRCwQdvmji+bTkJvg2CjBMYbI+xNEPY+dGyv1lxkCkH39uxik+U9EbKYUckAq5AYS+zyjRN8fOgJOau1e7Y2ri0KIPxUxLq4U9z6UD4lg8ZnF8mNX1fX6/baJ8y03et41zuAXB4v8VXJQIbO6oa+ieYpOaz+GmdcwmjMAtpEu37h9YFit8qJipFU+2EhaK6u6V2OmctMIkgrR9W37v50CLRs1w8e+G5LT5nkHJYNwC0gUiV5KEsP6i1d1HcWLtW2qd2f9qX8tB8VqU9cvz2i4p/JpMjfSHNyfSrwigNPR8+bW1uMy9Sh8da6MfUQgravJmGnTW0t9y+WXuDOfTg27HG3PeIMsrIJLFjRyo+TX6zi/HLasTN7xIBiY52h+0Hznsd1vxO+D9z2Jp/+hvuH7ZMJXsYmT65R1UZ0ZQ+P4hbfbeU9iHJM5/xvYte8qkCp0wVfTB0XUZD+8gzDP2Z9gtluXotkRXJB/sljIzk3DAzs+SWtsisaZQ/LIsckX5KDLkj48TANNXz9TFJaQlKmMXslVz7i3TQrVN1LXfpaKohkfsZR3oMWzmBVAMN403/DSiv0lca6xIAkauNE5AxCVVl3hjiBSzLH9QCzKZ9QTYbLB01es52OnshdX5rMlgkKPb9AUChPAAc0BxFzRDOUTfzaVUm9fDWuYDDh299WKRdLldqwXYuuVQzhe0iStwDL2Ff2asfv3n+1y+++M/7yx/z4Zc325sNd8R+EsXAtRWqLtcYwcDehk3MDLxShcnNjpuz3T7sjx/w/u37/+yDT//F1fu/j0ffgX0Evqt2TVyDV4SoKaxQpUTWPbD+8HCIgJ1QaO4Jd6T7fZQA58URrYzin5vs+77x5JsWZMTCBMHrIMgKNeemHMbMOgZVkeiq2OVpqNhJgUDJkYwbq8t1Fsto7kGwQx6AN9hfga9w/tpefPb6xU8fXn129/Izu/8V96cbX514L/Yadn8SE+6GBzOTDAHne8NghIoRg0QVcfSj7Ew8N/B01k3t0QPefbO/y+vfePzB//ThJ3/IJ9/C1YfAO2a35KPdROQaUcZuHIHTt46xubRl1Ooi85YeVUWfpPPij0Y6QEx3uDrBsdujGBC3idVdw/A+YqVlzJkwWUuW3vjpfPjrhuKYxjJTBp7H9tdaVDDIZrysFKFQDzShiNoZAE0gUSUe6Es1a95esQxNHx9/3x+2bUP3W+mbUoGo/EBMVatvhSvT0l3euzPjJEUOUb1aWnacpHnTupkhXLe2NVGqIpg3deYIu4g4wsUTr/kt18iurwHAdlSNzm8M91tNmYq+37X6EPVXR2HMHoK1m76P4t1PLDzRqokNrnPpdlSXFD8EIjVxlIPr/Fc3z6Me6BDekPGlFFb+UE6yhMIOei8n073GLqt5JDMxacUnNhzlhhp5pJjY/ImQrR8zyyP+jcp3nnTkkeMEvUdwIZiQhn6+N9EKu4gkj80ekYFGqR0s5EX9NXbQTfUF8mUiNboXs/NnlPwpjmrKmy6dVqgQLubShyxCwAG/qNoZv+Qaya8AyC0gHlSie8iGd+mCMzpD5QNWnDNxGb4jWetuhFSJ9uAfFl+ZxSXIAgmA+aAbFn3VdCsUVUHzJq7QC2yQNLxA3D06ZoKhFiwOM2UpkYyqkwMGIyVXw9FU/b6RjDKymO+5trjOxcxMQYEjKQJNmrqxbXHw/Oj6V1gJEbFd66x7diAKnGDt/rouGRrD2Xb3qnDZlE6NBp23ClbNCtzX+5vIPtcw+9gX+qpL0hOzjNrByj/WPMOmJOc01EvMNMlKdRM8v148H9TLOgza7vv46a92dVww+qZ1qS+lmGTQvz8wqHlv+mFPDzHn4rJP/RyK3YPJaIVBMtp3uB4IvaqjYYhNHT70LcexRFsevpxMkTrhFXIx1X1kbBs5Hhw7umIB7eoPNcK6LLGoUVMqO/jWm4J8vQvRZOl/OrFIKzWcuwJfg7we1wiHnPu6LqbUaI4ZXQcKid6FRwh63/aZQDSvh46ZZFHTv7vBzxWBi31k+Ma9F9l7FHT4VE/P3+IyEpW3DiwjhFbV6UdN+Y1Gb2aM1OfJzNIhqf+ZfMJx6nCePOgTA6ETXOcHArp5L+mvRcPSPGZWaLghL1JI2NovpLHF+lMbl7FbOrcYXnj6b+n0uI+6A9kWbRm/92Wy04p4cmlF0dajxsXSpQWscYJvQ6SP8dTkwNmXPHB4RpKaWSkAhe2S7HPnetX8Hsg8pwLgcADx8LPyyZzPJPVSqvFPIqcz6MPyWHKNNY7PwbG6NqQVEDMoVChq8d80Gjj06G/NkBLt702DyJyq/9KzLf+NcfJg9FjvdR1PDnnP3OzblCfWgeLh8veKn1tL5E/p1bnLacU6YeRngMzaDyx/ieRKt2SBtGvh1Yt7U6exI2groCwbOvGwkwdMw2cwll5tXYTMrrsv3Sw9VjpNxrwXvujM9ug4k91Hi5A2urTE6jfSbE/rN3DZUctr7zrfS4F5DLhYtNnLwpNJmdYkcdZ6RWG9Fyk46sNx4/Ykju/j9G/Thbks5/ge7VGcsfAeY79ScVYGKaMeTBpO7crMj9nwu6a/x7yOYowcJ3rNT98a/OBLxANLXNzzcd+pToFUVJJEWHz+yhHl7RSD0wZOf11dS011Qh9p1g3A9hd/8f2qXmYKEhjAyawhIJWFa40OPue2FUFXzGd/3qK48j1H94eIKFDhFIXbripCmhCbgZRb8IanJ1c3Tyg3wMnU7u/vU+WpeV06q1l5w2AkzEyNwpH0JUm/SHajCc8nnq9P9yd783D37Ktff/bq+RdXeDhdE3Km3/+sZzMFFDQz9WofvCgIzh7StdimQ0OTDv66PymDxSM8rHHK8xaR6HHpX1cNiJlFKWnSOfXU4g/NDerPE3FTnuthkgg/qaNQn2GcMRQzqEEpJtyhb8jXxCvgK+ivsX+ur3/y5unfvfzVD57/6gevfv1f7PUPt/Nn1/j8Gk+vtxdXfCV4tckD7QE4o3uvaATISUlJz9e3D9FaMQHbpMiJFOMV5Fb56Mx37/WDVw8f2fVvP/nGH33y7T97/Bv/mo9/D9s3DR8QT4y3hmvhNSmmlK1TD6aRLKlKSYZ0OzNRUqq4ze1EqQT1pr+iuTO1y1Pp+9FCZxb/k1ZahFMjJ/rAtQrJqqY2AzhfLD5Tc0JwR5SyC3lHZzLMZHcUvkOgnF2AeBZNHoCBpHd+RlaPzTzgsRKIWjhJ74rlM8oDwo1AjOSC7bmirAgl+lsc2VeJPH9ydCpQXRK7NedGt2HDYln33LTax6EnI3foF2Qz1Qho3R8wLQAAIABJREFUAe4DEOyRhDEzG/WlWjhHOon0pGeuHY2utfAXpVz2cnjIuHu6TBcScx3bHKezh81LfE1pnqEtAgLm6b/mIvGqb7FNq3Qd5ZY8YrmkX1G6BT3PgvGaWaEFkaIy+3lNRZp59Bg8VWDpriUqEJGErPr0RuWZThUSsEQEi4hB4X+MU0c52nirhWvLOauypIO5MUvy8aflntOA6cUEV2SQb5tXTTc5OU+SgSlIHqvFAYHkwoHBgDwJ3m5oYEBM1drKC7K6fvF1AAHEdBzxQFwSUZhG0d+LaiKbql7uY4UZhVBgikngIOj12mi3mk8u7kRRex3fNUDnzXNsZYZJyEGbDjl+jZMoFRc0IZknfKz1gKmkIgqRhADYdWfWry0MQiBBiDghpANpUnkQEXHKaFOyPKvmYEv8TklT8GX6kWaWu4zx40qb2+YZOiv1XTsSooBINUZ4mUiB8XTRtvDpW05GmhMirZhNwN2AjhM5brKck6WBSr53u4ig+sC6GRxWkinvzlHCAEWUBvNXCKPFrcMfHXdwcEcrFSXRSm9m7cl4Xmv1B9WH4UcNNeVTRT9p6Z6lGkAcpyBdM8M4/IeSvjmOTyG8L4a+6sVe4PLGICi5mDNnbqe/xTproFO+cs4xKx9joKW4jjPkLi1Lf59klQxtaEZ/OpaqafSQnN7batEZmQh8aMbVQ0OXz1yzSs1czpjlrjX/uz31vmw052BFHFA0tGNQzwPA7jDwNPIsVI77J+OSjQCJjbb0M5j3TCQHTYo/IWXXfA6s3xPD2Nudr671+tzNMPdl7ubAJQUTomSBfhA7bI1N+ptZimRJ9O6YTs0VDXnxx5q3y22ai50hiT842MP/n9lg0Txoyz6wiZjKW5saqAkALftDrHaGk+t80q/p0yc2fYNt9pwtYUHBb3MLxJsOGWyE0ukR+IYMpOEi3Ki9WH2V0vFFEI6RUftCsuxyPUvnT1RuFz3yqtBs9OYqvTGVNgfvtQCVDawzPC7mS8Pl+K3OSyX7hbtqC9q3Nbk7qKX1OzXBiLmFzK6CwULjpa1/nIZhx+MAEHXfDQsPc9Vgc6UroQ6KlBU7ex7ALPtQ5dRLTi3k0S1U0zYZNv3YTcbJhvEis2iw40lqxGH2ml5SIBMFpUmHJvSvDaveWfuZbZifHGg4qZQxVAv0JX28z7hc6JwZGFecWBRGnDEN+4Uo5Kc/UBfTXZxPCmaABuWVoAmzJRLYJ9pynsx+uGZZPgrGORb2OPDjh9i85hNm2vH1IqZ7Mm3SH1A/0Rvg2VjmKBkuF5fVnpb+zL2bFiNOGdbba3U29A8k9B3J3ZuQpPh3PiGSoZrqaM8393uRWZHmBBjGWbTyRUn/57iOL4KrEONi3ZwJzGz78z//P2phpJRmqZ3IF1R3m2DlGf0Ws86dJm24C8MLiZ+EXuePH4md3ehS+yefSbgKFiflT8Q1rt69uv14k1vwygwPDw+UbVclZXN3P0pJHPdhee+kEI2avzOcmnrMBjtv1G07n/h6f/PF86f/ePf1z67wcrsGTruvLrxkxC/m6XtP5qDo1lX6oFIdv3MW9fMpzTCL+saIlMoBLYdGSI+iUUn+VEMCFmhcl5Mb5bG9pcrRLh46IeLz9NhI8niumxlVpZjaTnHjZLBdqMSZeE2+gjzD+Re4+9H+9d+9+eIHz37xf7/68gfn538n9z8+2S+v+dXN9lzs1cYH6j1wDqxy1JfpXJzul2dZ1A8vu4NriHbR+64hHW6zsKmdlI8e9ps7ff/F3Yd68wfvfPpnn/72//7o03/FR78PfAS+Z3YLuQFPwAaTZkgCgO4xODolqqBFAJ9HbIAqWdDna2alVc0McRCnT1VbHxmDJ6T2fTGrgKn5JVHhcVrVkjSpAng+LI78GN3qBAMWd7F5L3mJrZFhBnXfIo8OEcKs71uIICHOb24k1MrnCeMr7dhlrED3IN3JA0CfYVc7tCTFXyTt3AtAidZkYd4MHjaIhXkKK28VbDPcJLcVdVjcpWALe8xUf3BbHzSJLAfNdrqHEQtAtv+i7V4FFFIYgB4Ns5HpBI2o23ctsG4xWqpMciMFpmmtF5sU0u9o0JQ7Z4lo/0DXhO6VGECFu8dGoWH3U0qqu5lGM3UFR2QezjRImshsL2DiANp0O6qjAtajSW2QfLobQEtni6X21QM2XyOFnkrQIq3WYEkf84O3xQOkwZTFJAybQErEUllsR7QBWDIgvorVvSzTmFpuOI4+E7PMlwQ3RQrVz/1VoJUafo98nIcAleArGRDJIyEU8Y6szqqSl8AsQQgNu56dS52Xal2O84nEBNSv08qJxAr9uKMZaOG4W/Z/yRZvaVb8HDBDNolgJ/EubxmGZZQlhNYplZKsyPXD6ACkTASIyL6fNz/XL6HENO48DdfSzVV4hBTPNHqOmEHJJcIBXONWuxg3fFWfS4SOd/muYI0AElzheiMbYAIWtYlkhuSfqMqGhoE4F3kM4cfTNi8hjyQpKkqB3/7IOiqO1JUVhCAtVxxppCADD1hqOCeRuIrIeJkeM9NMQzshm8JINWzx8Yn0LlxrMPIOTl6mygyXIc9q+Pyz5yE1UzQmhOsWZ7j0A7c0RH2Nle+sJFeGJBYDw69FKmxH/DHqPQyTEkoP0eSHwl3PWcSAbAKo7ZYnH13TpMei7uKqhJPtwzU0w/fdnRyX8dQAAj/p5vKbBafQtw6EXX/CPkateisdLgLT3Qfes2FwqjUwIS3M7K1VI6hg2DyFKltYTiE0HCNQs4YUjUdyUWXflYRA4ApeXL76ZCvSXrtMuU+rCeiqfgslfygL5Y6ZRKRTPGzINF3STaPHmc9YAaPR4nrneFRHP3SGi4DSxiIbUO6zQTa37BKptEI1iqS9YEPAWP6Y60z3W2y3vC4+igp9ZC/nb5VKAmBaV3ZIkrPo5i4Ow81yRwlljwKT4CYujri0g+b7JdGVsV4OijHECdvmeVs/HTLLYEKKUVGHE3x/IxCVShgZ3CdRSaWrei6eJ8vpcifSDV/aS4t1IlwmiXpmWsP6ep64SrUBhr0IJ04ZFiI2hvDTUW71d5dcibsQwn9W7ZkQYNwhCeTJ+uRKb5UANeUm6XqGfyRxiLVT+UUsmMFAE1fFJKWdND+sYNYqNBYVHD2OmpqePZ/hiKrh71nZiCBUxJytG8v8eTm4e1aIIBNY1VlG6Og51pSACugq6qyCdy85PPEhLz7Pel15Kb6VaX/hCfUeJ94YiTMgD8MCIPbzg6dgSJqqxK6hfCGS2TDKc75l0zNzEhISR00r0hHZ2h/whtw0WMRi7nEvpWuaVY56OczbGgbRqMS32/2l9m/T/0HpRlj1P2frbTo4IPRJBmZ+RD1cSXHjDQA1JjcBzHxgtXMaG1dfmmqX3LbItblP4KkAblJZLd8+LyQsTSFCPMNfzeZ3cbg7C5lZ/AjZlLyRQuZZq8FqI6MaiWMXTqa9Lt+KW2IH3J0DpanqpwdMtthHi0jWkvPDXsRraaSYmsjGcEeNwn2vvq7MmMv9JAVMGF08Ac2oE/8/Y+/WZVmOnId9AZyTmVXVVd3N6eZoZjgkRVKU9ejlJ/87/UItr2UviTYtmfbwNte+VlVmno0IP8QFH7CzRsqH6uyT+2ADgYgvrggIBOa5T5ns5egUhoCP0xEVkb2uFU1zN87y+1t8hmPpUdsqKB2iE4alIGMymWb2PwcOlFENtSZNlyBv+GSttaEqYXcl0anlUerrtsdV3YtIBwcQp0rrrTAkJ6CS8V2HhYB8V3At7DgRTDUa+Z4aZ1nXhA0PTdFbjI+3K5q0cG1F4BWUtLAwF0rwii2TCjNlXU++WA1UolhvIg6f0X0KSVfoNEgrdcTb/J4cP5AfMAw0sY52gTyIPPSHd/effd7b3aF4frpBZIzR20Vc94evkQH+bIqdlRc9TOVoEZVmoFnraDgEz1e5XfA4bj/84Xe/evzht+32/u5e0Q60Q+wmOESGubpFSGEE7MI6yS2PCqzZ8aSMv/rQz9GENUYwwTRHmmzOdabhmrslEDJhM5UjCR6N+kjW/0r+OBMn8GnNLc6PECdAFDBvowEbIkPkAJ6aPAk+irwX+w74PZ7+2R7/4fGb//zDb/737/71Pz19/3/141+u9psHfHO17+7a+6t8FHsSu0kbZtpD1/XWqKdeMnfVsAcbRAnbxcxgrfcu0tGayhXyauDVo7591s8/6Fd4+Osvfvq/fPXL//XVV/8zXv01+k+BzyGvFVfIpbUrrEO6L6bJJV4BLmWFq1v2nEIsqU8oO6vU9tQul6tk1QA1ARCFSmseR2jU4LzoPt8EK94oF7q1NvQgp1pQReZxGg6FUM7nlemaghdsaFkNGuGQyjQiTRBQ/q3KNKpYuIJBWdGW0KlxP7J381SNu4L80HS6uEXAWp3THNJQPWhEsj4rtMKsJignhLEoFlb8bwvmiEheLpvLxjTN6ZkM01hq6iCGmybxYVvqCMwo0JD0D4OAjPj4QtVUYsIjTF3lBuQm/4Rqr/50krUkifva2rwIQtIYqhVlC9Ei1MSW3LNU4hn2zSnF9ObuVCm3ZcrFphYo7nK0ZfyZD5CZm3+dt8DPCxPSVPOXZgh4jsD8k8bo1FlpuIA887m/KY8RMHJ+iOqerJaVtY0XADQ01v0+fw+jT3lkRprBL9/BMUZr3R2k5HbreSVUDQByniX1ZgUBgwdoReYel4iYJ/SY92Z/5qwQ8aRLhnclg5XhUEzZCY8SUyvNXzKWlRNAPUnFDsV1Hg70J1S87V2CSSXDRMqRqw0qJwoTl6rqJ/s+eyo4Jl93iBtaj+VE+bEzZtATyKIbb3hdeAKgtcsw9arLQozsV+tc6lkhlKwl3VqGbolDqiI0ny8ywjKUkMyc2OjuayeJnjlLEBTnxAP3fBSRyNj73xTDd5f3MelZsFDPhy+dfSrD2xNSixnyC5xEinnxWKFivYvhbozDEYmMe3bk4pNiAAlPTSTsw4QXv9xP/VqAkAK/TINyP43wx5GN6q9P9UQI/I9JpQRFHRZYul1Rn27wjE8wIrwZjlmmMAtRBcshO08qwEWyAcItOyTcnggm0myDbjlxCUVmnnVzJ6DliUUQtYOpqhKZ4bTN3vHzwxAQ1+xq7KQ6KQs/0zBxbRWYY5mL4WrBgjMqfZDkgdRT2Sc6XdDSrd2fbNm/T8IxmRUuvC9uSoasRSDP/+p6dtDby1ZP9NZB/D+ficiej0/iUUTLYeuTtpwTB0SahpFZASmXTD9mC7+GOL+LYp5KJvmRAIiJ9yhYnbJC6FR2rfTCnFUoj8xpm0WCkxne/5onJMpiKR06H/ZcYzb7LMpUEEcmZk48d3q6rRud3BMNEtKW97bswerMGyUjyQ/+JnbCc3pTTiQvVVsEP7kxxWR+mJPh8hpJzE/dutp7YUCKFNfX88kDs2u5f6KFtyIQ6fMugVa8h1wp8bmVUV1IBSAOYGIGX9K8nTrLx+GDnDHDMoBTL6d+DI9jfk4VcOvcJuXrlAPTStzjyEzwclJBZ+A7y0SE5dSlvnA+yJY319dOadTpl0ljGayx1pqOgUSejRMkz3eiTtK2ZV2uZZHilfAZ6/LoZJpDk6qxruzixPwp+ZH3bS+vJ0CWNGNxi6lKfuAnV5j+yJNblpyZb0EelqpK5NX9QZiDwCzuzglMeU/gd+uxWR5dMjX2ocu0QGIvEGfdMgXYfEdl9qAIGxWocCeAOiQUfNiy6taI/im2VntRt9JrnShdKtM9uxM4AqBFfp30GvGPYD3OmHvBcFFTJgsnAsq+LudYwgGrHVzrQ8NII2NpmlLsX5Q9c7ZSkLovXhf7Pv3BfAvb82ybhfck2Z3Ew8F5LiQic8joQS23vpuQVi2euhh6i5OLyBos/+m9S92eI3linKdSgsqUZd5lSSamn18hZFssdX5FjSMRhRWrtgQe64vz7fPkeL+ExjXcejOxR+B7PP7z+PBfv/vNf/rw7d9d8Xs8f/NwebrIc8Mw3KC2XYNhw0Mn1QbAoudI5FTFVND7UMAuaPdorx7HneHtx+PV5fXXn33+l5//5G/kzZ/h4WvgnemdyGvY1eQi1sxPCrdmRFKdtjG8Lw+f2M/HwhnYQpMbxQDkKWzu/+L7GN0uJO+kS3+gzX49ZsiWdVm7y32Coki4OiSCOh9BzWUcUNWjd8CeIM+wR+AJ+iNu39mH390ef/3447/cHn/79P7XXb+Dvr+0x/tux/Hh2gfsELvBjtbmorwaLO79tMjeIE0Wl+boQ2yAX9YWznNX1SYXRT/s7sCbm739qF/cv/3rz77892+//Bu8+imufwJ9ZXiFdqdDyqiNG3VQzME9ECcNqd9WWGCngGN1v5oXwoD6OqVh4eHLyvxUtspHiBv6fAII+2TKRblYURFMPWHVpohlT6tIH/Xex5iSGz1E2s5L/q7qVYEJT7OjK0iJpovcfVnIq8RI0c5b5OjgibQGP8Rdn2AHkxkWb2kPt9aix2V8s5vlpWbu8on3YAouba15rxYeOY8+uZjMHTSb1IjeSQieFOpltgFg9TAyk8IrILsfWIuMwURO75sjvkc1H1QPTerjaWZoNbAfVlQvRjOV6hYHL6qh24R9jzSoJ4h+u71olep1vtfXWL8feqtLz+rQxDSjzQ2+yZN8Q2X2kVz6VcUWkFdTHTPzT/6d6B1WGFXMIyLZ03PQhrZkIatbob1vGtJM4AiXb47YDIEZSaUNmET8A7rNBDwl1cPpQyaCwwLLrBXauzzmHVokp2YpjBbIQ/xm5PTW88kKaeNzH0x1oY7eMb5HrTU/eBdfN1QvVHD3GTeCyQIk7R8y585f9SkTsZKdmlvxeW30/HoSsxCsNF2hnO+Rz78wsNQg4WqcLKa+eE634AGkYZprpB7BEuc4T89My4x3PBM2pJXIPimEB2FF4XlQUlrdFJwGz+i9Jw7wq2fSt+hZ7iLgdakj4rDJAxXvmyd86cqs0kTOn5LhZhOFmkj3jvmTvVvq4tU83ewTX1tZKYyHlv3sig9JI+SKhoec3OtzBBiJAzLM8QStXdaejyFHbXUMFli26Atc80neiCoXMTj/F/Vaa463EhEEczzp0mxo63m0E9MmKf4pua4egsVvkoJU/OB/VVRzT+K9Rj0ZqxuPh9IinB30Kd4rnKm9MD3ge10BF260n+WK4jGs1bwPZo9E6ajxWQ9y7zOWd6YDbVb8kiLPjtzsFm1mrYGx0d8+DD2LYd3IrXvMi87+H6/4SX4L+gfuASa7c1iSazN+d5ANsFhrpSkjJJB9b13KMDUISg9+CrcLuzYZ92+7XPh+5R2ybFPJLoltwbfmRqzlben84+6icOWsIftsKkaTJlgqpwqq2T4JX8wm1hXrmkVfaQFgLW2e2aPWvUu2b1lmN756kXrEqFK98CY1sgd9QeVkNcJPZku3AJkT0uBsanMfawTeR6KSv3FiPr/C1ROTXcTrSAaABuojST3KP/XeYkj/o5RdmpjgtqUbUWjRL55v+t60CTIISJWVydupNSaFc1EbPzP+jHHj5S/8mf3iY2T2fNM+kanLwjaeg4M0BU2Ge/jWOTZKSs0xk5+DpUT8YEREVQqcvLh64kDY8BNvp8eXeqTs3tLyi97RiVcBes2ntHiXSNfyzGM5lDdc4rB4M+/1mYaMf3ft7OyebPh325ilT0H6i/cUaeuyBUI+XZFzsVdTuMoGWOIbmMgw18Id3lUX8ZfFwjmKryTJGtgSfkf+DpnWJ5mdk3MWHl7s4Sqw3+SaBlF+fhvW9huNFvGp/sg1WpMLyn/JvYbHoNwwmPbY2Hi75lDah23ywvAdb+l5Avl5h8qKmcWTU/bLkiGsUFuBtwBLRDzeUuV37j2R/kW9qCTdzC4MVbMZVkYbOSHD28Dk5t/rf4t8Ue/T6t7x5YdJtvFQvdqsijrppdYqPaJqsDddrnh46Pfv/uTuzeX+ix//8Hdi//x4/O4q7y/yLGLdD4JBpc2rG8ysuhaahqr0c8MWxb1oEIMKbmrHQ7/CPl76/fPjN9/++Ktvf/1frm9+/vlXf/PZF38hb34KeQt5EHsFuRO7SrtCLoJMVIqIScsjGGa1cPNbk5JXrOhfVCrCLj1r6Pkz5WNxmVwlR8K/Ir17LNCQogjAqSLNvEbSzFoXhCJ3d1TQbrAbMGBP3X8/3sM+6tO3t8ff3z7+7vbxN0/vfz2eftf0x/v++KA/Nnu8tAPyjKF3HV1s6K0JECmyiP2jiVkT8ZKcGU6dFUBR5OKnO/0s6kXRhnWTu2e7ex532t4e+PLh87/86Z/87asv/hav/wL4HHoPfTC5IO6Clyhlj4NzHFgJYop07zyVt++Frx4IRiSdQpusm+nK+TlJihdP+Wd+YdZQVVceGS+78OBFgfpJ4TIRkeY3mBswhZHnUzxQmsOnp1SUntKXuTiZxyBY9ABuqRN/HTqrJo1yxYT+Nb2oxXBF6yHI/L3xmDlzA6ADrUtbrx2X6oyWHwba1Ah+4s7UqbpJU36rexqWqSfCRxpSpuT8XX57ywaaYd/H68KBKY4SX3sEBClwJjV+6uaRQTRDJDDRRNBNZ7A4NhR1kAC1U7xepCkTz8wzdLbcn+4DZrKXmLzYIEEp4sfz85YlbK2q4Rb6JEA14isIdyTJCURs0b+oOqoZvJm1uLxiKgcftVwFANK8izFa3RuwaBbK564azczc5Wkiw7SvEZB6i//OnkOK6uZI7C4W0hlYPvHuB6IiuUHkRxHIzwEd8yWPBdY0ggIWX/O6PgmXWzx2GQ6wmZFhUa8IhTEd5nImc8IR3Axk9tPThV1M5/rXR1Atk8vgKjU7k5hgmHIYS0SGjnISGheu5i+epjKq4Pava97y3LLyy7/He+Ft+3Ol0+TifQGFrtJCmOwEaNrHojqfL/AJXnKt2kRin6cshEazM5Psu19/pex6e4mxYWn2Aaj2wbyiLaiX3iGAJhG88CPnR4WzizhEoinOZWJu+x7zR9SnzE+S2eZo0T7CI4LaWqs2ZJY/C39SqhIZAmjUbshSQ9c8ecleRON4XrNlTV2MLnkYSnpQUrKvrvl5uphhVNTGe19CleRPB1efoW/g3CCvw59MDhlGmIbpuyRbhr5eGFu1UBdJask/FaRL9HMJF0hm4eMMUuQvc6/TAPUwymQnyb5dIHyrjdN5rS0KIUOaEDtull0cpxQ0Z+FSMdFzLWsvlyWLVF22GhWkB56LNy6wuYk665iTjfO9UpiQIwQmz50Kus1TUIUAZ6DmX4iTBYtfNwW/uDePmrrGib0uKXDiRxxqvlHMTPLEpG98ox2sCaiqSEcWqzo6GSU5UkiLMYIOPgd3YVi/F3M7rSABj8VmU0akFy9PgE07baNe8eEGQZb2GPtxbYlfLKsu84BHy++GDyUe0PHFTLUYxjzzD/GGJPPHuwq16l0cTfAHhre097lp4M8Yo0XrKLZmi9k4stCAMWee0jA/MUjrIjay2QXPjfhFskINvAThSyBMmM939lviXBlF6pFRkGnfuo7o3JR8LjB+b7buOOikUX3D8vQVXwvD5KrfmWj1eTE2UsKDr5LJW2vDDoGout3rFpph4idohvNbPs/uV19RiKpWVKu2JS0Rg6h6Y5B5Fy67ZvWzFVIUD4uIeSP8dIhm99UJdN07FVhCjOuBwb0j01JyBqgCBeZqBFq2YoDi9pK7ZdUBC9NCTk3hdv4Uorohw7J7g5FbkY8d08IJOkd8ySKwJYCpaqb0lnB87TVWxPa8eK3FI4Lpe+2ede5mS7O/AbM03vVdKRQRWUvu5ghGJWg6ooa0/lqeFDLB2SinRcufioNBxqb9uZzqKLyi6QUrmgnQPG9q4ZXHM2OYFznx/FfvddrkDCaW/KOqVd9NlPejJJP46sUlQ83MOzSJB0dyFxe1WnLF0sJkXSRkAZfdLtz+9/yzfZEkgX372obq5wVV9SRGb2Z2a/KI8S2Of3367v/87jf/29P3f3cZv76TH+7aU5ND7IBfFCVlkaBZNzOrww4zdy2QpmgifRyRiXIGMOkmd8OuKq+eny9DPrP+7s3nf/72J39+/+Vf4O5PIW/R3sHuIA86emtXoEMEuKi6DxXHGKPBJkdEPA1Jge2scNyBKXfaoSGaoDmBSD1M8hYf1Iep5WcdELKDSetOH7VotjUABQ7IDfYReMLxPewDjh/Gx2+Ox2+eP/7h6f1vxtM3enwr+l7ssdmH3p4Ft46jiTZTw5B+9dmKDZiK2BijtUu61a5iB6CYqx6VUMwHPJrZTZvJ1XB91vtne3OzL0b/+tUXf/Xl1//h+vlf4PI18BnaG9jFcAc0eKFlFEuSZW9SpVhEqnpAARyHXi6X/CSdz5QIFhyzqZ4lMvBd/NY2ununhCvh3Qga2uVyofwGMrdWp4u0xKEceJ9z8QaLjGsjAJpZDUnz9ySY80BcfAcKVxjjaNPvVcvWXmaFQSayh/AqJCSVSxRHvVEz1LSVzaxuMk3+X9L+RSZWkJsVuMrIVKL+9hZKmsPf5rIDa8NUpJPthPkMBiKwCHqj0u74TLjGqgxHeH3BMLbqospV+CZ0gJVrhQBotLn7KRFcrePWliu8hS032TeuY/KVkqGW1hLXTtpcLwX0c1bL8/NdfgshulVlx3o3MdKtNQ+aoyqJat+d5n5pUg+R6W3Nyop5WzKYDaXaTxA1YBZHE+oG7ViLp0RWB6N2fyN7cTLSTPd/PQaXTfPF99oDgvGuJL5mXlTETUuDSuvdecAi6ZDcnncZz/vNk9NkZo+b3wgcvJ2Vib51JPthal8ulzQL5pkCrjKoroJuKABe75wRBLc8o01BNA2afDsojCsGIFgs0jw+lWmiTfYrve8m19AuzSun4lZWipcxyFTdhHgBtR1ireXBWLZQ60fSmM4U3fw8sWJWBC/87AXv4r2clpnLNIeChmZmQthlKvCuPoFddZiOUPQQEf8ua3BWLvW64KZV7wS5SIk+AAAgAElEQVSVjdSYTPQDoSgQpSLM7RHXoHSm059jAfV1Iwcgp5R2CFBFYRv9Y44GwG/VnI8xtano1VFOqpos6VPFFFGLNKjO0asSohKckk9irCnYxZqq2Tt3aOAz4xVoPgs/2Ck0iakFtsq1RcZDOdssBE7fQFprQt1SMYEIZy3PdeuV1IHHZFvz6lRBt3TeNIvJkRKXNYlOEKP5LzYnSX3SngRHqnaGHFezqfGlgltFJdEuzYNgfsFU1rAv/FBDreGJxPC81Td3ISry/Hm6mm9ya+4RPQ+OKUwfofSsp+sSftNiI0+v9hSJh2uwRmwxAOYt1bXjO84AynMI9Y5s0XiETswbV0FSLCI+ndLXXCkGkuUp0YHhkLU9RVU8FX1WrHMmlKo+E0JyyearzlBmcTfxC/WS2dqlKO/aJ/R1tD5o9QxSojH11zR10j6fybNNampdRho5Tt7EycJJc65Q800vkHR7SUgjMHdN6sVJowXraq/LNkbiw1r5KHWCsDin94hqrfgZJw8yDD0DCiVBm51TLCcZnGqtcSqXuQUrlNV6cxplt/vnk7cZHonronIwBpynauJUHyh/0Fo5uP7wTk9OkE8Wor2m3Zm2cZlwZb37F+yUzI5QPnvQXrWDXhJXLEGsIhJN3oT3Osv0RLJ6LjGk1aqZ1FXW50phFU8r/PH5KCy1m9QaecfjeZfWzkqcHB9rDib8rlojC++GJM5pzK5tFtzUwc0cmaomU9bEbKm+rKGKZ4LHuPR1enkVGdxvuo8JZyDHlmh7r/Bl4VtVL5o5PbuNiMIrrDQmEqPYh+L3coxFxCAaJ1OTPExbxlWicNiHG0+WNUI7G9WymDpo1KYUIxss/LK0OYnOTcT7dVnizxCR8uNASFhByenPigyb5yNjeilTjJ/I1hPx6hkTS1J4SbaD3RhLPUJRx2dTNQsbaxZN+WFGIv6En9nz+Su7+y+cHieVwMfo8rJp8UjQEHuW/h7Hr/Hx//nwzf/x4fd/9/T+H+7w/QXvr+0J9twwINqTk/IQjb+lGbxhrUDFFCYN7dLkOsaA+z0iYwy/FUJxUbuY3d30euCzZ3kj91+/+uwX737yb1+9+wXu/wTtDfAAPAB3sAtwQbsD2lDvKuW2RfjwAHSku+6bBL8Bat+RRd6y+79hiDVgZg9OrDw/qLX3i2uvoxkgWtW1EAMOyMA4IDeMR+gj9BH2Xm/f327f3T784fb07e3x93b7fjx/1+0DxnvRD1d56u1ouEEO01vr2sziCIhHEdBUj96bRdBBgKZmvfe6qB7QliIqPWv9VIZB0EWaoh24jHF/6MOBN3L9SXv1i9df/OWbz/8t3vwSl59C3gGvzK5mvq3TLcw4w6xis2l4ldrm0sJw5ilMLxkdWErAGJpjU9wF1UUNkDqc9nEp1zFGHj8fMk1bxzu3SPgIeSib3nuaOFJi/ykXN5mhbmNfAnx0djhAxw/11MVSInGkIgsWp03gYNfaperYc6iWT+Yt2EnD1tpxHO0SPnmnrC//sFlQW7PlMF6CFyXVCJFeRjDTobW2HdcqGC1tQU47w+AQcv5BppWqZhBKsJo1/KS5ompujIZSOT/sP64U2zx0H2tEOjPOyQIVuagpzfMFTEY6D6Fs6L1Jt52xl2OGWX25zYfnbDa8wteDj2aWb2SHp4kYNJXYaqTWGpPO3Q0LsQUGa/7pIDWRVH7O5wm2ZtbFI7+j5dHOdulYlWUNTp6Pys7PkzOTqmNmuQP1ICLGoShfkWfClOlpSY2kzwvPsxTM3Gw5w+RcAYBJc4J4aSjJC+vQl8fkQ9/kSHhRplWAEhkWZ4c82MAGwt6Tl46prqzITrLVka7RWuMLxPjHMlKQmGmKESWBhjrluuGehBsm+b8h5uziVuKBjWz/fN+X03yYB0ygQBePiw1Z3J6JXc73xfMvHmGecrrI8j4BgVeXswEQHMsqxoNfeCnUBaplqGRwvRorAjNhkfzvV6O2duGZY/FSkpOb0Hen4ZtfcWfvYmaIRoRlQMuivxI5i4YR/vBUtEwFV4hX4eAkQp/ckobyMC282kIA5dCKzAP1FLDwhXTCrnB4VNHgZVM3CgSoiKhrbfJJfBnVvGUz/7BKDYCGPRhdONNa0yPWparSLhCtA3FI/V6JveLJ5E5BhoAzVASmxnlitZtLuiharzDTRiCpSxYBVLfHbaXkHNYRvMITaU2zCJSxvd4lnzhiDJRPO+m8HqZjfpsOIa+rHihnG174WWT6RKbEzNKYZAIGXxU/gAJzHnAE1PPFtfvFt2VVJvgGwRVbAjjmUDuYGC6FitlQYuqLYpKSC3hjaOn7+JkOdN5rLdJUw46SWeaTaLpFLS84yVetG0orBaDZtPfWfZlYsQVo6rtLgMzRw2erR+0jn6yqVyxQFnvRFrlbtFugaPFtsVmFHau1wsv2AzUVWUGYi0tQQcmz/J7ROyfA9tWSsKl4OmenipOZeWjA5aivx1MS5WQ9SO5fD972rPNmH5oJS0183rJCBa2CRJuiZ2agvYi3O5U2guR3x9kXqJV6/bhGP1y3kTS3ZQanSL/MXZAIrUbQ0NwfHAp4MnUAuyPGFFYNJSAj2k8Vlwb1cv4pv7PVzMb/C2ol/teEhUtMaF0bV/NKmQ3OFgKzCgA/tShet8s2MLU6iYDgwv9LAG4+nxmRJrkv0Rx+tg3hVfsgZVsCUDuaXIqdCk8SAXe72tv3ZYqFWj1Q3TpTSam8LylwFA8TTVo9XHxYYU3WQeSHOkGEJZd9McKumWyLd3mjsLH7Akmu7gFKX6Ovw/m8ZaHemRmq/VfrsGUtEaEHACqJsPzx8S+Xi42570HY43j20EYxmRuvhUQAqtapfnSpuVt0THFkAQRWM9psGaq280XOZo1C4y99KmuEMYY0E7Peb6YfpH2P8fvbd3//4x/+89O3f4+nf2r6+2t7vus3D1NmIHLWPQGMa3EBnUg3uQqaHk9eVygiXvTf2sVMpPVDm7T753EZuL/Za5O3uLx78+5nD5/99M3bf4M3P8X1c7TPgFfAA3AFrrCuIjr82gppflVlOuTBLty/KeEPMwPgFCh6mhkkbzrrrQ8d1Y8so5yxZd7Ts4nAVPVoHfDrnvVZcEAU4wn6Ae2G20eMH3D8cDx+8/jhd8fz97fHb/T2o+h7s48YH4CP3W4XOQS33m6wo8sQMdUhc+uzEcESXToqd1GcFTDaLBRJtYZsXQek3w1tJhe1683efDw+7w8/u/vsr999/bd37/4Cdz8BXkFeQx/QHgxdLRRtkDGaDU/Fk/AhJKix+/mvLf2YMtuQXGepDCpwmYZROGDmhf+YEhsBCDNTxeVy8SSBzc7Wy2HSdW5SdJs8L4I8b1jcW6qrZIREqZJ71QPuwudqS5xJZvd+KIXgTo36X42i7i0VcUlMqLUoGU/BG9FH5rCeCkBTw7TWwBFDH9m3IKsOT4aIa+U5fwQoSaFWgeOKPFVKowWsNUJNd8Ef99raxKtUGLLSc0/k0Ovm804cygYPz9AyzTm4mb2lIhvmpn8hBvdmql5UQoE/Zwk5uVv+fGutxvegnohEDXKbPXHCzk46OE1MwONDxGDniiST5r3eggFg3B9trQqcBqvG4UHjafu7cqOtS4PkrcZrRlFKIlLNx7sEkeOxSZ9878zcClU6VKkXiwzvpplF/gnTtEpXc9KHDYuTzIIDtSyn5ERZVtCM6bjGCIwDsr3rJX06nfCoiGx2oqHRmFaOpSTW+WENn/gW5Ko3+rGRKiNa8dNxdamweMFdmbgXloZNY44C1n4g4NT7NeJETmTiBKZz2kJeRTjfLq7kFFWfVVztyzDUYTSp0aqeNxkmIoURhmhSc65VsH9YQbH0jrUmk4Zy8/WWPJb8IoNBiHTdrNhNGu62UPIe23uuPhiMtfiHu84l5ltvDcmrPjASt1edwrrMNFsHFN/6e0uy6nBQqeMk/nRIagmT/txHGFo1bxZX6AzVaO9gYaVEhVQkgCViBw2dkuV8oG/2cAzdkQYAK0pMDGF3tJ031Once8/qiba6vh4SDfrEfDzdzteYOCRnAwQhh81srPgW8m8Wye90ni+q6nPocolSZeKHTX7P9nnhQ+0v1BXTONkqs1fauVvZkgJMXm0Qw9J7tPaOE7pZeRR1ecTtzLFCPOmfjDYrs2ZkqpzJlZ5LEBMM42rSjO2HfL5Qt6XuGiKyVVDCHXKJAEoZ86iWoxZMJRGSgJoK+hboSYYxp38FXrFie21rOc/p9Hr/DZGsckrcaMxpzOdmFaxPU2Hh+QU3kvJnP3GSnWsVt0RmUnLRa4VXnJao3Vn3a4YDggOzN1/ij+fvW4XbGJx5Dki8XSusI91oFl0784sbJ+QlgWtwH0DZb6rqusMicDBOfLUHd1YKT7/GInjhDZFQ+rR+GEtzC/Sl8TUPOs/etaXIaP5T729zYGnlYCvrZdi8AKrOPkbGYmhqg+X8UO3FSgEKxi38A6akVKQ1rLhlzAoCFo/VCPGRe+55aqemNMb0KWIa2ee33u4pXq4a7iZmpph9qFd/ZO4Ir51rk8s+L9ou9h75PjwCFfhmDCRSF+Ixh3L6uO6KzyrlyK14fkF4rdK5gAs+MxTr8h6LxBu1ZRtuxCvEEFIc1xVYtphG+nFZ2DFZxfzasazoFESinfkkKz1bRU19u92Xr2pEoipVfZ5sy/QpppCyFBhGk0vZV/5MnRI767jiXkkbqUUbDT8BOU88uGc92AbLBFWtyMs7BpVJ+Whj3OrQt8/BY4m1igTIJY7Bp7tK6os+bueM4fYGROQiIsdx1B8anVyQVelK2sqttbp4kQga/56M6TT/5s/qAxNu1mNnAZvSvsZN4HcZD4umfmhoqnpnkI4HXF5fv/jsy89+dnz5Fx9++18+fP/fnm6/G/p9tw+9PwkOwXHpgjhOhSgFyT2WJsMh9bhJu4jH0AUi1gUQM7sJDCpdAP34ql2lXW/6w2Hf3G7Xpz/86v3v7n9//bzd/eT+7U/vX339+u2fXl79CS6fQV5B7ps8tH6BNZErrEOBdmcGaRe/jV5aF0TbXe+MJk0ayPj2Rsg9Tu701oHhB9hV0Zr35fEk5OEuOOyAyKUrbMAOQJscsAF7wvEkXfH8HuMR4/3t8bvnxz8cT9+N2/fH87cYP47nHzo+Qp+6Pd5dVMdja8elqY7nS1OzYaYCFRgMfeuG06A6kFoEIibDW0FJXrYAUy/7uuDOTKVdREQH0K6Q6yFQvX8ed8PeaPvs/u0vv/r8b159+e/w8Ge4fIX2OeRBrcN663emEnZm9fvrWaG2goKZgbOa8EleSq5U0XtCHuUEIhgUqCfHcfR+nZzv+iWPVbrUqKqZXi4XVQHMz4xL/hhfRDslSIrPRdpxHL3PikWKrtY9fWCwk6r1aKJmUOtdkD16HMhqKLc59FR3OfVc/rVwEDMYF08WXKoddPWQ84B4Q6jWJNelItLQDh3iLVpbM0CpdNqHrbqSbXWzkONUkV3uR4yw5J2GX5CKXTGYREPABZSaXGDI1un+ZHyxZW+aypXxzCdVYVI3n869s/PMncyMojasGrrVkw5QqmqYyv5yuYwxJGphDhFBBLW1tSanjpPul1cP3PnGJeM3s3bB/xoGSq2dnw++9c0OkkLoeHvxczkqZuaXu5pZNaMpfkumWpRFfsJqfpop6Y8NWBgivNcigqloB0ucucnn96GKWKjzyR7plrhmjN46rKfWfSxpig5KPkJxSN75yOb+svANE2jjrDhNRCT5XPVwQFuFOvbrcrlYvnHHvQVt5oc8mRdufaXOsEWishBiStEDDsztBU051MJvvXcT9brPGtx/Cn+KeZwPG/d+pR8LY/rovRtRL9cVbStosbJ9nW0hUPY4eibmtQy+JzyNoG+OJ2kUirhaljTWObThwU1fMu8LarvHmMmMMpSQsSczkx7BRzcMNM++uCTWhubqJjvlL7FS3tZFVAGXGuaHXGOcOhQ37tfBkTV6na76JZGRmmHqstB9QHVI15pzklR8HW0etakeaoteY35IloYVHeDpFgqCT12jiYq7RJS81HKWV/t3481RLV6snrdjz8IZ/5IToXRx8UZO20O3zhVWrpZmP7sEsdmlVDJUykHb0oM1bQ46jIjSQrMvXkkZAFMDoZkHT82s4g6tlcc1X+c44Jsd+ytuKqJ22SLEtvlv0yNo1RyJ+MfDYuIJfpsoWls5XRVJ7UNdRN33IQyfNp6/qPcr4szsJw9LxsMYrV1Kn9bb418ZkAyIm1LAGhlP0eTkmLmZqdnlcqlqIMtqDyJCpXszmAl4l90mLkQLf4qIxhVwBvScoesjK8hNuGLOCRomR4vk/qqCq4yNusulA48as/a0ZLyIv2EFMtjKysLM8n7nPY2XmzLHWTlnE7fanUkfXTsbiogx5iejrvTnXEI9ELNqrVm1KS1OTpyvYZ0sSbS5lno164gyiip0Qrw9bTam5yr185O0ByTNDB0zcN/OX0n+4fWyhKJ+Yv4UhqCXximxtN94vXwRKAAcx1GOks9WbTbMmfuS1FYPCjdhnWXhdOwLIbkIvCo36izgNiZv17ecG11Sc93F+cnnEAmjZXoQqy/pDcGAtH/ii+J3Iue4fri7Scs0iZx8IqTK2zautIOe7A3VBc0Kf5blO1qqlS2ak0Sal0ctXCTb5tOqa3/P9A9V6V6AlGPYcNqvbUXn9nfMfmZafCJSd+ZMfWdu/18uZQYA0fMR1U8zryTwr4yxUM8M1V2RmdxIn9o8fzxBoP6tHypJWcaxOGqvKTIMknPf66h1xvHCxKrPKY8+YwVG7p5/XrJWsxKZ+ULJwHRZ+K213ptPAIw8OuFLovnAkiEoK24jXXl2qhr+TM57Cefz79u/TFyS8P2XTfyYt7D+WNoQ3PtJqA/ONn79yyqqqqUMw+zoTaG31gfkEc+/w+Ovn97/t4/f/v3jD/8Nt3/p9v0Fj9f2LBhiN4Hl6yxHzk2SRll3dfMpLpMdQDMdaD2OYw9A0NW6XC5md2rN5OF59EOvh93dXd9e7r/o91/ev/rJw2c/uzx8ictb3L/zK8Ihd8AFuAMuatbkHohTtA6FKinfYaKptEhWtLr1wL0LaXAzXVTEbKg0g4hHJGEDGMABfcT4AP2I24843h9P3x/Hj7fHb26P39n4wY4Pt+fvRd93OcSegadLM9Pn3kzsJhgi1sVUb4jKj2R6ZEmR32OeN/NaXCrduOYofKehrWfLXi+itobebwdMLmpd5eE47p7xzu5+/vrdX7754t89/Mlf4foV8CbqUuXVMSAirV89rKBjv9GlpKD4yvtCekoDcVzR74m+Atiyu1jBkSqSutnwin2ROErpAQ4+xkUwO/2BbeQMqMWB03NTBZpPZGJF8iY7M0d2zmwUirFEJ5/PDOqWea45UPCx9MR8vqpLgLr92XlgOkJKdaNbKNPM6rbxDXnMBpo4DStTJCJwI5jwZ+mHSBV/wMk5oSpCpL637IC5hWUnqkQWLpChjjtxNZZFhYtbDCoifHOrKnrf+cf3Z/JkhvL9f3xfaI0wMz8FP4FoTyDNQ8p1LKs+58oUxuQN59mZFylbTQuTV10QlSw282lLA6A2b3WcFW2Voy5+Y5qDVCOrCVlvy+UqkkZ3UvmYJSMe5rYMZLD+AnSM0XpWSq6uNUL7LK0YUqaU9qisKwFVzzmvrpUIO/39X0e8rb/V6flZMcR2AEiWcwcHVs1bq2YakvZElSb7Fw8/T5D93cxsVpCZpYU0K0TqKBwB7WSqFdNc+px2CtFoYEJVWiv+sAENCrEJ70WblU3guU1opRtskVVySPyfFRnpVnK/S1C9T/aZXbqJOeb4/H2cgje1WZzHPQGBKXds2+SujXxvmbx7Q4lE4HmgOH1eFhlFW2585goRxvDCz8LAwv9VAGUbv/An/zorInmPFgQmN1v2jJExX01mWg801ekBs+hBxre4ynJSgeuFrZg8PgnCGPPDXIs3pvAbdVM3IXE+qhLc0CcN7lMd5kfOTbzDF8YI52SO44njCCZRwKKaLNWYsyI++xSvVRiBD6VSK4wFxGkqx5a0JbY4jm27o3q0nMz5XZJRDA4VBc+kHidmVlRfyOy3NRmDDv+uFXBg88DlC6FnW/XTRFZ08vyFDkrX55umI6B4gVeTP51VIqAss0j/U9VG6arUCfjsj+Y8ViMvFUPxYV9n4qeOog60OGHTC17JdehtRlLyODmDySSmV/7SDdG0nKkpaq9L19cbi/9b9gEsvS+9ZVXs0nVORLxn3zzNo8a3LYNwY2RbLcIf3yO01gRiqmGr0/gad68pIoVs3Ie06LDkVhNnlsTkqeKYef5Mz/q9Pildv8eGskWDE1wR+q6kr+gQbMcIv7YIKM4hdZDXTIGfWWzpehfHUCpMNnk1arEVQjuI7pqXt3X74WGdbm1vMILiK672Wimw2IFG7kZRw9mGK62cACM6nAIT1rKbObxbaxF80ftFpVoKM/DEgbANpv+yTXXzMfmH+bC6dW/7wtNg7gqqkaSsJJ32YeGSmXGbHYdOsyVTOF9H3BXvbZn7MKv+9Y1ugQfmTd+gggzGQ8k/s52ZD0/b2CKbFP6XUP90M/PmMLnQwn/k/RzqO1J8VXY108fMAk8k15RrDznKxiyWlm2UYuR8NNtAgdBe2qXUH/vvzHtGHVfPPlSFa32/gKrlZ2SYVflBZADACHmcjUqiszNZRxzlCI4NnWI8Z7dhal26oAFTbAYoy0baONx/L0SdSjbrdmXpRJRedjT0UEZOrD/CXXg4iHCeBOdFfSpsH2whSJBw1l6CaoWKd0vmy6y0adAv9x/VPPl5x4hiu1APzURgNmDWYWqH4EnkA8bv8Pyrj9/83++//3v9+E/69NsL3jf7cGm3ixzQZ2DuwGLKWNTjtGykxf3OopNy9k0oMg6T3i+CPrQpulpvcn+MdsMrxSuTt6O97nfvrvdfor++f/PF9f7d5f6zdnl1uX8L8W6VV7QOa+gXDIN0CGDzpkJ04DD0hqEom8MUYtmAYQAKHRg3yAGY3R51PN2ORz0+6vHhuP1w+/AHs4/6+P0Y7y/ybPpR9ONFbsDjBYfIreEQMdjRGgwDHqFvZkPLMlu4yklkJriambS50b1dj2MevA2GXUJIomiGfmg3ezjs7rC7oa/k/svL/Veff/U392//Cp/9OdpXkHfAa8W9oAGXuLDFd89YzKQgqZyoCayedcyTXml7FeRJGTRch4JIR4xKySqif2KstGffnOXAyNH71dbbD1h2UMqVAosc1Evhmkce2NHKh2d4yFYzl6Wy5KXo4whQBgS7wZUHqzErkVDUKP0bp1o8WTdhYUIh/8nhCVkKTu6oVwfX2rPWwOeQa3HnDRmgDHUrHrQyAm4tk6UKkItudTy8uHFpapEXzrAX0XvPfl7L5TC9d9ND5zKldr+CtkWEoqFDuWr0rCweKEI5X7HxTe0RKrAY3FJBbaNmyZu77uhd4+tat0ucNnnSnedSISfHfgnA1TjJjVJKoQI03jewZXXJydsUGkTqeGMqPCnndkOeMoL9aTPT7NC6qR73PF1Jj6Q2KaaDj47yxMxM9bhcLkmNMDsul4uZHcfR2sV1WWlVDr4U/VN3SPa90o3mFWxtdKitVkpL1uKoeqASAyRxR8l14UMiXjrhravq1ucUM3DGx8/3Y+/lhBSf56Ks3pjXVsyrUfziDv+k8ETi8rRCxfJmd944ceweCHYDd9jBslC6IOwN5woKLoMsDVB/MddraL1GLjOrtWaqMzWdwVbv7k2O3MRnPqhY+7YGU5YTLZuEgsKIXq9cBIlj3bYkxnrvY9yQYZH0M6YeWTVIFlxQHIfcgIUd89hj5wAray7eL5yM+5JHoRCbke+3Gq/B7R5MzyTTKO5K4kxX2SIPyq1a1PvBsR6c68lj+H5Mid7e5h55anzBKNcyYpYdcqO9xgxGx65lRtTHkTwfQKze02IJx6y1urWZk6ZT7ioEOefjz1NCjpN2zFTLzqpJxxgDTTyYUnSrkbfUKZBHfQeIez2UL2bVjF8LM9l+Tnzw6S0B+lQg3i9spg97n1VmtIrlYo2WiSulSzDqX+Y95vN8r50TcoVvxLFTNqt+ULPDXYZTl9LUcnoJHjvIf3G+GmutX83ZY3hue3iLldgR09aa2zZFlslv1lrvaaXPcxt8zZTrx7zFVTZEYv4vTJO0f8S8YIf7tLoYqfhBKkAVXZpiMA4gcUb1GKZdLsRv5DDzAVWgjgF6vTYc4qLdzRRitvPXvR70dh/Z95J1Cl00QQcqi6osQbLaJ7VfrUWf/XQRZxKFJWibW8F+8c9c0pIE1dZaEzmOo1XBXeoUUhDCz5cOqpUqXfko4jewh48v6JWuq3UVU23jl15wlmbKb/qrLGEJU0qBVokZRo/839ZmElpV1XsKi00Lp8b33mVCXhiZQHGXQGmHdU+FbTzJMK7/ofRIrSjH5LCXER046GzOCSJL32pWcAU+Jb/FIfUu5mq2LctWtIg/QI/Re4cXfGanzpptEOoFxIigWG9NjSXUkpJLYqk0MqesZPomCx+W3AX9JaOGbgMjw4XE/1iLSKSCmBit9+MI+7+9VP7i9OlysSxAYVkb43a5XDL07D+tZmt52ePkmaRD7909hbMGSSheOpwSuk7buxIkl8slun9GjSZ7B3wZjrTWdNxai9sy8jbzyRW1asvoGadyBWit3Y6j1cmtGrr4lgzOcttVNaLCeVIehH6TYqcwvaXuTp7MUzXpfZhVM5BRTSYtbyJBueEJEGDlzW+SWUfzyR+WzE1E+ZlaRnEzTkj6YlUXTtH6er7EuJgyxsTovekxRESaQZ9F1Oy92A82vrXbv3789r8+/fD3x4d/xPPvmn7X8LHLU7chYi0DUiJxUbH5OQiYhf8zCnwmm3oD7yYiMm6HO/zDFGhxylhE0IEG6YcK5MFwUbsO7dquY3S0V5euthkAACAASURBVOivpL1Cf7hcX/fLm8v14e7u9ZB26ffS7lrrJtL7dW4ZLGo64+jTMKgdN9Nn6IAN1UPtpsfNxpPaDXbT40nHk47HhgPjUXATPDcMs8dLM5FhemsdggNjCLTBXTs3x71bxAgcVK2Wz6X84OaL1yHqxcyrOLP7T96DjAoqVT1juygM1m9Dht2pvD7snfYvLw8/e3j3l6/f/eX1zc/x8DXwFriHvIJdTS/oF0QL8Bma9DZ2fF0DC5WxWC6dyxY1Uzu7HQKV2X1jcrVja/b0Idc3Rt4rxcysNYDyVC6JZuZhDiev/25k3Mt07UpOG+dh4g4gf8zlNyKM69XGq7mWv0+RzAOhS5JgqtusJBpjSBwT9tBYjbYXOJSRt4YejOQ6muxKb8fxPK1zhLnvVC18qOWUwcHVW1jc4Omo8zx9X+rw2hgjGtnQNVOFLZKVXI4q/ooMtQi/NxSbRFUpJ28qgDhnTn0hcxCuZH+hT1DN3xXh4Yon7lyGmXFVqWaNOSunmkCGif2tjrRj7i8agOM4eu8V/K35TE0zjZsF1YWCrVIHPWJus6ckIv7le3GjSh+qnK1eY62NzEUAxgEpNjfXTP4LlS/n/S3Kb47N9mRK4qz0X/Xj8q5tH2dVPvFny9B5/El9MlpyV/wzDSPf/czltqxU9YtiPLzuMlhzLvrn1SV0wQ5RIKe9p0/GcKXQaUV7sG+DF+bYRMg8oB28xE8uOFOz2vCzSJqmzOQ9rLYHj1P4uf3pj+7LDGiGasgrg4qSYaVwBSVRLCaTrDrnFu0vrPifjbm1wmivR7aoSo4Ko+m2kQOfNbmz6pPxB6ypM8vdsn9ZBZeLGxmvaiZVRSiUo1ppLq2J6twXnsOmkT+1a5sRDEKVuSk0Pu0d8+FSCQUAGl4cYxTJ2pEOT5LI5yPq9UQbhrCcbpZDMrCMMZxojS7fwJTrsM0bXYfiUye3fIbLHY23hEeb931z5SxVuyz7KzzzNMCMeqUVbZeApuRw3D3Nwj2beMj4WVzEO1JzS+ZxO+GCE/bWRm+4zSPzu7bwHFb/ZeItVUJV4INzOcxdzJOMaWwBbvhjNq8brRMVyITB7PPokWuJywoKIf2XLYCV8z8YNwL6sutfXSZWq2M61GxPntTcU8/Tc9Bqk5HN1Wf+zw8CT5w/hWp8apv8l2HTfWB7g+cWRqM1aRh0aVIFEWp12y7QXkwHOCaoh9sYhRV8OQZOOMP8tp3/Ld6u+Z/47Sg7pL6ycTIzG59esvQ1yB6bEpE5e9cIMzzBIQah8MHqNSxBvZxJTIcCPctNMizFmpXUW4iEk+6JimNbOJOU++n78+x31CV1rLm2GEW9t/bURt6+Mk0aIUzYK4JXHRTJSKsSbAPycrAcbbz4XaMwzVIwkXqnZXUeg0b9bPvrnyTanwOg7knNN/JOfUpmN36rF/E+1hpFxAb85iL/nG1skeopjNJrVRQyXxH7wKE67b0HPXXn/1rvec719sKTbSZ+Edx2QVD9pIvNiWqfzwz2rfRpZlr24UkrzSPSGQ2Yp3/Yg0P4fWVXCKeFmD911p1lb3ozQV9vbJ9JMsmrSEDmQWvlO8/kYvLJ9E38ZKeQdl5lJPiwbMuoWg1rtsKgVcy06Gv6ZBbpGxfGqrXWDl2S2fXG4gdhvGhZwyKznnNR0ptEnXXn9jxNa8+lMCucBCZMczPjzACD6eYI1SKP41kkbwtqRFyfC4aIQW6mH5p9j+d/xe1fnn78h/ff/cPx4Z/t+H0bP3R93/AEObpog4mN2DzpYtZg0nw7HcRtEldUtJlE9ZYNeHcXEfFd6JdISZlFRSHkOg6TywXWIFdVgTwMFcP1pheTO7Uu7Wrah4i1q+AqInG/oQmqU5tXC0bFhBq0wQy3pgMwsSFipjdABUcXFRwNw3BrooLj0hTma/FVqDVrMwS+HANxboaoZxKQ9WjMAFF94EaY39DjxkoT+GnK1qFW1zmpwAyGy2GXw64qD4c+SP+833/9+t0v37z7t/LwM7z+OS5fwT5TvW/twdBU0eSCDCcBccResw7IzBgWa4YOT5XHXmt1F/ePBWQX2vXHebX3LtY06+ASRiP8ytxOoruAC0uWUM6TjWb6fVbP1TEHM/NMnS8gMlQx+P6uMn0oPywn+VoUtsyAlx+j8CWSrbxc4DBlEyuAnJEB5RwmCCIU5wVqrXWl3ABOecjNwC2Y8930DK3yTcqnqjQrN29WMi4KSdKEatWdJAN2qovybq0Ni6baG2qx8RHjq5mgqg9qtHyFbgq1+K3NYn4PhQTugRyhpOELhtSyujD3ORQ4g4Mh+B6WbZbKaXMa9wpl3tOwImKeUnRLuVgqPS2N7DU4S7+7vJsfvjtXBRrzyTYmTxvp/5A0iZD6s8giYBt/oz/xDzxYzMFQpIFyuVSj6yWQgToIOWsMhzsete+c0lPV5rVmC1fMcAPRv63vWqpg/PlypOvgiX/uH9LBavO2ibTjsV8lR0WcotUUk5T3iKhCpCphzVqrx+a1OZWRZj5kqRcREW9IN0dmHkBq50JONq/LYWP+2eR9CYzOE1pSTq9l9psvKOAKKahU9DkQBmrZ2F4kmt/VhUJx1BFw38yvL6O5NRF4spBrFupiCjf9zawtl7YtYRQO0FhWsXmFaQU0ZeJ/YNdWQ7TRzVJ1ttaSH2b2iHhmqSZjGZQ1yLgpCx5hlbglXLKFjZDhCebnyORSb1PGWK4W9O+GDm0W2eXVgWS9wOvl5FlbzhjNivtEZjpE9lKGwF6yq7OCmz6vQHlPHUqB9UOjBYcPTohH+hdTA7Lc5Ru1qlC3IIiq4nSLcbHctncS1x9FVTvj0vZ8aa6idlXTMGf6885FWzfJ8zMeLJ7MTxXBvo8aXS/KrF3st22XbamtE11arcXbs44J4Re05maa631Apc8j8PWKLalAOzVPz/j/qmrryOs0zwHEPcG2LUSy+i/HtPodBOkhC5gR8zMOIHGyrRe21NspFBVhhTjOYjPRm3GEWe5XOtGxFxlM761rhirKdcUJPYpiMr3xyduOWn41fDZ8mCHm4iVZL489i3bqoP0o4TlItO3sdoB6ky9exYaQJcUt7mBorN9ztFgRXS8RAZftMGYlhos+WxDz/MvGVzka6wWppvNm0ntTXWQTWTSQs5VtvdXy4kV+jgWGDzgT1XUayU8MiEi2Z2FLFYXzIA9lCXT68yMqvgsx+PSYUe8/I7uaq1/9i9X+i3dnowbWYM3585p50bnWxQzJuq+Ya0OS+heVz5gHcoMfovfhqQLRVx3tvOJCrRmrEZmzWk6aEuZUcPNFLjr/AgpPs4euWY/fW/dqZQ5Qsr2dvzi/cewem9QUyd0O57+S4TQY/+uZzT8lLRPVu/UMe/dxwmaJmg6/1VpkVoX7/DH10bRVWuNkNmPIgUxmrD5L+dezOt5ljY1kkSCAl6YJutqBIOam1mXbL5FFIVayAWmT8G3grOvrKwBmafomD7UfjWofCtS2iDuA7ZNSLYwmWPKZm6Jd8sl1nJDnWiOXDpv0S0eUrfZ8Zagu31lpAG6wZ+AR9j1ufzje/8vt4z+Ox398fv//jY+/Ef1G7IeOJw/k9bgZx8y8stJaa1bnFDQ0hGRAKoNlU52IttaaNaU1ouYNNI1Ru6IBzdAAUTQzEVxNYHBN70GHsF8LbUGN0vyArUA7/JcodkBwtvoSJGMQDWqm4kENdIiKxdGnuDJMmmFAzRMpsZXRu8BrcXXCjYS10XrulMwyOpdPEwyTjobeVFUHFKJ2PeTVkM9Uvri8/vnd61/ev/3z+9e/kLs/xd0XkDfAPXAHu5pczMTCb3Qizh5zpSC551cBBLIaYlAdBFlgixtQPFnKIJW6mKEOiRR7VyADBUBwbxCJ1VU0vgQLGKBbHi627HXo3y2WJrafucfkojQsEqBpznMcHqrey/WhJbmrYKKoodR30g9w+Sd5QMbhBgB6d6HoHhysPSLd0LxfZwAWIUzNeatUtexRUiiUGGXBYPT5hg9lNDCkmtm8ddqsjDPfI5vVBNMgQLoQvsZSPIeOS492yz42078UBjlyjgnxjGIehduqwqPqbcxsf2XqzCQxc1wul1LApZBU4Rnpok/tNR8hYQWDVdGWaBedm1z8Vi7MoMDE85JBM4vLOshkL2Na9oCOJKCh6I9UxhVcLrZM43XPWJbbj1TMFSTd9E7RoVGFgq3hg+IrAJ51LCrV/MvVJ0yItZS8rPOZ1QeboUb/zkqK7ZSA80zJ/tpvdDmdUfOsSk/SqouhgzLuKYAS3w1B5CDOEvS0Wf10+P5eLhceh58PwzHP2PkIBcKggzaeS2ertGTZ569xpnjxGLc9rbdvSLjxM1zzZouYTV9Y3vnriqVk2Z8pq6vkeup2oEKrCmsNYrABaVY6q9C1xix8C1KMWWNLDGald2g+7HJY3sMzZxKnOujsWNGhReZ1PlB8kkze0mkcxSd1mKiCgKttJoBG8CWa34uZeSC17lDWPKrG1lGNX8hPR5Ykg8JzvXXEu+hT+1s4Nky7ND/+xlHjkmgz607PBTc4q+8+/EEtMkbRtuS9+KEYsuSx9gtA5KUiibXc7+R6nNdYNGcHY5GvUVdLTTkioVDGE8kfLMHHCGjWe88yRfolJDcrjBZ8Lr3ZMmzNcsrz8VQEHRi3Mz/zek94PiP11fqjao7qT75kDi7UTLhHGOsFTxp1Ybm4VfBC1oxj/a8fZ8tjubyK6KldqMW+VZF6xVVZxPnU2zcxnNB1Joq26wimPlrD08ITAMCONNsnPqDbJ5z4ZLtrmF5az3uHF/3okc08DzQY38Zwo8uY/kVPtmfSttS6Mqjos82n9KOs/mbKxdQ1WyITM8g7P9/6YzLdOGxUG1G4erb9/LscRar1rj4F49jsE822aCV6a/vqfI/b1cwtPa/AXfeXCTiTRol4kzdqRbXqEi4exzLcw/bJFnpg+si8N2Lhw5r5Jl+b3ln794UdcppVHBk+23jEY0JTRfFz7qwrESsc2CZGWz97sq/8o5J6nMdxpBo20W/lFj8cM/VF+aFn/Vu2GUsECG852M2+SW1IQorwWkJvpuSSnpptPUsftWxvUvxJqGIiUs2yWFhqkqxPOTGcum/GGZkPMwA3oZK9SLa3Le0ltzeKPikvjAms8Sf+tMx2T3s7CkHYJme/nvuqx2w3aa2F1y+rp9NTXGI0tq8y+bog56ZNQAV/aafN57cukHW0PDz6pT2XsjiDLNsyXVjXbJPBvLonxqy9OI6Z+KwRpgXuGYZi0HbKb2+v2X5KyPnJ7fntmfxZ8lr1dSboSugljk78zRm8pUPHFHtqsGqiWR5osCfII/R7HL/H8evj/a9uP/7q+cM/2fF7ff49xo+iH7scXYaZNvGCSreSzcwMIzoN0aEV84ujkhUAiDYA1s5Vcurtpc0MlnouW1hGsSEg0qxNSysp1czi6DQsekxUGynA764iUkCkOimrBfElasH8CjIPO3o811TciBeDYTRIhqIcdXoxaO6j3xzqVZzwMQFUxY0LG6QPQE10NMVVcVXcD3vV7r7E9fPXb39+9+rn18/+DK9+gctXwBdqD629NrkAzX2t1jJvQ0a8BUmF5rNcO+XUrodsvfti1TFTj5LxwcEUybjbgumgTGY4xlHrOjM53Ch2y26RYjCa0tIbq56pWSGNjzwydlwul+3ylppbOsPhM3C2hOWlPhERT1V5HpLcrbmukV1gzOpuSZZrTkJYOfCsQRXWW5dURTIPYc0jY5ahtArCqs7aN6YVO+Gp2GaFV1be7fs77OitW1SJltEsbIz6ElSXfiuWRjOo/0v2nOKeRKHsVdVvy4n58P5m5WNxoKyVKa21ONAUdxHOADTXjBgdqS4n0OcpdFSBsZ3NRxGGGi05qvVa1plidWLXDGq8S2ZmnqVpkQt/nj3DcsbckxGy1dbQSWf6sI5AGnblXJWxgqVaimWfkxlh6jG/FW/XV4qvEO0FQG7w/Jx/38wIVxa9dSN4Z0PN1r5ITpOqPDKKB1Wq4ryVjY7eyBK72Y6PLXtXOx59fzJA6TzA8thaOw6tIPgWLOYguKpK9wuO5gMSh9SWdREzTPTjC8dexEYmFAWPOGX1Qt10SlAY68nw3kFMReKKAz6CvVav8EFmVDIm91EcGcSD7BCRzhVDJcuVZCp5L33qVVdI41uzwoJ1EyuvXGnoaJY7UC1G0YrQY9eGZiNbylQwQk6U5HYKqLeE7A8AKLo5brR5l3HgRvmxzOdm03RM18KvoJECnwz0q0BsbczP8tJam/2e1PKo/mIGqNcmT/ofrOITQBo787IG+ok3Jv+vNX3qmd3eO0TUjmwDMoO8aapO5zZ3h7tMOj9QBVa2CmEOJ2l6YY98zryPPsFGTScko3uFLSnREmtPJ6foyd0wJ4ysVfzlbG/8tmIm/+g2zwpel0YYFvLiNOcSBwqSTn26tpoZ2+dZ+2OSSbU1sLUEp4o4JuoXuBW3+9t9X9L22PQsmM14PrzXNo91F1Vn18tcbCc+nPKSODkvOmPMKUwou6v4ivZdW2t6WOs9b2+vyGngjMVdHCFKloGhjUq9S/XkdahAdJXFp/h22jOzir+kctpyk4cJ6yyYdcpptTrxpBfZpTPZyfJVp2E2+6FWVBhSfM77SHY+YSAl0VlbpeJmHBN4g/s+P3drMDVL7UW3rCisMxlFh+zHOhPkxXKWgcW1M2aJhhWHYLd/9PT5omE3/bLZA7W/HCDjgCYFtcs1wIk+u/ye+ZZxNTF/WinsDZX9z/zZGra+ikW3wp/awQxmOT+Ie0mY3p+Wvqt8K+mL0AJMdkDrCD/pF8axWSVaNNx2ytI6Kr2WSYKX7eHt8/P+Jh8ikyIwc/UrZqNJA1Wnxgie8FhxbNuv1d5mKJj6gumf9g/7xfOLpV94nI0/K8HGOqsmxvJboFTYO26RFJSMobGOLh/ER5O0YOtI+JkCKeZa82+tAaI6jxk52hzH0RprsVb4U2Jb9CyewbR4HUDhl+/JtPmnX8O2mdClVblTnWWK0Hj6LKuEBg8jYwJrXGVe7upWX+/SWkadGMte3GwClNhyNs23H54Wf4UHqceY+33Szh4bOV78Yi34U+9df5o7GTGlBtMheIIo8AT9EccfcPzBHn9ze/ynp4//aE+/tqff4vgG40ex54ZDMLw9pZhGt1bM44ENYSEBcb47cF8rWVT3YWV/DURYR9BVq3HGLESd+5ckGhgi0uhYt6kfduQI9J71aijtC7GIcQy9dVxaayqnptHb/deizjqxX3Gk14OYQywDYU3M7NL6GDfDqCNRgALedle0XY/RTR4OeWf968vrP7u++vOHd392ff01+lu0z9E/Ax4gr03vpN+ZNEMmOCTOca97umQqwrC2WAuZxUs2Y+MWoxNqG9OsqLRIQfn5W9au3B6U2WrldooZoe+pgxVIstb5s0hPa74+Lqcib75eLrHBSTpq/Jo8j1yMZHQrHLtzq7HLjsc+zvqtOKK4EdNecGDIds8brtkI4PmXYn5xJphhXDZc8OJsl1bQMSsAxnfYrTA9QzaMmduNZmdekuwvQ7p2rpqZZ5thPs90mNv14j5udOaU3bK/gU5SsQAsrstkWqx8zu9ljuIRzjPZxkc6VOf5s4jRPKdc88UI2/gbV5wRskQpKSl1HmqTa96djT5mbNHG58we/N2UC+7W9DKTbAe+kI5TGL7rVRWrnfeifLnCVGlN18BHYQXzQ4Y8dnrGt7L2k6d93v3iz+xturtM2061Fp2jl76NRFUmftG/vq503ZNieDB0w4SNb/8H5r8HnngfE4Fn5ePad+lcqSQiqINj7KaeZPyP4fNGmT+KD4sddUJmNYrz8mhGBjQZ1jM8AeL/LWN0xt4X92ujPAUUZHt77fviGDep6vspm4kPG/Wo0X4swr9S/cI+pRfwEm4kHbj627Y18nstY/2eS+Z9P49P9OGkzjkc87IeZ/6U9Hzoyels26p5z9ziTOT8vM3T7Rlgx5niFkl7ZsX/cDW3+TNOcu15jEwytTnJNUIlOQCIzNHq7fUkADMYBXHqYcYHCvAtshZc5qQh147HYfpXAqlCkyJS7jrSrqhLWowcdRGJ9gu2O7RrNd+s3qq9qOVXVIjWkkUbqQvq8xqTmBCsC7jjLVNsDUR+0k4DIkmc6e2X5Q6ri9v2pO9uJbpw1XFUlohPoShvZ83nRRz4hF5YsJrljlCO9LWpJ2YAKRv4PPKnxufPUT6O7M/z7i/Pp14ovBJKYZ5D7WdEwloedJ4wE3nyOdHnjGBbLfx/9/l8r88t5RQma//Qthby5zh7n9PCRs8b1fJ57bzGlzSCi8kLerl+Z7n7FJ/UV+gtS3DjpB8zurnjlebju13Bn2x6dsO9+pOnEo2PCZN9aKvWZjbYGMA531YeK71z6hrxMj+f3rKggUj2AaeiqBxn6WdaM9/eKxSqlk0DxtZMb33zQWS1D3O2s8hgbfhm5+c33DvHwVgGNw3Ls/1UXK61xkfyz574OodZn5s/M/FT8we0kmFZ3yDFIZiYw/KyV6z7z9Lbl2rDL8xSRYKzZBYh6pmzz7k9zD9n9q3HPqH+FyP4xfFfhEj+/fx1M2neTlW6qjURSIep4V7aa1zf4fKVXL6+e/Vv7t788vb4T/r02+cP/3L7+Nvx+G23Hxs+dDxdxRTPGCrNhdYve1WuJxK3WtxIMkiVpvqdhqVTRQzEHKFoPeTeAYUCEsaCCMxGd66KekCvSWkCSPMbaZupIDivI65GHX5om3hdTdB7F7OBQ7DTrbW+Eq51lzdryHYSLVJDHnaaNu6hQ9AEzdAU3XA9tJncHXq19iDy2u5e9csXr9/+7NW7v2pvfonrz9Hemb2y9kpwJ+0B1k2u6GKY1ZGACF7c08U+hovHGlIkCdzj+uuq/0ejkyAZ0aWe5YXoABbx2d7gc1v0x6ZFELKwwFDOKm5mDHPcXXo1GnlBwDPdzjbcDgIehlgXWFM9g8ZGsZPO9p3ZzcRNf69rFNBMtvmv2LdYAPww2wH1RgY9n2rLSqUaVqN0SIwbzp4wcwMxow73Z64oyrDbsBlzlJU1XimADHM3KuDq+ATjnedQu8yTeRnHyeh0LpWIVeVB71MN8vZG/9+N8sgwk5F99qJUbt+au5Z9fFygmLA17Is0P88Ts5bBJzCjzJuZxQSsnWIGoCnNx+o0JRMKacE7rp8ZkvU6f1HEBXEihq2NDvhbeIld3bJXv7otxn5Z3osD+JmNnk1aBXpO0RbfmpjtOgdgtR94XyLqlNWL/DqwnOZKtyDCiuFNDULctbGBpLnJplKNtgkU7wvzmP9ZTjoimeesFwxY+gph/aknN8ZWagRZCuIc7HvxAaxyutGhtaqJm8hQD5RW4tcxn5/pz3y47fLZJWYKbAx8xiuQzrI0XHizzLKS/Yx+TQQe9FmIL0344U/w835WcU1LLH7CFg0h8wqSJt8SwTxFKFihOM8UzZliL85z45wtHL/x8xZxOI9/+mvgxva6834V7m0syiNv8nVGsG05bR2Ed4roEGwMgtlNEMym68FTrW3FJ/CfGMBbWvtfmwhK0pmSND1XBOWpiqlJa8HCPmFq9AHE7cY4KZeiQEXiCpFYGDcQOO1vLnrXj1L8jGhnFHaR+xrqF2PmlhcBN0Xj0CqhcZZQkU8+b8jc7ah1mybBiYsmb/AXPeWzRZxJgpZ9KQIyc/IuFyXZ2z+zAajq8BylldSeIk1VIdAsJ9n4v76yTYP5sNZlJn6/hdqc/CbXZ/poVMl4mOblONp5Pjz4HxFPWZV7re6P4E+8xZY58Ot4Pmd8q//VWdmzeDFGOjofXvQCgveD7eVkrZ35kNeVM4m1cFiDaVvz0eXo8cvrwpplj5oqGr/ELfkq5IKity/oiI2ehXKUOJwZI94viXC9uyoQkU2Xbba95Km7zaPh/dp+dOnv8bJ9csZhGpDWK1DVhhm7yG9h+zrv11ni6Iu75VaI6hvQaZls6RVNeObONf8j9liNtvESIy2LOe9vivkejGbxbK2pusJaiLlBx3mzzn/y2NeWNLK0qjcweXFYf2k5vPyn1tpiG9kaEzlPy/LNdcSvMk78OWd10hJfTF4e8LT8GandlvHpr7wwz/r9PL6IYPZhMZhBYKrSBvAIewaegA8Y32H8gPGdPf3u8ftfPf/w/+rHX131Dzi+b+3RL5+BGsTUDBIF261hWBZvyyztjraJfticjsGKCJcw+PMi4qkLQzOM1tpQbZ8IMyVs0ZE3EYiKNcRNgaOhmsRlw9qlsNzlp9c5cVBvhbQz/OfEiCLDzE/HjXyymZiJyfVmd0PejutX/eFn/e6n92/+9HL/Zb//Qi5f4PoF2hu0N8AD7Aq5AFezJnIxFdmP7/nanYtO2kicY87BROYlygDQupZj18nDsqadXxQq1lgA+EgOsyLf2tbQHYLO23eO0G14UY504ONSxl+pacomkb4cCm9LUONXnekmj8EJJMWfms8w7S0uEGAk3XDznDl8mYeL8VIjv0SB/VDVeeZFpPleF6ZT8b8fnUueEaHop4h4nqeuHgLmsUTM7FksyJ/32ddUuSYCLQI/Pnx6d6buYkdGLo5FbOtiIa0xaQ72qeeZ/tseYZURyTDNdvPgi1lfp4NWqfiJPi6nkv7JZrfNGRqQvjrvYNXXbMZlRQck87HJz0tPKB8BgL10XcDCcifO5zAfydFy6x/LFxthNdUa/xyzPs9n25F8+3JH5Pm9m1wg7UI6nDV/ONPLkwHg/fD4mQ3TzvTZuIvmwweu/a+7xG3UKGzc+C2WlrwhNvlz/TnL7PydM+GWaySemZaoy2DggwTkzRecDCGuQMnb5OeKQl5Em7QoxcaUxKrCxokfXqT5f5d/NjqoieP8JiM4MXzS3++wW8IfPkPCq0/O7VPSXZQxWzBzq6GomW/AHoMQPjCfnHFjnbN/yPv1stRsmFbjr3u9S9nhviMhbwAABx5JREFUYSY/BBpzmzTkcbgqU6LZy3Koc5diqlCrSq6d5mPqOObnWkWTBr6RHNYkXKlP8RvXLvl+qR8Fpf1aq0UWN2zqiOSZbXX17x/VQVKekq0rktTRq37Z4y++uuJ5xivXxfX5eW7xrhPy57+zn3ge0EbNlu2o7bv73r30eZBxRiEWxvsErT75LlrRPEbH+8J4dR7zPAE91Ubl74vNsPHhp5Zw/mtsDSHkpzBwk8TTe2e10Xps/2yLxv+9SNtNfs/4OZ/kLtIv0Wpbhb5kf1Y1pULPNDxLzTbniSSZzGPcUFj3qhGbRuVpO4R06CKDf4Rjz7uDhSdxluVP0eePvOVFTP4jzxcoESPNyAMW6ViCCZ+SI6z4Yy8d5HdUdH0UOJk6aOWx5RQFgPILeL1Ia2H7OYHVUlvHEyZ5WRrgvPgtXuwmXyLifVejx+Iqm/WubZL0zH5qZOONektS7GXMLLzy37s0M4jB5JOcyVv8glFB9onvwos+Rc2tduScX8En+Z9nxWV/L3SlnNtaESAJu0v16L0wVuRkw2+LxdrCZVoa5BEzCrG9tOFhbTHHVep3JK+GPfZHIeJTP2c8n9IE+L0UZtZ77//xP/5Hf8eL8GpkyscQUaEW1DSLQ/b+gVdvGS/STxLoqE8q5G+Zauakhz+patvn9V1WWohZVDR9dydwYs0MlTpoDpHmizGBGkwBuZg2tQv03uRB5VW7vr7e3T28uX911fH8o42PgkNtmBiGmgiCE1VEDj+452/MOkcRQeTYPXjhtSU9i8IsPH2X6Ul7M3fXMQwKQ2vtOOYV9WajiIrwCd1QHmZm6gflwn8SkXAa/QNAqK4TAsl+jg4lANINkAS7oPwwg4jvu8Oer8EsJ20CFbS7fvf5my//7LM//Q+vvv6fHj7/28u7v2mvfil3v9D+C7n8VPEF5I3pA+Sqdgd0M7+FxifQKppjYQJqbunURpLqgeJ+henxfM4R6k54kGtybPCJv4t4r45aF68a/TAP+111qtOcUpKL4E8PhkswP3M1c/v8rrEU+KujWIDz/IDkva5zVrFTYwBQgxksZdBX2lrToTwHyzSL+vHDXCsbYXM+MWRcK1Hf9TfymMTNkWTOm7Xj89aaaVRbwXEzn69n+F+h8BDvCAD1Qx8GJxGQ3ZHo3tv4Sux1HTcLPy4f0KSb57thZsMM/l5/XUiEr9qvTSD1lgv230Wk3tUiN2Bq6hPxHTGYnXt0EuJFwjx4FWZmOvelni9VVPtV8sJmYo6saTrEPNmROxvWlvJEQBXfBaBjVov4IniE4kxJ9BgrnvN3t/kzz7u8mxboSWLURLnSIFvKLbUAaswS8OIi/yW51Hi07ZlNWmU9rnJOqtfusNzxJ840LMs8PdJiC302aapPfL9ExPlkjJt/FWlk6GB+nnvE/PMCPuT4mkVkha7+Wt+X+ivTtuy84hnkXk98sImrLWOG/F7fcVVTnfe91F6U+IxhgIxxwHM4MFvpCeB2HJCgw6HDEE1gfKjs28VFfDZ5m+ZfD0y9D2myFAQ5rkJUBIq8gWvH+WksMnct4y+Wj2DqKRSOGe0vP7/wZAKhj+ni0FobRAfm0jO2n/kzPskJO31Q2kTpGQMQ8r7hFQBThZnjeWEpANc4Q8f/39e1JEsMgsDG3P/EL8Jb8GsxNbOYRcoowaZpLGOQ2S3sydBxDulYYv78spbw3z6vKCu/xVi5+8D9LOJfY89xs5/2QCz6U6nse+YSM/3sW0Vkp/fKnsMze1Ob0CpSZ0S6vtCDz3l+K76Yh5UQpao+74UN7z93IAjz1eSxHKBi8AeSL3sy+Z3V7w4kBOffeK6eg46sodb4fJaZKRAHR5A9flA1cLbP66oRo7IsVETuNiqUbtVnPSd7z1mrIW7/A/FyN664/lSDzDNsdsVveQXALkStKHotV6EAuJ7f+6086HdWTHEEXfEeGcptdcqpqLEzQ1181cygqdtZIXB79sBcKgXU1OJ6zIvRct7Ig+muUAhjCKRmc+dFDCLxnw6feDs3QXO+4+u3N0Rk65+sPKMf5p8zYx+WN2pcxk/nUF/I85yLaT9210d28ZvzWCpAMYOz8fv6hzJCHTE/M/YGnrPNVCbNLV+nybEneVJcZFa+qEEPVCSsC//sf4ETKbKEjN9nTcf/PQs+1lllTHyqAni9T2RaEBxzFJVXPlmvDxzP6wat3DY72JL8EAqk7OF6Kv3cKjptjirykz+5//CDM7pO/Wa5ItR558Rn5d8iRWIwxpt3HxUHh1jjP+cRyK+LbKrTvw4n8R6YY2+97ZFS9W9g1XTqw6gy2qrx6nQFSFTZ54rWWkt1k3jzBspz52hcyxMMzExDd6lZ3BFcp7ooEu3KF4Drt952Hc/uFJML34TtWW9yn9VGeq0v8Nn+1xkvhQRQBlznKzUiUvgZI5pZqqBdsPkHBnOlNhul9NkAAAAASUVORK5CYII="
 
 
+# ============================================================================
+# Vorkompilierte Muster für die Textaufbereitung
+# ============================================================================
+# IDs aus der CSV werden als HTML-IDs / data-Attribute verwendet: '-' -> '_'
+_ID_TRANS = str.maketrans('-', '_')
+
+# Chinesische Zeichen inkl. Zahlen und NUR chinesische Satzzeichen;
+# ein Lauf wird nur gefärbt, wenn er mindestens ein chinesisches Zeichen enthält
+_CJK_RUN_RE = re.compile(r'[\u4e00-\u9fff\d，。、：；！？（）【】《》""・\s]+')
+_HAS_CJK_RE = re.compile(r'[\u4e00-\u9fff]')
+_CJK_SPAN = '<span style="color: #dc3545; font-weight: 600;">%s</span>'
+
+# GPS-Koordinaten in Klammern, als ganze Zeile bzw. am Zeilenende
+_COORD_PAREN_ONLY_RE = re.compile(r'^\s*\([\d\.\,\s\-]+\)\s*$')
+_COORD_PAREN_TRAILING_RE = re.compile(r'\s*\([\d\.\,\s\-]+\)\s*$')
+# Trennzeichen, die für die Erkennung von "lat;lon"-Zeilen entfernt werden
+_COORD_DELETE_CHARS = str.maketrans('', '', ';.- ')
+
+
+# ============================================================================
+# Foto-Optimierung
+# ============================================================================
+# Fotos werden vor dem Einbetten auf diese Kantenlänge verkleinert (falls aktiviert)
+MAX_IMAGE_DIMENSION = 1600
+JPEG_QUALITY = 82
+WEBP_QUALITY = 80
+# WebP ist bei gleicher Qualität deutlich kleiner als JPEG und unterstützt Transparenz
+WEBP_SUPPORTED = Image is not None and features.check('webp')
+# Dateiendungen der Fotos im ZIP-Export
+_IMAGE_EXTENSIONS = {'image/jpeg': 'jpg', 'image/png': 'png', 'image/webp': 'webp'}
+
+
+# ============================================================================
+# Download-Formate
+# ============================================================================
+# Auswahl in der App -> (Kürzel, Dateiendung, MIME-Typ)
+DOWNLOAD_FORMATS = {
+    "Single HTML file": ('HTML', 'html', 'text/html'),
+    "Compressed HTML (.html.gz)": ('GZIP', 'html.gz', 'application/gzip'),
+    "ZIP (HTML + photo files)": ('ZIP', 'zip', 'application/zip'),
+}
+
+
 # Kopiere die Hilfsfunktionen aus generate_report_v3.py
 def format_timestamp(timestamp_str: str) -> str:
     """Formatiert einen Unix-Timestamp zu einem lesbaren Datum"""
@@ -33,52 +98,56 @@ def format_timestamp(timestamp_str: str) -> str:
 
 def parse_primary_value(primary: str) -> Tuple[str, str]:
     """Parst den Primary-Wert (Format: "ID|Wert")"""
-    if '|' in primary:
-        parts = primary.split('|', 1)
-        return parts[0], parts[1]
+    option_id, sep, value = primary.partition('|')
+    if sep:
+        return option_id, value
     return '', primary
 
 
+# Reihenfolge entspricht der Priorität: der erste Treffer gewinnt
+_STATUS_RULES = (
+    ('OK', ('status-ok', 'ok', 'OK')),
+    ('Non-compliant', ('status-noncompliant', 'noncompliant', 'NC')),
+    ('不合格', ('status-noncompliant', 'noncompliant', 'NC')),
+    ('Info', ('status-info', 'info', 'Info')),
+    ('说明', ('status-info', 'info', 'Info')),
+    ('n. a.', ('status-na', 'na', 'n.a.')),
+    ('n.a.', ('status-na', 'na', 'n.a.')),
+)
+_STATUS_OTHER = ('', 'other', '—')
+
+
+@lru_cache(maxsize=1024)
+def classify(value: str) -> Tuple[str, str, str]:
+    """Klassifiziert einen Wert einmalig: (CSS-Klasse, Status-Typ, TOC-Label)"""
+    for needle, result in _STATUS_RULES:
+        if needle in value:
+            return result
+    return _STATUS_OTHER
+
+
 def get_color_class(value: str) -> str:
     """Gibt die CSS-Klasse basierend auf dem Wert zurück"""
-    if 'OK' in value:
-        return 'status-ok'
-    elif 'Non-compliant' in value or '不合格' in value:
-        return 'status-noncompliant'
-    elif 'Info' in value or '说明' in value:
-        return 'status-info'
-    elif 'n. a.' in value or 'n.a.' in value:
-        return 'status-na'
-    return ''
+    return classify(value)[0]
 
 
 def get_status_type(value: str) -> str:
     """Gibt den Status-Typ für Filter zurück"""
-    if 'OK' in value:
-        return 'ok'
-    elif 'Non-compliant' in value or '不合格' in value:
-        return 'noncompliant'
-    elif 'Info' in value or '说明' in value:
-        return 'info'
-    elif 'n. a.' in value or 'n.a.' in value:
-        return 'na'
-    return 'other'
+    return classify(value)[1]
+
+
+def _color_cjk_run(match: re.Match) -> str:
+    """Färbt einen Lauf nur, wenn er mindestens ein chinesisches Zeichen enthält"""
+    run = match.group(0)
+    return _CJK_SPAN % run if _HAS_CJK_RE.search(run) else run
 
 
 def format_text_with_chinese_red(text: str) -> str:
     """Formatiert Text so, dass chinesische Zeichen rot dargestellt werden"""
-    # Regex für chinesische Zeichen inkl. Zahlen und NUR chinesische Satzzeichen
-    chinese_pattern = re.compile(r'[\u4e00-\u9fff\d，。、：；！？（）【】《》""''・\s]+')
-
-    def replace_chinese(match):
-        matched_text = match.group(0)
-        # Nur rot färben, wenn mindestens ein chinesisches Zeichen vorhanden ist
-        if re.search(r'[\u4e00-\u9fff]', matched_text):
-            return f'<span style="color: #dc3545; font-weight: 600;">{matched_text}</span>'
-        else:
-            return matched_text  # Unverändert zurückgeben (keine chinesischen Zeichen)
-
-    return chinese_pattern.sub(replace_chinese, text)
+    # Reiner ASCII-Text kann keine chinesischen Zeichen enthalten
+    if text.isascii():
+        return text
+    return _CJK_RUN_RE.sub(_color_cjk_run, text)
 
 
 def remove_gps_coordinates(text: str) -> str:
@@ -88,14 +157,19 @@ def remove_gps_coordinates(text: str) -> str:
 
     for line in lines:
         line = line.strip()
+        # Schneller Pfad: ohne ';' und '(' kann die Zeile keine Koordinaten enthalten
+        if ';' not in line and '(' not in line:
+            if line:
+                cleaned_lines.append(line)
+            continue
         # Skip Zeilen mit Semikolon-getrennten Koordinaten
-        if ';' in line and line.replace(';', '').replace('.', '').replace('-', '').replace(' ', '').isdigit():
+        if ';' in line and line.translate(_COORD_DELETE_CHARS).isdigit():
             continue
         # Skip Zeilen mit Koordinaten in Klammern
-        if re.match(r'^\s*\([\d\.\,\s\-]+\)\s*$', line):
+        if _COORD_PAREN_ONLY_RE.match(line):
             continue
         # Entferne Koordinaten in Klammern am Ende einer Zeile
-        line = re.sub(r'\s*\([\d\.\,\s\-]+\)\s*$', '', line)
+        line = _COORD_PAREN_TRAILING_RE.sub('', line)
 
         if line:
             cleaned_lines.append(line)
@@ -103,17 +177,116 @@ def remove_gps_coordinates(text: str) -> str:
     return '\n'.join(cleaned_lines)
 
 
+def get_image_base64(data: bytes, mime: str) -> str:
+    """Kodiert Bilddaten als data:-URI für die Einbettung ins HTML"""
+    return f"data:{mime};base64,{b64encode_as_string(data)}"
+
+
+def get_upload_stem(img_file) -> str:
+    """Gibt den Dateinamen eines Uploads ohne Endung zurück (= Media-ID in der CSV)"""
+    return img_file.name.partition('.')[0]
+
+
+def shrink_image(data: bytes) -> Optional[Tuple[bytes, str]]:
+    """
+    Verkleinert ein Foto auf MAX_IMAGE_DIMENSION und speichert es als WebP
+    (ohne WebP-Unterstützung als JPEG) neu. Gibt (Bilddaten, MIME-Typ) zurück,
+    oder None, wenn Pillow fehlt, das Bild unlesbar bzw. ohne WebP transparent ist
+    oder das Ergebnis nicht kleiner als das Original wäre.
+    """
+    if Image is None:
+        return None
+
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            has_alpha = img.mode in ('RGBA', 'LA', 'PA') or 'transparency' in img.info
+            if has_alpha and not WEBP_SUPPORTED:
+                return None
+            # EXIF-Drehung anwenden, da die EXIF-Daten beim Neuspeichern verloren gehen
+            img = ImageOps.exif_transpose(img)
+            img.thumbnail((MAX_IMAGE_DIMENSION, MAX_IMAGE_DIMENSION), Image.LANCZOS)
+            mode = 'RGBA' if has_alpha else 'RGB'
+            if img.mode != mode:
+                img = img.convert(mode)
+            output = io.BytesIO()
+            if WEBP_SUPPORTED:
+                img.save(output, 'WEBP', quality=WEBP_QUALITY, method=4)
+                mime = 'image/webp'
+            else:
+                img.save(output, 'JPEG', quality=JPEG_QUALITY, optimize=True, progressive=True)
+                mime = 'image/jpeg'
+    except (OSError, ValueError, Image.DecompressionBombError):
+        # Unlesbare oder übergroße Bilder (> 2 x MAX_IMAGE_PIXELS) werden unverändert eingebettet
+        return None
+
+    shrunk = output.getvalue()
+    return (shrunk, mime) if len(shrunk) < len(data) else None
+
+
+def get_image_mime(reported_type: str, data: bytes) -> str:
+    """MIME-Typ eines Fotos: vom Browser gemeldeter Typ, sonst anhand der Dateisignatur"""
+    if reported_type in ('image/jpeg', 'image/png'):
+        return reported_type
+    return 'image/jpeg' if data[:3] == b'\xff\xd8\xff' else 'image/png'
+
+
+def encode_uploaded_image(img_file, optimize: bool = False) -> Tuple[str, str]:
+    """Liest ein hochgeladenes Foto und gibt (Name ohne Endung, data:-URI) zurück"""
+    img_name = get_upload_stem(img_file)
+    # getvalue() liefert die Upload-Bytes ohne Kopie; getbuffer() würde den Puffer kopieren
+    data = img_file.getvalue()
+    mime = get_image_mime(img_file.type, data)
+    if optimize:
+        shrunk = shrink_image(data)
+        if shrunk is not None:
+            return img_name, get_image_base64(*shrunk)
+    return img_name, get_image_base64(data, mime)
+
+
+def get_image_filename(img_id: str, data_uri: str) -> str:
+    """Relativer Pfad eines Fotos, wenn es neben dem Bericht statt eingebettet abgelegt wird"""
+    mime = data_uri[5:data_uri.find(';')]
+    return f"images/{img_id}.{_IMAGE_EXTENSIONS.get(mime, 'png')}"
+
+
+def parse_media_ids(media: str) -> List[str]:
+    """Zerlegt die Media-Spalte (Format: "ID1;ID2;...") in Bild-IDs"""
+    if not media:
+        return []
+    return list(filter(None, map(str.strip, media.split(';'))))
+
+
+def get_referenced_media_ids(csv_content: str) -> Set[str]:
+    """Sammelt alle Bild-IDs, die in der CSV referenziert werden"""
+    metadata, items = read_csv_data(csv_content)
+    return {img_id for item in items for img_id in parse_media_ids(item.get('Media', ''))}
+
+
 def is_item_answered(item: Dict) -> bool:
     """Prüft, ob ein Item beantwortet wurde"""
     return bool(item.get('Primary') or item.get('Secondary') or item.get('Note') or item.get('Media'))
 
 
-def read_csv_data(csv_content: str) -> Tuple[Dict, List[Dict]]:
-    """Liest CSV-Daten aus String"""
+def get_page_break(photo_count: int, small_items_count: int) -> Tuple[str, int]:
+    """
+    Druck-Seitenumbruch nach einem Item: nach jedem Item mit vielen Fotos
+    bzw. nach je zwei kleinen Items. Gibt (CSS-Klasse, neuer Zähler) zurück
+    """
+    if photo_count >= 5:
+        return 'page-break-after', 0
+    small_items_count += 1
+    if small_items_count >= 2:
+        return 'page-break-after-small', 0
+    return '', small_items_count
+
+
+def read_csv_data(csv_content: str) -> Tuple[Dict, Iterator[Dict]]:
+    """Liest CSV-Daten aus String: Metadaten sofort, Items lazy als Iterator"""
     metadata = {}
-    items = []
+    header = None
 
-    reader = csv.reader(io.StringIO(csv_content))
+    # newline='' überlässt dem csv-Tokenizer die Zeilenenden (auch in Feldern mit Umbruch)
+    reader = csv.reader(io.StringIO(csv_content, newline=''))
 
     for row in reader:
         if not row:
@@ -128,70 +301,102 @@ def read_csv_data(csv_content: str) -> Tuple[Dict, List[Dict]]:
             value = row[1]
             metadata[key] = value
 
-    for row in reader:
-        if not row or not row[0]:
-            continue
+    if header is None:
+        return metadata, iter(())
 
-        item = {}
-        for i, col in enumerate(header):
-            if i < len(row):
-                item[col] = row[i]
-            else:
-                item[col] = ''
+    # Restliche Zeilen erst beim Iterieren aus demselben Reader lesen
+    return metadata, _iter_items(reader, header)
 
-        items.append(item)
 
-    return metadata, items
+def _iter_items(reader: Iterator[List[str]], header: List[str]) -> Iterator[Dict]:
+    """Baut die Item-Dicts der Zeilen nach dem Header; Zeilen ohne ID werden übersprungen"""
+    header_len = len(header)
+    for row in reader:
+        # Die ID steht in der ersten Spalte (Header-Zeile beginnt mit 'ID')
+        if not row or not row[0]:
+            continue
+        if len(row) < header_len:
+            row += [''] * (header_len - len(row))
+        yield dict(zip(header, row))
 
 
-def organize_items_by_sections(items: List[Dict]) -> List[Dict]:
+def organize_items_by_sections(items: Iterable[Dict]) -> List[Dict]:
     """Organisiert Items nach Sections"""
     sections = []
-    current_section = None
+    # Items vor der ersten Section werden verworfen
+    current_items = None
 
     for item in items:
         if item['Type'] == 'section':
-            if current_section:
-                sections.append(current_section)
-            current_section = {
+            current_items = []
+            sections.append({
                 'id': item['ID'],
                 'label': item['Label'],
-                'items': []
-            }
-        elif current_section:
-            current_section['items'].append(item)
-
-    if current_section:
-        sections.append(current_section)
+                'items': current_items
+            })
+        elif current_items is not None:
+            current_items.append(item)
 
     return sections
 
 
-def generate_html_report(csv_content: str, images_dict: Dict[str, str], logo_base64: str = '') -> str:
-    """
-    Generiert HTML-Bericht
-    images_dict: {filename: base64_data}
-    """
-    import re
+def _annotate_item(item: Dict) -> Dict:
+    """Berechnet die pro Item mehrfach benötigten Eigenschaften einmalig vor"""
+    label = item.get('Label', '')
+    label_lower = label.lower()
+    is_location = 'location' in label_lower or '地点' in label
+    option_id, display_value = '', ''
+    color_class, status_type, status_label = _STATUS_OTHER
+    if item.get('Primary'):
+        option_id, display_value = parse_primary_value(item['Primary'])
+        color_class, status_type, status_label = classify(display_value)
+
+        # Formatiere Timestamps
+        stripped_value = display_value.strip()
+        if len(stripped_value) == 10 and stripped_value.isdigit():
+            display_value = format_timestamp(display_value)
+
+        # Entferne GPS-Koordinaten
+        if is_location:
+            display_value = remove_gps_coordinates(display_value)
+
+    item['_answered'] = is_item_answered(item)
+    item['_is_category'] = item.get('Type') == 'category'
+    item['_is_location'] = is_location
+    item['_is_machine_designation'] = 'machine designation' in label_lower or '机器名称' in label
+    item['_color_class'] = color_class
+    item['_status_type'] = status_type
+    item['_status_label'] = status_label
+    item['_option_id'] = option_id
+    item['_display_value'] = display_value
+    item['_media_ids'] = parse_media_ids(item.get('Media', ''))
+    item['_safe_id'] = escape(item.get('ID', '').translate(_ID_TRANS), quote=True)
+    # Labels einmalig escapen (Text und title-Attribut); gekürzt wird vor dem Escapen
+    item['_label_html'] = escape(label, quote=True)
+    item['_label_short_toc'] = escape(label[:60], quote=True) + ('...' if len(label) > 60 else '')
+    return item
+
+
+def _annotate_sections(sections: List[Dict]) -> None:
+    """Berechnet die HTML-IDs und Labels der Sections einmalig vor"""
+    for section in sections:
+        label = section['label']
+        section['_safe_id'] = escape(section['id'].translate(_ID_TRANS), quote=True)
+        section['_is_title_page'] = 'title' in label.lower() or '标题页' in label
+        section['_label_html'] = escape(label, quote=True)
+        section['_label_short_toc'] = escape(label[:50], quote=True) + ('...' if len(label) > 50 else '')
 
-    metadata, items = read_csv_data(csv_content)
-    sections = organize_items_by_sections(items)
 
-    # HTML-Template
-    html = f"""<!DOCTYPE html>
-<html lang="de">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{metadata.get('audit_title', 'Audit Bericht')}</title>
-    <style>
-        * {{
+# ============================================================================
+# HTML-Bausteine (statisch, werden nur einmal angelegt)
+# ============================================================================
+_CSS = """        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
 
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
             line-height: 1.6;
             color: #333;
@@ -199,13 +404,13 @@ def generate_html_report(csv_content: str, images_dict: Dict[str, str], logo_bas
             padding: 20px;
             padding-left: 20px;
             transition: padding-left 0.3s ease;
-        }}
+        }
 
-        body.toc-open {{
+        body.toc-open {
             padding-left: 370px;
-        }}
+        }
 
-        .toc-sidebar {{
+        .toc-sidebar {
             position: fixed;
             left: -350px;
             top: 0;
@@ -217,13 +422,13 @@ def generate_html_report(csv_content: str, images_dict: Dict[str, str], logo_bas
             z-index: 1000;
             transition: left 0.3s ease;
             padding: 20px;
-        }}
+        }
 
-        .toc-sidebar.open {{
+        .toc-sidebar.open {
             left: 0;
-        }}
+        }
 
-        .toc-toggle {{
+        .toc-toggle {
             position: fixed;
             left: 20px;
             top: 20px;
@@ -240,40 +445,40 @@ def generate_html_report(csv_content: str, images_dict: Dict[str, str], logo_bas
             display: flex;
             align-items: center;
             gap: 8px;
-        }}
+        }
 
-        .toc-toggle:hover {{
+        .toc-toggle:hover {
             transform: translateY(-2px);
             box-shadow: 0 4px 12px rgba(102, 126, 234, 0.5);
-        }}
+        }
 
-        .toc-toggle::before {{
+        .toc-toggle::before {
             content: "☰";
             font-size: 1.2em;
-        }}
+        }
 
-        body.toc-open .toc-toggle {{
+        body.toc-open .toc-toggle {
             left: 370px;
-        }}
+        }
 
-        body.toc-open .toc-toggle::before {{
+        body.toc-open .toc-toggle::before {
             content: "✕";
-        }}
+        }
 
-        .toc-header {{
+        .toc-header {
             font-size: 1.3em;
             font-weight: 700;
             color: #2c3e50;
             margin-bottom: 20px;
             padding-bottom: 15px;
             border-bottom: 2px solid #3498db;
-        }}
+        }
 
-        .toc-section {{
+        .toc-section {
             margin-bottom: 20px;
-        }}
+        }
 
-        .toc-section-title {{
+        .toc-section-title {
             font-weight: 600;
             color: #2c3e50;
             font-size: 0.95em;
@@ -283,18 +488,18 @@ def generate_html_report(csv_content: str, images_dict: Dict[str, str], logo_bas
             border-radius: 4px;
             cursor: pointer;
             transition: background 0.2s;
-        }}
+        }
 
-        .toc-section-title:hover {{
+        .toc-section-title:hover {
             background: #e9ecef;
-        }}
+        }
 
-        .toc-items {{
+        .toc-items {
             margin-left: 15px;
             margin-top: 5px;
-        }}
+        }
 
-        .toc-item {{
+        .toc-item {
             display: flex;
             align-items: center;
             padding: 6px 10px;
@@ -303,14 +508,14 @@ def generate_html_report(csv_content: str, images_dict: Dict[str, str], logo_bas
             cursor: pointer;
             transition: all 0.2s;
             font-size: 0.9em;
-        }}
+        }
 
-        .toc-item:hover {{
+        .toc-item:hover {
             background: #f8f9fa;
             transform: translateX(5px);
-        }}
+        }
 
-        .toc-item-status {{
+        .toc-item-status {
             display: inline-block;
             padding: 3px 8px;
             border-radius: 12px;
@@ -320,50 +525,50 @@ def generate_html_report(csv_content: str, images_dict: Dict[str, str], logo_bas
             min-width: 50px;
             text-align: center;
             flex-shrink: 0;
-        }}
+        }
 
-        .toc-item-status.ok {{
+        .toc-item-status.ok {
             background: #a8d5ba;
             color: #0d3d1a;
-        }}
+        }
 
-        .toc-item-status.noncompliant {{
+        .toc-item-status.noncompliant {
             background: #f0b3b8;
             color: #5a0f15;
-        }}
+        }
 
-        .toc-item-status.info {{
+        .toc-item-status.info {
             background: #ffd966;
             color: #6b5200;
-        }}
+        }
 
-        .toc-item-status.na {{
+        .toc-item-status.na {
             background: #c8ccd0;
             color: #2d3236;
-        }}
+        }
 
-        .toc-item-status.other {{
+        .toc-item-status.other {
             background: #e9ecef;
             color: #495057;
-        }}
+        }
 
-        .toc-item-label {{
+        .toc-item-label {
             flex: 1;
             overflow: hidden;
             text-overflow: ellipsis;
             white-space: nowrap;
-        }}
+        }
 
-        .container {{
+        .container {
             max-width: 1400px;
             margin: 0 auto;
             background: white;
             padding: 40px;
             box-shadow: 0 2px 10px rgba(0,0,0,0.1);
             border-radius: 8px;
-        }}
+        }
 
-        .header {{
+        .header {
             border-bottom: 3px solid #2c3e50;
             padding-bottom: 30px;
             margin-bottom: 40px;
@@ -371,80 +576,80 @@ def generate_html_report(csv_content: str, images_dict: Dict[str, str], logo_bas
             align-items: center;
             justify-content: space-between;
             gap: 30px;
-        }}
+        }
 
-        .header-logo {{
+        .header-logo {
             max-width: 400px;
             height: auto;
-        }}
+        }
 
-        .header h1 {{
+        .header h1 {
             color: #2c3e50;
             font-size: 2.5em;
             margin: 0;
             flex: 1;
-        }}
+        }
 
-        .metadata {{
+        .metadata {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
             gap: 12px;
             margin-bottom: 25px;
-        }}
+        }
 
-        .metadata-item {{
+        .metadata-item {
             padding: 10px 12px;
             background: #f8f9fa;
             border-left: 3px solid #3498db;
             border-radius: 3px;
-        }}
+        }
 
-        .metadata-label {{
+        .metadata-label {
             font-weight: 600;
             color: #555;
             font-size: 0.8em;
             text-transform: uppercase;
             letter-spacing: 0.3px;
-        }}
+        }
 
-        .metadata-value {{
+        .metadata-value {
             font-size: 0.95em;
             color: #2c3e50;
             margin-top: 3px;
             white-space: pre-wrap;
-        }}
+        }
 
-        .filter-container {{
+        .filter-container {
             background: white;
             padding: 25px;
             border-radius: 8px;
             box-shadow: 0 2px 10px rgba(0,0,0,0.1);
             margin: 30px 0;
             border-left: 4px solid #3498db;
-        }}
+        }
 
-        .filter-title {{
+        .filter-title {
             font-size: 1.3em;
             font-weight: 600;
             color: #2c3e50;
             margin-bottom: 20px;
             display: flex;
             align-items: center;
-        }}
+        }
 
-        .filter-title::before {{
+        .filter-title::before {
             content: "🔍";
             margin-right: 10px;
             font-size: 1.2em;
-        }}
+        }
 
-        .filter-options {{
+        .filter-options {
             display: flex;
             flex-wrap: wrap;
             gap: 15px;
-        }}
+        }
 
-        .filter-option {{
+        .filter-option {
             display: flex;
             align-items: center;
             padding: 12px 20px;
@@ -454,177 +659,204 @@ def generate_html_report(csv_content: str, images_dict: Dict[str, str], logo_bas
             transition: all 0.2s;
             background: white;
             user-select: none;
-        }}
+        }
 
-        .filter-option:hover {{
+        .filter-option:hover {
             transform: translateY(-2px);
             box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-        }}
+        }
 
-        .filter-option input[type="checkbox"] {{
+        .filter-option input[type="checkbox"] {
             width: 20px;
             height: 20px;
             cursor: pointer;
             margin-right: 10px;
-        }}
+        }
 
-        .filter-option.active {{
+        .filter-option.active {
             border-width: 2px;
-        }}
+        }
 
-        .filter-option.filter-ok {{
+        .filter-option.filter-ok {
             border-color: #28a745;
-        }}
+        }
 
-        .filter-option.filter-ok.active {{
+        .filter-option.filter-ok.active {
             background: #a8d5ba;
-        }}
+        }
 
-        .filter-option.filter-noncompliant {{
+        .filter-option.filter-noncompliant {
             border-color: #dc3545;
-        }}
+        }
 
-        .filter-option.filter-noncompliant.active {{
+        .filter-option.filter-noncompliant.active {
             background: #f0b3b8;
-        }}
+        }
 
-        .filter-option.filter-info {{
+        .filter-option.filter-info {
             border-color: #ffc107;
-        }}
+        }
 
-        .filter-option.filter-info.active {{
+        .filter-option.filter-info.active {
             background: #ffd966;
-        }}
+        }
 
-        .filter-option.filter-na {{
+        .filter-option.filter-na {
             border-color: #6c757d;
-        }}
+        }
 
-        .filter-option.filter-na.active {{
+        .filter-option.filter-na.active {
             background: #c8ccd0;
-        }}
+        }
 
-        .filter-option label {{
+        .filter-option span {
             cursor: pointer;
             font-weight: 600;
             font-size: 1em;
-        }}
+        }
 
-        .filter-stats {{
+        .filter-stats {
             margin-top: 15px;
             padding: 15px;
             background: #f8f9fa;
             border-radius: 6px;
             font-size: 0.95em;
             color: #6c757d;
-        }}
+        }
 
-        .section.hidden {{
+        .section.hidden {
             display: none;
-        }}
+        }
 
-        .item.hidden {{
+        /* Sections ohne sichtbare Items blendet der Browser selbst aus (Fallback im Script) */
+        .section:not(:has(.item:not(.hidden))) {
             display: none;
-        }}
+        }
+
+        .item.hidden {
+            display: none;
+        }
+
+        /* Kurzes Hervorheben nach einem Sprung aus dem Inhaltsverzeichnis */
+        .section.flash {
+            animation: flash-section 1.5s ease-out;
+        }
+
+        .item.flash {
+            animation: flash-item 1.5s ease-out;
+        }
+
+        @keyframes flash-section {
+            0%, 70% {
+                background-color: #fff3cd;
+            }
+        }
+
+        @keyframes flash-item {
+            0%, 70% {
+                background-color: #fff3cd;
+                transform: scale(1.02);
+            }
+        }
 
-        @media print {{
+        @media print {
             .filter-container,
             .lightbox,
             .toc-sidebar,
-            .toc-toggle {{
+            .toc-toggle {
                 display: none !important;
-            }}
+            }
 
-            body {{
+            body {
                 background: white;
                 padding: 0 !important;
                 padding-left: 0 !important;
-            }}
+            }
 
-            .container {{
+            .container {
                 box-shadow: none;
                 padding: 20px;
                 max-width: 100%;
-            }}
+            }
 
-            .section {{
+            .section {
                 page-break-inside: avoid;
                 break-inside: avoid;
-            }}
+            }
 
-            .item {{
+            .item {
                 page-break-inside: avoid;
                 break-inside: avoid;
                 margin-bottom: 15px;
-            }}
+            }
 
-            .item.page-break-after {{
+            .item.page-break-after {
                 page-break-after: always;
                 break-after: page;
-            }}
+            }
 
-            .item.page-break-after-small {{
+            .item.page-break-after-small {
                 page-break-after: always;
                 break-after: page;
-            }}
+            }
 
-            .image-container {{
+            .image-container {
                 page-break-inside: avoid;
                 break-inside: avoid;
-            }}
+            }
 
-            .images-grid {{
+            .images-grid {
                 page-break-inside: avoid;
                 break-inside: avoid;
-            }}
+            }
 
-            .section-header {{
+            .section-header {
                 page-break-after: avoid;
                 break-after: avoid;
-            }}
+            }
 
-            .item-label {{
+            .item-label {
                 page-break-after: avoid;
                 break-after: avoid;
-            }}
-        }}
+            }
+        }
 
-        .section {{
+        .section {
             margin: 50px 0;
             page-break-inside: avoid;
-        }}
+        }
 
-        .section-header {{
+        .section-header {
             background: linear-gradient(135deg, #2c3e50 0%, #34495e 100%);
             color: white;
             padding: 20px 25px;
             border-radius: 8px 8px 0 0;
             font-size: 1.5em;
             font-weight: 600;
-        }}
+        }
 
-        .section-content {{
+        .section-content {
             border: 1px solid #ddd;
             border-top: none;
             border-radius: 0 0 8px 8px;
             padding: 20px;
             background: #f8f9fa;
-        }}
+        }
 
-        .section.title-page .section-content {{
+        .section.title-page .section-content {
             padding: 12px;
-        }}
+        }
 
-        .section.title-page .item {{
+        .section.title-page .item {
             padding: 8px 12px;
             margin-bottom: 8px;
             display: grid;
             grid-template-columns: 200px 1fr;
             gap: 15px;
             align-items: start;
-        }}
+        }
 
-        .section.title-page .item-label {{
+        .section.title-page .item-label {
             font-size: 0.9em;
             margin-bottom: 0;
             font-weight: 600;
@@ -633,24 +865,24 @@ def generate_html_report(csv_content: str, images_dict: Dict[str, str], logo_bas
             padding: 8px 12px;
             border-radius: 4px;
             border-left: 3px solid #3498db;
-        }}
+        }
 
         .section.title-page .item-value,
-        .section.title-page .item-notes {{
+        .section.title-page .item-notes {
             margin: 0;
             padding: 8px 12px;
             background: none;
             border: none;
             font-size: 0.9em;
             grid-column: 2;
-        }}
+        }
 
-        .section.title-page .images-grid {{
+        .section.title-page .images-grid {
             grid-column: 1 / -1;
             margin-top: 8px;
-        }}
+        }
 
-        .item {{
+        .item {
             padding: 30px;
             margin-bottom: 20px;
             background: white;
@@ -658,20 +890,20 @@ def generate_html_report(csv_content: str, images_dict: Dict[str, str], logo_bas
             border-radius: 8px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.05);
             transition: all 0.2s;
-        }}
+        }
 
-        .item:last-child {{
+        .item:last-child {
             margin-bottom: 0;
-        }}
+        }
 
-        .item:hover {{
+        .item:hover {
             background: #fefefe;
             box-shadow: 0 4px 12px rgba(0,0,0,0.1);
             border-color: #3498db;
             transform: translateY(-2px);
-        }}
+        }
 
-        .item-label {{
+        .item-label {
             font-size: 1.1em;
             font-weight: 600;
             color: #2c3e50;
@@ -681,75 +913,75 @@ def generate_html_report(csv_content: str, images_dict: Dict[str, str], logo_bas
             padding: 12px 15px;
             border-radius: 6px;
             border-left: 4px solid #3498db;
-        }}
+        }
 
-        .item-value {{
+        .item-value {
             display: inline-block;
             padding: 8px 16px;
             border-radius: 20px;
             font-weight: 600;
             margin: 10px 0;
-        }}
+        }
 
-        .status-ok {{
+        .status-ok {
             background: #a8d5ba;
             color: #0d3d1a;
             border: 1px solid #85c49a;
-        }}
+        }
 
-        .status-noncompliant {{
+        .status-noncompliant {
             background: #f0b3b8;
             color: #5a0f15;
             border: 1px solid #e89399;
-        }}
+        }
 
-        .status-info {{
+        .status-info {
             background: #ffd966;
             color: #6b5200;
             border: 1px solid #ffc933;
-        }}
+        }
 
-        .status-na {{
+        .status-na {
             background: #c8ccd0;
             color: #2d3236;
             border: 1px solid #adb2b8;
-        }}
+        }
 
-        .item-notes {{
+        .item-notes {
             background: #fff9e6;
             border-left: 4px solid #ffc107;
             padding: 15px;
             margin: 15px 0;
             border-radius: 4px;
             white-space: pre-wrap;
-        }}
+        }
 
-        .images-grid {{
+        .images-grid {
             display: grid;
             grid-template-columns: repeat(3, 1fr);
             gap: 10px;
             margin-top: 15px;
-        }}
+        }
 
-        .image-container {{
+        .image-container {
             position: relative;
             overflow: hidden;
             transition: transform 0.2s;
-        }}
+        }
 
-        .image-container:hover {{
+        .image-container:hover {
             transform: scale(1.02);
-        }}
+        }
 
-        .image-container img {{
+        .image-container img {
             width: 100%;
             height: 400px;
             object-fit: contain;
             display: block;
             cursor: pointer;
-        }}
+        }
 
-        .lightbox {{
+        .lightbox {
             display: none;
             position: fixed;
             top: 0;
@@ -761,20 +993,20 @@ def generate_html_report(csv_content: str, images_dict: Dict[str, str], logo_bas
             justify-content: center;
             align-items: center;
             padding: 20px;
-        }}
+        }
 
-        .lightbox.active {{
+        .lightbox.active {
             display: flex;
-        }}
+        }
 
-        .lightbox img {{
+        .lightbox img {
             max-width: 95%;
             max-height: 95%;
             object-fit: contain;
             border-radius: 4px;
-        }}
+        }
 
-        .lightbox-close {{
+        .lightbox-close {
             position: absolute;
             top: 20px;
             right: 40px;
@@ -783,75 +1015,82 @@ def generate_html_report(csv_content: str, images_dict: Dict[str, str], logo_bas
             cursor: pointer;
             font-weight: 300;
             transition: color 0.2s;
-        }}
+        }
 
-        .lightbox-close:hover {{
+        .lightbox-close:hover {
             color: #f39c12;
-        }}
+        }
 
-        @media (max-width: 768px) {{
-            body {{
+        @media (max-width: 768px) {
+            body {
                 padding: 10px;
-            }}
+            }
 
-            .container {{
+            .container {
                 padding: 20px;
-            }}
+            }
 
-            .header {{
+            .header {
                 flex-direction: column;
                 align-items: flex-start;
-            }}
+            }
 
-            .header h1 {{
+            .header h1 {
                 font-size: 1.8em;
-            }}
+            }
 
-            .header-logo {{
+            .header-logo {
                 max-width: 250px;
-            }}
+            }
 
-            .metadata {{
+            .metadata {
                 grid-template-columns: 1fr;
-            }}
+            }
 
-            .images-grid {{
+            .images-grid {
                 grid-template-columns: repeat(2, 1fr);
                 gap: 8px;
-            }}
+            }
 
-            .image-container img {{
+            .image-container img {
                 height: 300px;
-            }}
-        }}
-    </style>
+            }
+        }
+"""
+
+_HEAD_CLOSE_AND_BODY_OPEN = """    </style>
 </head>
 <body>
     <div class="container">
         <div class="header">
             <h1>Inspektionsbericht</h1>
-            {f'<img src="{logo_base64}" alt="Umenge Machine Inspections" class="header-logo">' if logo_base64 else ''}
+            """
+
+_LOGO_IMG_OPEN = '<img src="'
+_LOGO_IMG_CLOSE = '" alt="Umenge Machine Inspections" class="header-logo">'
+
+_HEADER_CLOSE_AND_FILTER = """
         </div>
 
         <div class="filter-container">
             <div class="filter-title">Status Filter</div>
             <div class="filter-options">
-                <div class="filter-option filter-ok active" onclick="toggleFilter(this, 'ok')">
-                    <input type="checkbox" id="filter-ok" checked onchange="event.stopPropagation(); toggleFilter(this.parentElement, 'ok')">
-                    <label for="filter-ok">✓ OK</label>
-                </div>
-                <div class="filter-option filter-noncompliant active" onclick="toggleFilter(this, 'noncompliant')">
-                    <input type="checkbox" id="filter-noncompliant" checked onchange="event.stopPropagation(); toggleFilter(this.parentElement, 'noncompliant')">
-                    <label for="filter-noncompliant">✗ Non-compliant</label>
-                </div>
-                <div class="filter-option filter-info active" onclick="toggleFilter(this, 'info')">
-                    <input type="checkbox" id="filter-info" checked onchange="event.stopPropagation(); toggleFilter(this.parentElement, 'info')">
-                    <label for="filter-info">ⓘ Info</label>
-                </div>
-                <div class="filter-option filter-na active" onclick="toggleFilter(this, 'na')">
-                    <input type="checkbox" id="filter-na" checked onchange="event.stopPropagation(); toggleFilter(this.parentElement, 'na')">
-                    <label for="filter-na">— n.a.</label>
-                </div>
+                <label class="filter-option filter-ok active" data-filter="ok">
+                    <input type="checkbox" id="filter-ok" checked>
+                    <span>✓ OK</span>
+                </label>
+                <label class="filter-option filter-noncompliant active" data-filter="noncompliant">
+                    <input type="checkbox" id="filter-noncompliant" checked>
+                    <span>✗ Non-compliant</span>
+                </label>
+                <label class="filter-option filter-info active" data-filter="info">
+                    <input type="checkbox" id="filter-info" checked>
+                    <span>ⓘ Info</span>
+                </label>
+                <label class="filter-option filter-na active" data-filter="na">
+                    <input type="checkbox" id="filter-na" checked>
+                    <span>— n.a.</span>
+                </label>
             </div>
             <div class="filter-stats" id="filter-stats">
                 Zeige alle Items
@@ -859,8 +1098,7 @@ def generate_html_report(csv_content: str, images_dict: Dict[str, str], logo_bas
         </div>
 """
 
-    # Generiere Inhaltsverzeichnis
-    toc_html = """
+_TOC_OPEN = """
     <!-- Toggle Button für Inhaltsverzeichnis -->
     <button class="toc-toggle" onclick="toggleTOC()">Inhalt</button>
 
@@ -869,189 +1107,54 @@ def generate_html_report(csv_content: str, images_dict: Dict[str, str], logo_bas
         <div class="toc-header">Inhaltsverzeichnis</div>
 """
 
-    for section in sections:
-        # Prüfe ob Section beantwortete Items hat
-        answered_items = [item for item in section['items']
-                         if item['Type'] != 'category' and is_item_answered(item)]
-
-        if not answered_items:
-            continue
-
-        section_id = section['id'].replace('-', '_')
-        toc_html += f"""
-        <div class="toc-section">
-            <div class="toc-section-title" onclick="scrollToSection('{section_id}')">{section['label'][:50]}{'...' if len(section['label']) > 50 else ''}</div>
-            <div class="toc-items">
-"""
-
-        for item in section['items']:
-            if item['Type'] == 'category' or not is_item_answered(item):
-                continue
-
-            # Bestimme Status
-            status_type = 'other'
-            status_label = '—'
-            if item['Primary']:
-                option_id, display_value = parse_primary_value(item['Primary'])
-                status_type = get_status_type(display_value)
-                if status_type == 'ok':
-                    status_label = 'OK'
-                elif status_type == 'noncompliant':
-                    status_label = 'NC'
-                elif status_type == 'info':
-                    status_label = 'Info'
-                elif status_type == 'na':
-                    status_label = 'n.a.'
-
-            item_id = item['ID'].replace('-', '_')
-            item_label = item['Label'][:60] + ('...' if len(item['Label']) > 60 else '')
-
-            toc_html += f"""
-                <div class="toc-item" onclick="scrollToItem('{item_id}')">
-                    <span class="toc-item-status {status_type}">{status_label}</span>
-                    <span class="toc-item-label" title="{item['Label']}">{item_label}</span>
-                </div>
-"""
-
-        toc_html += """
+# Zeilen-Templates für die Schleifen (%-Formatierung, ohne Einrückung im Ausgabe-HTML)
+_TOC_SECTION_TMPL = (
+    '        <div class="toc-section">'
+    '<div class="toc-section-title" data-section="%s">%s</div>'
+    '<div class="toc-items">\n'
+)
+_TOC_ROW_TMPL = (
+    '<div class="toc-item" data-item="%s">'
+    '<span class="toc-item-status %s">%s</span>'
+    '<span class="toc-item-label" title="%s">%s</span></div>\n'
+)
+
+_TOC_SECTION_CLOSE = """
             </div>
         </div>
 """
 
-    toc_html += """
+_TOC_CLOSE = """
     </div>
 """
 
-    html += toc_html
-
-    # Füge Sections hinzu
-    for section in sections:
-        # Prüfe ob Section beantwortete Items hat
-        answered_items = [item for item in section['items']
-                         if item['Type'] != 'category' and is_item_answered(item)]
-
-        if not answered_items:
-            continue
+_IMAGES_GRID_OPEN = '                    <div class="images-grid">\n'
+_IMAGES_GRID_CLOSE = '                    </div>\n'
+_IMAGE_OPEN = '''                        <div class="image-container">
+                            <img src="'''
+_IMAGE_CLOSE_TMPL = '" alt="Bild %s" loading="lazy">\n                        </div>\n'
 
-        section_id = section['id'].replace('-', '_')
-        is_title_page = 'title' in section['label'].lower() or '标题页' in section['label']
-        title_page_class = ' title-page' if is_title_page else ''
+_ITEM_OPEN_TMPL = (
+    '\n                <div class="item %s" data-status="%s" id="%s">\n'
+    '                    <div class="item-label">%s</div>\n'
+)
+_ITEM_VALUE_TMPL = '                    <div class="item-value %s">%s</div>\n'
+_ITEM_NOTES_TMPL = '                    <div class="item-notes">%s</div>\n'
 
-        html += f"""
-        <div class="section{title_page_class}" id="{section_id}">
-            <div class="section-header">{section['label']}</div>
-            <div class="section-content">
+_ITEM_CLOSE = """                </div>
 """
 
-        # Sortiere Items der Title Page: Machine designation zuerst
-        items_to_display = section['items']
-        if is_title_page:
-            machine_items = [item for item in items_to_display if 'machine designation' in item.get('Label', '').lower() or '机器名称' in item.get('Label', '')]
-            other_items = [item for item in items_to_display if item not in machine_items]
-            items_to_display = machine_items + other_items
-
-        small_items_count = 0
-
-        for item in items_to_display:
-            if item['Type'] == 'category':
-                continue
-
-            if not is_item_answered(item):
-                continue
-
-            # Skip Location-Felder
-            if 'location' in item.get('Label', '').lower() or '地点' in item.get('Label', ''):
-                continue
-
-            status_type = 'other'
-            if item['Primary']:
-                option_id, display_value = parse_primary_value(item['Primary'])
-                status_type = get_status_type(display_value)
-
-            # Zähle Anzahl der Fotos
-            photo_count = 0
-            if item['Media']:
-                image_ids = [img_id.strip() for img_id in item['Media'].split(';') if img_id.strip()]
-                photo_count = len(image_ids)
-
-            page_break_class = ''
-            if photo_count >= 5:
-                page_break_class = 'page-break-after'
-                small_items_count = 0
-            else:
-                small_items_count += 1
-                if small_items_count >= 2:
-                    page_break_class = 'page-break-after-small'
-                    small_items_count = 0
-
-            item_id = item['ID'].replace('-', '_')
-            html += f"""
-                <div class="item {page_break_class}" data-status="{status_type}" id="{item_id}">
-                    <div class="item-label">{item['Label']}</div>
-"""
-
-            # Zeige Primary Value
-            if item['Primary']:
-                option_id, display_value = parse_primary_value(item['Primary'])
-
-                # Formatiere Timestamps
-                if display_value.strip().isdigit() and len(display_value.strip()) == 10:
-                    display_value = format_timestamp(display_value)
-
-                # Entferne GPS-Koordinaten
-                if 'location' in item['Label'].lower() or '地点' in item['Label']:
-                    display_value = remove_gps_coordinates(display_value)
-
-                color_class = get_color_class(display_value)
-                html += f'                    <div class="item-value {color_class}">{display_value}</div>\n'
-
-            # Zeige Notes
-            if item['Note']:
-                is_location = 'location' in item['Label'].lower() or '地点' in item['Label']
-
-                if is_location:
-                    formatted_note = remove_gps_coordinates(item["Note"])
-                else:
-                    formatted_note = format_text_with_chinese_red(item["Note"])
-
-                html += f'                    <div class="item-notes">{formatted_note}</div>\n'
-            elif item['Secondary'] and item['Secondary'] != item['Primary']:
-                is_location = 'location' in item['Label'].lower() or '地点' in item['Label']
-
-                if is_location:
-                    formatted_secondary = remove_gps_coordinates(item["Secondary"])
-                else:
-                    formatted_secondary = format_text_with_chinese_red(item["Secondary"])
-
-                html += f'                    <div class="item-notes">{formatted_secondary}</div>\n'
-
-            # Zeige Bilder
-            if item['Media']:
-                image_ids = [img_id.strip() for img_id in item['Media'].split(';') if img_id.strip()]
-
-                if image_ids:
-                    html += '                    <div class="images-grid">\n'
-
-                    for img_id in image_ids:
-                        # Suche nach dem Bild im images_dict
-                        img_base64 = images_dict.get(img_id, '')
-                        if img_base64:
-                            html += f'''                        <div class="image-container">
-                            <img src="{img_base64}" alt="Bild {img_id}" onclick="openLightbox(this.src)">
-                        </div>
-'''
-
-                    html += '                    </div>\n'
+_SECTION_HEADER_TMPL = (
+    '        <div class="section%s" id="%s">'
+    '<div class="section-header">%s</div>'
+    '<div class="section-content">\n'
+)
 
-            html += """                </div>
-"""
-
-        html += """            </div>
+_SECTION_CLOSE = """            </div>
         </div>
 """
 
-    # Schließe HTML
-    html += """    </div>
+_HTML_FOOTER = """    </div>
 
     <!-- Lightbox für Bildansicht -->
     <div class="lightbox" id="lightbox" onclick="closeLightbox()">
@@ -1060,65 +1163,138 @@ def generate_html_report(csv_content: str, images_dict: Dict[str, str], logo_bas
     </div>
 
     <script>
+        // Für den Druck alle Fotos laden, auch die noch nicht in den sichtbaren Bereich gescrollten
+        window.addEventListener('beforeprint', function() {
+            for (const img of document.querySelectorAll('img[loading="lazy"]')) {
+                img.loading = 'eager';
+            }
+        });
+
+        // Ein delegierter Listener statt eines onclick-Attributs an jedem TOC-Eintrag und Foto
+        document.addEventListener('click', function(e) {
+            const target = e.target;
+            const tocEntry = target.closest('[data-item], [data-section]');
+            if (tocEntry) {
+                if (tocEntry.dataset.item) {
+                    scrollToItem(tocEntry.dataset.item);
+                } else {
+                    scrollToSection(tocEntry.dataset.section);
+                }
+            } else if (target.matches('.image-container img')) {
+                openLightbox(target.src);
+            }
+        });
+
+        // Geöffnete Fotos bleiben als Image-Objekte erhalten, damit der Browser
+        // beim erneuten Öffnen das bereits dekodierte Bild wiederverwendet
+        const lightboxCache = new Map();
+
         function openLightbox(src) {
+            let image = lightboxCache.get(src);
+            if (!image) {
+                image = new Image();
+                image.src = src;
+                lightboxCache.set(src, image);
+            }
+            const lightboxImg = document.getElementById('lightbox-img');
+            if (lightboxImg.src !== image.src) {
+                lightboxImg.src = image.src;
+            }
             document.getElementById('lightbox').classList.add('active');
-            document.getElementById('lightbox-img').src = src;
         }
 
         function closeLightbox() {
             document.getElementById('lightbox').classList.remove('active');
         }
 
-        document.addEventListener('keydown', function(e) {
-            if (e.key === 'Escape') {
-                closeLightbox();
-            }
-        });
-
         let activeFilters = new Set(['ok', 'noncompliant', 'info', 'na', 'other']);
 
-        function toggleFilter(element, filterType) {
-            const checkbox = element.querySelector('input[type="checkbox"]');
+        // Die Chips sind <label>-Elemente, der Browser schaltet die Checkbox selbst um;
+        // ein delegierter change-Listener auf der Filterleiste übernimmt den Rest
+        document.querySelector('.filter-options').addEventListener('change', function(e) {
+            const option = e.target.closest('[data-filter]');
+            const filterType = option.dataset.filter;
 
-            if (event.target === element) {
-                checkbox.checked = !checkbox.checked;
-            }
-
-            if (checkbox.checked) {
-                element.classList.add('active');
+            if (e.target.checked) {
+                option.classList.add('active');
                 activeFilters.add(filterType);
             } else {
-                element.classList.remove('active');
+                option.classList.remove('active');
                 activeFilters.delete(filterType);
             }
 
-            applyFilters();
+            scheduleApplyFilters();
+        });
+
+        // Mehrere Klicks innerhalb eines Frames werden zu einem applyFilters()-Durchlauf zusammengefasst
+        let applyPending = false;
+
+        function scheduleApplyFilters() {
+            if (applyPending) {
+                return;
+            }
+            applyPending = true;
+            requestAnimationFrame(function() {
+                applyPending = false;
+                applyFilters();
+            });
         }
 
+        // Items einmalig nach Status gruppieren; die Filter schalten danach nur noch ganze Gruppen
+        const statusBuckets = {};
+        let totalCount = 0;
+        // Nur für Browser ohne :has(): Status der Items je Section
+        const sectionStatuses = [];
+        const supportsHas = window.CSS && CSS.supports && CSS.supports('selector(:has(*))');
+
+        function buildStatusBuckets() {
+            for (const section of document.getElementsByClassName('section')) {
+                const statuses = new Set();
+                for (const item of section.getElementsByClassName('item')) {
+                    const status = item.dataset.status;
+                    if (!statusBuckets[status]) {
+                        statusBuckets[status] = [];
+                    }
+                    statusBuckets[status].push(item);
+                    statuses.add(status);
+                    totalCount++;
+                }
+                sectionStatuses.push({ section, statuses });
+            }
+        }
+
+        // Zuletzt angewendeter Zustand je Status: nur Gruppen, deren Filter sich geändert hat, werden angefasst
+        const appliedFilters = {};
+
         function applyFilters() {
             let visibleCount = 0;
-            let totalCount = 0;
-
-            document.querySelectorAll('.item').forEach(item => {
-                totalCount++;
-                const status = item.getAttribute('data-status');
 
-                if (activeFilters.has(status)) {
-                    item.classList.remove('hidden');
-                    visibleCount++;
-                } else {
-                    item.classList.add('hidden');
+            for (const status in statusBuckets) {
+                const bucket = statusBuckets[status];
+                const visible = activeFilters.has(status);
+                if (appliedFilters[status] !== visible) {
+                    for (const item of bucket) {
+                        item.classList.toggle('hidden', !visible);
+                    }
+                    appliedFilters[status] = visible;
                 }
-            });
+                if (visible) {
+                    visibleCount += bucket.length;
+                }
+            }
 
-            document.querySelectorAll('.section').forEach(section => {
-                const visibleItems = section.querySelectorAll('.item:not(.hidden)');
-                if (visibleItems.length === 0) {
-                    section.classList.add('hidden');
-                } else {
-                    section.classList.remove('hidden');
+            if (!supportsHas) {
+                for (const { section, statuses } of sectionStatuses) {
+                    let visible = false;
+                    for (const status of statuses) {
+                        if (activeFilters.has(status)) {
+                            visible = true;
+                            break;
+                        }
+                    }
+                    section.classList.toggle('hidden', !visible);
                 }
-            });
+            }
 
             updateFilterStats(visibleCount, totalCount);
         }
@@ -1133,6 +1309,7 @@ def generate_html_report(csv_content: str, images_dict: Dict[str, str], logo_bas
         }
 
         document.addEventListener('DOMContentLoaded', function() {
+            buildStatusBuckets();
             applyFilters();
         });
 
@@ -1144,15 +1321,22 @@ def generate_html_report(csv_content: str, images_dict: Dict[str, str], logo_bas
             body.classList.toggle('toc-open');
         }
 
+        // Hervorhebung per CSS-Animation; die Klasse wird am Animationsende wieder entfernt
+        function flash(element) {
+            element.classList.add('flash');
+            element.addEventListener('animationend', function onEnd(e) {
+                if (e.target === element) {
+                    element.classList.remove('flash');
+                    element.removeEventListener('animationend', onEnd);
+                }
+            });
+        }
+
         function scrollToSection(sectionId) {
             const element = document.getElementById(sectionId);
             if (element) {
                 element.scrollIntoView({ behavior: 'smooth', block: 'start' });
-                element.style.transition = 'background 0.5s';
-                element.style.background = '#fff3cd';
-                setTimeout(() => {
-                    element.style.background = '';
-                }, 1500);
+                flash(element);
             }
         }
 
@@ -1160,24 +1344,23 @@ def generate_html_report(csv_content: str, images_dict: Dict[str, str], logo_bas
             const element = document.getElementById(itemId);
             if (element) {
                 element.scrollIntoView({ behavior: 'smooth', block: 'center' });
-                element.style.transition = 'background 0.5s, transform 0.3s';
-                element.style.background = '#fff3cd';
-                element.style.transform = 'scale(1.02)';
-                setTimeout(() => {
-                    element.style.background = '';
-                    element.style.transform = '';
-                }, 1500);
+                flash(element);
             }
         }
 
+        // Ein gemeinsamer Escape-Handler: schließt zuerst die Lightbox, sonst das Inhaltsverzeichnis
+        const lightboxEl = document.getElementById('lightbox');
+        const sidebarEl = document.getElementById('toc-sidebar');
+
         document.addEventListener('keydown', function(e) {
-            if (e.key === 'Escape') {
-                const sidebar = document.getElementById('toc-sidebar');
-                const body = document.body;
-                if (sidebar.classList.contains('open')) {
-                    sidebar.classList.remove('open');
-                    body.classList.remove('toc-open');
-                }
+            if (e.key !== 'Escape') {
+                return;
+            }
+            if (lightboxEl.classList.contains('active')) {
+                lightboxEl.classList.remove('active');
+            } else if (sidebarEl.classList.contains('open')) {
+                sidebarEl.classList.remove('open');
+                document.body.classList.remove('toc-open');
             }
         });
     </script>
@@ -1185,7 +1368,236 @@ def generate_html_report(csv_content: str, images_dict: Dict[str, str], logo_bas
 </html>
 """
 
-    return html
+
+def write_html_report(out: TextIO, csv_content: str, images_dict: Dict[str, str], logo_base64: str = '') -> None:
+    """
+    Schreibt den HTML-Bericht fragmentweise in einen Text-Stream
+    out: Datei, StringIO oder TextIOWrapper um einen Byte-Puffer
+    images_dict: {filename: base64_data} oder {filename: relativer Pfad} - der Wert wird als src übernommen
+    """
+    metadata, items = read_csv_data(csv_content)
+    # Items werden beim Einsortieren einzeln annotiert; eine flache Item-Liste entsteht nicht
+    sections = organize_items_by_sections(map(_annotate_item, items))
+    _annotate_sections(sections)
+
+    write = out.write
+
+    # HTML-Template
+    write(f"""<!DOCTYPE html>
+<html lang="de">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{escape(metadata.get('audit_title', 'Audit Bericht'))}</title>
+    <style>
+""")
+    write(_CSS)
+    write(_HEAD_CLOSE_AND_BODY_OPEN)
+
+    # Logo und Bilder direkt in den Stream schreiben, ohne den Base64-Block in einen f-String zu kopieren
+    if logo_base64:
+        write(_LOGO_IMG_OPEN)
+        write(logo_base64)
+        write(_LOGO_IMG_CLOSE)
+
+    write(_HEADER_CLOSE_AND_FILTER)
+
+    # Inhaltsverzeichnis und Sections in einem Durchlauf erzeugen; das TOC steht im Dokument vor
+    # den Sections und wird deshalb separat gepuffert
+    toc_parts = []
+    body_parts = []
+    append = body_parts.append
+    get_image = images_dict.get
+
+    for section in sections:
+        # Prüfe ob Section beantwortete Items hat (bricht beim ersten Treffer ab)
+        if not any(item['_answered'] and not item['_is_category'] for item in section['items']):
+            continue
+
+        section_id = section['_safe_id']
+        toc_parts.append(_TOC_SECTION_TMPL % (section_id, section['_label_short_toc']))
+
+        for item in section['items']:
+            if item['_is_category'] or not item['_answered']:
+                continue
+
+            status_type = item['_status_type']
+            status_label = item['_status_label']
+            item_id = item['_safe_id']
+            toc_parts.append(_TOC_ROW_TMPL % (item_id, status_type, status_label,
+                                              item['_label_html'], item['_label_short_toc']))
+
+        toc_parts.append(_TOC_SECTION_CLOSE)
+
+        is_title_page = section['_is_title_page']
+        title_page_class = ' title-page' if is_title_page else ''
+
+        append(_SECTION_HEADER_TMPL % (title_page_class, section_id, section['_label_html']))
+
+        # Sortiere Items der Title Page: Machine designation zuerst
+        items_to_display = section['items']
+        if is_title_page:
+            machine_items, other_items = [], []
+            for item in items_to_display:
+                (machine_items if item['_is_machine_designation'] else other_items).append(item)
+            items_to_display = machine_items + other_items
+
+        small_items_count = 0
+
+        for item in items_to_display:
+            if item['_is_category'] or not item['_answered']:
+                continue
+
+            # Skip Location-Felder
+            if item['_is_location']:
+                continue
+
+            color_class = item['_color_class']
+            status_type = item['_status_type']
+            image_ids = item['_media_ids']
+            photo_count = len(image_ids)
+
+            page_break_class, small_items_count = get_page_break(photo_count, small_items_count)
+
+            item_id = item['_safe_id']
+            append(_ITEM_OPEN_TMPL % (page_break_class, status_type, item_id, item['_label_html']))
+
+            primary = item['Primary']
+            secondary = item['Secondary']
+
+            # Zeige Primary Value
+            if primary:
+                append(_ITEM_VALUE_TMPL % (color_class, escape(item['_display_value'])))
+
+            # Zeige Notes, sonst Secondary (sofern nicht identisch mit Primary)
+            # Erst escapen, dann chinesische Zeichen einfärben; quote=False lässt '"' in den CJK-Läufen
+            notes = item['Note'] or (secondary if secondary != primary else '')
+            if notes:
+                if item['_is_location']:
+                    formatted_notes = escape(remove_gps_coordinates(notes), quote=False)
+                else:
+                    formatted_notes = format_text_with_chinese_red(escape(notes, quote=False))
+
+                append(_ITEM_NOTES_TMPL % formatted_notes)
+
+            # Zeige Bilder
+            if image_ids:
+                append(_IMAGES_GRID_OPEN)
+
+                for img_id in image_ids:
+                    # Suche nach dem Bild im images_dict
+                    img_base64 = get_image(img_id)
+                    if img_base64:
+                        append(_IMAGE_OPEN)
+                        append(img_base64)
+                        append(_IMAGE_CLOSE_TMPL % escape(img_id))
+
+                append(_IMAGES_GRID_CLOSE)
+
+            append(_ITEM_CLOSE)
+
+        append(_SECTION_CLOSE)
+
+    write(_TOC_OPEN)
+    out.writelines(toc_parts)
+    write(_TOC_CLOSE)
+    out.writelines(body_parts)
+
+    # Schließe HTML
+    write(_HTML_FOOTER)
+
+
+def generate_html_report(csv_content: str, images_dict: Dict[str, str], logo_base64: str = '') -> str:
+    """
+    Generiert HTML-Bericht
+    images_dict: {filename: base64_data}
+    """
+    buffer = io.StringIO()
+    write_html_report(buffer, csv_content, images_dict, logo_base64)
+    return buffer.getvalue()
+
+
+def generate_html_report_bytes(csv_content: str, images_dict: Dict[str, str], logo_base64: str = '') -> bytes:
+    """Generiert den HTML-Bericht direkt als UTF-8-Bytes, ohne den Gesamttext als str zu halten"""
+    buffer = io.BytesIO()
+    out = io.TextIOWrapper(buffer, encoding='utf-8', newline='')
+    write_html_report(out, csv_content, images_dict, logo_base64)
+    out.flush()
+    out.detach()
+    return buffer.getvalue()
+
+
+def generate_html_report_zip(csv_content: str, images_dict: Dict[str, str], logo_base64: str = '') -> bytes:
+    """
+    Generiert ein ZIP mit report.html und den Fotos als Dateien unter images/
+    Das HTML verweist per relativem Pfad auf die Fotos, statt sie als Base64 einzubetten;
+    inhaltsgleiche Fotos werden nur einmal abgelegt
+    """
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        image_paths = {}
+        paths_by_hash = {}
+        for img_id, data_uri in images_dict.items():
+            data = b64decode(data_uri.partition(',')[2])
+            digest = hashlib.sha1(data).digest()
+            path = paths_by_hash.get(digest)
+            if path is None:
+                path = paths_by_hash[digest] = get_image_filename(img_id, data_uri)
+                # JPEG/PNG sind bereits komprimiert: unverändert speichern
+                zip_file.writestr(path, data, compress_type=zipfile.ZIP_STORED)
+            # Media-IDs können Leer- und Sonderzeichen enthalten: als URL kodiert in src schreiben
+            image_paths[img_id] = escape(quote(path))
+
+        with zip_file.open('report.html', 'w') as entry:
+            out = io.TextIOWrapper(entry, encoding='utf-8', newline='')
+            write_html_report(out, csv_content, image_paths, logo_base64)
+            out.flush()
+            out.detach()
+
+    return buffer.getvalue()
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def build_report(csv_content: str, images: Tuple[Tuple[str, str], ...], logo_base64: str, report_format: str) -> bytes:
+    """
+    Erzeugt den Bericht als HTML-, gzip- oder ZIP-Bytes (report_format: Kürzel aus DOWNLOAD_FORMATS)
+    Gecacht über alle Eingaben: erneutes Generieren mit denselben Dateien kommt aus dem Cache
+    images: ((filename, base64_data), ...) - hashbar statt dict
+    """
+    images_dict = dict(images)
+    if report_format == 'ZIP':
+        return generate_html_report_zip(csv_content, images_dict, logo_base64)
+    html_bytes = generate_html_report_bytes(csv_content, images_dict, logo_base64)
+    if report_format == 'GZIP':
+        # mtime=0: gleiche Eingaben ergeben byte-identische Dateien
+        return gzip.compress(html_bytes, compresslevel=6, mtime=0)
+    return html_bytes
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def load_csv(file_id: str, _csv_file) -> str:
+    """Dekodiert die hochgeladene CSV einmal pro Upload; Cache-Schlüssel ist nur die file_id"""
+    return str(_csv_file.getvalue(), 'utf-8-sig')
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def encode_uploaded_images(file_ids: Tuple[str, ...], optimize: bool, _image_files: List) -> Dict[str, str]:
+    """
+    Kodiert die Foto-Uploads zu {Name ohne Endung: data:-URI}
+    Cache-Schlüssel sind nur die file_ids: dieselben Uploads werden nicht erneut gelesen und kodiert
+    """
+    if not _image_files:
+        return {}
+    # Lesen und Kodieren pro Foto ist unabhängig; I/O und Base64 geben den GIL frei
+    max_workers = min(32, (os.cpu_count() or 1) * 4, len(_image_files))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        encode = partial(encode_uploaded_image, optimize=optimize)
+        return dict(executor.map(encode, _image_files))
+
+
+def clear_report() -> None:
+    """Verwirft einen zuvor generierten Bericht, sobald sich die Eingaben ändern"""
+    st.session_state.pop('report', None)
 
 
 
@@ -1208,7 +1620,7 @@ def main():
         1. **Upload CSV file**
         2. **Upload photos** (optional)
         3. **Generate report** ✨
-        4. **Download HTML file**
+        4. **Download HTML or ZIP file**
         
         🎨 **Logo:** Pre-integrated (Umenge Machine Inspections)
         """)
@@ -1224,7 +1636,8 @@ def main():
         csv_file = st.file_uploader(
             "Select the audit CSV file",
             type=['csv'],
-            help="The CSV file containing the audit data"
+            help="The CSV file containing the audit data",
+            on_change=clear_report
         )
 
         st.header("2. Upload Photos")
@@ -1232,8 +1645,23 @@ def main():
             "Select photos (multiple files possible)",
             type=['jpg', 'jpeg', 'png'],
             accept_multiple_files=True,
-            help="Photos to be included in the report"
+            help="Photos to be included in the report",
+            on_change=clear_report
+        )
+        optimize_photos = st.checkbox(
+            f"Optimize photos (max. {MAX_IMAGE_DIMENSION} px, {'WebP' if WEBP_SUPPORTED else 'JPEG'})",
+            value=True,
+            help="Downscales and recompresses photos before embedding - much smaller report files",
+            on_change=clear_report
         )
+        download_format = st.radio(
+            "Download format",
+            list(DOWNLOAD_FORMATS),
+            help="The .html.gz is the same single file, compressed for sending. "
+                 "The ZIP keeps the photos as separate files next to the report instead of embedding them",
+            on_change=clear_report
+        )
+        format_label, file_extension, mime = DOWNLOAD_FORMATS[download_format]
 
     with col2:
         st.header("Status")
@@ -1259,52 +1687,68 @@ def main():
             with st.spinner("Generating report..."):
                 try:
                     # Read CSV
-                    csv_content = csv_file.read().decode('utf-8-sig')
+                    csv_content = load_csv(csv_file.file_id, csv_file)
 
                     # Process images
-                    images_dict = {}
-                    if image_files:
-                        for img_file in image_files:
-                            img_name = img_file.name.split('.')[0]  # without extension
-                            img_data = base64.b64encode(img_file.read()).decode()
-                            ext = img_file.name.split('.')[-1].lower()
-                            mime = 'image/jpeg' if ext in ['jpg', 'jpeg'] else 'image/png'
-                            images_dict[img_name] = f"data:{mime};base64,{img_data}"
+                    # Nur Fotos kodieren, die in der CSV auch referenziert werden
+                    referenced_ids = get_referenced_media_ids(csv_content)
+                    image_files = [f for f in image_files or [] if get_upload_stem(f) in referenced_ids]
+                    images_dict = encode_uploaded_images(tuple(f.file_id for f in image_files), optimize_photos,
+                                                         image_files)
 
                     # Use embedded logo
                     logo_base64 = EMBEDDED_LOGO_BASE64
 
                     # Generate HTML
-                    html_content = generate_html_report(csv_content, images_dict, logo_base64)
-
-                    # Calculate statistics
-                    file_size_mb = len(html_content.encode('utf-8')) / (1024 * 1024)
+                    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                    report_bytes = build_report(csv_content, tuple(sorted(images_dict.items())), logo_base64, format_label)
+                    file_name = f"audit_report_{timestamp}.{file_extension}"
+
+                    # Bericht über Reruns hinweg halten: der Klick auf den Download-Button
+                    # startet das Skript neu, dann ist st.button wieder False
+                    st.session_state['report'] = {
+                        'data': report_bytes,
+                        'file_name': file_name,
+                        'mime': mime,
+                        'format_label': format_label,
+                        'photo_count': len(images_dict),
+                    }
 
                     st.success("✅ Report generated successfully!")
 
-                    # Show statistics
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("Photos", len(images_dict))
-                    with col2:
-                        st.metric("File Size", f"{file_size_mb:.1f} MB")
-                    with col3:
-                        st.metric("Format", "HTML")
-
-                    # Download button
-                    st.download_button(
-                        label="📥 Download HTML Report",
-                        data=html_content,
-                        file_name=f"audit_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html",
-                        mime="text/html",
-                        use_container_width=True
-                    )
-
-                    # Info box instead of preview (prevents WebSocket errors for large reports)
-                    st.info("💡 **Note:** Download the HTML file and open it in your browser to view the complete report.")
-
                 except Exception as e:
                     st.error(f"❌ Error generating report: {str(e)}")
+
+        report = st.session_state.get('report')
+        if report:
+            # Calculate statistics
+            file_size_mb = len(report['data']) / (1024 * 1024)
+
+            # Show statistics
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Photos", report['photo_count'])
+            with col2:
+                st.metric("File Size", f"{file_size_mb:.1f} MB")
+            with col3:
+                st.metric("Format", report['format_label'])
+
+            # Download button
+            st.download_button(
+                label=f"📥 Download {report['format_label']} Report",
+                data=report['data'],
+                file_name=report['file_name'],
+                mime=report['mime'],
+                use_container_width=True
+            )
+
+            # Info box instead of preview (prevents WebSocket errors for large reports)
+            if report['format_label'] == "ZIP":
+                st.info("💡 **Note:** Extract the ZIP and open report.html in your browser - keep the images folder next to it.")
+            elif report['format_label'] == "GZIP":
+                st.info("💡 **Note:** Unpack the .html.gz file (e.g. with 7-Zip or gunzip) and open the HTML file in your browser.")
+            else:
+                st.info("💡 **Note:** Download the HTML file and open it in your browser to view the complete report.")
     else:
         st.warning("⚠️ Please upload a CSV file first")
 